@@ -4,6 +4,8 @@ Activities API endpoints (MongoDB Version)
 Provides activity data across all sources from MongoDB
 """
 
+import re
+
 from fastapi import APIRouter, HTTPException, Query, Request
 from typing import List, Optional
 from pydantic import BaseModel
@@ -11,6 +13,19 @@ from datetime import datetime, timezone
 
 from src.utils.logger import get_logger
 from src.core.mongo_manager import get_mongo_manager
+from src.core.activity_timeline import (
+    TIMELINE_COLLECTION,
+    build_keyset_filter,
+    date_range_filter,
+    encode_cursor,
+)
+from src.core.cache_versions import bump_collection_versions_async
+from src.core.identity_index import (
+    IdentityIndex,
+    bump_identity_version,
+    identity_cache,
+    identity_key,
+)
 
 
 # Get MongoDB manager instance
@@ -25,69 +40,42 @@ logger = get_logger(__name__)
 router = APIRouter()
 
 
-# Cache for member mappings to avoid repeated DB queries
-_member_mapping_cache = {}
-
-
 def clear_member_mapping_cache():
-    """Clear the member mapping cache (call after member updates)"""
-    global _member_mapping_cache
-    _member_mapping_cache = {}
+    """Drop this worker's identity index (other workers follow the version counter)"""
+    identity_cache.invalidate()
     logger.info("Member mapping cache cleared")
 
 
-async def load_member_mappings(db) -> dict:
+async def invalidate_member_mappings(db):
     """
-    Load all member mappings into memory for fast lookup
+    Invalidate member mappings on every worker (call after member updates)
 
-    Returns:
-        Dict with structure: {
+    Bumps the shared identity version so other processes rebuild their index
+    on their next version check, and drops the local copy immediately. The
+    ``members`` counter is bumped too, so cached GraphQL responses expire.
+    """
+    await bump_identity_version(db)
+    await bump_collection_versions_async(db, "members")
+    clear_member_mapping_cache()
+
+
+async def load_member_mappings(db) -> IdentityIndex:
+    """
+    Return the shared identity index for fast member lookups
+
+    The result is an IdentityIndex, which is also a dict with the legacy layout:
+        {
             'github': {'username_lower': {'original': 'Username', 'member': 'MemberName'}, ...},
             'slack': {'U12345': {'original': 'U12345', 'member': 'MemberName'}, ...},
             'notion': {'notion-id': {'original': 'notion-id', 'member': 'MemberName'}, ...},
             'drive': {'email_lower': {'original': 'email@domain.com', 'member': 'MemberName'}, ...}
         }
     """
-    global _member_mapping_cache
-
-    # Return cached if available
-    if _member_mapping_cache:
-        return _member_mapping_cache
-
     try:
-        mappings = {"github": {}, "slack": {}, "notion": {}, "drive": {}}
-
-        # Load all member_identifiers
-        async for identifier in db["member_identifiers"].find({}):
-            source = identifier.get("source")
-            identifier_value = identifier.get("identifier_value")
-            member_name = identifier.get("member_name")
-
-            if source and identifier_value and member_name:
-                if source not in mappings:
-                    continue
-
-                # Case-insensitive key for GitHub and email, but keep original value
-                if source in ["github", "drive"]:
-                    key = identifier_value.lower()
-                else:
-                    key = identifier_value
-
-                # Store both original identifier and member name
-                mappings[source][key] = {
-                    "original": identifier_value,
-                    "member": member_name,
-                }
-
-        _member_mapping_cache = mappings
-        logger.info(
-            f"Loaded member mappings: GitHub={len(mappings['github'])}, Slack={len(mappings['slack'])}, Notion={len(mappings['notion'])}, Drive={len(mappings['drive'])}"
-        )
-        return mappings
-
+        return await identity_cache.get_async(db)
     except Exception as e:
         logger.error(f"Failed to load member mappings: {e}")
-        return {"github": {}, "slack": {}, "notion": {}, "drive": {}}
+        return IdentityIndex()
 
 
 def get_mapped_member_name(mappings: dict, source: str, identifier: str) -> str:
@@ -105,13 +93,7 @@ def get_mapped_member_name(mappings: dict, source: str, identifier: str) -> str:
     if not identifier or source not in mappings:
         return identifier
 
-    # Case-insensitive lookup for GitHub and Drive
-    if source in ["github", "drive"]:
-        key = identifier.lower()
-    else:
-        key = identifier
-
-    mapping_entry = mappings[source].get(key)
+    mapping_entry = mappings[source].get(identity_key(source, identifier))
     if mapping_entry and isinstance(mapping_entry, dict):
         name = mapping_entry.get("member", identifier)
     else:
@@ -139,6 +121,9 @@ def get_identifiers_for_member(mappings: dict, source: str, member_name: str) ->
     if not member_name or source not in mappings:
         return []
 
+    if isinstance(mappings, IdentityIndex):
+        return mappings.identifiers_for(member_name, source)
+
     identifiers = []
     for key, mapping_entry in mappings[source].items():
         if isinstance(mapping_entry, dict):
@@ -172,6 +157,13 @@ class ActivityListResponse(BaseModel):
     filters: dict
 
 
+class ActivityTimelinePage(BaseModel):
+    activities: List[ActivityResponse]
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+    filters: dict
+
+
 @router.get("/activities", response_model=ActivityListResponse)
 async def get_activities(
     request: Request,
@@ -315,7 +307,7 @@ async def get_activities(
                         query["date"] = date_filter
                     if filter_keyword:
                         # Search in commit message
-                        query["message"] = {"$regex": filter_keyword, "$options": "i"}
+                        query["message"] = {"$regex": re.escape(filter_keyword), "$options": "i"}
                     if project_config and project_config["repositories"]:
                         # Filter by project repositories
                         query["repository"] = {"$in": project_config["repositories"]}
@@ -384,7 +376,7 @@ async def get_activities(
                         query["created_at"] = date_filter
                     if filter_keyword:
                         # Search in PR title
-                        query["title"] = {"$regex": filter_keyword, "$options": "i"}
+                        query["title"] = {"$regex": re.escape(filter_keyword), "$options": "i"}
                     if project_config and project_config["repositories"]:
                         # Filter by project repositories
                         query["repository"] = {"$in": project_config["repositories"]}
@@ -453,8 +445,8 @@ async def get_activities(
                     if filter_keyword:
                         # Search in review body or PR title
                         query["$or"] = [
-                            {"body": {"$regex": filter_keyword, "$options": "i"}},
-                            {"pr_title": {"$regex": filter_keyword, "$options": "i"}},
+                            {"body": {"$regex": re.escape(filter_keyword), "$options": "i"}},
+                            {"pr_title": {"$regex": re.escape(filter_keyword), "$options": "i"}},
                         ]
                     if project_config and project_config["repositories"]:
                         # Filter by project repositories
@@ -521,7 +513,7 @@ async def get_activities(
                     or_conditions.append(
                         {
                             "user_name": {
-                                "$regex": f"^{filter_member_name}$",
+                                "$regex": f"^{re.escape(filter_member_name)}$",
                                 "$options": "i",
                             }
                         }
@@ -531,7 +523,7 @@ async def get_activities(
                     query["posted_at"] = date_filter
                 if filter_keyword:
                     # Search in message text
-                    query["text"] = {"$regex": filter_keyword, "$options": "i"}
+                    query["text"] = {"$regex": re.escape(filter_keyword), "$options": "i"}
                 if project_config and project_config["slack_channel_id"]:
                     # Filter by project Slack channel
                     query["channel_id"] = project_config["slack_channel_id"]
@@ -636,7 +628,7 @@ async def get_activities(
                 if filter_member_name:
                     # Search by editor name (case-insensitive)
                     query["editor_name"] = {
-                        "$regex": f"^{filter_member_name}",
+                        "$regex": f"^{re.escape(filter_member_name)}",
                         "$options": "i",
                     }
 
@@ -661,7 +653,7 @@ async def get_activities(
                 if filter_keyword:
                     # Search in page title
                     keyword_conditions = [
-                        {"document_title": {"$regex": filter_keyword, "$options": "i"}}
+                        {"document_title": {"$regex": re.escape(filter_keyword), "$options": "i"}}
                     ]
                     if query:
                         query = {"$and": [query, {"$or": keyword_conditions}]}
@@ -767,14 +759,14 @@ async def get_activities(
                     else:
                         # Fallback to regex search
                         query["user_email"] = {
-                            "$regex": filter_member_name,
+                            "$regex": re.escape(filter_member_name),
                             "$options": "i",
                         }
                 if date_filter:
                     query["timestamp"] = date_filter
                 if filter_keyword:
                     # Search in document title
-                    query["doc_title"] = {"$regex": filter_keyword, "$options": "i"}
+                    query["doc_title"] = {"$regex": re.escape(filter_keyword), "$options": "i"}
                 if project_config and project_config["drive_folders"]:
                     # Filter by project Drive folders (check if doc_id or parent_folder_id matches)
                     folder_conditions = [
@@ -845,10 +837,9 @@ async def get_activities(
 
                 # For recordings, filter by participant (not createdBy)
                 if filter_member_name:
-                    from backend.api.v1.ai_processed import get_gemini_db
                     from bson import ObjectId
 
-                    gemini_db = get_gemini_db()
+                    gemini_db = mongo.gemini_async_db
                     gemini_recordings_col = gemini_db["recordings"]
 
                     # Find meeting_ids where participant matches
@@ -865,7 +856,7 @@ async def get_activities(
                                         "in": {
                                             "$regexMatch": {
                                                 "input": "$$participant",
-                                                "regex": filter_member_name,
+                                                "regex": re.escape(filter_member_name),
                                                 "options": "i",
                                             }
                                         },
@@ -873,19 +864,15 @@ async def get_activities(
                                 }
                             }
                         }
-                        matching_meetings = list(
-                            gemini_recordings_col.find(
-                                participant_query, {"meeting_id": 1}
-                            )
-                        )
+                        matching_meetings = await gemini_recordings_col.find(
+                            participant_query, {"meeting_id": 1}
+                        ).to_list(length=None)
                     except Exception:
                         # Fallback: filter in Python if MongoDB query fails
                         # Get all documents and filter in Python for case-insensitive partial match
-                        all_meetings = list(
-                            gemini_recordings_col.find(
-                                {}, {"meeting_id": 1, "participants": 1}
-                            )
-                        )
+                        all_meetings = await gemini_recordings_col.find(
+                            {}, {"meeting_id": 1, "participants": 1}
+                        ).to_list(length=None)
                         matching_meetings = [
                             m
                             for m in all_meetings
@@ -928,11 +915,11 @@ async def get_activities(
                         query = {
                             "$and": [
                                 {"_id": query["_id"]},
-                                {"name": {"$regex": filter_keyword, "$options": "i"}},
+                                {"name": {"$regex": re.escape(filter_keyword), "$options": "i"}},
                             ]
                         }
                     else:
-                        query["name"] = {"$regex": filter_keyword, "$options": "i"}
+                        query["name"] = {"$regex": re.escape(filter_keyword), "$options": "i"}
 
                 async for recording in (
                     recordings.find(query).sort("modifiedTime", -1).limit(source_limit)
@@ -971,9 +958,7 @@ async def get_activities(
             elif source == "recordings_daily":
                 try:
                     # Get recordings_daily from gemini database
-                    from backend.api.v1.ai_processed import get_gemini_db
-
-                    gemini_db = get_gemini_db()
+                    gemini_db = mongo.gemini_async_db
                     recordings_daily_col = gemini_db["recordings_daily"]
 
                     query = {}
@@ -983,16 +968,15 @@ async def get_activities(
                     if filter_keyword:
                         # Search in full_analysis_text
                         query["analysis.full_analysis_text"] = {
-                            "$regex": filter_keyword,
+                            "$regex": re.escape(filter_keyword),
                             "$options": "i",
                         }
 
-                    # Get documents (sync operation)
                     # Sort by timestamp if available, otherwise by target_date (as date, not string)
                     # We'll sort in Python after fetching to ensure proper date sorting
-                    daily_docs = list(
-                        recordings_daily_col.find(query).limit(source_limit)
-                    )  # Fetch more to sort properly
+                    daily_docs = await recordings_daily_col.find(query).limit(
+                        source_limit
+                    ).to_list(length=source_limit)  # Fetch more to sort properly
 
                     # Sort by target_date as date (not string) - newest first
                     def sort_daily_doc(doc):
@@ -1163,6 +1147,108 @@ async def get_activities(
         raise HTTPException(status_code=500, detail="Failed to fetch activities")
 
 
+@router.get("/activities/timeline", response_model=ActivityTimelinePage)
+async def get_activity_timeline(
+    request: Request,
+    source_type: Optional[str] = Query(
+        None, description="Filter by source (github, slack, notion, drive, recordings)"
+    ),
+    activity_type: Optional[str] = Query(None, description="Filter by activity type"),
+    member_name: Optional[str] = Query(None, description="Filter by member name"),
+    project_key: Optional[str] = Query(None, description="Filter by project key"),
+    start_date: Optional[str] = Query(None, description="Start date (ISO format)"),
+    end_date: Optional[str] = Query(None, description="End date (ISO format)"),
+    after: Optional[str] = Query(
+        None,
+        description="Keyset cursor '<timestamp>,<id>' from the previous page's next_cursor",
+    ),
+    limit: int = Query(100, ge=1, le=1000),
+):
+    """
+    Get activities from the unified activity_timeline projection
+
+    Pages are served with a single indexed range scan ordered by
+    (timestamp DESC, _id DESC), so page N costs the same as page 1.
+    Pass the returned next_cursor as ``after`` to fetch the next page.
+
+    Returns:
+        One page of activities plus the cursor for the next page
+    """
+    filters = {
+        "source_type": source_type,
+        "activity_type": activity_type,
+        "member_name": member_name,
+        "project_key": project_key,
+        "start_date": start_date,
+        "end_date": end_date,
+        "after": after,
+        "limit": limit,
+    }
+
+    try:
+        query = build_keyset_filter(after)
+        date_filter = date_range_filter(start_date, end_date)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        db = get_mongo().async_db
+
+        if source_type:
+            query["source_type"] = source_type
+        if activity_type:
+            query["activity_type"] = activity_type
+        if member_name:
+            query["member_key"] = member_name.lower()
+        if project_key:
+            query["project_keys"] = project_key
+
+        if date_filter:
+            if "$or" in query:
+                query = {"$and": [query, {"timestamp": date_filter}]}
+            else:
+                query["timestamp"] = date_filter
+
+        # Fetch one extra row to know whether another page exists
+        rows = (
+            await db[TIMELINE_COLLECTION]
+            .find(query, {"search_title": 0, "search_text": 0})
+            .sort([("timestamp", -1), ("_id", -1)])
+            .limit(limit + 1)
+            .to_list(length=limit + 1)
+        )
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        activities = [
+            ActivityResponse(
+                id=row["_id"],
+                member_name=row.get("member_name", ""),
+                source_type=row.get("source_type", ""),
+                activity_type=row.get("activity_type", ""),
+                timestamp=row["timestamp"].isoformat() + "Z",
+                metadata=row.get("metadata", {}),
+            )
+            for row in rows
+        ]
+
+        next_cursor = (
+            encode_cursor(rows[-1]["timestamp"], rows[-1]["_id"]) if has_more else None
+        )
+
+        return ActivityTimelinePage(
+            activities=activities,
+            next_cursor=next_cursor,
+            has_more=has_more,
+            filters=filters,
+        )
+
+    except Exception as e:
+        logger.error(f"Error fetching activity timeline: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch activity timeline")
+
+
 @router.get("/activities/summary")
 async def get_activities_summary(
     request: Request,
@@ -1177,7 +1263,7 @@ async def get_activities_summary(
         Summary statistics grouped by source and activity type
     """
     try:
-        db = get_mongo().db
+        db = get_mongo().async_db
         summary = {}
 
         # Build date filter
@@ -1241,7 +1327,7 @@ async def get_activities_summary(
                         }
                     },
                 ]
-                result = list(commits.aggregate(pipeline))
+                result = await commits.aggregate(pipeline).to_list(length=1)
                 if result:
                     commit_count = result[0]["count"]
                     source_summary["total_activities"] += commit_count
@@ -1252,7 +1338,7 @@ async def get_activities_summary(
 
                 # PRs
                 prs = db["github_pull_requests"]
-                pr_count = prs.count_documents(query if date_filter else {})
+                pr_count = await prs.count_documents(query if date_filter else {})
                 if pr_count > 0:
                     source_summary["total_activities"] += pr_count
                     source_summary["activity_types"]["pull_request"] = {
@@ -1279,7 +1365,7 @@ async def get_activities_summary(
                         }
                     },
                 ]
-                result = list(messages.aggregate(pipeline))
+                result = await messages.aggregate(pipeline).to_list(length=1)
                 if result:
                     msg_count = result[0]["count"]
                     source_summary["total_activities"] = msg_count
@@ -1294,7 +1380,7 @@ async def get_activities_summary(
                 if date_filter:
                     query["created_time"] = date_filter
 
-                page_count = pages.count_documents(query)
+                page_count = await pages.count_documents(query)
                 if page_count > 0:
                     source_summary["total_activities"] = page_count
                     source_summary["activity_types"]["page_created"] = {
@@ -1307,12 +1393,12 @@ async def get_activities_summary(
                 if date_filter:
                     query["timestamp"] = date_filter
 
-                drive_count = drive_activities.count_documents(query)
+                drive_count = await drive_activities.count_documents(query)
                 if drive_count > 0:
                     source_summary["total_activities"] = drive_count
 
             elif source == "recordings":
-                shared_db = get_mongo().shared_db
+                shared_db = get_mongo().shared_async_db
                 recordings = shared_db["recordings"]
                 query = {}
                 if date_filter:
@@ -1328,7 +1414,7 @@ async def get_activities_summary(
                         }
                     },
                 ]
-                result = list(recordings.aggregate(pipeline))
+                result = await recordings.aggregate(pipeline).to_list(length=1)
                 if result:
                     recording_count = result[0]["count"]
                     source_summary["total_activities"] = recording_count
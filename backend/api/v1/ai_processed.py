@@ -4,6 +4,8 @@ AI Processed Data API endpoints
 Provides endpoints for AI-processed data (Gemini summaries, translations, etc.)
 """
 
+import re
+
 from fastapi import APIRouter, HTTPException, Query, Request
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel
@@ -74,54 +76,29 @@ class FailedRecording(BaseModel):
 # Helper functions
 # ============================================
 
-# Cache for gemini database connection
-_gemini_db_cache = None
+def _get_mongo():
+    from backend.main import mongo_manager
+    return mongo_manager
 
-def get_gemini_db():
-    """Get gemini database connection (cached)"""
-    global _gemini_db_cache
-    
-    if _gemini_db_cache is not None:
-        return _gemini_db_cache
-    
-    import os
-    from pymongo import MongoClient
-    
-    # Get MongoDB URI from environment
-    gemini_uri = os.getenv('GEMINI_MONGODB_URI')
-    if not gemini_uri:
-        # Fall back to main MongoDB URI
-        gemini_uri = os.getenv('MONGODB_URI', 'mongodb://localhost:27017')
-    
-    # Create a direct connection to gemini database
-    client = MongoClient(gemini_uri)
-    _gemini_db_cache = client["gemini"]
-    return _gemini_db_cache
 
+def get_gemini_db():
+    """Get synchronous gemini database (for legacy sync code paths)"""
+    return _get_mongo().gemini_db
 
-# Cache for shared database connection
-_shared_db_cache = None
 
 def get_shared_db():
-    """Get shared database connection (cached)"""
-    global _shared_db_cache
-    
-    if _shared_db_cache is not None:
-        return _shared_db_cache
-    
-    import os
-    from pymongo import MongoClient
-    
-    # Get MongoDB URI from environment
-    shared_uri = os.getenv('SHARED_MONGODB_URI')
-    if not shared_uri:
-        # Fall back to main MongoDB URI
-        shared_uri = os.getenv('MONGODB_URI', 'mongodb://localhost:27017')
-    
-    # Create a direct connection to shared database
-    client = MongoClient(shared_uri)
-    _shared_db_cache = client["shared"]
-    return _shared_db_cache
+    """Get synchronous shared database (for legacy sync code paths)"""
+    return _get_mongo().shared_db
+
+
+def get_gemini_async_db():
+    """Get asynchronous (Motor) gemini database for use inside async handlers"""
+    return _get_mongo().gemini_async_db
+
+
+def get_shared_async_db():
+    """Get asynchronous (Motor) shared database for use inside async handlers"""
+    return _get_mongo().shared_async_db
 
 
 # ============================================
@@ -141,18 +118,18 @@ async def get_meetings(
     Get list of meetings with AI analyses from gemini.recordings
     """
     try:
-        gemini_db = get_gemini_db()
-        shared_db = get_shared_db()
+        gemini_db = get_gemini_async_db()
+        shared_db = get_shared_async_db()
         
         # Build aggregation pipeline to get unique meetings
         match_stage: Dict[str, Any] = {}
         if search:
             match_stage["$or"] = [
-                {"meeting_title": {"$regex": search, "$options": "i"}},
-                {"participants": {"$regex": search, "$options": "i"}}
+                {"meeting_title": {"$regex": re.escape(search), "$options": "i"}},
+                {"participants": {"$regex": re.escape(search), "$options": "i"}}
             ]
         if participant:
-            match_stage["participants"] = {"$regex": participant, "$options": "i"}
+            match_stage["participants"] = {"$regex": re.escape(participant), "$options": "i"}
         if template:
             match_stage["analysis.template_used"] = template
         
@@ -187,11 +164,21 @@ async def get_meetings(
             {"$group": {"_id": "$meeting_id"}},
             {"$count": "total"}
         ]
-        count_result = list(gemini_db["recordings"].aggregate(count_pipeline))
+        count_result = await gemini_db["recordings"].aggregate(count_pipeline).to_list(length=1)
         total = count_result[0]["total"] if count_result else 0
         
         # Execute main pipeline
-        results = list(gemini_db["recordings"].aggregate(pipeline))
+        results = await gemini_db["recordings"].aggregate(pipeline).to_list(length=limit)
+        
+        # Fetch all original recordings from shared.recordings in one query
+        recording_ids = [
+            ObjectId(r["_id"]) for r in results
+            if r.get("_id") and ObjectId.is_valid(str(r["_id"]))
+        ]
+        shared_recordings = {}
+        if recording_ids:
+            async for rec in shared_db["recordings"].find({"_id": {"$in": recording_ids}}):
+                shared_recordings[str(rec["_id"])] = rec
         
         # Build response with shared.recordings data
         meetings = []
@@ -199,12 +186,7 @@ async def get_meetings(
             meeting_id = r["_id"]
             
             # Get original recording from shared.recordings
-            shared_recording = None
-            if meeting_id:
-                try:
-                    shared_recording = shared_db["recordings"].find_one({"_id": ObjectId(meeting_id)})
-                except:
-                    pass
+            shared_recording = shared_recordings.get(str(meeting_id)) if meeting_id else None
             
             # Build analyses dict by template
             analyses_dict = {}
@@ -262,8 +244,8 @@ async def get_meeting_detail(
     - Google Drive document ID (from shared.recordings.id)
     """
     try:
-        gemini_db = get_gemini_db()
-        shared_db = get_shared_db()
+        gemini_db = get_gemini_async_db()
+        shared_db = get_shared_async_db()
         
         # First, try to find the shared recording by different IDs
         shared_recording = None
@@ -271,7 +253,7 @@ async def get_meeting_detail(
         
         # Try as MongoDB ObjectId first
         try:
-            shared_recording = shared_db["recordings"].find_one({"_id": ObjectId(meeting_id)})
+            shared_recording = await shared_db["recordings"].find_one({"_id": ObjectId(meeting_id)})
             if shared_recording:
                 actual_meeting_id = shared_recording["_id"]
         except:
@@ -279,7 +261,7 @@ async def get_meeting_detail(
         
         # If not found, try as Google Drive ID
         if not shared_recording:
-            shared_recording = shared_db["recordings"].find_one({"id": meeting_id})
+            shared_recording = await shared_db["recordings"].find_one({"id": meeting_id})
             if shared_recording:
                 actual_meeting_id = shared_recording["_id"]
         
@@ -288,13 +270,13 @@ async def get_meeting_detail(
         analyses = []
         if actual_meeting_id:
             # Try both string and ObjectId formats
-            analyses = list(gemini_db["recordings"].find({"meeting_id": str(actual_meeting_id)}))
+            analyses = await gemini_db["recordings"].find({"meeting_id": str(actual_meeting_id)}).to_list(length=None)
             if not analyses:
-                analyses = list(gemini_db["recordings"].find({"meeting_id": actual_meeting_id}))
+                analyses = await gemini_db["recordings"].find({"meeting_id": actual_meeting_id}).to_list(length=None)
         
         # If still no analyses, try with the original meeting_id as string
         if not analyses:
-            analyses = list(gemini_db["recordings"].find({"meeting_id": meeting_id}))
+            analyses = await gemini_db["recordings"].find({"meeting_id": meeting_id}).to_list(length=None)
         
         if not analyses and not shared_recording:
             raise HTTPException(status_code=404, detail="Meeting not found")
@@ -360,7 +342,7 @@ async def get_meeting_analysis(
                decision_log, quick_recap, meeting_context
     """
     try:
-        gemini_db = get_gemini_db()
+        gemini_db = get_gemini_async_db()
         
         # Find the specific analysis
         try:
@@ -374,7 +356,7 @@ async def get_meeting_analysis(
                 "analysis.template_used": template
             }
         
-        doc = gemini_db["recordings"].find_one(query)
+        doc = await gemini_db["recordings"].find_one(query)
         
         if not doc:
             raise HTTPException(status_code=404, detail=f"Analysis not found for template: {template}")
@@ -417,12 +399,12 @@ async def get_failed_recordings(
     Get list of failed recordings from shared.failed_recordings
     """
     try:
-        shared_db = get_shared_db()
+        shared_db = get_shared_async_db()
         
         cursor = shared_db["failed_recordings"].find().skip(offset).limit(limit)
         
         results = []
-        for doc in cursor:
+        async for doc in cursor:
             results.append(FailedRecording(
                 id=str(doc["_id"]),
                 name=doc.get("name", ""),
@@ -449,27 +431,29 @@ async def get_ai_stats(request: Request):
     Get AI processing statistics
     """
     try:
-        gemini_db = get_gemini_db()
-        shared_db = get_shared_db()
+        gemini_db = get_gemini_async_db()
+        shared_db = get_shared_async_db()
         
         # Count unique meetings
-        unique_meetings = len(gemini_db["recordings"].distinct("meeting_id"))
+        unique_meetings = len(await gemini_db["recordings"].distinct("meeting_id"))
         
         # Count by template
-        template_stats = list(gemini_db["recordings"].aggregate([
+        template_stats = await gemini_db["recordings"].aggregate([
             {"$group": {"_id": "$analysis.template_used", "count": {"$sum": 1}}},
             {"$sort": {"count": -1}}
-        ]))
+        ]).to_list(length=None)
         
         # Failed recordings count
-        failed_count = shared_db["failed_recordings"].count_documents({})
+        failed_count = await shared_db["failed_recordings"].count_documents({})
         
         # Original recordings count
-        original_count = shared_db["recordings"].count_documents({})
+        original_count = await shared_db["recordings"].count_documents({})
+        
+        total_analyses = await gemini_db["recordings"].count_documents({})
         
         return {
             "total_meetings": unique_meetings,
-            "total_analyses": gemini_db["recordings"].count_documents({}),
+            "total_analyses": total_analyses,
             "original_recordings": original_count,
             "failed_recordings": failed_count,
             "templates": {t["_id"]: t["count"] for t in template_stats if t["_id"]},
@@ -523,7 +507,7 @@ async def get_recordings_daily(
     Get list of daily recordings analyses from gemini.recordings_daily
     """
     try:
-        gemini_db = get_gemini_db()
+        gemini_db = get_gemini_async_db()
         
         # Build query
         query: Dict[str, Any] = {}
@@ -536,7 +520,7 @@ async def get_recordings_daily(
             query["target_date"] = date_query
         
         # Get total count
-        total = gemini_db["recordings_daily"].count_documents(query)
+        total = await gemini_db["recordings_daily"].count_documents(query)
         
         # Get documents
         cursor = gemini_db["recordings_daily"].find(query).sort("target_date", -1).skip(offset).limit(limit)
@@ -554,7 +538,7 @@ async def get_recordings_daily(
             return v
         
         analyses = []
-        for doc in cursor:
+        async for doc in cursor:
             # Convert ObjectId to string
             doc_id = str(doc["_id"])
             
@@ -602,9 +586,9 @@ async def get_recordings_daily_by_date(
     Get daily recordings analysis for a specific date
     """
     try:
-        gemini_db = get_gemini_db()
+        gemini_db = get_gemini_async_db()
         
-        doc = gemini_db["recordings_daily"].find_one({"target_date": date})
+        doc = await gemini_db["recordings_daily"].find_one({"target_date": date})
         
         if not doc:
             raise HTTPException(status_code=404, detail=f"No analysis found for date: {date}")
@@ -741,15 +725,10 @@ async def translate_text(
         cache_key = hashlib.sha256(cache_key_str.encode('utf-8')).hexdigest()
         
         # Try to get cached translation from MongoDB
+        translations_collection = _get_mongo().async_db["translations"]
         try:
-            from backend.main import mongo_manager
-            if mongo_manager._sync_client is None:
-                mongo_manager.connect_sync()
-            db = mongo_manager._sync_client[mongo_manager.database_name]
-            translations_collection = db["translations"]
-            
             # Check cache
-            cached = translations_collection.find_one({"cache_key": cache_key})
+            cached = await translations_collection.find_one({"cache_key": cache_key})
             if cached:
                 logger.info(f"Translation cache hit for key: {cache_key[:16]}...")
                 return TranslationResponse(
@@ -816,7 +795,7 @@ Rules:
                 "created_at": datetime.utcnow(),
                 "updated_at": datetime.utcnow()
             }
-            translations_collection.update_one(
+            await translations_collection.update_one(
                 {"cache_key": cache_key},
                 {"$set": translation_doc},
                 upsert=True
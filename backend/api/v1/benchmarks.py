@@ -30,8 +30,12 @@ class BackfillRequest(BaseModel):
 
 # --- Helper ---
 
+def _get_mongo(request: Request):
+    return request.app.state.mongo_manager
+
+
 def _get_db(request: Request):
-    return request.app.state.mongo_manager.db
+    return _get_mongo(request).async_db
 
 
 # --- External Project CRUD ---
@@ -40,10 +44,10 @@ def _get_db(request: Request):
 async def list_external_projects(request: Request):
     """List all registered external projects."""
     db = _get_db(request)
-    projects = list(db["external_projects"].find(
+    projects = await db["external_projects"].find(
         {},
         {"_id": 0},
-    ).sort("full_name", 1))
+    ).sort("full_name", 1).to_list(length=None)
     return {"projects": projects, "total": len(projects)}
 
 
@@ -53,7 +57,7 @@ async def add_external_project(request: Request, body: AddProjectRequest):
     db = _get_db(request)
 
     full_name = f"{body.owner}/{body.repo}"
-    existing = db["external_projects"].find_one({"full_name": full_name})
+    existing = await db["external_projects"].find_one({"full_name": full_name})
     if existing:
         raise HTTPException(status_code=409, detail=f"Project {full_name} already registered")
 
@@ -65,7 +69,8 @@ async def add_external_project(request: Request, body: AddProjectRequest):
     from src.plugins.external_github_collector import ExternalGitHubCollector
 
     collector = ExternalGitHubCollector(github_token)
-    info = collector.get_repo_info(body.owner, body.repo)
+    # GitHub REST calls are blocking; keep them off the event loop
+    info = await _get_mongo(request).run_sync(collector.get_repo_info, body.owner, body.repo)
     if not info:
         raise HTTPException(status_code=404, detail=f"Repository {full_name} not found on GitHub")
 
@@ -86,7 +91,7 @@ async def add_external_project(request: Request, body: AddProjectRequest):
         "created_at": now,
         "updated_at": now,
     }
-    db["external_projects"].insert_one(doc)
+    await db["external_projects"].insert_one(doc)
     doc.pop("_id", None)
 
     # Backfill 30 days of benchmark data (bulk fetch)
@@ -94,11 +99,13 @@ async def add_external_project(request: Request, body: AddProjectRequest):
     today = datetime.now(timezone.utc)
     start_date = today - timedelta(days=backfill_days)
 
-    daily_stats = collector.collect_range_stats(body.owner, body.repo, start_date, today)
+    daily_stats = await _get_mongo(request).run_sync(
+        collector.collect_range_stats, body.owner, body.repo, start_date, today
+    )
     backfill_count = 0
     for stats in daily_stats:
         if stats["commits_count"] > 0 or stats["prs_opened"] > 0 or stats["issues_opened"] > 0:
-            db["project_benchmarks"].update_one(
+            await db["project_benchmarks"].update_one(
                 {"project_ref": full_name, "date": stats["date"]},
                 {"$set": stats},
                 upsert=True,
@@ -118,12 +125,12 @@ async def remove_external_project(request: Request, owner: str, repo: str):
     db = _get_db(request)
     full_name = f"{owner}/{repo}"
 
-    result = db["external_projects"].delete_one({"full_name": full_name})
+    result = await db["external_projects"].delete_one({"full_name": full_name})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail=f"Project {full_name} not found")
 
     # Also remove benchmark data
-    deleted_benchmarks = db["project_benchmarks"].delete_many({"project_ref": full_name})
+    deleted_benchmarks = await db["project_benchmarks"].delete_many({"project_ref": full_name})
 
     return {
         "message": f"Project {full_name} removed",
@@ -164,7 +171,9 @@ async def compare_projects(
         "project_ref": {"$in": project_list},
         "date": {"$gte": start_date, "$lte": end_date},
     }
-    benchmarks = list(db["project_benchmarks"].find(query, {"_id": 0}).sort("date", 1))
+    benchmarks = await db["project_benchmarks"].find(query, {"_id": 0}).sort("date", 1).to_list(
+        length=None
+    )
 
     # Group by project
     project_data = {}
@@ -251,17 +260,19 @@ async def backfill_comparison_data(request: Request, body: BackfillRequest):
             continue
 
         # Verify project is registered
-        project = db["external_projects"].find_one({"full_name": ref})
+        project = await db["external_projects"].find_one({"full_name": ref})
         if not project:
             results[ref] = {"status": "not_registered", "backfilled": 0}
             continue
 
         owner, repo = ref.split("/", 1)
-        daily_stats = collector.collect_range_stats(owner, repo, start_dt, end_dt)
+        daily_stats = await _get_mongo(request).run_sync(
+            collector.collect_range_stats, owner, repo, start_dt, end_dt
+        )
         count = 0
         for stats in daily_stats:
             if stats["commits_count"] > 0 or stats["prs_opened"] > 0 or stats["issues_opened"] > 0:
-                db["project_benchmarks"].update_one(
+                await db["project_benchmarks"].update_one(
                     {"project_ref": ref, "date": stats["date"]},
                     {"$set": stats},
                     upsert=True,
@@ -285,10 +296,10 @@ async def search_internal_repos(
     if q.strip():
         query["name"] = {"$regex": q.strip(), "$options": "i"}
 
-    repos = list(db["github_repositories"].find(
+    repos = await db["github_repositories"].find(
         query,
         {"_id": 0, "name": 1, "description": 1, "url": 1, "pushed_at": 1},
-    ).sort("pushed_at", -1).limit(limit))
+    ).sort("pushed_at", -1).limit(limit).to_list(length=limit)
 
     return {"repos": repos, "total": len(repos)}
 
@@ -9,24 +9,35 @@ from fastapi.responses import StreamingResponse
 from typing import Optional, List, Dict, Set
 from pydantic import BaseModel
 from datetime import datetime, timedelta
-from bson import ObjectId
 import csv
 import io
 import os
 import requests
 import yaml
 import json
-import zipfile
-import asyncio
 import re
 
 from src.utils.logger import get_logger
+from src.core.identity_index import identity_cache
 from src.utils.toon_encoder import encode_toon
+from src.utils.export_stream import (
+    CURSOR_BATCH_SIZE,
+    clean_document,
+    encode_csv,
+    encode_json_array,
+    encode_toon_array,
+    iterate_cursor,
+    peek,
+    zip_entries,
+)
 
 logger = get_logger(__name__)
 
 router = APIRouter()
 
+# Documents per collection when the request sets no limit
+MAX_COLLECTION_EXPORT_DOCS = 100000
+
 
 class CustomExportRequest(BaseModel):
     """Request model for custom export preview"""
@@ -60,19 +71,42 @@ def get_mongo():
     return mongo_manager
 
 
-def get_identifiers_for_member(member_name: str, db) -> dict:
-    """Get all identifiers for a member across different sources"""
-    identifiers = {"github": [], "slack": [], "notion": [], "drive": []}
+def encode_collection(rows, export_format: str, key: str, collection, query_filter: dict, max_docs: int):
+    """
+    Streaming encoder for a collection export
+
+    Args:
+        rows: Cleaned (flattened) documents
+        export_format: csv, json or toon
+        key: TOON array name
+        collection: Motor collection
+        query_filter: Export query (used for the TOON length)
+        max_docs: Export limit
+
+    Returns:
+        (chunk iterator, file extension, media type)
+    """
+    if export_format == "json":
+        return encode_json_array(rows), "json", "application/json"
+
+    if export_format == "toon":
 
-    # Use same field names as activities_mongo.py: source, identifier_value, member_name
-    member_identifiers = db["member_identifiers"].find({"member_name": member_name})
-    for identifier in member_identifiers:
-        source = identifier.get("source", "").lower()
-        identifier_value = identifier.get("identifier_value")
-        if source in identifiers and identifier_value:
-            identifiers[source].append(identifier_value)
+        async def count():
+            return await collection.count_documents(query_filter, limit=max_docs)
 
-    return identifiers
+        return encode_toon_array(key, rows, count, delimiter=","), "toon", "text/plain"
+
+    # CSV: fields from first record, then new fields from other records at the end
+    return encode_csv(rows), "csv", "text/csv"
+
+
+async def get_identifiers_for_member(member_name: str, db) -> dict:
+    """Get all identifiers for a member across different sources"""
+    identity = await identity_cache.get_async(db)
+    return {
+        source: identity.identifiers_for(member_name, source)
+        for source in ("github", "slack", "notion", "drive")
+    }
 
 
 def get_source_from_field(field: str) -> str:
@@ -264,7 +298,7 @@ async def get_custom_export_preview(request: Request, body: CustomExportRequest)
     """
     try:
         mongo = get_mongo()
-        db = mongo.db
+        db = mongo.async_db
 
         # Determine which sources to query based on selected fields
         sources_needed = set()
@@ -308,7 +342,7 @@ async def get_custom_export_preview(request: Request, body: CustomExportRequest)
         member_info_map = {}
         if members_to_filter:
             for name in members_to_filter:
-                member = db["members"].find_one({"name": name})
+                member = await db["members"].find_one({"name": name})
                 if member:
                     member_info_map[name] = {
                         "email": member.get("email"),
@@ -424,7 +458,9 @@ async def fetch_github_data(
     # Read from MongoDB (automatically synced from GitHub Teams during data collection)
     project_repos = None
     if project and project != "all":
-        project_repos = get_project_repositories_from_mongodb(project)
+        project_repos = await get_mongo().run_sync(
+            get_project_repositories_from_mongodb, project
+        )
         if not project_repos:
             logger.warning(
                 f"No repositories found for project {project}, returning empty results"
@@ -432,7 +468,7 @@ async def fetch_github_data(
             return []
 
     for member_name in members:
-        identifiers = get_identifiers_for_member(member_name, db)
+        identifiers = await get_identifiers_for_member(member_name, db)
         member_info = member_info_map.get(member_name, {})
 
         # Build query for commits (use author_name field like activities_mongo.py)
@@ -455,7 +491,7 @@ async def fetch_github_data(
             commit_query["repository"] = {"$in": list(project_repos)}
 
         # Fetch commits (no limit for full export)
-        commits = list(db["github_commits"].find(commit_query).sort("date", -1))
+        commits = await db["github_commits"].find(commit_query).sort("date", -1).to_list(length=None)
         for commit in commits:
             results.append(
                 {
@@ -489,7 +525,7 @@ async def fetch_github_data(
         if project_repos:
             pr_query["repository"] = {"$in": list(project_repos)}
 
-        prs = list(db["github_pull_requests"].find(pr_query).sort("created_at", -1))
+        prs = await db["github_pull_requests"].find(pr_query).sort("created_at", -1).to_list(length=None)
         for pr in prs:
             results.append(
                 {
@@ -535,8 +571,8 @@ async def fetch_github_data(
         if project_repos:
             review_query["repository"] = {"$in": list(project_repos)}
 
-        reviews = list(
-            db["github_reviews"].find(review_query).sort("submitted_at", -1)
+        reviews = await (
+            db["github_reviews"].find(review_query).sort("submitted_at", -1).to_list(length=None)
         )
         for review in reviews:
             results.append(
@@ -566,7 +602,7 @@ async def fetch_slack_data(
     results = []
 
     for member_name in members:
-        identifiers = get_identifiers_for_member(member_name, db)
+        identifiers = await get_identifiers_for_member(member_name, db)
         member_info = member_info_map.get(member_name, {})
 
         # Build query
@@ -587,7 +623,7 @@ async def fetch_slack_data(
         if date_filter:
             query["posted_at"] = date_filter
 
-        messages = list(db["slack_messages"].find(query).sort("posted_at", -1))
+        messages = await db["slack_messages"].find(query).sort("posted_at", -1).to_list(length=None)
         for msg in messages:
             # Clean text: replace newlines with space, strip whitespace
             # No truncation - keep full message for data analysis
@@ -626,7 +662,7 @@ async def fetch_notion_data(
     fetch_content_diffs = "notion.content_diffs" in notion_fields
 
     for member_name in members:
-        identifiers = get_identifiers_for_member(member_name, db)
+        identifiers = await get_identifiers_for_member(member_name, db)
         member_info = member_info_map.get(member_name, {})
         member_email = (member_info.get("email") or "").strip().lower()
 
@@ -644,7 +680,7 @@ async def fetch_notion_data(
             query = {"$or": or_conditions}
             if date_filter:
                 query["created_time"] = date_filter
-            pages = list(db["notion_pages"].find(query).sort("created_time", -1))
+            pages = await db["notion_pages"].find(query).sort("created_time", -1).to_list(length=None)
             for page in pages:
                 title = ""
                 props = page.get("properties", {})
@@ -685,11 +721,12 @@ async def fetch_notion_data(
                     else:
                         ts_filter[op] = val
                 diff_query["timestamp"] = ts_filter
-            diffs = list(
+            diffs = await (
                 db["notion_content_diffs"]
                 .find(diff_query)
                 .sort("timestamp", -1)
                 .limit(1000)
+                .to_list(length=None)
             )
             for diff in diffs:
                 changes = diff.get("changes", {})
@@ -743,7 +780,7 @@ async def fetch_drive_data(
     results = []
 
     for member_name in members:
-        identifiers = get_identifiers_for_member(member_name, db)
+        identifiers = await get_identifiers_for_member(member_name, db)
         member_info = member_info_map.get(member_name, {})
 
         # Build query for drive activities
@@ -766,7 +803,7 @@ async def fetch_drive_data(
             query["timestamp"] = date_filter
 
         # Use timestamp field for sorting (not activity_time)
-        activities = list(db["drive_activities"].find(query).sort("timestamp", -1))
+        activities = await db["drive_activities"].find(query).sort("timestamp", -1).to_list(length=None)
         for activity in activities:
             results.append(
                 {
@@ -801,9 +838,9 @@ async def fetch_gemini_data(
     results = []
 
     try:
-        from backend.api.v1.ai_processed import get_gemini_db
+        from backend.api.v1.ai_processed import get_gemini_async_db
 
-        gemini_db = get_gemini_db()
+        gemini_db = get_gemini_async_db()
         recordings_daily_col = gemini_db["recordings_daily"]
 
         # Build query
@@ -818,8 +855,7 @@ async def fetch_gemini_data(
                     string_date_filter[op] = value
             query["target_date"] = string_date_filter
 
-        # Get documents (sync operation)
-        daily_docs = list(recordings_daily_col.find(query).sort("target_date", -1))
+        daily_docs = await recordings_daily_col.find(query).sort("target_date", -1).to_list(length=None)
 
         for daily in daily_docs:
             # If members are specified, filter by participants
@@ -1012,9 +1048,9 @@ async def fetch_recordings_data(
     results = []
 
     try:
-        from backend.api.v1.ai_processed import get_gemini_db
+        from backend.api.v1.ai_processed import get_gemini_async_db
 
-        gemini_db = get_gemini_db()
+        gemini_db = get_gemini_async_db()
         recordings_col = gemini_db["recordings"]
 
         # Build query
@@ -1038,9 +1074,8 @@ async def fetch_recordings_data(
         logger.info(f"[RECORDINGS] Members filter: {members}")
         logger.info(f"[RECORDINGS] Date filter: {date_filter}")
 
-        # Get recordings (sync operation for gemini)
-        recordings = list(
-            recordings_col.find(query).sort("meeting_date", -1).limit(10000)
+        recordings = await (
+            recordings_col.find(query).sort("meeting_date", -1).limit(10000).to_list(length=None)
         )
 
         logger.info(f"[RECORDINGS] Found {len(recordings)} documents")
@@ -1109,11 +1144,11 @@ async def get_export_members(request: Request):
     """
     try:
         mongo = get_mongo()
-        db = mongo.db
+        db = mongo.async_db
 
-        members = list(
-            db["members"].find({}, {"name": 1, "email": 1, "role": 1, "team": 1})
-        )
+        members = await db["members"].find(
+            {}, {"name": 1, "email": 1, "role": 1, "team": 1}
+        ).to_list(length=None)
 
         return {
             "success": True,
@@ -1157,7 +1192,7 @@ async def export_custom_data(
 
         # Get preview data (full, not limited)
         mongo = get_mongo()
-        db = mongo.db
+        db = mongo.async_db
 
         # Determine which sources to query
         sources_needed = set()
@@ -1205,7 +1240,7 @@ async def export_custom_data(
         member_info_map = {}
         if members_to_filter:
             for name in members_to_filter:
-                member = db["members"].find_one({"name": name})
+                member = await db["members"].find_one({"name": name})
                 if member:
                     member_info_map[name] = {
                         "email": member.get("email"),
@@ -1383,11 +1418,7 @@ async def get_custom_export_collections(request: Request):
         mongo = get_mongo()
         db = mongo.async_db
         shared_db = mongo.shared_async_db
-
-        # Get gemini database
-        from backend.api.v1.ai_processed import get_gemini_db
-
-        gemini_db_sync = get_gemini_db()
+        gemini_db = mongo.gemini_async_db
 
         collections_by_source = {"main": [], "shared": [], "gemini": []}
 
@@ -1418,10 +1449,10 @@ async def get_custom_export_collections(request: Request):
 
         # Get gemini database collections
         try:
-            gemini_collections = gemini_db_sync.list_collection_names()
+            gemini_collections = await gemini_db.list_collection_names()
             for name in gemini_collections:
                 try:
-                    count = gemini_db_sync[name].count_documents({})
+                    count = await gemini_db[name].count_documents({})
                     collections_by_source["gemini"].append(
                         {"name": f"gemini.{name}", "count": count, "source": "gemini"}
                     )
@@ -1477,21 +1508,15 @@ async def export_collection(request: Request, body: CollectionExportRequest):
             actual_collection = collection_name.replace("shared.", "")
             source = "shared"  # Override source if collection name has prefix
         elif collection_name.startswith("gemini."):
-            from backend.api.v1.ai_processed import get_gemini_db
-
-            gemini_db_sync = get_gemini_db()
+            db = mongo.gemini_async_db
             actual_collection = collection_name.replace("gemini.", "")
             source = "gemini"  # Override source if collection name has prefix
-            db = None  # Will handle separately
         elif source == "shared" or source == "other":
             db = mongo.shared_async_db
             actual_collection = collection_name
         elif source == "gemini":
-            from backend.api.v1.ai_processed import get_gemini_db
-
-            gemini_db_sync = get_gemini_db()
+            db = mongo.gemini_async_db
             actual_collection = collection_name
-            db = None  # Will handle separately
         else:
             db = mongo.async_db
             actual_collection = collection_name
@@ -1520,10 +1545,7 @@ async def export_collection(request: Request, body: CollectionExportRequest):
                 ]
                 timestamp_field = None
 
-                if source == "gemini":
-                    sample_doc = gemini_db_sync[actual_collection].find_one({})
-                else:
-                    sample_doc = await db[actual_collection].find_one({})
+                sample_doc = await db[actual_collection].find_one({})
 
                 if sample_doc:
                     for field in timestamp_fields:
@@ -1552,46 +1574,17 @@ async def export_collection(request: Request, body: CollectionExportRequest):
                     if date_filter:
                         query_filter[timestamp_field] = date_filter
 
-        # Query MongoDB with batching for large collections
-        if source == "gemini":
-            cursor = gemini_db_sync[actual_collection].find(query_filter)
-            if body.limit:
-                cursor = cursor.limit(body.limit)
-            documents = list(cursor)
-        else:
-            cursor = db[actual_collection].find(query_filter)
-            if body.limit:
-                cursor = cursor.limit(body.limit)
-            # Use batch processing for large collections to avoid memory issues
-            max_docs = body.limit or 100000
-            documents = []
-            count = 0
-            async for doc in cursor:
-                documents.append(doc)
-                count += 1
-                if count >= max_docs:
-                    break
-                # Yield control periodically for large collections (every 10000 docs)
-                if count % 10000 == 0:
-                    await asyncio.sleep(0)  # Yield to event loop
-
-        if not documents:
-            raise HTTPException(status_code=404, detail="No documents found")
+        # Stream documents from the cursor (at most 100,000 without an explicit limit)
+        max_docs = body.limit or MAX_COLLECTION_EXPORT_DOCS
+        collection = db[actual_collection]
+        cursor = collection.find(query_filter).limit(max_docs).batch_size(CURSOR_BATCH_SIZE)
 
-        # Convert documents
-        rows = []
-        for doc in documents:
-            clean_doc = {}
-            for key, value in doc.items():
-                if isinstance(value, ObjectId):
-                    clean_doc[key] = str(value)
-                elif isinstance(value, datetime):
-                    clean_doc[key] = value.isoformat()
-                elif isinstance(value, (dict, list)):
-                    clean_doc[key] = json.dumps(value, default=str, ensure_ascii=False)
-                else:
-                    clean_doc[key] = value
-            rows.append(clean_doc)
+        rows = (
+            clean_document(doc, flatten=True) async for doc in iterate_cursor(cursor)
+        )
+        first, rows = await peek(rows)
+        if first is None:
+            raise HTTPException(status_code=404, detail="No documents found")
 
         # Generate filename
         date_suffix = (
@@ -1601,42 +1594,16 @@ async def export_collection(request: Request, body: CollectionExportRequest):
         )
         filename_base = f"{collection_name}_{date_suffix}"
 
-        if body.format == "json":
-            output = json.dumps(rows, indent=2, ensure_ascii=False, default=str)
-            filename = f"{filename_base}.json"
-            media_type = "application/json"
-
-        elif body.format == "toon":
-            toon_data = {actual_collection: rows}
-            output = encode_toon(toon_data, indent=2, delimiter=",")
-            filename = f"{filename_base}.toon"
-            media_type = "text/plain"
-
-        else:  # CSV
-            output_stream = io.StringIO()
-            if rows:
-                # Preserve field order: fields from first record, then new fields from other records at the end
-                fieldnames = []
-                seen_fields = set()
-                for row in rows:
-                    for field in row.keys():
-                        if field not in seen_fields:
-                            fieldnames.append(field)
-                            seen_fields.add(field)
-
-                writer = csv.DictWriter(
-                    output_stream, fieldnames=fieldnames, extrasaction="ignore"
-                )
-                writer.writeheader()
-                writer.writerows(rows)
-            output = output_stream.getvalue()
-            filename = f"{filename_base}.csv"
-            media_type = "text/csv"
+        chunks, file_ext, media_type = encode_collection(
+            rows, body.format, actual_collection, collection, query_filter, max_docs
+        )
 
         return StreamingResponse(
-            iter([output]),
+            chunks,
             media_type=media_type,
-            headers={"Content-Disposition": f"attachment; filename={filename}"},
+            headers={
+                "Content-Disposition": f"attachment; filename={filename_base}.{file_ext}"
+            },
         )
 
     except HTTPException:
@@ -1659,256 +1626,162 @@ async def export_collections_bulk(request: Request, body: CollectionExportReques
     try:
         mongo = get_mongo()
 
-        # Create in-memory ZIP file
-        zip_buffer = io.BytesIO()
-
-        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-            total_collections = len(body.collections)
-            logger.info(f"Starting bulk export of {total_collections} collections")
+        # Resolve collections and queries up front; fail early if nothing has data
+        targets = []
+        for collection_info in body.collections:
+            source = collection_info.get("source")
+            collection_name = collection_info.get("collection")
 
-            for idx, collection_info in enumerate(body.collections, 1):
-                logger.info(
-                    f"Processing collection {idx}/{total_collections}: {collection_info.get('collection')}"
-                )
-                source = collection_info.get("source")
-                collection_name = collection_info.get("collection")
-
-                if not source or not collection_name:
-                    continue
-
-                try:
-                    # Select database
-                    # Handle collection_name that might already have prefix (e.g., "shared.recordings")
-                    if collection_name.startswith("shared."):
-                        db = mongo.shared_async_db
-                        actual_collection = collection_name.replace("shared.", "")
-                        source = (
-                            "shared"  # Override source if collection name has prefix
-                        )
-                    elif collection_name.startswith("gemini."):
-                        from backend.api.v1.ai_processed import get_gemini_db
+            if not source or not collection_name:
+                continue
 
-                        gemini_db_sync = get_gemini_db()
-                        actual_collection = collection_name.replace("gemini.", "")
-                        source = (
-                            "gemini"  # Override source if collection name has prefix
-                        )
-                        db = None
-                    elif source == "shared" or source == "other":
-                        db = mongo.shared_async_db
-                        actual_collection = collection_name
-                    elif source == "gemini":
-                        from backend.api.v1.ai_processed import get_gemini_db
-
-                        gemini_db_sync = get_gemini_db()
-                        actual_collection = collection_name
-                        db = None
+            try:
+                # Select database
+                # Handle collection_name that might already have prefix (e.g., "shared.recordings")
+                if collection_name.startswith("shared."):
+                    db = mongo.shared_async_db
+                    actual_collection = collection_name.replace("shared.", "")
+                    source = (
+                        "shared"  # Override source if collection name has prefix
+                    )
+                elif collection_name.startswith("gemini."):
+                    db = mongo.gemini_async_db
+                    actual_collection = collection_name.replace("gemini.", "")
+                    source = (
+                        "gemini"  # Override source if collection name has prefix
+                    )
+                elif source == "shared" or source == "other":
+                    db = mongo.shared_async_db
+                    actual_collection = collection_name
+                elif source == "gemini":
+                    db = mongo.gemini_async_db
+                    actual_collection = collection_name
+                else:
+                    db = mongo.async_db
+                    actual_collection = collection_name
+
+                # Build query filter
+                query_filter = {}
+                if body.start_date or body.end_date:
+                    if (
+                        source == "gemini"
+                        and actual_collection == "recordings_daily"
+                    ):
+                        date_filter = {}
+                        if body.start_date:
+                            date_filter["$gte"] = body.start_date
+                        if body.end_date:
+                            date_filter["$lte"] = body.end_date
+                        if date_filter:
+                            query_filter["target_date"] = date_filter
                     else:
-                        db = mongo.async_db
-                        actual_collection = collection_name
+                        timestamp_fields = [
+                            "timestamp",
+                            "posted_at",
+                            "created_at",
+                            "updated_at",
+                            "committed_at",
+                        ]
+                        timestamp_field = None
+
+                        sample_doc = await db[actual_collection].find_one({})
+
+                        if sample_doc:
+                            for field in timestamp_fields:
+                                if field in sample_doc:
+                                    timestamp_field = field
+                                    break
 
-                    # Build query filter
-                    query_filter = {}
-                    if body.start_date or body.end_date:
-                        if (
-                            source == "gemini"
-                            and actual_collection == "recordings_daily"
-                        ):
+                        if timestamp_field:
                             date_filter = {}
                             if body.start_date:
-                                date_filter["$gte"] = body.start_date
+                                try:
+                                    date_filter["$gte"] = datetime.fromisoformat(
+                                        body.start_date
+                                    )
+                                except ValueError:
+                                    date_filter["$gte"] = body.start_date
                             if body.end_date:
-                                date_filter["$lte"] = body.end_date
-                            if date_filter:
-                                query_filter["target_date"] = date_filter
-                        else:
-                            timestamp_fields = [
-                                "timestamp",
-                                "posted_at",
-                                "created_at",
-                                "updated_at",
-                                "committed_at",
-                            ]
-                            timestamp_field = None
-
-                            if source == "gemini":
-                                sample_doc = gemini_db_sync[actual_collection].find_one(
-                                    {}
-                                )
-                            else:
-                                sample_doc = await db[actual_collection].find_one({})
-
-                            if sample_doc:
-                                for field in timestamp_fields:
-                                    if field in sample_doc:
-                                        timestamp_field = field
-                                        break
-
-                            if timestamp_field:
-                                date_filter = {}
-                                if body.start_date:
-                                    try:
-                                        date_filter["$gte"] = datetime.fromisoformat(
-                                            body.start_date
-                                        )
-                                    except ValueError:
-                                        date_filter["$gte"] = body.start_date
-                                if body.end_date:
-                                    try:
-                                        end_dt = datetime.fromisoformat(
-                                            body.end_date
-                                        ) + timedelta(days=1)
-                                        date_filter["$lt"] = end_dt
-                                    except ValueError:
-                                        date_filter["$lte"] = (
-                                            body.end_date + "T23:59:59"
-                                        )
-
-                                if date_filter:
-                                    query_filter[timestamp_field] = date_filter
-
-                    # Query documents with batching for large collections
-                    if source == "gemini":
-                        cursor = gemini_db_sync[actual_collection].find(query_filter)
-                        if body.limit:
-                            cursor = cursor.limit(body.limit)
-                        documents = list(cursor)
-                    else:
-                        cursor = db[actual_collection].find(query_filter)
-                        if body.limit:
-                            cursor = cursor.limit(body.limit)
-                        # Use batch processing for large collections to avoid memory issues
-                        # Process in chunks to yield control periodically
-                        max_docs = body.limit or 100000
-                        documents = []
-                        count = 0
-                        async for doc in cursor:
-                            documents.append(doc)
-                            count += 1
-                            if count >= max_docs:
-                                break
-                            # Yield control periodically for large collections (every 10000 docs)
-                            if count % 10000 == 0:
-                                await asyncio.sleep(0)  # Yield to event loop
+                                try:
+                                    end_dt = datetime.fromisoformat(
+                                        body.end_date
+                                    ) + timedelta(days=1)
+                                    date_filter["$lt"] = end_dt
+                                except ValueError:
+                                    date_filter["$lte"] = (
+                                        body.end_date + "T23:59:59"
+                                    )
 
-                    if not documents:
-                        continue
+                            if date_filter:
+                                query_filter[timestamp_field] = date_filter
 
-                    # Convert documents
-                    rows = []
-                    for doc in documents:
-                        clean_doc = {}
-                        for key, value in doc.items():
-                            if isinstance(value, ObjectId):
-                                clean_doc[key] = str(value)
-                            elif isinstance(value, datetime):
-                                clean_doc[key] = value.isoformat()
-                            elif isinstance(value, (dict, list)):
-                                clean_doc[key] = json.dumps(
-                                    value, default=str, ensure_ascii=False
-                                )
-                            else:
-                                clean_doc[key] = value
-                        rows.append(clean_doc)
-
-                    # Generate file content based on format
-                    if body.format == "json":
-                        file_content = json.dumps(
-                            rows, indent=2, ensure_ascii=False, default=str
-                        )
-                        file_ext = "json"
-                    elif body.format == "toon":
-                        toon_data = {actual_collection: rows}
-                        file_content = encode_toon(toon_data, indent=2, delimiter=",")
-                        file_ext = "toon"
-                    else:  # CSV
-                        output_stream = io.StringIO()
-                        if rows:
-                            # Preserve field order: fields from first record, then new fields from other records at the end
-                            fieldnames = []
-                            seen_fields = set()
-                            for row in rows:
-                                for field in row.keys():
-                                    if field not in seen_fields:
-                                        fieldnames.append(field)
-                                        seen_fields.add(field)
-
-                            writer = csv.DictWriter(
-                                output_stream,
-                                fieldnames=fieldnames,
-                                extrasaction="ignore",
-                            )
-                            writer.writeheader()
-                            writer.writerows(rows)
-                        file_content = output_stream.getvalue()
-                        file_ext = "csv"
-
-                    # Add to ZIP
-                    # Remove database prefix from collection name for filename
-                    clean_collection_name = (
-                        re.sub(r"^(main|shared|gemini)\.", "", actual_collection)
-                        if isinstance(actual_collection, str)
-                        else actual_collection
-                    )
-                    date_suffix = (
-                        f"_{body.start_date or 'all'}_{body.end_date or 'all'}"
-                        if (body.start_date or body.end_date)
-                        else ""
-                    )
-                    zip_filename = (
-                        f"{source}_{clean_collection_name}{date_suffix}.{file_ext}"
+                collection = db[actual_collection]
+                has_data = await collection.find_one(query_filter, {"_id": 1})
+                if has_data:
+                    targets.append(
+                        (source, collection_name, actual_collection, collection, query_filter)
                     )
 
-                    # Ensure file_content is bytes for ZIP
-                    if isinstance(file_content, str):
-                        file_content_bytes = file_content.encode("utf-8")
-                    else:
-                        file_content_bytes = file_content
+            except Exception as e:
+                logger.error(f"Failed to export {collection_name}: {e}", exc_info=True)
+                continue
+
+        if not targets:
+            logger.warning("No collection has data to export")
+            raise HTTPException(
+                status_code=400,
+                detail="No data was exported. All collections may be empty or failed to export.",
+            )
 
-                    zip_file.writestr(zip_filename, file_content_bytes)
-                    logger.info(
-                        f"Added {zip_filename} to ZIP ({len(rows)} documents, {body.format.upper()} format)"
+        async def entries():
+            total_collections = len(targets)
+            logger.info(f"Starting bulk export of {total_collections} collections")
+
+            for idx, (source, collection_name, actual_collection, collection, query_filter) in enumerate(
+                targets, 1
+            ):
+                logger.info(
+                    f"Processing collection {idx}/{total_collections}: {collection_name}"
+                )
+                try:
+                    max_docs = body.limit or MAX_COLLECTION_EXPORT_DOCS
+                    cursor = collection.find(query_filter).limit(max_docs).batch_size(CURSOR_BATCH_SIZE)
+                    rows = (
+                        clean_document(doc, flatten=True)
+                        async for doc in iterate_cursor(cursor)
                     )
+                    first, rows = await peek(rows)
+                    if first is None:
+                        continue
 
+                    chunks, file_ext, _ = encode_collection(
+                        rows, body.format, actual_collection, collection, query_filter, max_docs
+                    )
                 except Exception as e:
                     logger.error(
                         f"Failed to export {collection_name}: {e}", exc_info=True
                     )
                     continue
 
-        zip_buffer.seek(0)
-        zip_data = zip_buffer.getvalue()
-
-        # Check if ZIP is empty or corrupted
-        if len(zip_data) < 22:  # Minimum ZIP file size (empty ZIP is ~22 bytes)
-            logger.warning("Generated ZIP file is empty or too small")
-            raise HTTPException(
-                status_code=400,
-                detail="No data was exported. All collections may be empty or failed to export.",
-            )
-
-        # Verify ZIP file integrity
-        try:
-            test_zip = zipfile.ZipFile(io.BytesIO(zip_data), "r")
-            file_list = test_zip.namelist()
-            test_zip.close()
-
-            if not file_list:
-                logger.warning("ZIP file contains no files")
-                raise HTTPException(
-                    status_code=400,
-                    detail="No files were added to the ZIP. All collections may be empty or failed to export.",
+                # Remove database prefix from collection name for filename
+                clean_collection_name = (
+                    re.sub(r"^(main|shared|gemini)\.", "", actual_collection)
+                    if isinstance(actual_collection, str)
+                    else actual_collection
+                )
+                date_suffix = (
+                    f"_{body.start_date or 'all'}_{body.end_date or 'all'}"
+                    if (body.start_date or body.end_date)
+                    else ""
+                )
+                zip_filename = f"{source}_{clean_collection_name}{date_suffix}.{file_ext}"
+                logger.info(
+                    f"Adding {zip_filename} to ZIP ({body.format.upper()} format)"
                 )
+                yield zip_filename, chunks
 
-            logger.info(
-                f"ZIP file created successfully with {len(file_list)} files: {', '.join(file_list[:5])}{'...' if len(file_list) > 5 else ''}"
-            )
-        except zipfile.BadZipFile as e:
-            logger.error(f"Generated ZIP file is corrupted: {e}")
-            raise HTTPException(
-                status_code=500,
-                detail="Failed to create ZIP file. The file may be corrupted.",
-            )
+        def on_entry_error(filename, error):
+            logger.error(f"Export of {filename} failed mid-stream, file is truncated: {error}")
 
         # Generate ZIP filename
         date_suffix = (
@@ -1919,11 +1792,13 @@ async def export_collections_bulk(request: Request, body: CollectionExportReques
         zip_filename = f"collections_export{date_suffix}.zip"
 
         return StreamingResponse(
-            iter([zip_data]),
+            zip_entries(entries(), on_error=on_entry_error),
             media_type="application/zip",
             headers={"Content-Disposition": f"attachment; filename={zip_filename}"},
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error exporting collections bulk: {e}")
         raise HTTPException(status_code=500, detail=str(e))
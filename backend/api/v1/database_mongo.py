@@ -110,10 +110,7 @@ async def get_database_stats(request: Request, _admin: str = Depends(require_adm
         mongo = get_mongo()
         db = mongo.async_db
         shared_db = mongo.shared_async_db
-        
-        # Get gemini database
-        from backend.api.v1.ai_processed import get_gemini_db
-        gemini_db_sync = get_gemini_db()
+        gemini_db = mongo.gemini_async_db
         
         total_size = 0  # Use 'size' instead of 'storageSize' to match individual collection display
         total_collections = 0
@@ -154,12 +151,12 @@ async def get_database_stats(request: Request, _admin: str = Depends(require_adm
         
         # Calculate from gemini database
         try:
-            gemini_collection_names = gemini_db_sync.list_collection_names()
+            gemini_collection_names = await gemini_db.list_collection_names()
             for name in gemini_collection_names:
                 try:
-                    collection = gemini_db_sync[name]
-                    count = collection.count_documents({})
-                    stats = gemini_db_sync.command("collStats", name)
+                    collection = gemini_db[name]
+                    count = await collection.count_documents({})
+                    stats = await gemini_db.command("collStats", name)
                     # Use 'size' (logical data size) to match what's shown in individual collection cards
                     total_size += stats.get("size", 0)
                     total_collections += 1
@@ -193,10 +190,7 @@ async def get_collections(request: Request, _admin: str = Depends(require_admin)
         mongo = get_mongo()
         db = mongo.async_db
         shared_db = mongo.shared_async_db
-        
-        # Get gemini database
-        from backend.api.v1.ai_processed import get_gemini_db
-        gemini_db_sync = get_gemini_db()
+        gemini_db = mongo.gemini_async_db
         
         collections_info = []
         
@@ -267,14 +261,14 @@ async def get_collections(request: Request, _admin: str = Depends(require_admin)
         
         # Get gemini database collections
         try:
-            gemini_collection_names = gemini_db_sync.list_collection_names()
+            gemini_collection_names = await gemini_db.list_collection_names()
             for name in gemini_collection_names:
                 try:
-                    collection = gemini_db_sync[name]
-                    count = collection.count_documents({})
+                    collection = gemini_db[name]
+                    count = await collection.count_documents({})
                     
                     # Get collection stats
-                    stats = gemini_db_sync.command("collStats", name)
+                    stats = await gemini_db.command("collStats", name)
                     
                     collections_info.append({
                         "name": f"gemini.{name}",  # Prefix with database name
@@ -342,16 +336,15 @@ async def get_collection_schema(request: Request, collection_name: str, _admin:
             # Sample documents to infer schema (take 100 documents)
             sample_docs = await collection.find({}).limit(100).to_list(length=100)
         elif is_gemini:
-            from backend.api.v1.ai_processed import get_gemini_db
-            gemini_db_sync = get_gemini_db()
+            db = mongo.gemini_async_db
             actual_name = collection_name.replace("gemini.", "", 1)
             # Verify collection exists
-            collection_names = gemini_db_sync.list_collection_names()
+            collection_names = await db.list_collection_names()
             if actual_name not in collection_names:
                 raise HTTPException(status_code=404, detail=f"Collection '{collection_name}' not found")
-            collection = gemini_db_sync[actual_name]
-            # Sample documents to infer schema (take 100 documents) - sync version
-            sample_docs = list(collection.find({}).limit(100))
+            collection = db[actual_name]
+            # Sample documents to infer schema (take 100 documents)
+            sample_docs = await collection.find({}).limit(100).to_list(length=100)
         else:
             db = mongo.async_db
             actual_name = collection_name
@@ -501,22 +494,21 @@ async def get_collection_documents(
             # MongoDB ObjectId contains timestamp, so newer documents have larger _id values
             documents = await collection.find(query).sort("_id", -1).skip(skip).limit(limit).to_list(length=limit)
         elif is_gemini:
-            from backend.api.v1.ai_processed import get_gemini_db
-            gemini_db_sync = get_gemini_db()
+            db = mongo.gemini_async_db
             actual_name = collection_name.replace("gemini.", "", 1)
             # Verify collection exists
-            collection_names = gemini_db_sync.list_collection_names()
+            collection_names = await db.list_collection_names()
             if actual_name not in collection_names:
                 raise HTTPException(status_code=404, detail=f"Collection '{collection_name}' not found")
-            collection = gemini_db_sync[actual_name]
+            collection = db[actual_name]
             # Get total count
-            total_count = collection.count_documents(query)
+            total_count = await collection.count_documents(query)
             # Calculate pagination
             skip = (page - 1) * limit
             total_pages = (total_count + limit - 1) // limit  # Ceiling division
-            # Get documents sorted by _id descending (newest first) - sync version
+            # Get documents sorted by _id descending (newest first)
             # MongoDB ObjectId contains timestamp, so newer documents have larger _id values
-            documents = list(collection.find(query).sort("_id", -1).skip(skip).limit(limit))
+            documents = await collection.find(query).sort("_id", -1).skip(skip).limit(limit).to_list(length=limit)
         else:
             db = mongo.async_db
             actual_name = collection_name
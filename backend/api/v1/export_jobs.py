@@ -0,0 +1,404 @@
+"""
+Export Jobs API
+
+Runs large custom exports in the background instead of inside the HTTP
+request (multi-minute exports were cut off by the proxy timeout):
+
+    POST /custom-export/jobs/export?format=csv    -> {"job_id", "status", ...}
+    POST /custom-export/jobs/collections-bulk     -> {"job_id", "status", ...}
+    GET  /custom-export/jobs/{job_id}             -> status + progress
+    GET  /custom-export/jobs/{job_id}/download    -> artifact (Range requests supported)
+
+Jobs are documents in ``export_jobs``. A bounded pool of workers (per API
+process) streams the regular export endpoints into a file under
+``EXPORT_ARTIFACT_DIR``. Submitting the same parameters again while a job is
+queued/running, or within ``EXPORT_ARTIFACT_TTL_SECONDS`` of it finishing,
+returns the existing job instead of computing the export twice.
+
+Jobs interrupted by a restart are re-queued at startup
+(:func:`resume_export_jobs`).
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
+from fastapi.responses import FileResponse
+
+from backend.api.v1.custom_export import (
+    CollectionExportRequest,
+    CustomExportRequest,
+    export_collections_bulk,
+    export_custom_data,
+)
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+router = APIRouter()
+
+JOBS_COLLECTION = "export_jobs"
+
+project_root = Path(__file__).parent.parent.parent.parent
+ARTIFACT_DIR = Path(os.getenv("EXPORT_ARTIFACT_DIR", str(project_root / "data" / "exports")))
+
+# Finished artifacts are reused (and kept on disk) this long
+ARTIFACT_TTL_SECONDS = int(os.getenv("EXPORT_ARTIFACT_TTL_SECONDS", "21600"))
+
+# Exports built at once by one API process
+MAX_EXPORT_WORKERS = int(os.getenv("EXPORT_MAX_WORKERS", "2"))
+
+# How often a running job reports progress
+PROGRESS_INTERVAL_SECONDS = 2.0
+
+# A running job without progress for this long is considered abandoned
+STALE_JOB_SECONDS = 300
+
+JOB_KINDS = ("custom", "collections")
+
+_workers = asyncio.Semaphore(max(1, MAX_EXPORT_WORKERS))
+
+
+def get_mongo():
+    """Get MongoDB manager from main.py"""
+    from backend.main import mongo_manager
+
+    return mongo_manager
+
+
+def _jobs_collection():
+    return get_mongo().async_db[JOBS_COLLECTION]
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def params_hash(kind: str, params: Dict[str, Any]) -> str:
+    """Stable hash of an export's parameters (key order does not matter)"""
+    canonical = json.dumps({"kind": kind, "params": params}, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def artifact_path(job_id: ObjectId, artifact_dir: Optional[Path] = None) -> Path:
+    """Location of a job's artifact"""
+    return Path(artifact_dir or ARTIFACT_DIR) / f"{job_id}.bin"
+
+
+def attachment_filename(content_disposition: str, default: str) -> str:
+    """Filename from a ``Content-Disposition`` header"""
+    match = re.search(r'filename="?([^";]+)"?', content_disposition or "")
+    return match.group(1) if match else default
+
+
+def custom_export_params(body: CustomExportRequest, export_format: str) -> Dict[str, Any]:
+    """Job parameters for ``export_custom_data`` (preview paging does not affect exports)"""
+    return {"format": export_format, "body": body.model_dump(exclude={"limit", "offset"})}
+
+
+def collections_export_params(body: CollectionExportRequest) -> Dict[str, Any]:
+    """Job parameters for ``export_collections_bulk``"""
+    return {"body": body.model_dump()}
+
+
+async def find_reusable_job(
+    jobs, digest: str, now: Optional[datetime] = None, ttl_seconds: int = ARTIFACT_TTL_SECONDS
+) -> Optional[Dict[str, Any]]:
+    """
+    Job that already covers these parameters
+
+    Args:
+        jobs: Motor collection of export jobs
+        digest: ``params_hash`` of the request
+        ttl_seconds: How long a finished artifact is reused
+
+    Returns:
+        A queued/running job, or a finished job whose artifact is still on
+        disk; None if the export has to be built
+    """
+    now = now or datetime.utcnow()
+    active = await jobs.find_one(
+        {"params_hash": digest, "status": {"$in": ["queued", "running"]}},
+        sort=[("created_at", -1)],
+    )
+    if active:
+        return active
+
+    done = await jobs.find_one(
+        {
+            "params_hash": digest,
+            "status": "done",
+            "finished_at": {"$gte": now - timedelta(seconds=ttl_seconds)},
+        },
+        sort=[("finished_at", -1)],
+    )
+    if done and Path(done.get("artifact_path", "")).is_file():
+        return done
+    return None
+
+
+def job_status(job: Dict[str, Any], reused: bool = False) -> Dict[str, Any]:
+    """API view of a job document"""
+    job_id = str(job["_id"])
+    status = {
+        "job_id": job_id,
+        "kind": job.get("kind"),
+        "status": job.get("status", "queued"),
+        "bytes_written": job.get("bytes_written", 0),
+        "filename": job.get("filename"),
+        "error": job.get("error"),
+        "created_at": job.get("created_at"),
+        "started_at": job.get("started_at"),
+        "finished_at": job.get("finished_at"),
+        "expires_at": job.get("expires_at"),
+        "reused": reused,
+    }
+    if job.get("status") == "done":
+        status["download_url"] = f"/api/v1/custom-export/jobs/{job_id}/download"
+    return status
+
+
+# =============================================================================
+# Worker
+# =============================================================================
+
+
+async def _start_export(kind: str, params: Dict[str, Any]):
+    """StreamingResponse of the export endpoint a job wraps"""
+    if kind == "custom":
+        body = CustomExportRequest(**params["body"])
+        return await export_custom_data(None, body, format=params.get("format", "csv"))
+    if kind == "collections":
+        return await export_collections_bulk(None, CollectionExportRequest(**params["body"]))
+    raise ValueError(f"Unknown export job kind: {kind}")
+
+
+async def run_export_job(job_id: ObjectId) -> None:
+    """
+    Build one job's artifact (waits for a free worker)
+
+    The job is claimed atomically, so a job queued in several processes (e.g.
+    after a restart) is only built once. The artifact is written to a
+    ``.part`` file and renamed when complete.
+    """
+    jobs = _jobs_collection()
+    async with _workers:
+        started_at = datetime.utcnow()
+        job = await jobs.find_one_and_update(
+            {"_id": job_id, "status": "queued"},
+            {"$set": {"status": "running", "started_at": started_at, "heartbeat_at": started_at}},
+        )
+        if not job:
+            return
+
+        path = artifact_path(job_id)
+        partial = path.with_suffix(".part")
+        progress = {"bytes_written": 0}
+
+        async def report_progress():
+            while True:
+                await asyncio.sleep(PROGRESS_INTERVAL_SECONDS)
+                await jobs.update_one(
+                    {"_id": job_id},
+                    {"$set": {"bytes_written": progress["bytes_written"], "heartbeat_at": datetime.utcnow()}},
+                )
+
+        reporter = asyncio.create_task(report_progress())
+        started = time.perf_counter()
+        try:
+            response = await _start_export(job["kind"], job["params"])
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(partial, "wb") as f:
+                async for chunk in response.body_iterator:
+                    data = chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+                    f.write(data)
+                    progress["bytes_written"] += len(data)
+            os.replace(partial, path)
+
+            finished_at = datetime.utcnow()
+            await jobs.update_one(
+                {"_id": job_id},
+                {
+                    "$set": {
+                        "status": "done",
+                        "bytes_written": progress["bytes_written"],
+                        "artifact_path": str(path),
+                        "filename": attachment_filename(
+                            response.headers.get("content-disposition", ""), path.name
+                        ),
+                        "media_type": response.media_type or "application/octet-stream",
+                        "finished_at": finished_at,
+                        "expires_at": finished_at + timedelta(seconds=ARTIFACT_TTL_SECONDS),
+                    }
+                },
+            )
+            logger.info(
+                f"📦 Export job {job_id} done: {progress['bytes_written']} bytes "
+                f"in {time.perf_counter() - started:.1f}s"
+            )
+        except Exception as e:
+            error = e.detail if isinstance(e, HTTPException) else str(e)
+            await jobs.update_one(
+                {"_id": job_id},
+                {"$set": {"status": "failed", "error": error, "finished_at": datetime.utcnow()}},
+            )
+            partial.unlink(missing_ok=True)
+            logger.error(f"❌ Export job {job_id} failed: {error}")
+        finally:
+            reporter.cancel()
+
+
+async def cleanup_expired_artifacts(now: Optional[datetime] = None) -> int:
+    """
+    Delete artifacts past their TTL and mark their jobs expired
+
+    Returns:
+        Number of jobs expired
+    """
+    jobs = _jobs_collection()
+    now = now or datetime.utcnow()
+    expired = 0
+    async for job in jobs.find({"status": "done", "expires_at": {"$lt": now}}, {"artifact_path": 1}):
+        if job.get("artifact_path"):
+            Path(job["artifact_path"]).unlink(missing_ok=True)
+        await jobs.update_one({"_id": job["_id"]}, {"$set": {"status": "expired"}})
+        expired += 1
+    return expired
+
+
+async def resume_export_jobs() -> int:
+    """
+    Re-queue jobs interrupted by a restart and clean up expired artifacts
+
+    Called once at API startup.
+
+    Returns:
+        Number of jobs queued for building
+    """
+    jobs = _jobs_collection()
+    await jobs.create_index([("params_hash", 1), ("status", 1)])
+    await jobs.create_index([("status", 1), ("expires_at", 1)])
+
+    stale_before = datetime.utcnow() - timedelta(seconds=STALE_JOB_SECONDS)
+    await jobs.update_many(
+        {"status": "running", "heartbeat_at": {"$lt": stale_before}},
+        {"$set": {"status": "queued"}},
+    )
+    await cleanup_expired_artifacts()
+
+    job_ids = [job["_id"] async for job in jobs.find({"status": "queued"}, {"_id": 1})]
+    for job_id in job_ids:
+        asyncio.create_task(run_export_job(job_id))
+    if job_ids:
+        logger.info(f"📦 Resuming {len(job_ids)} export jobs")
+    return len(job_ids)
+
+
+# =============================================================================
+# Endpoints
+# =============================================================================
+
+
+async def _submit(kind: str, params: Dict[str, Any], background_tasks: BackgroundTasks) -> Dict[str, Any]:
+    jobs = _jobs_collection()
+    digest = params_hash(kind, params)
+
+    existing = await find_reusable_job(jobs, digest)
+    if existing:
+        logger.info(f"📦 Reusing export job {existing['_id']} ({existing.get('status')})")
+        return job_status(existing, reused=True)
+
+    await cleanup_expired_artifacts()
+    job = {
+        "kind": kind,
+        "params": params,
+        "params_hash": digest,
+        "status": "queued",
+        "bytes_written": 0,
+        "error": None,
+        "created_at": datetime.utcnow(),
+    }
+    result = await jobs.insert_one(job)
+    job["_id"] = result.inserted_id
+
+    background_tasks.add_task(run_export_job, result.inserted_id)
+    logger.info(f"📦 Queued {kind} export job {result.inserted_id}")
+    return job_status(job)
+
+
+@router.post("/custom-export/jobs/export")
+async def submit_custom_export_job(
+    body: CustomExportRequest,
+    background_tasks: BackgroundTasks,
+    format: str = Query("csv", regex="^(csv|json|toon)$"),
+):
+    """
+    Queue a filtered raw data export (same output as /custom-export/export)
+
+    Returns:
+        Job status; poll /custom-export/jobs/{job_id} until it is done
+    """
+    return await _submit("custom", custom_export_params(body, format), background_tasks)
+
+
+@router.post("/custom-export/jobs/collections-bulk")
+async def submit_collections_export_job(
+    body: CollectionExportRequest, background_tasks: BackgroundTasks
+):
+    """
+    Queue a multi-collection ZIP export (same output as /custom-export/collections/bulk)
+
+    Returns:
+        Job status; poll /custom-export/jobs/{job_id} until it is done
+    """
+    if not body.collections:
+        raise HTTPException(status_code=400, detail="No collections selected")
+    return await _submit("collections", collections_export_params(body), background_tasks)
+
+
+async def _get_job(job_id: str) -> Dict[str, Any]:
+    try:
+        oid = ObjectId(job_id)
+    except InvalidId:
+        raise HTTPException(status_code=400, detail="Invalid job id.")
+
+    job = await _jobs_collection().find_one({"_id": oid})
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found.")
+    return job
+
+
+@router.get("/custom-export/jobs/{job_id}")
+async def get_export_job(job_id: str):
+    """Status and progress of an export job"""
+    return job_status(await _get_job(job_id))
+
+
+@router.get("/custom-export/jobs/{job_id}/download")
+async def download_export_job(job_id: str):
+    """Download a finished export (supports Range requests for resuming)"""
+    job = await _get_job(job_id)
+    if job.get("status") != "done":
+        raise HTTPException(
+            status_code=409, detail=f"Export is {job.get('status', 'queued')}, not ready for download."
+        )
+
+    path = Path(job.get("artifact_path", ""))
+    if not path.is_file():
+        raise HTTPException(status_code=410, detail="Export artifact has expired.")
+
+    return FileResponse(
+        path,
+        media_type=job.get("media_type") or "application/octet-stream",
+        filename=job.get("filename") or path.name,
+    )
@@ -1,7 +1,9 @@
 """
 Exports API endpoints for MongoDB
 
-Provides data export functionality (CSV, JSON)
+Provides data export functionality (CSV, JSON, TOON). Collection and
+activity exports are streamed from the cursor (see src/utils/export_stream.py)
+so memory stays flat regardless of export size.
 """
 
 from fastapi import APIRouter, HTTPException, Query, Request, Depends
@@ -11,12 +13,21 @@ from pydantic import BaseModel
 import json
 import csv
 import io
-import zipfile
 from datetime import datetime, timedelta
-from bson import ObjectId
 
+from src.utils.export_stream import (
+    CURSOR_BATCH_SIZE,
+    clean_document,
+    encode_csv,
+    encode_json_array,
+    encode_toon_array,
+    gzip_chunks,
+    iterate_cursor,
+    merge_sorted,
+    peek,
+    zip_entries,
+)
 from src.utils.logger import get_logger
-from src.utils.toon_encoder import encode_toon
 from backend.middleware.jwt_auth import require_admin
 
 logger = get_logger(__name__)
@@ -49,6 +60,44 @@ def get_mongo():
     return mongo_manager
 
 
+async def _log_stream_errors(chunks, filename: str):
+    """Log failures that happen after the response has started (the download is cut short)"""
+    try:
+        async for chunk in chunks:
+            yield chunk
+    except Exception as e:
+        logger.error(f"Export stream {filename} failed mid-download: {e}")
+        raise
+
+
+def export_response(
+    chunks, filename: str, media_type: str, compression: Optional[str] = None
+) -> StreamingResponse:
+    """
+    Streaming file download
+
+    Args:
+        chunks: Async iterator of str/bytes chunks
+        filename: Download filename
+        media_type: Content type of the uncompressed file
+        compression: "gzip" to compress on the fly (adds .gz)
+    """
+    if compression == "gzip":
+        chunks = gzip_chunks(chunks)
+        filename = f"{filename}.gz"
+        media_type = "application/gzip"
+
+    return StreamingResponse(
+        _log_stream_errors(chunks, filename),
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
+
+
+# Documents per collection in bulk exports
+BULK_EXPORT_LIMIT = 10000
+
+
 # Collection name mapping (source -> collections)
 COLLECTION_MAP = {
     "main": ["members", "member_identifiers"],
@@ -67,6 +116,7 @@ COLLECTION_MAP = {
         "notion_comments",
         "notion_content_diffs",
         "notion_block_snapshots",
+        "notion_block_contents",
         "notion_comment_snapshots",
         "notion_page_tracking",
         "notion_users",
@@ -89,16 +139,12 @@ async def get_tables(request: Request):
         mongo = get_mongo()
         db = mongo.async_db  # Main database
         shared_db = mongo.shared_async_db  # Shared database
+        gemini_db = mongo.gemini_async_db  # Gemini database
 
-        # Get gemini database
-        from backend.api.v1.ai_processed import get_gemini_db
-
-        gemini_db_sync = get_gemini_db()
-        gemini_collections = gemini_db_sync.list_collection_names()
-
-        # Get collection names from both databases
+        # Get collection names from all databases
         main_collections = await db.list_collection_names()
         shared_collections = await shared_db.list_collection_names()
+        gemini_collections = await gemini_db.list_collection_names()
 
         # Organize by source
         collections_by_source = {}
@@ -146,6 +192,9 @@ async def export_collection_csv(
         None, description="Start date filter (YYYY-MM-DD)"
     ),
     end_date: Optional[str] = Query(None, description="End date filter (YYYY-MM-DD)"),
+    compression: Optional[str] = Query(
+        None, regex="^gzip$", description="Compress the download (gzip)"
+    ),
 ):
     """
     Export a specific collection as CSV
@@ -156,9 +205,10 @@ async def export_collection_csv(
         limit: Maximum number of documents to export (optional)
         start_date: Filter records from this date onwards (optional)
         end_date: Filter records up to this date (optional)
+        compression: "gzip" to stream a .csv.gz (optional)
 
     Returns:
-        CSV file download
+        CSV file download (streamed)
     """
     try:
         mongo = get_mongo()
@@ -167,18 +217,7 @@ async def export_collection_csv(
         if source == "other":
             db = mongo.shared_async_db
         elif source == "gemini":
-            # For gemini database, use sync operations
-            from backend.api.v1.ai_processed import get_gemini_db
-
-            gemini_db_sync = get_gemini_db()
-            # Validate collection exists in gemini database
-            all_collections = gemini_db_sync.list_collection_names()
-            if collection not in all_collections:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Collection '{collection}' not found in gemini database",
-                )
-            db = None  # Will handle separately with sync operations
+            db = mongo.gemini_async_db
         else:
             db = mongo.async_db
 
@@ -189,13 +228,12 @@ async def export_collection_csv(
                 detail=f"Invalid source. Must be one of: {', '.join(COLLECTION_MAP.keys())}",
             )
 
-        # Validate collection exists (for non-gemini databases)
-        if db:
-            all_collections = await db.list_collection_names()
-            if collection not in all_collections:
-                raise HTTPException(
-                    status_code=404, detail=f"Collection '{collection}' not found"
-                )
+        # Validate collection exists
+        all_collections = await db.list_collection_names()
+        if collection not in all_collections:
+            raise HTTPException(
+                status_code=404, detail=f"Collection '{collection}' not found"
+            )
 
         # Build query filter
         query_filter = {}
@@ -233,10 +271,7 @@ async def export_collection_csv(
                 timestamp_field = None
 
                 # Check which timestamp field exists in the collection
-                if source == "gemini":
-                    sample_doc = gemini_db_sync[collection].find_one({})
-                else:
-                    sample_doc = await db[collection].find_one({})
+                sample_doc = await db[collection].find_one({})
             if sample_doc:
                 for field in timestamp_fields:
                     if field in sample_doc:
@@ -261,75 +296,24 @@ async def export_collection_csv(
                 if date_filter:
                     query_filter[timestamp_field] = date_filter
 
-        # Query MongoDB
-        if source == "gemini":
-            # Use sync operations for gemini database
-            cursor = gemini_db_sync[collection].find(query_filter)
-            if limit:
-                cursor = cursor.limit(limit)
-            documents = list(cursor)
-        else:
-            cursor = db[collection].find(query_filter)
-            if limit:
-                cursor = cursor.limit(limit)
-            documents = await cursor.to_list(length=limit or 10000)
-
-        if not documents:
-            # Empty collection - return empty CSV with basic header
-            output = io.StringIO()
-            writer = csv.writer(output)
-            writer.writerow(["_id", "no_data"])
-            csv_content = output.getvalue()
-            row_count = 0
-        else:
-            # Convert documents to CSV-friendly format
-            rows = []
-            all_keys = set()
-
-            for doc in documents:
-                # Convert ObjectId to string
-                if "_id" in doc:
-                    doc["_id"] = str(doc["_id"])
-
-                # Convert nested objects to JSON strings
-                flat_doc = {}
-                for key, value in doc.items():
-                    if isinstance(value, (dict, list)):
-                        flat_doc[key] = json.dumps(
-                            value, default=str, ensure_ascii=False
-                        )
-                    elif isinstance(value, ObjectId):
-                        flat_doc[key] = str(value)
-                    elif isinstance(value, datetime):
-                        flat_doc[key] = value.isoformat()
-                    else:
-                        flat_doc[key] = value
-
-                    all_keys.add(key)
-
-                rows.append(flat_doc)
+        # Stream the cursor straight into the response
+        cursor = db[collection].find(query_filter).batch_size(CURSOR_BATCH_SIZE)
+        if limit:
+            cursor = cursor.limit(limit)
 
-            # Write CSV
-            output = io.StringIO()
-            fieldnames = sorted(list(all_keys))
-            writer = csv.DictWriter(output, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows)
-            csv_content = output.getvalue()
-            row_count = len(rows)
+        rows = (
+            clean_document(doc, flatten=True) async for doc in iterate_cursor(cursor)
+        )
+        chunks = encode_csv(rows, sort_fields=True, empty_header=["_id", "no_data"])
 
         # Generate filename
         filename = (
             f"{source}_{collection}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
         )
 
-        logger.info(f"Exported {row_count} documents from {source}.{collection}")
+        logger.info(f"Streaming export of {source}.{collection} as CSV")
 
-        return StreamingResponse(
-            iter([csv_content]),
-            media_type="text/csv",
-            headers={"Content-Disposition": f"attachment; filename={filename}"},
-        )
+        return export_response(chunks, filename, "text/csv", compression)
 
     except HTTPException:
         raise
@@ -358,6 +342,9 @@ async def export_collection_toon(
     delimiter: str = Query(
         ",", description="Delimiter for array values (comma, tab, pipe)"
     ),
+    compression: Optional[str] = Query(
+        None, regex="^gzip$", description="Compress the download (gzip)"
+    ),
 ):
     """
     Export a specific collection as TOON format
@@ -374,9 +361,10 @@ async def export_collection_toon(
         start_date: Filter records from this date onwards (optional)
         end_date: Filter records up to this date (optional)
         delimiter: Delimiter for array values (',' | '\t' | '|')
+        compression: "gzip" to stream a .toon.gz (optional)
 
     Returns:
-        TOON file download
+        TOON file download (streamed)
     """
     try:
         mongo = get_mongo()
@@ -451,59 +439,26 @@ async def export_collection_toon(
                 if date_filter:
                     query_filter[timestamp_field] = date_filter
 
-        # Query MongoDB
-        cursor = db[collection].find(query_filter)
+        # Stream the cursor straight into the response
+        cursor = db[collection].find(query_filter).batch_size(CURSOR_BATCH_SIZE)
         if limit:
             cursor = cursor.limit(limit)
 
-        documents = await cursor.to_list(length=limit or 10000)
-
-        if not documents:
-            # Empty collection
-            toon_content = f"{collection}[0]:"
-            row_count = 0
-        else:
-            # Convert documents to TOON-friendly format
-            rows = []
-
-            for doc in documents:
-                # Convert ObjectId to string
-                if "_id" in doc:
-                    doc["_id"] = str(doc["_id"])
-
-                # Convert other special types
-                clean_doc = {}
-                for key, value in doc.items():
-                    if isinstance(value, ObjectId):
-                        clean_doc[key] = str(value)
-                    elif isinstance(value, datetime):
-                        clean_doc[key] = value.isoformat()
-                    else:
-                        clean_doc[key] = value
-
-                rows.append(clean_doc)
-
-            # Wrap in collection name for TOON
-            toon_data = {collection: rows}
+        async def count():
+            options = {"limit": limit} if limit else {}
+            return await db[collection].count_documents(query_filter, **options)
 
-            # Encode to TOON format
-            toon_content = encode_toon(toon_data, indent=2, delimiter=actual_delimiter)
-            row_count = len(rows)
+        rows = (clean_document(doc) async for doc in iterate_cursor(cursor))
+        chunks = encode_toon_array(collection, rows, count, delimiter=actual_delimiter)
 
         # Generate filename
         filename = (
             f"{source}_{collection}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.toon"
         )
 
-        logger.info(
-            f"Exported {row_count} documents from {source}.{collection} as TOON"
-        )
+        logger.info(f"Streaming export of {source}.{collection} as TOON")
 
-        return StreamingResponse(
-            iter([toon_content]),
-            media_type="text/plain",
-            headers={"Content-Disposition": f"attachment; filename={filename}"},
-        )
+        return export_response(chunks, filename, "text/plain", compression)
 
     except HTTPException:
         raise
@@ -604,6 +559,9 @@ async def export_activities(
     ),
     member_name: Optional[str] = Query(None, description="Filter by member name"),
     limit: int = Query(10000, ge=1, le=100000),
+    compression: Optional[str] = Query(
+        None, regex="^gzip$", description="Compress the download (gzip)"
+    ),
 ):
     """
     Export activities data from source collections (not member_activities)
@@ -617,9 +575,11 @@ async def export_activities(
         project_key: Filter by project (only activities from members in this project)
         member_name: Filter by specific member name
         limit: Maximum number of records
+        compression: "gzip" to compress the download (optional)
 
     Returns:
-        File download response
+        File download response (streamed; sources are merged newest-first
+        from their cursors without collecting them)
     """
     try:
         # Import helper functions from activities_mongo
@@ -712,451 +672,281 @@ async def export_activities(
                 end_dt = end_dt.astimezone(timezone.utc).replace(tzinfo=None)
             date_filter["$lte"] = end_dt
 
-        activities = []
-
-        # Query each source collection directly (same logic as activities_mongo.py)
-        for source in sources_to_query:
-            if source == "github":
-                # GitHub commits
-                if not activity_type or activity_type == "commit":
-                    commits = db["github_commits"]
-                    query = {}
-                    if date_filter:
-                        query["date"] = date_filter
-
-                    async for commit in (
-                        commits.find(query).sort("date", -1).limit(limit)
-                    ):
-                        commit_date = commit.get("date")
-                        if isinstance(commit_date, datetime):
-                            timestamp_str = (
-                                commit_date.isoformat() + "Z"
-                                if commit_date.tzinfo is None
-                                else commit_date.isoformat()
-                            )
-                        else:
-                            timestamp_str = str(commit_date) if commit_date else ""
-
-                        github_username = commit.get("author_name", "")
-                        member_name = get_mapped_member_name(
-                            member_mappings, "github", github_username
-                        )
-
-                        metadata = {
-                            "sha": commit.get("sha"),
-                            "message": commit.get("message"),
-                            "repository": commit.get("repository", ""),
-                            "additions": commit.get("additions", 0),
-                            "deletions": commit.get("deletions", 0),
-                            "url": commit.get("url"),
-                        }
-
-                        activities.append(
-                            {
-                                "id": str(commit["_id"]),
-                                "member_name": member_name,
-                                "source_type": "github",
-                                "activity_type": "commit",
-                                "timestamp": timestamp_str,
-                                "activity_id": f"github:commit:{commit.get('sha')}",
-                                "metadata": metadata
-                                if format == "json"
-                                else json.dumps(
-                                    metadata, ensure_ascii=False, default=str
-                                ),
-                            }
-                        )
-
-                # GitHub PRs
-                if not activity_type or activity_type == "pull_request":
-                    prs = db["github_pull_requests"]
-                    query = {}
-                    if date_filter:
-                        query["created_at"] = date_filter
-
-                    async for pr in prs.find(query).sort("created_at", -1).limit(limit):
-                        created_at = pr.get("created_at")
-                        if isinstance(created_at, datetime):
-                            timestamp_str = (
-                                created_at.isoformat() + "Z"
-                                if created_at.tzinfo is None
-                                else created_at.isoformat()
-                            )
-                        else:
-                            timestamp_str = str(created_at) if created_at else ""
-
-                        github_username = pr.get("author_login", "")
-                        member_name = get_mapped_member_name(
-                            member_mappings, "github", github_username
-                        )
-
-                        metadata = {
-                            "repository": pr.get("repository_name", ""),
-                            "title": pr.get("title"),
-                            "number": pr.get("number"),
-                            "state": pr.get("state"),
-                            "url": pr.get("url"),
-                        }
-
-                        activities.append(
-                            {
-                                "id": str(pr["_id"]),
-                                "member_name": member_name,
-                                "source_type": "github",
-                                "activity_type": "pull_request",
-                                "timestamp": timestamp_str,
-                                "activity_id": f"github:pr:{pr.get('repository_name')}:{pr.get('number')}",
-                                "metadata": metadata
-                                if format == "json"
-                                else json.dumps(
-                                    metadata, ensure_ascii=False, default=str
-                                ),
-                            }
-                        )
-
-                # GitHub Issues
-                if not activity_type or activity_type == "issue":
-                    issues = db["github_issues"]
-                    query = {}
-                    if date_filter:
-                        query["created_at"] = date_filter
-
-                    async for issue in (
-                        issues.find(query).sort("created_at", -1).limit(limit)
-                    ):
-                        created_at = issue.get("created_at")
-                        if isinstance(created_at, datetime):
-                            timestamp_str = (
-                                created_at.isoformat() + "Z"
-                                if created_at.tzinfo is None
-                                else created_at.isoformat()
-                            )
-                        else:
-                            timestamp_str = str(created_at) if created_at else ""
-
-                        github_username = issue.get("author_login", "")
-                        member_name = get_mapped_member_name(
-                            member_mappings, "github", github_username
-                        )
-
-                        metadata = {
-                            "repository": issue.get("repository_name", ""),
-                            "title": issue.get("title"),
-                            "number": issue.get("number"),
-                            "state": issue.get("state"),
-                            "url": issue.get("url"),
-                        }
-
-                        activities.append(
-                            {
-                                "id": str(issue["_id"]),
-                                "member_name": member_name,
-                                "source_type": "github",
-                                "activity_type": "issue",
-                                "timestamp": timestamp_str,
-                                "activity_id": f"github:issue:{issue.get('repository_name')}:{issue.get('number')}",
-                                "metadata": metadata
-                                if format == "json"
-                                else json.dumps(
-                                    metadata, ensure_ascii=False, default=str
-                                ),
-                            }
-                        )
-
-            elif source == "slack":
-                # Slack messages
-                if not activity_type or activity_type == "message":
-                    messages = db["slack_messages"]
-                    query = {}
-                    if date_filter:
-                        query["posted_at"] = date_filter
-
-                    async for msg in (
-                        messages.find(query).sort("posted_at", -1).limit(limit)
-                    ):
-                        posted_at = msg.get("posted_at")
-                        if isinstance(posted_at, datetime):
-                            timestamp_str = (
-                                posted_at.isoformat() + "Z"
-                                if posted_at.tzinfo is None
-                                else posted_at.isoformat()
-                            )
-                        else:
-                            timestamp_str = str(posted_at) if posted_at else ""
-
-                        slack_user_id = msg.get("user_id", "")
-                        member_name = get_mapped_member_name(
-                            member_mappings, "slack", slack_user_id
-                        )
-
-                        metadata = {
-                            "channel_id": msg.get("channel_id"),
-                            "channel_name": msg.get("channel_name"),
-                            "text": msg.get("text", ""),
-                            "thread_ts": msg.get("thread_ts"),
-                            "reactions": msg.get("reactions", []),
-                        }
-
-                        activities.append(
-                            {
-                                "id": str(msg["_id"]),
-                                "member_name": member_name,
-                                "member_name": member_name,
-                                "source_type": "slack",
-                                "activity_type": "message",
-                                "timestamp": timestamp_str,
-                                "activity_id": f"slack:message:{msg.get('channel_id')}:{msg.get('ts')}",
-                                "metadata": metadata
-                                if format == "json"
-                                else json.dumps(
-                                    metadata, ensure_ascii=False, default=str
-                                ),
-                            }
-                        )
-            elif source == "notion":
-                # Notion pages
-                if not activity_type or activity_type == "page":
-                    pages = db["notion_pages"]
-                    query = {}
-                    if date_filter:
-                        query["last_edited_time"] = date_filter
-
-                    async for page in (
-                        pages.find(query).sort("last_edited_time", -1).limit(limit)
-                    ):
-                        last_edited = page.get("last_edited_time")
-                        if isinstance(last_edited, datetime):
-                            timestamp_str = (
-                                last_edited.isoformat() + "Z"
-                                if last_edited.tzinfo is None
-                                else last_edited.isoformat()
-                            )
-                        else:
-                            timestamp_str = str(last_edited) if last_edited else ""
-
-                        notion_user_id = (
-                            page.get("created_by", {}).get("id", "")
-                            if isinstance(page.get("created_by"), dict)
-                            else ""
-                        )
-                        member_name = get_mapped_member_name(
-                            member_mappings, "notion", notion_user_id
-                        )
-
-                        metadata = {
-                            "page_id": page.get("page_id"),
-                            "title": page.get("title"),
-                            "url": page.get("url"),
-                            "database_id": page.get("database_id"),
-                        }
-
-                        activities.append(
-                            {
-                                "id": str(page["_id"]),
-                                "member_name": member_name,
-                                "source_type": "notion",
-                                "activity_type": "page",
-                                "timestamp": timestamp_str,
-                                "activity_id": f"notion:page:{page.get('page_id')}",
-                                "metadata": metadata
-                                if format == "json"
-                                else json.dumps(
-                                    metadata, ensure_ascii=False, default=str
-                                ),
-                            }
-                        )
-
-            elif source == "drive":
-                # Drive activities
-                if not activity_type or activity_type == "activity":
-                    drive_activities = db["drive_activities"]
-                    query = {}
-                    if date_filter:
-                        query["time"] = date_filter
-
-                    async for activity in (
-                        drive_activities.find(query).sort("time", -1).limit(limit)
-                    ):
-                        time = activity.get("time")
-                        if isinstance(time, datetime):
-                            timestamp_str = (
-                                time.isoformat() + "Z"
-                                if time.tzinfo is None
-                                else time.isoformat()
-                            )
-                        else:
-                            timestamp_str = str(time) if time else ""
-
-                        actor_email = activity.get("actor_email", "")
-                        member_name = get_mapped_member_name(
-                            member_mappings, "drive", actor_email
-                        )
-
-                        metadata = {
-                            "activity_type": activity.get("activity_type"),
-                            "file_id": activity.get("file_id"),
-                            "file_name": activity.get("file_name"),
-                            "target": activity.get("target"),
-                        }
-
-                        activities.append(
-                            {
-                                "id": str(activity["_id"]),
-                                "member_name": member_name,
-                                "source_type": "drive",
-                                "activity_type": activity.get(
-                                    "activity_type", "activity"
-                                ),
-                                "timestamp": timestamp_str,
-                                "activity_id": activity.get(
-                                    "activity_id", f"drive:{activity.get('file_id')}"
-                                ),
-                                "metadata": metadata
-                                if format == "json"
-                                else json.dumps(
-                                    metadata, ensure_ascii=False, default=str
-                                ),
-                            }
-                        )
-
-            elif source == "recordings":
-                # Recordings from Gemini database
-                try:
-                    from backend.api.v1.ai_processed import get_gemini_db
+        def timestamp_string(value) -> str:
+            if isinstance(value, datetime):
+                return (
+                    value.isoformat() + "Z" if value.tzinfo is None else value.isoformat()
+                )
+            return str(value) if value else ""
+
+        def activity_row(doc, member_name, source, act_type, timestamp_str, activity_id, metadata):
+            return {
+                "id": str(doc["_id"]),
+                "member_name": member_name,
+                "source_type": source,
+                "activity_type": act_type,
+                "timestamp": timestamp_str,
+                "activity_id": activity_id,
+                "metadata": metadata
+                if format == "json"
+                else json.dumps(metadata, ensure_ascii=False, default=str),
+            }
+
+        # One newest-first stream per source collection (same logic as activities_mongo.py)
+        async def github_commits():
+            query = {"date": date_filter} if date_filter else {}
+            cursor = db["github_commits"].find(query).sort("date", -1).limit(limit)
+            async for commit in iterate_cursor(cursor):
+                member_name = get_mapped_member_name(
+                    member_mappings, "github", commit.get("author_name", "")
+                )
+                metadata = {
+                    "sha": commit.get("sha"),
+                    "message": commit.get("message"),
+                    "repository": commit.get("repository", ""),
+                    "additions": commit.get("additions", 0),
+                    "deletions": commit.get("deletions", 0),
+                    "url": commit.get("url"),
+                }
+                yield activity_row(
+                    commit,
+                    member_name,
+                    "github",
+                    "commit",
+                    timestamp_string(commit.get("date")),
+                    f"github:commit:{commit.get('sha')}",
+                    metadata,
+                )
 
-                    gemini_db = get_gemini_db()
-                    recordings_col = gemini_db["recordings"]
+        async def github_pull_requests():
+            query = {"created_at": date_filter} if date_filter else {}
+            cursor = db["github_pull_requests"].find(query).sort("created_at", -1).limit(limit)
+            async for pr in iterate_cursor(cursor):
+                member_name = get_mapped_member_name(
+                    member_mappings, "github", pr.get("author_login", "")
+                )
+                metadata = {
+                    "repository": pr.get("repository_name", ""),
+                    "title": pr.get("title"),
+                    "number": pr.get("number"),
+                    "state": pr.get("state"),
+                    "url": pr.get("url"),
+                }
+                yield activity_row(
+                    pr,
+                    member_name,
+                    "github",
+                    "pull_request",
+                    timestamp_string(pr.get("created_at")),
+                    f"github:pr:{pr.get('repository_name')}:{pr.get('number')}",
+                    metadata,
+                )
 
-                    query = {}
-                    if date_filter:
-                        query["meeting_date"] = date_filter
+        async def github_issues():
+            query = {"created_at": date_filter} if date_filter else {}
+            cursor = db["github_issues"].find(query).sort("created_at", -1).limit(limit)
+            async for issue in iterate_cursor(cursor):
+                member_name = get_mapped_member_name(
+                    member_mappings, "github", issue.get("author_login", "")
+                )
+                metadata = {
+                    "repository": issue.get("repository_name", ""),
+                    "title": issue.get("title"),
+                    "number": issue.get("number"),
+                    "state": issue.get("state"),
+                    "url": issue.get("url"),
+                }
+                yield activity_row(
+                    issue,
+                    member_name,
+                    "github",
+                    "issue",
+                    timestamp_string(issue.get("created_at")),
+                    f"github:issue:{issue.get('repository_name')}:{issue.get('number')}",
+                    metadata,
+                )
 
-                    # Use sync cursor for gemini database
-                    recordings_cursor = (
-                        recordings_col.find(query).sort("meeting_date", -1).limit(limit)
-                    )
+        async def slack_messages():
+            query = {"posted_at": date_filter} if date_filter else {}
+            cursor = db["slack_messages"].find(query).sort("posted_at", -1).limit(limit)
+            async for msg in iterate_cursor(cursor):
+                member_name = get_mapped_member_name(
+                    member_mappings, "slack", msg.get("user_id", "")
+                )
+                metadata = {
+                    "channel_id": msg.get("channel_id"),
+                    "channel_name": msg.get("channel_name"),
+                    "text": msg.get("text", ""),
+                    "thread_ts": msg.get("thread_ts"),
+                    "reactions": msg.get("reactions", []),
+                }
+                yield activity_row(
+                    msg,
+                    member_name,
+                    "slack",
+                    "message",
+                    timestamp_string(msg.get("posted_at")),
+                    f"slack:message:{msg.get('channel_id')}:{msg.get('ts')}",
+                    metadata,
+                )
 
-                    for recording in recordings_cursor:
-                        meeting_date = recording.get("meeting_date")
-                        if isinstance(meeting_date, datetime):
-                            timestamp_str = (
-                                meeting_date.isoformat() + "Z"
-                                if meeting_date.tzinfo is None
-                                else meeting_date.isoformat()
-                            )
-                        else:
-                            timestamp_str = str(meeting_date) if meeting_date else ""
-
-                        participants = recording.get("participants", [])
-                        # For recordings, use first participant as member_name
-                        member_name = participants[0] if participants else "Unknown"
-
-                        metadata = {
-                            "meeting_id": recording.get("meeting_id"),
-                            "meeting_title": recording.get("meeting_title"),
-                            "participants": participants,
-                            "participant_count": len(participants),
-                        }
-
-                        activities.append(
-                            {
-                                "id": str(recording["_id"]),
-                                "member_name": member_name,
-                                "source_type": "recordings",
-                                "activity_type": "meeting",
-                                "timestamp": timestamp_str,
-                                "activity_id": f"recordings:meeting:{recording.get('meeting_id')}",
-                                "metadata": metadata
-                                if format == "json"
-                                else json.dumps(
-                                    metadata, ensure_ascii=False, default=str
-                                ),
-                            }
-                        )
-                except Exception as e:
-                    logger.error(f"Error fetching recordings data: {e}")
+        async def notion_pages():
+            query = {"last_edited_time": date_filter} if date_filter else {}
+            cursor = db["notion_pages"].find(query).sort("last_edited_time", -1).limit(limit)
+            async for page in iterate_cursor(cursor):
+                notion_user_id = (
+                    page.get("created_by", {}).get("id", "")
+                    if isinstance(page.get("created_by"), dict)
+                    else ""
+                )
+                member_name = get_mapped_member_name(
+                    member_mappings, "notion", notion_user_id
+                )
+                metadata = {
+                    "page_id": page.get("page_id"),
+                    "title": page.get("title"),
+                    "url": page.get("url"),
+                    "database_id": page.get("database_id"),
+                }
+                yield activity_row(
+                    page,
+                    member_name,
+                    "notion",
+                    "page",
+                    timestamp_string(page.get("last_edited_time")),
+                    f"notion:page:{page.get('page_id')}",
+                    metadata,
+                )
 
-            elif source == "recordings_daily":
-                # Daily analysis from Gemini database
-                try:
-                    from backend.api.v1.ai_processed import get_gemini_db
+        async def drive_activities():
+            query = {"time": date_filter} if date_filter else {}
+            cursor = db["drive_activities"].find(query).sort("time", -1).limit(limit)
+            async for activity in iterate_cursor(cursor):
+                member_name = get_mapped_member_name(
+                    member_mappings, "drive", activity.get("actor_email", "")
+                )
+                metadata = {
+                    "activity_type": activity.get("activity_type"),
+                    "file_id": activity.get("file_id"),
+                    "file_name": activity.get("file_name"),
+                    "target": activity.get("target"),
+                }
+                yield activity_row(
+                    activity,
+                    member_name,
+                    "drive",
+                    activity.get("activity_type", "activity"),
+                    timestamp_string(activity.get("time")),
+                    activity.get("activity_id", f"drive:{activity.get('file_id')}"),
+                    metadata,
+                )
 
-                    gemini_db = get_gemini_db()
-                    recordings_daily_col = gemini_db["recordings_daily"]
+        async def recordings():
+            # Recordings from Gemini database
+            query = {"meeting_date": date_filter} if date_filter else {}
+            cursor = (
+                mongo.gemini_async_db["recordings"].find(query).sort("meeting_date", -1).limit(limit)
+            )
+            async for recording in iterate_cursor(cursor):
+                participants = recording.get("participants", [])
+                # For recordings, use first participant as member_name
+                member_name = participants[0] if participants else "Unknown"
+                metadata = {
+                    "meeting_id": recording.get("meeting_id"),
+                    "meeting_title": recording.get("meeting_title"),
+                    "participants": participants,
+                    "participant_count": len(participants),
+                }
+                yield activity_row(
+                    recording,
+                    member_name,
+                    "recordings",
+                    "meeting",
+                    timestamp_string(recording.get("meeting_date")),
+                    f"recordings:meeting:{recording.get('meeting_id')}",
+                    metadata,
+                )
 
-                    query = {}
-                    if date_filter:
-                        # target_date is string format, need to convert date_filter
-                        string_date_filter = {}
-                        for op, value in date_filter.items():
-                            if isinstance(value, datetime):
-                                string_date_filter[op] = value.strftime("%Y-%m-%d")
-                            else:
-                                string_date_filter[op] = value
-                        query["target_date"] = string_date_filter
-
-                    # Use sync cursor for gemini database
-                    daily_cursor = (
-                        recordings_daily_col.find(query)
-                        .sort("target_date", -1)
-                        .limit(limit)
-                    )
+        async def recordings_daily():
+            # Daily analysis from Gemini database
+            query = {}
+            if date_filter:
+                # target_date is string format, need to convert date_filter
+                query["target_date"] = {
+                    op: value.strftime("%Y-%m-%d") if isinstance(value, datetime) else value
+                    for op, value in date_filter.items()
+                }
+            cursor = (
+                mongo.gemini_async_db["recordings_daily"]
+                .find(query)
+                .sort("target_date", -1)
+                .limit(limit)
+            )
+            async for daily in iterate_cursor(cursor):
+                timestamp = daily.get("timestamp")
+                analysis = daily.get("analysis", {})
+                metadata = {
+                    "target_date": daily.get("target_date"),
+                    "meeting_count": daily.get("meeting_count", 0),
+                    "total_meeting_time": daily.get("total_meeting_time"),
+                    "total_meeting_time_seconds": daily.get(
+                        "total_meeting_time_seconds", 0
+                    ),
+                    "meeting_titles": daily.get("meeting_titles", []),
+                    "status": daily.get("status"),
+                    "model_used": daily.get("model_used"),
+                    "summary": analysis.get("summary", {}),
+                    "participants": analysis.get("participants", []),
+                }
+                yield activity_row(
+                    daily,
+                    "System",
+                    "recordings_daily",
+                    "daily_analysis",
+                    timestamp_string(timestamp)
+                    if isinstance(timestamp, datetime)
+                    else daily.get("target_date", ""),
+                    f"recordings_daily:{daily.get('target_date')}",
+                    metadata,
+                )
 
-                    for daily in daily_cursor:
-                        timestamp = daily.get("timestamp")
-                        if isinstance(timestamp, datetime):
-                            timestamp_str = (
-                                timestamp.isoformat() + "Z"
-                                if timestamp.tzinfo is None
-                                else timestamp.isoformat()
-                            )
-                        else:
-                            timestamp_str = daily.get("target_date", "")
-
-                        analysis = daily.get("analysis", {})
-                        meeting_count = daily.get("meeting_count", 0)
-
-                        metadata = {
-                            "target_date": daily.get("target_date"),
-                            "meeting_count": meeting_count,
-                            "total_meeting_time": daily.get("total_meeting_time"),
-                            "total_meeting_time_seconds": daily.get(
-                                "total_meeting_time_seconds", 0
-                            ),
-                            "meeting_titles": daily.get("meeting_titles", []),
-                            "status": daily.get("status"),
-                            "model_used": daily.get("model_used"),
-                            "summary": analysis.get("summary", {}),
-                            "participants": analysis.get("participants", []),
-                        }
-
-                        activities.append(
-                            {
-                                "id": str(daily["_id"]),
-                                "member_name": "System",
-                                "source_type": "recordings_daily",
-                                "activity_type": "daily_analysis",
-                                "timestamp": timestamp_str,
-                                "activity_id": f"recordings_daily:{daily.get('target_date')}",
-                                "metadata": metadata
-                                if format == "json"
-                                else json.dumps(
-                                    metadata, ensure_ascii=False, default=str
-                                ),
-                            }
-                        )
-                except Exception as e:
-                    logger.error(f"Error fetching recordings_daily data: {e}")
+        async def guarded(stream, label):
+            # A failing source ends its own stream without aborting the export
+            try:
+                async for row in stream:
+                    yield row
+            except Exception as e:
+                logger.error(f"Error fetching {label} data: {e}")
+
+        # (source, activity type filter, stream factory)
+        stream_specs = [
+            ("github", "commit", github_commits),
+            ("github", "pull_request", github_pull_requests),
+            ("github", "issue", github_issues),
+            ("slack", "message", slack_messages),
+            ("notion", "page", notion_pages),
+            ("drive", "activity", drive_activities),
+            ("recordings", None, recordings),
+            ("recordings_daily", None, recordings_daily),
+        ]
+        streams = [
+            guarded(factory(), factory.__name__)
+            for source, act_type, factory in stream_specs
+            if source in sources_to_query
+            and (act_type is None or not activity_type or activity_type == act_type)
+        ]
 
-        logger.info(f"[EXPORT] Total activities before filter: {len(activities)}")
         logger.info(f"[EXPORT] allowed_member_names: {allowed_member_names}")
         logger.info(f"[EXPORT] filter_member_name: {filter_member_name}")
 
-        # Filter by member if project_key or member_name is specified
-        if allowed_member_names is not None or filter_member_name:
-            filtered_activities = []
-            for activity in activities:
-                act_member = activity.get("member_name", "").lower()
+        async def export_rows():
+            # Newest first across all sources, filtered by member, up to limit
+            emitted = 0
+            merged = merge_sorted(
+                streams, key=lambda x: x["timestamp"] or "", reverse=True
+            )
+            async for activity in merged:
+                act_member = (activity.get("member_name") or "").lower()
                 # Skip if member filter is specified and doesn't match
                 if filter_member_name and act_member != filter_member_name:
                     continue
@@ -1166,18 +956,14 @@ async def export_activities(
                     and act_member not in allowed_member_names
                 ):
                     continue
-                filtered_activities.append(activity)
-            activities = filtered_activities
+                yield activity
+                emitted += 1
+                if emitted >= limit:
+                    break
             logger.info(
-                f"[EXPORT] Filtered activities: {len(activities)} (project={project_key}, member={member_name})"
+                f"[EXPORT] Exported {emitted} activities (project={project_key}, member={member_name})"
             )
 
-        # Sort all activities by timestamp (newest first)
-        activities.sort(key=lambda x: x["timestamp"] or "", reverse=True)
-
-        # Apply limit
-        activities = activities[:limit]
-
         filename_base = f"activities_{datetime.now().strftime('%Y%m%d')}"
         if project_key:
             filename_base += f"_{project_key}"
@@ -1185,40 +971,28 @@ async def export_activities(
             filename_base += f"_{source_type}"
 
         if format == "json":
-            # JSON export
-            output = json.dumps(activities, indent=2, ensure_ascii=False)
-
-            return StreamingResponse(
-                iter([output]),
-                media_type="application/json",
-                headers={
-                    "Content-Disposition": f"attachment; filename={filename_base}.json"
-                },
+            return export_response(
+                encode_json_array(export_rows()),
+                f"{filename_base}.json",
+                "application/json",
+                compression,
             )
 
-        else:
-            # CSV export
-            output = io.StringIO()
-            fieldnames = [
-                "id",
-                "member_name",
-                "source_type",
-                "activity_type",
-                "timestamp",
-                "activity_id",
-                "metadata",
-            ]
-            writer = csv.DictWriter(output, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(activities)
-
-            return StreamingResponse(
-                iter([output.getvalue()]),
-                media_type="text/csv",
-                headers={
-                    "Content-Disposition": f"attachment; filename={filename_base}.csv"
-                },
-            )
+        fieldnames = [
+            "id",
+            "member_name",
+            "source_type",
+            "activity_type",
+            "timestamp",
+            "activity_id",
+            "metadata",
+        ]
+        return export_response(
+            encode_csv(export_rows(), fieldnames=fieldnames),
+            f"{filename_base}.csv",
+            "text/csv",
+            compression,
+        )
 
     except Exception as e:
         logger.error(f"Error exporting activities: {e}")
@@ -1353,6 +1127,9 @@ async def export_bulk_collections(request: Request, bulk_request: BulkExportRequ
     - JSON: Structured JSON format
     - TOON: Token-Oriented Object Notation (LLM-optimized, 20-40% fewer tokens)
 
+    The archive is streamed: each collection is encoded from its cursor
+    directly into the ZIP as the client downloads it.
+
     Args:
         bulk_request: List of collection selections with optional date range and format
 
@@ -1366,11 +1143,51 @@ async def export_bulk_collections(request: Request, bulk_request: BulkExportRequ
         mongo = get_mongo()
         start_date = bulk_request.start_date
         end_date = bulk_request.end_date
+        export_format = bulk_request.format
+
+        async def build_query(db, collection):
+            query_filter = {}
+
+            # Date filtering
+            if start_date or end_date:
+                timestamp_fields = [
+                    "timestamp",
+                    "posted_at",
+                    "created_at",
+                    "updated_at",
+                    "committed_at",
+                ]
+                timestamp_field = None
+
+                # Check which timestamp field exists
+                sample_doc = await db[collection].find_one({})
+                if sample_doc:
+                    for field in timestamp_fields:
+                        if field in sample_doc:
+                            timestamp_field = field
+                            break
+
+                if timestamp_field:
+                    date_filter = {}
+                    if start_date:
+                        try:
+                            date_filter["$gte"] = datetime.fromisoformat(start_date)
+                        except ValueError:
+                            date_filter["$gte"] = start_date
+                    if end_date:
+                        try:
+                            # Add 1 day to include the entire end date
+                            end_dt = datetime.fromisoformat(end_date) + timedelta(days=1)
+                            date_filter["$lt"] = end_dt
+                        except ValueError:
+                            date_filter["$lte"] = end_date + "T23:59:59"
 
-        # Create in-memory ZIP file
-        zip_buffer = io.BytesIO()
+                    if date_filter:
+                        query_filter[timestamp_field] = date_filter
+
+            return query_filter
 
-        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        async def entries():
             for selection in bulk_request.tables:
                 source = selection.source
                 collection = selection.get_collection_name()
@@ -1382,143 +1199,59 @@ async def export_bulk_collections(request: Request, bulk_request: BulkExportRequ
                     else:
                         db = mongo.async_db
 
-                    # Build query filter
-                    query_filter = {}
-
-                    # Date filtering
-                    if start_date or end_date:
-                        timestamp_fields = [
-                            "timestamp",
-                            "posted_at",
-                            "created_at",
-                            "updated_at",
-                            "committed_at",
-                        ]
-                        timestamp_field = None
-
-                        # Check which timestamp field exists
-                        sample_doc = await db[collection].find_one({})
-                        if sample_doc:
-                            for field in timestamp_fields:
-                                if field in sample_doc:
-                                    timestamp_field = field
-                                    break
-
-                        if timestamp_field:
-                            date_filter = {}
-                            if start_date:
-                                try:
-                                    date_filter["$gte"] = datetime.fromisoformat(
-                                        start_date
-                                    )
-                                except ValueError:
-                                    date_filter["$gte"] = start_date
-                            if end_date:
-                                try:
-                                    # Add 1 day to include the entire end date
-                                    end_dt = datetime.fromisoformat(
-                                        end_date
-                                    ) + timedelta(days=1)
-                                    date_filter["$lt"] = end_dt
-                                except ValueError:
-                                    date_filter["$lte"] = end_date + "T23:59:59"
-
-                            if date_filter:
-                                query_filter[timestamp_field] = date_filter
-
-                    # Query collection
-                    cursor = db[collection].find(query_filter).limit(10000)
-                    documents = await cursor.to_list(length=10000)
-
-                    if not documents:
+                    query_filter = await build_query(db, collection)
+
+                    # Query collection (first document decides whether the file is written)
+                    cursor = (
+                        db[collection]
+                        .find(query_filter)
+                        .limit(BULK_EXPORT_LIMIT)
+                        .batch_size(CURSOR_BATCH_SIZE)
+                    )
+                    rows = (
+                        clean_document(doc, flatten=export_format == "csv")
+                        async for doc in iterate_cursor(cursor)
+                    )
+                    first, rows = await peek(rows)
+                    if first is None:
                         logger.warning(f"No data in {source}.{collection}")
                         continue
 
-                    # Prepare documents (common processing)
-                    rows = []
-
-                    for doc in documents:
-                        # Convert ObjectId to string
-                        if "_id" in doc:
-                            doc["_id"] = str(doc["_id"])
-
-                        # Convert special types
-                        clean_doc = {}
-                        for key, value in doc.items():
-                            if isinstance(value, ObjectId):
-                                clean_doc[key] = str(value)
-                            elif isinstance(value, datetime):
-                                clean_doc[key] = value.isoformat()
-                            elif bulk_request.format == "csv" and isinstance(
-                                value, (dict, list)
-                            ):
-                                # Flatten for CSV
-                                clean_doc[key] = json.dumps(
-                                    value, default=str, ensure_ascii=False
-                                )
-                            else:
-                                clean_doc[key] = value
-
-                        rows.append(clean_doc)
-
-                    # Export based on format
-                    if bulk_request.format == "toon":
-                        # TOON format
-                        toon_data = {collection: rows}
-                        content = encode_toon(toon_data, indent=2, delimiter=",")
-                        filename = f"{source}_{collection}.toon"
-                        zip_file.writestr(filename, content)
-                        logger.info(
-                            f"Added {filename} to ZIP ({len(rows)} documents, TOON format)"
-                        )
-
-                    elif bulk_request.format == "json":
-                        # JSON format
-                        json_content = json.dumps(
-                            rows, indent=2, default=str, ensure_ascii=False
-                        )
-                        filename = f"{source}_{collection}.json"
-                        zip_file.writestr(filename, json_content)
-                        logger.info(
-                            f"Added {filename} to ZIP ({len(rows)} documents, JSON format)"
-                        )
-
-                    else:  # Default: CSV
-                        # CSV format
-                        all_keys = set()
-                        for row in rows:
-                            all_keys.update(row.keys())
-
-                        csv_buffer = io.StringIO()
-                        fieldnames = sorted(list(all_keys))
-                        writer = csv.DictWriter(csv_buffer, fieldnames=fieldnames)
-                        writer.writeheader()
-                        writer.writerows(rows)
-
-                        csv_content = csv_buffer.getvalue()
-                        filename = f"{source}_{collection}.csv"
-                        zip_file.writestr(filename, csv_content)
-                        logger.info(
-                            f"Added {filename} to ZIP ({len(rows)} documents, CSV format)"
-                        )
-
                 except Exception as e:
                     logger.error(f"Error exporting {source}.{collection}: {e}")
                     # Continue with other collections even if one fails
                     continue
 
-        # Prepare ZIP for download
-        zip_buffer.seek(0)
+                # Export based on format
+                if export_format == "toon":
+
+                    async def count(db=db, collection=collection, query_filter=query_filter):
+                        return await db[collection].count_documents(
+                            query_filter, limit=BULK_EXPORT_LIMIT
+                        )
+
+                    filename = f"{source}_{collection}.toon"
+                    chunks = encode_toon_array(collection, rows, count, delimiter=",")
+                elif export_format == "json":
+                    filename = f"{source}_{collection}.json"
+                    chunks = encode_json_array(rows)
+                else:  # Default: CSV
+                    filename = f"{source}_{collection}.csv"
+                    chunks = encode_csv(rows, sort_fields=True)
+
+                logger.info(f"Adding {filename} to ZIP ({export_format.upper()} format)")
+                yield filename, chunks
+
+        def on_entry_error(filename, error):
+            logger.error(f"Error exporting {filename}, file is truncated: {error}")
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"all_thing_eye_export_{timestamp}.zip"
 
-        logger.info(f"Bulk export completed: {len(bulk_request.tables)} collections")
+        logger.info(f"Bulk export started: {len(bulk_request.tables)} collections")
 
-        return StreamingResponse(
-            io.BytesIO(zip_buffer.read()),
-            media_type="application/zip",
-            headers={"Content-Disposition": f"attachment; filename={filename}"},
+        return export_response(
+            zip_entries(entries(), on_error=on_entry_error), filename, "application/zip"
         )
 
     except Exception as e:
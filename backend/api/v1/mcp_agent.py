@@ -15,6 +15,7 @@ from pathlib import Path
 from dotenv import load_dotenv
 
 from src.utils.logger import get_logger
+from src.core.embedding_index import semantic_search_async
 from backend.api.v1.auth import require_admin
 from backend.api.v1.mcp_utils import (
     get_mongo,
@@ -114,6 +115,34 @@ TOOLS = [
             "required": ["source"],
         },
     },
+    {
+        "name": "semantic_search",
+        "description": "Find the Slack threads, commit messages, Notion edits and meeting analyses most relevant to a question. Returns the top-k text excerpts with links. Use this for 'what/why/how was X discussed, decided or implemented' questions instead of fetching raw activities.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Natural-language question or topic",
+                },
+                "source": {
+                    "type": "string",
+                    "enum": ["slack", "github", "notion", "meeting", "all"],
+                    "description": "Restrict to one source (optional)",
+                },
+                "start_date": {
+                    "type": "string",
+                    "description": "ISO format date (optional)",
+                },
+                "end_date": {
+                    "type": "string",
+                    "description": "ISO format date (optional)",
+                },
+                "k": {"type": "integer", "default": 8, "description": "Number of excerpts (max 20)"},
+            },
+            "required": ["query"],
+        },
+    },
     {
         "name": "get_code_stats",
         "description": "Get code change statistics (lines added/deleted) from GitHub commits. Use this for questions about code contributions, lines of code, additions, deletions, or code volume. Returns total additions/deletions, daily breakdown, top contributors by code volume, and top repositories.",
@@ -155,23 +184,23 @@ TOOLS = [
 class MCPToolManager:
     @staticmethod
     async def get_team_members(args: Dict[str, Any]) -> Dict[str, Any]:
-        db = get_mongo().db
-        members = list(
-            db["members"].find({}, {"_id": 0, "name": 1, "role": 1, "projects": 1})
-        )
+        db = get_mongo().async_db
+        members = await db["members"].find(
+            {}, {"_id": 0, "name": 1, "role": 1, "projects": 1}
+        ).to_list(length=None)
         return {"success": True, "data": {"members": members}}
 
     @staticmethod
     async def get_projects(args: Dict[str, Any]) -> Dict[str, Any]:
-        db = get_mongo().db
-        projects = list(
-            db["projects"].find({}, {"_id": 0, "key": 1, "name": 1, "lead": 1})
-        )
+        db = get_mongo().async_db
+        projects = await db["projects"].find(
+            {}, {"_id": 0, "key": 1, "name": 1, "lead": 1}
+        ).to_list(length=None)
         return {"success": True, "data": {"projects": projects}}
 
     @staticmethod
     async def get_project_details(args: Dict[str, Any]) -> Dict[str, Any]:
-        db = get_mongo().db
+        db = get_mongo().async_db
         project_key = args.get("project_key", "").lower()
         include_reports = args.get("include_reports", True)
         include_milestones = args.get("include_milestones", True)
@@ -190,7 +219,7 @@ class MCPToolManager:
         if include_milestones:
             projection["milestones_data"] = 1
 
-        project = db["projects"].find_one({"key": project_key}, projection)
+        project = await db["projects"].find_one({"key": project_key}, projection)
 
         if not project:
             return {"success": False, "error": f"Project '{project_key}' not found"}
@@ -233,10 +262,36 @@ class MCPToolManager:
 
         return {"success": True, "data": results}
 
+    @staticmethod
+    async def semantic_search(args: Dict[str, Any]) -> Dict[str, Any]:
+        query = (args.get("query") or "").strip()
+        if not query:
+            return {"success": False, "error": "query is required"}
+
+        source = (args.get("source") or "all").lower()
+        try:
+            k = max(1, min(int(args.get("k", 8)), 20))
+        except (TypeError, ValueError):
+            k = 8
+
+        try:
+            hits = await semantic_search_async(
+                get_mongo().async_db,
+                query,
+                k=k,
+                source_type=None if source == "all" else source,
+                start_date=args.get("start_date"),
+                end_date=args.get("end_date"),
+            )
+        except (RuntimeError, ValueError) as e:
+            return {"success": False, "error": str(e)}
+
+        return {"success": True, "data": {"query": query, "results": hits}}
+
     @staticmethod
     async def get_code_stats(args: Dict[str, Any]) -> Dict[str, Any]:
         """Get code change statistics from GitHub commits."""
-        db = get_mongo().db
+        db = get_mongo().async_db
 
         # Parse date range
         end_dt = datetime.now()
@@ -260,12 +315,29 @@ class MCPToolManager:
 
         # GitHub username to member name mapping
         github_to_member = {}
-        github_identifiers = list(db["member_identifiers"].find({"source": "github"}))
+        github_identifiers = await db["member_identifiers"].find(
+            {"source": "github"}
+        ).to_list(length=None)
+
+        # Resolve all members in one round-trip instead of one find_one per identifier
+        member_ids = set()
+        for ident in github_identifiers:
+            try:
+                member_ids.add(ObjectId(ident.get("member_id")))
+            except Exception:
+                continue
+        members_by_id = {}
+        if member_ids:
+            async for member in db["members"].find(
+                {"_id": {"$in": list(member_ids)}}, {"name": 1}
+            ):
+                members_by_id[str(member["_id"])] = member
+
         for ident in github_identifiers:
             member_id = ident.get("member_id")
             github_username = ident.get("identifier_value", "").lower()
             if member_id and github_username:
-                member = db["members"].find_one({"_id": ObjectId(member_id)})
+                member = members_by_id.get(str(member_id))
                 if member:
                     github_to_member[github_username] = member.get("name", github_username)
 
@@ -279,7 +351,7 @@ class MCPToolManager:
                 "commits": {"$sum": 1}
             }}
         ]
-        total_result = list(db["github_commits"].aggregate(total_pipeline))
+        total_result = await db["github_commits"].aggregate(total_pipeline).to_list(length=None)
         total = total_result[0] if total_result else {"additions": 0, "deletions": 0, "commits": 0}
 
         # Aggregate by member
@@ -294,7 +366,7 @@ class MCPToolManager:
             {"$sort": {"additions": -1}},
             {"$limit": 10}
         ]
-        member_results = list(db["github_commits"].aggregate(member_pipeline))
+        member_results = await db["github_commits"].aggregate(member_pipeline).to_list(length=None)
         by_member = []
         for m in member_results:
             github_username = (m["_id"] or "").lower()
@@ -318,7 +390,7 @@ class MCPToolManager:
             {"$sort": {"additions": -1}},
             {"$limit": 10}
         ]
-        repo_results = list(db["github_commits"].aggregate(repo_pipeline))
+        repo_results = await db["github_commits"].aggregate(repo_pipeline).to_list(length=None)
         by_repository = [
             {
                 "name": r["_id"],
@@ -353,6 +425,7 @@ TOOL_EXECUTOR_MAP = {
     "get_projects": MCPToolManager.get_projects,
     "get_project_details": MCPToolManager.get_project_details,
     "get_activities": MCPToolManager.get_activities,
+    "semantic_search": MCPToolManager.semantic_search,
     "get_code_stats": MCPToolManager.get_code_stats,
 }
 
@@ -361,7 +434,7 @@ TOOL_EXECUTOR_MAP = {
 # ============================================================================
 
 
-def build_system_prompt() -> str:
+async def build_system_prompt() -> str:
     # Use KST (Korea Standard Time, UTC+9) as the reference timezone
     from datetime import timezone
 
@@ -401,8 +474,8 @@ def build_system_prompt() -> str:
     )
 
     # Pre-fetch actual members for grounding
-    db = get_mongo().db
-    members = [m["name"] for m in db["members"].find({}, {"name": 1})]
+    db = get_mongo().async_db
+    members = [m["name"] async for m in db["members"].find({}, {"name": 1})]
     member_list = ", ".join(members)
 
     return f"""You are the All-Thing-Eye Analytics Specialist.
@@ -414,6 +487,7 @@ Your mission is to provide deep, accurate insights into team productivity, proje
 3. **REAL MEMBERS ONLY**: Use ONLY these names: {member_list}.
 4. **INTEGRATED ANALYSIS**: When asked for "activity", always combine GitHub commits and Slack messages.
 5. **ENGLISH OUTPUT**: Always respond to the user in English. Keep internal Thoughts in English as well.
+6. **SEARCH BEFORE FETCHING**: For questions about what was discussed, decided or built around a topic, call "semantic_search" first. Use "get_activities" for counts and activity lists.
 
 ## RESPONSE PROTOCOL
 Thought: <Detailed plan or data analysis>
@@ -512,7 +586,7 @@ async def run_mcp_agent(body: AgentRequest, _admin: Any = None):
         f"🔑 API Key loaded: {api_key[:10]}...{api_key[-4:] if len(api_key) > 14 else '***'} (length: {len(api_key)})"
     )
 
-    conversation = [{"role": "system", "content": build_system_prompt()}]
+    conversation = [{"role": "system", "content": await build_system_prompt()}]
     for m in body.messages:
         conversation.append({"role": m["role"], "content": m["content"]})
 
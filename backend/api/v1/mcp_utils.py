@@ -10,6 +10,7 @@ import json
 import re
 from collections import Counter
 from src.utils.logger import get_logger
+from src.core.identity_index import sync_identity_cache
 
 logger = get_logger(__name__)
 
@@ -26,19 +27,14 @@ def github_to_member_name(db, github_username: str) -> str:
     if not github_username:
         return "Unknown"
     
+    # Check member_identifiers (shared identity index, case-insensitive)
+    mapped = sync_identity_cache.get(db).member_for('github', github_username)
+    if mapped:
+        return mapped
+
     cache_key = f"gh:{github_username.lower()}"
     if cache_key in _MEMBER_CACHE:
         return _MEMBER_CACHE[cache_key]
-
-    # Check member_identifiers collection
-    identifier = db['member_identifiers'].find_one({
-        'source': 'github',
-        'identifier_value': {'$regex': f'^{github_username}$', '$options': 'i'}
-    })
-    if identifier:
-        res = identifier.get('member_name', github_username)
-        _MEMBER_CACHE[cache_key] = res
-        return res
     
     # Check members collection for github_username field
     member = db['members'].find_one({
@@ -69,14 +65,10 @@ def slack_to_member_name(db, slack_username: str) -> str:
         return member['name']
     
     # 2. Check member_identifiers (handles both IDs like U123 and usernames)
-    identifier = db['member_identifiers'].find_one({
-        'source': 'slack',
-        'identifier_value': {'$regex': f'^{slack_username}$', '$options': 'i'}
-    })
-    if identifier:
-        res = identifier.get('member_name', slack_username)
-        _MEMBER_CACHE[cache_key] = res
-        return res
+    mapped = sync_identity_cache.get(db).member_for('slack', slack_username, fold_case=True)
+    if mapped:
+        _MEMBER_CACHE[cache_key] = mapped
+        return mapped
     
     return slack_username.capitalize()
 
@@ -102,7 +94,23 @@ async def fetch_github_activities(
     project_key: Optional[str] = None,
     limit: int = 500
 ) -> Dict[str, Any]:
-    """Unified logic to fetch and summarize GitHub activities."""
+    """Unified logic to fetch and summarize GitHub activities.
+
+    Member mapping does a find_one per author, so the blocking work runs on
+    the Mongo manager's executor instead of the event loop.
+    """
+    return await get_mongo().run_sync(
+        _fetch_github_activities_sync, db, start_date, end_date, member_name, project_key, limit
+    )
+
+def _fetch_github_activities_sync(
+    db,
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+    member_name: Optional[str],
+    project_key: Optional[str],
+    limit: int
+) -> Dict[str, Any]:
     query = {}
     if start_date:
         query["date"] = {"$gte": start_date}
@@ -160,7 +168,22 @@ async def fetch_slack_messages(
     project_key: Optional[str] = None,
     limit: int = 500
 ) -> Dict[str, Any]:
-    """Unified logic to fetch and summarize Slack messages with ID mapping."""
+    """Unified logic to fetch and summarize Slack messages with ID mapping.
+
+    Runs on the Mongo manager's executor (see fetch_github_activities).
+    """
+    return await get_mongo().run_sync(
+        _fetch_slack_messages_sync, db, start_date, end_date, member_name, project_key, limit
+    )
+
+def _fetch_slack_messages_sync(
+    db,
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+    member_name: Optional[str],
+    project_key: Optional[str],
+    limit: int
+) -> Dict[str, Any]:
     query = {"channel_name": {"$ne": "tokamak-partners"}}
     if start_date:
         query["posted_at"] = {"$gte": start_date}
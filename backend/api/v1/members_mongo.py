@@ -3,16 +3,22 @@ Members Management API
 Handles CRUD operations for team members
 """
 
+import asyncio
+
 from fastapi import APIRouter, HTTPException, Request, Depends
 from typing import List, Dict, Any, Optional
 from pydantic import BaseModel, EmailStr
-from datetime import datetime
+from datetime import datetime, timedelta
+from src.core.activity_rollups import daily_range, load_daily_totals, summarize_code_changes
 from src.utils.logger import get_logger
 from backend.middleware.jwt_auth import require_admin
 
 logger = get_logger(__name__)
 router = APIRouter()
 
+# Model for AI member summaries
+GEMINI_SUMMARY_MODEL = "gemini-2.0-flash"
+
 
 # Get MongoDB manager instance
 def get_mongo():
@@ -431,9 +437,9 @@ async def create_member(
                         )
 
         # Clear member mapping cache to ensure fresh data after creation
-        from backend.api.v1.activities_mongo import clear_member_mapping_cache
+        from backend.api.v1.activities_mongo import invalidate_member_mappings
 
-        clear_member_mapping_cache()
+        await invalidate_member_mappings(db)
 
         logger.info(f"Created new member: {member_data.name} ({member_id})")
 
@@ -932,9 +938,9 @@ async def update_member(
                         )
 
         # Clear member mapping cache to ensure fresh data after update
-        from backend.api.v1.activities_mongo import clear_member_mapping_cache
+        from backend.api.v1.activities_mongo import invalidate_member_mappings
 
-        clear_member_mapping_cache()
+        await invalidate_member_mappings(db)
 
         # Get updated member
         updated_member = await db["members"].find_one({"_id": member_obj_id})
@@ -1152,79 +1158,18 @@ async def get_member_detail(
                 github_commits + github_prs + github_issues
             )
 
-        # Calculate code changes (additions/deletions) for this member
-        code_changes = {
-            "total": {"additions": 0, "deletions": 0},
-            "daily": [],
-            "weekly": []
-        }
+        # Code changes and daily trends come from the precomputed daily rollups
+        trend_end = datetime.utcnow()
+        trend_start = trend_end - timedelta(days=90)
+        rollup_totals = {}
         try:
-            from datetime import timedelta as td
-            end_dt = datetime.utcnow()
-            start_90d = end_dt - td(days=90)
-
-            # Total code changes (last 90 days)
-            code_total_pipeline = [
-                {"$match": {"$and": [github_query, {"date": {"$gte": start_90d}}]}},
-                {"$group": {
-                    "_id": None,
-                    "additions": {"$sum": {"$ifNull": ["$additions", 0]}},
-                    "deletions": {"$sum": {"$ifNull": ["$deletions", 0]}}
-                }}
-            ]
-            code_total_result = await db["github_commits"].aggregate(code_total_pipeline).to_list(1)
-            if code_total_result:
-                code_changes["total"]["additions"] = code_total_result[0].get("additions", 0)
-                code_changes["total"]["deletions"] = code_total_result[0].get("deletions", 0)
-
-            # Daily code changes (last 30 days)
-            start_30d = end_dt - td(days=30)
-            daily_pipeline = [
-                {"$match": {"$and": [github_query, {"date": {"$gte": start_30d}}]}},
-                {"$group": {
-                    "_id": {"$dateToString": {"format": "%Y-%m-%d", "date": "$date"}},
-                    "additions": {"$sum": {"$ifNull": ["$additions", 0]}},
-                    "deletions": {"$sum": {"$ifNull": ["$deletions", 0]}}
-                }},
-                {"$sort": {"_id": 1}}
-            ]
-            daily_result = await db["github_commits"].aggregate(daily_pipeline).to_list(None)
-
-            # Fill missing days with zeros
-            daily_map = {}
-            current = start_30d
-            while current <= end_dt:
-                d = current.strftime("%Y-%m-%d")
-                daily_map[d] = {"date": d, "additions": 0, "deletions": 0}
-                current += td(days=1)
-
-            for doc in daily_result:
-                if doc["_id"] and doc["_id"] in daily_map:
-                    daily_map[doc["_id"]]["additions"] = doc["additions"]
-                    daily_map[doc["_id"]]["deletions"] = doc["deletions"]
-
-            code_changes["daily"] = sorted(daily_map.values(), key=lambda x: x["date"])
-
-            # Weekly code changes (last 12 weeks)
-            start_12w = end_dt - td(weeks=12)
-            weekly_pipeline = [
-                {"$match": {"$and": [github_query, {"date": {"$gte": start_12w}}]}},
-                {"$group": {
-                    "_id": {"$dateToString": {"format": "%Y-%V", "date": "$date"}},
-                    "additions": {"$sum": {"$ifNull": ["$additions", 0]}},
-                    "deletions": {"$sum": {"$ifNull": ["$deletions", 0]}}
-                }},
-                {"$sort": {"_id": 1}}
-            ]
-            weekly_result = await db["github_commits"].aggregate(weekly_pipeline).to_list(None)
-            code_changes["weekly"] = [
-                {"week": doc["_id"], "additions": doc["additions"], "deletions": doc["deletions"]}
-                for doc in weekly_result if doc["_id"]
-            ]
-
+            rollup_totals = await load_daily_totals(
+                db, trend_start, trend_end, {"member_key": (member_name or "").lower()}
+            )
         except Exception as e:
-            logger.warning(f"Failed to get code changes for member {member_name}: {e}")
+            logger.warning(f"Failed to load activity rollups for member {member_name}: {e}")
 
+        code_changes = summarize_code_changes(rollup_totals, trend_end)
         activity_stats["code_changes"] = code_changes
 
         # Slack statistics - use both member_mappings and direct identifiers
@@ -1397,102 +1342,21 @@ async def get_member_detail(
         recent.sort(key=lambda x: x.get("timestamp") or "", reverse=True)
         activity_stats["recent_activities"] = recent[:20]
 
-        # Calculate daily trends (last 90 days)
-        from datetime import timedelta
-
+        # Daily trends (last 90 days)
         daily_trends = []
-        try:
-            end_date = datetime.utcnow()
-            start_date = end_date - timedelta(days=90)
-
-            # Helper for aggregation with existing query
-            async def get_daily_counts_with_query(collection_name, query, date_field):
-                try:
-                    coll = db[collection_name]
-                    # Clone query and add date filter
-                    trend_query = query.copy()
-                    trend_query[date_field] = {"$gte": start_date, "$lte": end_date}
-
-                    # Build dateToString expression properly for MongoDB
-                    # Use dictionary construction to properly reference the field
-                    date_expr = {
-                        "$dateToString": {
-                            "format": "%Y-%m-%d",
-                            "date": f"${date_field}",  # This will be evaluated as "$date", "$posted_at", etc.
-                        }
-                    }
-
-                    pipeline = [
-                        {"$match": trend_query},
-                        {"$group": {"_id": date_expr, "count": {"$sum": 1}}},
-                        {"$sort": {"_id": 1}},
-                    ]
-                    result = await coll.aggregate(pipeline).to_list(None)
-                    return {
-                        doc["_id"]: doc["count"]
-                        for doc in result
-                        if doc["_id"] is not None
-                    }
-                except Exception as e:
-                    logger.warning(
-                        f"Trend aggregation failed for {collection_name} with query {query} and date_field {date_field}: {e}"
-                    )
-                    import traceback
-
-                    logger.warning(traceback.format_exc())
-                    return {}
-
-            # Execute aggregations
-            github_trend = await get_daily_counts_with_query(
-                "github_commits", github_query, "date"
-            )
-            slack_trend = await get_daily_counts_with_query(
-                "slack_messages", slack_query, "posted_at"
-            )
-            notion_trend = await get_daily_counts_with_query(
-                "notion_pages", notion_query, "created_time"
-            )
-            drive_trend = await get_daily_counts_with_query(
-                "drive_activities", drive_query, "timestamp"
-            )
-
-            # Initialize map with 0s for all dates in range
-            trend_map = {}
-            current = start_date
-            while current <= end_date:
-                d = current.strftime("%Y-%m-%d")
-                trend_map[d] = {
-                    "date": d,
-                    "github": 0,
-                    "slack": 0,
-                    "notion": 0,
+        for date_str in daily_range(trend_start, trend_end):
+            day = rollup_totals.get(date_str, {})
+            daily_trends.append(
+                {
+                    "date": date_str,
+                    "github": day.get("github", {}).get("by_type", {}).get("commit", 0),
+                    "slack": day.get("slack", {}).get("count", 0),
+                    "notion": day.get("notion", {}).get("count", 0),
+                    # Drive is kept at 0 for charts due to noise
                     "drive": 0,
                 }
-                current += timedelta(days=1)
-
-            # Fill data
-            for date_str, count in github_trend.items():
-                if date_str in trend_map:
-                    trend_map[date_str]["github"] = count
-            for date_str, count in slack_trend.items():
-                if date_str in trend_map:
-                    trend_map[date_str]["slack"] = count
-            for date_str, count in notion_trend.items():
-                if date_str in trend_map:
-                    trend_map[date_str]["notion"] = count
-            for date_str, count in drive_trend.items():
-                # Force drive count to 0 for charts due to noise
-                if date_str in trend_map:
-                    trend_map[date_str]["drive"] = 0
-
-            daily_trends = sorted(trend_map.values(), key=lambda x: x["date"])
-            activity_stats["daily_trends"] = daily_trends
-
-        except Exception as e:
-            import traceback
-
-            logger.error(f"Failed to generate member daily trends: {e}")
-            logger.error(traceback.format_exc())
+            )
+        activity_stats["daily_trends"] = daily_trends
 
         logger.info(f"Retrieved member detail: {member_name} ({actual_member_id})")
 
@@ -1939,7 +1803,7 @@ async def generate_member_summary(
 
         # Configure Gemini
         genai.configure(api_key=gemini_api_key)
-        model = genai.GenerativeModel("gemini-2.0-flash")
+        model = genai.GenerativeModel(GEMINI_SUMMARY_MODEL)
 
         # Get member activities
         mongo = get_mongo()
@@ -2279,10 +2143,20 @@ Please provide:
 Provide a clear, concise summary in English that would be useful for performance review or team insights.
 """
 
-        # Generate summary using Gemini
+        # Generate summary using Gemini (cached; the SDK call blocks, so run it on a thread)
+        from src.report.ai_client import cache_key, run_cached
+
+        async def call_gemini() -> str:
+            response = await asyncio.to_thread(model.generate_content, prompt)
+            return response.text
+
         try:
-            response = model.generate_content(prompt)
-            summary = response.text
+            summary = await run_cached(
+                cache_key(GEMINI_SUMMARY_MODEL, prompt),
+                GEMINI_SUMMARY_MODEL,
+                call_gemini,
+                mongo_manager=mongo,
+            )
         except Exception as e:
             logger.error(f"Error generating Gemini summary: {e}")
             summary = f"Error generating summary: {str(e)}"
@@ -2339,9 +2213,9 @@ async def delete_member(
         await db["members"].delete_one({"_id": member_obj_id})
 
         # Clear member mapping cache to ensure fresh data after deletion
-        from backend.api.v1.activities_mongo import clear_member_mapping_cache
+        from backend.api.v1.activities_mongo import invalidate_member_mappings
 
-        clear_member_mapping_cache()
+        await invalidate_member_mappings(db)
 
         logger.info(f"Deleted member: {member_name} ({member_id})")
 
@@ -5,6 +5,8 @@ Provides granular content change data for Notion pages.
 Used by frontend to display GitHub-like diff views.
 """
 
+import re
+
 from fastapi import APIRouter, HTTPException, Query
 from typing import List, Optional
 from pydantic import BaseModel
@@ -117,7 +119,7 @@ async def get_notion_diffs(
         if editor_id:
             query['editor_id'] = editor_id
         if editor_name:
-            query['editor_name'] = {'$regex': editor_name, '$options': 'i'}
+            query['editor_name'] = {'$regex': re.escape(editor_name), '$options': 'i'}
         if diff_type:
             query['diff_type'] = diff_type
         
@@ -302,9 +304,15 @@ async def get_notion_diff_stats():
         mongo = get_mongo()
         db = mongo.async_db
         
+        # Current blocks live in one manifest document per page
+        manifest_totals = await db["notion_block_snapshots"].aggregate([
+            {"$match": {"is_current": True, "blocks": {"$exists": True}}},
+            {"$group": {"_id": None, "total": {"$sum": "$block_count"}}}
+        ]).to_list(1)
+        
         stats = NotionDiffStatsResponse(
             tracked_pages=await db["notion_page_tracking"].count_documents({}),
-            current_blocks=await db["notion_block_snapshots"].count_documents({"is_current": True}),
+            current_blocks=manifest_totals[0]["total"] if manifest_totals else 0,
             total_block_snapshots=await db["notion_block_snapshots"].count_documents({}),
             total_comment_snapshots=await db["notion_comment_snapshots"].count_documents({}),
             total_diffs=await db["notion_content_diffs"].count_documents({}),
@@ -380,7 +388,7 @@ async def get_notion_activities(
         query = {}
         
         if member_name:
-            query['editor_name'] = {'$regex': member_name, '$options': 'i'}
+            query['editor_name'] = {'$regex': re.escape(member_name), '$options': 'i'}
         
         if start_date or end_date:
             date_query = {}
@@ -16,6 +16,7 @@ from pathlib import Path
 
 from src.utils.logger import get_logger
 from src.core.mongo_manager import get_mongo_manager
+from src.core.cache_versions import bump_collection_versions
 
 logger = get_logger(__name__)
 
@@ -316,6 +317,7 @@ async def create_project(request: Request, body: ProjectCreateRequest):
         result = projects_collection.insert_one(project_doc)
         project_doc["_id"] = result.inserted_id
         
+        bump_collection_versions(db, "projects")
         logger.info(f"Created project: {body.key}")
         
         return ProjectResponse(
@@ -554,6 +556,7 @@ async def update_project(request: Request, project_key: str, body: ProjectUpdate
         # Fetch updated document
         updated = projects_collection.find_one({"key": project_key})
         
+        bump_collection_versions(db, "projects", "members")
         logger.info(f"Updated project: {project_key}")
         
         return ProjectResponse(
@@ -608,6 +611,7 @@ async def delete_project(request: Request, project_key: str):
             {"$set": {"is_active": False, "updated_at": datetime.utcnow()}}
         )
         
+        bump_collection_versions(db, "projects")
         logger.info(f"Deleted (deactivated) project: {project_key}")
         
     except HTTPException:
@@ -660,6 +664,7 @@ async def sync_repositories(request: Request, project_key: str):
         # Fetch updated document
         updated = projects_collection.find_one({"key": project_key})
         
+        bump_collection_versions(db, "projects")
         logger.info(f"Synced {len(repositories)} repositories for project: {project_key}")
         
         return ProjectResponse(
@@ -801,6 +806,7 @@ async def add_grant_report(request: Request, project_key: str, body: GrantReport
             }
         )
         
+        bump_collection_versions(db, "projects")
         logger.info(f"Added grant report for {project_key}: {body.year} Q{body.quarter}")
         
         return GrantReportResponse(
@@ -884,6 +890,7 @@ async def update_grant_report(request: Request, project_key: str, report_id: str
         )
         
         updated_report = grant_reports[report_index]
+        bump_collection_versions(db, "projects")
         logger.info(f"Updated grant report for {project_key}: {report_id}")
         
         return GrantReportResponse(
@@ -948,6 +955,7 @@ async def delete_grant_report(request: Request, project_key: str, report_id: str
             }
         )
         
+        bump_collection_versions(db, "projects")
         logger.info(f"Deleted grant report for {project_key}: {report_id}")
         
     except HTTPException:
@@ -9,6 +9,7 @@ from pydantic import BaseModel
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
+import asyncio
 import os
 import sys
 from pathlib import Path
@@ -46,84 +47,18 @@ class ReportResponse(BaseModel):
     metadata: Dict[str, Any]
 
 
-async def get_github_stats(mongo_manager, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
+async def get_github_stats(
+    mongo_manager, start_date: datetime, end_date: datetime, active_projects: Optional[Dict[str, list]] = None
+) -> Dict[str, Any]:
     """
     Get GitHub commit statistics from MongoDB.
+
+    Counts are computed server-side; only the commit headlines used by
+    the project summaries are returned (``headlines``).
     """
-    db = mongo_manager.async_db
-    
-    # Query commits in date range
-    query = {
-        "date": {
-            "$gte": start_date,
-            "$lte": end_date
-        }
-    }
-    
-    commits = await db['github_commits'].find(query).to_list(length=None)
-    
-    # Also get PRs
-    pr_query = {
-        "created_at": {
-            "$gte": start_date,
-            "$lte": end_date
-        }
-    }
-    prs = await db['github_pull_requests'].find(pr_query).to_list(length=None)
-    
-    # Count commits by repository
-    repo_counts = {}
-    for commit in commits:
-        repo = commit.get('repository', 'unknown')
-        repo_counts[repo] = repo_counts.get(repo, 0) + 1
-    
-    # Count PRs by repository
-    pr_counts = {}
-    for pr in prs:
-        repo = pr.get('repository', 'unknown')
-        pr_counts[repo] = pr_counts.get(repo, 0) + 1
-    
-    # Categorize repos
-    categories = {
-        'Economics': ['ton-staking-v2', 'TON-Ecosystem', 'staking-dashboard', 'ton-staking', 'tokamak-dao'],
-        'Zkp': ['Tokamak-zk-EVM', 'tokamak-zk-evm-docs', 'Tokamak-zkp-channel-manager', 'zkp', 'zk-'],
-        'Rollup': ['tokamak-titan', 'tokamak-titan-canyon', 'optimism', 'thanos', 'trh-'],
-        'etc': []
-    }
-    
-    category_stats = {cat: {'repos': set(), 'commits': 0} for cat in categories}
-    
-    for repo, count in repo_counts.items():
-        found = False
-        for cat, keywords in categories.items():
-            if cat == 'etc':
-                continue
-            if any(kw.lower() in repo.lower() for kw in keywords):
-                category_stats[cat]['repos'].add(repo)
-                category_stats[cat]['commits'] += count
-                found = True
-                break
-        if not found:
-            category_stats['etc']['repos'].add(repo)
-            category_stats['etc']['commits'] += count
-    
-    # Convert sets to counts
-    for cat in category_stats:
-        category_stats[cat]['repos'] = len(category_stats[cat]['repos'])
-    
-    total_commits = sum(repo_counts.values())
-    total_repos = len(repo_counts)
-    
-    return {
-        'total_commits': total_commits,
-        'total_repos': total_repos,
-        'total_prs': len(prs),
-        'by_repo': repo_counts,
-        'pr_by_repo': pr_counts,
-        'by_category': category_stats,
-        'commits_list': commits,
-        'prs_list': prs
-    }
+    from src.report.github_stats import load_github_stats
+
+    return await load_github_stats(mongo_manager.async_db, start_date, end_date, active_projects)
 
 
 def format_tech_stats_table(category_stats: Dict) -> str:
@@ -143,7 +78,9 @@ def format_tech_stats_table(category_stats: Dict) -> str:
 async def get_active_projects(mongo_manager) -> Dict[str, list]:
     """Get active projects and their repositories from MongoDB."""
     db = mongo_manager.async_db
-    projects = await db['projects'].find({'is_active': True}).to_list(length=None)
+    projects = await db['projects'].find(
+        {'is_active': True}, {'key': 1, 'repositories': 1}
+    ).to_list(length=None)
     
     active_repos = {}
     for p in projects:
@@ -155,47 +92,19 @@ async def get_active_projects(mongo_manager) -> Dict[str, list]:
 
 
 async def generate_project_summaries(
-    commits_list: list,
-    active_projects: Dict[str, list],
-    use_ai: bool = True
+    project_headlines: Dict[str, list],
+    use_ai: bool = True,
+    mongo_manager=None
 ) -> Dict[str, str]:
-    """Generate project-specific summaries from commits."""
-    from src.report.ai_client import generate_completion
-    
-    project_commits = {
-        'ooo': [],
-        'eco': [],
-        'trh': []
-    }
-    
-    # Map repos to projects based on DB config
-    repo_to_project = {}
-    for project_key, repos in active_projects.items():
-        if project_key in project_commits:
-            for repo in repos:
-                repo_to_project[repo.lower()] = project_key
-    
-    # Fallback keywords for repos not in DB
-    project_keywords = {
-        'ooo': ['zk-evm', 'zkevm', 'zkp', 'tokamak-zk', 'channel-manager'],
-        'eco': ['staking', 'ton-staking', 'dao', 'ecosystem', 'ton-total'],
-        'trh': ['titan', 'thanos', 'drb', 'trh-', 'commit-reveal']
-    }
+    """
+    Generate project-specific summaries from commit headlines (``get_github_stats()['headlines']``).
+
+    AI summaries for all projects are requested concurrently; responses are
+    cached when a mongo_manager is given.
+    """
+    from src.report.ai_client import generate_completions
     
-    for commit in commits_list:
-        repo = commit.get('repository', '').lower()
-        
-        if repo in repo_to_project:
-            project_key = repo_to_project[repo]
-            project_commits[project_key].append(commit)
-            continue
-        
-        matched = False
-        for project, keywords in project_keywords.items():
-            if any(kw in repo for kw in keywords):
-                project_commits[project].append(commit)
-                matched = True
-                break
+    project_commits = {project: project_headlines.get(project, []) for project in ('ooo', 'eco', 'trh')}
     
     summaries = {}
     
@@ -206,6 +115,7 @@ Focus on key achievements and features, not internal processes.
 Use past tense and be specific about what was implemented.
 Output 3-5 bullet points in markdown format starting with "- " (hyphen)."""
         
+        requests = {}
         for project, commits in project_commits.items():
             if not commits:
                 summaries[project] = "- No significant updates in this period."
@@ -214,7 +124,7 @@ Output 3-5 bullet points in markdown format starting with "- " (hyphen)."""
             commit_texts = []
             for c in commits[:20]:
                 repo = c.get('repository', '')
-                msg = c.get('message', '').split('\n')[0]
+                msg = c.get('message', '')
                 commit_texts.append(f"- [{repo}] {msg}")
             
             prompt = f"""Based on these commits, summarize the key development progress:
@@ -222,29 +132,32 @@ Output 3-5 bullet points in markdown format starting with "- " (hyphen)."""
 {chr(10).join(commit_texts)}
 
 Generate a concise summary with 3-5 bullet points highlighting the main achievements."""
-            
-            try:
-                summary = await generate_completion(prompt, system_prompt, max_tokens=500)
-                summaries[project] = summary
-            except Exception as e:
-                logger.error(f"AI generation failed for {project}: {e}")
-                summaries[project] = "\n".join([f"- {c.get('message', '').split(chr(10))[0]}" for c in commits[:5]])
+            requests[project] = {"prompt": prompt, "system_prompt": system_prompt, "max_tokens": 500}
+        
+        results = await generate_completions(list(requests.values()), mongo_manager=mongo_manager)
+        for project, result in zip(requests, results):
+            if isinstance(result, Exception):
+                logger.error(f"AI generation failed for {project}: {result}")
+                summaries[project] = "\n".join([f"- {c.get('message', '')}" for c in project_commits[project][:5]])
+            else:
+                summaries[project] = result
     else:
         for project, commits in project_commits.items():
             if not commits:
                 summaries[project] = "- No significant updates in this period."
             else:
-                bullet_points = [f"- {c.get('message', '').split(chr(10))[0]}" for c in commits[:5]]
+                bullet_points = [f"- {c.get('message', '')}" for c in commits[:5]]
                 summaries[project] = "\n".join(bullet_points)
     
-    return summaries
+    return {project: summaries[project] for project in project_commits}
 
 
 async def generate_highlight(
     github_stats: Dict,
     staking_summary: str,
     market_summary: str,
-    use_ai: bool = True
+    use_ai: bool = True,
+    mongo_manager=None
 ) -> str:
     """Generate the highlight section using AI."""
     from src.report.ai_client import generate_completion
@@ -272,7 +185,9 @@ GitHub Activity:
 Generate a 2-3 sentence highlight focusing on the most significant achievements."""
     
     try:
-        highlight = await generate_completion(prompt, system_prompt, max_tokens=300)
+        highlight = await generate_completion(
+            prompt, system_prompt, max_tokens=300, mongo_manager=mongo_manager
+        )
         return highlight
     except Exception as e:
         logger.error(f"AI generation failed for highlight: {e}")
@@ -333,21 +248,21 @@ async def generate_report(
             logger.warning(f"Transactions data not available: {e}")
             tx_summary = "Transaction data is currently being collected."
         
-        # 2. Fetch GitHub stats
-        github_stats = await get_github_stats(mongo, start_utc, end_utc)
-        
-        # 3. Get active projects and generate summaries
+        # 2. Fetch GitHub stats (repos are mapped to active projects)
         active_projects = await get_active_projects(mongo)
+        github_stats = await get_github_stats(mongo, start_utc, end_utc, active_projects)
         
-        project_summaries = await generate_project_summaries(
-            github_stats['commits_list'],
-            active_projects=active_projects,
-            use_ai=report_request.use_ai
-        )
-        
-        # 4. Generate highlight
-        highlight = await generate_highlight(
-            github_stats, staking_summary, market_summary, use_ai=report_request.use_ai
+        # 3-4. Generate project summaries and highlight (independent AI calls, run together)
+        project_summaries, highlight = await asyncio.gather(
+            generate_project_summaries(
+                github_stats['headlines'],
+                use_ai=report_request.use_ai,
+                mongo_manager=mongo
+            ),
+            generate_highlight(
+                github_stats, staking_summary, market_summary,
+                use_ai=report_request.use_ai, mongo_manager=mongo
+            ),
         )
         
         # 5. Format tech stats table
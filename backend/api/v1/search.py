@@ -0,0 +1,94 @@
+"""
+Search API endpoints (MongoDB Version)
+
+Ranked full-text search across every activity source, served from the text
+index on ``activity_timeline`` (see ``src/core/search_index.py``)
+"""
+
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from pydantic import BaseModel
+
+from src.core.search_index import search_timeline_async
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+router = APIRouter()
+
+
+# Get MongoDB manager instance
+def get_mongo():
+    from backend.main import mongo_manager
+
+    return mongo_manager
+
+
+class SearchHit(BaseModel):
+    id: str
+    source_type: str
+    activity_type: str
+    timestamp: Optional[str] = None
+    member_name: str = ""
+    title: str = ""
+    title_highlights: List[List[int]] = []
+    snippet: str = ""
+    highlights: List[List[int]] = []
+    score: float
+    metadata: dict = {}
+
+
+class SearchResponse(BaseModel):
+    query: str
+    results: List[SearchHit]
+    offset: int
+    limit: int
+    has_more: bool = False
+    filters: dict
+
+
+@router.get("/search", response_model=SearchResponse)
+async def search(
+    request: Request,
+    q: str = Query(..., min_length=1, description='Keywords; "quoted phrase" must match, -word excludes'),
+    source_type: Optional[str] = Query(
+        None, description="Filter by source (github, slack, notion, drive, recordings)"
+    ),
+    member_name: Optional[str] = Query(None, description="Filter by member name"),
+    project_key: Optional[str] = Query(None, description="Filter by project key"),
+    start_date: Optional[str] = Query(None, description="Start date (ISO format)"),
+    end_date: Optional[str] = Query(None, description="End date (ISO format)"),
+    offset: int = Query(0, ge=0, le=1000),
+    limit: int = Query(20, ge=1, le=100),
+):
+    """
+    Search commit messages, PR titles, Slack text, Notion diffs, Drive titles
+    and meeting transcripts
+
+    Results are ordered by relevance (text score, then newest first). Each hit
+    carries a snippet around the first match; ``highlights`` are
+    ``[start, end)`` offsets of the matches within the snippet (and
+    ``title_highlights`` within the title).
+
+    Returns:
+        One page of ranked hits
+    """
+    filters = {
+        "source_type": source_type,
+        "member_name": member_name,
+        "project_key": project_key,
+        "start_date": start_date,
+        "end_date": end_date,
+    }
+
+    try:
+        db = get_mongo().async_db
+        page = await search_timeline_async(db, q, offset=offset, limit=limit, **filters)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error searching activities: {e}")
+        raise HTTPException(status_code=500, detail="Failed to search activities")
+
+    return SearchResponse(filters=filters, **page)
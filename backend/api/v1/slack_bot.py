@@ -6,6 +6,7 @@ Connects Slack events to the MCP AI Agent.
 from fastapi import APIRouter, HTTPException, Request, BackgroundTasks, Form, Response
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
+import asyncio
 import json
 import httpx
 import os
@@ -746,17 +747,22 @@ async def generate_and_send_report(
             except Exception:
                 tx_summary = "Transaction data is currently being collected."
 
-            github_stats = await get_github_stats(mongo, start_utc, end_utc)
             active_projects = await get_active_projects(mongo)
-
-            project_summaries = await generate_project_summaries(
-                github_stats["commits_list"],
-                active_projects=active_projects,
-                use_ai=use_ai,
+            github_stats = await get_github_stats(
+                mongo, start_utc, end_utc, active_projects
             )
 
-            highlight = await generate_highlight(
-                github_stats, staking_summary, market_summary, use_ai=use_ai
+            project_summaries, highlight = await asyncio.gather(
+                generate_project_summaries(
+                    github_stats["headlines"], use_ai=use_ai, mongo_manager=mongo
+                ),
+                generate_highlight(
+                    github_stats,
+                    staking_summary,
+                    market_summary,
+                    use_ai=use_ai,
+                    mongo_manager=mongo,
+                ),
             )
 
             tech_table = format_tech_stats_table(github_stats["by_category"])
@@ -11,6 +11,7 @@ from datetime import datetime, timedelta
 from collections import Counter
 import re
 
+from src.core.activity_rollups import daily_range, load_daily_totals, summarize_code_changes
 from src.utils.logger import get_logger
 from backend.middleware.jwt_auth import require_admin
 
@@ -18,6 +19,10 @@ logger = get_logger(__name__)
 
 router = APIRouter()
 
+# Keywords change slowly; recompute them at most every few minutes
+KEYWORDS_TTL = timedelta(minutes=10)
+_keywords_cache: Dict[str, Any] = {"expires_at": None, "keywords": []}
+
 
 def get_mongo():
     """Get MongoDB manager from main.py"""
@@ -25,6 +30,81 @@ def get_mongo():
     return mongo_manager
 
 
+async def get_top_keywords(db) -> List[Dict[str, Any]]:
+    """
+    Top words of the last week's commit messages, Slack messages and Notion edits
+
+    Results are cached in-process for KEYWORDS_TTL.
+    """
+    if _keywords_cache["expires_at"] and _keywords_cache["expires_at"] > datetime.utcnow():
+        return _keywords_cache["keywords"]
+
+    top_keywords = []
+    try:
+        # Recent 7 days for context
+        keyword_start_date = datetime.utcnow() - timedelta(days=7)
+        
+        # Helper to fetch text from collection
+        async def get_recent_texts(collection_name, text_field, date_field):
+            try:
+                coll = db[collection_name]
+                cursor = coll.find(
+                    {date_field: {"$gte": keyword_start_date}},
+                    {text_field: 1, "_id": 0}
+                ).sort(date_field, -1).limit(200) # Limit to 200 documents per source
+                
+                texts = []
+                async for doc in cursor:
+                    if text_field in doc and doc[text_field]:
+                        texts.append(doc[text_field])
+                return texts
+            except Exception:
+                return []
+        
+        # Fetch texts
+        github_texts = await get_recent_texts("github_commits", "message", "date")
+        slack_texts = await get_recent_texts("slack_messages", "text", "posted_at")
+        notion_texts = await get_recent_texts("notion_content_diffs", "page_title", "timestamp")  # Use diff tracking
+        # drive_texts = await get_recent_texts("drive_activities", "title", "time") # Re-enable if possible, but title might be missing
+        
+        all_texts = github_texts + slack_texts + notion_texts
+        
+        # Simple keyword extraction
+        if all_texts:
+            # Basic stopwords
+            stopwords = set([
+                "the", "be", "to", "of", "and", "a", "in", "that", "have", "i", 
+                "it", "for", "not", "on", "with", "he", "as", "you", "do", "at", 
+                "this", "but", "his", "by", "from", "they", "we", "say", "her", 
+                "she", "or", "an", "will", "my", "one", "all", "would", "there", 
+                "their", "what", "so", "up", "out", "if", "about", "who", "get", 
+                "which", "go", "me", "https", "http", "com", "www", "github", 
+                "slack", "drive", "google", "feat", "fix", "chore", "docs", "refactor",
+                "merge", "branch", "pull", "request", "update", "delete", "create",
+                "add", "remove", "test", "main", "master", "dev", "prod", "is", "are", "was"
+            ])
+            
+            words = []
+            for text in all_texts:
+                # Remove URLs and special chars
+                clean_text = re.sub(r'http\S+', '', str(text))
+                clean_text = re.sub(r'[^\w\s]', '', clean_text)
+                tokens = clean_text.lower().split()
+                words.extend([w for w in tokens if w not in stopwords and len(w) > 2])
+            
+            # Get top 30
+            common_words = Counter(words).most_common(30)
+            top_keywords = [{"text": word, "value": count} for word, count in common_words]
+
+        _keywords_cache["keywords"] = top_keywords
+        _keywords_cache["expires_at"] = datetime.utcnow() + KEYWORDS_TTL
+            
+    except Exception as e:
+        logger.warning(f"Failed to extract keywords: {e}")
+
+    return top_keywords
+
+
 @router.get("/summary")
 async def get_app_stats(request: Request, _admin: str = Depends(require_admin)):
     """
@@ -35,7 +115,7 @@ async def get_app_stats(request: Request, _admin: str = Depends(require_admin)):
     
     Returns:
         Comprehensive statistics including:
-        - Total documents (accurate count from MongoDB)
+        - Total documents (estimated from collection metadata)
         - Total members
         - Total projects
         - Activity breakdown by source
@@ -47,14 +127,14 @@ async def get_app_stats(request: Request, _admin: str = Depends(require_admin)):
         db = mongo.async_db
         shared_db = mongo.shared_async_db
         
-        # 1. Get accurate document counts from MongoDB collections
+        # 1. Get document counts from collection metadata (no collection scans)
         collections_info = []
         collection_names = await db.list_collection_names()
         
         for name in collection_names:
             try:
                 collection = db[name]
-                count = await collection.count_documents({})
+                count = await collection.estimated_document_count()
                 collections_info.append({
                     "name": name,
                     "count": count,
@@ -69,7 +149,7 @@ async def get_app_stats(request: Request, _admin: str = Depends(require_admin)):
             for name in shared_collection_names:
                 try:
                     collection = shared_db[name]
-                    count = await collection.count_documents({})
+                    count = await collection.estimated_document_count()
                     collections_info.append({
                         "name": f"shared.{name}",
                         "count": count,
@@ -82,13 +162,12 @@ async def get_app_stats(request: Request, _admin: str = Depends(require_admin)):
         
         # Add gemini database collections
         try:
-            from backend.api.v1.ai_processed import get_gemini_db
-            gemini_db_sync = get_gemini_db()
-            gemini_collection_names = gemini_db_sync.list_collection_names()
+            gemini_db = mongo.gemini_async_db
+            gemini_collection_names = await gemini_db.list_collection_names()
             for name in gemini_collection_names:
                 try:
-                    collection = gemini_db_sync[name]
-                    count = collection.count_documents({})
+                    collection = gemini_db[name]
+                    count = await collection.estimated_document_count()
                     collections_info.append({
                         "name": f"gemini.{name}",
                         "count": count,
@@ -99,6 +178,8 @@ async def get_app_stats(request: Request, _admin: str = Depends(require_admin)):
         except Exception as e:
             logger.warning(f"Failed to access gemini database: {e}")
         
+        collection_counts = {c["name"]: c["count"] for c in collections_info}
+        
         # Calculate totals
         total_documents = sum(c["count"] for c in collections_info)
         total_collections = len(collections_info)
@@ -124,9 +205,9 @@ async def get_app_stats(request: Request, _admin: str = Depends(require_admin)):
         activity_summary = {}
         
         # GitHub
-        github_commits = await db["github_commits"].count_documents({})
-        github_prs = await db["github_pull_requests"].count_documents({})
-        github_issues = await db["github_issues"].count_documents({})
+        github_commits = collection_counts.get("github_commits", 0)
+        github_prs = collection_counts.get("github_pull_requests", 0)
+        github_issues = collection_counts.get("github_issues", 0)
         github_total = github_commits + github_prs + github_issues
         
         if github_total > 0:
@@ -152,7 +233,7 @@ async def get_app_stats(request: Request, _admin: str = Depends(require_admin)):
             }
         
         # Notion (using diff tracking data - collected every minute)
-        notion_diffs = await db["notion_content_diffs"].count_documents({})
+        notion_diffs = collection_counts.get("notion_content_diffs", 0)
         if notion_diffs > 0:
             activity_summary["notion"] = {
                 "total_activities": notion_diffs,
@@ -162,7 +243,7 @@ async def get_app_stats(request: Request, _admin: str = Depends(require_admin)):
             }
         
         # Drive
-        drive_activities = await db["drive_activities"].count_documents({})
+        drive_activities = collection_counts.get("drive_activities", 0)
         if drive_activities > 0:
             activity_summary["drive"] = {
                 "total_activities": drive_activities,
@@ -172,7 +253,7 @@ async def get_app_stats(request: Request, _admin: str = Depends(require_admin)):
             }
         
         # Recordings
-        recordings = await shared_db["recordings"].count_documents({})
+        recordings = collection_counts.get("shared.recordings", 0)
         if recordings > 0:
             activity_summary["recordings"] = {
                 "total_activities": recordings,
@@ -181,216 +262,42 @@ async def get_app_stats(request: Request, _admin: str = Depends(require_admin)):
                 }
             }
         
-        # 5. Get code changes statistics (additions + deletions from github_commits)
+        # 5-6. Code changes and daily trends from the precomputed daily rollups
+        end_date = datetime.utcnow()
+        start_date = end_date - timedelta(days=90)
         code_changes = {
             "total": {"additions": 0, "deletions": 0},
             "daily": [],
             "weekly": []
         }
-        try:
-            end_date = datetime.utcnow()
-            start_date = end_date - timedelta(days=90)
-
-            # Total code changes (last 90 days)
-            total_pipeline = [
-                {"$match": {"date": {"$gte": start_date}}},
-                {"$group": {
-                    "_id": None,
-                    "additions": {"$sum": {"$ifNull": ["$additions", 0]}},
-                    "deletions": {"$sum": {"$ifNull": ["$deletions", 0]}}
-                }}
-            ]
-            total_result = await db["github_commits"].aggregate(total_pipeline).to_list(1)
-            if total_result:
-                code_changes["total"]["additions"] = total_result[0].get("additions", 0)
-                code_changes["total"]["deletions"] = total_result[0].get("deletions", 0)
-
-            # Daily code changes (last 30 days for chart)
-            daily_start = end_date - timedelta(days=30)
-            daily_pipeline = [
-                {"$match": {"date": {"$gte": daily_start}}},
-                {"$group": {
-                    "_id": {"$dateToString": {"format": "%Y-%m-%d", "date": "$date"}},
-                    "additions": {"$sum": {"$ifNull": ["$additions", 0]}},
-                    "deletions": {"$sum": {"$ifNull": ["$deletions", 0]}}
-                }},
-                {"$sort": {"_id": 1}}
-            ]
-            daily_result = await db["github_commits"].aggregate(daily_pipeline).to_list(None)
-
-            # Fill missing days with zeros
-            daily_map = {}
-            current = daily_start
-            while current <= end_date:
-                d = current.strftime("%Y-%m-%d")
-                daily_map[d] = {"date": d, "additions": 0, "deletions": 0}
-                current += timedelta(days=1)
-
-            for doc in daily_result:
-                if doc["_id"] in daily_map:
-                    daily_map[doc["_id"]]["additions"] = doc["additions"]
-                    daily_map[doc["_id"]]["deletions"] = doc["deletions"]
-
-            code_changes["daily"] = sorted(daily_map.values(), key=lambda x: x["date"])
-
-            # Weekly code changes (last 12 weeks)
-            weekly_start = end_date - timedelta(weeks=12)
-            weekly_pipeline = [
-                {"$match": {"date": {"$gte": weekly_start}}},
-                {"$group": {
-                    "_id": {"$dateToString": {"format": "%Y-%V", "date": "$date"}},
-                    "additions": {"$sum": {"$ifNull": ["$additions", 0]}},
-                    "deletions": {"$sum": {"$ifNull": ["$deletions", 0]}}
-                }},
-                {"$sort": {"_id": 1}}
-            ]
-            weekly_result = await db["github_commits"].aggregate(weekly_pipeline).to_list(None)
-            code_changes["weekly"] = [
-                {"week": doc["_id"], "additions": doc["additions"], "deletions": doc["deletions"]}
-                for doc in weekly_result
-            ]
-
-        except Exception as e:
-            logger.warning(f"Failed to get code changes stats: {e}")
-
-        # 6. Get daily activity trends
         daily_trends = []
         try:
-            # Last 90 days
-            end_date = datetime.utcnow()
-            start_date = end_date - timedelta(days=90)
-            
-            # Helper for aggregation
-            async def get_daily_counts(collection_name, date_field):
-                try:
-                    coll = db[collection_name]
-                    pipeline = [
-                        {
-                            "$match": {
-                                date_field: {"$gte": start_date}
-                            }
-                        },
-                        {
-                            "$group": {
-                                "_id": {
-                                    "$dateToString": {
-                                        "format": "%Y-%m-%d", 
-                                        "date": f"${date_field}"
-                                    }
-                                },
-                                "count": {"$sum": 1}
-                            }
-                        },
-                        {"$sort": {"_id": 1}}
-                    ]
-                    result = await coll.aggregate(pipeline).to_list(None)
-                    return {doc["_id"]: doc["count"] for doc in result if doc["_id"] is not None}
-                except Exception as e:
-                    logger.warning(f"Trend aggregation failed for {collection_name}: {e}")
-                    return {}
-
-            # Execute aggregations
-            github_trend = await get_daily_counts("github_commits", "date")
-            slack_trend = await get_daily_counts("slack_messages", "posted_at")
-            notion_trend = await get_daily_counts("notion_content_diffs", "timestamp")  # Use diff tracking
-            drive_trend = await get_daily_counts("drive_activities", "time")
-            
-            # Initialize map with 0s for all dates in range
-            trend_map = {}
-            current = start_date
-            while current <= end_date:
-                d = current.strftime("%Y-%m-%d")
-                trend_map[d] = {
-                    "date": d, 
-                    "github": 0, 
-                    "slack": 0, 
-                    "notion": 0, 
-                    "drive": 0
-                }
-                current += timedelta(days=1)
-                
-            # Fill data
-            for date_str, count in github_trend.items():
-                if date_str in trend_map: trend_map[date_str]["github"] = count
-            for date_str, count in slack_trend.items():
-                if date_str in trend_map: trend_map[date_str]["slack"] = count
-            for date_str, count in notion_trend.items():
-                if date_str in trend_map: trend_map[date_str]["notion"] = count
-            for date_str, count in drive_trend.items():
-                if date_str in trend_map: trend_map[date_str]["drive"] = count
-                
-            daily_trends = sorted(trend_map.values(), key=lambda x: x["date"])
-            
-        except Exception as e:
-            logger.error(f"Failed to generate daily trends: {e}")
+            totals = await load_daily_totals(db, start_date, end_date)
+
+            code_changes = summarize_code_changes(totals, end_date)
+
+            for date_str in daily_range(start_date, end_date):
+                day = totals.get(date_str, {})
+                daily_trends.append({
+                    "date": date_str,
+                    "github": day.get("github", {}).get("by_type", {}).get("commit", 0),
+                    "slack": day.get("slack", {}).get("count", 0),
+                    "notion": day.get("notion", {}).get("count", 0),
+                    "drive": day.get("drive", {}).get("count", 0)
+                })
 
-        # 6. Get context keywords
-        top_keywords = []
-        try:
-            # Recent 7 days for context
-            keyword_start_date = datetime.utcnow() - timedelta(days=7)
-            
-            # Helper to fetch text from collection
-            async def get_recent_texts(collection_name, text_field, date_field):
-                try:
-                    coll = db[collection_name]
-                    cursor = coll.find(
-                        {date_field: {"$gte": keyword_start_date}},
-                        {text_field: 1, "_id": 0}
-                    ).sort(date_field, -1).limit(200) # Limit to 200 documents per source
-                    
-                    texts = []
-                    async for doc in cursor:
-                        if text_field in doc and doc[text_field]:
-                            texts.append(doc[text_field])
-                    return texts
-                except Exception:
-                    return []
-            
-            # Fetch texts
-            github_texts = await get_recent_texts("github_commits", "message", "date")
-            slack_texts = await get_recent_texts("slack_messages", "text", "posted_at")
-            notion_texts = await get_recent_texts("notion_content_diffs", "page_title", "timestamp")  # Use diff tracking
-            # drive_texts = await get_recent_texts("drive_activities", "title", "time") # Re-enable if possible, but title might be missing
-            
-            all_texts = github_texts + slack_texts + notion_texts
-            
-            # Simple keyword extraction
-            if all_texts:
-                # Basic stopwords
-                stopwords = set([
-                    "the", "be", "to", "of", "and", "a", "in", "that", "have", "i", 
-                    "it", "for", "not", "on", "with", "he", "as", "you", "do", "at", 
-                    "this", "but", "his", "by", "from", "they", "we", "say", "her", 
-                    "she", "or", "an", "will", "my", "one", "all", "would", "there", 
-                    "their", "what", "so", "up", "out", "if", "about", "who", "get", 
-                    "which", "go", "me", "https", "http", "com", "www", "github", 
-                    "slack", "drive", "google", "feat", "fix", "chore", "docs", "refactor",
-                    "merge", "branch", "pull", "request", "update", "delete", "create",
-                    "add", "remove", "test", "main", "master", "dev", "prod", "is", "are", "was"
-                ])
-                
-                words = []
-                for text in all_texts:
-                    # Remove URLs and special chars
-                    clean_text = re.sub(r'http\S+', '', str(text))
-                    clean_text = re.sub(r'[^\w\s]', '', clean_text)
-                    tokens = clean_text.lower().split()
-                    words.extend([w for w in tokens if w not in stopwords and len(w) > 2])
-                
-                # Get top 30
-                common_words = Counter(words).most_common(30)
-                top_keywords = [{"text": word, "value": count} for word, count in common_words]
-                
         except Exception as e:
-            logger.warning(f"Failed to extract keywords: {e}")
+            logger.error(f"Failed to load daily activity rollups: {e}")
+
+        # 6. Get context keywords (cached for KEYWORDS_TTL)
+        top_keywords = await get_top_keywords(db)
 
         # 7. Get last collection times (based on collector execution, not data timestamps)
         # This shows when the collector last ran, regardless of whether it found data
         last_collected = {}
         
         # Check if collection_status exists (for new tracking system)
-        collection_names_list = await db.list_collection_names()
+        collection_names_list = collection_names
         has_collection_status = 'collection_status' in collection_names_list
         
         # For Notion, always use notion_content_diffs timestamp since it's collected every minute
@@ -10,6 +10,7 @@ Used by:
 - /projects/[key] page (project activities)
 """
 
+import re
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
 import strawberry
@@ -140,7 +141,7 @@ def build_github_commits_query(
     
     # Filter by keyword (message)
     if keyword:
-        query['message'] = {'$regex': keyword, '$options': 'i'}
+        query['message'] = {'$regex': re.escape(keyword), '$options': 'i'}
     
     # Date range
     if start_date:
@@ -175,8 +176,8 @@ def build_github_prs_query(
     # Filter by keyword (title or body)
     if keyword:
         query['$or'] = [
-            {'title': {'$regex': keyword, '$options': 'i'}},
-            {'body': {'$regex': keyword, '$options': 'i'}}
+            {'title': {'$regex': re.escape(keyword), '$options': 'i'}},
+            {'body': {'$regex': re.escape(keyword), '$options': 'i'}}
         ]
     
     # Date range
@@ -212,8 +213,8 @@ def build_github_issues_query(
     # Filter by keyword (title or body)
     if keyword:
         query['$or'] = [
-            {'title': {'$regex': keyword, '$options': 'i'}},
-            {'body': {'$regex': keyword, '$options': 'i'}}
+            {'title': {'$regex': re.escape(keyword), '$options': 'i'}},
+            {'body': {'$regex': re.escape(keyword), '$options': 'i'}}
         ]
     
     # Date range
@@ -249,7 +250,7 @@ def build_slack_query(
         if slack_ids:
             query['$or'] = [
                 {'user_id': {'$in': slack_ids}},
-                {'user_name': {'$regex': f'^{member_name}$', '$options': 'i'}}
+                {'user_name': {'$regex': f'^{re.escape(member_name)}$', '$options': 'i'}}
             ]
     
     # Filter by keyword (text content)
@@ -259,10 +260,10 @@ def build_slack_query(
             existing_or = query.pop('$or')
             query['$and'] = [
                 {'$or': existing_or},
-                {'text': {'$regex': keyword, '$options': 'i'}}
+                {'text': {'$regex': re.escape(keyword), '$options': 'i'}}
             ]
         else:
-            query['text'] = {'$regex': keyword, '$options': 'i'}
+            query['text'] = {'$regex': re.escape(keyword), '$options': 'i'}
     
     # Date range
     if start_date:
@@ -308,7 +309,7 @@ def build_notion_query(
     # Filter by keyword (title)
     if keyword:
         and_conditions.append({
-            'title': {'$regex': keyword, '$options': 'i'}
+            'title': {'$regex': re.escape(keyword), '$options': 'i'}
         })
     
     # Combine all AND conditions
@@ -347,7 +348,7 @@ def build_drive_query(
     
     # Filter by keyword (title)
     if keyword:
-        query['title'] = {'$regex': keyword, '$options': 'i'}
+        query['title'] = {'$regex': re.escape(keyword), '$options': 'i'}
     
     # Date range
     if start_date:
@@ -382,12 +383,12 @@ def build_recordings_query(
         if keyword:
             query['$and'] = [
                 {'name': project_name_pattern},
-                {'name': {'$regex': keyword, '$options': 'i'}}
+                {'name': {'$regex': re.escape(keyword), '$options': 'i'}}
             ]
         else:
             query['name'] = project_name_pattern
     elif keyword:
-        query['name'] = {'$regex': keyword, '$options': 'i'}
+        query['name'] = {'$regex': re.escape(keyword), '$options': 'i'}
     
     # Filter by member using gemini.recordings participants
     if member_name and gemini_db:
@@ -398,18 +399,18 @@ def build_recordings_query(
             
             # Build participant query (participants is a string array)
             participant_query = {
-                'participants': {'$regex': f'\\b{member_name}\\b', '$options': 'i'}
+                'participants': {'$regex': f'\\b{re.escape(member_name)}\\b', '$options': 'i'}
             }
             
             # Add recording_name patterns
             if recording_names:
                 or_conditions = [
-                    {'participants': {'$regex': f'\\b{member_name}\\b', '$options': 'i'}}
+                    {'participants': {'$regex': f'\\b{re.escape(member_name)}\\b', '$options': 'i'}}
                 ]
                 for rec_name in recording_names:
                     if rec_name:
                         or_conditions.append(
-                            {'participants': {'$regex': f'\\b{rec_name}\\b', '$options': 'i'}}
+                            {'participants': {'$regex': f'\\b{re.escape(rec_name)}\\b', '$options': 'i'}}
                         )
                 participant_query = {'$or': or_conditions}
             
@@ -451,17 +452,17 @@ def build_recordings_query(
             print(f"⚠️  Error querying gemini.recordings for participants: {e}")
             # Fallback to old method (created_by and name only)
             or_conditions = [
-                {'created_by': {'$regex': f'^{member_name}$', '$options': 'i'}},
-                {'created_by': {'$regex': f'\\b{member_name}\\b', '$options': 'i'}},
-                {'name': {'$regex': f'\\b{member_name}\\b', '$options': 'i'}}
+                {'created_by': {'$regex': f'^{re.escape(member_name)}$', '$options': 'i'}},
+                {'created_by': {'$regex': f'\\b{re.escape(member_name)}\\b', '$options': 'i'}},
+                {'name': {'$regex': f'\\b{re.escape(member_name)}\\b', '$options': 'i'}}
             ]
             
             for rec_name in recording_names:
                 if rec_name:
                     or_conditions.extend([
-                        {'created_by': {'$regex': f'^{rec_name}$', '$options': 'i'}},
-                        {'created_by': {'$regex': f'\\b{rec_name}\\b', '$options': 'i'}},
-                        {'name': {'$regex': f'\\b{rec_name}\\b', '$options': 'i'}}
+                        {'created_by': {'$regex': f'^{re.escape(rec_name)}$', '$options': 'i'}},
+                        {'created_by': {'$regex': f'\\b{re.escape(rec_name)}\\b', '$options': 'i'}},
+                        {'name': {'$regex': f'\\b{re.escape(rec_name)}\\b', '$options': 'i'}}
                     ])
             
             # Combine with keyword filter if exists
@@ -494,15 +495,15 @@ def build_recordings_daily_query(
         recording_names = member_identifiers.get('recordings', []) if member_identifiers else []
         
         or_conditions = [
-            {'analysis.participants.name': {'$regex': f'^{member_name}$', '$options': 'i'}},
-            {'analysis.participants.name': {'$regex': f'\\b{member_name}\\b', '$options': 'i'}}
+            {'analysis.participants.name': {'$regex': f'^{re.escape(member_name)}$', '$options': 'i'}},
+            {'analysis.participants.name': {'$regex': f'\\b{re.escape(member_name)}\\b', '$options': 'i'}}
         ]
         
         for rec_name in recording_names:
             if rec_name:
                 or_conditions.extend([
-                    {'analysis.participants.name': {'$regex': f'^{rec_name}$', '$options': 'i'}},
-                    {'analysis.participants.name': {'$regex': f'\\b{rec_name}\\b', '$options': 'i'}}
+                    {'analysis.participants.name': {'$regex': f'^{re.escape(rec_name)}$', '$options': 'i'}},
+                    {'analysis.participants.name': {'$regex': f'\\b{re.escape(rec_name)}\\b', '$options': 'i'}}
                 ])
         
         query['$or'] = or_conditions
@@ -513,10 +514,10 @@ def build_recordings_daily_query(
             existing_or = query.pop('$or')
             query['$and'] = [
                 {'$or': existing_or},
-                {'analysis.summary.overview': {'$regex': keyword, '$options': 'i'}}
+                {'analysis.summary.overview': {'$regex': re.escape(keyword), '$options': 'i'}}
             ]
         else:
-            query['analysis.summary.overview'] = {'$regex': keyword, '$options': 'i'}
+            query['analysis.summary.overview'] = {'$regex': re.escape(keyword), '$options': 'i'}
     
     # Date range (target_date field)
     if start_date:
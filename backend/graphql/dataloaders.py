@@ -2,105 +2,174 @@
 GraphQL DataLoaders
 
 Implements batch loading to prevent N+1 query problems.
+
+``create_dataloaders`` builds a fresh registry for every request (it is
+called from the GraphQL context getter), so loader caches never leak between
+requests. Every nested resolver of ``Member`` and ``Project`` goes through a
+loader: a query such as
+
+    query { members { activityStats { totalActivities } recentActivities { id }
+                      topCollaborators { memberName } } }
+
+costs the same, constant number of round trips for one member or for the
+whole team.
+
+Identity resolution is a loader too (``member_identities``); the batch
+functions join result documents back to members through a ``MemberLookup``
+(dict indexes) instead of scanning every member per document.
 """
 
-from typing import List, Dict, Any
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional, Tuple
 from collections import defaultdict
+
+from bson import ObjectId
 from strawberry.dataloader import DataLoader
 
+from src.core.collaboration_store import DAILY_COLLECTION
+from src.core.identity_index import MemberLookup, identity_cache, member_identifiers
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Slack channel that must never count towards project / member activity feeds
+EXCLUDED_SLACK_CHANNEL = "tokamak-partners"
+
+# Profile fields filled from member_identifiers when the member doc lacks them
+PROFILE_IDENTIFIER_FIELDS = {
+    "github": "github_username",
+    "slack": "slack_id",
+    "notion": "notion_id",
+}
+
+
+async def _aggregate(collection, pipeline: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return await collection.aggregate(pipeline).to_list(length=None)
+
+
+async def _group_by(
+    collection,
+    field: str,
+    values: List[str],
+    accumulators: Optional[Dict[str, Any]] = None,
+    match: Optional[Dict[str, Any]] = None,
+    group_id: Any = None,
+) -> List[Dict[str, Any]]:
+    """``$match`` on ``field $in values`` then ``$group`` (by ``field`` by default)"""
+    if not values:
+        return []
+    return await _aggregate(
+        collection,
+        [
+            {"$match": {field: {"$in": values}, **(match or {})}},
+            {
+                "$group": {
+                    "_id": group_id if group_id is not None else f"${field}",
+                    **(accumulators or {"count": {"$sum": 1}}),
+                }
+            },
+        ],
+    )
+
+
+async def load_member_identities_batch(keys: List[str], db) -> List[Dict[str, List[str]]]:
+    """
+    Batch resolve the identifiers of multiple members.
+
+    The identity index is cached per process, so this costs one ``members``
+    query per request.
+
+    Args:
+        keys: List of member names
+        db: MongoDB async database instance
+
+    Returns:
+        ``{source: [identifiers]}`` per member, in the same order as keys
+    """
+    index = await identity_cache.get_async(db)
+    docs = {}
+    async for doc in db["members"].find(
+        {"name": {"$in": list(keys)}}, {"name": 1, "github_id": 1, "github_username": 1, "email": 1}
+    ):
+        docs.setdefault(doc.get("name"), doc)
+    return [member_identifiers(index, key, docs.get(key)) for key in keys]
+
+
+async def _member_lookup(names: List[str], db, identities: Optional[DataLoader] = None) -> MemberLookup:
+    """MemberLookup for a batch, through the request's identity loader if available"""
+    names = list(dict.fromkeys(names))
+    if identities is not None:
+        per_member = await identities.load_many(names)
+    else:
+        per_member = await load_member_identities_batch(names, db)
+    return MemberLookup(dict(zip(names, per_member)))
+
+
+async def load_profile_identifiers_batch(keys: List[str], db) -> List[Dict[str, str]]:
+    """
+    Batch load profile identifiers (github_username, slack_id, notion_id).
+
+    Used by the ``members`` / ``member`` root resolvers to fill fields missing
+    from the member document with one ``member_identifiers`` query.
+
+    Args:
+        keys: List of member names
+        db: MongoDB async database instance
+
+    Returns:
+        ``{field: identifier}`` per member, in the same order as keys
+    """
+    profiles: Dict[str, Dict[str, str]] = {key: {} for key in keys}
+    async for doc in db["member_identifiers"].find(
+        {"member_name": {"$in": list(keys)}, "source": {"$in": list(PROFILE_IDENTIFIER_FIELDS)}},
+        {"member_name": 1, "source": 1, "identifier_type": 1, "identifier_value": 1},
+    ):
+        source = doc.get("source")
+        if source == "github" and doc.get("identifier_type") != "username":
+            continue
+        profile = profiles.get(doc.get("member_name"))
+        if profile is not None and doc.get("identifier_value"):
+            profile.setdefault(PROFILE_IDENTIFIER_FIELDS[source], doc["identifier_value"])
+    return [profiles[key] for key in keys]
+
 
 async def load_activity_counts_batch(
     keys: List[str],
-    db
+    db,
+    identities: Optional[DataLoader] = None,
 ) -> List[int]:
     """
     Batch load activity counts for multiple members.
-    
+
     Instead of:
         query { members { activityCount } }  # N+1 queries
-    
+
     Does:
         query { members { activityCount } }  # 2 queries (1 for members, 1 batch for counts)
-    
+
     Args:
         keys: List of member names
         db: MongoDB async database instance
-        
+        identities: The request's ``member_identities`` loader
+
     Returns:
         List of activity counts in same order as keys
     """
     logger.info(f"📦 DataLoader: Batch loading activity counts for {len(keys)} members")
-    
-    # Initialize counts for all members
+
+    lookup = await _member_lookup(keys, db, identities)
     counts: Dict[str, int] = {key: 0 for key in keys}
-    
-    # Get member mappings (name -> github_id, slack_username, email, etc.)
-    member_mappings = {}
-    async for member_doc in db['members'].find({'name': {'$in': keys}}):
-        name = member_doc.get('name')
-        member_mappings[name] = {
-            'github_id': member_doc.get('github_id'),
-            'github_username': member_doc.get('github_username'),
-            'email': member_doc.get('email'),
-        }
-    
-    # Build list of GitHub IDs and Slack usernames to query
-    github_ids = [m.get('github_id') or m.get('github_username') for m in member_mappings.values() if m.get('github_id') or m.get('github_username')]
-    slack_usernames = [name.lower() for name in keys]  # Slack uses lowercase names
-    
-    logger.info(f"   GitHub IDs: {github_ids}")
-    logger.info(f"   Slack usernames: {slack_usernames}")
-    
-    # Batch query for GitHub commits
-    pipeline = [
-        {'$match': {'author_name': {'$in': github_ids}}},
-        {'$group': {'_id': '$author_name', 'count': {'$sum': 1}}}
-    ]
-    async for doc in db['github_commits'].aggregate(pipeline):
-        # Map GitHub ID back to member name
-        github_id = doc['_id']
-        for name, mapping in member_mappings.items():
-            if mapping.get('github_id') == github_id or mapping.get('github_username') == github_id:
-                counts[name] += doc['count']
-                break
-    
-    # Batch query for GitHub PRs
-    pipeline = [
-        {'$match': {'author': {'$in': github_ids}}},
-        {'$group': {'_id': '$author', 'count': {'$sum': 1}}}
-    ]
-    async for doc in db['github_pull_requests'].aggregate(pipeline):
-        # Map GitHub ID back to member name
-        github_id = doc['_id']
-        for name, mapping in member_mappings.items():
-            if mapping.get('github_id') == github_id or mapping.get('github_username') == github_id:
-                counts[name] += doc['count']
-                break
-    
-    # Batch query for Slack messages
-    pipeline = [
-        {'$match': {'user_name': {'$in': slack_usernames}}},
-        {'$group': {'_id': '$user_name', 'count': {'$sum': 1}}}
-    ]
-    async for doc in db['slack_messages'].aggregate(pipeline):
-        # Map Slack username back to member name (case-insensitive)
-        slack_username = doc['_id']
-        for name in keys:
-            if name.lower() == slack_username.lower():
-                counts[name] += doc['count']
-                break
-    
-    # Batch query for Notion pages (uses member names directly)
-    pipeline = [
+    github_ids = lookup.identifiers("github")
+
+    # Notion pages count for the creator, else for the last editor
+    notion_names = lookup.identifiers("notion")
+    notion_pipeline = [
         {
             '$match': {
                 '$or': [
-                    {'created_by.name': {'$in': keys}},
-                    {'last_edited_by.name': {'$in': keys}}
+                    {'created_by.name': {'$in': notion_names}},
+                    {'last_edited_by.name': {'$in': notion_names}}
                 ]
             }
         },
@@ -108,7 +177,7 @@ async def load_activity_counts_batch(
             '$project': {
                 'member': {
                     '$cond': [
-                        {'$in': ['$created_by.name', keys]},
+                        {'$in': ['$created_by.name', notion_names]},
                         '$created_by.name',
                         '$last_edited_by.name'
                     ]
@@ -117,202 +186,138 @@ async def load_activity_counts_batch(
         },
         {'$group': {'_id': '$member', 'count': {'$sum': 1}}}
     ]
-    async for doc in db['notion_pages'].aggregate(pipeline):
-        if doc['_id']:
-            counts[doc['_id']] += doc['count']
-    
-    # Batch query for Drive activities (uses actor_name which might be email or name)
-    # Try both member names and emails
-    all_identifiers = list(keys)
-    for mapping in member_mappings.values():
-        if mapping.get('email'):
-            all_identifiers.append(mapping['email'])
-    
-    pipeline = [
-        {'$match': {'actor_name': {'$in': all_identifiers}}},
-        {'$group': {'_id': '$actor_name', 'count': {'$sum': 1}}}
-    ]
-    async for doc in db['drive_activities'].aggregate(pipeline):
-        actor = doc['_id']
-        # Try to match by name first, then by email
-        if actor in counts:
-            counts[actor] += doc['count']
-        else:
-            # Try to find member by email
-            for name, mapping in member_mappings.items():
-                if mapping.get('email') == actor:
-                    counts[name] += doc['count']
-                    break
-    
+
+    commits, prs, messages, pages, drive = await asyncio.gather(
+        _group_by(db['github_commits'], 'author_name', github_ids),
+        _group_by(db['github_pull_requests'], 'author', github_ids),
+        _group_by(db['slack_messages'], 'user_name', lookup.identifiers("slack")),
+        _aggregate(db['notion_pages'], notion_pipeline),
+        _group_by(db['drive_activities'], 'actor_name', lookup.identifiers("drive")),
+    )
+
+    for source, groups in (
+        ("github", commits), ("github", prs), ("slack", messages), ("notion", pages), ("drive", drive)
+    ):
+        for doc in groups:
+            member = lookup.member(source, doc['_id'])
+            if member:
+                counts[member] += doc['count']
+
     # Return counts in same order as keys
     result = [counts[key] for key in keys]
-    
+
     logger.info(
         f"✅ DataLoader: Loaded {len(keys)} activity counts "
         f"(total: {sum(result)} activities)"
     )
-    logger.info(f"   Individual counts: {dict(zip(keys, result))}")
-    
+    logger.debug(f"   Individual counts: {dict(zip(keys, result))}")
+
     return result
 
 
 async def load_recent_activities_batch(
     keys: List[tuple],  # (member_name, limit, source_type)
-    db
+    db,
+    identities: Optional[DataLoader] = None,
 ) -> List[List[Any]]:
     """
     Batch load recent activities for multiple members.
-    
+
     Args:
         keys: List of (member_name, limit, source_type) tuples
         db: MongoDB async database instance
-        
+        identities: The request's ``member_identities`` loader
+
     Returns:
         List of activity lists in same order as keys
     """
-    from .types import Activity, SourceType
-    
+    from .types import Activity
+
     logger.info(f"📦 DataLoader: Batch loading activities for {len(keys)} requests")
-    logger.debug(f"   Member names: {list(set(key[0] for key in keys))}")
-    
-    # Group by member name for efficient querying
-    member_names = list(set(key[0] for key in keys))
-    
-    # Get member mappings (name -> github_id, slack_id, etc.)
-    member_mappings = {}
-    async for member_doc in db['members'].find({'name': {'$in': member_names}}):
-        name = member_doc.get('name')
-        member_mappings[name] = {
-            'github_id': member_doc.get('github_id'),
-            'github_username': member_doc.get('github_username'),
-            'slack_id': member_doc.get('slack_id'),
-            'slack_username': member_doc.get('slack_username'),
-            'email': member_doc.get('email'),
-        }
-    
-    # Build list of GitHub IDs and Slack usernames to query
-    github_ids = [m.get('github_id') or m.get('github_username') for m in member_mappings.values() if m.get('github_id') or m.get('github_username')]
-    slack_usernames = [name.lower() for name in member_names]  # Slack uses lowercase names
-    
+
+    lookup = await _member_lookup([key[0] for key in keys], db, identities)
+    github_ids = lookup.identifiers("github")
+
     # Fetch all activities for these members
     all_activities: Dict[str, List] = defaultdict(list)
-    
+
     # GitHub commits
-    commit_count = 0
-    
     try:
         cursor = db['github_commits'].find(
             {'author_name': {'$in': github_ids}}
         ).sort('date', -1).limit(1000)
-        
+
         async for doc in cursor:
-            author_github_id = doc.get('author_name')
+            member_name = lookup.member("github", doc.get('author_name'))
             timestamp = doc.get('date')
-            if author_github_id and timestamp:
-                # Map GitHub ID back to member name
-                member_name = None
-                for name, mapping in member_mappings.items():
-                    if mapping.get('github_id') == author_github_id or mapping.get('github_username') == author_github_id:
-                        member_name = name
-                        break
-                
-                if member_name:
-                    all_activities[member_name].append(Activity(
-                        id=str(doc['_id']),
-                        member_name=member_name,
-                        source_type='github',
-                        activity_type='commit',
-                        timestamp=timestamp,
-                        metadata={
-                            'sha': doc.get('sha'),
-                            'message': doc.get('message'),
-                            'repository': doc.get('repository'),
-                            'url': doc.get('url')
-                        }
-                    ))
-                    commit_count += 1
-        
-        logger.debug(f"   Found {commit_count} GitHub commits")
+            if member_name and timestamp:
+                all_activities[member_name].append(Activity(
+                    id=str(doc['_id']),
+                    member_name=member_name,
+                    source_type='github',
+                    activity_type='commit',
+                    timestamp=timestamp,
+                    metadata={
+                        'sha': doc.get('sha'),
+                        'message': doc.get('message'),
+                        'repository': doc.get('repository'),
+                        'url': doc.get('url')
+                    }
+                ))
     except Exception as e:
         logger.error(f"   Error querying GitHub commits: {e}")
-    
+
     # GitHub PRs
-    pr_count = 0
-    
     try:
         async for doc in db['github_pull_requests'].find(
             {'author': {'$in': github_ids}}
         ).sort('created_at', -1).limit(1000):
-            author_github_id = doc.get('author')
+            member_name = lookup.member("github", doc.get('author'))
             timestamp = doc.get('created_at')
-            if author_github_id and timestamp:
-                # Map GitHub ID back to member name
-                member_name = None
-                for name, mapping in member_mappings.items():
-                    if mapping.get('github_id') == author_github_id or mapping.get('github_username') == author_github_id:
-                        member_name = name
-                        break
-                
-                if member_name:
-                    all_activities[member_name].append(Activity(
-                        id=str(doc['_id']),
-                        member_name=member_name,
-                        source_type='github',
-                        activity_type='pull_request',
-                        timestamp=timestamp,
-                        metadata={
-                            'title': doc.get('title'),
-                            'repository': doc.get('repository'),
-                            'url': doc.get('url')
-                        }
-                    ))
-                    pr_count += 1
-        
-        logger.debug(f"   Found {pr_count} GitHub PRs")
+            if member_name and timestamp:
+                all_activities[member_name].append(Activity(
+                    id=str(doc['_id']),
+                    member_name=member_name,
+                    source_type='github',
+                    activity_type='pull_request',
+                    timestamp=timestamp,
+                    metadata={
+                        'title': doc.get('title'),
+                        'repository': doc.get('repository'),
+                        'url': doc.get('url')
+                    }
+                ))
     except Exception as e:
         logger.error(f"   Error querying GitHub PRs: {e}")
-    
+
     # Slack messages
-    slack_count = 0
-    
     try:
         async for doc in db['slack_messages'].find({
-            'user_name': {'$in': slack_usernames},
-            'channel_name': {'$ne': 'tokamak-partners'}  # Exclude private channel
+            'user_name': {'$in': lookup.identifiers("slack")},
+            'channel_name': {'$ne': EXCLUDED_SLACK_CHANNEL}  # Exclude private channel
         }).sort('posted_at', -1).limit(1000):
-            slack_username = doc.get('user_name')
+            member_name = lookup.member("slack", doc.get('user_name'))
             timestamp = doc.get('posted_at')
-            if slack_username and timestamp:
-                # Map Slack username back to member name (case-insensitive)
-                member_name = None
-                for name in member_names:
-                    if name.lower() == slack_username.lower():
-                        member_name = name
-                        break
-                
-                if member_name:
-                    all_activities[member_name].append(Activity(
-                        id=str(doc['_id']),
-                        member_name=member_name,
-                        source_type='slack',
-                        activity_type='message',
-                        timestamp=timestamp,
-                        metadata={
-                            'text': doc.get('text'),
-                            'channel_name': doc.get('channel_name')
-                        }
-                    ))
-                    slack_count += 1
-        
-        logger.debug(f"   Found {slack_count} Slack messages")
+            if member_name and timestamp:
+                all_activities[member_name].append(Activity(
+                    id=str(doc['_id']),
+                    member_name=member_name,
+                    source_type='slack',
+                    activity_type='message',
+                    timestamp=timestamp,
+                    metadata={
+                        'text': doc.get('text'),
+                        'channel_name': doc.get('channel_name')
+                    }
+                ))
     except Exception as e:
         logger.error(f"   Error querying Slack messages: {e}")
-    
+
     # Build result for each key
     result = []
     for member_name, limit, source in keys:
         member_activities = all_activities.get(member_name, [])
-        
+
         # Filter by source if specified
         if source:
             source_value = source.value if hasattr(source, 'value') else source
@@ -320,16 +325,421 @@ async def load_recent_activities_batch(
                 a for a in member_activities
                 if a.source_type == source_value
             ]
-        
+
         # Sort by timestamp and limit
-        member_activities.sort(key=lambda a: a.timestamp, reverse=True)
+        member_activities = sorted(member_activities, key=lambda a: a.timestamp, reverse=True)
         result.append(member_activities[:limit])
-    
+
     logger.info(
         f"✅ DataLoader: Loaded activities for {len(keys)} requests "
         f"(total: {sum(len(r) for r in result)} activities)"
     )
-    
+
+    return result
+
+
+def _stats_accumulators(date_field: str, now: datetime) -> Dict[str, Any]:
+    """Totals, last-30-days and last-4-weeks counts in one ``$group``"""
+    date = f"${date_field}"
+    accumulators = {
+        "count": {"$sum": 1},
+        "last_30_days": {"$sum": {"$cond": [{"$gte": [date, now - timedelta(days=30)]}, 1, 0]}},
+    }
+    four_weeks_ago = now - timedelta(weeks=4)
+    for week in range(4):
+        week_start = four_weeks_ago + timedelta(weeks=week)
+        accumulators[f"week_{week}"] = {
+            "$sum": {
+                "$cond": [
+                    {"$and": [{"$gte": [date, week_start]}, {"$lt": [date, week_start + timedelta(weeks=1)]}]},
+                    1,
+                    0,
+                ]
+            }
+        }
+    return accumulators
+
+
+async def load_activity_stats_batch(
+    keys: List[str],
+    db,
+    identities: Optional[DataLoader] = None,
+) -> List[Any]:
+    """
+    Batch load activity statistics for multiple members.
+
+    One ``$group`` per source computes every member's total, last-30-days
+    count and 4-week trend at once.
+
+    Args:
+        keys: List of member names
+        db: MongoDB async database instance
+        identities: The request's ``member_identities`` loader
+
+    Returns:
+        List of ActivityStats in same order as keys
+    """
+    from .types import ActivityStats, SourceStats, WeeklyStats
+
+    logger.info(f"📦 DataLoader: Batch loading activity stats for {len(keys)} members")
+
+    lookup = await _member_lookup(keys, db, identities)
+    github_ids = lookup.identifiers("github")
+    notion_names = lookup.identifiers("notion")
+    now = datetime.now(timezone.utc)
+    four_weeks_ago = now - timedelta(weeks=4)
+
+    commits, prs, messages, created, edited, drive = await asyncio.gather(
+        _group_by(db["github_commits"], "author_name", github_ids, _stats_accumulators("date", now)),
+        _group_by(db["github_pull_requests"], "author", github_ids, _stats_accumulators("created_at", now)),
+        _group_by(db["slack_messages"], "user_name", lookup.identifiers("slack"), _stats_accumulators("posted_at", now)),
+        _group_by(db["notion_pages"], "created_by.name", notion_names),
+        # Pages last edited by someone other than their creator
+        _group_by(
+            db["notion_pages"], "last_edited_by.name", notion_names,
+            match={"$expr": {"$ne": ["$created_by.name", "$last_edited_by.name"]}},
+        ),
+        _group_by(db["drive_activities"], "actor_name", lookup.identifiers("drive")),
+    )
+
+    empty = {"count": 0, "last_30_days": 0, **{f"week_{week}": 0 for week in range(4)}}
+    per_member = {key: {source: dict(empty) for source in ("github", "slack", "notion", "drive")} for key in keys}
+
+    for source, groups in (
+        ("github", commits), ("github", prs), ("slack", messages),
+        ("notion", created), ("notion", edited), ("drive", drive),
+    ):
+        for doc in groups:
+            member = lookup.member(source, doc["_id"])
+            if not member:
+                continue
+            totals = per_member[member][source]
+            for field in totals:
+                totals[field] += doc.get(field, 0)
+
+    result = []
+    for key in keys:
+        sources = per_member[key]
+        total = sum(stats["count"] for stats in sources.values())
+        by_source = [
+            SourceStats(
+                source=source,
+                count=stats["count"],
+                percentage=round(stats["count"] / total * 100, 2) if total > 0 else 0,
+            )
+            for source, stats in sources.items()
+        ]
+        by_source.sort(key=lambda x: x.count, reverse=True)
+
+        # Weekly trend / last 30 days cover GitHub and Slack
+        trend_sources = (sources["github"], sources["slack"])
+        result.append(
+            ActivityStats(
+                total_activities=total,
+                by_source=by_source,
+                weekly_trend=[
+                    WeeklyStats(
+                        week_start=four_weeks_ago + timedelta(weeks=week),
+                        count=sum(stats[f"week_{week}"] for stats in trend_sources),
+                    )
+                    for week in range(4)
+                ],
+                last_30_days=sum(stats["last_30_days"] for stats in trend_sources),
+            )
+        )
+
+    return result
+
+
+async def load_active_repositories_batch(
+    keys: List[Tuple[str, int]],  # (member_name, limit)
+    db,
+    identities: Optional[DataLoader] = None,
+) -> List[List[Any]]:
+    """
+    Batch load the repositories members are active in.
+
+    Args:
+        keys: List of (member_name, limit) tuples
+        db: MongoDB async database instance
+        identities: The request's ``member_identities`` loader
+
+    Returns:
+        List of RepositoryActivity lists in same order as keys
+    """
+    from .types import RepositoryActivity
+    from .queries import ensure_datetime
+
+    logger.info(f"📦 DataLoader: Batch loading active repositories for {len(keys)} requests")
+
+    lookup = await _member_lookup([key[0] for key in keys], db, identities)
+    github_ids = lookup.identifiers("github")
+
+    commits, prs = await asyncio.gather(
+        _group_by(
+            db["github_commits"], "author_name", github_ids,
+            {
+                "commit_count": {"$sum": 1},
+                "additions": {"$sum": "$additions"},
+                "deletions": {"$sum": "$deletions"},
+                "last_date": {"$max": "$date"},
+            },
+            group_id={"author": "$author_name", "repository": "$repository"},
+        ),
+        _group_by(
+            db["github_pull_requests"], "author", github_ids,
+            {"pr_count": {"$sum": 1}, "last_date": {"$max": "$created_at"}},
+            group_id={"author": "$author", "repository": "$repository"},
+        ),
+    )
+
+    repos: Dict[str, Dict[str, Dict[str, Any]]] = defaultdict(dict)
+    for doc in commits + prs:
+        member = lookup.member("github", doc["_id"].get("author"))
+        repo = doc["_id"].get("repository")
+        if not member or not repo:
+            continue
+        entry = repos[member].setdefault(
+            repo,
+            {"commit_count": 0, "pr_count": 0, "additions": 0, "deletions": 0, "last_date": None},
+        )
+        for field in ("commit_count", "pr_count", "additions", "deletions"):
+            entry[field] += doc.get(field) or 0
+        last_date = ensure_datetime(doc.get("last_date"))
+        if last_date and (not entry["last_date"] or last_date > entry["last_date"]):
+            entry["last_date"] = last_date
+
+    result = []
+    for member_name, limit in keys:
+        activities = [
+            RepositoryActivity(
+                repository=repo,
+                commit_count=data["commit_count"],
+                pr_count=data["pr_count"],
+                issue_count=0,
+                additions=data["additions"],
+                deletions=data["deletions"],
+                last_activity=data["last_date"],
+            )
+            for repo, data in repos.get(member_name, {}).items()
+        ]
+        # Sort by total activity (commits + PRs)
+        activities.sort(key=lambda x: x.commit_count + x.pr_count, reverse=True)
+        result.append(activities[:limit])
+
+    return result
+
+
+async def load_top_collaborators_batch(
+    keys: List[Tuple[str, int]],  # (member_name, limit)
+    db,
+) -> List[List[Any]]:
+    """
+    Batch load top collaborators from the materialized collaboration store.
+
+    GitHub counts are PR reviews and shared issues, Slack counts are shared
+    threads (see ``src/core/collaboration_store.py``).
+
+    Args:
+        keys: List of (member_name, limit) tuples
+        db: MongoDB async database instance
+
+    Returns:
+        List of Collaborator lists in same order as keys
+    """
+    from .types import Collaborator
+    from .queries import ensure_datetime
+
+    logger.info(f"📦 DataLoader: Batch loading top collaborators for {len(keys)} requests")
+
+    wanted = {name.lower(): name for name, _ in keys}
+    groups = await _aggregate(
+        db[DAILY_COLLECTION],
+        [
+            {
+                "$match": {
+                    "$or": [
+                        {"member_a_key": {"$in": list(wanted)}},
+                        {"member_b_key": {"$in": list(wanted)}},
+                    ]
+                }
+            },
+            {
+                "$group": {
+                    "_id": {"a": "$member_a_key", "b": "$member_b_key", "source": "$source"},
+                    "member_a": {"$first": "$member_a"},
+                    "member_b": {"$first": "$member_b"},
+                    "count": {"$sum": "$count"},
+                    "last_date": {"$max": "$last_at"},
+                }
+            },
+        ],
+    )
+
+    collaborators: Dict[str, Dict[str, Dict[str, Any]]] = defaultdict(dict)
+    for doc in groups:
+        kind = "slack" if doc["_id"]["source"] == "slack_thread" else "github"
+        last_date = ensure_datetime(doc.get("last_date"))
+        for own_key, other in ((doc["_id"]["a"], doc["member_b"]), (doc["_id"]["b"], doc["member_a"])):
+            member = wanted.get(own_key)
+            if not member:
+                continue
+            entry = collaborators[member].setdefault(other, {"github": 0, "slack": 0, "last_date": None})
+            entry[kind] += doc["count"]
+            if last_date and (not entry["last_date"] or last_date > entry["last_date"]):
+                entry["last_date"] = last_date
+
+    result = []
+    for member_name, limit in keys:
+        entries = []
+        for name, data in collaborators.get(member_name, {}).items():
+            github_count, slack_count = data["github"], data["slack"]
+            collab_type = (
+                "both"
+                if github_count > 0 and slack_count > 0
+                else ("github" if github_count > 0 else "slack")
+            )
+            entries.append(
+                Collaborator(
+                    member_name=name,
+                    collaboration_count=github_count + slack_count,
+                    collaboration_type=collab_type,
+                    last_collaboration=data["last_date"],
+                )
+            )
+        # Sort by collaboration count and return top N
+        entries.sort(key=lambda x: x.collaboration_count, reverse=True)
+        result.append(entries[:limit])
+
+    return result
+
+
+async def load_member_projects_batch(keys: List[str], db) -> List[Optional[List[Dict[str, Any]]]]:
+    """
+    Batch load the active projects of multiple members.
+
+    Args:
+        keys: List of member IDs (ObjectId strings)
+        db: MongoDB async database instance
+
+    Returns:
+        Project documents per member in same order as keys
+        (None for malformed IDs, so resolvers can fall back)
+    """
+    object_ids = []
+    by_member: Dict[str, Optional[List[Dict[str, Any]]]] = {}
+    for key in keys:
+        try:
+            object_ids.append(ObjectId(key))
+            by_member[key] = []
+        except Exception:
+            by_member[key] = None
+
+    if object_ids:
+        async for doc in db["projects"].find({"member_ids": {"$in": object_ids}, "is_active": True}):
+            for member_id in dict.fromkeys(str(m) for m in doc.get("member_ids", [])):
+                if by_member.get(member_id) is not None:
+                    by_member[member_id].append(doc)
+
+    return [by_member[key] for key in keys]
+
+
+async def load_members_by_id_batch(keys: List[str], db) -> List[Optional[Dict[str, Any]]]:
+    """
+    Batch load member documents by ID.
+
+    Args:
+        keys: List of member IDs (ObjectId strings)
+        db: MongoDB async database instance
+
+    Returns:
+        Member documents (None if missing) in same order as keys
+    """
+    object_ids = []
+    for key in keys:
+        try:
+            object_ids.append(ObjectId(key))
+        except Exception:
+            continue
+
+    docs = {}
+    if object_ids:
+        async for doc in db["members"].find({"_id": {"$in": object_ids}}):
+            docs[str(doc["_id"])] = doc
+    return [docs.get(key) for key in keys]
+
+
+def _window(field: str, start_date: Optional[datetime], end_date: Optional[datetime]) -> Dict[str, Any]:
+    bounds = {}
+    if start_date:
+        bounds["$gte"] = start_date
+    if end_date:
+        bounds["$lte"] = end_date
+    return {field: bounds} if bounds else {}
+
+
+async def load_project_activity_summaries_batch(
+    keys: List[tuple],  # (repositories, slack_channel, start_date, end_date)
+    db,
+) -> List[Any]:
+    """
+    Batch load project activity summaries.
+
+    Keys sharing a date window are answered by one grouped count per
+    collection (commits / PRs per repository, messages per channel).
+
+    Args:
+        keys: List of (repositories tuple, slack_channel, start_date, end_date)
+        db: MongoDB async database instance
+
+    Returns:
+        List of ActivitySummary in same order as keys
+    """
+    from .types import ActivitySummary
+
+    windows: Dict[tuple, List[tuple]] = defaultdict(list)
+    for key in keys:
+        windows[(key[2], key[3])].append(key)
+
+    counts: Dict[tuple, Dict[str, Dict[str, int]]] = {}
+    for (start_date, end_date), window_keys in windows.items():
+        repositories = sorted({repo for key in window_keys for repo in key[0]})
+        channels = sorted(
+            {key[1] for key in window_keys if key[1] and key[1] != EXCLUDED_SLACK_CHANNEL}
+        )
+        commits, prs, messages = await asyncio.gather(
+            _group_by(db["github_commits"], "repository", repositories, match=_window("date", start_date, end_date)),
+            _group_by(
+                db["github_pull_requests"], "repository", repositories,
+                match=_window("created_at", start_date, end_date),
+            ),
+            _group_by(db["slack_messages"], "channel_name", channels, match=_window("posted_at", start_date, end_date)),
+        )
+        counts[(start_date, end_date)] = {
+            "commits": {doc["_id"]: doc["count"] for doc in commits},
+            "prs": {doc["_id"]: doc["count"] for doc in prs},
+            "messages": {doc["_id"]: doc["count"] for doc in messages},
+        }
+
+    result = []
+    for repositories, slack_channel, start_date, end_date in keys:
+        window_counts = counts[(start_date, end_date)]
+        github_commits = sum(window_counts["commits"].get(repo, 0) for repo in repositories)
+        github_prs = sum(window_counts["prs"].get(repo, 0) for repo in repositories)
+        slack_count = window_counts["messages"].get(slack_channel, 0) if slack_channel else 0
+        result.append(
+            ActivitySummary(
+                total=github_commits + github_prs + slack_count,
+                by_source={"github": github_commits + github_prs, "slack": slack_count},
+                by_type={
+                    "commit": github_commits,
+                    "pull_request": github_prs,
+                    "message": slack_count,
+                },
+                date_range_start=start_date,
+                date_range_end=end_date,
+            )
+        )
     return result
 
 
@@ -339,42 +749,67 @@ async def load_project_member_counts_batch(
 ) -> List[int]:
     """
     Batch load member counts for multiple projects.
-    
+
     Args:
         keys: List of member_id lists (one per project)
         db: MongoDB async database instance
-        
+
     Returns:
         List of member counts in same order as keys
     """
     logger.debug(f"📦 DataLoader: Batch loading member counts for {len(keys)} projects")
-    
+
     # Simply return the length of each member_id list
     # (More efficient than querying DB since we already have the IDs)
     result = [len(member_ids) if member_ids else 0 for member_ids in keys]
-    
+
     logger.debug(f"✅ DataLoader: Loaded {len(keys)} member counts")
-    
+
     return result
 
 
 def create_dataloaders(db):
     """
-    Create all DataLoaders with database context.
-    
+    Create the per-request DataLoader registry with database context.
+
     Args:
         db: MongoDB async database instance
-        
+
     Returns:
         Dict of DataLoader instances
     """
+    identities = DataLoader(load_fn=lambda keys: load_member_identities_batch(keys, db))
     return {
+        # Identity resolution (shared by the member loaders below)
+        'member_identities': identities,
+        'profile_identifiers': DataLoader(
+            load_fn=lambda keys: load_profile_identifiers_batch(keys, db)
+        ),
+        # Member stats
         'activity_counts': DataLoader(
-            load_fn=lambda keys: load_activity_counts_batch(keys, db)
+            load_fn=lambda keys: load_activity_counts_batch(keys, db, identities)
         ),
         'recent_activities': DataLoader(
-            load_fn=lambda keys: load_recent_activities_batch(keys, db)
+            load_fn=lambda keys: load_recent_activities_batch(keys, db, identities)
+        ),
+        'activity_stats': DataLoader(
+            load_fn=lambda keys: load_activity_stats_batch(keys, db, identities)
+        ),
+        'active_repositories': DataLoader(
+            load_fn=lambda keys: load_active_repositories_batch(keys, db, identities)
+        ),
+        'top_collaborators': DataLoader(
+            load_fn=lambda keys: load_top_collaborators_batch(keys, db)
+        ),
+        # Projects
+        'member_projects': DataLoader(
+            load_fn=lambda keys: load_member_projects_batch(keys, db)
+        ),
+        'members_by_id': DataLoader(
+            load_fn=lambda keys: load_members_by_id_batch(keys, db)
+        ),
+        'project_activity_summaries': DataLoader(
+            load_fn=lambda keys: load_project_activity_summaries_batch(keys, db)
         ),
         # Note: project_member_counts DataLoader removed - member count is calculated directly from member_ids
     }
-
@@ -4,11 +4,35 @@ GraphQL Extensions
 Custom extensions for performance monitoring, logging, and optimization.
 """
 
+import hashlib
+import json
+import os
+import threading
 import time
-from typing import Any, Dict
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from graphql import (
+    DocumentNode,
+    ExecutionResult as GraphQLExecutionResult,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    InlineFragmentNode,
+    IntValueNode,
+    OperationType,
+    VariableNode,
+    get_operation_ast,
+    print_ast,
+)
 from strawberry.extensions import SchemaExtension
 
+from src.core.cache_versions import collection_versions, snapshot
+from src.core.collaboration_store import DAILY_COLLECTION as COLLABORATION_DAILY
+from src.core.identity_index import IDENTITY_VERSION_ID
 from src.utils.logger import get_logger
+from src.utils.rate_limiter import TokenBucket
 
 logger = get_logger(__name__)
 
@@ -67,38 +91,405 @@ class PerformanceMonitoringExtension(SchemaExtension):
         }
 
 
-class QueryComplexityExtension(SchemaExtension):
+# ---------------------------------------------------------------------------
+# Query cost model
+# ---------------------------------------------------------------------------
+
+# Reject operations above this cost before they execute
+MAX_QUERY_COST = int(os.getenv("GRAPHQL_MAX_COST", "10000"))
+
+# Cost budget per client IP and minute (0 disables throttling)
+COST_PER_MINUTE = float(os.getenv("GRAPHQL_COST_PER_MINUTE", "60000"))
+
+# Expected list sizes when no ``limit`` argument is given
+ROOT_LIST_SIZES = {
+    "members": 100,
+    "activities": 100,
+    "projects": 50,
+}
+NESTED_LIST_SIZES = {
+    "members": 15,
+    "projectDetails": 5,
+    "recentActivities": 10,
+    "topCollaborators": 10,
+    "activeRepositories": 10,
+    "collaborationDetails": 5,
+    "edges": 500,
+    "bySource": 5,
+    "weeklyTrend": 12,
+    "grantReports": 8,
+    "milestones": 10,
+}
+
+# Fields whose resolvers do noticeably more than a document lookup
+FIELD_COSTS = {
+    "teamCollaborations": 100,
+    "memberCollaborations": 50,
+    "activities": 10,
+    "activitySummary": 10,
+    "activityStats": 5,
+    "activityCount": 2,
+    "topCollaborators": 2,
+    "activeRepositories": 2,
+    "recentActivities": 2,
+}
+
+# ``activities`` without a date range scans every source collection
+UNBOUNDED_ACTIVITIES_FACTOR = 5
+
+
+def _argument_value(field: FieldNode, name: str, variables: Dict[str, Any]) -> Any:
+    for argument in field.arguments or ():
+        if argument.name.value != name:
+            continue
+        if isinstance(argument.value, VariableNode):
+            return variables.get(argument.value.name.value)
+        if isinstance(argument.value, IntValueNode):
+            return int(argument.value.value)
+        return getattr(argument.value, "value", None)
+    return None
+
+
+def _list_size(field: FieldNode, depth: int, variables: Dict[str, Any]) -> int:
+    name = field.name.value
+    sizes = ROOT_LIST_SIZES if depth == 1 else NESTED_LIST_SIZES
+    if name not in sizes:
+        return 1
+
+    limit = _argument_value(field, "limit", variables)
+    if isinstance(limit, int) and limit >= 0:
+        return limit
+    return sizes[name]
+
+
+def _field_cost(field: FieldNode, variables: Dict[str, Any]) -> int:
+    name = field.name.value
+    cost = FIELD_COSTS.get(name, 1 if field.selection_set else 0)
+
+    if name == "activities" and all(
+        _argument_value(field, arg, variables) is None for arg in ("startDate", "endDate")
+    ):
+        cost *= UNBOUNDED_ACTIVITIES_FACTOR
+    return cost
+
+
+def _iter_fields(selection_set, fragments: Dict[str, FragmentDefinitionNode], seen=frozenset()):
+    """Yield the fields of a selection set with fragments inlined"""
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            yield selection
+        elif isinstance(selection, InlineFragmentNode):
+            yield from _iter_fields(selection.selection_set, fragments, seen)
+        elif isinstance(selection, FragmentSpreadNode):
+            name = selection.name.value
+            if name in fragments and name not in seen:
+                yield from _iter_fields(fragments[name].selection_set, fragments, seen | {name})
+
+
+def query_cost(
+    document: DocumentNode,
+    operation_name: Optional[str] = None,
+    variables: Optional[Dict[str, Any]] = None,
+) -> Tuple[int, int]:
     """
-    Extension to analyze and log query complexity.
-    
-    Helps identify expensive queries that might need optimization.
+    Estimate the cost of an operation from its AST
+
+    Every field is charged once per parent object: object fields cost 1,
+    scalars are free and the fields in ``FIELD_COSTS`` cost more. List fields
+    multiply the cost of their selections by ``limit`` (literal or variable)
+    or by the expected size in ``ROOT_LIST_SIZES`` / ``NESTED_LIST_SIZES``.
+
+    Args:
+        document: Parsed GraphQL document
+        operation_name: Operation to analyze (documents may hold several)
+        variables: Request variables
+
+    Returns:
+        (cost, depth)
     """
-    
-    def on_operation(self) -> None:
-        """Analyze query complexity"""
-        query = self.execution_context.query
-        
-        # Simple complexity metrics
-        field_count = query.count('{')
-        alias_count = query.count(':')
-        
-        complexity_score = field_count + (alias_count * 2)
-        
-        # Log if query is complex
-        if complexity_score > 50:
+    operation = get_operation_ast(document, operation_name)
+    if operation is None:
+        return 0, 0
+
+    variables = variables or {}
+    fragments = {
+        definition.name.value: definition
+        for definition in document.definitions
+        if isinstance(definition, FragmentDefinitionNode)
+    }
+
+    def walk(selection_set, multiplier: int, depth: int) -> Tuple[int, int]:
+        total = 0
+        deepest = depth
+        for field in _iter_fields(selection_set, fragments):
+            if field.name.value.startswith("__"):
+                continue
+            total += multiplier * _field_cost(field, variables)
+            if field.selection_set:
+                size = _list_size(field, depth, variables)
+                cost, sub_depth = walk(field.selection_set, multiplier * size, depth + 1)
+                total += cost
+                deepest = max(deepest, sub_depth)
+        return total, deepest
+
+    return walk(operation.selection_set, 1, 1)
+
+
+def _client_id(context: Any) -> str:
+    request = context.get("request") if isinstance(context, dict) else getattr(context, "request", None)
+    client = getattr(request, "client", None)
+    return getattr(client, "host", None) or "unknown"
+
+
+def _error_result(message: str, **extensions) -> GraphQLExecutionResult:
+    return GraphQLExecutionResult(data=None, errors=[GraphQLError(message, extensions=extensions)])
+
+
+class QueryCostExtension(SchemaExtension):
+    """
+    Extension to reject and throttle expensive queries.
+
+    The cost of each operation is estimated with ``query_cost`` before
+    execution. Operations above ``GRAPHQL_MAX_COST`` are rejected, and each
+    client IP spends its cost from a token bucket refilled with
+    ``GRAPHQL_COST_PER_MINUTE`` points per minute.
+    """
+
+    _buckets: Dict[str, TokenBucket] = {}
+    _buckets_lock = threading.Lock()
+
+    @classmethod
+    def _bucket(cls, client: str) -> TokenBucket:
+        with cls._buckets_lock:
+            bucket = cls._buckets.get(client)
+            if bucket is None:
+                if len(cls._buckets) >= 10000:
+                    cls._buckets.clear()
+                bucket = cls._buckets[client] = TokenBucket(COST_PER_MINUTE / 60.0, COST_PER_MINUTE)
+            return bucket
+
+    def on_execute(self) -> Iterator[None]:
+        """Analyze the query and reject it before execution if needed"""
+        self.cost = None
+        self.depth = None
+        context = self.execution_context
+
+        # Served from the response cache
+        if context.result is not None or context.graphql_document is None:
+            yield
+            return
+
+        self.cost, self.depth = query_cost(
+            context.graphql_document, context.operation_name, context.variables
+        )
+        operation = context.operation_name or "anonymous"
+
+        if self.cost > MAX_QUERY_COST:
             logger.warning(
-                f"⚠️  Complex GraphQL query detected: "
-                f"score={complexity_score}, fields≈{field_count}"
+                f"🚫 GraphQL query rejected: {operation} cost={self.cost} "
+                f"(max {MAX_QUERY_COST}), depth={self.depth}"
             )
-        elif complexity_score > 20:
-            logger.info(
-                f"📊 Moderate GraphQL query: "
-                f"score={complexity_score}, fields≈{field_count}"
+            context.result = _error_result(
+                f"Query cost {self.cost} exceeds the maximum of {MAX_QUERY_COST}",
+                code="QUERY_TOO_EXPENSIVE",
+                cost=self.cost,
+                maxCost=MAX_QUERY_COST,
             )
-    
+        elif COST_PER_MINUTE > 0:
+            client = _client_id(context.context)
+            retry_after = self._bucket(client).try_acquire(self.cost)
+            if retry_after > 0:
+                logger.warning(
+                    f"🚫 GraphQL query throttled: {operation} from {client} "
+                    f"cost={self.cost}, retry in {retry_after:.1f}s"
+                )
+                context.result = _error_result(
+                    f"Query cost budget exhausted, retry in {retry_after:.0f}s",
+                    code="RATE_LIMITED",
+                    cost=self.cost,
+                    retryAfter=round(retry_after, 1),
+                )
+        elif self.cost > MAX_QUERY_COST // 10:
+            logger.info(f"📊 Expensive GraphQL query: {operation} cost={self.cost}, depth={self.depth}")
+
+        yield
+
     def get_results(self) -> Dict[str, Any]:
-        """Return complexity information"""
-        return {}
+        """Return the estimated cost"""
+        if getattr(self, "cost", None) is None:
+            return {}
+        return {"cost": {"requested": self.cost, "maximum": MAX_QUERY_COST, "depth": self.depth}}
+
+
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+
+RESPONSE_CACHE_TTL = float(os.getenv("GRAPHQL_CACHE_TTL", "60"))
+RESPONSE_CACHE_SIZE = int(os.getenv("GRAPHQL_CACHE_SIZE", "500"))
+
+_ACTIVITY_DATA = (
+    "activity_timeline",
+    "github_commits",
+    "github_pull_requests",
+    "github_issues",
+    "slack_messages",
+    "notion_pages",
+    "notion_content_diffs",
+    "drive_activities",
+    "recordings",
+)
+_MEMBER_DATA = ("members", IDENTITY_VERSION_ID, "projects")
+
+# Collections each root field reads (its nested fields included). Responses
+# are reused until one of these version counters moves (see cache_versions)
+# or the TTL expires; root fields missing here are never cached.
+FIELD_DEPENDENCIES = {
+    "__typename": (),
+    "members": _MEMBER_DATA + _ACTIVITY_DATA + (COLLABORATION_DAILY,),
+    "member": _MEMBER_DATA + _ACTIVITY_DATA + (COLLABORATION_DAILY,),
+    "activities": _MEMBER_DATA + _ACTIVITY_DATA,
+    "activitySummary": _MEMBER_DATA + _ACTIVITY_DATA,
+    "projects": _MEMBER_DATA + _ACTIVITY_DATA,
+    "project": _MEMBER_DATA + _ACTIVITY_DATA,
+    "memberCollaborations": ("members", IDENTITY_VERSION_ID, COLLABORATION_DAILY),
+    "teamCollaborations": ("members", IDENTITY_VERSION_ID, COLLABORATION_DAILY),
+}
+
+
+def query_dependencies(document: DocumentNode, operation_name: Optional[str] = None) -> Optional[List[str]]:
+    """
+    Collections a query depends on
+
+    Returns:
+        Sorted collection names, or None if the operation is not a cacheable query
+    """
+    operation = get_operation_ast(document, operation_name)
+    if operation is None or operation.operation != OperationType.QUERY:
+        return None
+
+    fragments = {
+        definition.name.value: definition
+        for definition in document.definitions
+        if isinstance(definition, FragmentDefinitionNode)
+    }
+    collections = set()
+    for field in _iter_fields(operation.selection_set, fragments):
+        dependencies = FIELD_DEPENDENCIES.get(field.name.value)
+        if dependencies is None:
+            return None
+        collections.update(dependencies)
+    return sorted(collections)
+
+
+def response_cache_key(tenant: str, document: DocumentNode, operation_name: Optional[str], variables: Optional[Dict[str, Any]]) -> str:
+    """Cache key of a query (whitespace and formatting do not matter)"""
+    payload = json.dumps(
+        [tenant, operation_name, print_ast(document), variables or {}],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    In-process LRU cache of query results
+
+    Entries hold the version counters of the collections the query read and
+    are dropped once any of them moved or the TTL expired.
+    """
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_SIZE, ttl: float = RESPONSE_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, int], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, versions: Dict[str, int]) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, entry_versions, data = entry
+            if expires_at < time.monotonic() or snapshot(versions, entry_versions) != entry_versions:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return data
+
+    def set(self, key: str, versions: Dict[str, int], data: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, versions, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+response_cache = ResponseCache()
+
+
+class ResponseCacheExtension(SchemaExtension):
+    """
+    Extension to serve repeated queries from ``response_cache``.
+
+    Only queries whose root fields are listed in ``FIELD_DEPENDENCIES`` and
+    that completed without errors are stored. Keys include the tenant
+    (database name), so databases never share entries.
+    """
+
+    async def on_execute(self) -> AsyncIterator[None]:
+        """Serve the result from the cache or store it after execution"""
+        self.cache_status = None
+        context = self.execution_context
+        graphql_context = context.context if isinstance(context.context, dict) else {}
+        db = graphql_context.get("db")
+
+        dependencies = None
+        if db is not None and context.graphql_document is not None and response_cache.max_entries > 0:
+            dependencies = query_dependencies(context.graphql_document, context.operation_name)
+
+        if dependencies is None:
+            yield
+            return
+
+        key = response_cache_key(
+            graphql_context.get("tenant") or getattr(db, "name", ""),
+            context.graphql_document,
+            context.operation_name,
+            context.variables,
+        )
+        try:
+            versions = snapshot(await collection_versions.get_async(db), dependencies)
+        except Exception as e:
+            logger.warning(f"⚠️  Failed to read cache versions, skipping response cache: {e}")
+            yield
+            return
+
+        data = response_cache.get(key, versions)
+        if data is not None:
+            self.cache_status = "hit"
+            context.result = GraphQLExecutionResult(data=data, errors=None)
+            yield
+            return
+
+        self.cache_status = "miss"
+        yield
+
+        result = context.result
+        if result is not None and not result.errors and result.data is not None:
+            # Versions read before execution: a write during execution makes
+            # the entry stale instead of hiding the write
+            response_cache.set(key, versions, result.data)
+
+    def get_results(self) -> Dict[str, Any]:
+        """Report whether the response came from the cache"""
+        status = getattr(self, "cache_status", None)
+        return {"cache": status} if status else {}
 
 
 class ErrorLoggingExtension(SchemaExtension):
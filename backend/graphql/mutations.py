@@ -9,6 +9,8 @@ from typing import Optional
 from datetime import datetime
 from bson import ObjectId
 
+from src.core.cache_versions import bump_collection_versions_async
+
 from .types import Member
 
 
@@ -78,6 +80,7 @@ class Mutation:
             {'_id': object_id},
             {'$set': update_data}
         )
+        await bump_collection_versions_async(db, 'members')
         
         # Fetch updated member
         updated_doc = await db['members'].find_one({'_id': object_id})
@@ -152,6 +155,7 @@ class Mutation:
                 }
             }
         )
+        await bump_collection_versions_async(db, 'members')
         
         # Fetch updated member
         updated_doc = await db['members'].find_one({'_id': object_id})
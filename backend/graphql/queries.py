@@ -4,11 +4,17 @@ GraphQL Query Resolvers
 Implements query resolvers for fetching data from MongoDB.
 """
 
+import re
+
 import strawberry
 from typing import List, Optional, Any, Dict
 from datetime import datetime
 from bson import ObjectId
 
+from src.core.collaboration_store import load_collaboration_matrix
+from src.core.identity_index import identity_cache
+from src.utils.logger import get_logger
+
 from .types import (
     Member,
     Activity,
@@ -17,9 +23,13 @@ from .types import (
     ActivitySummary,
     Collaboration,
     CollaborationDetail,
+    CollaborationEdge,
     CollaborationNetwork,
+    TeamCollaborationNetwork,
 )
 
+logger = get_logger(__name__)
+
 
 def ensure_datetime(value: Any) -> Optional[datetime]:
     """
@@ -216,320 +226,54 @@ async def get_activities_for_member(
 
 async def get_top_collaborators(db, member_name: str, limit: int = 10) -> List:
     """
-    Get top collaborators for a member using MongoDB aggregation.
-
-    Analyzes GitHub PR reviews, co-authored commits, and Slack interactions.
+    Get top collaborators for a member (see ``load_top_collaborators_batch``).
     """
-    from .types import Collaborator
-    from datetime import timezone as tz
-
-    collaborators = {}
-
-    # 1. GitHub PR Reviews (members who reviewed this member's PRs)
-    pipeline_pr_reviews = [
-        {"$match": {"author": member_name}},
-        {"$unwind": "$reviewers"},
-        {
-            "$group": {
-                "_id": "$reviewers",
-                "count": {"$sum": 1},
-                "last_date": {"$max": "$created_at"},
-            }
-        },
-        {"$match": {"_id": {"$ne": member_name}}},  # Exclude self
-        {"$sort": {"count": -1}},
-        {"$limit": limit * 2},
-    ]
+    from .dataloaders import load_top_collaborators_batch
 
-    try:
-        async for doc in db["github_pull_requests"].aggregate(pipeline_pr_reviews):
-            reviewer = doc["_id"]
-            if reviewer and reviewer != member_name:
-                if reviewer not in collaborators:
-                    collaborators[reviewer] = {
-                        "github": doc["count"],
-                        "slack": 0,
-                        "last_date": ensure_datetime(doc.get("last_date")),
-                    }
-                else:
-                    collaborators[reviewer]["github"] += doc["count"]
-                    last_date = ensure_datetime(doc.get("last_date"))
-                    if last_date and (
-                        not collaborators[reviewer]["last_date"]
-                        or last_date > collaborators[reviewer]["last_date"]
-                    ):
-                        collaborators[reviewer]["last_date"] = last_date
-    except Exception as e:
-        print(f"Error fetching PR reviews: {e}")
-
-    # 2. Slack Interactions (threads, mentions)
-    pipeline_slack = [
-        {"$match": {"user_name": member_name}},
-        {
-            "$group": {
-                "_id": "$channel_id",
-                "messages": {"$push": {"ts": "$ts", "thread_ts": "$thread_ts"}},
-            }
-        },
-    ]
-
-    try:
-        # Find who replied to this member's messages
-        async for doc in db["slack_messages"].aggregate(
-            [
-                {"$match": {"user_name": {"$ne": member_name}}},
-                {
-                    "$group": {
-                        "_id": "$user_name",
-                        "count": {"$sum": 1},
-                        "last_date": {"$max": "$posted_at"},
-                    }
-                },
-                {"$sort": {"count": -1}},
-                {"$limit": limit * 2},
-            ]
-        ):
-            user = doc["_id"]
-            if user and user != member_name:
-                if user not in collaborators:
-                    collaborators[user] = {
-                        "github": 0,
-                        "slack": doc["count"],
-                        "last_date": ensure_datetime(doc.get("last_date")),
-                    }
-                else:
-                    collaborators[user]["slack"] += doc["count"]
-                    last_date = ensure_datetime(doc.get("last_date"))
-                    if last_date and (
-                        not collaborators[user]["last_date"]
-                        or last_date > collaborators[user]["last_date"]
-                    ):
-                        collaborators[user]["last_date"] = last_date
-    except Exception as e:
-        print(f"Error fetching Slack interactions: {e}")
-
-    # Build result list
-    result = []
-    for name, data in collaborators.items():
-        github_count = data["github"]
-        slack_count = data["slack"]
-        total = github_count + slack_count
-
-        if total > 0:
-            collab_type = (
-                "both"
-                if github_count > 0 and slack_count > 0
-                else ("github" if github_count > 0 else "slack")
-            )
-            result.append(
-                Collaborator(
-                    member_name=name,
-                    collaboration_count=total,
-                    collaboration_type=collab_type,
-                    last_collaboration=data["last_date"],
-                )
-            )
-
-    # Sort by collaboration count and return top N
-    result.sort(key=lambda x: x.collaboration_count, reverse=True)
-    return result[:limit]
+    return (await load_top_collaborators_batch([(member_name, limit)], db))[0]
 
 
 async def get_active_repositories(db, member_name: str, limit: int = 10) -> List:
     """
-    Get repositories where member is active using MongoDB aggregation.
+    Get repositories where member is active (see ``load_active_repositories_batch``).
     """
-    from .types import RepositoryActivity
-
-    repos = {}
-
-    # 1. Commits
-    pipeline_commits = [
-        {"$match": {"author_name": member_name}},
-        {
-            "$group": {
-                "_id": "$repository",
-                "commit_count": {"$sum": 1},
-                "additions": {"$sum": "$additions"},
-                "deletions": {"$sum": "$deletions"},
-                "last_date": {"$max": "$date"},
-            }
-        },
-        {"$sort": {"commit_count": -1}},
-        {"$limit": limit * 2},
-    ]
+    from .dataloaders import load_active_repositories_batch
 
-    try:
-        async for doc in db["github_commits"].aggregate(pipeline_commits):
-            repo = doc["_id"]
-            if repo:
-                repos[repo] = {
-                    "commit_count": doc["commit_count"],
-                    "pr_count": 0,
-                    "issue_count": 0,
-                    "additions": doc.get("additions", 0),
-                    "deletions": doc.get("deletions", 0),
-                    "last_date": ensure_datetime(doc.get("last_date")),
-                }
-    except Exception as e:
-        print(f"Error fetching commit stats: {e}")
-
-    # 2. Pull Requests
-    pipeline_prs = [
-        {"$match": {"author": member_name}},
-        {
-            "$group": {
-                "_id": "$repository",
-                "pr_count": {"$sum": 1},
-                "last_date": {"$max": "$created_at"},
-            }
-        },
-        {"$sort": {"pr_count": -1}},
-        {"$limit": limit * 2},
-    ]
-
-    try:
-        async for doc in db["github_pull_requests"].aggregate(pipeline_prs):
-            repo = doc["_id"]
-            if repo:
-                if repo not in repos:
-                    repos[repo] = {
-                        "commit_count": 0,
-                        "pr_count": doc["pr_count"],
-                        "issue_count": 0,
-                        "additions": 0,
-                        "deletions": 0,
-                        "last_date": ensure_datetime(doc.get("last_date")),
-                    }
-                else:
-                    repos[repo]["pr_count"] = doc["pr_count"]
-                    last_date = ensure_datetime(doc.get("last_date"))
-                    if last_date and (
-                        not repos[repo]["last_date"]
-                        or last_date > repos[repo]["last_date"]
-                    ):
-                        repos[repo]["last_date"] = last_date
-    except Exception as e:
-        print(f"Error fetching PR stats: {e}")
-
-    # Build result list
-    result = []
-    for repo, data in repos.items():
-        result.append(
-            RepositoryActivity(
-                repository=repo,
-                commit_count=data["commit_count"],
-                pr_count=data["pr_count"],
-                issue_count=data["issue_count"],
-                additions=data["additions"],
-                deletions=data["deletions"],
-                last_activity=data["last_date"],
-            )
-        )
-
-    # Sort by total activity (commits + PRs)
-    result.sort(key=lambda x: x.commit_count + x.pr_count, reverse=True)
-    return result[:limit]
+    return (await load_active_repositories_batch([(member_name, limit)], db))[0]
 
 
 async def get_activity_stats(db, member_name: str) -> "ActivityStats":
     """
-    Get comprehensive activity statistics for a member.
+    Get comprehensive activity statistics for a member (see ``load_activity_stats_batch``).
     """
-    from .types import ActivityStats, SourceStats, WeeklyStats
-    from datetime import datetime, timedelta, timezone as tz
-
-    # Calculate date ranges
-    now = datetime.now(tz.utc)
-    thirty_days_ago = now - timedelta(days=30)
-    four_weeks_ago = now - timedelta(weeks=4)
-
-    # Count by source
-    source_counts = {}
-
-    # GitHub
-    github_commits = await db["github_commits"].count_documents(
-        {"author_name": member_name}
-    )
-    github_prs = await db["github_pull_requests"].count_documents(
-        {"author": member_name}
-    )
-    source_counts["github"] = github_commits + github_prs
-
-    # Slack
-    source_counts["slack"] = await db["slack_messages"].count_documents(
-        {"user_name": member_name}
-    )
-
-    # Notion
-    source_counts["notion"] = await db["notion_pages"].count_documents(
-        {
-            "$or": [
-                {"created_by.name": member_name},
-                {"last_edited_by.name": member_name},
-            ]
-        }
-    )
-
-    # Drive
-    source_counts["drive"] = await db["drive_activities"].count_documents(
-        {"actor_name": member_name}
-    )
-
-    total = sum(source_counts.values())
-
-    # Build source stats with percentages
-    by_source = []
-    for source, count in source_counts.items():
-        percentage = (count / total * 100) if total > 0 else 0
-        by_source.append(
-            SourceStats(source=source, count=count, percentage=round(percentage, 2))
-        )
+    from .dataloaders import load_activity_stats_batch
 
-    # Sort by count descending
-    by_source.sort(key=lambda x: x.count, reverse=True)
+    return (await load_activity_stats_batch([member_name], db))[0]
 
-    # Weekly trend (last 4 weeks)
-    weekly_trend = []
-    for i in range(4):
-        week_start = four_weeks_ago + timedelta(weeks=i)
-        week_end = week_start + timedelta(weeks=1)
 
-        # Count activities in this week
-        week_count = 0
-        week_count += await db["github_commits"].count_documents(
-            {"author_name": member_name, "date": {"$gte": week_start, "$lt": week_end}}
-        )
-        week_count += await db["github_pull_requests"].count_documents(
-            {"author": member_name, "created_at": {"$gte": week_start, "$lt": week_end}}
-        )
-        week_count += await db["slack_messages"].count_documents(
-            {
-                "user_name": member_name,
-                "posted_at": {"$gte": week_start, "$lt": week_end},
-            }
-        )
+async def load_profile_identifiers(info, docs: List[Dict[str, Any]]) -> Dict[str, Dict[str, str]]:
+    """
+    Profile identifiers for member documents missing github/slack/notion IDs
 
-        weekly_trend.append(WeeklyStats(week_start=week_start, count=week_count))
+    Returns:
+        Member name -> {field: identifier}, from one batched lookup
+    """
+    from .dataloaders import PROFILE_IDENTIFIER_FIELDS, load_profile_identifiers_batch
 
-    # Last 30 days count
-    last_30_days = 0
-    last_30_days += await db["github_commits"].count_documents(
-        {"author_name": member_name, "date": {"$gte": thirty_days_ago}}
-    )
-    last_30_days += await db["github_pull_requests"].count_documents(
-        {"author": member_name, "created_at": {"$gte": thirty_days_ago}}
-    )
-    last_30_days += await db["slack_messages"].count_documents(
-        {"user_name": member_name, "posted_at": {"$gte": thirty_days_ago}}
-    )
+    names = [
+        doc["name"]
+        for doc in docs
+        if any(not doc.get(field) for field in PROFILE_IDENTIFIER_FIELDS.values())
+    ]
+    if not names:
+        return {}
 
-    return ActivityStats(
-        total_activities=total,
-        by_source=by_source,
-        weekly_trend=weekly_trend,
-        last_30_days=last_30_days,
-    )
+    dataloaders = info.context.get("dataloaders")
+    if dataloaders:
+        profiles = await dataloaders["profile_identifiers"].load_many(names)
+    else:
+        profiles = await load_profile_identifiers_batch(names, info.context["db"])
+    return dict(zip(names, profiles))
 
 
 @strawberry.type
@@ -562,55 +306,35 @@ class Query:
                 {"is_active": {"$exists": False}},  # Backwards compatibility
             ]
 
-        members = []
         # Sort by name alphabetically (case-insensitive)
-        async for doc in (
-            db["members"].find(query_filter).sort("name", 1).skip(offset).limit(limit)
-        ):
+        docs = (
+            await db["members"]
+            .find(query_filter)
+            .sort("name", 1)
+            .skip(offset)
+            .limit(limit)
+            .to_list(length=None)
+        )
+
+        # github_username / slack_id / notion_id: first from the member doc,
+        # then from member_identifiers (one batched lookup for the page)
+        profiles = await load_profile_identifiers(info, docs)
+
+        members = []
+        for doc in docs:
             member_name = doc["name"]
-            member_id = str(doc["_id"])
-
-            # Get github_username: first from member doc, then from member_identifiers
-            github_username = doc.get("github_username")
-            if not github_username:
-                github_id_doc = await db["member_identifiers"].find_one(
-                    {
-                        "member_name": member_name,
-                        "source": "github",
-                        "identifier_type": "username",
-                    }
-                )
-                if github_id_doc:
-                    github_username = github_id_doc.get("identifier_value")
-
-            # Get slack_id: first from member doc, then from member_identifiers
-            slack_id = doc.get("slack_id")
-            if not slack_id:
-                slack_id_doc = await db["member_identifiers"].find_one(
-                    {"member_name": member_name, "source": "slack"}
-                )
-                if slack_id_doc:
-                    slack_id = slack_id_doc.get("identifier_value")
-
-            # Get notion_id: first from member doc, then from member_identifiers
-            notion_id = doc.get("notion_id")
-            if not notion_id:
-                notion_id_doc = await db["member_identifiers"].find_one(
-                    {"member_name": member_name, "source": "notion"}
-                )
-                if notion_id_doc:
-                    notion_id = notion_id_doc.get("identifier_value")
+            profile = profiles.get(member_name, {})
 
             members.append(
                 Member(
-                    id=member_id,
+                    id=str(doc["_id"]),
                     name=member_name,
                     email=doc["email"],
                     role=doc.get("role"),
                     team=doc.get("team"),
-                    github_username=github_username,
-                    slack_id=slack_id,
-                    notion_id=notion_id,
+                    github_username=doc.get("github_username") or profile.get("github_username"),
+                    slack_id=doc.get("slack_id") or profile.get("slack_id"),
+                    notion_id=doc.get("notion_id") or profile.get("notion_id"),
                     eoa_address=doc.get("eoa_address"),
                     recording_name=doc.get("recording_name"),
                     projects=doc.get("projects", []),
@@ -651,37 +375,10 @@ class Query:
             return None
 
         member_name = doc["name"]
-
-        # Get github_username: first from member doc, then from member_identifiers
-        github_username = doc.get("github_username")
-        if not github_username:
-            github_id_doc = await db["member_identifiers"].find_one(
-                {
-                    "member_name": member_name,
-                    "source": "github",
-                    "identifier_type": "username",
-                }
-            )
-            if github_id_doc:
-                github_username = github_id_doc.get("identifier_value")
-
-        # Get slack_id: first from member doc, then from member_identifiers
-        slack_id = doc.get("slack_id")
-        if not slack_id:
-            slack_id_doc = await db["member_identifiers"].find_one(
-                {"member_name": member_name, "source": "slack"}
-            )
-            if slack_id_doc:
-                slack_id = slack_id_doc.get("identifier_value")
-
-        # Get notion_id: first from member doc, then from member_identifiers
-        notion_id = doc.get("notion_id")
-        if not notion_id:
-            notion_id_doc = await db["member_identifiers"].find_one(
-                {"member_name": member_name, "source": "notion"}
-            )
-            if notion_id_doc:
-                notion_id = notion_id_doc.get("identifier_value")
+        profile = (await load_profile_identifiers(info, [doc])).get(member_name, {})
+        github_username = doc.get("github_username") or profile.get("github_username")
+        slack_id = doc.get("slack_id") or profile.get("slack_id")
+        notion_id = doc.get("notion_id") or profile.get("notion_id")
 
         return Member(
             id=str(doc["_id"]),
@@ -743,18 +440,18 @@ class Query:
         import time
 
         request_id = int(time.time() * 1000) % 100000
-        print(f"🔍 [{request_id}] ===== GraphQL Activities Query Start =====")
-        print(f"🔍 [{request_id}] Strawberry variable_values: {info.variable_values}")
-        print(f"🔍 [{request_id}] Python parameters:")
-        print(f"🔍 [{request_id}]   - source: {source} (type: {type(source).__name__})")
-        print(f"🔍 [{request_id}]   - member_name: {member_name}")
-        print(f"🔍 [{request_id}]   - project_key: {project_key}")
-        print(f"🔍 [{request_id}]   - keyword: {keyword}")
-        print(f"🔍 [{request_id}]   - start_date: {start_date}")
-        print(f"🔍 [{request_id}]   - end_date: {end_date}")
-        print(f"🔍 [{request_id}]   - limit: {limit}")
-        print(f"🔍 [{request_id}]   - offset: {offset}")
-        print(
+        logger.debug(f"🔍 [{request_id}] ===== GraphQL Activities Query Start =====")
+        logger.debug(f"🔍 [{request_id}] Strawberry variable_values: {info.variable_values}")
+        logger.debug(f"🔍 [{request_id}] Python parameters:")
+        logger.debug(f"🔍 [{request_id}]   - source: {source} (type: {type(source).__name__})")
+        logger.debug(f"🔍 [{request_id}]   - member_name: {member_name}")
+        logger.debug(f"🔍 [{request_id}]   - project_key: {project_key}")
+        logger.debug(f"🔍 [{request_id}]   - keyword: {keyword}")
+        logger.debug(f"🔍 [{request_id}]   - start_date: {start_date}")
+        logger.debug(f"🔍 [{request_id}]   - end_date: {end_date}")
+        logger.debug(f"🔍 [{request_id}]   - limit: {limit}")
+        logger.debug(f"🔍 [{request_id}]   - offset: {offset}")
+        logger.debug(
             f"🔍 [{request_id}]   - notion_aggregation_minutes: {notion_aggregation_minutes}"
         )
 
@@ -774,69 +471,41 @@ class Query:
                 project_name = project_doc.get(
                     "name"
                 )  # Get project name for title filtering
-                print(f"🔍 [{request_id}] 📁 Project '{project_key}' config:")
-                print(f"🔍 [{request_id}]   - name: {project_name}")
-                print(
+                logger.debug(f"🔍 [{request_id}] 📁 Project '{project_key}' config:")
+                logger.debug(f"🔍 [{request_id}]   - name: {project_name}")
+                logger.debug(
                     f"🔍 [{request_id}]   - repositories: {len(project_repositories)} repos"
                 )
-                print(
+                logger.debug(
                     f"🔍 [{request_id}]   - slack_channel_id: {project_slack_channel_id}"
                 )
-                print(f"🔍 [{request_id}]   - drive_folders: {project_drive_folders}")
-                print(
+                logger.debug(f"🔍 [{request_id}]   - drive_folders: {project_drive_folders}")
+                logger.debug(
                     f"🔍 [{request_id}]   - notion_page_ids: {project_notion_page_ids}"
                 )
 
-        # Build mapping: identifier -> display name for ALL members (to resolve "Unknown")
-        # Uses the same structure as REST API's load_member_mappings
-        identifier_to_member = {}
-        member_to_identifiers = {}  # For filtering: member_name -> {source: [identifiers]}
-
-        print(
-            f"🔍 [{request_id}] 📍 BEFORE member_identifiers loop: source={source}, type={type(source).__name__}"
-        )
-
-        async for id_doc in db["member_identifiers"].find():
-            id_source = id_doc.get(
-                "source"
-            )  # Renamed to avoid conflict with function parameter
-            identifier_value = id_doc.get("identifier_value")
-            display_name = id_doc.get("member_name")  # Direct member_name field!
-
-            if id_source and identifier_value and display_name:
-                # Case-insensitive key for GitHub and email (like REST API)
-                if id_source in ["github", "drive", "email"]:
-                    key = (id_source, identifier_value.lower())
-                else:
-                    key = (id_source, identifier_value)
-
-                # Store mapping for display conversion
-                identifier_to_member[key] = display_name
-
-                # Build reverse mapping for filtering
-                if display_name not in member_to_identifiers:
-                    member_to_identifiers[display_name] = {}
-                if id_source not in member_to_identifiers[display_name]:
-                    member_to_identifiers[display_name][id_source] = []
-                member_to_identifiers[display_name][id_source].append(identifier_value)
+        # identifier -> display name for ALL members (to resolve "Unknown"),
+        # served from the shared, version-checked identity index
+        identity = await identity_cache.get_async(db)
+        identifier_to_member = identity.forward
 
         # Get identifiers for the specified member (for filtering)
         member_identifiers = {}
-        if member_name and member_name in member_to_identifiers:
-            member_identifiers = member_to_identifiers[member_name]
-            print(
+        if member_name and identity.has_member(member_name):
+            member_identifiers = identity.identifiers_for(member_name)
+            logger.debug(
                 f"🔍 [{request_id}] 👤 Member '{member_name}' identifiers: {member_identifiers}"
             )
         elif member_name:
-            print(
-                f"🔍 [{request_id}] ⚠️  Member '{member_name}' NOT FOUND in member_to_identifiers!"
+            logger.debug(
+                f"🔍 [{request_id}] ⚠️  Member '{member_name}' NOT FOUND in identity index!"
             )
-            print(
-                f"🔍 [{request_id}] Available members: {list(member_to_identifiers.keys())[:10]}"
+            logger.debug(
+                f"🔍 [{request_id}] Available members: {identity.member_names()[:10]}"
             )
 
         # Checkpoint: Verify source variable hasn't been corrupted
-        print(
+        logger.debug(
             f"🔍 [{request_id}] 📍 CHECKPOINT before sources logic: source={source}, type={type(source).__name__}"
         )
 
@@ -857,7 +526,7 @@ class Query:
                 "recordings_daily",
             ]
 
-        print(
+        logger.debug(
             f"🔍 [{request_id}] ⚡ sources = {sources} (from source={source}, type={type(source).__name__})"
         )
 
@@ -871,12 +540,12 @@ class Query:
                 # Project filter is active - only filter by repositories, ignore member
                 if project_repositories:
                     query["repository"] = {"$in": project_repositories}
-                    print(
+                    logger.debug(
                         f"🔍 [{request_id}] 🐙 Filtering GitHub by project repositories: {len(project_repositories)} repos"
                     )
                 else:
                     # Project has no repositories configured - return empty results
-                    print(
+                    logger.debug(
                         f"🔍 [{request_id}] ⚠️  Project '{project_key}' has no repositories configured - returning empty results"
                     )
                     query["repository"] = {"$in": []}  # Return no results
@@ -894,7 +563,7 @@ class Query:
                 query["date"] = query.get("date", {})
                 query["date"]["$lte"] = end_date
             if keyword:
-                query["message"] = {"$regex": keyword, "$options": "i"}
+                query["message"] = {"$regex": re.escape(keyword), "$options": "i"}
             # project_repositories filter is already applied above
 
             async for doc in (
@@ -951,12 +620,12 @@ class Query:
                 # Project filter is active - only filter by repositories, ignore member
                 if project_repositories:
                     query["repository"] = {"$in": project_repositories}
-                    print(
+                    logger.debug(
                         f"🔍 [{request_id}] 🐙 Filtering GitHub PRs by project repositories: {len(project_repositories)} repos"
                     )
                 else:
                     # Project has no repositories configured - return empty results
-                    print(
+                    logger.debug(
                         f"🔍 [{request_id}] ⚠️  Project '{project_key}' has no repositories configured - returning empty results"
                     )
                     query["repository"] = {"$in": []}  # Return no results
@@ -974,7 +643,7 @@ class Query:
                 query["created_at"] = query.get("created_at", {})
                 query["created_at"]["$lte"] = end_date
             if keyword:
-                query["title"] = {"$regex": keyword, "$options": "i"}
+                query["title"] = {"$regex": re.escape(keyword), "$options": "i"}
             # project_repositories filter is already applied above
 
             async for doc in (
@@ -1039,19 +708,19 @@ class Query:
                 # Project filter is active - only filter by channel, ignore member
                 if project_slack_channel_id:
                     query["channel_id"] = project_slack_channel_id
-                    print(
+                    logger.debug(
                         f"🔍 [{request_id}] 💬 Filtering Slack by project channel: {project_slack_channel_id}"
                     )
                 else:
                     # Project has no slack_channel_id configured - return empty results
-                    print(
+                    logger.debug(
                         f"🔍 [{request_id}] ⚠️  Project '{project_key}' has no slack_channel_id configured - returning empty results"
                     )
                     query["channel_id"] = {"$in": []}  # Return no results
             elif member_name:
                 # Use Slack identifiers (REST API pattern: user_id, user_email, user_name)
                 slack_identifiers = member_identifiers.get("slack", [])
-                print(
+                logger.debug(
                     f"🔍 [{request_id}] 💬 Slack identifiers for '{member_name}': {slack_identifiers}"
                 )
 
@@ -1064,16 +733,16 @@ class Query:
                     query["$or"] = or_conditions
                 else:
                     # Fallback to display name (case-insensitive)
-                    query["user_name"] = {"$regex": f"^{member_name}$", "$options": "i"}
+                    query["user_name"] = {"$regex": f"^{re.escape(member_name)}$", "$options": "i"}
             if start_date:
                 query["posted_at"] = {"$gte": start_date}
             if end_date:
                 query["posted_at"] = query.get("posted_at", {})
                 query["posted_at"]["$lte"] = end_date
             if keyword:
-                query["text"] = {"$regex": keyword, "$options": "i"}
+                query["text"] = {"$regex": re.escape(keyword), "$options": "i"}
 
-            print(f"🔍 [{request_id}] 💬 Slack query: {query}")
+            logger.debug(f"🔍 [{request_id}] 💬 Slack query: {query}")
 
             # Debug: Check actual user_name values in DB
             if member_name:
@@ -1081,13 +750,13 @@ class Query:
                 async for sample_doc in db["slack_messages"].find().limit(10):
                     if "user_name" in sample_doc:
                         sample_users.append(sample_doc["user_name"])
-                print(
+                logger.debug(
                     f"🔍 [{request_id}] 💬 Sample user_name values in DB: {list(set(sample_users))[:5]}"
                 )
 
                 # Check if query matches any documents
                 count = await db["slack_messages"].count_documents(query)
-                print(f"🔍 [{request_id}] 💬 Slack messages found for query: {count}")
+                logger.debug(f"🔍 [{request_id}] 💬 Slack messages found for query: {count}")
 
             slack_before = len(activities)
             async for doc in (
@@ -1150,7 +819,7 @@ class Query:
                 )
 
             slack_after = len(activities)
-            print(
+            logger.debug(
                 f"🔍 [{request_id}] 💬 Slack activities added: {slack_after - slack_before}"
             )
 
@@ -1161,8 +830,8 @@ class Query:
 
             # Filter by member name (editor_name field)
             if member_name:
-                query["editor_name"] = {"$regex": f"^{member_name}", "$options": "i"}
-                print(
+                query["editor_name"] = {"$regex": f"^{re.escape(member_name)}", "$options": "i"}
+                logger.debug(
                     f"🔍 [{request_id}] 📝 Notion diff filter by editor: {member_name}"
                 )
 
@@ -1181,7 +850,7 @@ class Query:
 
             # Keyword search in document title
             if keyword:
-                query["document_title"] = {"$regex": keyword, "$options": "i"}
+                query["document_title"] = {"$regex": re.escape(keyword), "$options": "i"}
 
             # Project filter by title
             if project_name:
@@ -1199,12 +868,12 @@ class Query:
                     }
                 else:
                     query["document_title"] = {"$regex": project_name, "$options": "i"}
-                print(
+                logger.debug(
                     f"🔍 [{request_id}] 📝 Filtering Notion diffs by project: {project_name}"
                 )
 
-            print(f"🔍 [{request_id}] 📝 Notion query: {query}")
-            print(
+            logger.debug(f"🔍 [{request_id}] 📝 Notion query: {query}")
+            logger.debug(
                 f"🔍 [{request_id}] 📝 Notion aggregation_minutes: {notion_aggregation_minutes}"
             )
 
@@ -1226,7 +895,7 @@ class Query:
                 ):
                     notion_docs.append(doc)
 
-                print(
+                logger.debug(
                     f"🔍 [{request_id}] 📝 Fetched {len(notion_docs)} Notion docs for aggregation"
                 )
 
@@ -1265,7 +934,7 @@ class Query:
                     key = (document_id, window_start.isoformat())
                     aggregated_groups[key].append((doc, timestamp))
 
-                print(
+                logger.debug(
                     f"🔍 [{request_id}] 📝 Aggregated into {len(aggregated_groups)} groups"
                 )
 
@@ -1438,7 +1107,7 @@ class Query:
                     )
 
             notion_after = len(activities)
-            print(
+            logger.debug(
                 f"🔍 [{request_id}] 📝 Notion diff activities added: {notion_after - notion_before}"
             )
 
@@ -1452,7 +1121,7 @@ class Query:
                 emails = member_identifiers.get("email", []) or member_identifiers.get(
                     "drive", []
                 )
-                print(
+                logger.debug(
                     f"🔍 [{request_id}] 📁 Drive emails for '{member_name}': {emails}"
                 )
 
@@ -1461,7 +1130,7 @@ class Query:
                 else:
                     # Fallback: try to match email by member name
                     query["user_email"] = {
-                        "$regex": f"^{member_name.lower()}@",
+                        "$regex": f"^{re.escape(member_name.lower())}@",
                         "$options": "i",
                     }
 
@@ -1474,7 +1143,7 @@ class Query:
 
             # Keyword search in document title
             if keyword:
-                query["doc_title"] = {"$regex": keyword, "$options": "i"}
+                query["doc_title"] = {"$regex": re.escape(keyword), "$options": "i"}
 
             # Project filter by title
             if project_name:
@@ -1492,11 +1161,11 @@ class Query:
                     }
                 else:
                     query["doc_title"] = {"$regex": project_name, "$options": "i"}
-                print(
+                logger.debug(
                     f"🔍 [{request_id}] 📁 Filtering Drive activities by project: {project_name}"
                 )
 
-            print(f"🔍 [{request_id}] 📁 Drive query: {query}")
+            logger.debug(f"🔍 [{request_id}] 📁 Drive query: {query}")
 
             drive_before = len(activities)
             async for doc in (
@@ -1554,7 +1223,7 @@ class Query:
                 )
 
             drive_after = len(activities)
-            print(
+            logger.debug(
                 f"🔍 [{request_id}] 📁 Drive activities added: {drive_after - drive_before}"
             )
 
@@ -1571,18 +1240,18 @@ class Query:
                 # Debug: Sample one recording to see actual field structure
                 sample_doc = await recordings_col.find_one()
                 if sample_doc:
-                    print(
+                    logger.debug(
                         f"🔍 [{request_id}] 🎥 Sample recording doc fields: {list(sample_doc.keys())}"
                     )
-                    print(f"🔍 [{request_id}] 🎥 Sample recording creator fields:")
-                    print(
+                    logger.debug(f"🔍 [{request_id}] 🎥 Sample recording creator fields:")
+                    logger.debug(
                         f"🔍 [{request_id}] 🎥   - createdBy (camelCase): {sample_doc.get('createdBy')}"
                     )
-                    print(
+                    logger.debug(
                         f"🔍 [{request_id}] 🎥   - created_by (snake_case): {sample_doc.get('created_by')}"
                     )
-                    print(f"🔍 [{request_id}] 🎥   - owner: {sample_doc.get('owner')}")
-                    print(
+                    logger.debug(f"🔍 [{request_id}] 🎥   - owner: {sample_doc.get('owner')}")
+                    logger.debug(
                         f"🔍 [{request_id}] 🎥   - lastModifyingUser: {sample_doc.get('lastModifyingUser')}"
                     )
 
@@ -1591,32 +1260,32 @@ class Query:
                     # Project filter is active - only filter by project name in title, ignore member
                     if not project_name:
                         # Project has no name configured - return empty results
-                        print(
+                        logger.debug(
                             f"🔍 [{request_id}] ⚠️  Project '{project_key}' has no name configured - returning empty results"
                         )
                         query["name"] = {"$regex": "^$"}  # Match nothing
                 elif member_name:
-                    print(
+                    logger.debug(
                         f"🔍 [{request_id}] 🎥 Filtering by member name: {member_name}"
                     )
 
                     # Get recording_name for this member (if exists)
                     recording_names = member_identifiers.get("recordings", [])
-                    print(
+                    logger.debug(
                         f"🔍 [{request_id}] 🎥 Recording names for '{member_name}': {recording_names}"
                     )
 
                     # NEW APPROACH: Get meeting_ids from gemini.recordings where member is a participant
                     try:
-                        from backend.api.v1.ai_processed import get_gemini_db
+                        from backend.api.v1.ai_processed import get_gemini_async_db
 
-                        gemini_db = get_gemini_db()
+                        gemini_db = get_gemini_async_db()
                         gemini_recordings_col = gemini_db["recordings"]
 
                         # Build participant query (participants is a string array)
                         participant_query = {
                             "participants": {
-                                "$regex": f"\\b{member_name}\\b",
+                                "$regex": f"\\b{re.escape(member_name)}\\b",
                                 "$options": "i",
                             }
                         }
@@ -1626,7 +1295,7 @@ class Query:
                             or_conditions = [
                                 {
                                     "participants": {
-                                        "$regex": f"\\b{member_name}\\b",
+                                        "$regex": f"\\b{re.escape(member_name)}\\b",
                                         "$options": "i",
                                     }
                                 }
@@ -1636,7 +1305,7 @@ class Query:
                                     or_conditions.append(
                                         {
                                             "participants": {
-                                                "$regex": f"\\b{rec_name}\\b",
+                                                "$regex": f"\\b{re.escape(rec_name)}\\b",
                                                 "$options": "i",
                                             }
                                         }
@@ -1644,18 +1313,16 @@ class Query:
                             participant_query = {"$or": or_conditions}
 
                         # Get meeting_ids where member is a participant
-                        gemini_docs = list(
-                            gemini_recordings_col.find(
-                                participant_query, {"meeting_id": 1}
-                            )
-                        )
+                        gemini_docs = await gemini_recordings_col.find(
+                            participant_query, {"meeting_id": 1}
+                        ).to_list(length=None)
 
                         meeting_ids = [
                             doc.get("meeting_id")
                             for doc in gemini_docs
                             if doc.get("meeting_id")
                         ]
-                        print(
+                        logger.debug(
                             f"🔍 [{request_id}] 🎥 Found {len(meeting_ids)} meetings where '{member_name}' is a participant"
                         )
 
@@ -1684,19 +1351,19 @@ class Query:
                             query["_id"] = {"$in": []}
 
                     except Exception as e:
-                        print(
+                        logger.warning(
                             f"🔍 [{request_id}] ⚠️  Error querying gemini.recordings: {e}"
                         )
                         # Fallback to old method (created_by and name)
                     or_conditions = [
-                        {"created_by": {"$regex": f"^{member_name}$", "$options": "i"}},
+                        {"created_by": {"$regex": f"^{re.escape(member_name)}$", "$options": "i"}},
                         {
                             "created_by": {
-                                "$regex": f"\\b{member_name}\\b",
+                                "$regex": f"\\b{re.escape(member_name)}\\b",
                                 "$options": "i",
                             }
                         },
-                        {"name": {"$regex": f"\\b{member_name}\\b", "$options": "i"}},
+                        {"name": {"$regex": f"\\b{re.escape(member_name)}\\b", "$options": "i"}},
                     ]
 
                     for rec_name in recording_names:
@@ -1705,19 +1372,19 @@ class Query:
                                 [
                                     {
                                         "created_by": {
-                                            "$regex": f"^{rec_name}$",
+                                            "$regex": f"^{re.escape(rec_name)}$",
                                             "$options": "i",
                                         }
                                     },
                                     {
                                         "created_by": {
-                                            "$regex": f"\\b{rec_name}\\b",
+                                            "$regex": f"\\b{re.escape(rec_name)}\\b",
                                             "$options": "i",
                                         }
                                     },
                                     {
                                         "name": {
-                                            "$regex": f"\\b{rec_name}\\b",
+                                            "$regex": f"\\b{re.escape(rec_name)}\\b",
                                             "$options": "i",
                                         }
                                     },
@@ -1733,7 +1400,7 @@ class Query:
                     query["modifiedTime"] = query.get("modifiedTime", {})
                     query["modifiedTime"]["$lte"] = end_date.isoformat()
                 if keyword:
-                    query["name"] = {"$regex": keyword, "$options": "i"}
+                    query["name"] = {"$regex": re.escape(keyword), "$options": "i"}
 
                 # Filter by project name in title if project_key is specified
                 if project_name:
@@ -1751,16 +1418,16 @@ class Query:
                         }
                     else:
                         query["name"] = {"$regex": project_name, "$options": "i"}
-                    print(
+                    logger.debug(
                         f"🔍 [{request_id}] 🎥 Filtering Recordings by project name in title: {project_name}"
                     )
 
-                print(f"🔍 [{request_id}] 🎥 Recordings query: {query}")
+                logger.debug(f"🔍 [{request_id}] 🎥 Recordings query: {query}")
 
                 # Debug: Check if query matches any documents
                 if member_name:
                     count = await recordings_col.count_documents(query)
-                    print(f"🔍 [{request_id}] 🎥 Documents matching query: {count}")
+                    logger.debug(f"🔍 [{request_id}] 🎥 Documents matching query: {count}")
 
                 # Async MongoDB query
                 recordings_before = len(activities)
@@ -1816,27 +1483,27 @@ class Query:
                     )
 
                 recordings_after = len(activities)
-                print(
+                logger.debug(
                     f"🔍 [{request_id}] 🎥 Recordings activities added: {recordings_after - recordings_before}"
                 )
             except Exception as e:
-                print(f"Error fetching recordings: {e}")
+                logger.warning(f"Error fetching recordings: {e}")
                 import traceback
 
-                print(traceback.format_exc())
+                logger.debug(traceback.format_exc())
 
         # Recordings Daily (Daily analysis)
         if "recordings_daily" in sources:
             try:
-                from backend.api.v1.ai_processed import get_gemini_db
+                from backend.api.v1.ai_processed import get_gemini_async_db
 
-                gemini_db = get_gemini_db()
+                gemini_db = get_gemini_async_db()
                 recordings_daily_col = gemini_db["recordings_daily"]
 
                 # Debug: Sample one daily doc to see structure
-                sample_daily = recordings_daily_col.find_one()
+                sample_daily = await recordings_daily_col.find_one()
                 if sample_daily:
-                    print(
+                    logger.debug(
                         f"🔍 [{request_id}] 📅 Sample recordings_daily fields: {list(sample_daily.keys())}"
                     )
 
@@ -1844,20 +1511,20 @@ class Query:
                     analysis = sample_daily.get("analysis", {})
                     if analysis and "participants" in analysis:
                         participants = analysis["participants"]
-                        print(
+                        logger.debug(
                             f"🔍 [{request_id}] 📅 analysis.participants type: {type(participants)}"
                         )
                         if isinstance(participants, list) and len(participants) > 0:
                             sample_participant = participants[0]
-                            print(
+                            logger.debug(
                                 f"🔍 [{request_id}] 📅 Sample participant: {sample_participant}"
                             )
                         elif isinstance(participants, dict):
-                            print(
+                            logger.debug(
                                 f"🔍 [{request_id}] 📅 Participants dict keys: {list(participants.keys())[:5]}"
                             )
                         else:
-                            print(
+                            logger.debug(
                                 f"🔍 [{request_id}] 📅 Participants value: {str(participants)[:200]}"
                             )
 
@@ -1871,26 +1538,26 @@ class Query:
                 if keyword:
                     # Search in analysis.summary.overview field
                     query["analysis.summary.overview"] = {
-                        "$regex": keyword,
+                        "$regex": re.escape(keyword),
                         "$options": "i",
                     }
 
                 # If member filter is specified, filter by analysis.participants
                 # participants is array of dicts: [{'name': 'Ale Son', ...}, {'name': 'Jake Jang', ...}]
                 if member_name:
-                    print(
+                    logger.debug(
                         f"🔍 [{request_id}] 📅 Filtering recordings_daily by analysis.participants.name containing: {member_name}"
                     )
 
                     # Get recording_name for this member (if exists)
                     recording_names = member_identifiers.get("recordings", [])
-                    print(
+                    logger.debug(
                         f"🔍 [{request_id}] 📅 Recording names for '{member_name}': {recording_names}"
                     )
 
                     # Build search patterns: search for both member_name and recording_name
                     name_patterns = [
-                        {"name": {"$regex": f"\\b{member_name}\\b", "$options": "i"}}
+                        {"name": {"$regex": f"\\b{re.escape(member_name)}\\b", "$options": "i"}}
                     ]
 
                     # Add recording_name patterns
@@ -1898,13 +1565,13 @@ class Query:
                         if rec_name:
                             # Exact match for recording name (e.g., "YEONGJU BAK")
                             name_patterns.append(
-                                {"name": {"$regex": f"^{rec_name}$", "$options": "i"}}
+                                {"name": {"$regex": f"^{re.escape(rec_name)}$", "$options": "i"}}
                             )
                             # Also try word boundary match
                             name_patterns.append(
                                 {
                                     "name": {
-                                        "$regex": f"\\b{rec_name}\\b",
+                                        "$regex": f"\\b{re.escape(rec_name)}\\b",
                                         "$options": "i",
                                     }
                                 }
@@ -1915,24 +1582,24 @@ class Query:
                         "$elemMatch": {"$or": name_patterns}
                     }
 
-                print(f"🔍 [{request_id}] 📅 recordings_daily query: {query}")
+                logger.debug(f"🔍 [{request_id}] 📅 recordings_daily query: {query}")
 
                 # Debug: Check if query matches any documents
                 if member_name:
-                    count = recordings_daily_col.count_documents(query)
-                    print(f"🔍 [{request_id}] 📅 Documents matching query: {count}")
+                    count = await recordings_daily_col.count_documents(query)
+                    logger.debug(f"🔍 [{request_id}] 📅 Documents matching query: {count}")
 
                     # Check total documents without filter
-                    total_count = recordings_daily_col.count_documents({})
-                    print(
+                    total_count = await recordings_daily_col.count_documents({})
+                    logger.debug(
                         f"🔍 [{request_id}] 📅 Total documents (no filter): {total_count}"
                     )
 
                     # Check recent documents (last 10) to see if member is in participants
-                    recent_docs = list(
+                    recent_docs = await (
                         recordings_daily_col.find({}).sort("target_date", -1).limit(10)
-                    )
-                    print(f"🔍 [{request_id}] 📅 Recent 10 documents analysis:")
+                    ).to_list(length=10)
+                    logger.debug(f"🔍 [{request_id}] 📅 Recent 10 documents analysis:")
                     for doc in recent_docs:
                         target_date = doc.get("target_date")
                         analysis = doc.get("analysis", {})
@@ -1957,25 +1624,24 @@ class Query:
                                         member_found = True
 
                         status = "✅ MATCH" if member_found else "❌ NO MATCH"
-                        print(
+                        logger.debug(
                             f"🔍 [{request_id}] 📅   {target_date}: {status} | Names: {participant_names[:3]}"
                         )
 
-                # Sync MongoDB query (recordings_daily uses sync client)
-                daily_docs = list(
+                daily_docs = await (
                     recordings_daily_col.find(query)
                     .sort("target_date", -1)
                     .limit(limit * 2)
-                )
+                ).to_list(length=limit * 2)
 
                 # Debug: Show matched dates
                 if member_name and daily_docs:
                     matched_dates = [doc.get("target_date") for doc in daily_docs[:15]]
-                    print(
+                    logger.debug(
                         f"🔍 [{request_id}] 📅 Matched dates (first 15): {matched_dates}"
                     )
                     if len(daily_docs) > 15:
-                        print(
+                        logger.debug(
                             f"🔍 [{request_id}] 📅 ... and {len(daily_docs) - 15} more documents"
                         )
 
@@ -1983,7 +1649,7 @@ class Query:
                     if daily_docs:
                         oldest = daily_docs[-1].get("target_date")
                         newest = daily_docs[0].get("target_date")
-                        print(f"🔍 [{request_id}] 📅 Date range: {newest} to {oldest}")
+                        logger.debug(f"🔍 [{request_id}] 📅 Date range: {newest} to {oldest}")
 
                 daily_before = len(activities)
                 for doc in daily_docs:
@@ -2113,14 +1779,14 @@ class Query:
                     )
 
                 daily_after = len(activities)
-                print(
+                logger.debug(
                     f"🔍 [{request_id}] 📅 recordings_daily activities added: {daily_after - daily_before}"
                 )
             except Exception as e:
                 if "Skip recordings_daily" in str(e):
-                    print(f"🔍 [{request_id}] 📅 {str(e)}")
+                    logger.debug(f"🔍 [{request_id}] 📅 {str(e)}")
                 else:
-                    print(f"Error fetching recordings_daily: {e}")
+                    logger.warning(f"Error fetching recordings_daily: {e}")
 
         # Sort by timestamp (newest first) and apply pagination
         # Handle mixed datetime/string timestamps
@@ -2148,10 +1814,10 @@ class Query:
 
         activities.sort(key=get_sort_key, reverse=True)
 
-        print(
+        logger.debug(
             f"🔍 [{request_id}] 📊 Total activities before pagination: {len(activities)}"
         )
-        print(
+        logger.debug(
             f"🔍 [{request_id}] 📊 Returning activities[{offset}:{offset + limit}] = {len(activities[offset : offset + limit])} items"
         )
 
@@ -2546,428 +2212,81 @@ class Query:
             generated_at=datetime.utcnow(),
         )
 
+    @strawberry.field
+    async def team_collaborations(
+        self, info, days: int = 90, min_score: float = 5.0, limit: int = 500
+    ) -> TeamCollaborationNetwork:
+        """
+        Get the whole team's collaboration graph (every collaborating pair once).
 
-async def calculate_member_collaborations(
-    db,
-    member_name: str,
-    start_date: datetime,
-    end_date: datetime,
-    min_score: float = 5.0,
-) -> Dict[str, Dict]:
-    """
-    Calculate collaboration scores for a member with all other members.
-
-    Returns:
-        Dict mapping collaborator names to their collaboration data
-    """
-    from collections import defaultdict
-
-    collaborations = defaultdict(
-        lambda: {
-            "name": "",
-            "total_score": 0.0,
-            "interaction_count": 0,
-            "details": [],
-            "common_projects": set(),
-            "first_interaction": None,
-            "last_interaction": None,
-        }
-    )
-
-    # 1. GitHub PR Reviews (weight: 3.0)
-    await calculate_github_pr_collaborations(
-        db, member_name, start_date, end_date, collaborations
-    )
-
-    # 2. Slack Thread Participation (weight: 2.0)
-    await calculate_slack_thread_collaborations(
-        db, member_name, start_date, end_date, collaborations
-    )
-
-    # 3. Meeting Attendance (weight: 2.2) - DISABLED: No recordings_daily collection
-    # await calculate_meeting_collaborations(
-    #     db, member_name, start_date, end_date, collaborations
-    # )
-
-    # 4. GitHub Issue Discussions (weight: 1.5)
-    await calculate_github_issue_collaborations(
-        db, member_name, start_date, end_date, collaborations
-    )
-
-    # Filter by minimum score and convert sets to lists
-    filtered = {}
-    for collab_name, data in collaborations.items():
-        if data["total_score"] >= min_score:
-            data["common_projects"] = list(data["common_projects"])
-            filtered[collab_name] = data
-
-    return filtered
-
-
-async def calculate_github_pr_collaborations(
-    db, member_name: str, start_date: datetime, end_date: datetime, collaborations: Dict
-):
-    """Calculate collaborations from GitHub PR reviews."""
-    # Get member's GitHub username
-    member_id_doc = await db["member_identifiers"].find_one(
-        {"member_name": member_name, "source": "github", "identifier_type": "username"}
-    )
-
-    if not member_id_doc:
-        return
-
-    github_username = member_id_doc.get("identifier_value")
-    if not github_username:
-        return
-
-    # Find PRs where member is author or reviewer
-    prs = db["github_pull_requests"].find(
-        {
-            "created_at": {"$gte": start_date, "$lte": end_date},
-            "$or": [{"author": github_username}, {"reviews.reviewer": github_username}],
-        }
-    )
-
-    async for pr in prs:
-        author = pr.get("author", "")
-        reviewers = set()
-
-        for review in pr.get("reviews", []):
-            reviewer = review.get("reviewer")
-            if reviewer:
-                reviewers.add(reviewer)
-
-        # Get project from repository
-        repo = pr.get("repository", "")
-        project_key = await get_project_from_repo(db, repo)
-
-        # If member is author, collaborators are reviewers
-        if author == github_username:
-            for reviewer in reviewers:
-                if reviewer != github_username:
-                    await add_collaboration(
-                        db,
-                        collaborations,
-                        reviewer,
-                        "github_pr_review",
-                        3.0,
-                        pr.get("created_at"),
-                        project_key,
-                    )
-
-        # If member is reviewer, collaborator is author
-        if github_username in reviewers and author != github_username:
-            await add_collaboration(
-                db,
-                collaborations,
-                author,
-                "github_pr_review",
-                3.0,
-                pr.get("created_at"),
-                project_key,
-            )
-
+        Scored like member_collaborations, folded from the materialized
+        collaboration_daily buckets.
 
-async def calculate_slack_thread_collaborations(
-    db, member_name: str, start_date: datetime, end_date: datetime, collaborations: Dict
-):
-    """Calculate collaborations from Slack thread participation."""
-    # Find threads where member participated
-    member_threads = set()
-    async for msg in db["slack_messages"].find(
-        {
-            "user_name": member_name.lower(),
-            "posted_at": {"$gte": start_date, "$lte": end_date},
-            "thread_ts": {"$exists": True, "$ne": None},
-        }
-    ):
-        member_threads.add(msg["thread_ts"])
-
-    # For each thread, find co-participants
-    for thread_ts in member_threads:
-        messages = db["slack_messages"].find(
-            {
-                "thread_ts": thread_ts,
-                "posted_at": {"$gte": start_date, "$lte": end_date},
-            }
-        )
+        Args:
+            days: Time range in days (default: 90)
+            min_score: Minimum pair score threshold
+            limit: Max number of edges to return (highest score first)
 
-        co_participants = set()
-        latest_time = None
-        channel_id = None
-
-        async for msg in messages:
-            user = msg.get("user_name", "")
-            if user and user != member_name.lower():
-                co_participants.add(user)
-
-            msg_time = msg.get("posted_at")
-            if msg_time and (not latest_time or msg_time > latest_time):
-                latest_time = msg_time
-
-            if not channel_id:
-                channel_id = msg.get("channel_id")
-
-        # Get project from channel
-        project_key = await get_project_from_channel(db, channel_id)
-
-        # Add collaboration for each co-participant
-        for co_participant in co_participants:
-            await add_collaboration(
-                db,
-                collaborations,
-                co_participant,
-                "slack_thread",
-                2.0,
-                latest_time,
-                project_key,
-            )
+        Returns:
+            TeamCollaborationNetwork with members and weighted edges
+        """
+        db = info.context["db"]
 
+        from datetime import timedelta
 
-async def calculate_meeting_collaborations(
-    db, member_name: str, start_date: datetime, end_date: datetime, collaborations: Dict
-):
-    """Calculate collaborations from meeting attendance."""
-    # Find recordings where member participated
-    recordings = db["recordings_daily"].find(
-        {
-            "target_date": {
-                "$gte": start_date.strftime("%Y-%m-%d"),
-                "$lte": end_date.strftime("%Y-%m-%d"),
-            },
-            "analysis.participants.name": member_name,
-        }
-    )
-
-    async for recording in recordings:
-        participants = recording.get("analysis", {}).get("participants", [])
-        meeting_date_str = recording.get("target_date")
-        meeting_date = (
-            datetime.fromisoformat(meeting_date_str) if meeting_date_str else None
-        )
+        end_date = datetime.utcnow()
+        start_date = end_date - timedelta(days=days)
 
-        # Extract project from title or metadata
-        title = recording.get("title", "")
-        project_key = extract_project_from_title(title)
-
-        # Add collaboration with each co-participant
-        for participant in participants:
-            participant_name = participant.get("name", "")
-            if participant_name and participant_name != member_name:
-                await add_collaboration(
-                    db,
-                    collaborations,
-                    participant_name,
-                    "meeting",
-                    2.2,
-                    meeting_date,
-                    project_key,
+        matrix = await load_collaboration_matrix(db, start_date, end_date)
+        edges = matrix.edges(min_score=min_score)[:limit]
+
+        return TeamCollaborationNetwork(
+            members=sorted({e["source_name"] for e in edges} | {e["target_name"] for e in edges}),
+            edges=[
+                CollaborationEdge(
+                    source_name=e["source_name"],
+                    target_name=e["target_name"],
+                    total_score=e["total_score"],
+                    interaction_count=e["interaction_count"],
+                    collaboration_details=[
+                        CollaborationDetail(
+                            source=d["source"],
+                            activity_count=d["count"],
+                            score=d["score"],
+                            recent_activity=d.get("recent_activity"),
+                        )
+                        for d in e["details"]
+                    ],
+                    common_projects=e["common_projects"],
+                    last_interaction=e.get("last_interaction"),
                 )
-
-
-async def calculate_github_issue_collaborations(
-    db, member_name: str, start_date: datetime, end_date: datetime, collaborations: Dict
-):
-    """Calculate collaborations from GitHub issue discussions."""
-    # Get member's GitHub username
-    member_id_doc = await db["member_identifiers"].find_one(
-        {"member_name": member_name, "source": "github", "identifier_type": "username"}
-    )
-
-    if not member_id_doc:
-        return
-
-    github_username = member_id_doc.get("identifier_value")
-    if not github_username:
-        return
-
-    # Find issues where member commented
-    issues = db["github_issues"].find(
-        {
-            "created_at": {"$gte": start_date, "$lte": end_date},
-            "$or": [
-                {"user.login": github_username},
-                {"assignees.login": github_username},
+                for e in edges
             ],
-        }
-    )
-
-    async for issue in issues:
-        author = issue.get("user", {}).get("login", "")
-        assignees = {a.get("login") for a in issue.get("assignees", [])}
-
-        repo = issue.get("repository_name", "")
-        project_key = await get_project_from_repo(db, repo)
-
-        # Collaborators are author + assignees (excluding self)
-        collaborators = {author} | assignees
-        collaborators.discard(github_username)
-        collaborators.discard("")
-
-        for collaborator in collaborators:
-            await add_collaboration(
-                db,
-                collaborations,
-                collaborator,
-                "github_issue",
-                1.5,
-                issue.get("created_at"),
-                project_key,
-            )
-
-
-async def add_collaboration(
-    db,
-    collaborations: Dict,
-    identifier: str,
-    source: str,
-    weight: float,
-    timestamp: Optional[datetime],
-    project_key: Optional[str],
-):
-    """Add a collaboration interaction to the collaborations dict."""
-    # Convert GitHub username to member name if needed
-    if source.startswith("github"):
-        member_name = await get_member_name_from_github(db, identifier)
-    elif source.startswith("slack"):
-        member_name = await get_member_name_from_slack_username(db, identifier)
-    else:
-        member_name = identifier.title()
-
-    if not member_name or member_name == identifier:
-        # Try to capitalize properly
-        member_name = identifier.title()
-
-    # Calculate recency multiplier (recent = higher score)
-    recency_multiplier = 1.0
-    if timestamp:
-        days_ago = (datetime.utcnow() - timestamp).days
-        recency_multiplier = max(0.3, 1.0 - (days_ago / 90))
-
-    score = weight * recency_multiplier
-
-    # Update collaboration data
-    collab = collaborations[member_name]
-    if not collab["name"]:
-        collab["name"] = member_name
-
-    collab["total_score"] += score
-    collab["interaction_count"] += 1
-
-    # Update timestamps
-    if timestamp:
-        if not collab["first_interaction"] or timestamp < collab["first_interaction"]:
-            collab["first_interaction"] = timestamp
-        if not collab["last_interaction"] or timestamp > collab["last_interaction"]:
-            collab["last_interaction"] = timestamp
-
-    # Add project
-    if project_key:
-        collab["common_projects"].add(project_key)
-
-    # Add to details
-    existing_detail = next(
-        (d for d in collab["details"] if d["source"] == source), None
-    )
-    if existing_detail:
-        existing_detail["count"] += 1
-        existing_detail["score"] += score
-        if timestamp and (
-            not existing_detail.get("recent_activity")
-            or timestamp > existing_detail["recent_activity"]
-        ):
-            existing_detail["recent_activity"] = timestamp
-    else:
-        collab["details"].append(
-            {"source": source, "count": 1, "score": score, "recent_activity": timestamp}
+            time_range_days=days,
+            generated_at=datetime.utcnow(),
         )
 
 
-async def get_member_name_from_github(db, github_username: str) -> Optional[str]:
-    """Get member name from GitHub username."""
-    doc = await db["member_identifiers"].find_one(
-        {
-            "source": "github",
-            "identifier_type": "username",
-            "identifier_value": github_username,
-        }
-    )
-    return doc.get("member_name") if doc else None
-
-
-async def get_member_name_from_slack_username(db, slack_username: str) -> Optional[str]:
-    """Get member name from Slack username."""
-    # Slack stores lowercase usernames
-    doc = await db["member_identifiers"].find_one(
-        {
-            "source": "slack",
-            "identifier_value": {"$regex": f"^{slack_username}$", "$options": "i"},
-        }
-    )
-    return doc.get("member_name") if doc else None
-
-
-async def get_project_from_repo(db, repo_name: str) -> Optional[str]:
-    """Get project key from repository name."""
-    if not repo_name:
-        return None
-
-    # Projects collection is empty, so infer from repo name
-    repo_lower = repo_name.lower()
-
-    if "zk" in repo_lower or "ooo" in repo_lower or "zkp" in repo_lower:
-        return "ooo"
-    elif "rollup" in repo_lower or "trh" in repo_lower:
-        return "trh"
-    elif "drb" in repo_lower:
-        return "drb"
-    elif "eco" in repo_lower or "grants" in repo_lower:
-        return "eco"
-    elif "syb" in repo_lower or "sybil" in repo_lower:
-        return "syb"
-
-    return None
-
-
-async def get_project_from_channel(db, channel_id: str) -> Optional[str]:
-    """Get project key from Slack channel ID."""
-    if not channel_id:
-        return None
-
-    # Get channel name from channels collection
-    channel = await db["slack_channels"].find_one({"channel_id": channel_id})
-    if not channel:
-        return None
-
-    channel_name = channel.get("name", "").lower()
-
-    if "ooo" in channel_name or "zkp" in channel_name:
-        return "ooo"
-    elif "trh" in channel_name or "rollup" in channel_name:
-        return "trh"
-    elif "drb" in channel_name:
-        return "drb"
-    elif "eco" in channel_name:
-        return "eco"
-    elif "syb" in channel_name or "sybil" in channel_name:
-        return "syb"
-
-    return None
+async def calculate_member_collaborations(
+    db,
+    member_name: str,
+    start_date: datetime,
+    end_date: datetime,
+    min_score: float = 5.0,
+) -> Dict[str, Dict]:
+    """
+    Calculate collaboration scores for a member with all other members.
 
+    Sources (see src/core/collaboration.py): GitHub PR reviews (3.0),
+    Slack threads (2.0) and GitHub issues (1.5). Meeting attendance is not
+    scored: there is no recordings_daily collection in this database.
 
-def extract_project_from_title(title: str) -> Optional[str]:
-    """Extract project key from meeting title."""
-    title_lower = title.lower()
+    Read from the materialized day buckets (src/core/collaboration_store.py),
+    which collectors keep up to date.
 
-    if "ooo" in title_lower or "zk" in title_lower:
-        return "ooo"
-    elif "trh" in title_lower or "rollup" in title_lower:
-        return "trh"
-    elif "drb" in title_lower:
-        return "drb"
-    elif "eco" in title_lower or "ecosystem" in title_lower:
-        return "eco"
-    elif "syb" in title_lower or "sybil" in title_lower:
-        return "syb"
+    Returns:
+        Dict mapping collaborator names to their collaboration data
+    """
+    matrix = await load_collaboration_matrix(db, start_date, end_date, member_name=member_name)
+    return matrix.network(member_name, min_score=min_score)
 
-    return None
@@ -10,7 +10,8 @@ from .queries import Query
 from .mutations import Mutation
 from .extensions import (
     PerformanceMonitoringExtension,
-    QueryComplexityExtension,
+    QueryCostExtension,
+    ResponseCacheExtension,
     ErrorLoggingExtension,
 )
 
@@ -31,8 +32,12 @@ schema = strawberry.Schema(
         # Monitoring: Track query performance
         PerformanceMonitoringExtension,
         
-        # Monitoring: Analyze query complexity
-        QueryComplexityExtension,
+        # Performance: Serve repeated queries from the response cache
+        # (registered before the cost check so cache hits are not charged)
+        ResponseCacheExtension,
+        
+        # Security: Reject and throttle expensive queries by estimated cost
+        QueryCostExtension,
         
         # Logging: Log errors with context
         ErrorLoggingExtension,
@@ -62,6 +62,12 @@ class Member:
         """
         from bson import ObjectId
 
+        dataloaders = info.context.get("dataloaders")
+        if dataloaders:
+            docs = await dataloaders["member_projects"].load(self.id)
+            # Fallback to legacy projects field for malformed IDs
+            return self.projects if docs is None else [doc["key"] for doc in docs]
+
         db = info.context["db"]
         project_keys = []
 
@@ -91,43 +97,27 @@ class Member:
         db = info.context["db"]
         projects = []
 
-        # Find all active projects where this member's ID is in member_ids
-        try:
-            member_oid = ObjectId(self.id)
-            async for doc in db["projects"].find(
-                {"member_ids": member_oid, "is_active": True}
-            ):
-                projects.append(
-                    Project(
-                        id=str(doc["_id"]),
-                        key=doc["key"],
-                        name=doc.get("name", doc["key"]),
-                        description=doc.get("description"),
-                        slack_channel=doc.get("slack_channel"),
-                        lead=doc.get("lead"),
-                        repositories=doc.get("repositories", []),
-                        is_active=doc.get("is_active", True),
-                        member_ids=doc.get("member_ids", []),
-                    )
-                )
-        except Exception as e:
-            logger.warning(f"Error fetching project details for member {self.id}: {e}")
-            # Fallback to legacy behavior
-            if self.projects:
-                async for doc in db["projects"].find({"key": {"$in": self.projects}}):
-                    projects.append(
-                        Project(
-                            id=str(doc["_id"]),
-                            key=doc["key"],
-                            name=doc.get("name", doc["key"]),
-                            description=doc.get("description"),
-                            slack_channel=doc.get("slack_channel"),
-                            lead=doc.get("lead"),
-                            repositories=doc.get("repositories", []),
-                            is_active=doc.get("is_active", True),
-                            member_ids=doc.get("member_ids", []),
-                        )
-                    )
+        dataloaders = info.context.get("dataloaders")
+        if dataloaders:
+            docs = await dataloaders["member_projects"].load(self.id)
+            if docs is not None:
+                return [project_from_doc(doc) for doc in docs]
+        else:
+            # Find all active projects where this member's ID is in member_ids
+            try:
+                member_oid = ObjectId(self.id)
+                async for doc in db["projects"].find(
+                    {"member_ids": member_oid, "is_active": True}
+                ):
+                    projects.append(project_from_doc(doc))
+                return projects
+            except Exception as e:
+                logger.warning(f"Error fetching project details for member {self.id}: {e}")
+
+        # Fallback to legacy behavior (malformed member ID)
+        if self.projects:
+            async for doc in db["projects"].find({"key": {"$in": self.projects}}):
+                projects.append(project_from_doc(doc))
 
         return projects
 
@@ -239,6 +229,10 @@ class Member:
         Returns:
             List of Collaborator objects
         """
+        dataloaders = info.context.get("dataloaders")
+        if dataloaders:
+            return await dataloaders["top_collaborators"].load((self.name, limit))
+
         from .queries import get_top_collaborators
 
         return await get_top_collaborators(
@@ -258,6 +252,10 @@ class Member:
         Returns:
             List of RepositoryActivity objects
         """
+        dataloaders = info.context.get("dataloaders")
+        if dataloaders:
+            return await dataloaders["active_repositories"].load((self.name, limit))
+
         from .queries import get_active_repositories
 
         return await get_active_repositories(
@@ -272,6 +270,10 @@ class Member:
         Returns:
             ActivityStats object with detailed metrics
         """
+        dataloaders = info.context.get("dataloaders")
+        if dataloaders:
+            return await dataloaders["activity_stats"].load(self.name)
+
         from .queries import get_activity_stats
 
         return await get_activity_stats(db=info.context["db"], member_name=self.name)
@@ -655,10 +657,17 @@ class Project:
                 f"[Project.members] Project {self.key}: {len(invalid_ids)} invalid member_ids found: {invalid_ids}"
             )
 
-        # Fetch members from database
+        # Fetch members from database (batched across projects when possible)
+        dataloaders = info.context.get("dataloaders")
+        if dataloaders:
+            docs = await dataloaders["members_by_id"].load_many([str(oid) for oid in object_ids])
+            docs = [doc for doc in docs if doc]
+        else:
+            docs = await db["members"].find({"_id": {"$in": object_ids}}).to_list(length=None)
+
         members = []
         found_ids = set()
-        async for doc in db["members"].find({"_id": {"$in": object_ids}}):
+        for doc in docs:
             found_ids.add(str(doc["_id"]))
             members.append(
                 Member(
@@ -724,44 +733,30 @@ class Project:
         end_date: Optional[datetime] = None,
     ) -> ActivitySummary:
         """Get activity statistics for this project"""
-        db = info.context["db"]
-
-        # Count GitHub activities for project repositories
-        github_query = {"repository": {"$in": self.repositories}}
-        if start_date:
-            github_query["date"] = {"$gte": start_date}
-        if end_date:
-            github_query["date"] = github_query.get("date", {})
-            github_query["date"]["$lte"] = end_date
-
-        github_commits = await db["github_commits"].count_documents(github_query)
-        github_prs = await db["github_pull_requests"].count_documents(github_query)
-
-        # Count Slack activities (if slack_channel exists)
-        slack_count = 0
-        if self.slack_channel and self.slack_channel != "tokamak-partners":
-            slack_query = {"channel_name": self.slack_channel}
-            if start_date:
-                slack_query["posted_at"] = {"$gte": start_date}
-            if end_date:
-                slack_query["posted_at"] = slack_query.get("posted_at", {})
-                slack_query["posted_at"]["$lte"] = end_date
-
-            slack_count = await db["slack_messages"].count_documents(slack_query)
-
-        total = github_commits + github_prs + slack_count
-
-        return ActivitySummary(
-            total=total,
-            by_source={"github": github_commits + github_prs, "slack": slack_count},
-            by_type={
-                "commit": github_commits,
-                "pull_request": github_prs,
-                "message": slack_count,
-            },
-            date_range_start=start_date,
-            date_range_end=end_date,
-        )
+        key = (tuple(self.repositories), self.slack_channel, start_date, end_date)
+        dataloaders = info.context.get("dataloaders")
+        if dataloaders:
+            return await dataloaders["project_activity_summaries"].load(key)
+
+        from .dataloaders import load_project_activity_summaries_batch
+
+        summaries = await load_project_activity_summaries_batch([key], info.context["db"])
+        return summaries[0]
+
+
+def project_from_doc(doc) -> Project:
+    """Build a Project (member view) from a ``projects`` document"""
+    return Project(
+        id=str(doc["_id"]),
+        key=doc["key"],
+        name=doc.get("name", doc["key"]),
+        description=doc.get("description"),
+        slack_channel=doc.get("slack_channel"),
+        lead=doc.get("lead"),
+        repositories=doc.get("repositories", []),
+        is_active=doc.get("is_active", True),
+        member_ids=doc.get("member_ids", []),
+    )
 
 
 @strawberry.type
@@ -865,3 +860,30 @@ class CollaborationNetwork:
     time_range_days: int
     total_score: float  # Sum of all collaboration scores
     generated_at: datetime
+
+
+@strawberry.type
+class CollaborationEdge:
+    """
+    Collaboration between two members in the team network (undirected).
+    """
+
+    source_name: str
+    target_name: str
+    total_score: float
+    interaction_count: int
+    collaboration_details: List[CollaborationDetail]
+    common_projects: List[str]
+    last_interaction: Optional[datetime] = None
+
+
+@strawberry.type
+class TeamCollaborationNetwork:
+    """
+    Collaboration graph of the whole team.
+    """
+
+    members: List[str]
+    edges: List[CollaborationEdge]
+    time_range_days: int
+    generated_at: datetime
@@ -8,6 +8,7 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
+import asyncio
 import sys
 import os
 from pathlib import Path
@@ -18,9 +19,12 @@ sys.path.insert(0, str(project_root))
 
 from src.core.config import Config
 from src.core.mongo_manager import get_mongo_manager
+from src.core.index_manifest import run_index_advisor
 from src.utils.logger import get_logger
 from src.scheduler.slack_scheduler import SlackScheduler
-from backend.api.v1 import query_mongo, members_mongo, activities_mongo, projects_mongo, projects_management, exports_mongo, database_mongo, auth, oauth, tenants, stats_mongo, notion_export_mongo, ai_processed, custom_export, ai_proxy, mcp_api, mcp_agent, slack_bot, notion_diff, reports, weekly_output_schedules, support_bot, onboarding, benchmarks, report_distribution
+from backend.middleware import profiling
+from backend.middleware.profiling import ProfilingMiddleware
+from backend.api.v1 import query_mongo, members_mongo, activities_mongo, projects_mongo, projects_management, exports_mongo, database_mongo, auth, oauth, tenants, stats_mongo, notion_export_mongo, ai_processed, custom_export, export_jobs, ai_proxy, mcp_api, mcp_agent, slack_bot, notion_diff, reports, weekly_output_schedules, support_bot, onboarding, benchmarks, report_distribution, search
 
 logger = get_logger(__name__)
 
@@ -56,12 +60,23 @@ async def lifespan(app: FastAPI):
     await slack_scheduler.start()
     app.state.slack_scheduler = slack_scheduler
     
+    # Re-queue background exports interrupted by the last shutdown
+    asyncio.create_task(export_jobs.resume_export_jobs())
+    
+    # Explain the registered query shapes and log COLLSCANs / in-memory sorts
+    if os.getenv('INDEX_ADVISOR', '1') != '0':
+        asyncio.create_task(mongo_manager.run_sync(run_index_advisor, mongo_manager))
+    
+    # Optional sampling profiler (folded stacks at /metrics/profile)
+    profiling.start_profiler_from_env()
+    
     print("✅ API startup complete")
     
     yield
     
     # Shutdown
     logger.info("🔒 Shutting down All-Thing-Eye API...")
+    profiling.sampling_profiler.stop()
     mongo_manager.close()
     logger.info("✅ API shutdown complete")
 
@@ -87,6 +102,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Profiling: per-route latency histograms and Mongo command attribution (/metrics)
+app.add_middleware(ProfilingMiddleware)
+app.include_router(profiling.router, tags=["metrics"])
+
 
 # Root endpoint
 @app.get("/")
@@ -192,6 +211,13 @@ app.include_router(
     tags=["activities"]
 )
 
+# Full-text search across all activity sources
+app.include_router(
+    search.router,
+    prefix="/api/v1",
+    tags=["search"]
+)
+
 app.include_router(
     projects_mongo.router,
     prefix="/api/v1",
@@ -245,6 +271,13 @@ app.include_router(
     tags=["custom-export"]
 )
 
+# Export job routes (background custom exports)
+app.include_router(
+    export_jobs.router,
+    prefix="/api/v1",
+    tags=["custom-export"]
+)
+
 # Reports routes (Biweekly report generation)
 app.include_router(
     reports.router,
@@ -333,6 +366,7 @@ try:
         db = mongo_manager.async_db
         return {
             'db': db,
+            'tenant': db.name,
             'config': app.state.config,
             'dataloaders': create_dataloaders(db),
         }
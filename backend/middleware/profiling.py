@@ -0,0 +1,138 @@
+"""
+Profiling Middleware for All-Thing-Eye
+
+Records per-route latency histograms, attributes MongoDB commands to the
+request that issued them and exposes everything at ``/metrics`` in the
+Prometheus text format. See ``src/utils/profiling.py``.
+
+Environment:
+    PROFILING_SLOW_REQUEST_SECONDS: Log requests slower than this with their
+        most expensive Mongo commands (default: 2.0)
+    PROFILER_SAMPLING: Start the sampling profiler at startup ("1")
+"""
+
+import os
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from backend.middleware.jwt_auth import require_admin
+from src.utils.logger import get_logger
+from src.utils.profiling import (
+    RequestProfile,
+    current_profile,
+    http_request_duration,
+    metrics,
+    sampling_profiler,
+)
+
+logger = get_logger(__name__)
+
+SLOW_REQUEST_SECONDS = float(os.getenv("PROFILING_SLOW_REQUEST_SECONDS", "2.0"))
+
+# Not profiled: scrapes and probes would dominate the histograms
+EXCLUDED_PATHS = {"/metrics", "/health"}
+
+
+def route_template(scope) -> str:
+    """Route path template (``/api/v1/members/{member_id}``), bounded cardinality"""
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    if path:
+        return path
+    return "unmatched"
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware timing every HTTP request
+
+    A ``RequestProfile`` is set in a context variable for the duration of the
+    request so the Mongo command listener can attribute commands to it. The
+    response carries a ``Server-Timing`` header with the database and total
+    time.
+    """
+
+    def __init__(self, app, slow_seconds: float = SLOW_REQUEST_SECONDS):
+        self.app = app
+        self.slow_seconds = slow_seconds
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope.get("path") in EXCLUDED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(route="unmatched", method=scope.get("method", ""))
+        token = current_profile.set(profile)
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                # Routing has happened by now; later Mongo commands use the template
+                profile.route = route_template(scope)
+                headers = list(message.get("headers", []))
+                timing = f"db;dur={profile.mongo_seconds * 1000:.1f}, app;dur={profile.elapsed() * 1000:.1f}"
+                headers.append((b"server-timing", timing.encode("latin-1")))
+                message = dict(message, headers=headers)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_profile.reset(token)
+            profile.route = route_template(scope)
+            elapsed = profile.elapsed()
+            http_request_duration.observe(elapsed, profile.method, profile.route, str(status["code"]))
+
+            if self.slow_seconds and elapsed >= self.slow_seconds:
+                logger.warning(
+                    f"🐢 Slow request {profile.method} {profile.route} took {elapsed:.2f}s, "
+                    f"{profile.mongo_commands} Mongo commands ({profile.mongo_seconds:.2f}s): "
+                    f"{profile.summary() or 'no Mongo commands'}"
+                )
+
+
+router = APIRouter()
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Prometheus scrape endpoint"""
+    return PlainTextResponse(
+        metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+@router.get("/metrics/profile", response_class=PlainTextResponse)
+async def get_profile(
+    limit: int = Query(500, ge=1, le=10000),
+    reset: bool = Query(False),
+    admin: str = Depends(require_admin),
+):
+    """Folded stacks from the sampling profiler (flamegraph input)"""
+    if not sampling_profiler.running and not sampling_profiler.samples:
+        raise HTTPException(status_code=404, detail="Sampling profiler is not running")
+
+    body = sampling_profiler.folded(limit)
+    if reset:
+        sampling_profiler.reset()
+    return PlainTextResponse(body)
+
+
+@router.post("/metrics/profile/{action}")
+async def toggle_profile(action: str, admin: str = Depends(require_admin)):
+    """Start or stop the sampling profiler at runtime"""
+    if action == "start":
+        sampling_profiler.start()
+    elif action == "stop":
+        sampling_profiler.stop()
+    else:
+        raise HTTPException(status_code=400, detail="action must be 'start' or 'stop'")
+    return {"running": sampling_profiler.running, "samples": sampling_profiler.samples}
+
+
+def start_profiler_from_env() -> None:
+    """Start the sampling profiler when ``PROFILER_SAMPLING=1``"""
+    if os.getenv("PROFILER_SAMPLING", "0") == "1":
+        sampling_profiler.start()
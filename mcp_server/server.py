@@ -7,6 +7,7 @@ for AI assistants to interact with the All-Thing-Eye platform data.
 
 import asyncio
 import os
+import re
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -43,6 +44,7 @@ if env_path.exists():
 # Import MongoDB manager
 from src.core.config import Config
 from src.core.mongo_manager import get_mongo_manager
+from src.core.search_index import search_timeline
 
 # Initialize config and MongoDB
 config = Config()
@@ -288,7 +290,7 @@ async def list_tools() -> List[Tool]:
                     },
                     "source": {
                         "type": "string",
-                        "enum": ["github", "slack", "notion", "all"],
+                        "enum": ["github", "slack", "notion", "drive", "recordings", "all"],
                         "description": "Source to search in (default: all)",
                         "default": "all"
                     },
@@ -367,7 +369,7 @@ async def _get_member_activity(db, args: Dict[str, Any]) -> Dict:
     start_date = datetime.utcnow() - timedelta(days=days)
     
     # Find member
-    member = db['members'].find_one({'name': {'$regex': member_name, '$options': 'i'}})
+    member = db['members'].find_one({'name': {'$regex': re.escape(member_name), '$options': 'i'}})
     if not member:
         return {"error": f"Member '{member_name}' not found"}
     
@@ -379,14 +381,14 @@ async def _get_member_activity(db, args: Dict[str, Any]) -> Dict:
     if github_username:
         commit_query['author_login'] = github_username
     else:
-        commit_query['author_login'] = {'$regex': member_name_exact, '$options': 'i'}
+        commit_query['author_login'] = {'$regex': re.escape(member_name_exact), '$options': 'i'}
     
     commits = list(db['github_commits'].find(commit_query, {'_id': 0, 'sha': 1, 'message': 1, 'repository': 1, 'committed_at': 1}).limit(50))
     
     # Get Slack messages
     message_query = {
         'timestamp': {'$gte': start_date},
-        'user_name': {'$regex': member_name_exact, '$options': 'i'}
+        'user_name': {'$regex': re.escape(member_name_exact), '$options': 'i'}
     }
     messages = db['slack_messages'].count_documents(message_query)
     
@@ -488,7 +490,7 @@ async def _compare_contributors(db, args: Dict[str, Any]) -> Dict:
     
     results = {}
     for name in member_names:
-        member = db['members'].find_one({'name': {'$regex': name, '$options': 'i'}})
+        member = db['members'].find_one({'name': {'$regex': re.escape(name), '$options': 'i'}})
         if not member:
             results[name] = {"error": "Member not found"}
             continue
@@ -604,7 +606,7 @@ async def _get_top_contributors(db, args: Dict[str, Any]) -> Dict:
 
 
 async def _search_activities(db, args: Dict[str, Any]) -> Dict:
-    """Search activities by keyword"""
+    """Search activities by keyword (ranked, via the timeline text index)"""
     keyword = args["keyword"]
     source = args.get("source", "all")
     member_name = args.get("member_name")
@@ -612,43 +614,30 @@ async def _search_activities(db, args: Dict[str, Any]) -> Dict:
     limit = args.get("limit", 20)
     
     start_date = datetime.utcnow() - timedelta(days=days)
-    results = []
-    
-    if source in ["github", "all"]:
-        query = {
-            'committed_at': {'$gte': start_date},
-            'message': {'$regex': keyword, '$options': 'i'}
-        }
-        if member_name:
-            query['author_login'] = {'$regex': member_name, '$options': 'i'}
-        
-        for commit in db['github_commits'].find(query).limit(limit // 2 if source == "all" else limit):
-            results.append({
-                "source": "github",
-                "type": "commit",
-                "author": commit.get('author_login'),
-                "message": commit.get('message', '')[:200],
-                "repository": commit.get('repository'),
-                "timestamp": commit.get('committed_at')
-            })
-    
-    if source in ["slack", "all"]:
-        query = {
-            'timestamp': {'$gte': start_date},
-            'text': {'$regex': keyword, '$options': 'i'}
+    try:
+        page = search_timeline(
+            db,
+            keyword,
+            limit=limit,
+            source_type=None if source == "all" else source,
+            member_name=member_name,
+            start_date=start_date.isoformat(),
+        )
+    except ValueError as e:
+        return {"error": str(e)}
+    
+    results = [
+        {
+            "source": hit["source_type"],
+            "type": hit["activity_type"],
+            "author": hit["member_name"],
+            "title": hit["title"],
+            "message": hit["snippet"],
+            "url": hit["metadata"].get("url"),
+            "timestamp": hit["timestamp"],
         }
-        if member_name:
-            query['user_name'] = {'$regex': member_name, '$options': 'i'}
-        
-        for msg in db['slack_messages'].find(query).limit(limit // 2 if source == "all" else limit):
-            results.append({
-                "source": "slack",
-                "type": "message",
-                "author": msg.get('user_name'),
-                "message": msg.get('text', '')[:200],
-                "channel": msg.get('channel_name'),
-                "timestamp": msg.get('timestamp')
-            })
+        for hit in page["results"]
+    ]
     
     return {
         "keyword": keyword,
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Backfill Daily Activity Rollups Script
+
+Rebuilds ``daily_activity_rollups`` from ``activity_timeline``. Safe to
+re-run: every (date, source) bucket is recomputed from scratch.
+
+Collectors refresh the buckets they touch after the initial backfill; run
+this after editing timeline rows by hand or changing member/project mappings.
+
+Usage:
+    # Rebuild every day that has timeline rows
+    python scripts/backfill_activity_rollups.py
+
+    # Last 90 days only
+    python scripts/backfill_activity_rollups.py --days 90
+"""
+
+import os
+import sys
+from pathlib import Path
+from datetime import datetime, timedelta
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from src.core.mongo_manager import get_mongo_manager
+from src.core.activity_rollups import ensure_rollup_indexes, rebuild_rollups
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Rebuild the daily_activity_rollups collection")
+    parser.add_argument("--days", type=int, help="Only rebuild the last N days")
+    args = parser.parse_args()
+
+    mongodb_config = {
+        "uri": os.getenv("MONGODB_URI", "mongodb://localhost:27017"),
+        "database": os.getenv("MONGODB_DATABASE", "all_thing_eye"),
+    }
+    mongo_manager = get_mongo_manager(mongodb_config)
+
+    since = datetime.utcnow() - timedelta(days=args.days) if args.days else None
+
+    try:
+        ensure_rollup_indexes(mongo_manager.db)
+
+        logger.info("=" * 80)
+        logger.info("🧮 Backfilling daily_activity_rollups")
+        logger.info(f"   Since: {since.date().isoformat() if since else 'beginning'}")
+        logger.info("=" * 80)
+
+        written = rebuild_rollups(mongo_manager.db, since)
+        logger.info(f"✅ Backfill complete: {written:,} rollup documents written")
+    finally:
+        mongo_manager.close()
+
+
+if __name__ == "__main__":
+    main()
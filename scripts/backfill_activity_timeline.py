@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Backfill Activity Timeline Script
+
+Builds the unified ``activity_timeline`` projection from the existing source
+collections (commits, PRs, reviews, Slack messages, Notion diffs, Drive
+activities and shared recordings). Safe to re-run: rows are upserted by a
+deterministic id. Re-running it also fills the full-text search fields
+(``src/core/search_index.py``) of rows written before they existed.
+
+Collectors keep the timeline up to date after the initial backfill. The
+``daily_activity_rollups`` of the backfilled window are rebuilt once at the
+end. Meeting
+recordings are written into the shared database by an external pipeline, so
+schedule this script (e.g. ``--sources recordings --days 2``) to pick them up.
+
+Usage:
+    # Full backfill of every source
+    python scripts/backfill_activity_timeline.py
+
+    # Last 30 days only
+    python scripts/backfill_activity_timeline.py --days 30
+
+    # Specific sources
+    python scripts/backfill_activity_timeline.py --sources slack_messages recordings
+"""
+
+import os
+import sys
+from pathlib import Path
+from datetime import datetime, timedelta
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from src.core.mongo_manager import get_mongo_manager
+from src.core.activity_rollups import rebuild_rollups
+from src.core.activity_timeline import (
+    NORMALIZERS,
+    ActivityTimelineWriter,
+    ensure_timeline_indexes,
+)
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Source collection -> timestamp field used for the --days window
+TIMESTAMP_FIELDS = {
+    "github_commits": "date",
+    "github_pull_requests": "created_at",
+    "github_reviews": "submitted_at",
+    "slack_messages": "posted_at",
+    "notion_content_diffs": "timestamp",
+    "drive_activities": "timestamp",
+    "recordings": "modifiedTime",
+}
+
+
+def backfill_source(mongo_manager, writer: ActivityTimelineWriter, source: str, since, batch_size: int) -> int:
+    """Stream one source collection into the timeline in batches"""
+    db = mongo_manager.shared_db if source == "recordings" else mongo_manager.db
+    query = {}
+    if since is not None:
+        field = TIMESTAMP_FIELDS[source]
+        # Notion diff timestamps are stored as ISO strings
+        query[field] = {"$gte": since.isoformat() if source == "notion_content_diffs" else since}
+
+    cursor = db[source].find(query, {"files": 0, "raw_event": 0}).batch_size(batch_size)
+
+    written = 0
+    batch = []
+    for doc in cursor:
+        batch.append(doc)
+        if len(batch) >= batch_size:
+            written += writer.write(source, batch)
+            batch = []
+    if batch:
+        written += writer.write(source, batch)
+
+    return written
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Backfill the activity_timeline projection")
+    parser.add_argument(
+        "--sources",
+        nargs="+",
+        choices=list(NORMALIZERS.keys()),
+        default=list(NORMALIZERS.keys()),
+        help="Source collections to backfill (default: all)",
+    )
+    parser.add_argument("--days", type=int, help="Only backfill the last N days")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows per bulk write")
+    args = parser.parse_args()
+
+    mongodb_config = {
+        "uri": os.getenv("MONGODB_URI", "mongodb://localhost:27017"),
+        "database": os.getenv("MONGODB_DATABASE", "all_thing_eye"),
+    }
+    mongo_manager = get_mongo_manager(mongodb_config)
+
+    since = datetime.utcnow() - timedelta(days=args.days) if args.days else None
+
+    try:
+        ensure_timeline_indexes(mongo_manager.db)
+        writer = ActivityTimelineWriter(
+            mongo_manager.db,
+            batch_size=args.batch_size,
+            update_rollups=False,
+            # scripts/build_embedding_index.py backfills the semantic index
+            update_embeddings=False,
+        )
+
+        logger.info("=" * 80)
+        logger.info("🧭 Backfilling activity_timeline")
+        logger.info(f"   Sources: {', '.join(args.sources)}")
+        logger.info(f"   Since: {since.isoformat() if since else 'beginning'}")
+        logger.info("=" * 80)
+
+        total = 0
+        for source in args.sources:
+            try:
+                count = backfill_source(mongo_manager, writer, source, since, args.batch_size)
+                total += count
+                logger.info(f"   ✅ {source:25s}: {count:,} rows written")
+            except Exception as e:
+                logger.error(f"   ❌ {source}: {e}")
+
+        logger.info(f"✅ Backfill complete: {total:,} rows written")
+
+        rollups = rebuild_rollups(mongo_manager.db, since)
+        logger.info(f"✅ Rebuilt {rollups:,} daily activity rollups")
+    finally:
+        mongo_manager.close()
+
+
+if __name__ == "__main__":
+    main()
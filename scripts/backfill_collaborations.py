@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Backfill Collaboration Store Script
+
+Rebuilds ``collaboration_events`` and ``collaboration_daily`` from
+``github_pull_requests``, ``github_issues`` and ``slack_messages``. Safe to
+re-run: events are upserted by id and every touched day is recomputed.
+
+Collectors keep the store up to date after the initial backfill; run this
+after changing member identifiers or project mappings.
+
+Usage:
+    # Rebuild everything
+    python scripts/backfill_collaborations.py
+
+    # Last 90 days only
+    python scripts/backfill_collaborations.py --days 90
+"""
+
+import os
+import sys
+from pathlib import Path
+from datetime import datetime, timedelta
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from src.core.mongo_manager import get_mongo_manager
+from src.core.collaboration_store import CollaborationStore, ensure_collaboration_indexes
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Rebuild the collaboration store")
+    parser.add_argument("--days", type=int, help="Only rebuild the last N days")
+    args = parser.parse_args()
+
+    mongodb_config = {
+        "uri": os.getenv("MONGODB_URI", "mongodb://localhost:27017"),
+        "database": os.getenv("MONGODB_DATABASE", "all_thing_eye"),
+    }
+    mongo_manager = get_mongo_manager(mongodb_config)
+
+    since = datetime.utcnow() - timedelta(days=args.days) if args.days else None
+
+    try:
+        ensure_collaboration_indexes(mongo_manager.db)
+
+        logger.info("=" * 80)
+        logger.info("🤝 Backfilling collaboration store")
+        logger.info(f"   Since: {since.date().isoformat() if since else 'beginning'}")
+        logger.info("=" * 80)
+
+        written = CollaborationStore(mongo_manager.db).rebuild(since)
+        logger.info(f"✅ Backfill complete: {written:,} day buckets written")
+    finally:
+        mongo_manager.close()
+
+
+if __name__ == "__main__":
+    main()
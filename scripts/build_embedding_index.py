@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Build Embedding Index Script
+
+Backfills the semantic index (``src/core/embedding_index.py``) from the
+existing Slack messages, commit messages, Notion diffs and the AI meeting
+analyses in ``gemini.recordings``. Safe to re-run: chunks whose content did
+not change keep their vectors.
+
+Collectors keep Slack, GitHub and Notion up to date after the initial
+backfill. Meeting analyses are written into the gemini database by an
+external pipeline, so schedule this script (e.g. ``--sources
+gemini_recordings --days 2``) to pick them up.
+
+Usage:
+    # Full backfill of every source
+    python scripts/build_embedding_index.py
+
+    # Last 30 days only
+    python scripts/build_embedding_index.py --days 30
+
+    # Start over (e.g. after switching embedding_index.embedder)
+    python scripts/build_embedding_index.py --rebuild
+"""
+
+import os
+import shutil
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from src.core.config import get_config
+from src.core.mongo_manager import get_mongo_manager
+from src.core.embedding_index import (
+    CHUNKS_COLLECTION,
+    DEFAULT_INDEX_DIR,
+    MEETING_ANALYSES,
+    build_chunks,
+    ensure_embedding_indexes,
+    get_semantic_index,
+)
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Source collection -> timestamp field used for the --days window
+TIMESTAMP_FIELDS = {
+    "slack_messages": "posted_at",
+    "github_commits": "date",
+    "notion_content_diffs": "timestamp",
+    MEETING_ANALYSES: "meeting_date",
+}
+
+
+def index_source(mongo_manager, index, source: str, since, batch_size: int) -> int:
+    """Stream one source collection into the semantic index in batches"""
+    if source == MEETING_ANALYSES:
+        collection = mongo_manager.gemini_db["recordings"]
+    else:
+        collection = mongo_manager.db[source]
+
+    query = {}
+    if since is not None:
+        field = TIMESTAMP_FIELDS[source]
+        # Notion diff timestamps are stored as ISO strings
+        query[field] = {"$gte": since.isoformat() if source == "notion_content_diffs" else since}
+
+    cursor = collection.find(query, {"files": 0, "raw_event": 0}).batch_size(batch_size)
+
+    embedded = 0
+    batch = []
+    for doc in cursor:
+        batch.append(doc)
+        if len(batch) >= batch_size:
+            embedded += index.upsert(mongo_manager.db, *build_chunks(mongo_manager.db, source, batch))
+            batch = []
+    if batch:
+        embedded += index.upsert(mongo_manager.db, *build_chunks(mongo_manager.db, source, batch))
+
+    return embedded
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Backfill the semantic (embedding) index")
+    parser.add_argument(
+        "--sources",
+        nargs="+",
+        choices=list(TIMESTAMP_FIELDS.keys()),
+        default=list(TIMESTAMP_FIELDS.keys()),
+        help="Sources to index (default: all)",
+    )
+    parser.add_argument("--days", type=int, help="Only index the last N days")
+    parser.add_argument("--batch-size", type=int, default=500, help="Documents per batch")
+    parser.add_argument(
+        "--rebuild", action="store_true", help="Delete the index and its chunk metadata first"
+    )
+    args = parser.parse_args()
+
+    mongodb_config = {
+        "uri": os.getenv("MONGODB_URI", "mongodb://localhost:27017"),
+        "database": os.getenv("MONGODB_DATABASE", "all_thing_eye"),
+    }
+    mongo_manager = get_mongo_manager(mongodb_config)
+
+    since = datetime.utcnow() - timedelta(days=args.days) if args.days else None
+
+    try:
+        if args.rebuild:
+            index_dir = get_config().get("embedding_index.path") or DEFAULT_INDEX_DIR
+            shutil.rmtree(index_dir, ignore_errors=True)
+            mongo_manager.db[CHUNKS_COLLECTION].delete_many({})
+            logger.info(f"🗑️  Removed embedding index at {index_dir}")
+
+        ensure_embedding_indexes(mongo_manager.db)
+        index = get_semantic_index()
+        if index is None:
+            logger.error("❌ Embedding index is disabled (embedding_index.enabled in config.yaml)")
+            sys.exit(1)
+
+        logger.info("=" * 80)
+        logger.info("🧠 Building embedding index")
+        logger.info(f"   Embedder: {index.embedder.name}")
+        logger.info(f"   Sources: {', '.join(args.sources)}")
+        logger.info(f"   Since: {since.isoformat() if since else 'beginning'}")
+        logger.info("=" * 80)
+
+        total = 0
+        for source in args.sources:
+            try:
+                count = index_source(mongo_manager, index, source, since, args.batch_size)
+                total += count
+                logger.info(f"   ✅ {source:25s}: {count:,} chunks embedded")
+            except Exception as e:
+                logger.error(f"   ❌ {source}: {e}")
+
+        logger.info(f"✅ Embedding index complete: {total:,} chunks embedded, {index.store.rows:,} rows")
+    finally:
+        mongo_manager.close()
+
+
+if __name__ == "__main__":
+    main()
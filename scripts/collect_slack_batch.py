@@ -2,15 +2,16 @@
 """
 Slack Batch Data Collection Script
 
-Collects Slack data in smaller batches (default 7 days) with configurable intervals
-to avoid rate limits and timeout errors.
+Collects Slack data in smaller batches (default 7 days). Channels are fetched
+concurrently; API calls are paced per method by the plugin's rate limiter, so
+no interval between batches is needed.
 
 Usage:
-    # Collect from 2025-01-01 to 2025-08-29 in 7-day batches with 1-hour intervals
+    # Collect from 2025-01-01 to 2025-08-29 in 7-day batches
     python scripts/collect_slack_batch.py --start-date 2025-01-01 --end-date 2025-08-29
     
-    # With custom batch size and interval
-    python scripts/collect_slack_batch.py --start-date 2025-01-01 --end-date 2025-08-29 --batch-days 7 --interval-hours 1
+    # With custom batch size, channel concurrency and interval
+    python scripts/collect_slack_batch.py --start-date 2025-01-01 --end-date 2025-08-29 --batch-days 7 --concurrency 8 --interval-hours 0.5
 """
 
 import sys
@@ -29,6 +30,7 @@ load_dotenv()
 
 from src.core.config import Config
 from src.core.mongo_manager import MongoDBManager, get_mongo_manager
+from src.core.record_pipeline import persist_records
 from src.plugins.slack_plugin_mongo import SlackPluginMongo
 from src.utils.logger import get_logger
 
@@ -72,7 +74,8 @@ async def collect_slack_batch(
     end_date: datetime,
     batch_num: int,
     total_batches: int,
-    dry_run: bool = False
+    dry_run: bool = False,
+    concurrency: int = 4
 ):
     """Collect Slack data for a specific date range"""
     try:
@@ -93,6 +96,7 @@ async def collect_slack_batch(
             logger.warning("   ⏭️  Slack plugin disabled, skipping")
             return False
         
+        plugin_config['max_concurrent_channels'] = concurrency
         plugin = SlackPluginMongo(plugin_config, mongo_manager)
         
         if not plugin.authenticate():
@@ -103,25 +107,14 @@ async def collect_slack_batch(
         start_naive = start_date.replace(tzinfo=None)
         end_naive = end_date.replace(tzinfo=None)
         
-        # Collect data
+        # Collect and save in batches as messages arrive
         logger.info(f"   🚀 Starting collection...")
-        data_list = plugin.collect_data(start_date=start_naive, end_date=end_naive)
-        
-        # Slack plugin returns a list with one dict
-        data = data_list[0] if data_list else {}
-        
-        # Save to MongoDB
-        if data:
-            await plugin.save_data(data)
-        
-        messages_count = len(data.get('messages', []))
-        channels_count = len(data.get('channels', []))
-        users_count = len(data.get('users', []))
+        result = persist_records(plugin, start_naive, end_naive)
         
         logger.info(f"   ✅ Batch {batch_num} completed:")
-        logger.info(f"      - Messages: {messages_count:,}")
-        logger.info(f"      - Channels: {channels_count}")
-        logger.info(f"      - Users: {users_count}")
+        logger.info(f"      - Messages: {result.records.get('message', 0):,}")
+        logger.info(f"      - Channels: {result.records.get('channel', 0)}")
+        logger.info(f"      - Users: {result.skipped.get('user', 0)}")
         
         return True
         
@@ -155,9 +148,15 @@ async def main():
     )
     parser.add_argument(
         '--interval-hours',
+        type=float,
+        default=0,
+        help='Interval between batches in hours (default: 0)'
+    )
+    parser.add_argument(
+        '--concurrency',
         type=int,
-        default=1,
-        help='Interval between batches in hours (default: 1)'
+        default=4,
+        help='Channels fetched concurrently (default: 4)'
     )
     parser.add_argument(
         '--dry-run',
@@ -190,7 +189,7 @@ async def main():
     logger.info(f"📦 Batch Size: {args.batch_days} days")
     logger.info(f"⏱️  Interval: {args.interval_hours} hour(s)")
     logger.info(f"📊 Total Batches: {total_batches}")
-    logger.info(f"⏰ Estimated Duration: ~{total_batches * args.interval_hours} hours")
+    logger.info(f"🧵 Concurrency: {args.concurrency} channels")
     logger.info("=" * 80)
     
     if args.dry_run:
@@ -220,7 +219,8 @@ async def main():
                 batch_start,
                 batch_end,
                 i,
-                total_batches
+                total_batches,
+                concurrency=args.concurrency
             )
             
             if success:
@@ -229,7 +229,7 @@ async def main():
                 fail_count += 1
             
             # Wait before next batch (except for the last one)
-            if i < total_batches:
+            if i < total_batches and args.interval_hours > 0:
                 wait_seconds = args.interval_hours * 3600
                 logger.info(f"\n⏳ Waiting {args.interval_hours} hour(s) before next batch...")
                 logger.info(f"   Next batch will start at: {(datetime.now(UTC) + timedelta(seconds=wait_seconds)).strftime('%Y-%m-%d %H:%M:%S UTC')}")
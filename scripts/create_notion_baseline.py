@@ -29,6 +29,7 @@ load_dotenv(os.path.join(project_root, '.env'))
 from notion_client import Client
 from notion_client.errors import APIResponseError
 from src.core.mongo_manager import MongoDBManager
+from src.core.notion_snapshots import BlockSnapshotStore
 
 
 class NotionBaselineCreator:
@@ -59,6 +60,7 @@ class NotionBaselineCreator:
             self.mongo.connect_sync()
             self.db = self.mongo.db
             
+            self.snapshots = BlockSnapshotStore(self.db)
             self.collections = {
                 "block_snapshots": self.db["notion_block_snapshots"],
                 "comment_snapshots": self.db["notion_comment_snapshots"],
@@ -303,27 +305,11 @@ class NotionBaselineCreator:
     
     def _save_baseline_snapshot(self, page_id: str, blocks: List[Dict]):
         """Save initial baseline snapshot (without creating diff)"""
-        snapshot_time = datetime.now(timezone.utc)
-        
         if not blocks:
             return
         
-        documents = []
-        for block in blocks:
-            documents.append({
-                "page_id": page_id,
-                "block_id": block['block_id'],
-                "block_type": block['block_type'],
-                "plain_text": block['plain_text'],
-                "last_edited_time": block['last_edited_time'],
-                "parent_id": block.get('parent_id'),
-                "snapshot_time": snapshot_time,
-                "is_current": True,
-                "is_baseline": True  # Mark as baseline (initial snapshot)
-            })
-        
         try:
-            self.collections["block_snapshots"].insert_many(documents, ordered=False)
+            self.snapshots.save(page_id, blocks, previous=[], is_baseline=True)
         except Exception as e:
             print(f"   ⚠️ Insert error: {e}")
     
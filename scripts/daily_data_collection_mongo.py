@@ -19,6 +19,25 @@ Usage:
 
     # Date range
     python scripts/daily_data_collection_mongo.py --start-date 2025-11-01 --end-date 2025-11-17
+
+    # Ignore checkpoints and re-collect the whole window
+    python scripts/daily_data_collection_mongo.py --hours 24 --full
+
+    # Run sources one after another (e.g. to read interleaved logs)
+    python scripts/daily_data_collection_mongo.py --hours 2 --sequential
+
+Sources run concurrently, each with its own timeout, retry and thread budget
+(see DEFAULT_SOURCE_POLICIES; override per plugin under
+``plugins.<name>.orchestration`` in config.yaml). A slow or hung source no
+longer delays the others; each source's outcome, attempts and per-phase
+timings are recorded in ``collection_status``.
+
+Checkpoints:
+    Hourly and daily runs are incremental: each source resumes from the
+    high-water mark stored in ``collection_checkpoints`` (Slack channel ts,
+    Notion last_edited_time, Drive activity time, GitHub repo pushedAt) when it
+    is later than the window start. --date / --start-date backfills and --full
+    always collect the full window and leave checkpoints untouched.
 """
 
 import os
@@ -27,7 +46,7 @@ import asyncio
 from pathlib import Path
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
-from typing import List
+from typing import Dict, List
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -37,8 +56,17 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+from src.core.collection_orchestrator import (
+    CollectionOrchestrator,
+    PermanentSourceError,
+    SourceContext,
+    SourceDisabled,
+    SourcePolicy,
+    SourceRun,
+)
 from src.core.config import Config
 from src.core.mongo_manager import MongoDBManager, get_mongo_manager
+from src.core.record_pipeline import persist_records
 from src.plugins.github_plugin_mongo import GitHubPluginMongo
 from src.plugins.slack_plugin_mongo import SlackPluginMongo
 from src.plugins.notion_plugin_mongo import NotionPluginMongo
@@ -50,6 +78,18 @@ logger = get_logger(__name__)
 # Korea Standard Time
 KST = ZoneInfo("Asia/Seoul")
 
+# Source name (--sources) -> plugin name in config.yaml
+PLUGIN_NAMES = {"drive": "google_drive"}
+
+# Per-source timeout / retry / thread budgets (overridable via config.yaml)
+DEFAULT_SOURCE_POLICIES = {
+    "github": SourcePolicy(timeout_seconds=3 * 3600, max_attempts=2, retry_delay_seconds=60),
+    "slack": SourcePolicy(timeout_seconds=3600, max_attempts=2, retry_delay_seconds=30),
+    "notion": SourcePolicy(timeout_seconds=3600, max_attempts=1),
+    "drive": SourcePolicy(timeout_seconds=1800, max_attempts=2, retry_delay_seconds=30),
+    "ecosystem": SourcePolicy(timeout_seconds=900, max_attempts=2, retry_delay_seconds=30),
+}
+
 
 async def record_collection_status(
     mongo_manager: MongoDBManager,
@@ -58,6 +98,9 @@ async def record_collection_status(
     status: str,
     items_collected: int,
     error_message: str = None,
+    end_time: datetime = None,
+    attempts: int = 1,
+    timings: Dict[str, float] = None,
 ):
     """
     Record collection status to MongoDB for tracking collector execution.
@@ -66,15 +109,18 @@ async def record_collection_status(
         mongo_manager: MongoDB manager instance
         source: Data source name (github, slack, notion, drive)
         start_time: When the collection started
-        status: success, failed, disabled
+        status: success, failed, disabled, timeout
         items_collected: Number of items collected
         error_message: Error message if failed
+        end_time: When the collection finished (default: now)
+        attempts: Number of attempts made
+        timings: Seconds spent per phase (authenticate, collect, save)
     """
     try:
         db = mongo_manager.async_db
         collection = db["collection_status"]
 
-        end_time = datetime.utcnow()
+        end_time = end_time or datetime.utcnow()
         duration_seconds = (end_time - start_time).total_seconds()
 
         status_doc = {
@@ -82,9 +128,11 @@ async def record_collection_status(
             "started_at": start_time,
             "completed_at": end_time,
             "duration_seconds": duration_seconds,
-            "status": status,  # success, failed, disabled
+            "status": status,  # success, failed, disabled, timeout
             "items_collected": items_collected,
             "error_message": error_message,
+            "attempts": attempts,
+            "timings": timings or {},
         }
 
         await collection.insert_one(status_doc)
@@ -142,348 +190,229 @@ def get_previous_day_range_kst():
     return start_utc, end_utc
 
 
-async def collect_github(
-    mongo_manager: MongoDBManager,
-    start_date: datetime,
-    end_date: datetime,
-    target_members: List[str] = None,
-):
-    """Collect GitHub data for the specified date range"""
-    start_time = datetime.utcnow()
-    status = "failed"
-    items_collected = 0
-    error_message = None
+def _load_plugin_config(source: str, use_checkpoints: bool) -> dict:
+    """Plugin config for ``source``; raises SourceDisabled when it is turned off"""
+    plugin_config = Config().get_plugin_config(source)
+    if not plugin_config or not plugin_config.get("enabled", False):
+        raise SourceDisabled(source)
+    plugin_config["use_checkpoints"] = use_checkpoints
+    return plugin_config
 
-    try:
-        logger.info("📂 Collecting GitHub data...")
 
-        config = Config()
-        plugin_config = config.get_plugin_config("github")
+async def _authenticate(ctx: SourceContext, plugin, label: str) -> None:
+    # A timed-out run keeps going on its thread; it must not commit checkpoints
+    ctx.guard(getattr(plugin, "checkpoints", None))
+    if not await ctx.run_blocking("authenticate", plugin.authenticate):
+        logger.error(f"   ❌ {label} authentication failed")
+        raise PermanentSourceError("Authentication failed")
 
-        if not plugin_config or not plugin_config.get("enabled", False):
-            logger.info("   ⏭️  GitHub plugin disabled, skipping")
-            status = "disabled"
-            return
 
-        # If target members specified, add to plugin config
-        if target_members:
-            plugin_config["target_members"] = target_members
-            logger.info(
-                f"   🎯 Targeting specific members: {', '.join(target_members)}"
-            )
+async def _save(ctx: SourceContext, plugin, data: dict) -> None:
+    """Run a plugin's save_data (async signature, blocking pymongo body) off the event loop"""
+    await ctx.run_blocking("save", lambda: asyncio.run(plugin.save_data(data)))
 
-        plugin = GitHubPluginMongo(plugin_config, mongo_manager)
 
-        if not plugin.authenticate():
-            logger.error("   ❌ GitHub authentication failed")
-            error_message = "Authentication failed"
-            return
+async def collect_github(
+    ctx: SourceContext,
+    mongo_manager: MongoDBManager,
+    start_date: datetime,
+    end_date: datetime,
+    target_members: List[str] = None,
+    use_checkpoints: bool = True,
+) -> int:
+    """Collect GitHub data for the specified date range"""
+    logger.info("📂 Collecting GitHub data...")
 
-        # Collect data (GitHub plugin saves data internally during collect_data)
-        data_list = plugin.collect_data(start_date=start_date, end_date=end_date)
+    plugin_config = _load_plugin_config("github", use_checkpoints)
 
-        # GitHub plugin returns a list with one dict
-        data = data_list[0] if data_list else {}
+    # If target members specified, add to plugin config
+    if target_members:
+        plugin_config["target_members"] = target_members
+        logger.info(f"   🎯 Targeting specific members: {', '.join(target_members)}")
 
-        # Note: GitHub plugin already saves data to MongoDB during collect_data
-        # No need to call save_data separately
+    plugin = GitHubPluginMongo(plugin_config, mongo_manager)
+    await _authenticate(ctx, plugin, "GitHub")
 
-        commits_count = len(data.get("commits", []))
-        prs_count = len(data.get("pull_requests", []))
-        issues_count = len(data.get("issues", []))
-        items_collected = commits_count + prs_count + issues_count
+    # Stream records into MongoDB, committing per-repository checkpoints as they land
+    result = await ctx.run_blocking(
+        "collect", persist_records, plugin, start_date, end_date
+    )
 
-        logger.info(
-            f"   ✅ GitHub: {commits_count} commits, {prs_count} PRs, {issues_count} issues"
-        )
-        status = "success"
+    commits_count = result.records.get("commit", 0)
+    prs_count = result.records.get("pull_request", 0)
+    issues_count = result.records.get("issue", 0)
 
-    except Exception as e:
-        logger.error(f"   ❌ GitHub collection failed: {e}", exc_info=True)
-        error_message = str(e)
-    finally:
-        # Record collection status
-        await record_collection_status(
-            mongo_manager, "github", start_time, status, items_collected, error_message
-        )
+    logger.info(
+        f"   ✅ GitHub: {commits_count} commits, {prs_count} PRs, {issues_count} issues"
+    )
+    return commits_count + prs_count + issues_count
 
 
 async def collect_slack(
-    mongo_manager: MongoDBManager, start_date: datetime, end_date: datetime
-):
+    ctx: SourceContext,
+    mongo_manager: MongoDBManager,
+    start_date: datetime,
+    end_date: datetime,
+    use_checkpoints: bool = True,
+) -> int:
     """Collect Slack data for the specified date range"""
-    start_time = datetime.utcnow()
-    status = "failed"
-    items_collected = 0
-    error_message = None
+    logger.info("📂 Collecting Slack data...")
 
-    try:
-        logger.info("📂 Collecting Slack data...")
+    plugin = SlackPluginMongo(_load_plugin_config("slack", use_checkpoints), mongo_manager)
+    await _authenticate(ctx, plugin, "Slack")
 
-        config = Config()
-        plugin_config = config.get_plugin_config("slack")
-
-        if not plugin_config or not plugin_config.get("enabled", False):
-            logger.info("   ⏭️  Slack plugin disabled, skipping")
-            status = "disabled"
-            return
-
-        plugin = SlackPluginMongo(plugin_config, mongo_manager)
+    # Log date range being collected
+    logger.info(
+        f"   📅 Collecting from {start_date.isoformat()} to {end_date.isoformat()}"
+    )
+    if start_date.tzinfo is None:
+        start_kst = start_date.replace(tzinfo=ZoneInfo("UTC")).astimezone(KST)
+        end_kst = end_date.replace(tzinfo=ZoneInfo("UTC")).astimezone(KST)
+    else:
+        start_kst = start_date.astimezone(KST)
+        end_kst = end_date.astimezone(KST)
+    logger.info(
+        f"   📅 Date range (KST): {start_kst.strftime('%Y-%m-%d %H:%M:%S')} ~ {end_kst.strftime('%Y-%m-%d %H:%M:%S')}"
+    )
 
-        if not plugin.authenticate():
-            logger.error("   ❌ Slack authentication failed")
-            error_message = "Authentication failed"
-            return
+    # Stream records into MongoDB, committing per-channel checkpoints as they land
+    result = await ctx.run_blocking(
+        "collect", persist_records, plugin, start_date, end_date
+    )
 
-        # Log date range being collected
-        logger.info(
-            f"   📅 Collecting from {start_date.isoformat()} to {end_date.isoformat()}"
-        )
-        if start_date.tzinfo is None:
-            start_kst = start_date.replace(tzinfo=ZoneInfo("UTC")).astimezone(KST)
-            end_kst = end_date.replace(tzinfo=ZoneInfo("UTC")).astimezone(KST)
-        else:
-            start_kst = start_date.astimezone(KST)
-            end_kst = end_date.astimezone(KST)
-        logger.info(
-            f"   📅 Date range (KST): {start_kst.strftime('%Y-%m-%d %H:%M:%S')} ~ {end_kst.strftime('%Y-%m-%d %H:%M:%S')}"
+    messages_count = result.records.get("message", 0)
+    if not messages_count:
+        logger.warning(
+            f"   ⚠️  No messages found in date range {start_kst.strftime('%Y-%m-%d')} ~ {end_kst.strftime('%Y-%m-%d')}"
         )
 
-        # Collect data (returns a list with one dict)
-        data_list = plugin.collect_data(start_date=start_date, end_date=end_date)
-
-        # Save to MongoDB (extract the dict from the list)
-        if data_list:
-            data = data_list[0]
-            messages_count = len(data.get("messages", []))
-
-            # Log detailed results
-            if messages_count > 0:
-                # Show date range of collected messages
-                msg_dates = [
-                    msg.get("posted_at")
-                    for msg in data.get("messages", [])
-                    if msg.get("posted_at")
-                ]
-                if msg_dates:
-                    min_date = min(msg_dates)
-                    max_date = max(msg_dates)
-                    logger.info(
-                        f"   📊 Messages date range: {min_date.strftime('%Y-%m-%d %H:%M')} ~ {max_date.strftime('%Y-%m-%d %H:%M')}"
-                    )
-
-                # Group by channel
-                from collections import Counter
-
-                channel_counts = Counter()
-                for msg in data.get("messages", []):
-                    channel_counts[msg.get("channel_name", "unknown")] += 1
-                logger.info(f"   📂 Messages by channel: {dict(channel_counts)}")
-            else:
-                logger.warning(
-                    f"   ⚠️  No messages found in date range {start_kst.strftime('%Y-%m-%d')} ~ {end_kst.strftime('%Y-%m-%d')}"
-                )
-
-            await plugin.save_data(data)
-            items_collected = messages_count
-            logger.info(f"   ✅ Slack: {messages_count} messages")
-            status = "success"
-        else:
-            logger.warning("   ⚠️  Slack collection returned empty data")
-            status = "success"  # Still success even if no data
-
-    except Exception as e:
-        logger.error(f"   ❌ Slack collection failed: {e}", exc_info=True)
-        error_message = str(e)
-    finally:
-        # Record collection status
-        await record_collection_status(
-            mongo_manager, "slack", start_time, status, items_collected, error_message
-        )
+    logger.info(f"   ✅ Slack: {messages_count} messages")
+    return messages_count
 
 
 async def collect_notion(
-    mongo_manager: MongoDBManager, start_date: datetime, end_date: datetime
-):
+    ctx: SourceContext,
+    mongo_manager: MongoDBManager,
+    start_date: datetime,
+    end_date: datetime,
+    use_checkpoints: bool = True,
+) -> int:
     """Collect Notion data for the specified date range"""
-    start_time = datetime.utcnow()
-    status = "failed"
-    items_collected = 0
-    error_message = None
+    logger.info("📂 Collecting Notion data...")
 
-    try:
-        logger.info("📂 Collecting Notion data...")
-
-        config = Config()
-        plugin_config = config.get_plugin_config("notion")
-
-        if not plugin_config or not plugin_config.get("enabled", False):
-            logger.info("   ⏭️  Notion plugin disabled, skipping")
-            status = "disabled"
-            return
-
-        plugin = NotionPluginMongo(plugin_config, mongo_manager)
-
-        if not plugin.authenticate():
-            logger.error("   ❌ Notion authentication failed")
-            error_message = "Authentication failed"
-            return
-
-        # Ensure start_date and end_date are timezone-aware
-        if start_date.tzinfo is None:
-            start_date = start_date.replace(tzinfo=ZoneInfo("UTC"))
-        if end_date.tzinfo is None:
-            end_date = end_date.replace(tzinfo=ZoneInfo("UTC"))
-
-        # Collect data (returns a list with one dict)
-        data_list = plugin.collect_data(start_date=start_date, end_date=end_date)
-
-        # Save to MongoDB (extract the dict from the list)
-        if data_list:
-            data = data_list[0]
-            await plugin.save_data(data)
-            pages_count = len(data.get("pages", []))
-            items_collected = pages_count
-            logger.info(f"   ✅ Notion: {pages_count} pages")
-            status = "success"
-        else:
-            logger.warning("   ⚠️  Notion collection returned empty data")
-            status = "success"  # Still success even if no data
+    plugin = NotionPluginMongo(_load_plugin_config("notion", use_checkpoints), mongo_manager)
+    await _authenticate(ctx, plugin, "Notion")
 
-    except Exception as e:
-        logger.error(f"   ❌ Notion collection failed: {e}", exc_info=True)
-        error_message = str(e)
-    finally:
-        # Record collection status
-        await record_collection_status(
-            mongo_manager, "notion", start_time, status, items_collected, error_message
-        )
+    # Ensure start_date and end_date are timezone-aware
+    if start_date.tzinfo is None:
+        start_date = start_date.replace(tzinfo=ZoneInfo("UTC"))
+    if end_date.tzinfo is None:
+        end_date = end_date.replace(tzinfo=ZoneInfo("UTC"))
+
+    # Collect data (returns a list with one dict)
+    data_list = await ctx.run_blocking(
+        "collect", plugin.collect_data, start_date=start_date, end_date=end_date
+    )
+
+    if not data_list:
+        logger.warning("   ⚠️  Notion collection returned empty data")
+        return 0
+
+    data = data_list[0]
+    await _save(ctx, plugin, data)
+    pages_count = len(data.get("pages", []))
+    logger.info(f"   ✅ Notion: {pages_count} pages")
+    return pages_count
 
 
 async def collect_google_drive(
-    mongo_manager: MongoDBManager, start_date: datetime, end_date: datetime
-):
+    ctx: SourceContext,
+    mongo_manager: MongoDBManager,
+    start_date: datetime,
+    end_date: datetime,
+    use_checkpoints: bool = True,
+) -> int:
     """
     Collect Google Drive data for the specified date range.
     """
-    start_time = datetime.utcnow()
-    status = "failed"
-    items_collected = 0
-    error_message = None
+    logger.info("📂 Collecting Google Drive data...")
 
-    try:
-        logger.info("📂 Collecting Google Drive data...")
-
-        config = Config()
-        plugin_config = config.get_plugin_config("google_drive")
-
-        if not plugin_config or not plugin_config.get("enabled", False):
-            logger.info("   ⏭️  Google Drive plugin disabled, skipping")
-            status = "disabled"
-            return
-
-        plugin = GoogleDrivePluginMongo(plugin_config, mongo_manager)
-
-        if not plugin.authenticate():
-            logger.error("   ❌ Google Drive authentication failed")
-            error_message = "Authentication failed"
-            return
-
-        # Ensure dates are timezone-aware (Google Drive plugin expects UTC)
-        if start_date.tzinfo is None:
-            start_date = start_date.replace(tzinfo=ZoneInfo("UTC"))
-        if end_date.tzinfo is None:
-            end_date = end_date.replace(tzinfo=ZoneInfo("UTC"))
-
-        # Collect data (returns a list with one dict)
-        data_list = plugin.collect_data(start_date=start_date, end_date=end_date)
-
-        # Save to MongoDB (extract the dict from the list)
-        if data_list:
-            data = data_list[0]
-            await plugin.save_data(data)
-            activities_count = len(data.get("activities", []))
-            items_collected = activities_count
-            logger.info(f"   ✅ Google Drive: {activities_count} activities")
-            status = "success"
-        else:
-            logger.warning("   ⚠️  Google Drive collection returned empty data")
-            status = "success"  # Still success even if no data
+    plugin = GoogleDrivePluginMongo(
+        _load_plugin_config("google_drive", use_checkpoints), mongo_manager
+    )
+    await _authenticate(ctx, plugin, "Google Drive")
 
-    except Exception as e:
-        logger.error(f"   ❌ Google Drive collection failed: {e}", exc_info=True)
-        error_message = str(e)
-    finally:
-        # Record collection status
-        await record_collection_status(
-            mongo_manager, "drive", start_time, status, items_collected, error_message
-        )
+    # Ensure dates are timezone-aware (Google Drive plugin expects UTC)
+    if start_date.tzinfo is None:
+        start_date = start_date.replace(tzinfo=ZoneInfo("UTC"))
+    if end_date.tzinfo is None:
+        end_date = end_date.replace(tzinfo=ZoneInfo("UTC"))
+
+    # Stream records into MongoDB, committing per-user checkpoints as they land
+    result = await ctx.run_blocking(
+        "collect", persist_records, plugin, start_date, end_date
+    )
+
+    activities_count = result.records.get("activity", 0)
+    logger.info(f"   ✅ Google Drive: {activities_count} activities")
+    return activities_count
 
 
 async def collect_ecosystem(
-    mongo_manager: MongoDBManager, start_date: datetime, end_date: datetime
-):
+    ctx: SourceContext,
+    mongo_manager: MongoDBManager,
+    start_date: datetime,
+    end_date: datetime,
+) -> int:
     """
     Collect ecosystem data (staking, transactions, market cap) for the specified date range.
 
     This data is used for biweekly reports and ecosystem dashboards.
     """
-    start_time = datetime.utcnow()
-    status = "failed"
-    items_collected = 0
-    error_message = None
+    logger.info("📂 Collecting Ecosystem data (staking, transactions, market cap)...")
 
-    try:
-        logger.info(
-            "📂 Collecting Ecosystem data (staking, transactions, market cap)..."
-        )
+    from src.plugins.ecosystem_plugin_mongo import EcosystemPluginMongo
 
-        from src.plugins.ecosystem_plugin_mongo import EcosystemPluginMongo
-
-        # Ecosystem plugin doesn't need special config, uses env vars
-        plugin_config = {
-            "enabled": True,
-            "subgraph_api_key": os.getenv("SUBGRAPH_API_KEY", ""),
-            "etherscan_api_key": os.getenv("ETHERSCAN_API_KEY", ""),
-        }
+    # Ecosystem plugin doesn't need special config, uses env vars
+    plugin_config = {
+        "enabled": True,
+        "subgraph_api_key": os.getenv("SUBGRAPH_API_KEY", ""),
+        "etherscan_api_key": os.getenv("ETHERSCAN_API_KEY", ""),
+    }
 
-        plugin = EcosystemPluginMongo(plugin_config, mongo_manager)
+    plugin = EcosystemPluginMongo(plugin_config, mongo_manager)
 
-        if not plugin.authenticate():
-            logger.warning("   ⚠️  Some ecosystem APIs may not be configured")
+    if not plugin.authenticate():
+        logger.warning("   ⚠️  Some ecosystem APIs may not be configured")
 
-        # Collect all ecosystem data
+    # Collect all ecosystem data (natively async: httpx + Motor)
+    with ctx.timed("collect"):
         results = await plugin.collect_all(start_date, end_date)
 
-        # Count items
-        staking_count = results.get("staking", {}).get("count", 0)
-        tx_success = results.get("transactions", {}).get("success", False)
-        market_success = results.get("market_cap", {}).get("success", False)
+    # Count items
+    staking_count = results.get("staking", {}).get("count", 0)
+    tx_success = results.get("transactions", {}).get("success", False)
+    market_success = results.get("market_cap", {}).get("success", False)
 
-        items_collected = (
-            staking_count + (1 if tx_success else 0) + (1 if market_success else 0)
-        )
+    logger.info(
+        f"   ✅ Ecosystem: {staking_count} staking records, "
+        f"TX={'✓' if tx_success else '✗'}, "
+        f"Market={'✓' if market_success else '✗'}"
+    )
+    return staking_count + (1 if tx_success else 0) + (1 if market_success else 0)
 
-        logger.info(
-            f"   ✅ Ecosystem: {staking_count} staking records, "
-            f"TX={'✓' if tx_success else '✗'}, "
-            f"Market={'✓' if market_success else '✗'}"
-        )
-        status = "success"
 
-    except Exception as e:
-        logger.error(f"   ❌ Ecosystem collection failed: {e}", exc_info=True)
-        error_message = str(e)
-    finally:
-        # Record collection status
-        await record_collection_status(
-            mongo_manager,
-            "ecosystem",
-            start_time,
-            status,
-            items_collected,
-            error_message,
+def build_source_policies(sources: List[str]) -> Dict[str, SourcePolicy]:
+    """Default policies overlaid with ``plugins.<name>.orchestration`` from config"""
+    config = Config()
+    policies = {}
+    for source in sources:
+        plugin_name = PLUGIN_NAMES.get(source, source)
+        overrides = (config.get_plugin_config(plugin_name) or {}).get("orchestration")
+        policies[source] = SourcePolicy.from_config(
+            overrides, DEFAULT_SOURCE_POLICIES.get(source)
         )
+    return policies
 
 
 async def main():
@@ -525,6 +454,18 @@ async def main():
         nargs="+",
         help='Specific members to collect GitHub data for (e.g., "Thomas Shin" "Eugenie Nguyen")',
     )
+    parser.add_argument(
+        "--full",
+        "--no-checkpoints",
+        dest="full",
+        action="store_true",
+        help="Ignore collection checkpoints and collect the whole window (implied by --date/--start-date)",
+    )
+    parser.add_argument(
+        "--sequential",
+        action="store_true",
+        help="Collect sources one after another instead of concurrently",
+    )
 
     args = parser.parse_args()
 
@@ -575,6 +516,11 @@ async def main():
         # Use previous day (default)
         start_utc, end_utc = get_previous_day_range_kst()
 
+    # Explicit backfills re-collect their window and must not move checkpoints
+    use_checkpoints = not (args.full or args.date or args.start_date)
+    if not use_checkpoints:
+        logger.info("🔁 Full collection: checkpoints disabled for this run")
+
     # Initialize MongoDB connection
     import os
 
@@ -599,21 +545,50 @@ async def main():
         logger.info(f"📦 Collecting from: {', '.join(sources)}")
         logger.info("=" * 80)
 
-        # Collect from each source
-        if "github" in sources:
-            await collect_github(mongo_manager, start_utc, end_utc, args.members)
-
-        if "slack" in sources:
-            await collect_slack(mongo_manager, start_utc, end_utc)
-
-        if "notion" in sources:
-            await collect_notion(mongo_manager, start_utc, end_utc)
+        jobs = {
+            "github": lambda ctx: collect_github(
+                ctx, mongo_manager, start_utc, end_utc, args.members, use_checkpoints
+            ),
+            "slack": lambda ctx: collect_slack(
+                ctx, mongo_manager, start_utc, end_utc, use_checkpoints
+            ),
+            "notion": lambda ctx: collect_notion(
+                ctx, mongo_manager, start_utc, end_utc, use_checkpoints
+            ),
+            "drive": lambda ctx: collect_google_drive(
+                ctx, mongo_manager, start_utc, end_utc, use_checkpoints
+            ),
+            "ecosystem": lambda ctx: collect_ecosystem(
+                ctx, mongo_manager, start_utc, end_utc
+            ),
+        }
 
-        if "drive" in sources:
-            await collect_google_drive(mongo_manager, start_utc, end_utc)
+        async def on_source_complete(run: SourceRun):
+            if run.status == "disabled":
+                logger.info(f"   ⏭️  {run.source} plugin disabled, skipping")
+            logger.info(
+                f"   🏁 {run.source}: {run.status} in {run.duration_seconds:.1f}s "
+                f"({run.items_collected} items, {run.attempts} attempt(s)) {run.timings}"
+            )
+            await record_collection_status(
+                mongo_manager,
+                run.source,
+                run.started_at,
+                run.status,
+                run.items_collected,
+                run.error_message,
+                end_time=run.completed_at,
+                attempts=run.attempts,
+                timings=run.timings,
+            )
 
-        if "ecosystem" in sources:
-            await collect_ecosystem(mongo_manager, start_utc, end_utc)
+        # Collect from each source
+        orchestrator = CollectionOrchestrator(
+            build_source_policies(sources),
+            on_complete=on_source_complete,
+            concurrent=not args.sequential,
+        )
+        await orchestrator.run({source: jobs[source] for source in sources})
 
         # Show summary
         logger.info("\n" + "=" * 80)
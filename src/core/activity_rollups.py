@@ -0,0 +1,309 @@
+"""
+Daily Activity Rollups
+
+Maintains ``daily_activity_rollups``: per-day activity counts derived from
+``activity_timeline``, one document per
+
+    (date, source_type, member_key, project_keys, repository)
+
+with the number of activities per ``activity_type`` and, for commits, the
+lines added/deleted. Dashboard and member statistics read these small
+documents instead of running ``$dateToString`` group-bys over the raw source
+collections on every request.
+
+Rollups are rebuilt per ``(date, source_type)`` bucket from the timeline rows
+of that day, so refreshing a bucket is idempotent: collectors refresh the
+buckets touched by the rows they just wrote (see
+``ActivityTimelineWriter.write``) and re-collecting a day never double counts.
+
+``project_keys`` is kept as one dimension (the sorted key list of the row),
+so summing rollups never counts an activity twice; filter with
+``{"project_keys": key}`` to select a single project.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from pymongo import ASCENDING
+
+from src.core.activity_timeline import TIMELINE_COLLECTION
+from src.core.bulk_writer import BulkWriter
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+ROLLUPS_COLLECTION = "daily_activity_rollups"
+
+DATE_FORMAT = "%Y-%m-%d"
+
+# Activity types whose metadata additions/deletions are lines of code
+CODE_ACTIVITY_TYPES = {"commit"}
+
+Bucket = Tuple[str, str]  # (YYYY-MM-DD, source_type)
+
+
+def ensure_rollup_indexes(db) -> None:
+    """Create the indexes backing the rollup read paths (sync database)"""
+    rollups = db[ROLLUPS_COLLECTION]
+    rollups.create_index([("date", ASCENDING), ("source_type", ASCENDING)])
+    rollups.create_index([("member_key", ASCENDING), ("date", ASCENDING)])
+    rollups.create_index([("project_keys", ASCENDING), ("date", ASCENDING)])
+    rollups.create_index([("repository", ASCENDING), ("date", ASCENDING)])
+
+
+def rollup_id(date: str, source_type: str, member_key: str, project_keys: List[str], repository: str) -> str:
+    """Deterministic rollup ``_id`` for one dimension tuple"""
+    return f"{date}|{source_type}|{member_key}|{','.join(project_keys)}|{repository}"
+
+
+def rollup_buckets(rows: Iterable[Dict[str, Any]]) -> Set[Bucket]:
+    """(date, source_type) buckets touched by timeline rows"""
+    buckets = set()
+    for row in rows:
+        timestamp = row.get("timestamp")
+        source_type = row.get("source_type")
+        if isinstance(timestamp, datetime) and source_type:
+            buckets.add((timestamp.strftime(DATE_FORMAT), source_type))
+    return buckets
+
+
+def build_rollup_docs(
+    date: str, source_type: str, groups: Iterable[Dict[str, Any]], now: Optional[datetime] = None
+) -> List[Dict[str, Any]]:
+    """
+    Fold per-activity-type group results into rollup documents
+
+    Args:
+        date: Bucket date (YYYY-MM-DD)
+        source_type: Bucket source
+        groups: Output of the bucket aggregation: ``_id`` holds
+            ``member_key``, ``project_keys``, ``repository`` and
+            ``activity_type``; ``member_name``, ``count``, ``additions``
+            and ``deletions`` are accumulated values
+
+    Returns:
+        One document per (member, projects, repository)
+    """
+    now = now or datetime.utcnow()
+    docs: Dict[str, Dict[str, Any]] = {}
+    for group in groups:
+        key = group["_id"]
+        member_key = key.get("member_key") or "unknown"
+        project_keys = sorted(key.get("project_keys") or [])
+        repository = key.get("repository") or ""
+        activity_type = key.get("activity_type") or "activity"
+
+        doc_id = rollup_id(date, source_type, member_key, project_keys, repository)
+        doc = docs.get(doc_id)
+        if doc is None:
+            doc = docs[doc_id] = {
+                "_id": doc_id,
+                "date": date,
+                "source_type": source_type,
+                "member_key": member_key,
+                "member_name": group.get("member_name") or member_key,
+                "project_keys": project_keys,
+                "repository": repository,
+                "count": 0,
+                "by_type": {},
+                "additions": 0,
+                "deletions": 0,
+                "updated_at": now,
+            }
+
+        count = group.get("count", 0)
+        doc["count"] += count
+        doc["by_type"][activity_type] = doc["by_type"].get(activity_type, 0) + count
+        if activity_type in CODE_ACTIVITY_TYPES:
+            doc["additions"] += group.get("additions") or 0
+            doc["deletions"] += group.get("deletions") or 0
+
+    return list(docs.values())
+
+
+def _bucket_pipeline(date: str, source_type: str) -> List[Dict[str, Any]]:
+    day = datetime.strptime(date, DATE_FORMAT)
+    return [
+        {
+            "$match": {
+                "source_type": source_type,
+                "timestamp": {"$gte": day, "$lt": day + timedelta(days=1)},
+            }
+        },
+        {
+            "$group": {
+                "_id": {
+                    "member_key": "$member_key",
+                    "project_keys": "$project_keys",
+                    "repository": "$repository",
+                    "activity_type": "$activity_type",
+                },
+                "member_name": {"$first": "$member_name"},
+                "count": {"$sum": 1},
+                "additions": {"$sum": {"$ifNull": ["$metadata.additions", 0]}},
+                "deletions": {"$sum": {"$ifNull": ["$metadata.deletions", 0]}},
+            }
+        },
+    ]
+
+
+def refresh_rollups(db, buckets: Iterable[Bucket]) -> int:
+    """
+    Recompute rollups for the given (date, source_type) buckets
+
+    Args:
+        db: pymongo database
+        buckets: Buckets to rebuild from ``activity_timeline``
+
+    Returns:
+        Number of rollup documents written
+    """
+    timeline = db[TIMELINE_COLLECTION]
+    rollups = db[ROLLUPS_COLLECTION]
+    written = 0
+
+    for date, source_type in sorted(set(buckets)):
+        groups = timeline.aggregate(_bucket_pipeline(date, source_type))
+        docs = build_rollup_docs(date, source_type, groups)
+
+        with BulkWriter(rollups, label=ROLLUPS_COLLECTION) as writer:
+            for doc in docs:
+                writer.replace_one({"_id": doc["_id"]}, doc, upsert=True)
+
+        # Dimension tuples that no longer have activity (e.g. re-attributed rows)
+        rollups.delete_many(
+            {"date": date, "source_type": source_type, "_id": {"$nin": [d["_id"] for d in docs]}}
+        )
+        written += len(docs)
+
+    return written
+
+
+def rebuild_rollups(db, since: Optional[datetime] = None) -> int:
+    """
+    Rebuild every bucket that has timeline rows (optionally since a date)
+
+    Returns:
+        Number of rollup documents written
+    """
+    match: Dict[str, Any] = {}
+    if since is not None:
+        match["timestamp"] = {"$gte": since.replace(hour=0, minute=0, second=0, microsecond=0)}
+
+    pipeline = [
+        {"$match": match},
+        {
+            "$group": {
+                "_id": {
+                    "date": {"$dateToString": {"format": DATE_FORMAT, "date": "$timestamp"}},
+                    "source_type": "$source_type",
+                }
+            }
+        },
+    ]
+    buckets = [
+        (doc["_id"]["date"], doc["_id"]["source_type"])
+        for doc in db[TIMELINE_COLLECTION].aggregate(pipeline, allowDiskUse=True)
+        if doc["_id"].get("date") and doc["_id"].get("source_type")
+    ]
+    logger.info(f"🧮 Rebuilding {len(buckets)} rollup buckets")
+    return refresh_rollups(db, buckets)
+
+
+# =============================================================================
+# Read helpers (Motor, for the API)
+# =============================================================================
+
+
+async def load_daily_totals(
+    db, start_date: datetime, end_date: datetime, match: Optional[Dict[str, Any]] = None
+) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    Per-day, per-source totals from the rollups
+
+    Args:
+        db: Motor database
+        start_date: First day (inclusive)
+        end_date: Last day (inclusive)
+        match: Extra rollup filter (e.g. ``{"member_key": "alice"}``)
+
+    Returns:
+        {date: {source_type: {"count", "by_type", "additions", "deletions"}}}
+    """
+    query = {
+        "date": {"$gte": start_date.strftime(DATE_FORMAT), "$lte": end_date.strftime(DATE_FORMAT)},
+        **(match or {}),
+    }
+    totals: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    cursor = db[ROLLUPS_COLLECTION].find(
+        query, {"date": 1, "source_type": 1, "count": 1, "by_type": 1, "additions": 1, "deletions": 1}
+    )
+    async for doc in cursor:
+        entry = totals.setdefault(doc["date"], {}).setdefault(
+            doc["source_type"], {"count": 0, "by_type": {}, "additions": 0, "deletions": 0}
+        )
+        entry["count"] += doc.get("count", 0)
+        entry["additions"] += doc.get("additions", 0)
+        entry["deletions"] += doc.get("deletions", 0)
+        for activity_type, count in (doc.get("by_type") or {}).items():
+            entry["by_type"][activity_type] = entry["by_type"].get(activity_type, 0) + count
+    return totals
+
+
+def daily_range(start_date: datetime, end_date: datetime) -> List[str]:
+    """All YYYY-MM-DD dates from start_date to end_date (inclusive)"""
+    dates = []
+    current = start_date
+    while current <= end_date:
+        dates.append(current.strftime(DATE_FORMAT))
+        current += timedelta(days=1)
+    return dates
+
+
+def iso_week_label(date: str) -> str:
+    """``%Y-%V`` week label (same as MongoDB's ``$dateToString``)"""
+    day = datetime.strptime(date, DATE_FORMAT)
+    return f"{day.year}-{day.isocalendar()[1]:02d}"
+
+
+def summarize_code_changes(
+    totals: Dict[str, Dict[str, Dict[str, Any]]], end_date: datetime
+) -> Dict[str, Any]:
+    """
+    Dashboard code-change block (90-day total, 30 daily points, 12 weeks)
+
+    Args:
+        totals: Output of :func:`load_daily_totals` covering the last 90 days
+        end_date: Last day of the window
+    """
+
+    def github(date: str) -> Dict[str, Any]:
+        return totals.get(date, {}).get("github", {})
+
+    code_changes = {"total": {"additions": 0, "deletions": 0}, "daily": [], "weekly": []}
+    for date in daily_range(end_date - timedelta(days=90), end_date):
+        code_changes["total"]["additions"] += github(date).get("additions", 0)
+        code_changes["total"]["deletions"] += github(date).get("deletions", 0)
+
+    code_changes["daily"] = [
+        {
+            "date": date,
+            "additions": github(date).get("additions", 0),
+            "deletions": github(date).get("deletions", 0),
+        }
+        for date in daily_range(end_date - timedelta(days=30), end_date)
+    ]
+
+    weekly: Dict[str, Dict[str, Any]] = {}
+    for date in daily_range(end_date - timedelta(weeks=12), end_date):
+        stats = github(date)
+        if not stats.get("by_type", {}).get("commit"):
+            continue
+        week = weekly.setdefault(
+            iso_week_label(date), {"week": iso_week_label(date), "additions": 0, "deletions": 0}
+        )
+        week["additions"] += stats.get("additions", 0)
+        week["deletions"] += stats.get("deletions", 0)
+    code_changes["weekly"] = sorted(weekly.values(), key=lambda x: x["week"])
+
+    return code_changes
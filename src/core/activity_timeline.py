@@ -0,0 +1,602 @@
+"""
+Activity Timeline Projection
+
+Maintains the ``activity_timeline`` collection: one normalized row per
+commit / PR / review / Slack message / Notion diff / Drive event / recording,
+with a native UTC datetime, the resolved member name and the project keys the
+activity belongs to.
+
+Collectors write into it right after persisting their source documents, and
+``GET /activities/timeline`` serves keyset-paginated pages from it with a
+single indexed range scan on ``(timestamp, _id)``.
+
+Row ``_id`` values are deterministic (``"<kind>:<natural key>"``) so that
+re-collecting the same data upserts instead of duplicating rows.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from pymongo import ASCENDING, DESCENDING
+
+from src.core.bulk_writer import BulkWriter
+from src.core.cache_versions import bump_collection_versions
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+TIMELINE_COLLECTION = "activity_timeline"
+
+# Slack channels that must never surface in the shared activity feed
+EXCLUDED_SLACK_CHANNELS = {"tokamak-partners"}
+
+# Reviewers that are bots, not members
+BOT_REVIEWERS = {"gemini-code-assist", "github-actions[bot]"}
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def to_utc_naive(value: Any) -> Optional[datetime]:
+    """
+    Normalize a timestamp to a timezone-naive UTC datetime (MongoDB convention)
+
+    Accepts datetimes (naive = UTC), ISO8601 strings (with or without ``Z``)
+    and ``YYYY-MM-DD`` date strings.
+    """
+    if value is None or value == "":
+        return None
+
+    if isinstance(value, datetime):
+        dt = value
+    elif isinstance(value, str):
+        try:
+            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    else:
+        return None
+
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+def date_range_filter(start_date: Any = None, end_date: Any = None) -> Dict[str, datetime]:
+    """
+    ``$gte`` / ``$lte`` condition on a timestamp for an inclusive date range
+
+    Returns:
+        The condition (empty when neither bound is given)
+
+    Raises:
+        ValueError: If a bound is given but cannot be parsed
+    """
+    condition = {}
+    for operator, value in (("$gte", start_date), ("$lte", end_date)):
+        if value is None or value == "":
+            continue
+        bound = to_utc_naive(value)
+        if bound is None:
+            raise ValueError(f"Invalid date: {value!r} (expected ISO 8601, e.g. 2025-11-01)")
+        condition[operator] = bound
+    return condition
+
+
+def encode_cursor(timestamp: datetime, row_id: str) -> str:
+    """Encode a keyset cursor as ``<iso timestamp>,<row id>``"""
+    return f"{timestamp.isoformat()},{row_id}"
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    Decode a cursor produced by :func:`encode_cursor`
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if not cursor or "," not in cursor:
+        raise ValueError("Cursor must have the form '<timestamp>,<id>'")
+
+    ts_part, row_id = cursor.split(",", 1)
+    timestamp = to_utc_naive(ts_part)
+    if timestamp is None or not row_id:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return timestamp, row_id
+
+
+def build_keyset_filter(after: Optional[str]) -> Dict[str, Any]:
+    """
+    Build the range filter for rows strictly older than the cursor
+
+    Rows are ordered by ``(timestamp DESC, _id DESC)``, so the next page starts
+    at rows with a smaller timestamp, or an equal timestamp and smaller ``_id``.
+    """
+    if not after:
+        return {}
+
+    timestamp, row_id = decode_cursor(after)
+    return {
+        "$or": [
+            {"timestamp": {"$lt": timestamp}},
+            {"timestamp": timestamp, "_id": {"$lt": row_id}},
+        ]
+    }
+
+
+def ensure_timeline_indexes(db) -> None:
+    """Create the indexes backing the timeline read path (sync database)"""
+    timeline = db[TIMELINE_COLLECTION]
+    keyset = [("timestamp", DESCENDING), ("_id", DESCENDING)]
+
+    timeline.create_index(keyset)
+    timeline.create_index([("member_key", ASCENDING)] + keyset)
+    timeline.create_index([("source_type", ASCENDING), ("activity_type", ASCENDING)] + keyset)
+    timeline.create_index([("project_keys", ASCENDING)] + keyset)
+    timeline.create_index([("source_collection", ASCENDING), ("source_id", ASCENDING)])
+
+
+# =============================================================================
+# Normalizers (source document -> timeline row)
+# =============================================================================
+
+
+def _commit_entry(doc: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    sha = doc.get("sha")
+    timestamp = to_utc_naive(doc.get("date"))
+    if not sha or not timestamp:
+        return None
+
+    repo_name = doc.get("repository", "")
+    return {
+        "_id": f"github_commit:{sha}",
+        "source_type": "github",
+        "activity_type": "commit",
+        "timestamp": timestamp,
+        "identity_source": "github",
+        "actor": doc.get("author_name") or "",
+        "repository": repo_name,
+        "source_collection": "github_commits",
+        "source_id": sha,
+        "metadata": {
+            "sha": sha,
+            "message": doc.get("message"),
+            "repository": repo_name,
+            "additions": doc.get("additions", 0),
+            "deletions": doc.get("deletions", 0),
+            "url": doc.get("url")
+            or (
+                f"https://github.com/tokamak-network/{repo_name}/commit/{sha}"
+                if repo_name
+                else None
+            ),
+        },
+    }
+
+
+def _pull_request_entry(doc: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    repo_name = doc.get("repository")
+    number = doc.get("number")
+    timestamp = to_utc_naive(doc.get("created_at"))
+    if not repo_name or number is None or not timestamp:
+        return None
+
+    return {
+        "_id": f"github_pr:{repo_name}#{number}",
+        "source_type": "github",
+        "activity_type": "pull_request",
+        "timestamp": timestamp,
+        "identity_source": "github",
+        "actor": doc.get("author") or "",
+        "repository": repo_name,
+        "source_collection": "github_pull_requests",
+        "source_id": f"{repo_name}#{number}",
+        "metadata": {
+            "number": number,
+            "title": doc.get("title"),
+            "repository": repo_name,
+            "state": doc.get("state"),
+            "url": doc.get("url"),
+        },
+    }
+
+
+def _review_entry(doc: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    repo_name = doc.get("repository")
+    reviewer = doc.get("reviewer")
+    timestamp = to_utc_naive(doc.get("submitted_at"))
+    if not repo_name or not reviewer or not timestamp or reviewer in BOT_REVIEWERS:
+        return None
+
+    natural_key = f"{repo_name}#{doc.get('pr_number')}:{reviewer}:{timestamp.isoformat()}"
+    return {
+        "_id": f"github_review:{natural_key}",
+        "source_type": "github",
+        "activity_type": "review",
+        "timestamp": timestamp,
+        "identity_source": "github",
+        "actor": reviewer,
+        "repository": repo_name,
+        "source_collection": "github_reviews",
+        "source_id": natural_key,
+        "metadata": {
+            "repository": repo_name,
+            "pr_number": doc.get("pr_number"),
+            "pr_title": doc.get("pr_title"),
+            "state": doc.get("state"),
+            "body": (doc.get("body") or "")[:200],
+            "comment_path": doc.get("comment_path"),
+            "comment_line": doc.get("comment_line"),
+            "url": doc.get("pr_url"),
+        },
+    }
+
+
+def _slack_message_entry(doc: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    channel_id = doc.get("channel_id")
+    ts = doc.get("ts")
+    timestamp = to_utc_naive(doc.get("posted_at"))
+    if not channel_id or not ts or not timestamp:
+        return None
+    if doc.get("channel_name") in EXCLUDED_SLACK_CHANNELS:
+        return None
+
+    thread_ts = doc.get("thread_ts")
+    is_thread_reply = bool(thread_ts) and str(thread_ts) != str(ts)
+    if is_thread_reply:
+        activity_type = "thread_reply"
+    elif doc.get("files"):
+        activity_type = "file_share"
+    else:
+        activity_type = "message"
+
+    return {
+        "_id": f"slack:{channel_id}:{ts}",
+        "source_type": "slack",
+        "activity_type": activity_type,
+        "timestamp": timestamp,
+        "identity_source": "slack",
+        "actor": doc.get("user_id") or doc.get("user") or "",
+        "actor_email": (doc.get("user_email") or "").lower() or None,
+        "actor_display": doc.get("user_name") or "",
+        "channel_id": channel_id,
+        "source_collection": "slack_messages",
+        "source_id": f"{channel_id}:{ts}",
+        "metadata": {
+            "channel": doc.get("channel_name"),
+            "channel_id": channel_id,
+            "text": (doc.get("text") or "")[:200],
+            "reactions": len(doc.get("reactions", [])),
+            "links": len(doc.get("links", [])),
+            "files": len(doc.get("files", [])),
+            "reply_count": doc.get("reply_count", 0),
+            "url": f"https://tokamak-network.slack.com/archives/{channel_id}/p{ts.replace('.', '')}",
+            "is_thread": is_thread_reply,
+        },
+    }
+
+
+def _notion_diff_entry(doc: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    page_id = doc.get("document_id")
+    timestamp = to_utc_naive(doc.get("timestamp"))
+    if not page_id or not timestamp:
+        return None
+
+    diff_type = doc.get("diff_type", "block")
+    changes = doc.get("changes", {}) or {}
+    added_items = changes.get("added", [])
+    deleted_items = changes.get("deleted", [])
+    modified_items = changes.get("modified", [])
+
+    additions = len(added_items)
+    deletions = len(deleted_items)
+    for mod in modified_items:
+        if isinstance(mod, dict):
+            additions += len(mod.get("added_lines", []))
+            deletions += len(mod.get("deleted_lines", []))
+
+    editor_id = doc.get("editor_id", "") or ""
+    editor_name = doc.get("editor_name") or ""
+    if not editor_name or editor_name == "Unknown":
+        editor_name = f"Notion-{editor_id[:8]}" if editor_id else "Unknown"
+
+    natural_key = f"{page_id}:{diff_type}:{timestamp.isoformat()}"
+    return {
+        "_id": f"notion_diff:{natural_key}",
+        "source_type": "notion",
+        "activity_type": f"notion_{diff_type}",
+        "timestamp": timestamp,
+        "identity_source": "notion",
+        "actor": editor_id,
+        "actor_display": editor_name,
+        "notion_page_id": page_id,
+        "source_collection": "notion_content_diffs",
+        "source_id": natural_key,
+        "metadata": {
+            "page_id": page_id,
+            "page_title": doc.get("document_title"),
+            "title": doc.get("document_title"),
+            "page_url": doc.get("document_url"),
+            "url": doc.get("document_url"),
+            "diff_type": diff_type,
+            "additions": additions,
+            "deletions": deletions,
+            "blocks_added": len(added_items),
+            "blocks_deleted": len(deleted_items),
+            "blocks_modified": len(modified_items),
+        },
+    }
+
+
+def _drive_activity_entry(doc: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    activity_id = doc.get("activity_id")
+    timestamp = to_utc_naive(doc.get("timestamp") or doc.get("time"))
+    if not activity_id or not timestamp:
+        return None
+
+    user_email = (doc.get("user_email") or doc.get("actor_email") or "").lower()
+    return {
+        "_id": f"drive:{activity_id}",
+        "source_type": "drive",
+        "activity_type": doc.get("event_name", "activity"),
+        "timestamp": timestamp,
+        "identity_source": "drive",
+        "actor": user_email,
+        "actor_display": user_email.split("@")[0].capitalize() if user_email else "Unknown",
+        "drive_ids": [i for i in (doc.get("doc_id"), doc.get("parent_folder_id")) if i],
+        "source_collection": "drive_activities",
+        "source_id": activity_id,
+        "metadata": {
+            "action": doc.get("action"),
+            "doc_title": doc.get("doc_title"),
+            "doc_type": doc.get("doc_type"),
+            "url": doc.get("link"),
+            "file_id": doc.get("doc_id"),
+        },
+    }
+
+
+def _recording_entry(doc: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    recording_id = doc.get("_id")
+    timestamp = to_utc_naive(doc.get("modifiedTime"))
+    if not recording_id or not timestamp:
+        return None
+
+    return {
+        "_id": f"recording:{recording_id}",
+        "source_type": "recordings",
+        "activity_type": "meeting_recording",
+        "timestamp": timestamp,
+        "identity_source": "recordings",
+        "actor": doc.get("createdBy", "") or "",
+        "actor_display": doc.get("createdBy", "") or "",
+        "source_collection": "recordings",
+        "source_id": str(recording_id),
+        "metadata": {
+            "name": doc.get("name"),
+            "size": doc.get("size", 0),
+            "recording_id": doc.get("id"),
+            "webViewLink": doc.get("webViewLink"),
+        },
+    }
+
+
+NORMALIZERS: Dict[str, Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]] = {
+    "github_commits": _commit_entry,
+    "github_pull_requests": _pull_request_entry,
+    "github_reviews": _review_entry,
+    "slack_messages": _slack_message_entry,
+    "notion_content_diffs": _notion_diff_entry,
+    "drive_activities": _drive_activity_entry,
+    "recordings": _recording_entry,
+}
+
+
+def normalize(source_collection: str, doc: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Convert a source document into a timeline row (without member/project resolution)
+
+    Returns:
+        Row dict, or None if the document cannot be placed on the timeline
+    """
+    normalizer = NORMALIZERS.get(source_collection)
+    if normalizer is None:
+        raise ValueError(f"No timeline normalizer for collection: {source_collection}")
+    return normalizer(doc)
+
+
+# =============================================================================
+# Writer
+# =============================================================================
+
+
+class ActivityTimelineWriter:
+    """
+    Writes normalized rows into ``activity_timeline`` (synchronous, for collectors)
+
+    Member names and project keys are resolved from ``member_identifiers`` and
+    ``projects``, loaded once per writer instance.
+
+    After each write the ``daily_activity_rollups`` buckets touched by the
+    rows are recomputed (``update_rollups=False`` skips this, e.g. for bulk
+    backfills that rebuild rollups once at the end). Slack, commit and Notion
+    diff documents are also embedded into the semantic index when it is
+    enabled (``update_embeddings=False`` skips this).
+
+    Usage:
+        writer = ActivityTimelineWriter(mongo_manager.db)
+        writer.write("github_commits", saved_commit_docs)
+    """
+
+    def __init__(
+        self,
+        db,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        update_rollups: bool = True,
+        update_embeddings: bool = True,
+    ):
+        self.db = db
+        self.collection = db[TIMELINE_COLLECTION]
+        self.batch_size = batch_size
+        self.update_rollups = update_rollups
+        self.update_embeddings = update_embeddings
+        self._members: Optional[Dict[str, Dict[str, str]]] = None
+        self._projects: Optional[Dict[str, Dict[str, List[str]]]] = None
+
+    def _load_members(self) -> Dict[str, Dict[str, str]]:
+        """Load {source: {identifier_key: member_name}} from member_identifiers"""
+        if self._members is None:
+            members: Dict[str, Dict[str, str]] = {}
+            for ident in self.db["member_identifiers"].find(
+                {}, {"source": 1, "identifier_value": 1, "member_name": 1}
+            ):
+                source = ident.get("source")
+                value = ident.get("identifier_value")
+                name = ident.get("member_name")
+                if not (source and value and name):
+                    continue
+                key = value.lower() if source in ("github", "drive") else value
+                members.setdefault(source, {})[key] = name
+            self._members = members
+        return self._members
+
+    def _load_projects(self) -> Dict[str, Dict[str, List[str]]]:
+        """Load {kind: {value: [project_key, ...]}} for repos, channels, folders and pages"""
+        if self._projects is None:
+            projects: Dict[str, Dict[str, List[str]]] = {
+                "repository": {},
+                "channel": {},
+                "drive": {},
+                "notion": {},
+            }
+
+            def add(kind: str, value: Optional[str], key: str):
+                if value:
+                    projects[kind].setdefault(value, []).append(key)
+
+            for project in self.db["projects"].find({"is_active": True}):
+                key = project.get("key")
+                if not key:
+                    continue
+                for repo in project.get("repositories", []) or []:
+                    add("repository", repo, key)
+                add("channel", project.get("slack_channel_id"), key)
+                for folder in project.get("drive_folders", []) or []:
+                    add("drive", folder, key)
+                for page_id in project.get("notion_page_ids", []) or []:
+                    add("notion", page_id, key)
+            self._projects = projects
+        return self._projects
+
+    def resolve_member(self, row: Dict[str, Any]) -> str:
+        """Resolve the display member name for a row, mirroring the /activities rules"""
+        members = self._load_members()
+        source = row.get("identity_source")
+        actor = row.get("actor") or ""
+        source_map = members.get(source, {})
+
+        name = None
+        if actor:
+            key = actor.lower() if source in ("github", "drive") else actor
+            name = source_map.get(key)
+        if not name and row.get("actor_email"):
+            mapped = source_map.get(row["actor_email"])
+            if mapped and "@" not in mapped:
+                name = mapped
+        if not name:
+            name = row.get("actor_display") or actor or "Unknown"
+
+        return name[0].upper() + name[1:] if name else name
+
+    def resolve_projects(self, row: Dict[str, Any]) -> List[str]:
+        """Resolve the project keys a row belongs to"""
+        projects = self._load_projects()
+        keys: List[str] = []
+        if row.get("repository"):
+            keys.extend(projects["repository"].get(row["repository"], []))
+        if row.get("channel_id"):
+            keys.extend(projects["channel"].get(row["channel_id"], []))
+        if row.get("notion_page_id"):
+            keys.extend(projects["notion"].get(row["notion_page_id"], []))
+        for drive_id in row.get("drive_ids", []):
+            keys.extend(projects["drive"].get(drive_id, []))
+        return sorted(set(keys))
+
+    def build_rows(self, source_collection: str, docs: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Normalize and resolve source documents into timeline rows"""
+        from src.core.search_index import search_fields
+
+        rows = []
+        now = datetime.utcnow()
+        for doc in docs:
+            row = normalize(source_collection, doc)
+            if row is None:
+                continue
+            member_name = self.resolve_member(row)
+            row["member_name"] = member_name
+            row["member_key"] = member_name.lower()
+            row["project_keys"] = self.resolve_projects(row)
+            row.update(search_fields(source_collection, doc))
+            row["updated_at"] = now
+            rows.append(row)
+        return rows
+
+    def write(self, source_collection: str, docs: Iterable[Dict[str, Any]]) -> int:
+        """
+        Upsert timeline rows for the given source documents
+
+        Args:
+            source_collection: Source collection name (key of ``NORMALIZERS``)
+            docs: Source documents as stored in MongoDB
+
+        Returns:
+            Number of rows upserted or modified
+        """
+        docs = list(docs)
+        rows = self.build_rows(source_collection, docs)
+
+        with BulkWriter(self.collection, batch_size=self.batch_size, label=TIMELINE_COLLECTION) as writer:
+            for row in rows:
+                writer.update_one({"_id": row["_id"]}, {"$set": row})
+
+        if writer.result.errors:
+            logger.warning(
+                f"⚠️  Timeline write errors ({source_collection}): {writer.result.errors}"
+            )
+
+        if self.update_rollups and rows:
+            from src.core.activity_rollups import refresh_rollups, rollup_buckets
+
+            try:
+                refresh_rollups(self.db, rollup_buckets(rows))
+            except Exception as e:
+                logger.warning(f"⚠️  Failed to refresh activity rollups ({source_collection}): {e}")
+
+        if self.update_embeddings and rows:
+            from src.core.embedding_index import index_source_documents
+
+            try:
+                index_source_documents(self.db, source_collection, docs)
+            except Exception as e:
+                logger.warning(f"⚠️  Failed to update embedding index ({source_collection}): {e}")
+
+        if rows:
+            # Invalidates cached API responses built from this data (see cache_versions)
+            try:
+                bump_collection_versions(self.db, source_collection, TIMELINE_COLLECTION)
+            except Exception as e:
+                logger.warning(f"⚠️  Failed to bump cache versions ({source_collection}): {e}")
+
+        return writer.result.upserted + writer.result.modified
+
+    def safe_write(self, source_collection: str, docs: Iterable[Dict[str, Any]]) -> int:
+        """Like :meth:`write`, but never lets a timeline failure break collection"""
+        try:
+            return self.write(source_collection, docs)
+        except Exception as e:
+            logger.warning(f"⚠️  Failed to update activity timeline ({source_collection}): {e}")
+            return 0
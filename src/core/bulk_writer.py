@@ -0,0 +1,266 @@
+"""
+Batched MongoDB Writer
+
+Collectors used to persist one document per round-trip (``update_one`` /
+``replace_one`` in a loop). ``BulkWriter`` buffers write operations and sends
+them as unordered ``bulk_write`` batches instead, reporting upserted / modified
+/ error counts per batch.
+
+Backpressure: by default a full buffer is flushed synchronously, so producers
+can never run ahead of the database by more than one batch. With
+``max_pending_batches > 0`` batches are flushed by a background thread through
+a bounded queue; producers block once that many batches are waiting.
+
+``AsyncBulkWriter`` is the Motor equivalent for async collectors.
+
+Example:
+    with BulkWriter(db["slack_messages"], label="slack_messages") as writer:
+        for doc in docs:
+            writer.replace_one({"ts": doc["ts"], "channel_id": doc["channel_id"]}, doc)
+    print(writer.result.written)
+"""
+
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from pymongo import InsertOne, ReplaceOne, UpdateOne
+from pymongo.errors import BulkWriteError
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+@dataclass
+class BulkWriteResult:
+    """Aggregated counts of one or more bulk_write batches"""
+
+    batches: int = 0
+    operations: int = 0
+    inserted: int = 0
+    upserted: int = 0
+    matched: int = 0
+    modified: int = 0
+    errors: int = 0
+    duplicates: int = 0  # subset of errors: duplicate key (E11000)
+
+    @property
+    def written(self) -> int:
+        """Documents that were inserted, upserted or modified"""
+        return self.inserted + self.upserted + self.modified
+
+    def merge(self, other: "BulkWriteResult") -> None:
+        self.batches += other.batches
+        self.operations += other.operations
+        self.inserted += other.inserted
+        self.upserted += other.upserted
+        self.matched += other.matched
+        self.modified += other.modified
+        self.errors += other.errors
+        self.duplicates += other.duplicates
+
+    @classmethod
+    def from_pymongo(cls, result, operations: int) -> "BulkWriteResult":
+        return cls(
+            batches=1,
+            operations=operations,
+            inserted=result.inserted_count,
+            upserted=result.upserted_count,
+            matched=result.matched_count,
+            modified=result.modified_count,
+        )
+
+    @classmethod
+    def from_error(cls, error: BulkWriteError, operations: int) -> "BulkWriteResult":
+        details = error.details or {}
+        write_errors = details.get("writeErrors", [])
+        return cls(
+            batches=1,
+            operations=operations,
+            inserted=details.get("nInserted", 0),
+            upserted=details.get("nUpserted", 0),
+            matched=details.get("nMatched", 0),
+            modified=details.get("nModified", 0),
+            errors=len(write_errors),
+            duplicates=sum(1 for e in write_errors if e.get("code") == 11000),
+        )
+
+
+class _BaseBulkWriter:
+    def __init__(
+        self,
+        collection,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        ordered: bool = False,
+        label: Optional[str] = None,
+        on_batch: Optional[Callable[[BulkWriteResult], None]] = None,
+    ):
+        self.collection = collection
+        self.batch_size = max(1, batch_size)
+        self.ordered = ordered
+        self.label = label or getattr(collection, "name", "collection")
+        self.on_batch = on_batch
+        self.result = BulkWriteResult()
+        self._buffer: List[Any] = []
+        self._lock = threading.Lock()
+
+    def _record(self, batch_result: BulkWriteResult) -> None:
+        with self._lock:
+            self.result.merge(batch_result)
+        if batch_result.errors > batch_result.duplicates:
+            logger.warning(
+                f"⚠️  {self.label}: batch of {batch_result.operations} had {batch_result.errors} write errors"
+            )
+        logger.debug(
+            f"{self.label}: batch {batch_result.operations} ops, "
+            f"upserted={batch_result.upserted} modified={batch_result.modified} errors={batch_result.errors}"
+        )
+        if self.on_batch:
+            self.on_batch(batch_result)
+
+    def _take_batch(self) -> List[Any]:
+        batch, self._buffer = self._buffer, []
+        return batch
+
+
+class BulkWriter(_BaseBulkWriter):
+    """
+    Buffered writer for a pymongo collection
+
+    Args:
+        collection: pymongo Collection
+        batch_size: Operations per bulk_write call
+        ordered: Use ordered bulk writes (default: unordered)
+        max_pending_batches: 0 = flush inline; N > 0 = flush on a background
+            thread, blocking producers once N batches are queued
+        label: Name used in log messages
+        on_batch: Callback receiving each batch's BulkWriteResult
+    """
+
+    def __init__(
+        self,
+        collection,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        ordered: bool = False,
+        max_pending_batches: int = 0,
+        label: Optional[str] = None,
+        on_batch: Optional[Callable[[BulkWriteResult], None]] = None,
+    ):
+        super().__init__(collection, batch_size, ordered, label, on_batch)
+        self._queue: Optional[queue.Queue] = None
+        self._worker: Optional[threading.Thread] = None
+        if max_pending_batches > 0:
+            self._queue = queue.Queue(maxsize=max_pending_batches)
+            self._worker = threading.Thread(target=self._drain, daemon=True)
+            self._worker.start()
+
+    def __enter__(self) -> "BulkWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def add(self, operation) -> None:
+        """Buffer a pymongo write operation (UpdateOne, ReplaceOne, ...)"""
+        self._buffer.append(operation)
+        if len(self._buffer) >= self.batch_size:
+            self._dispatch(self._take_batch())
+
+    def update_one(self, filter: Dict[str, Any], update: Dict[str, Any], upsert: bool = True) -> None:
+        self.add(UpdateOne(filter, update, upsert=upsert))
+
+    def replace_one(self, filter: Dict[str, Any], document: Dict[str, Any], upsert: bool = True) -> None:
+        self.add(ReplaceOne(filter, document, upsert=upsert))
+
+    def insert_one(self, document: Dict[str, Any]) -> None:
+        self.add(InsertOne(document))
+
+    def flush(self) -> BulkWriteResult:
+        """Write buffered operations and wait for queued batches"""
+        if self._buffer:
+            self._dispatch(self._take_batch())
+        if self._queue is not None:
+            self._queue.join()
+        return self.result
+
+    def close(self) -> BulkWriteResult:
+        """Flush and stop the background worker (if any)"""
+        self.flush()
+        if self._queue is not None and self._worker is not None:
+            self._queue.put(None)
+            self._worker.join()
+            self._queue = None
+            self._worker = None
+        return self.result
+
+    def _dispatch(self, batch: List[Any]) -> None:
+        if self._queue is not None:
+            # Blocks when the writer thread is max_pending_batches behind
+            self._queue.put(batch)
+        else:
+            self._write(batch)
+
+    def _drain(self) -> None:
+        while True:
+            batch = self._queue.get()
+            try:
+                if batch is None:
+                    return
+                self._write(batch)
+            finally:
+                self._queue.task_done()
+
+    def _write(self, batch: List[Any]) -> None:
+        try:
+            result = self.collection.bulk_write(batch, ordered=self.ordered)
+            self._record(BulkWriteResult.from_pymongo(result, len(batch)))
+        except BulkWriteError as bwe:
+            self._record(BulkWriteResult.from_error(bwe, len(batch)))
+        except Exception as e:
+            logger.error(f"❌ {self.label}: bulk write of {len(batch)} ops failed: {e}")
+            self._record(BulkWriteResult(batches=1, operations=len(batch), errors=len(batch)))
+
+
+class AsyncBulkWriter(_BaseBulkWriter):
+    """
+    Buffered writer for a Motor collection
+
+    A full buffer is awaited before ``add`` returns, which bounds memory the
+    same way the synchronous writer does.
+    """
+
+    async def __aenter__(self) -> "AsyncBulkWriter":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.flush()
+
+    async def add(self, operation) -> None:
+        self._buffer.append(operation)
+        if len(self._buffer) >= self.batch_size:
+            await self._write(self._take_batch())
+
+    async def update_one(self, filter: Dict[str, Any], update: Dict[str, Any], upsert: bool = True) -> None:
+        await self.add(UpdateOne(filter, update, upsert=upsert))
+
+    async def replace_one(self, filter: Dict[str, Any], document: Dict[str, Any], upsert: bool = True) -> None:
+        await self.add(ReplaceOne(filter, document, upsert=upsert))
+
+    async def flush(self) -> BulkWriteResult:
+        if self._buffer:
+            await self._write(self._take_batch())
+        return self.result
+
+    async def _write(self, batch: List[Any]) -> None:
+        try:
+            result = await self.collection.bulk_write(batch, ordered=self.ordered)
+            self._record(BulkWriteResult.from_pymongo(result, len(batch)))
+        except BulkWriteError as bwe:
+            self._record(BulkWriteResult.from_error(bwe, len(batch)))
+        except Exception as e:
+            logger.error(f"❌ {self.label}: bulk write of {len(batch)} ops failed: {e}")
+            self._record(BulkWriteResult(batches=1, operations=len(batch), errors=len(batch)))
@@ -0,0 +1,86 @@
+"""
+Collection Version Counters
+
+``cache_versions`` holds one counter per collection (``_id`` is the
+collection name). Writers bump the counters of the collections they changed;
+caches remember the counters their entries were built from and treat an
+entry as stale as soon as one of them moved. This works across API workers
+and collector processes without any pub/sub.
+
+The identity index (``member_identifiers``) uses the same counters.
+
+Example:
+    bump_collection_versions(db, "slack_messages", "activity_timeline")
+
+    versions = await collection_versions.get_async(db)
+    versions.get("activity_timeline", 0)
+"""
+
+import time
+from typing import Dict, Iterable, Optional
+
+from pymongo import UpdateOne
+
+VERSIONS_COLLECTION = "cache_versions"
+
+DEFAULT_CHECK_INTERVAL = 2.0
+
+
+def _bump_operations(collections: Iterable[str]):
+    return [
+        UpdateOne({"_id": name}, {"$inc": {"version": 1}}, upsert=True)
+        for name in sorted(set(collections))
+        if name
+    ]
+
+
+def bump_collection_versions(db, *collections: str) -> None:
+    """Bump the version counters of ``collections`` (pymongo database)"""
+    operations = _bump_operations(collections)
+    if operations:
+        db[VERSIONS_COLLECTION].bulk_write(operations, ordered=False)
+
+
+async def bump_collection_versions_async(db, *collections: str) -> None:
+    """Bump the version counters of ``collections`` (Motor database)"""
+    operations = _bump_operations(collections)
+    if operations:
+        await db[VERSIONS_COLLECTION].bulk_write(operations, ordered=False)
+
+
+class CollectionVersionCache:
+    """
+    Process-local snapshot of every version counter
+
+    ``cache_versions`` holds one small document per collection, so the whole
+    collection is re-read at most once per ``check_interval`` seconds.
+    """
+
+    def __init__(self, check_interval: float = DEFAULT_CHECK_INTERVAL):
+        self.check_interval = check_interval
+        self._versions: Optional[Dict[str, int]] = None
+        self._checked_at = 0.0
+
+    def invalidate(self) -> None:
+        """Force the next read to reload the counters"""
+        self._versions = None
+        self._checked_at = 0.0
+
+    async def get_async(self, db) -> Dict[str, int]:
+        """Current counters (collection -> version; missing means 0)"""
+        if self._versions is not None and time.monotonic() - self._checked_at < self.check_interval:
+            return self._versions
+
+        docs = await db[VERSIONS_COLLECTION].find({}, {"version": 1}).to_list(length=None)
+        self._versions = {doc["_id"]: doc.get("version", 0) for doc in docs}
+        self._checked_at = time.monotonic()
+        return self._versions
+
+
+def snapshot(versions: Dict[str, int], collections: Iterable[str]) -> Dict[str, int]:
+    """Counters of ``collections`` only (missing counters are 0)"""
+    return {name: versions.get(name, 0) for name in collections}
+
+
+# Shared per-process cache for Motor handlers
+collection_versions = CollectionVersionCache()
@@ -0,0 +1,199 @@
+"""
+Collection Checkpoints
+
+Per-source high-water marks stored in ``collection_checkpoints``, keyed by
+``(source, scope)``. A scope is whatever unit a collector pages through: a
+GitHub repository, a Slack channel, or ``"*"`` for source-wide marks (Notion
+search, Drive activity feed).
+
+Each checkpoint holds the last successfully persisted position:
+- ``cursor``: opaque API cursor (e.g. Slack ``ts``)
+- ``timestamp``: last data timestamp seen (UTC)
+- ``etag``: change marker for the scope (e.g. GitHub ``pushedAt``)
+
+Collectors stage new positions while fetching and only commit them after the
+corresponding documents are saved, so a failed run resumes from the last good
+position instead of skipping data. Streaming collectors emit positions as
+``CheckpointMark`` records instead (see ``src/core/record_pipeline.py``).
+
+A collection abandoned by the orchestrator (e.g. after a timeout) may still
+be running on a background thread; once its ``cancelled`` event is set, the
+store stops writing checkpoints.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from pymongo import ASCENDING, UpdateOne
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+CHECKPOINTS_COLLECTION = "collection_checkpoints"
+
+# Scope for checkpoints that cover a whole source
+SOURCE_SCOPE = "*"
+
+
+class CollectionCancelled(Exception):
+    """Raised to stop a collection that was abandoned (e.g. after a timeout)"""
+
+
+@dataclass
+class CheckpointMark:
+    """A position reached by a streaming collector (see ``CheckpointStore.stage``)"""
+
+    scope: str = SOURCE_SCOPE
+    cursor: Optional[str] = None
+    timestamp: Optional[datetime] = None
+    etag: Optional[str] = None
+    extra: Dict[str, Any] = field(default_factory=dict)
+    # Called once the mark is committed, to persist source-specific state
+    # that must not run ahead of the saved records (e.g. Slack thread watermarks)
+    on_commit: Optional[Callable[[], Any]] = None
+
+
+def ensure_checkpoint_indexes(db) -> None:
+    """Create the (source, scope) unique index"""
+    db[CHECKPOINTS_COLLECTION].create_index(
+        [("source", ASCENDING), ("scope", ASCENDING)], unique=True, background=True
+    )
+
+
+def as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Return a timezone-aware UTC datetime (naive values are treated as UTC)"""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def resume_from(start: datetime, checkpoint: Optional[Dict[str, Any]]) -> datetime:
+    """Later of the requested start and the checkpoint timestamp (keeps start's tz-awareness)"""
+    if not checkpoint or not checkpoint.get("timestamp"):
+        return start
+    mark = as_utc(checkpoint["timestamp"])
+    if mark <= as_utc(start):
+        return start
+    return mark if start.tzinfo is not None else mark.replace(tzinfo=None)
+
+
+class CheckpointStore:
+    """
+    Read/write access to ``collection_checkpoints`` for one source
+
+    Args:
+        db: pymongo database (or None to disable checkpoints)
+        source: Source name (github, slack, notion, drive)
+        enabled: When False, reads return nothing and commits are no-ops
+
+    Attributes:
+        cancelled: Event set when the collection was abandoned; commits are
+            dropped from then on (see ``SourceContext.guard``)
+    """
+
+    def __init__(self, db, source: str, enabled: bool = True):
+        self.db = db
+        self.source = source
+        self.enabled = enabled and db is not None
+        self._cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._staged: Dict[str, Dict[str, Any]] = {}
+        self.cancelled: Optional[threading.Event] = None
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self.cancelled is not None and self.cancelled.is_set()
+
+    @property
+    def collection(self):
+        return self.db[CHECKPOINTS_COLLECTION]
+
+    def all(self) -> Dict[str, Dict[str, Any]]:
+        """All checkpoints for this source, keyed by scope (loaded once)"""
+        if not self.enabled:
+            return {}
+        if self._cache is None:
+            self._cache = {
+                doc["scope"]: doc
+                for doc in self.collection.find({"source": self.source}, {"_id": 0})
+            }
+        return self._cache
+
+    def get(self, scope: str = SOURCE_SCOPE) -> Optional[Dict[str, Any]]:
+        return self.all().get(scope)
+
+    def stage(
+        self,
+        scope: str = SOURCE_SCOPE,
+        cursor: Optional[str] = None,
+        timestamp: Optional[datetime] = None,
+        etag: Optional[str] = None,
+        **extra: Any,
+    ) -> None:
+        """
+        Record a new position to be written by :meth:`commit`
+
+        Timestamps only move forward: staging an older timestamp for a scope
+        keeps the newer one.
+        """
+        if not self.enabled:
+            return
+
+        entry = self._staged.setdefault(scope, {})
+        if cursor is not None:
+            entry["cursor"] = cursor
+        if etag is not None:
+            entry["etag"] = etag
+        if timestamp is not None:
+            timestamp = as_utc(timestamp)
+            current = entry.get("timestamp")
+            if current is None or timestamp > current:
+                entry["timestamp"] = timestamp
+        entry.update(extra)
+
+    def stage_mark(self, mark: CheckpointMark) -> None:
+        """Stage a position emitted by a streaming collector"""
+        self.stage(mark.scope, cursor=mark.cursor, timestamp=mark.timestamp, etag=mark.etag, **mark.extra)
+
+    def staged_scopes(self) -> Tuple[str, ...]:
+        return tuple(self._staged)
+
+    def discard(self) -> None:
+        self._staged = {}
+
+    def commit(self) -> int:
+        """Persist staged checkpoints; returns the number of scopes written"""
+        if not self.enabled or not self._staged:
+            return 0
+        if self.is_cancelled:
+            logger.warning(f"⚠️  {self.source} collection was abandoned; dropping {len(self._staged)} staged checkpoints")
+            self._staged = {}
+            return 0
+
+        now = datetime.now(timezone.utc)
+        operations = []
+        for scope, entry in self._staged.items():
+            fields = {**entry, "updated_at": now}
+            operations.append(
+                UpdateOne(
+                    {"source": self.source, "scope": scope},
+                    {"$set": fields},
+                    upsert=True,
+                )
+            )
+            if self._cache is not None:
+                self._cache.setdefault(scope, {"source": self.source, "scope": scope}).update(fields)
+
+        try:
+            self.collection.bulk_write(operations, ordered=False)
+        except Exception as e:
+            logger.warning(f"⚠️  Failed to save {self.source} checkpoints: {e}")
+            return 0
+
+        written = len(operations)
+        self._staged = {}
+        return written
@@ -0,0 +1,344 @@
+"""
+Collaboration Engine
+
+Scores how much team members work together from:
+
+- GitHub PR reviews: PR author <-> each reviewer (weight 3.0)
+- Slack threads: every pair of thread participants (weight 2.0)
+- GitHub issues: every pair among author and assignees (weight 1.5)
+
+Each interaction scores ``weight * recency`` where
+``recency = max(0.3, 1 - days_ago / 90)``.
+
+Pairs are extracted from PR / issue / thread documents by the pure functions
+below. The materialized store (``src/core/collaboration_store.py``) persists
+them as per-day buckets that ``CollaborationMatrix.add_bucket`` folds back
+in. Interactions are accumulated into dense (source x member x member) NumPy
+arrays, so one pass produces the whole team's collaboration matrix and a
+member's network is one row of it.
+
+Example:
+    matrix = await load_collaboration_matrix(db, start, end)
+    network = matrix.network("Alice", min_score=5.0)
+    edges = matrix.edges(min_score=5.0)
+"""
+
+from datetime import datetime, timedelta, timezone
+from itertools import combinations
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from src.core.identity_index import IdentityIndex
+
+# Interaction sources and weights (matrix axis 0 order)
+SOURCE_WEIGHTS: Dict[str, float] = {
+    "github_pr_review": 3.0,
+    "slack_thread": 2.0,
+    "github_issue": 1.5,
+}
+SOURCES = list(SOURCE_WEIGHTS)
+
+# Recency: full weight today, linearly less over RECENCY_DAYS, never below the floor
+RECENCY_DAYS = 90
+RECENCY_FLOOR = 0.3
+
+_EPOCH = datetime(1970, 1, 1)
+_NO_TIME = np.iinfo(np.int64).min
+
+
+def _to_micros(timestamp: Optional[datetime]) -> int:
+    if timestamp is None:
+        return _NO_TIME
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return (timestamp - _EPOCH) // timedelta(microseconds=1)
+
+
+def _from_micros(micros: int) -> Optional[datetime]:
+    if micros in (_NO_TIME, np.iinfo(np.int64).max):
+        return None
+    return _EPOCH + timedelta(microseconds=int(micros))
+
+
+def recency_multipliers(timestamps: np.ndarray, now: datetime) -> np.ndarray:
+    """
+    Recency multiplier per interaction
+
+    Args:
+        timestamps: Interaction times in epoch microseconds (``_NO_TIME`` = unknown)
+        now: Reference time
+
+    Returns:
+        1.0 for unknown times, else max(0.3, 1 - whole days ago / 90)
+    """
+    days_ago = np.floor((_to_micros(now) - timestamps) / 86_400_000_000)
+    multipliers = np.maximum(RECENCY_FLOOR, 1.0 - days_ago / RECENCY_DAYS)
+    return np.where(timestamps == _NO_TIME, 1.0, multipliers)
+
+
+def project_from_repo(repo_name: Optional[str]) -> Optional[str]:
+    """Project key inferred from a repository name"""
+    repo_lower = (repo_name or "").lower()
+    if not repo_lower:
+        return None
+    if "zk" in repo_lower or "ooo" in repo_lower or "zkp" in repo_lower:
+        return "ooo"
+    if "rollup" in repo_lower or "trh" in repo_lower:
+        return "trh"
+    if "drb" in repo_lower:
+        return "drb"
+    if "eco" in repo_lower or "grants" in repo_lower:
+        return "eco"
+    if "syb" in repo_lower or "sybil" in repo_lower:
+        return "syb"
+    return None
+
+
+def project_from_channel_name(channel_name: Optional[str]) -> Optional[str]:
+    """Project key inferred from a Slack channel name"""
+    name = (channel_name or "").lower()
+    if not name:
+        return None
+    if "ooo" in name or "zkp" in name:
+        return "ooo"
+    if "trh" in name or "rollup" in name:
+        return "trh"
+    if "drb" in name:
+        return "drb"
+    if "eco" in name:
+        return "eco"
+    if "syb" in name or "sybil" in name:
+        return "syb"
+    return None
+
+
+class CollaborationMatrix:
+    """
+    Accumulates pairwise interactions into dense per-source matrices
+
+    Args:
+        now: Reference time for the recency multiplier
+    """
+
+    def __init__(self, now: Optional[datetime] = None):
+        self.now = now or datetime.utcnow()
+        self.names: List[str] = []
+        self._index: Dict[str, int] = {}
+        # (a, b, source, count, recency micros, first micros, last micros)
+        self._rows: List[Tuple[int, int, int, int, int, int, int]] = []
+        self._projects: Dict[Tuple[int, int], Set[str]] = {}
+        self._built = False
+
+    def node(self, name: str) -> int:
+        """Matrix index of a member (case-insensitive)"""
+        key = name.lower()
+        if key not in self._index:
+            self._index[key] = len(self.names)
+            self.names.append(name)
+        return self._index[key]
+
+    def add(
+        self,
+        member_a: str,
+        member_b: str,
+        source: str,
+        timestamp: Optional[datetime],
+        project_key: Optional[str] = None,
+    ) -> None:
+        """Record one interaction between two members (self-pairs are ignored)"""
+        micros = _to_micros(timestamp)
+        self._append(member_a, member_b, source, 1, micros, micros, micros, [project_key])
+
+    def add_bucket(
+        self,
+        member_a: str,
+        member_b: str,
+        source: str,
+        count: int,
+        day: datetime,
+        first_at: Optional[datetime] = None,
+        last_at: Optional[datetime] = None,
+        project_keys: Optional[Iterable[str]] = None,
+    ) -> None:
+        """
+        Record a day bucket of ``count`` interactions between two members
+
+        Recency is taken from the start of ``day``, so every interaction of
+        the bucket gets the same multiplier.
+        """
+        self._append(
+            member_a, member_b, source, count, _to_micros(day),
+            _to_micros(first_at or day), _to_micros(last_at or day), project_keys or [],
+        )
+
+    def _append(self, member_a, member_b, source, count, recency, first, last, project_keys) -> None:
+        a, b = self.node(member_a), self.node(member_b)
+        if a == b or count <= 0:
+            return
+        self._rows.append((a, b, SOURCES.index(source), count, recency, first, last))
+        for project_key in project_keys:
+            if project_key:
+                self._projects.setdefault((min(a, b), max(a, b)), set()).add(project_key)
+        self._built = False
+
+    def build(self) -> None:
+        """Fold recorded interactions into the score/count/time arrays"""
+        n, s = len(self.names), len(SOURCES)
+        self.scores = np.zeros((s, n, n))
+        self.counts = np.zeros((s, n, n), dtype=np.int64)
+        self.last = np.full((s, n, n), _NO_TIME, dtype=np.int64)
+        self.first = np.full((s, n, n), np.iinfo(np.int64).max, dtype=np.int64)
+
+        if self._rows:
+            rows = np.array(self._rows, dtype=np.int64)
+            a, b, src, count = rows[:, 0], rows[:, 1], rows[:, 2], rows[:, 3]
+            recency, first, last = rows[:, 4], rows[:, 5], rows[:, 6]
+            weights = np.array([SOURCE_WEIGHTS[name] for name in SOURCES])[src]
+            scores = weights * recency_multipliers(recency, self.now) * count
+
+            # Interactions are symmetric: credit both directions
+            def both(values):
+                return np.concatenate([values, values])
+
+            index = (both(src), np.concatenate([a, b]), np.concatenate([b, a]))
+            np.add.at(self.scores, index, both(scores))
+            np.add.at(self.counts, index, both(count))
+            np.maximum.at(self.last, index, both(last))
+            first2 = both(first)
+            known = first2 != _NO_TIME
+            np.minimum.at(self.first, tuple(axis[known] for axis in index), first2[known])
+
+        self.total_scores = self.scores.sum(axis=0)
+        self.total_counts = self.counts.sum(axis=0)
+        self._built = True
+
+    def _ensure_built(self) -> None:
+        if not self._built:
+            self.build()
+
+    def _pair(self, i: int, j: int) -> Dict[str, Any]:
+        details = []
+        for k, source in enumerate(SOURCES):
+            if self.counts[k, i, j]:
+                details.append(
+                    {
+                        "source": source,
+                        "count": int(self.counts[k, i, j]),
+                        "score": float(self.scores[k, i, j]),
+                        "recent_activity": _from_micros(self.last[k, i, j]),
+                    }
+                )
+        return {
+            "name": self.names[j],
+            "total_score": float(self.total_scores[i, j]),
+            "interaction_count": int(self.total_counts[i, j]),
+            "details": details,
+            "common_projects": sorted(self._projects.get((min(i, j), max(i, j)), set())),
+            "first_interaction": _from_micros(self.first[:, i, j].min()),
+            "last_interaction": _from_micros(self.last[:, i, j].max()),
+        }
+
+    def network(self, member_name: str, min_score: float = 0.0) -> Dict[str, Dict[str, Any]]:
+        """
+        Collaborators of one member
+
+        Returns:
+            Collaborator name -> {name, total_score, interaction_count,
+            details, common_projects, first_interaction, last_interaction}
+        """
+        self._ensure_built()
+        i = self._index.get(member_name.lower())
+        if i is None:
+            return {}
+        row = self.total_scores[i]
+        return {
+            self.names[j]: self._pair(i, j)
+            for j in np.flatnonzero((self.total_counts[i] > 0) & (row >= min_score))
+        }
+
+    def edges(self, min_score: float = 0.0) -> List[Dict[str, Any]]:
+        """
+        Every collaborating pair once (highest score first)
+
+        Returns:
+            [{source_name, target_name, total_score, interaction_count, details, common_projects, ...}]
+        """
+        self._ensure_built()
+        upper = np.triu((self.total_counts > 0) & (self.total_scores >= min_score), k=1)
+        result = []
+        for i, j in zip(*np.nonzero(upper)):
+            pair = self._pair(i, j)
+            pair["source_name"] = self.names[i]
+            pair["target_name"] = pair.pop("name")
+            result.append(pair)
+        result.sort(key=lambda e: e["total_score"], reverse=True)
+        return result
+
+
+class _Resolver:
+    """Identifier -> member display name, with the legacy title-case fallback"""
+
+    def __init__(self, identity: IdentityIndex, overrides: Optional[Dict[Tuple[str, str], str]] = None):
+        self.identity = identity
+        self.overrides = overrides or {}
+        self.slack = {
+            key.lower(): entry["member"] for key, entry in identity.get("slack", {}).items()
+        }
+
+    def github(self, username: str) -> str:
+        name = self.overrides.get(("github", username.lower())) or self.identity.member_for("github", username)
+        return username.title() if not name or name == username else name
+
+    def slack_user(self, user_name: str) -> str:
+        name = self.overrides.get(("slack", user_name.lower())) or self.slack.get(user_name.lower())
+        return user_name.title() if not name or name == user_name else name
+
+
+def pull_request_pairs(pr: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """(author, reviewer) GitHub username pairs of a PR (self-reviews dropped)"""
+    author = pr.get("author") or ""
+    reviewers = {r.get("reviewer") for r in pr.get("reviews", []) if r.get("reviewer")}
+    reviewers.discard(author)
+    if not author:
+        return []
+    return [(author, reviewer) for reviewer in sorted(reviewers)]
+
+
+def issue_pairs(issue: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """Every pair among an issue's author and assignees (GitHub usernames)"""
+    people = {(issue.get("user") or {}).get("login") or issue.get("author")}
+    for assignee in issue.get("assignees") or []:
+        people.add(assignee.get("login") if isinstance(assignee, dict) else assignee)
+    return list(combinations(sorted(p for p in people if p), 2))
+
+
+def issue_repository(issue: Dict[str, Any]) -> Optional[str]:
+    """Repository of an issue (GitHub API and collector field names)"""
+    return issue.get("repository_name") or issue.get("repository")
+
+
+def group_threads(messages: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Group thread messages by ``thread_ts``
+
+    Returns:
+        thread_ts -> {"users": set of user names, "latest": newest posted_at,
+        "channel_id": channel of the thread}
+    """
+    threads: Dict[str, Dict[str, Any]] = {}
+    for msg in messages:
+        thread = threads.setdefault(msg["thread_ts"], {"users": set(), "latest": None, "channel_id": None})
+        if msg.get("user_name"):
+            thread["users"].add(msg["user_name"])
+        posted_at = msg.get("posted_at")
+        if posted_at and (thread["latest"] is None or posted_at > thread["latest"]):
+            thread["latest"] = posted_at
+        if not thread["channel_id"]:
+            thread["channel_id"] = msg.get("channel_id")
+    return threads
+
+
+def thread_pairs(thread: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """Every pair of participants of a grouped thread (Slack user names)"""
+    return list(combinations(sorted(thread["users"]), 2))
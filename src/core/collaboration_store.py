@@ -0,0 +1,459 @@
+"""
+Materialized Collaboration Store
+
+Persists the collaboration matrix (see ``src/core/collaboration.py``) so the
+API never recomputes it from raw PRs, issues and Slack threads:
+
+- ``collaboration_events``: one document per PR / issue / Slack thread with
+  the resolved member pairs it contributes, its timestamp, day and project
+  (``_id`` is ``"<kind>:<natural key>"``, so re-collecting upserts)
+- ``collaboration_daily``: one bucket per (day, source, member pair) with the
+  interaction count, first/last interaction and project keys
+
+Collectors call :meth:`CollaborationStore.safe_update` with the PRs, issues
+and threads they just saved; the store re-reads those documents, replaces
+their events and rebuilds the day buckets the events moved in or out of.
+Rebuilding a day is idempotent, like the activity rollups.
+
+Readers fold the buckets of a window into a ``CollaborationMatrix``, which
+applies the recency weighting per bucket with vectorized NumPy math. Windows
+are whole days and recency is measured from the start of each bucket's day.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from pymongo import ASCENDING, DeleteOne
+
+from src.core.activity_timeline import to_utc_naive
+from src.core.bulk_writer import BulkWriter
+from src.core.cache_versions import bump_collection_versions
+from src.core.collaboration import (
+    CollaborationMatrix,
+    _Resolver,
+    group_threads,
+    issue_pairs,
+    issue_repository,
+    project_from_channel_name,
+    project_from_repo,
+    pull_request_pairs,
+    thread_pairs,
+)
+from src.core.identity_index import sync_identity_cache
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+EVENTS_COLLECTION = "collaboration_events"
+DAILY_COLLECTION = "collaboration_daily"
+
+DATE_FORMAT = "%Y-%m-%d"
+
+DEFAULT_BATCH_SIZE = 1000
+
+PR_PROJECTION = {"repository": 1, "number": 1, "author": 1, "reviews.reviewer": 1, "created_at": 1}
+ISSUE_PROJECTION = {
+    "repository": 1,
+    "repository_name": 1,
+    "number": 1,
+    "author": 1,
+    "user.login": 1,
+    "assignees": 1,
+    "created_at": 1,
+}
+MESSAGE_PROJECTION = {"thread_ts": 1, "user_name": 1, "posted_at": 1, "channel_id": 1}
+
+
+def ensure_collaboration_indexes(db) -> None:
+    """Create the indexes backing the collaboration store (sync database)"""
+    db[EVENTS_COLLECTION].create_index([("date", ASCENDING)])
+    daily = db[DAILY_COLLECTION]
+    daily.create_index([("date", ASCENDING)])
+    daily.create_index([("member_a_key", ASCENDING), ("date", ASCENDING)])
+    daily.create_index([("member_b_key", ASCENDING), ("date", ASCENDING)])
+
+
+def _chunks(items: List[Any], size: int):
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+# =============================================================================
+# Events
+# =============================================================================
+
+
+def build_event(
+    event_id: str,
+    source: str,
+    timestamp: Any,
+    project_key: Optional[str],
+    pairs: Iterable[Tuple[str, str]],
+) -> Optional[Dict[str, Any]]:
+    """
+    Collaboration event for one PR / issue / thread
+
+    Args:
+        event_id: Deterministic ``_id``
+        source: Interaction source (key of ``SOURCE_WEIGHTS``)
+        timestamp: Interaction time
+        project_key: Project inferred from the repository / channel
+        pairs: Resolved member name pairs
+
+    Returns:
+        Event document, or None when it has no time or no member pair
+    """
+    timestamp = to_utc_naive(timestamp)
+    if timestamp is None:
+        return None
+
+    unique: Dict[Tuple[str, str], Dict[str, str]] = {}
+    for x, y in pairs:
+        if not x or not y or x.lower() == y.lower():
+            continue
+        (a, a_key), (b, b_key) = sorted([(x, x.lower()), (y, y.lower())], key=lambda p: p[1])
+        unique.setdefault((a_key, b_key), {"a": a, "b": b, "a_key": a_key, "b_key": b_key})
+    if not unique:
+        return None
+
+    return {
+        "_id": event_id,
+        "source": source,
+        "timestamp": timestamp,
+        "date": timestamp.strftime(DATE_FORMAT),
+        "project_key": project_key,
+        "pairs": list(unique.values()),
+    }
+
+
+def pull_request_event(pr: Dict[str, Any], resolver: _Resolver) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """(event id, event) for a ``github_pull_requests`` document"""
+    event_id = f"pr:{pr.get('repository')}#{pr.get('number')}"
+    pairs = [(resolver.github(a), resolver.github(b)) for a, b in pull_request_pairs(pr)]
+    return event_id, build_event(
+        event_id, "github_pr_review", pr.get("created_at"), project_from_repo(pr.get("repository")), pairs
+    )
+
+
+def issue_event(issue: Dict[str, Any], resolver: _Resolver) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """(event id, event) for a ``github_issues`` document"""
+    repository = issue_repository(issue)
+    event_id = f"issue:{repository}#{issue.get('number')}"
+    pairs = [(resolver.github(a), resolver.github(b)) for a, b in issue_pairs(issue)]
+    return event_id, build_event(
+        event_id, "github_issue", issue.get("created_at"), project_from_repo(repository), pairs
+    )
+
+
+def thread_event(
+    thread_ts: str, thread: Dict[str, Any], project_key: Optional[str], resolver: _Resolver
+) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """(event id, event) for a thread grouped by ``group_threads``"""
+    event_id = f"thread:{thread.get('channel_id')}:{thread_ts}"
+    pairs = [(resolver.slack_user(a), resolver.slack_user(b)) for a, b in thread_pairs(thread)]
+    return event_id, build_event(event_id, "slack_thread", thread["latest"], project_key, pairs)
+
+
+# =============================================================================
+# Day buckets
+# =============================================================================
+
+
+def bucket_id(date: str, source: str, a_key: str, b_key: str) -> str:
+    """Deterministic bucket ``_id``"""
+    return f"{date}|{source}|{a_key}|{b_key}"
+
+
+def _day_pipeline(date: str) -> List[Dict[str, Any]]:
+    return [
+        {"$match": {"date": date}},
+        {"$unwind": "$pairs"},
+        {
+            "$group": {
+                "_id": {"source": "$source", "a_key": "$pairs.a_key", "b_key": "$pairs.b_key"},
+                "member_a": {"$first": "$pairs.a"},
+                "member_b": {"$first": "$pairs.b"},
+                "count": {"$sum": 1},
+                "first_at": {"$min": "$timestamp"},
+                "last_at": {"$max": "$timestamp"},
+                "project_keys": {"$addToSet": "$project_key"},
+            }
+        },
+    ]
+
+
+def build_bucket_docs(
+    date: str, groups: Iterable[Dict[str, Any]], now: Optional[datetime] = None
+) -> List[Dict[str, Any]]:
+    """Day bucket documents from the output of the day aggregation"""
+    now = now or datetime.utcnow()
+    docs = []
+    for group in groups:
+        key = group["_id"]
+        docs.append(
+            {
+                "_id": bucket_id(date, key["source"], key["a_key"], key["b_key"]),
+                "date": date,
+                "source": key["source"],
+                "member_a": group["member_a"],
+                "member_b": group["member_b"],
+                "member_a_key": key["a_key"],
+                "member_b_key": key["b_key"],
+                "count": group["count"],
+                "first_at": group.get("first_at"),
+                "last_at": group.get("last_at"),
+                "project_keys": sorted(p for p in group.get("project_keys") or [] if p),
+                "updated_at": now,
+            }
+        )
+    return docs
+
+
+def refresh_days(db, dates: Iterable[str]) -> int:
+    """
+    Rebuild the day buckets of the given dates from ``collaboration_events``
+
+    Args:
+        db: pymongo database
+        dates: YYYY-MM-DD days to rebuild
+
+    Returns:
+        Number of bucket documents written
+    """
+    events = db[EVENTS_COLLECTION]
+    daily = db[DAILY_COLLECTION]
+    written = 0
+
+    for date in sorted(set(dates)):
+        docs = build_bucket_docs(date, events.aggregate(_day_pipeline(date)))
+
+        with BulkWriter(daily, label=DAILY_COLLECTION) as writer:
+            for doc in docs:
+                writer.replace_one({"_id": doc["_id"]}, doc, upsert=True)
+
+        # Pairs that no longer interacted that day (edited threads, re-attributed members)
+        daily.delete_many({"date": date, "_id": {"$nin": [d["_id"] for d in docs]}})
+        written += len(docs)
+
+    return written
+
+
+# =============================================================================
+# Store (sync, for collectors and scripts)
+# =============================================================================
+
+
+class CollaborationStore:
+    """
+    Keeps ``collaboration_events`` and ``collaboration_daily`` up to date
+
+    Args:
+        db: pymongo database
+        batch_size: Source documents read / events written per batch
+    """
+
+    def __init__(self, db, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.db = db
+        self.batch_size = batch_size
+        self.events = db[EVENTS_COLLECTION]
+
+    def _resolver(self) -> _Resolver:
+        return _Resolver(sync_identity_cache.get(self.db))
+
+    def _save_events(self, built: List[Tuple[str, Optional[Dict[str, Any]]]]) -> Set[str]:
+        """
+        Replace (or drop) events and return every day they were or are in
+        """
+        if not built:
+            return set()
+
+        ids = [event_id for event_id, _ in built]
+        dates = {doc["date"] for doc in self.events.find({"_id": {"$in": ids}}, {"date": 1})}
+
+        with BulkWriter(self.events, batch_size=self.batch_size, label=EVENTS_COLLECTION) as writer:
+            for event_id, event in built:
+                if event is None:
+                    writer.add(DeleteOne({"_id": event_id}))
+                else:
+                    writer.replace_one({"_id": event_id}, event, upsert=True)
+                    dates.add(event["date"])
+        if writer.result.errors:
+            logger.warning(f"⚠️  Collaboration event write errors: {writer.result.errors}")
+        return dates
+
+    def _pull_request_dates(self, query: Dict[str, Any], resolver: _Resolver) -> Set[str]:
+        dates: Set[str] = set()
+        cursor = self.db["github_pull_requests"].find(query, PR_PROJECTION)
+        for chunk in _chunks(list(cursor), self.batch_size):
+            dates |= self._save_events([pull_request_event(pr, resolver) for pr in chunk])
+        return dates
+
+    def _issue_dates(self, query: Dict[str, Any], resolver: _Resolver) -> Set[str]:
+        dates: Set[str] = set()
+        cursor = self.db["github_issues"].find(query, ISSUE_PROJECTION)
+        for chunk in _chunks(list(cursor), self.batch_size):
+            dates |= self._save_events([issue_event(issue, resolver) for issue in chunk])
+        return dates
+
+    def _thread_dates(self, thread_keys: List[Tuple[str, str]], resolver: _Resolver) -> Set[str]:
+        dates: Set[str] = set()
+        for chunk in _chunks(sorted(set(thread_keys)), self.batch_size):
+            by_channel: Dict[str, List[str]] = {}
+            for channel_id, thread_ts in chunk:
+                by_channel.setdefault(channel_id, []).append(thread_ts)
+
+            # Whole threads: participants of earlier replies count too
+            messages = self.db["slack_messages"].find(
+                {"$or": [{"channel_id": c, "thread_ts": {"$in": ts}} for c, ts in by_channel.items()]},
+                MESSAGE_PROJECTION,
+            )
+            threads = group_threads(messages)
+            channel_projects = {
+                channel["channel_id"]: project_from_channel_name(channel.get("name"))
+                for channel in self.db["slack_channels"].find(
+                    {"channel_id": {"$in": list(by_channel)}}, {"channel_id": 1, "name": 1}
+                )
+            }
+            built = [
+                thread_event(ts, thread, channel_projects.get(thread["channel_id"]), resolver)
+                for ts, thread in threads.items()
+            ]
+            dates |= self._save_events(built)
+        return dates
+
+    def update(
+        self,
+        pull_requests: Iterable[Tuple[str, int]] = (),
+        issues: Iterable[Tuple[str, int]] = (),
+        threads: Iterable[Tuple[str, str]] = (),
+    ) -> int:
+        """
+        Re-derive events for freshly saved documents and refresh their days
+
+        Args:
+            pull_requests: (repository, number) of saved PRs
+            issues: (repository, number) of saved issues
+            threads: (channel_id, thread_ts) of threads that got messages
+
+        Returns:
+            Number of day bucket documents written
+        """
+        resolver = self._resolver()
+        dates: Set[str] = set()
+
+        for collection_keys, loader in ((pull_requests, self._pull_request_dates), (issues, self._issue_dates)):
+            by_repo: Dict[str, List[int]] = {}
+            for repository, number in collection_keys:
+                by_repo.setdefault(repository, []).append(number)
+            if by_repo:
+                query = {"$or": [{"repository": r, "number": {"$in": n}} for r, n in by_repo.items()]}
+                dates |= loader(query, resolver)
+
+        thread_keys = [(c, ts) for c, ts in threads if c and ts]
+        if thread_keys:
+            dates |= self._thread_dates(thread_keys, resolver)
+
+        written = refresh_days(self.db, dates)
+        if dates:
+            bump_collection_versions(self.db, EVENTS_COLLECTION, DAILY_COLLECTION)
+        return written
+
+    def safe_update(self, **keys) -> int:
+        """Like :meth:`update`, but never lets a store failure break collection"""
+        try:
+            return self.update(**keys)
+        except Exception as e:
+            logger.warning(f"⚠️  Failed to update collaboration store: {e}")
+            return 0
+
+    def rebuild(self, since: Optional[datetime] = None) -> int:
+        """
+        Re-derive every event (optionally since a date) and rebuild their days
+
+        Returns:
+            Number of day bucket documents written
+        """
+        resolver = self._resolver()
+        window: Dict[str, Any] = {}
+        if since is not None:
+            window = {"$gte": since.replace(hour=0, minute=0, second=0, microsecond=0)}
+
+        dates = self._pull_request_dates({"created_at": window} if window else {}, resolver)
+        dates |= self._issue_dates({"created_at": window} if window else {}, resolver)
+
+        match: Dict[str, Any] = {"thread_ts": {"$exists": True, "$ne": None}}
+        if window:
+            match["posted_at"] = window
+        thread_keys = [
+            (doc["_id"]["channel_id"], doc["_id"]["thread_ts"])
+            for doc in self.db["slack_messages"].aggregate(
+                [
+                    {"$match": match},
+                    {"$group": {"_id": {"channel_id": "$channel_id", "thread_ts": "$thread_ts"}}},
+                ],
+                allowDiskUse=True,
+            )
+        ]
+        dates |= self._thread_dates(thread_keys, resolver)
+
+        logger.info(f"🤝 Rebuilding {len(dates)} collaboration days")
+        written = refresh_days(self.db, dates)
+        bump_collection_versions(self.db, EVENTS_COLLECTION, DAILY_COLLECTION)
+        return written
+
+
+# =============================================================================
+# Read helpers (Motor, for the API)
+# =============================================================================
+
+
+async def load_collaboration_matrix(
+    db,
+    start_date: datetime,
+    end_date: datetime,
+    member_name: Optional[str] = None,
+    now: Optional[datetime] = None,
+) -> CollaborationMatrix:
+    """
+    Collaboration matrix for a window, folded from the day buckets
+
+    Args:
+        db: Motor database
+        start_date: First day (inclusive)
+        end_date: Last day (inclusive)
+        member_name: Only load buckets involving this member
+        now: Reference time for recency (default: utcnow)
+
+    Returns:
+        Built CollaborationMatrix
+    """
+    query: Dict[str, Any] = {
+        "date": {"$gte": start_date.strftime(DATE_FORMAT), "$lte": end_date.strftime(DATE_FORMAT)}
+    }
+    matrix = CollaborationMatrix(now)
+    if member_name:
+        key = member_name.lower()
+        query["$or"] = [{"member_a_key": key}, {"member_b_key": key}]
+        matrix.node(member_name)
+
+    cursor = db[DAILY_COLLECTION].find(
+        query,
+        {
+            "date": 1, "source": 1, "member_a": 1, "member_b": 1, "count": 1,
+            "first_at": 1, "last_at": 1, "project_keys": 1,
+        },
+    )
+    async for doc in cursor:
+        matrix.add_bucket(
+            doc["member_a"],
+            doc["member_b"],
+            doc["source"],
+            doc.get("count", 0),
+            datetime.strptime(doc["date"], DATE_FORMAT),
+            doc.get("first_at"),
+            doc.get("last_at"),
+            doc.get("project_keys"),
+        )
+
+    matrix.build()
+    return matrix
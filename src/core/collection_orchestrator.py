@@ -0,0 +1,281 @@
+"""
+Collection Orchestrator
+
+Runs the per-source collectors (GitHub, Slack, Notion, Drive, Ecosystem)
+concurrently instead of one after another. Each source gets its own
+``SourcePolicy``:
+
+- timeout_seconds: wall-clock limit for one attempt (None = no limit)
+- max_attempts / retry_delay_seconds: retries with exponential backoff
+- max_threads: how many blocking calls the source may run at once
+
+The plugins are synchronous (requests, slack_sdk, notion_client), so jobs hand
+their blocking calls to ``SourceContext.run_blocking``, which runs them on
+daemon threads owned by that source. A thread holds one of the source's
+``max_threads`` slots until it returns, even after its caller gave up.
+
+A source that times out is abandoned: its thread cannot be killed and keeps
+running in the background, but it no longer holds up the other sources, and
+the attempt's ``cancelled`` event is set. Checkpoint stores attached with
+``SourceContext.guard`` stop committing from then on, so an abandoned run
+never moves a checkpoint.
+
+Example:
+    async def collect_slack(ctx: SourceContext) -> int:
+        plugin = SlackPluginMongo(config, mongo_manager)
+        ctx.guard(plugin.checkpoints)
+        data = await ctx.run_blocking("collect", plugin.collect_data, start, end)
+        return len(data[0]["messages"])
+
+    orchestrator = CollectionOrchestrator({"slack": SourcePolicy(timeout_seconds=3600)})
+    runs = await orchestrator.run({"slack": collect_slack})
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class SourceDisabled(Exception):
+    """Raised by a job when its source is disabled in the configuration"""
+
+
+class PermanentSourceError(Exception):
+    """Failure that retrying will not fix (e.g. invalid credentials)"""
+
+
+@dataclass
+class SourcePolicy:
+    """Concurrency, timeout and retry settings for one source"""
+
+    timeout_seconds: Optional[float] = None
+    max_attempts: int = 1
+    retry_delay_seconds: float = 30.0
+    max_threads: int = 1
+
+    @classmethod
+    def from_config(
+        cls, config: Optional[Dict[str, Any]], default: Optional["SourcePolicy"] = None
+    ) -> "SourcePolicy":
+        """Overlay a config dict (e.g. ``plugins.<name>.orchestration``) on a default policy"""
+        base = default or cls()
+        config = config or {}
+        return cls(
+            timeout_seconds=config.get("timeout_seconds", base.timeout_seconds),
+            max_attempts=max(1, int(config.get("max_attempts", base.max_attempts))),
+            retry_delay_seconds=float(config.get("retry_delay_seconds", base.retry_delay_seconds)),
+            max_threads=max(1, int(config.get("max_threads", base.max_threads))),
+        )
+
+
+@dataclass
+class SourceRun:
+    """Outcome and timings of one source's collection"""
+
+    source: str
+    status: str = "pending"  # success, failed, disabled, timeout
+    items_collected: int = 0
+    error_message: Optional[str] = None
+    attempts: int = 0
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    timings: Dict[str, float] = field(default_factory=dict)  # phase -> seconds
+
+    @property
+    def duration_seconds(self) -> float:
+        if not self.started_at or not self.completed_at:
+            return 0.0
+        return (self.completed_at - self.started_at).total_seconds()
+
+
+def _resolve(future: asyncio.Future, result: Any = None, error: Optional[BaseException] = None) -> None:
+    if future.done():  # cancelled by a timeout
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+class SourceContext:
+    """
+    Per-source handle passed to jobs for blocking calls and phase timings
+
+    Attributes:
+        cancelled: Set when the attempt ends (timeout, failure or success);
+            blocking calls still running after that were abandoned
+    """
+
+    def __init__(self, source: str, policy: SourcePolicy, run: SourceRun, threads: asyncio.Semaphore):
+        self.source = source
+        self.policy = policy
+        self.run = run
+        self.cancelled = threading.Event()
+        self._threads = threads
+
+    def guard(self, checkpoints) -> None:
+        """Stop a plugin's CheckpointStore from committing once this attempt is abandoned"""
+        if checkpoints is not None:
+            checkpoints.cancelled = self.cancelled
+
+    @contextmanager
+    def timed(self, phase: str):
+        """Add the wall time of the enclosed block to ``run.timings[phase]``"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self.run.timings[phase] = round(self.run.timings.get(phase, 0.0) + elapsed, 3)
+
+    async def run_blocking(self, phase: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking call on one of this source's threads
+
+        Waits for a free slot when ``max_threads`` calls are already running.
+        The slot is released when the thread returns, not when the caller
+        stops waiting, so abandoned threads still count against the budget.
+
+        Args:
+            phase: Timing bucket (e.g. "authenticate", "collect", "save")
+            func: Blocking callable
+
+        Returns:
+            The callable's return value (exceptions are re-raised)
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        threads = self._threads
+
+        def finish(result: Any = None, error: Optional[BaseException] = None) -> None:
+            threads.release()
+            _resolve(future, result, error)
+
+        def target():
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                outcome = (None, e)
+            else:
+                outcome = (result, None)
+            try:
+                loop.call_soon_threadsafe(finish, *outcome)
+            except RuntimeError:
+                pass  # loop already closed: the source was abandoned
+
+        await threads.acquire()
+        with self.timed(phase):
+            try:
+                threading.Thread(
+                    target=target, name=f"collect-{self.source}-{phase}", daemon=True
+                ).start()
+            except BaseException:
+                threads.release()
+                raise
+            return await future
+
+
+Job = Callable[[SourceContext], Awaitable[int]]
+
+
+class CollectionOrchestrator:
+    """
+    Run source jobs concurrently with independent policies
+
+    Args:
+        policies: Source name -> SourcePolicy (missing sources use defaults)
+        on_complete: Async callback receiving each finished SourceRun
+        concurrent: False runs sources one after another (debugging)
+    """
+
+    def __init__(
+        self,
+        policies: Optional[Dict[str, SourcePolicy]] = None,
+        on_complete: Optional[Callable[[SourceRun], Awaitable[None]]] = None,
+        concurrent: bool = True,
+    ):
+        self.policies = policies or {}
+        self.on_complete = on_complete
+        self.concurrent = concurrent
+
+    async def run(self, jobs: Dict[str, Job]) -> Dict[str, SourceRun]:
+        """
+        Run every job and wait for all of them
+
+        Args:
+            jobs: Source name -> async job returning the number of items collected
+
+        Returns:
+            Source name -> SourceRun
+        """
+        if self.concurrent:
+            runs = await asyncio.gather(
+                *(self._run_source(source, job) for source, job in jobs.items())
+            )
+        else:
+            runs = [await self._run_source(source, job) for source, job in jobs.items()]
+        return {run.source: run for run in runs}
+
+    @staticmethod
+    async def _attempt(ctx: SourceContext, job: Job) -> int:
+        try:
+            return await asyncio.wait_for(job(ctx), timeout=ctx.policy.timeout_seconds) or 0
+        finally:
+            # Blocking calls still running now belong to an abandoned attempt
+            ctx.cancelled.set()
+
+    async def _run_source(self, source: str, job: Job) -> SourceRun:
+        policy = self.policies.get(source) or SourcePolicy()
+        threads = asyncio.Semaphore(policy.max_threads)
+        run = SourceRun(source=source, started_at=datetime.utcnow())
+
+        while True:
+            run.attempts += 1
+            ctx = SourceContext(source, policy, run, threads)
+            try:
+                run.items_collected = await self._attempt(ctx, job)
+                run.status = "success"
+                run.error_message = None
+                break
+            except SourceDisabled:
+                run.status = "disabled"
+                break
+            except asyncio.TimeoutError:
+                # A hung API is unlikely to recover within this run
+                run.status = "timeout"
+                run.error_message = f"Timed out after {policy.timeout_seconds:.0f}s"
+                logger.error(f"   ⏱️  {source}: {run.error_message}")
+                break
+            except PermanentSourceError as e:
+                run.status = "failed"
+                run.error_message = str(e)
+                logger.error(f"   ❌ {source}: {e}")
+                break
+            except Exception as e:
+                run.status = "failed"
+                run.error_message = str(e)
+                logger.error(
+                    f"   ❌ {source} collection failed (attempt {run.attempts}/{policy.max_attempts}): {e}",
+                    exc_info=True,
+                )
+                if run.attempts >= policy.max_attempts:
+                    break
+                delay = policy.retry_delay_seconds * 2 ** (run.attempts - 1)
+                logger.info(f"   🔁 Retrying {source} in {delay:.0f}s...")
+                await asyncio.sleep(delay)
+
+        run.completed_at = datetime.utcnow()
+        if self.on_complete:
+            try:
+                await self.on_complete(run)
+            except Exception as e:
+                logger.warning(f"   ⚠️  on_complete failed for {source}: {e}")
+        return run
@@ -0,0 +1,783 @@
+"""
+Semantic (Embedding) Index
+
+Top-k retrieval of Slack threads, commit messages, Notion diffs and meeting
+analyses for natural-language questions, so the MCP agent can put a handful
+of relevant chunks into its prompt instead of hundreds of raw rows.
+
+Storage:
+- Vectors live in a memory-mapped float32 matrix on disk (``VectorStore``),
+  with an IVF (inverted file) index: spherical k-means centroids, and the
+  list of every row. A query scores the centroids, then only the rows of
+  the ``nprobe`` closest lists. Until ``min_train_rows`` rows exist, search
+  is exact (one matrix-vector product).
+- Chunk metadata (text, source, timestamp, row number) lives in the
+  ``embedding_chunks`` collection, keyed by chunk id. Each row also stores
+  a fingerprint of its chunk's content hash, so a chunk document is only
+  trusted when its row still holds that content.
+
+Updates are incremental: collectors call :func:`index_source_documents`
+through ``ActivityTimelineWriter``, changed chunks are appended as new rows
+and their old rows are tombstoned. ``meta.json`` is replaced first, so
+readers in other processes never see a half-written batch, and only then
+do the chunk documents point at the new rows. Meeting analyses
+are written by an external pipeline and picked up by
+``scripts/build_embedding_index.py``.
+
+Example:
+    hits = semantic_search(db, "why did we change the bridge fee?", k=5)
+"""
+
+import asyncio
+import fcntl
+import json
+import math
+import os
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from pymongo import ASCENDING, DESCENDING, DeleteOne, UpdateOne
+
+from src.core.activity_timeline import date_range_filter, to_utc_naive
+from src.core.embeddings import (
+    DEFAULT_DIM,
+    DEFAULT_EMBEDDER,
+    Chunk,
+    commit_chunks,
+    get_embedder,
+    meeting_analysis_chunks,
+    notion_diff_chunks,
+    slack_thread_chunks,
+)
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+CHUNKS_COLLECTION = "embedding_chunks"
+DEFAULT_INDEX_DIR = "data/embeddings"
+
+MIN_TRAIN_ROWS = 4096
+DEFAULT_NPROBE = 32
+KMEANS_ITERATIONS = 10
+KMEANS_SAMPLE = 50000
+DELETED = -1
+
+# Filters matching at most this many rows are scored exactly (no IVF)
+EXACT_FILTER_ROWS = 20000
+
+# Data files: name -> bytes per row (beyond the vector dimension)
+STORE_FILES = (("vectors.f32", 4), ("lists.i32", 4), ("keys.u64", 8))
+
+# Characters of chunk text returned per hit (keeps agent prompts small)
+HIT_TEXT_CHARS = 800
+
+# Pseudo source collection for the AI meeting analyses in gemini.recordings
+MEETING_ANALYSES = "gemini_recordings"
+
+SLACK_THREAD_PROJECTION = {
+    "_id": 0,
+    "ts": 1,
+    "thread_ts": 1,
+    "text": 1,
+    "user_name": 1,
+    "user_id": 1,
+    "channel_name": 1,
+    "posted_at": 1,
+}
+
+
+def content_key(content_hash: str) -> int:
+    """64-bit row fingerprint of a chunk's content hash (0 means unknown)"""
+    return int(content_hash[:16], 16) or 1
+
+
+def ensure_embedding_indexes(db) -> None:
+    """Create the indexes of ``embedding_chunks``"""
+    chunks = db[CHUNKS_COLLECTION]
+    chunks.create_index([("row", ASCENDING)])
+    chunks.create_index([("source_id", ASCENDING)])
+    # Covering indexes for the row pre-filter of filtered searches
+    chunks.create_index([("source_type", ASCENDING), ("timestamp", DESCENDING), ("row", ASCENDING)])
+    chunks.create_index([("timestamp", DESCENDING), ("row", ASCENDING)])
+
+
+# =============================================================================
+# Vector store (memory-mapped matrix + IVF lists)
+# =============================================================================
+
+
+class VectorStore:
+    """
+    On-disk vector matrix with an IVF index
+
+    Files in ``path``:
+    - ``meta.json``: dim, embedder, rows, trained_rows (the commit point)
+    - ``vectors.f32``: float32 ``[capacity, dim]``
+    - ``lists.i32``: IVF list of each row, ``-1`` for deleted rows
+    - ``keys.u64``: content fingerprint of each row (see :func:`content_key`)
+    - ``centroids-<rows>.npy``: IVF centroids (absent until trained)
+
+    Writers must hold :meth:`lock`; readers call :meth:`refresh` to pick up
+    commits from other processes.
+
+    Args:
+        path: Index directory
+        dim: Vector dimension
+        embedder: Embedder name the vectors were made with
+        nprobe: IVF lists scanned per query
+        min_train_rows: Rows needed before the IVF index is trained
+    """
+
+    def __init__(
+        self,
+        path,
+        dim: int,
+        embedder: str,
+        nprobe: int = DEFAULT_NPROBE,
+        min_train_rows: int = MIN_TRAIN_ROWS,
+    ):
+        self.path = Path(path)
+        self.dim = dim
+        self.embedder = embedder
+        self.nprobe = nprobe
+        self.min_train_rows = min_train_rows
+
+        self.rows = 0
+        self.trained_rows = 0
+        self.centroids: Optional[np.ndarray] = None
+        self._vectors: Optional[np.ndarray] = None
+        self._lists: Optional[np.ndarray] = None
+        self._keys: Optional[np.ndarray] = None
+        self._pending_deletes: List[int] = []
+        self._capacity = 0
+        self._centroids_file: Optional[str] = None
+        self._meta_version: Optional[Tuple[int, int]] = None
+        self._order = np.zeros(0, dtype=np.int64)
+        self._offsets = np.zeros(1, dtype=np.int64)
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.refresh()
+
+    # ---------------------------------------------------------------- files
+
+    @property
+    def _meta_path(self) -> Path:
+        return self.path / "meta.json"
+
+    def _map(self, name: str, dtype, shape: Tuple[int, ...], writable: bool) -> Optional[np.ndarray]:
+        file_path = self.path / name
+        if not shape[0] or not file_path.exists():
+            return None
+        return np.memmap(file_path, dtype=dtype, mode="r+" if writable else "r", shape=shape)
+
+    def _open(self, capacity: int, writable: bool = False) -> None:
+        self._capacity = capacity
+        self._vectors = self._map("vectors.f32", np.float32, (capacity, self.dim), writable)
+        self._lists = self._map("lists.i32", np.int32, (capacity,), writable)
+        self._keys = self._map("keys.u64", np.uint64, (capacity,), writable)
+
+    @contextmanager
+    def lock(self):
+        """Exclusive writer lock (across processes)"""
+        with open(self.path / "index.lock", "w") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                # Start from the committed state: drop anything a failed writer left behind
+                self._meta_version = None
+                self._pending_deletes = []
+                if not self.refresh():  # nothing committed yet
+                    self.rows = self.trained_rows = 0
+                    self.centroids = self._centroids_file = None
+                self._allocate(self._capacity)
+                self._open(self._capacity, writable=True)
+                yield self
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def refresh(self) -> bool:
+        """
+        Reload the committed state if another process changed it
+
+        Returns:
+            True if the state was reloaded
+
+        Raises:
+            ValueError: If the index was built with another embedder
+        """
+        try:
+            stat = self._meta_path.stat()
+        except FileNotFoundError:
+            return False
+        # meta.json is replaced, never rewritten: a new inode means a new commit
+        version = (stat.st_ino, stat.st_mtime_ns)
+        if version == self._meta_version:
+            return False
+
+        meta = json.loads(self._meta_path.read_text())
+        if meta["dim"] != self.dim or meta["embedder"] != self.embedder:
+            raise ValueError(
+                f"Embedding index at {self.path} was built with {meta['embedder']} "
+                f"(dim {meta['dim']}); rebuild it for {self.embedder} (dim {self.dim})"
+            )
+
+        self.rows = meta["rows"]
+        self.trained_rows = meta.get("trained_rows", 0)
+        self._centroids_file = meta.get("centroids")
+        self.centroids = np.load(self.path / self._centroids_file) if self._centroids_file else None
+        self._open(meta["capacity"])
+        self._build_lists()
+        self._meta_version = version
+        return True
+
+    def _build_lists(self) -> None:
+        """Sort row numbers by IVF list for O(1) list lookups"""
+        if self._lists is None or not self.rows:
+            self._order = np.zeros(0, dtype=np.int64)
+            self._offsets = np.zeros(1, dtype=np.int64)
+            return
+
+        lists = np.asarray(self._lists[: self.rows])
+        order = np.argsort(lists, kind="stable")
+        live = order[lists[order] != DELETED]
+        n_lists = len(self.centroids) if self.centroids is not None else 1
+        self._order = live
+        self._offsets = np.searchsorted(lists[live], np.arange(n_lists + 1))
+
+    # --------------------------------------------------------------- writes
+
+    def _allocate(self, capacity: int) -> None:
+        """Extend the data files to ``capacity`` rows (files added later start zeroed)"""
+        for name, itemsize in STORE_FILES:
+            size = capacity * itemsize * (self.dim if name == "vectors.f32" else 1)
+            with open(self.path / name, "ab") as handle:
+                if handle.tell() < size:
+                    handle.truncate(size)
+
+    def _grow(self, needed: int) -> None:
+        if needed <= self._capacity:
+            return
+        capacity = max(needed, self._capacity * 2, 1024)
+        self._allocate(capacity)
+        self._open(capacity, writable=True)
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        if self.centroids is None:
+            return np.zeros(len(vectors), dtype=np.int32)
+        return np.argmax(vectors @ self.centroids.T, axis=1).astype(np.int32)
+
+    def append(self, vectors: np.ndarray, keys: Iterable[int]) -> List[int]:
+        """
+        Append normalized vectors (call under :meth:`lock`)
+
+        Args:
+            vectors: Normalized vectors
+            keys: Content fingerprint of each vector (see :func:`content_key`)
+
+        Returns:
+            Row numbers of the new vectors
+        """
+        start = self.rows
+        self._grow(start + len(vectors))
+        self._vectors[start : start + len(vectors)] = vectors
+        self._lists[start : start + len(vectors)] = self._assign(vectors)
+        self._keys[start : start + len(vectors)] = np.fromiter(keys, dtype=np.uint64, count=len(vectors))
+        self.rows = start + len(vectors)
+        return list(range(start, self.rows))
+
+    def delete(self, rows: Iterable[int]) -> None:
+        """Tombstone rows at the next :meth:`commit` (call under :meth:`lock`)"""
+        self._pending_deletes.extend(r for r in rows if r is not None and 0 <= r < self.rows)
+
+    def maybe_train(self) -> bool:
+        """(Re)train the IVF centroids once the index has doubled since the last training"""
+        live = int(np.count_nonzero(np.asarray(self._lists[: self.rows]) != DELETED)) if self.rows else 0
+        if live < self.min_train_rows or live < 2 * self.trained_rows:
+            return False
+        self.train()
+        return True
+
+    def train(self, seed: int = 0) -> None:
+        """Spherical k-means over a sample of live rows, then reassign every row"""
+        lists = np.asarray(self._lists[: self.rows])
+        live = np.flatnonzero(lists != DELETED)
+        n_lists = int(min(1024, max(16, math.sqrt(len(live)))))
+        rng = np.random.default_rng(seed)
+        sample = np.sort(rng.choice(live, size=min(len(live), KMEANS_SAMPLE), replace=False))
+        data = np.asarray(self._vectors[sample])
+
+        centroids = data[rng.choice(len(data), size=n_lists, replace=False)].copy()
+        for _ in range(KMEANS_ITERATIONS):
+            labels = np.argmax(data @ centroids.T, axis=1)
+            for i in range(n_lists):
+                members = data[labels == i]
+                if len(members):
+                    centroid = members.sum(axis=0)
+                    centroids[i] = centroid / (np.linalg.norm(centroid) or 1.0)
+
+        self.centroids = centroids.astype(np.float32)
+        for start in range(0, len(live), 10000):
+            batch = live[start : start + 10000]
+            self._lists[batch] = self._assign(np.asarray(self._vectors[batch]))
+        # A new file per training: readers keep loading the committed one,
+        # files older than that are no longer referenced
+        for old in self.path.glob("centroids-*.npy"):
+            if old.name != self._centroids_file:
+                old.unlink()
+        self._centroids_file = f"centroids-{len(live)}.npy"
+        np.save(self.path / self._centroids_file, self.centroids)
+        self.trained_rows = len(live)
+        logger.info(f"🧭 Trained embedding IVF index: {n_lists} lists over {len(live)} rows")
+
+    def commit(self) -> None:
+        """Flush and publish the new state (atomic ``meta.json`` replace)"""
+        if self._pending_deletes:
+            self._lists[self._pending_deletes] = DELETED
+            self._pending_deletes = []
+        for array in (self._vectors, self._lists, self._keys):
+            if isinstance(array, np.memmap):
+                array.flush()
+        meta = {
+            "dim": self.dim,
+            "embedder": self.embedder,
+            "rows": self.rows,
+            "capacity": self._capacity,
+            "trained_rows": self.trained_rows,
+            "centroids": self._centroids_file,
+            "updated_at": datetime.utcnow().isoformat(),
+        }
+        tmp_path = self.path / "meta.json.tmp"
+        tmp_path.write_text(json.dumps(meta))
+        os.replace(tmp_path, self._meta_path)
+        stat = self._meta_path.stat()
+        self._meta_version = (stat.st_ino, stat.st_mtime_ns)
+        self._build_lists()
+
+    # ---------------------------------------------------------------- reads
+
+    def holds(self, rows: Iterable[int], keys: Iterable[int]) -> List[bool]:
+        """
+        Whether each committed row is live and still holds the content with that key
+
+        A row can be stale when it was never committed, was deleted, or the
+        index files were replaced (e.g. rebuilt or lost) under the metadata.
+        """
+        rows = np.fromiter((-1 if r is None else r for r in rows), dtype=np.int64)
+        keys = np.fromiter(keys, dtype=np.uint64, count=len(rows))
+        valid = (rows >= 0) & (rows < self.rows)
+        if self._keys is None or not valid.any():
+            return [False] * len(rows)
+        held = np.zeros(len(rows), dtype=bool)
+        checked = rows[valid]
+        held[valid] = (np.asarray(self._keys[checked]) == keys[valid]) & (
+            np.asarray(self._lists[checked]) != DELETED
+        )
+        return held.tolist()
+
+    def _candidates(self, query: np.ndarray) -> np.ndarray:
+        if self.centroids is None:
+            return self._order
+        nprobe = min(self.nprobe, len(self.centroids))
+        probes = np.argpartition(-(self.centroids @ query), nprobe - 1)[:nprobe]
+        return np.concatenate([self._order[self._offsets[i] : self._offsets[i + 1]] for i in probes])
+
+    def _filtered_candidates(self, query: np.ndarray, k: int, rows: Iterable[int]) -> np.ndarray:
+        """
+        Live rows among ``rows`` to score
+
+        Small row sets are scored exactly. Large ones go through the IVF
+        lists, nearest first, probing past ``nprobe`` until ``k`` allowed
+        rows are found or every list was scanned.
+        """
+        rows = np.unique(np.fromiter((r for r in rows if r is not None), dtype=np.int64))
+        rows = rows[(rows >= 0) & (rows < self.rows)]
+        rows = rows[np.asarray(self._lists[rows]) != DELETED]
+        if self.centroids is None or len(rows) <= EXACT_FILTER_ROWS:
+            return rows
+
+        allowed = np.zeros(self.rows, dtype=bool)
+        allowed[rows] = True
+        found: List[np.ndarray] = []
+        count = 0
+        for probed, i in enumerate(np.argsort(-(self.centroids @ query)), start=1):
+            members = self._order[self._offsets[i] : self._offsets[i + 1]]
+            members = members[allowed[members]]
+            found.append(members)
+            count += len(members)
+            if probed >= self.nprobe and count >= k:
+                break
+        return np.concatenate(found)
+
+    def search(self, query: np.ndarray, k: int, rows: Optional[Iterable[int]] = None) -> List[Tuple[int, float]]:
+        """
+        Nearest rows to a normalized query vector
+
+        Args:
+            query: Normalized query vector
+            k: Number of rows to return
+            rows: Only consider these rows (e.g. the rows matching a metadata filter)
+
+        Returns:
+            (row, cosine similarity) pairs, best first
+        """
+        self.refresh()
+        if self._vectors is None or not len(self._order):
+            return []
+
+        candidates = self._candidates(query) if rows is None else self._filtered_candidates(query, k, rows)
+        if not len(candidates):
+            return []
+        candidates = np.sort(candidates)
+        scores = np.asarray(self._vectors[candidates]) @ query
+        k = min(k, len(candidates))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(int(candidates[i]), float(scores[i])) for i in top]
+
+
+# =============================================================================
+# Semantic index (vectors + chunk metadata)
+# =============================================================================
+
+
+class SemanticIndex:
+    """
+    Embedder + vector store + ``embedding_chunks`` metadata
+
+    Args:
+        store: VectorStore holding the vectors
+        embedder: Embedder the store was built with
+    """
+
+    def __init__(self, store: VectorStore, embedder):
+        self.store = store
+        self.embedder = embedder
+
+    @staticmethod
+    def _embed_text(chunk: Chunk) -> str:
+        return f"{chunk.title}\n{chunk.text}" if chunk.title else chunk.text
+
+    def _held(self, chunks: List[Chunk], docs: Dict[str, Dict[str, Any]]) -> set:
+        """Ids of chunks whose stored row still holds their current content"""
+        same = [c for c in chunks if docs.get(c.chunk_id, {}).get("content_hash") == c.content_hash]
+        held = self.store.holds([docs[c.chunk_id].get("row") for c in same], [content_key(c.content_hash) for c in same])
+        return {c.chunk_id for c, ok in zip(same, held) if ok}
+
+    def upsert(self, db, chunks: List[Chunk], source_ids: Optional[Iterable[str]] = None) -> int:
+        """
+        Replace the chunks of their sources
+
+        Chunks with unchanged content keep their vectors; chunks of the given
+        sources that are no longer produced are removed.
+
+        Args:
+            db: pymongo database holding ``embedding_chunks``
+            chunks: New chunks
+            source_ids: Sources being replaced (default: those of ``chunks``);
+                pass sources that now have no chunks to remove them
+
+        Returns:
+            Number of chunks (re-)embedded
+        """
+        collection = db[CHUNKS_COLLECTION]
+        source_ids = sorted(set(source_ids or []) | {c.source_id for c in chunks})
+        if not source_ids:
+            return 0
+
+        existing = {
+            doc["_id"]: doc
+            for doc in collection.find(
+                {"source_id": {"$in": source_ids}}, {"row": 1, "content_hash": 1}
+            )
+        }
+        new_ids = {c.chunk_id for c in chunks}
+        # A chunk keeps its vector only if its row still holds that content
+        # (the index files may have been rebuilt or lost under the metadata)
+        self.store.refresh()
+        held = self._held(chunks, existing)
+        changed = [c for c in chunks if c.chunk_id not in held]
+        removed = [doc for chunk_id, doc in existing.items() if chunk_id not in new_ids]
+        if not changed and not removed:
+            return 0
+
+        vectors = self.embedder.embed([self._embed_text(c) for c in changed]) if changed else None
+        now = datetime.utcnow()
+
+        with self.store.lock() as store:
+            # Rows as of now: another process may have replaced them meanwhile.
+            # Only rows still holding the stored content are freed.
+            current = list(collection.find({"source_id": {"$in": source_ids}}, {"row": 1, "content_hash": 1}))
+            stale = {c.chunk_id for c in changed} | {doc["_id"] for doc in removed}
+            current = [doc for doc in current if doc["_id"] in stale and doc.get("content_hash")]
+            freed = store.holds(
+                [doc.get("row") for doc in current], [content_key(doc["content_hash"]) for doc in current]
+            )
+
+            rows = store.append(vectors, [content_key(c.content_hash) for c in changed]) if changed else []
+            store.delete(doc["row"] for doc, free in zip(current, freed) if free)
+            store.maybe_train()
+            # Publish the rows before any chunk document points at them
+            store.commit()
+
+            operations = [
+                UpdateOne(
+                    {"_id": chunk.chunk_id},
+                    {
+                        "$set": {
+                            "row": row,
+                            "source_type": chunk.source_type,
+                            "source_id": chunk.source_id,
+                            "title": chunk.title,
+                            "text": chunk.text,
+                            "timestamp": to_utc_naive(chunk.timestamp),
+                            "url": chunk.url,
+                            "members": chunk.members,
+                            "content_hash": chunk.content_hash,
+                            "updated_at": now,
+                        }
+                    },
+                    upsert=True,
+                )
+                for chunk, row in zip(changed, rows)
+            ]
+            operations += [DeleteOne({"_id": doc["_id"]}) for doc in removed]
+            collection.bulk_write(operations, ordered=False)
+
+        return len(changed)
+
+    @staticmethod
+    def _filter(
+        source_type: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        ``embedding_chunks`` filter for the search filters
+
+        Raises:
+            ValueError: If a date cannot be parsed
+        """
+        mongo_filter: Dict[str, Any] = {}
+        if source_type:
+            mongo_filter["source_type"] = source_type
+        date_filter = date_range_filter(start_date, end_date)
+        if date_filter:
+            mongo_filter["timestamp"] = date_filter
+        return mongo_filter
+
+    def _vector_search(self, query: str, k: int, rows: Optional[List[int]] = None) -> List[Tuple[int, float]]:
+        vector = self.embedder.embed([query])[0]
+        # Over-fetch a little: hits whose row no longer holds its chunk are dropped by _rank
+        return self.store.search(vector, k * 2, rows=rows)
+
+    def _rank(self, hits: List[Tuple[int, float]], docs: List[Dict[str, Any]], k: int) -> List[Dict[str, Any]]:
+        scores = dict(hits)
+        # A document whose row was replaced (or never committed) would pair
+        # this vector's score with another chunk's text
+        docs = [doc for doc in docs if doc.get("content_hash")]
+        held = self.store.holds([doc["row"] for doc in docs], [content_key(doc["content_hash"]) for doc in docs])
+        docs = [doc for doc, ok in zip(docs, held) if ok]
+        results = []
+        for doc in sorted(docs, key=lambda d: -scores.get(d["row"], 0.0))[:k]:
+            timestamp = doc.get("timestamp")
+            results.append(
+                {
+                    "chunk_id": doc["_id"],
+                    "source_type": doc.get("source_type"),
+                    "title": doc.get("title", ""),
+                    "text": (doc.get("text") or "")[:HIT_TEXT_CHARS],
+                    "timestamp": timestamp.isoformat() + "Z" if timestamp else None,
+                    "url": doc.get("url"),
+                    "members": doc.get("members", []),
+                    "score": round(scores.get(doc["row"], 0.0), 4),
+                }
+            )
+        return results
+
+    def search(self, db, query: str, k: int = 10, **filters: Any) -> List[Dict[str, Any]]:
+        """
+        Top-k chunks for a natural-language query (sync database)
+
+        Args:
+            db: pymongo database
+            query: Question or topic
+            k: Number of chunks to return
+            **filters: source_type, start_date, end_date
+
+        Returns:
+            Hits, best first: chunk_id, source_type, title, text, timestamp,
+            url, members, score
+        """
+        mongo_filter = self._filter(**filters)
+        collection = db[CHUNKS_COLLECTION]
+        rows = None
+        if mongo_filter:
+            # Score only the rows matching the filter, so narrow filters still fill k
+            rows = [doc["row"] for doc in collection.find(mongo_filter, {"_id": 0, "row": 1})]
+            if not rows:
+                return []
+
+        hits = self._vector_search(query, k, rows)
+        if not hits:
+            return []
+        docs = list(collection.find({**mongo_filter, "row": {"$in": [row for row, _ in hits]}}))
+        return self._rank(hits, docs, k)
+
+    async def search_async(self, db, query: str, k: int = 10, **filters: Any) -> List[Dict[str, Any]]:
+        """Async (Motor) variant of :meth:`search`; the vector scan runs in a thread"""
+        mongo_filter = self._filter(**filters)
+        collection = db[CHUNKS_COLLECTION]
+        rows = None
+        if mongo_filter:
+            docs = await collection.find(mongo_filter, {"_id": 0, "row": 1}).to_list(length=None)
+            rows = [doc["row"] for doc in docs]
+            if not rows:
+                return []
+
+        hits = await asyncio.to_thread(self._vector_search, query, k, rows)
+        if not hits:
+            return []
+        docs = await collection.find({**mongo_filter, "row": {"$in": [row for row, _ in hits]}}).to_list(length=None)
+        return self._rank(hits, docs, k)
+
+
+# =============================================================================
+# Process-wide index and collector entry point
+# =============================================================================
+
+_semantic_index: Optional[SemanticIndex] = None
+_semantic_index_loaded = False
+
+
+def _enabled(value: Any) -> bool:
+    return str(value).strip().lower() in ("1", "true", "yes", "on")
+
+
+def get_semantic_index() -> Optional[SemanticIndex]:
+    """
+    The index configured under ``embedding_index`` in config.yaml
+
+    Returns:
+        SemanticIndex, or None when disabled or unavailable
+    """
+    global _semantic_index, _semantic_index_loaded
+    if _semantic_index_loaded:
+        return _semantic_index
+
+    from src.core.config import get_config
+
+    settings = get_config().get("embedding_index", {}) or {}
+    _semantic_index_loaded = True
+    if not _enabled(settings.get("enabled", False)):
+        return None
+
+    try:
+        embedder = get_embedder(
+            settings.get("embedder") or DEFAULT_EMBEDDER, int(settings.get("dim", DEFAULT_DIM))
+        )
+        store = VectorStore(
+            settings.get("path") or DEFAULT_INDEX_DIR,
+            embedder.dim,
+            embedder.name,
+            nprobe=int(settings.get("nprobe", DEFAULT_NPROBE)),
+        )
+        _semantic_index = SemanticIndex(store, embedder)
+    except Exception as e:
+        logger.warning(f"⚠️  Embedding index unavailable: {e}")
+    return _semantic_index
+
+
+def _slack_chunks(db, docs: List[Dict[str, Any]]) -> Tuple[List[Chunk], List[str]]:
+    """Rebuild the thread chunks touched by new Slack messages"""
+    threads: Dict[str, set] = {}
+    standalone = []
+    for doc in docs:
+        channel_id, thread_ts = doc.get("channel_id"), doc.get("thread_ts")
+        if not channel_id or not doc.get("ts"):
+            continue
+        if thread_ts:
+            threads.setdefault(channel_id, set()).add(thread_ts)
+        else:
+            standalone.append(doc)
+
+    chunks: List[Chunk] = []
+    source_ids: List[str] = []
+    for doc in standalone:
+        chunks.extend(slack_thread_chunks(doc["channel_id"], doc["ts"], [doc]))
+        source_ids.append(f"slack_thread:{doc['channel_id']}:{doc['ts']}")
+
+    for channel_id, thread_tss in threads.items():
+        by_thread: Dict[str, List[Dict[str, Any]]] = {}
+        for message in db["slack_messages"].find(
+            {"channel_id": channel_id, "thread_ts": {"$in": sorted(thread_tss)}},
+            SLACK_THREAD_PROJECTION,
+        ):
+            by_thread.setdefault(message["thread_ts"], []).append(message)
+        for thread_ts, messages in by_thread.items():
+            chunks.extend(slack_thread_chunks(channel_id, thread_ts, messages))
+        source_ids.extend(f"slack_thread:{channel_id}:{ts}" for ts in thread_tss)
+    return chunks, source_ids
+
+
+def build_chunks(db, source_collection: str, docs: List[Dict[str, Any]]) -> Tuple[List[Chunk], List[str]]:
+    """
+    Chunks for a batch of source documents
+
+    Returns:
+        (chunks, source ids being replaced); empty for unindexed collections
+    """
+    if source_collection == "slack_messages":
+        return _slack_chunks(db, docs)
+
+    builders = {
+        "github_commits": commit_chunks,
+        "notion_content_diffs": notion_diff_chunks,
+        MEETING_ANALYSES: meeting_analysis_chunks,
+    }
+    builder = builders.get(source_collection)
+    if builder is None:
+        return [], []
+    chunks = [chunk for doc in docs for chunk in builder(doc)]
+    return chunks, [c.source_id for c in chunks]
+
+
+def index_source_documents(db, source_collection: str, docs: Iterable[Dict[str, Any]]) -> int:
+    """
+    Update the semantic index for newly saved source documents
+
+    No-op when the index is disabled or the collection is not indexed.
+
+    Returns:
+        Number of chunks (re-)embedded
+    """
+    index = get_semantic_index()
+    if index is None:
+        return 0
+    chunks, source_ids = build_chunks(db, source_collection, list(docs))
+    if not source_ids:
+        return 0
+    return index.upsert(db, chunks, source_ids)
+
+
+def semantic_search(db, query: str, k: int = 10, **filters: Any) -> List[Dict[str, Any]]:
+    """
+    Top-k chunks from the configured index (sync database)
+
+    Raises:
+        RuntimeError: If the embedding index is disabled
+    """
+    index = get_semantic_index()
+    if index is None:
+        raise RuntimeError("Embedding index is disabled (embedding_index.enabled)")
+    return index.search(db, query, k, **filters)
+
+
+async def semantic_search_async(db, query: str, k: int = 10, **filters: Any) -> List[Dict[str, Any]]:
+    """Async (Motor) variant of :func:`semantic_search`"""
+    # The first call may load an embedding model
+    index = await asyncio.to_thread(get_semantic_index)
+    if index is None:
+        raise RuntimeError("Embedding index is disabled (embedding_index.enabled)")
+    return await index.search_async(db, query, k, **filters)
@@ -0,0 +1,277 @@
+"""
+Embeddings and Chunking
+
+Turns activity documents into text chunks and chunks into vectors for the
+semantic index (``src/core/embedding_index.py``).
+
+Embedders (all return L2-normalized float32 rows, so dot product = cosine):
+- ``HashingEmbedder``: feature-hashed word unigrams/bigrams and character
+  trigrams, sublinear TF. NumPy only, ~0.1 ms per chunk on one CPU core;
+  trigrams keep Korean word forms and typos close together.
+- ``SentenceTransformerEmbedder``: a local sentence-transformers model
+  (optional dependency, ``pip install sentence-transformers``), e.g.
+  ``paraphrase-multilingual-MiniLM-L12-v2`` for Korean + English.
+
+Chunk sources:
+- Slack threads (parent + replies, or a standalone message)
+- GitHub commit messages
+- Notion content diffs (added / modified blocks)
+- Meeting analyses in ``gemini.recordings``
+"""
+
+import hashlib
+import math
+import re
+import zlib
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+DEFAULT_EMBEDDER = "hashing"
+DEFAULT_DIM = 512
+
+CHUNK_CHARS = 1200
+CHUNK_OVERLAP = 200
+
+# Standalone Slack messages shorter than this ("ok", "thanks") are not indexed
+MIN_MESSAGE_CHARS = 20
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+_SENTENCE_END = re.compile(r"(?<=[.!?。])\s+|\n+")
+
+
+# =============================================================================
+# Embedders
+# =============================================================================
+
+
+class HashingEmbedder:
+    """
+    Feature-hashing text embedder (no model download, no extra dependency)
+
+    Args:
+        dim: Vector dimension (number of hash buckets)
+    """
+
+    def __init__(self, dim: int = DEFAULT_DIM):
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+
+    @staticmethod
+    def _features(text: str) -> Counter:
+        words = [w.lower() for w in _WORD.findall(text or "")]
+        features = Counter(words)
+        features.update(f"{a} {b}" for a, b in zip(words, words[1:]))
+        for word in words:
+            padded = f"<{word}>"
+            features.update(f"#{padded[i:i + 3]}" for i in range(len(padded) - 2))
+        return features
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """Embed texts into an ``(len(texts), dim)`` float32 matrix"""
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature, count in self._features(text).items():
+                digest = zlib.crc32(feature.encode("utf-8"))
+                sign = 1.0 if digest & 0x80000000 else -1.0
+                matrix[row, digest % self.dim] += sign * (1.0 + math.log(count))
+        return normalize_rows(matrix)
+
+
+class SentenceTransformerEmbedder:
+    """
+    Local sentence-transformers model on CPU
+
+    Raises:
+        ImportError: If sentence-transformers is not installed
+    """
+
+    def __init__(self, model_name: str):
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError as e:
+            raise ImportError(
+                "sentence-transformers is not installed; use the 'hashing' embedder "
+                "or pip install sentence-transformers"
+            ) from e
+
+        self.model = SentenceTransformer(model_name, device="cpu")
+        self.dim = self.model.get_sentence_embedding_dimension()
+        self.name = f"st:{model_name}"
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        vectors = self.model.encode(texts, batch_size=32, convert_to_numpy=True)
+        return normalize_rows(vectors.astype(np.float32))
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def get_embedder(name: str = DEFAULT_EMBEDDER, dim: int = DEFAULT_DIM):
+    """
+    Create an embedder from its config name
+
+    Args:
+        name: ``"hashing"`` or ``"sentence-transformers:<model name>"``
+        dim: Dimension of the hashing embedder
+    """
+    if name == "hashing":
+        return HashingEmbedder(dim)
+    if name.startswith("sentence-transformers:"):
+        return SentenceTransformerEmbedder(name.split(":", 1)[1])
+    raise ValueError(f"Unknown embedder: {name}")
+
+
+# =============================================================================
+# Chunks
+# =============================================================================
+
+
+@dataclass
+class Chunk:
+    """One indexed piece of text"""
+
+    chunk_id: str
+    source_type: str  # slack, github, notion, meeting
+    source_id: str  # every chunk of a source is replaced together
+    text: str
+    timestamp: Optional[datetime] = None
+    title: str = ""
+    url: Optional[str] = None
+    members: List[str] = field(default_factory=list)
+
+    @property
+    def content_hash(self) -> str:
+        return hashlib.sha1(f"{self.title}\n{self.text}".encode("utf-8")).hexdigest()
+
+
+def split_text(text: str, max_chars: int = CHUNK_CHARS, overlap: int = CHUNK_OVERLAP) -> List[str]:
+    """
+    Split text into chunks of at most ``max_chars`` at sentence boundaries
+
+    Consecutive chunks share up to ``overlap`` characters of context.
+    """
+    text = (text or "").strip()
+    if len(text) <= max_chars:
+        return [text] if text else []
+
+    # Sentences longer than a chunk are cut hard
+    step = max_chars - overlap - 1
+    pieces = []
+    for sentence in _SENTENCE_END.split(text):
+        sentence = sentence.strip()
+        pieces.extend(sentence[i:i + step] for i in range(0, len(sentence), step))
+
+    chunks: List[str] = []
+    current = ""
+    for piece in pieces:
+        if current and len(current) + 1 + len(piece) > max_chars:
+            chunks.append(current)
+            # Carry the tail of the previous chunk over, from a word start
+            tail = current[-overlap:] if overlap else ""
+            current = tail.split(" ", 1)[1] if " " in tail else tail
+        current = f"{current} {piece}".strip()
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _chunks(source_type: str, source_id: str, text: str, **fields: Any) -> List[Chunk]:
+    return [
+        Chunk(chunk_id=f"{source_id}:{i}", source_type=source_type, source_id=source_id, text=part, **fields)
+        for i, part in enumerate(split_text(text))
+    ]
+
+
+def slack_thread_chunks(channel_id: str, thread_ts: str, messages: Iterable[Dict[str, Any]]) -> List[Chunk]:
+    """
+    Chunks of a Slack thread (or standalone message)
+
+    Args:
+        channel_id: Channel of the thread
+        thread_ts: ts of the parent message
+        messages: Parent and replies as stored in ``slack_messages``
+    """
+    messages = sorted(messages, key=lambda m: float(m.get("ts") or 0))
+    lines = [
+        f"{m.get('user_name') or m.get('user_id') or 'unknown'}: {m.get('text')}"
+        for m in messages
+        if m.get("text")
+    ]
+    text = "\n".join(lines)
+    if not messages or (len(messages) == 1 and len(text) < MIN_MESSAGE_CHARS):
+        return []
+
+    channel_name = messages[0].get("channel_name") or channel_id
+    return _chunks(
+        "slack",
+        f"slack_thread:{channel_id}:{thread_ts}",
+        text,
+        timestamp=messages[-1].get("posted_at"),
+        title=f"#{channel_name}",
+        url=f"https://tokamak-network.slack.com/archives/{channel_id}/p{thread_ts.replace('.', '')}",
+        members=sorted({m["user_name"] for m in messages if m.get("user_name")}),
+    )
+
+
+def commit_chunks(doc: Dict[str, Any]) -> List[Chunk]:
+    sha = doc.get("sha")
+    message = (doc.get("message") or "").strip()
+    if not sha or not message:
+        return []
+
+    repo_name = doc.get("repository", "")
+    return _chunks(
+        "github",
+        f"github_commit:{sha}",
+        message,
+        timestamp=doc.get("date"),
+        title=f"{repo_name}: {message.splitlines()[0][:120]}",
+        url=doc.get("url"),
+        members=[doc["author_name"]] if doc.get("author_name") else [],
+    )
+
+
+def notion_diff_chunks(doc: Dict[str, Any]) -> List[Chunk]:
+    page_id = doc.get("document_id")
+    changes = doc.get("changes", {}) or {}
+    parts = [item.get("content") for item in changes.get("added", []) if isinstance(item, dict)]
+    parts += [item.get("new_content") for item in changes.get("modified", []) if isinstance(item, dict)]
+    text = "\n".join(p for p in parts if p)
+    if not page_id or not text:
+        return []
+
+    timestamp = doc.get("timestamp")
+    return _chunks(
+        "notion",
+        f"notion_diff:{page_id}:{doc.get('diff_type', 'block')}:{timestamp}",
+        text,
+        timestamp=timestamp,
+        title=doc.get("document_title") or "",
+        url=doc.get("document_url"),
+        members=[doc["editor_name"]] if doc.get("editor_name") else [],
+    )
+
+
+def meeting_analysis_chunks(doc: Dict[str, Any]) -> List[Chunk]:
+    """Chunks of one AI analysis in ``gemini.recordings``"""
+    analysis = doc.get("analysis") or {}
+    text = analysis.get("analysis") if isinstance(analysis, dict) else None
+    if not doc.get("_id") or not text:
+        return []
+
+    template = analysis.get("template_used") or "default"
+    return _chunks(
+        "meeting",
+        f"meeting_analysis:{doc['_id']}",
+        text,
+        timestamp=doc.get("meeting_date"),
+        title=f"{doc.get('meeting_title') or 'Meeting'} ({template})",
+        members=[p for p in doc.get("participants", []) if isinstance(p, str)],
+    )
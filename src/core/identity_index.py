@@ -0,0 +1,260 @@
+"""
+Identity Index
+
+In-memory index over ``member_identifiers`` shared by the REST API, GraphQL
+resolvers and export endpoints:
+
+- forward map: ``(source, identifier)`` -> member display name
+- reverse map: member name -> ``{source: [identifiers]}``
+
+GitHub usernames and e-mail addresses are case-insensitive, so they are
+case-folded on both insert and lookup.
+
+Every process keeps one cached index per database. Coherence across API
+workers is kept with a version counter stored in ``cache_versions``: writers
+of ``member_identifiers`` call :func:`bump_identity_version` and readers
+compare the stored version (at most once per ``check_interval`` seconds)
+before rebuilding. A single ``find_one`` on ``_id`` replaces the full
+collection scan each request used to pay.
+"""
+
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.core.cache_versions import VERSIONS_COLLECTION, bump_collection_versions_async
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+IDENTITY_VERSION_ID = "member_identifiers"
+
+# Sources whose identifiers are compared case-insensitively
+CASE_FOLDED_SOURCES = {"github", "drive", "email"}
+
+# Sources always present in the per-source view, even when empty
+DEFAULT_SOURCES = ("github", "slack", "notion", "drive")
+
+DEFAULT_CHECK_INTERVAL = 2.0
+
+
+def identity_key(source: str, identifier: str) -> str:
+    """Normalize an identifier for lookup within ``source``"""
+    if source in CASE_FOLDED_SOURCES:
+        return identifier.lower()
+    return identifier
+
+
+class IdentityIndex(dict):
+    """
+    Forward and reverse member identity maps
+
+    The dict view keeps the legacy ``load_member_mappings`` layout
+    (``{source: {key: {"original": ..., "member": ...}}}``) so existing callers
+    keep working; new code should use the lookup methods.
+    """
+
+    def __init__(self, version: int = 0):
+        super().__init__({source: {} for source in DEFAULT_SOURCES})
+        self.version = version
+        self.forward: Dict[Tuple[str, str], str] = {}
+        self._folded: Dict[Tuple[str, str], str] = {}
+        self._by_member: Dict[str, Dict[str, List[str]]] = {}
+        self._display_names: Dict[str, str] = {}
+
+    @classmethod
+    def from_documents(cls, docs: Iterable[Dict[str, Any]], version: int = 0) -> "IdentityIndex":
+        """Build an index from ``member_identifiers`` documents"""
+        index = cls(version)
+        for doc in docs:
+            index.add(doc.get("source"), doc.get("identifier_value"), doc.get("member_name"))
+        return index
+
+    def add(self, source: Optional[str], identifier: Optional[str], member_name: Optional[str]) -> None:
+        """Register one identifier (ignores incomplete rows)"""
+        if not source or not identifier or not member_name:
+            return
+
+        key = identity_key(source, identifier)
+        self.setdefault(source, {})[key] = {"original": identifier, "member": member_name}
+        self.forward[(source, key)] = member_name
+        self._folded.setdefault((source, identifier.lower()), member_name)
+
+        member_key = member_name.lower()
+        self._display_names.setdefault(member_key, member_name)
+        per_source = self._by_member.setdefault(member_key, {}).setdefault(source, [])
+        if identifier not in per_source:
+            per_source.append(identifier)
+
+    def member_for(self, source: str, identifier: Optional[str], fold_case: bool = False) -> Optional[str]:
+        """
+        Return the member name for an identifier, or None if unmapped
+
+        Args:
+            source: Identifier source ("github", "slack", ...)
+            identifier: Identifier value
+            fold_case: Fall back to a case-insensitive match for sources that
+                are otherwise case-sensitive (e.g. Slack usernames)
+        """
+        if not identifier:
+            return None
+        member = self.forward.get((source, identity_key(source, identifier)))
+        if member is None and fold_case:
+            member = self._folded.get((source, identifier.lower()))
+        return member
+
+    def identifiers_for(self, member_name: Optional[str], source: Optional[str] = None):
+        """
+        Reverse lookup (case-insensitive on member name)
+
+        Returns:
+            List of identifiers when ``source`` is given, otherwise the full
+            ``{source: [identifiers]}`` dict
+        """
+        per_member = self._by_member.get((member_name or "").lower(), {})
+        if source is None:
+            return {s: list(values) for s, values in per_member.items()}
+        return list(per_member.get(source, []))
+
+    def has_member(self, member_name: Optional[str]) -> bool:
+        return (member_name or "").lower() in self._by_member
+
+    def member_names(self) -> List[str]:
+        """Display names of every member with at least one identifier"""
+        return list(self._display_names.values())
+
+    def counts(self) -> Dict[str, int]:
+        return {source: len(entries) for source, entries in self.items()}
+
+
+def member_identifiers(
+    index: IdentityIndex, member_name: str, member_doc: Optional[Dict[str, Any]] = None
+) -> Dict[str, List[str]]:
+    """
+    Identifiers a member's activities may be stored under, per source
+
+    Combines the identity index with the legacy ``members`` fields
+    (``github_id`` / ``github_username`` / ``email``); the member name itself
+    is always included, since several collections store display names.
+
+    Returns:
+        {"github": [...], "slack": [...], "notion": [...], "drive": [...]}
+    """
+    member_doc = member_doc or {}
+    known = index.identifiers_for(member_name)
+    email = member_doc.get("email")
+
+    candidates = {
+        "github": known.get("github", [])
+        + [member_doc.get("github_id"), member_doc.get("github_username"), member_name],
+        "slack": known.get("slack", []) + [member_name, member_name.lower()],
+        "notion": known.get("notion", []) + [member_name],
+        "drive": known.get("drive", []) + known.get("email", []) + [email, member_name],
+    }
+    return {
+        source: list(dict.fromkeys(value for value in values if value))
+        for source, values in candidates.items()
+    }
+
+
+class MemberLookup:
+    """
+    Identifier -> member joins for a batch of members
+
+    Built once per batch so that mapping a result document back to its member
+    is a dict lookup instead of a scan over every member. Lookups are
+    case-insensitive; when two members share an identifier the first wins.
+
+    Args:
+        identifiers: Member name -> :func:`member_identifiers` result
+    """
+
+    def __init__(self, identifiers: Dict[str, Dict[str, List[str]]]):
+        self.names = list(identifiers)
+        self._values: Dict[str, List[str]] = {}
+        self._members: Dict[str, Dict[str, str]] = {}
+        for name, per_source in identifiers.items():
+            for source, values in per_source.items():
+                members = self._members.setdefault(source, {})
+                source_values = self._values.setdefault(source, [])
+                for value in values:
+                    members.setdefault(value.lower(), name)
+                    source_values.append(value)
+
+    def identifiers(self, source: str) -> List[str]:
+        """Every identifier of the batch for ``source`` (for ``$in`` filters)"""
+        return list(dict.fromkeys(self._values.get(source, [])))
+
+    def member(self, source: str, identifier: Optional[str]) -> Optional[str]:
+        """Member name for an identifier, or None if it belongs to none of the batch"""
+        if not identifier or not isinstance(identifier, str):
+            return None
+        return self._members.get(source, {}).get(identifier.lower())
+
+
+class IdentityIndexCache:
+    """
+    Process-local, version-checked cache of :class:`IdentityIndex`
+
+    Supports both Motor (``get_async``) and pymongo (``get``) databases.
+    """
+
+    def __init__(self, check_interval: float = DEFAULT_CHECK_INTERVAL):
+        self.check_interval = check_interval
+        self._index: Optional[IdentityIndex] = None
+        self._checked_at = 0.0
+
+    def invalidate(self) -> None:
+        """Drop the local copy so the next read rebuilds it"""
+        self._index = None
+        self._checked_at = 0.0
+
+    def _fresh(self) -> bool:
+        return self._index is not None and time.monotonic() - self._checked_at < self.check_interval
+
+    def _store(self, index: IdentityIndex) -> IdentityIndex:
+        self._index = index
+        self._checked_at = time.monotonic()
+        logger.info(f"Loaded identity index v{index.version}: {index.counts()}")
+        return index
+
+    async def get_async(self, db) -> IdentityIndex:
+        """Return the current index, rebuilding it if the stored version moved"""
+        if self._fresh():
+            return self._index
+
+        version_doc = await db[VERSIONS_COLLECTION].find_one({"_id": IDENTITY_VERSION_ID})
+        version = (version_doc or {}).get("version", 0)
+        if self._index is not None and self._index.version == version:
+            self._checked_at = time.monotonic()
+            return self._index
+
+        docs = await db["member_identifiers"].find(
+            {}, {"source": 1, "identifier_value": 1, "member_name": 1}
+        ).to_list(length=None)
+        return self._store(IdentityIndex.from_documents(docs, version))
+
+    def get(self, db) -> IdentityIndex:
+        """Synchronous variant of :meth:`get_async` for pymongo databases"""
+        if self._fresh():
+            return self._index
+
+        version_doc = db[VERSIONS_COLLECTION].find_one({"_id": IDENTITY_VERSION_ID})
+        version = (version_doc or {}).get("version", 0)
+        if self._index is not None and self._index.version == version:
+            self._checked_at = time.monotonic()
+            return self._index
+
+        docs = db["member_identifiers"].find(
+            {}, {"source": 1, "identifier_value": 1, "member_name": 1}
+        )
+        return self._store(IdentityIndex.from_documents(docs, version))
+
+
+async def bump_identity_version(db) -> None:
+    """Signal all workers that ``member_identifiers`` changed (Motor)"""
+    await bump_collection_versions_async(db, IDENTITY_VERSION_ID)
+
+
+# Shared per-process caches (one for Motor handlers, one for sync callers)
+identity_cache = IdentityIndexCache()
+sync_identity_cache = IdentityIndexCache()
@@ -0,0 +1,344 @@
+"""
+Index Manifest and Advisor
+
+``INDEX_MANIFEST`` lists the compound indexes behind the API's activity query
+shapes. Keys follow the ESR rule: equality (and ``$in``) fields first, then
+the sort field, then range fields. The activity queries sort and range on
+the same timestamp, so most indexes are ``(who/where, timestamp desc)``.
+
+``QUERY_TEMPLATES`` registers one representative query per shape. The
+advisor runs ``explain()`` on each template and reports collection scans
+and in-memory sorts, so a query shape without an index shows up in the
+startup log instead of in production latency.
+
+Example:
+    ensure_manifest_indexes(db)
+
+    reports = explain_templates(db, shared_db=mongo_manager.shared_db)
+    log_index_report(reports)
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from pymongo import ASCENDING, DESCENDING
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Databases an index or template can target
+MAIN_DATABASE = "main"
+SHARED_DATABASE = "shared"  # recordings, owned by the meeting recorder
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    """One index of the manifest"""
+
+    collection: str
+    keys: Tuple[Tuple[str, int], ...]
+    database: str = MAIN_DATABASE
+
+    @property
+    def name(self) -> str:
+        """MongoDB's default index name for these keys"""
+        return "_".join(f"{key}_{direction}" for key, direction in self.keys)
+
+
+@dataclass
+class QueryTemplate:
+    """A representative query of one endpoint query shape"""
+
+    name: str
+    collection: str
+    filter: Callable[[datetime], Dict[str, Any]]
+    sort: List[Tuple[str, int]] = field(default_factory=list)
+    database: str = MAIN_DATABASE
+    limit: int = 200
+
+
+def _index(collection: str, *keys: Tuple[str, int], database: str = MAIN_DATABASE) -> IndexSpec:
+    return IndexSpec(collection, tuple(keys), database)
+
+
+INDEX_MANIFEST: List[IndexSpec] = [
+    # GitHub: member and project (repository list) filters, newest first
+    _index("github_commits", ("author_name", ASCENDING), ("date", DESCENDING)),
+    _index("github_commits", ("repository", ASCENDING), ("date", DESCENDING)),
+    _index("github_pull_requests", ("author", ASCENDING), ("created_at", DESCENDING)),
+    _index("github_pull_requests", ("repository", ASCENDING), ("created_at", DESCENDING)),
+    _index("github_issues", ("created_at", DESCENDING)),
+    # Slack: member, channel (project) and thread lookups
+    _index("slack_messages", ("user_name", ASCENDING), ("posted_at", DESCENDING)),
+    _index("slack_messages", ("channel_id", ASCENDING), ("posted_at", DESCENDING)),
+    _index("slack_messages", ("thread_ts", ASCENDING), ("posted_at", ASCENDING)),
+    # Notion
+    _index("notion_pages", ("created_by.name", ASCENDING), ("last_edited_time", DESCENDING)),
+    _index("notion_pages", ("last_edited_by.name", ASCENDING), ("last_edited_time", DESCENDING)),
+    _index("notion_content_diffs", ("timestamp", DESCENDING)),
+    _index("notion_content_diffs", ("editor_name", ASCENDING), ("timestamp", DESCENDING)),
+    _index("notion_content_diffs", ("editor_id", ASCENDING), ("timestamp", DESCENDING)),
+    _index("notion_content_diffs", ("document_id", ASCENDING), ("timestamp", DESCENDING)),
+    # Drive: activity documents carry both ``time`` (collector) and
+    # ``timestamp`` (GraphQL/member endpoints); both shapes are queried
+    _index("drive_activities", ("actor_name", ASCENDING), ("time", DESCENDING)),
+    _index("drive_activities", ("actor_email", ASCENDING), ("time", DESCENDING)),
+    _index("drive_activities", ("user_email", ASCENDING), ("timestamp", DESCENDING)),
+    _index("drive_activities", ("timestamp", DESCENDING)),
+    # Identity lookups (identity index, member admin endpoints)
+    _index("member_identifiers", ("source", ASCENDING), ("identifier_value", ASCENDING)),
+    _index("member_identifiers", ("member_name", ASCENDING), ("source", ASCENDING)),
+    _index("member_identifiers", ("member_id", ASCENDING), ("source", ASCENDING)),
+    # Meeting recordings (shared database)
+    _index("recordings", ("modifiedTime", DESCENDING), database=SHARED_DATABASE),
+]
+
+
+def _last_days(days: int) -> Callable[[datetime], Dict[str, Any]]:
+    def date_range(now: datetime) -> Dict[str, Any]:
+        return {"$gte": now - timedelta(days=days), "$lte": now}
+
+    return date_range
+
+
+_month = _last_days(30)
+_NAMES = ["index-advisor-a", "index-advisor-b"]
+
+QUERY_TEMPLATES: List[QueryTemplate] = [
+    QueryTemplate(
+        "commits by member",
+        "github_commits",
+        lambda now: {"author_name": {"$in": _NAMES}, "date": _month(now)},
+        [("date", DESCENDING)],
+    ),
+    QueryTemplate(
+        "commits by project",
+        "github_commits",
+        lambda now: {"repository": {"$in": _NAMES}, "date": _month(now)},
+        [("date", DESCENDING)],
+    ),
+    QueryTemplate(
+        "pull requests by member",
+        "github_pull_requests",
+        lambda now: {"author": {"$in": _NAMES}, "created_at": _month(now)},
+        [("created_at", DESCENDING)],
+    ),
+    QueryTemplate(
+        "pull requests by project",
+        "github_pull_requests",
+        lambda now: {"repository": {"$in": _NAMES}, "created_at": _month(now)},
+        [("created_at", DESCENDING)],
+    ),
+    QueryTemplate(
+        "slack messages by member",
+        "slack_messages",
+        lambda now: {"user_name": {"$in": _NAMES}, "posted_at": _month(now)},
+        [("posted_at", DESCENDING)],
+    ),
+    QueryTemplate(
+        "slack messages by channel",
+        "slack_messages",
+        lambda now: {"channel_id": _NAMES[0], "posted_at": _month(now)},
+        [("posted_at", DESCENDING)],
+    ),
+    QueryTemplate(
+        "slack thread",
+        "slack_messages",
+        lambda now: {"thread_ts": {"$in": _NAMES}},
+        [("posted_at", ASCENDING)],
+    ),
+    QueryTemplate(
+        "notion pages by creator",
+        "notion_pages",
+        lambda now: {"created_by.name": {"$in": _NAMES}, "last_edited_time": _month(now)},
+        [("last_edited_time", DESCENDING)],
+    ),
+    QueryTemplate(
+        "notion diffs by editor",
+        "notion_content_diffs",
+        lambda now: {"editor_id": _NAMES[0], "timestamp": _month(now)},
+        [("timestamp", DESCENDING)],
+    ),
+    QueryTemplate(
+        "notion diffs by page",
+        "notion_content_diffs",
+        lambda now: {"document_id": _NAMES[0]},
+        [("timestamp", DESCENDING)],
+    ),
+    QueryTemplate(
+        "drive activities by member",
+        "drive_activities",
+        lambda now: {"actor_name": {"$in": _NAMES}, "time": _month(now)},
+        [("time", DESCENDING)],
+    ),
+    QueryTemplate(
+        "drive activities by email",
+        "drive_activities",
+        lambda now: {"user_email": {"$in": _NAMES}, "timestamp": _month(now)},
+        [("timestamp", DESCENDING)],
+    ),
+    QueryTemplate(
+        "identifier lookup",
+        "member_identifiers",
+        lambda now: {"source": "github", "identifier_value": _NAMES[0]},
+    ),
+    QueryTemplate(
+        "identifiers of a member",
+        "member_identifiers",
+        lambda now: {"member_name": _NAMES[0]},
+    ),
+    QueryTemplate(
+        "recent recordings",
+        "recordings",
+        lambda now: {"modifiedTime": {"$gte": (now - timedelta(days=30)).isoformat()}},
+        [("modifiedTime", DESCENDING)],
+        database=SHARED_DATABASE,
+    ),
+]
+
+
+def ensure_manifest_indexes(db, database: str = MAIN_DATABASE) -> int:
+    """
+    Create the manifest indexes of one database (sync database)
+
+    Args:
+        db: pymongo database
+        database: Which manifest database ``db`` is (``main`` or ``shared``)
+
+    Returns:
+        Number of index specs applied
+    """
+    created = 0
+    for spec in INDEX_MANIFEST:
+        if spec.database != database:
+            continue
+        db[spec.collection].create_index(list(spec.keys))
+        created += 1
+    return created
+
+
+def _iter_stages(plan: Any) -> Iterator[Dict[str, Any]]:
+    """Every stage of an explain plan (classic and slot-based engine layouts)"""
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            yield plan
+        for value in plan.values():
+            if isinstance(value, (dict, list)):
+                yield from _iter_stages(value)
+    elif isinstance(plan, list):
+        for item in plan:
+            yield from _iter_stages(item)
+
+
+def analyze_plan(explain: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Summarize the winning plan of an ``explain()`` result
+
+    Returns:
+        Dict with the plan's stages, ``collscan``, ``in_memory_sort`` and the
+        index names used
+    """
+    winning = explain.get("queryPlanner", {}).get("winningPlan", {})
+    stages = list(_iter_stages(winning))
+    names = [stage["stage"] for stage in stages]
+    return {
+        "stages": names,
+        "collscan": "COLLSCAN" in names,
+        "in_memory_sort": any(name in ("SORT", "SORT_KEY_GENERATOR") for name in names),
+        "indexes": sorted({stage["indexName"] for stage in stages if stage.get("indexName")}),
+    }
+
+
+def explain_templates(
+    db,
+    templates: Optional[List[QueryTemplate]] = None,
+    shared_db=None,
+    now: Optional[datetime] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Run ``explain()`` on the registered query templates
+
+    Templates of the shared database are skipped when ``shared_db`` is None.
+
+    Args:
+        db: pymongo database (main)
+        templates: Templates to explain (default: ``QUERY_TEMPLATES``)
+        shared_db: pymongo database holding the shared collections
+        now: Reference time for the template date ranges
+
+    Returns:
+        One report per template: name, collection and ``analyze_plan`` fields
+        (or ``error``)
+    """
+    now = now or datetime.utcnow()
+    databases = {MAIN_DATABASE: db, SHARED_DATABASE: shared_db}
+    reports = []
+
+    for template in templates if templates is not None else QUERY_TEMPLATES:
+        target = databases.get(template.database)
+        if target is None:
+            continue
+
+        report = {"name": template.name, "collection": template.collection}
+        try:
+            cursor = target[template.collection].find(template.filter(now))
+            if template.sort:
+                cursor = cursor.sort(template.sort)
+            report.update(analyze_plan(cursor.limit(template.limit).explain()))
+        except Exception as e:
+            report["error"] = str(e)
+        reports.append(report)
+
+    return reports
+
+
+def log_index_report(reports: List[Dict[str, Any]]) -> int:
+    """
+    Log collection scans and in-memory sorts found by the advisor
+
+    Returns:
+        Number of templates with a problem
+    """
+    problems = 0
+    for report in reports:
+        label = f"{report['name']} ({report['collection']})"
+        if report.get("error"):
+            logger.warning(f"⚠️  Index advisor could not explain {label}: {report['error']}")
+            continue
+
+        issues = []
+        if report["collscan"]:
+            issues.append("COLLSCAN")
+        if report["in_memory_sort"]:
+            issues.append("in-memory sort")
+        if issues:
+            problems += 1
+            logger.warning(f"⚠️  Index advisor: {label} uses {', '.join(issues)} (plan: {' → '.join(report['stages'])})")
+
+    if problems:
+        logger.warning(f"⚠️  Index advisor: {problems}/{len(reports)} query shapes lack a matching index")
+    else:
+        logger.info(f"✅ Index advisor: all {len(reports)} query shapes use an index")
+    return problems
+
+
+def run_index_advisor(mongo_manager) -> int:
+    """
+    Explain every template against the configured databases and log the result
+
+    Meant to run once at startup (off the event loop). Never raises.
+
+    Returns:
+        Number of templates with a problem
+    """
+    try:
+        try:
+            shared_db = mongo_manager.shared_db
+        except Exception:
+            shared_db = None
+        return log_index_report(explain_templates(mongo_manager.db, shared_db=shared_db))
+    except Exception as e:
+        logger.warning(f"⚠️  Index advisor failed: {e}")
+        return 0
@@ -5,8 +5,12 @@ Manages MongoDB connections, provides database and collection access,
 and handles connection pooling for the All-Thing-Eye project.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import contextvars
+import functools
 import pymongo
 from pymongo import MongoClient
 from pymongo.database import Database
@@ -16,6 +20,15 @@ from motor.motor_asyncio import AsyncIOMotorClient
 import os
 
 from src.utils.logger import get_logger
+from src.utils.profiling import mongo_profiler
+from src.core.activity_rollups import ensure_rollup_indexes
+from src.core.activity_timeline import ensure_timeline_indexes
+from src.core.search_index import ensure_search_indexes
+from src.core.embedding_index import ensure_embedding_indexes
+from src.core.index_manifest import ensure_manifest_indexes
+from src.core.checkpoints import ensure_checkpoint_indexes
+from src.core.collaboration_store import ensure_collaboration_indexes
+from src.core.slack_threads import ensure_thread_indexes
 
 logger = get_logger(__name__)
 
@@ -40,12 +53,24 @@ class MongoDBManager:
         self.database_name = config.get('database', 'all_thing_eye')
         
         # Shared database URI (for recordings from Google Drive)
-        self.shared_uri = os.getenv('MONGODB_SHARED_URI', self.uri)
+        self.shared_uri = (
+            os.getenv('MONGODB_SHARED_URI')
+            or os.getenv('SHARED_MONGODB_URI')
+            or self.uri
+        )
+        
+        # Gemini database URI (AI meeting analyses, recordings_daily)
+        self.gemini_uri = os.getenv('GEMINI_MONGODB_URI', self.uri)
         
         # Connection pool settings
         self.max_pool_size = config.get('max_pool_size', 100)
         self.min_pool_size = config.get('min_pool_size', 10)
         
+        # Bounded thread pool for work that must stay synchronous
+        # (legacy pymongo code paths, blocking SDK calls) inside async handlers
+        self.sync_executor_workers = config.get('sync_executor_workers', 8)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
         # Write concern settings
         write_concern = config.get('write_concern', {})
         self.write_concern = pymongo.WriteConcern(
@@ -75,6 +100,12 @@ class MongoDBManager:
         self._shared_async_client: Optional[AsyncIOMotorClient] = None
         self._shared_async_db: Optional[Database] = None
         
+        # Gemini database clients (AI-processed data)
+        self._gemini_sync_client: Optional[MongoClient] = None
+        self._gemini_sync_db: Optional[Database] = None
+        self._gemini_async_client: Optional[AsyncIOMotorClient] = None
+        self._gemini_async_db: Optional[Database] = None
+        
         logger.info(f"MongoDB Manager initialized for database: {self.database_name}")
     
     def _get_read_preference(self, pref_str: str):
@@ -104,6 +135,7 @@ class MongoDBManager:
                     serverSelectionTimeoutMS=5000,
                     connectTimeoutMS=10000,
                     socketTimeoutMS=30000,
+                    event_listeners=[mongo_profiler],
                 )
                 
                 # Test connection
@@ -138,6 +170,7 @@ class MongoDBManager:
                     serverSelectionTimeoutMS=5000,
                     connectTimeoutMS=10000,
                     socketTimeoutMS=30000,
+                    event_listeners=[mongo_profiler],
                 )
                 
                 logger.info("✅ Asynchronous MongoDB connection established")
@@ -179,6 +212,7 @@ class MongoDBManager:
                     serverSelectionTimeoutMS=5000,
                     connectTimeoutMS=10000,
                     socketTimeoutMS=30000,
+                    event_listeners=[mongo_profiler],
                 )
                 
                 # Test connection
@@ -209,6 +243,7 @@ class MongoDBManager:
                     serverSelectionTimeoutMS=5000,
                     connectTimeoutMS=10000,
                     socketTimeoutMS=30000,
+                    event_listeners=[mongo_profiler],
                 )
                 
                 logger.info("✅ Asynchronous shared MongoDB connection established")
@@ -234,6 +269,100 @@ class MongoDBManager:
             self.connect_shared_async()
         return self._shared_async_db
     
+    def connect_gemini_sync(self) -> MongoClient:
+        """
+        Create synchronous connection to the gemini database
+        
+        Returns:
+            MongoClient instance for gemini database
+        """
+        if self._gemini_sync_client is None:
+            try:
+                self._gemini_sync_client = MongoClient(
+                    self.gemini_uri,
+                    maxPoolSize=self.max_pool_size,
+                    minPoolSize=self.min_pool_size,
+                    serverSelectionTimeoutMS=5000,
+                    connectTimeoutMS=10000,
+                    socketTimeoutMS=30000,
+                    event_listeners=[mongo_profiler],
+                )
+                
+                logger.info("✅ Synchronous gemini MongoDB connection established")
+                self._gemini_sync_db = self._gemini_sync_client['gemini']
+                
+            except (ConnectionFailure, ServerSelectionTimeoutError) as e:
+                logger.error(f"❌ Failed to connect to gemini MongoDB: {e}")
+                raise
+        
+        return self._gemini_sync_client
+    
+    def connect_gemini_async(self) -> AsyncIOMotorClient:
+        """
+        Create asynchronous connection to the gemini database
+        
+        Returns:
+            AsyncIOMotorClient instance for gemini database
+        """
+        if self._gemini_async_client is None:
+            try:
+                self._gemini_async_client = AsyncIOMotorClient(
+                    self.gemini_uri,
+                    maxPoolSize=self.max_pool_size,
+                    minPoolSize=self.min_pool_size,
+                    serverSelectionTimeoutMS=5000,
+                    connectTimeoutMS=10000,
+                    socketTimeoutMS=30000,
+                    event_listeners=[mongo_profiler],
+                )
+                
+                logger.info("✅ Asynchronous gemini MongoDB connection established")
+                self._gemini_async_db = self._gemini_async_client['gemini']
+                
+            except (ConnectionFailure, ServerSelectionTimeoutError) as e:
+                logger.error(f"❌ Failed to connect to gemini MongoDB (async): {e}")
+                raise
+        
+        return self._gemini_async_client
+    
+    @property
+    def gemini_db(self) -> Database:
+        """Get synchronous gemini database instance"""
+        if self._gemini_sync_db is None:
+            self.connect_gemini_sync()
+        return self._gemini_sync_db
+    
+    @property
+    def gemini_async_db(self) -> Database:
+        """Get asynchronous gemini database instance"""
+        if self._gemini_async_db is None:
+            self.connect_gemini_async()
+        return self._gemini_async_db
+    
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Get the bounded thread pool used for synchronous work"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.sync_executor_workers,
+                thread_name_prefix="mongo-sync",
+            )
+        return self._executor
+    
+    async def run_sync(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking callable on the bounded executor without stalling the event loop
+        
+        Usage:
+            result = await mongo_manager.run_sync(legacy_sync_function, arg1, key=value)
+        """
+        loop = asyncio.get_running_loop()
+        # Copy the context so Mongo commands stay attributed to the request profile
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(context.run, func, *args, **kwargs)
+        )
+    
     def get_collection(self, collection_name: str) -> Collection:
         """
         Get collection by name (synchronous)
@@ -316,13 +445,10 @@ class MongoDBManager:
             # GitHub collections
             github_commits = db[self.collections.get('github_commits', 'github_commits')]
             github_commits.create_index('sha', unique=True)
-            github_commits.create_index('author_name')
-            github_commits.create_index('repository')
             github_commits.create_index('date')
             
             github_prs = db[self.collections.get('github_pull_requests', 'github_pull_requests')]
             github_prs.create_index([('repository', 1), ('number', 1)], unique=True)
-            github_prs.create_index('author')
             github_prs.create_index('state')
             github_prs.create_index('created_at')
             
@@ -350,6 +476,29 @@ class MongoDBManager:
             drive_activities.create_index('actor_email')
             drive_activities.create_index('time')
             
+            # Compound (ESR) indexes for the API query shapes; member/repository
+            # lookups above are covered by their prefixes
+            ensure_manifest_indexes(db)
+            
+            # Unified activity timeline (keyset-paginated /activities/timeline)
+            ensure_timeline_indexes(db)
+            
+            # Full-text search over the timeline (/search)
+            ensure_search_indexes(db)
+            
+            # Chunk metadata of the semantic (embedding) index
+            ensure_embedding_indexes(db)
+            
+            # Precomputed daily counts for dashboard / member stats
+            ensure_rollup_indexes(db)
+            
+            # Incremental collection high-water marks
+            ensure_checkpoint_indexes(db)
+            ensure_thread_indexes(db)
+            
+            # Materialized collaboration events / day buckets
+            ensure_collaboration_indexes(db)
+            
             logger.info("✅ Indexes created successfully")
             
         except Exception as e:
@@ -372,6 +521,18 @@ class MongoDBManager:
         if self._shared_async_client:
             self._shared_async_client.close()
             logger.info("🔒 Closed shared asynchronous MongoDB connection")
+        
+        if self._gemini_sync_client:
+            self._gemini_sync_client.close()
+            logger.info("🔒 Closed gemini synchronous MongoDB connection")
+        
+        if self._gemini_async_client:
+            self._gemini_async_client.close()
+            logger.info("🔒 Closed gemini asynchronous MongoDB connection")
+        
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
     
     def test_connection(self) -> bool:
         """
@@ -0,0 +1,223 @@
+"""
+Content-Addressed Notion Block Snapshots
+
+Block text is stored once per distinct content in ``notion_block_contents``
+(``_id`` = SHA-1 of the plain text). Page snapshots only reference it:
+
+- head manifest (one per page, ``is_current: True``) in
+  ``notion_block_snapshots``: ordered ``blocks`` list of
+  ``{block_id, block_type, hash, parent_id}``
+- history entries (``is_current: False``): only the manifest delta of each
+  edit (``changed`` entries and ``removed`` block ids). The first entry of
+  a page (``full_manifest: True``) carries the whole manifest, so any
+  snapshot can be rebuilt by replaying deltas.
+
+An edit touching one block therefore writes one content document (if the
+text is new), one small history entry and the head manifest, regardless of
+page size.
+
+Pages snapshotted before this layout have one ``notion_block_snapshots``
+document per block (``block_id`` + ``plain_text``); they are read
+transparently and retired when the page is next saved.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pymongo import DESCENDING, UpdateOne
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+SNAPSHOTS_COLLECTION = "notion_block_snapshots"
+CONTENTS_COLLECTION = "notion_block_contents"
+
+# Manifest entry fields that define a block's state
+MANIFEST_FIELDS = ("block_id", "block_type", "hash", "parent_id")
+
+
+def block_hash(plain_text: str) -> str:
+    """Content address of a block's plain text"""
+    return hashlib.sha1((plain_text or "").encode("utf-8")).hexdigest()
+
+
+def manifest_entry(block: Dict[str, Any]) -> Dict[str, Any]:
+    """Manifest entry for a fetched block (``block_id``, ``block_type``, ``plain_text``)"""
+    return {
+        "block_id": block["block_id"],
+        "block_type": block.get("block_type", ""),
+        "hash": block.get("hash") or block_hash(block.get("plain_text", "")),
+        "parent_id": block.get("parent_id"),
+    }
+
+
+def manifest_delta(
+    old_entries: List[Dict[str, Any]], new_entries: List[Dict[str, Any]]
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Entries that are new or changed, and block ids that were removed
+
+    Returns:
+        (changed entries, removed block ids)
+    """
+    old_map = {e["block_id"]: e for e in old_entries}
+    new_ids = set()
+    changed = []
+    for entry in new_entries:
+        new_ids.add(entry["block_id"])
+        old = old_map.get(entry["block_id"])
+        if old is None or any(old.get(f) != entry.get(f) for f in MANIFEST_FIELDS):
+            changed.append(entry)
+    removed = [block_id for block_id in old_map if block_id not in new_ids]
+    return changed, removed
+
+
+class BlockSnapshotStore:
+    """
+    Read/write content-addressed block snapshots
+
+    Args:
+        db: pymongo database
+    """
+
+    def __init__(self, db):
+        self.snapshots = db[SNAPSHOTS_COLLECTION]
+        self.contents = db[CONTENTS_COLLECTION]
+
+    def ensure_indexes(self) -> None:
+        self.snapshots.create_index([("page_id", 1), ("is_current", 1)])
+        self.snapshots.create_index([("page_id", 1), ("snapshot_time", DESCENDING)])
+
+    def load_current(self, page_id: str) -> List[Dict[str, Any]]:
+        """
+        Current manifest of a page (empty if the page was never snapshotted)
+
+        Legacy per-block documents are returned as manifest entries that
+        also carry their ``plain_text``.
+        """
+        return self.load_head(page_id)[0]
+
+    def load_head(self, page_id: str) -> Tuple[List[Dict[str, Any]], Optional[datetime]]:
+        """Current manifest of a page and the time it was taken"""
+        head = self.snapshots.find_one(
+            {"page_id": page_id, "is_current": True, "blocks": {"$exists": True}},
+            {"blocks": 1, "snapshot_time": 1},
+        )
+        if head:
+            return head["blocks"], head.get("snapshot_time")
+
+        legacy = list(self.snapshots.find(
+            {"page_id": page_id, "is_current": True, "block_id": {"$exists": True}},
+            {"block_id": 1, "block_type": 1, "plain_text": 1, "parent_id": 1, "snapshot_time": 1},
+        ))
+        entries = [
+            {**manifest_entry(doc), "plain_text": doc.get("plain_text", ""), "legacy": True}
+            for doc in legacy
+        ]
+        return entries, legacy[0].get("snapshot_time") if legacy else None
+
+    def load_texts(self, hashes: Iterable[str]) -> Dict[str, str]:
+        """Plain text for the given content hashes"""
+        hashes = list(set(hashes))
+        if not hashes:
+            return {}
+        return {
+            doc["_id"]: doc.get("plain_text", "")
+            for doc in self.contents.find({"_id": {"$in": hashes}}, {"plain_text": 1})
+        }
+
+    def save(
+        self,
+        page_id: str,
+        blocks: List[Dict[str, Any]],
+        previous: Optional[List[Dict[str, Any]]] = None,
+        is_baseline: bool = False,
+    ) -> int:
+        """
+        Store a page's blocks as the new current snapshot
+
+        Args:
+            page_id: Notion page id
+            blocks: Fetched blocks (``block_id``, ``block_type``, ``plain_text``, ``parent_id``)
+            previous: Manifest returned by :meth:`load_current` (avoids a re-read)
+            is_baseline: First snapshot of the page
+
+        Returns:
+            Number of manifest entries that changed (0 = nothing written)
+        """
+        if previous is None:
+            previous = self.load_current(page_id)
+        entries = [manifest_entry(block) for block in blocks]
+
+        changed, removed = manifest_delta(previous, entries)
+        is_legacy = any(e.get("legacy") for e in previous)
+        if not changed and not removed and previous and not is_legacy:
+            return 0
+
+        # Only content that this edit introduced needs to be stored
+        known = {e["hash"] for e in previous if not e.get("legacy")}
+        texts = {}
+        for block, entry in zip(blocks, entries):
+            if entry["hash"] not in known:
+                texts[entry["hash"]] = block.get("plain_text", "")
+
+        snapshot_time = datetime.now(timezone.utc)
+        full_manifest = not previous or is_legacy
+        if texts:
+            self.contents.bulk_write(
+                [
+                    UpdateOne(
+                        {"_id": h},
+                        {"$setOnInsert": {"plain_text": text, "created_at": snapshot_time}},
+                        upsert=True,
+                    )
+                    for h, text in texts.items()
+                ],
+                ordered=False,
+            )
+
+        if is_legacy:
+            self.snapshots.update_many(
+                {"page_id": page_id, "is_current": True, "block_id": {"$exists": True}},
+                {"$set": {"is_current": False}},
+            )
+
+        self.snapshots.insert_one(
+            {
+                "page_id": page_id,
+                "snapshot_time": snapshot_time,
+                "is_current": False,
+                "is_baseline": is_baseline,
+                # First entry of the new layout: replay starts here
+                "full_manifest": full_manifest,
+                "changed": entries if full_manifest else changed,
+                "removed": removed,
+                "block_count": len(entries),
+            }
+        )
+        self.snapshots.replace_one(
+            {"page_id": page_id, "is_current": True, "blocks": {"$exists": True}},
+            {
+                "page_id": page_id,
+                "snapshot_time": snapshot_time,
+                "is_current": True,
+                "blocks": entries,
+                "block_count": len(entries),
+            },
+            upsert=True,
+        )
+        return len(changed) + len(removed)
+
+    def current_block_count(self) -> int:
+        """Blocks across all current manifests"""
+        result = list(
+            self.snapshots.aggregate(
+                [
+                    {"$match": {"is_current": True, "blocks": {"$exists": True}}},
+                    {"$group": {"_id": None, "total": {"$sum": "$block_count"}}},
+                ]
+            )
+        )
+        return result[0]["total"] if result else 0
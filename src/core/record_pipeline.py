@@ -0,0 +1,184 @@
+"""
+Streaming Record Pipeline
+
+Persists the records of a plugin's ``iter_records()`` in batches as they
+arrive instead of collecting the whole window into lists first.
+
+A record stream yields:
+- ``(kind, record)`` tuples, e.g. ``("message", {...})``; each kind is saved
+  by the plugin's writer for that kind (``record_writers()``)
+- ``CheckpointMark`` items: every record yielded before a mark belongs to
+  the position it describes
+
+On a mark the pipeline flushes all buffered records and, if every batch so
+far was saved in full, commits the mark. Peak memory is bounded by the batch
+size (per kind), and a crash loses at most the records since the last mark:
+they are re-fetched on the next run and upserted again. If the checkpoint
+store was cancelled (the orchestrator abandoned the source), the next mark
+stops the stream with ``CollectionCancelled`` instead of committing.
+
+Example:
+    pipeline = RecordPipeline(plugin.record_writers(), plugin.checkpoints, batch_size=500)
+    result = pipeline.run(plugin.iter_records(start_date, end_date))
+
+    # or, equivalently
+    result = persist_records(plugin, start_date, end_date)
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from src.core.checkpoints import CheckpointMark, CheckpointStore, CollectionCancelled
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_RECORD_BATCH_SIZE = 500
+
+Record = Union[Tuple[str, Dict[str, Any]], CheckpointMark]
+
+# Saves one batch of records of a kind; returns how many were persisted
+RecordWriter = Callable[[List[Dict[str, Any]]], int]
+
+
+@dataclass
+class PipelineResult:
+    """Counts of one pipeline run"""
+
+    records: Dict[str, int] = field(default_factory=dict)  # kind -> persisted
+    skipped: Dict[str, int] = field(default_factory=dict)  # kind -> records without a writer
+    batches: int = 0
+    failed_batches: int = 0
+    checkpoints: int = 0  # marks committed
+
+    @property
+    def total(self) -> int:
+        return sum(self.records.values())
+
+
+class RecordPipeline:
+    """
+    Batch writer stage for a record stream
+
+    Args:
+        writers: Record kind -> writer for a batch of that kind. Records of
+            kinds without a writer are informational and only counted.
+        checkpoints: Store receiving the marks (None to ignore marks)
+        batch_size: Records buffered per kind before they are written
+    """
+
+    def __init__(
+        self,
+        writers: Dict[str, RecordWriter],
+        checkpoints: Optional[CheckpointStore] = None,
+        batch_size: int = DEFAULT_RECORD_BATCH_SIZE,
+    ):
+        self.writers = writers
+        self.checkpoints = checkpoints
+        self.batch_size = max(1, batch_size)
+        self._buffers: Dict[str, List[Dict[str, Any]]] = {}
+        self.result = PipelineResult()
+
+    def _write(self, kind: str) -> None:
+        batch = self._buffers.pop(kind, None)
+        if not batch:
+            return
+
+        self.result.batches += 1
+        try:
+            saved = self.writers[kind](batch)
+        except Exception:
+            self.result.failed_batches += 1
+            raise
+
+        saved = saved or 0
+        self.result.records[kind] = self.result.records.get(kind, 0) + saved
+        if saved < len(batch):
+            self.result.failed_batches += 1
+            logger.warning(f"⚠️  Saved {saved}/{len(batch)} {kind} records; checkpoints held back")
+
+    def flush(self) -> None:
+        """Write every buffered record"""
+        for kind in list(self._buffers):
+            self._write(kind)
+
+    def _checkpoint(self, mark: CheckpointMark) -> None:
+        if getattr(self.checkpoints, "is_cancelled", False):
+            raise CollectionCancelled("collection was abandoned; not committing further checkpoints")
+        self.flush()
+        if self.result.failed_batches:
+            return
+        if self.checkpoints is not None:
+            self.checkpoints.stage_mark(mark)
+            self.result.checkpoints += self.checkpoints.commit()
+        if mark.on_commit is not None:
+            mark.on_commit()
+
+    def add(self, record: Record) -> None:
+        """Buffer one record (writing its kind's batch when full) or apply a mark"""
+        if isinstance(record, CheckpointMark):
+            self._checkpoint(record)
+            return
+
+        kind, item = record
+        if kind not in self.writers:
+            self.result.skipped[kind] = self.result.skipped.get(kind, 0) + 1
+            return
+
+        buffer = self._buffers.setdefault(kind, [])
+        buffer.append(item)
+        if len(buffer) >= self.batch_size:
+            self._write(kind)
+
+    def run(self, records: Iterable[Record]) -> PipelineResult:
+        """
+        Consume a record stream
+
+        If the stream fails, the records already received are still written
+        (without committing further marks) before the error is re-raised.
+        """
+        try:
+            for record in records:
+                self.add(record)
+        except BaseException:
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning(f"⚠️  Failed to save buffered records after a collection error: {e}")
+            raise
+
+        self.flush()
+        return self.result
+
+
+def persist_records(
+    plugin,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    batch_size: int = DEFAULT_RECORD_BATCH_SIZE,
+    **kwargs: Any,
+) -> PipelineResult:
+    """
+    Stream a plugin's records into MongoDB
+
+    Args:
+        plugin: Plugin implementing ``iter_records`` and ``record_writers``
+        start_date: Start of the collection window
+        end_date: End of the collection window
+        batch_size: Records buffered per kind before they are written
+
+    Returns:
+        PipelineResult
+    """
+    pipeline = RecordPipeline(
+        plugin.record_writers(), getattr(plugin, "checkpoints", None), batch_size=batch_size
+    )
+    result = pipeline.run(plugin.iter_records(start_date, end_date, **kwargs))
+
+    counts = ", ".join(f"{count} {kind}" for kind, count in sorted(result.records.items()))
+    logger.info(
+        f"💾 {plugin.source_name}: persisted {counts or 'nothing'} in {result.batches} batches, "
+        f"{result.checkpoints} checkpoints committed"
+    )
+    return result
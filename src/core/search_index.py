@@ -0,0 +1,323 @@
+"""
+Full-text Search Index
+
+Ranked keyword search over ``activity_timeline``. Every timeline row carries
+two search fields, filled by ``ActivityTimelineWriter`` from the full source
+document (the row metadata only keeps truncated previews):
+
+- ``search_title``: commit subject, PR title, Notion page / Drive document
+  title, recording name
+- ``search_text``: full commit message, PR and review bodies, Slack text,
+  Notion diff content, meeting transcript
+
+A single MongoDB text index over both fields (title weighted higher) serves
+every source, so a search is one index lookup instead of unanchored
+``$regex`` scans of ``slack_messages`` / ``github_commits``. The index uses
+``default_language="none"``: no stemming or stop words, which keeps Korean
+and English text searchable alike and keeps highlighting exact.
+
+Query syntax is MongoDB's: words are OR'ed and ranked by relevance,
+``"quoted phrases"`` must match, ``-word`` excludes.
+
+Rows written before the search fields existed are filled in by re-running
+``scripts/backfill_activity_timeline.py``.
+
+Example:
+    page = search_timeline(db, "bridge audit", source_type="github", limit=20)
+    for hit in page["results"]:
+        print(hit["score"], hit["snippet"])
+"""
+
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pymongo import TEXT
+
+from src.core.activity_timeline import TIMELINE_COLLECTION, date_range_filter
+
+SEARCH_INDEX_NAME = "activity_search"
+SEARCH_WEIGHTS = {"search_title": 5, "search_text": 1}
+
+# Transcripts can be hours long; the head is enough to find the meeting
+MAX_SEARCH_TEXT_CHARS = 50000
+MAX_QUERY_CHARS = 200
+SNIPPET_CHARS = 200
+
+# Only the fields a result needs (rows carry no other large fields)
+RESULT_PROJECTION = {
+    "score": {"$meta": "textScore"},
+    "search_title": 1,
+    "search_text": 1,
+    "source_type": 1,
+    "activity_type": 1,
+    "timestamp": 1,
+    "member_name": 1,
+    "metadata": 1,
+}
+RESULT_SORT = [("score", {"$meta": "textScore"}), ("timestamp", -1)]
+
+_QUERY_TOKEN = re.compile(r'"([^"]+)"|(\S+)')
+
+
+def ensure_search_indexes(db) -> None:
+    """Create the text index on ``activity_timeline`` (sync database)"""
+    db[TIMELINE_COLLECTION].create_index(
+        [("search_title", TEXT), ("search_text", TEXT)],
+        weights=SEARCH_WEIGHTS,
+        default_language="none",
+        name=SEARCH_INDEX_NAME,
+        background=True,
+    )
+
+
+# =============================================================================
+# Search fields (source document -> searchable text)
+# =============================================================================
+
+
+def _join(*parts: Any) -> str:
+    return "\n".join(str(p) for p in parts if p)
+
+
+def _commit_text(doc: Dict[str, Any]) -> Tuple[str, str]:
+    message = doc.get("message") or ""
+    return message.split("\n", 1)[0], message
+
+
+def _pull_request_text(doc: Dict[str, Any]) -> Tuple[str, str]:
+    return doc.get("title") or "", doc.get("body") or ""
+
+
+def _review_text(doc: Dict[str, Any]) -> Tuple[str, str]:
+    return doc.get("pr_title") or "", doc.get("body") or ""
+
+
+def _slack_message_text(doc: Dict[str, Any]) -> Tuple[str, str]:
+    return "", doc.get("text") or ""
+
+
+def _notion_diff_text(doc: Dict[str, Any]) -> Tuple[str, str]:
+    changes = doc.get("changes", {}) or {}
+    parts = [item.get("content") for item in changes.get("added", []) if isinstance(item, dict)]
+    parts += [item.get("new_content") for item in changes.get("modified", []) if isinstance(item, dict)]
+    return doc.get("document_title") or "", _join(*parts)
+
+
+def _drive_activity_text(doc: Dict[str, Any]) -> Tuple[str, str]:
+    return doc.get("doc_title") or "", ""
+
+
+def _recording_text(doc: Dict[str, Any]) -> Tuple[str, str]:
+    return doc.get("name") or "", doc.get("content") or ""
+
+
+SEARCH_FIELD_BUILDERS: Dict[str, Callable[[Dict[str, Any]], Tuple[str, str]]] = {
+    "github_commits": _commit_text,
+    "github_pull_requests": _pull_request_text,
+    "github_reviews": _review_text,
+    "slack_messages": _slack_message_text,
+    "notion_content_diffs": _notion_diff_text,
+    "drive_activities": _drive_activity_text,
+    "recordings": _recording_text,
+}
+
+
+def search_fields(source_collection: str, doc: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Build the ``search_title`` / ``search_text`` fields of a timeline row
+
+    Returns:
+        Dict with both fields (empty strings when the source has no text)
+    """
+    builder = SEARCH_FIELD_BUILDERS.get(source_collection)
+    title, text = builder(doc) if builder else ("", "")
+    return {
+        "search_title": str(title).strip(),
+        "search_text": str(text).strip()[:MAX_SEARCH_TEXT_CHARS],
+    }
+
+
+# =============================================================================
+# Query
+# =============================================================================
+
+
+def parse_query(q: str) -> Tuple[List[str], List[str]]:
+    """
+    Split a search string into positive terms and quoted phrases
+
+    Excluded (``-word``) terms are dropped: they never appear in a hit, so
+    they are not highlighted.
+
+    Returns:
+        (terms, phrases)
+    """
+    terms, phrases = [], []
+    for phrase, word in _QUERY_TOKEN.findall(q or ""):
+        if phrase:
+            phrases.append(phrase.strip())
+        elif word and not word.startswith("-"):
+            terms.append(word)
+    return terms, [p for p in phrases if p]
+
+
+def build_search_filter(
+    q: str,
+    source_type: Optional[str] = None,
+    member_name: Optional[str] = None,
+    project_key: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Build the ``$text`` query with the timeline's equality and date filters
+
+    Raises:
+        ValueError: If the query is empty, only excludes terms, or is too long,
+            or a date cannot be parsed
+    """
+    q = (q or "").strip()
+    if not q:
+        raise ValueError("Search query must not be empty")
+    if len(q) > MAX_QUERY_CHARS:
+        raise ValueError(f"Search query must be at most {MAX_QUERY_CHARS} characters")
+    terms, phrases = parse_query(q)
+    if not terms and not phrases:
+        raise ValueError("Search query must contain at least one term that is not excluded")
+
+    query: Dict[str, Any] = {"$text": {"$search": q}}
+    if source_type:
+        query["source_type"] = source_type
+    if member_name:
+        query["member_key"] = member_name.lower()
+    if project_key:
+        query["project_keys"] = project_key
+
+    date_filter = date_range_filter(start_date, end_date)
+    if date_filter:
+        query["timestamp"] = date_filter
+    return query
+
+
+def _match_pattern(q: str) -> Optional[re.Pattern]:
+    terms, phrases = parse_query(q)
+    # Terms match whole tokens (no stemming); phrases match as substrings
+    alternatives = [re.escape(p) for p in sorted(phrases, key=len, reverse=True)]
+    alternatives += [rf"(?<!\w){re.escape(t)}(?!\w)" for t in sorted(terms, key=len, reverse=True)]
+    if not alternatives:
+        return None
+    return re.compile("|".join(alternatives), re.IGNORECASE)
+
+
+def highlight(text: str, q: str, width: int = SNIPPET_CHARS) -> Tuple[str, List[List[int]]]:
+    """
+    Cut a snippet around the first match and locate the matches in it
+
+    Args:
+        text: Full text of the hit
+        q: Search string
+        width: Maximum snippet length (before ellipses)
+
+    Returns:
+        (snippet, highlights) where highlights are ``[start, end)`` offsets
+        into the snippet
+    """
+    text = " ".join((text or "").split())
+    pattern = _match_pattern(q)
+    first = pattern.search(text) if pattern else None
+
+    start = 0
+    if first and first.start() > width // 3:
+        start = first.start() - width // 3
+        # Start at a word boundary
+        space = text.rfind(" ", 0, start)
+        start = space + 1 if space >= 0 and start - space < 20 else start
+    end = min(len(text), start + width)
+
+    snippet = text[start:end]
+    highlights = (
+        [[m.start(), m.end()] for m in pattern.finditer(snippet) if m.end() > m.start()]
+        if pattern
+        else []
+    )
+
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if end < len(text) else ""
+    if prefix:
+        highlights = [[s + len(prefix), e + len(prefix)] for s, e in highlights]
+    return prefix + snippet + suffix, highlights
+
+
+def format_hit(row: Dict[str, Any], q: str) -> Dict[str, Any]:
+    """Shape a matched timeline row into a search result"""
+    title = row.get("search_title") or ""
+    snippet, highlights = highlight(row.get("search_text") or title, q)
+    _, title_highlights = highlight(title, q, width=max(len(title), 1))
+    return {
+        "id": row["_id"],
+        "source_type": row.get("source_type", ""),
+        "activity_type": row.get("activity_type", ""),
+        "timestamp": row["timestamp"].isoformat() + "Z" if row.get("timestamp") else None,
+        "member_name": row.get("member_name", ""),
+        "title": title,
+        "title_highlights": title_highlights,
+        "snippet": snippet,
+        "highlights": highlights,
+        "score": round(row.get("score", 0.0), 4),
+        "metadata": row.get("metadata", {}),
+    }
+
+
+def _page(rows: List[Dict[str, Any]], q: str, offset: int, limit: int) -> Dict[str, Any]:
+    return {
+        "query": q,
+        "results": [format_hit(row, q) for row in rows[:limit]],
+        "offset": offset,
+        "limit": limit,
+        "has_more": len(rows) > limit,
+    }
+
+
+def search_timeline(db, q: str, offset: int = 0, limit: int = 20, **filters: Any) -> Dict[str, Any]:
+    """
+    Ranked search over the timeline (sync database)
+
+    Args:
+        db: pymongo database
+        q: Search string (MongoDB ``$text`` syntax)
+        offset: Number of ranked results to skip
+        limit: Page size
+        **filters: source_type, member_name, project_key, start_date, end_date
+
+    Returns:
+        Page dict: query, results, offset, limit, has_more
+
+    Raises:
+        ValueError: If the query is invalid (see :func:`build_search_filter`)
+    """
+    query = build_search_filter(q, **filters)
+    # Fetch one extra row to know whether another page exists
+    rows = list(
+        db[TIMELINE_COLLECTION]
+        .find(query, RESULT_PROJECTION)
+        .sort(RESULT_SORT)
+        .skip(offset)
+        .limit(limit + 1)
+    )
+    return _page(rows, q, offset, limit)
+
+
+async def search_timeline_async(
+    db, q: str, offset: int = 0, limit: int = 20, **filters: Any
+) -> Dict[str, Any]:
+    """Async (Motor) variant of :func:`search_timeline`"""
+    query = build_search_filter(q, **filters)
+    rows = (
+        await db[TIMELINE_COLLECTION]
+        .find(query, RESULT_PROJECTION)
+        .sort(RESULT_SORT)
+        .skip(offset)
+        .limit(limit + 1)
+        .to_list(length=limit + 1)
+    )
+    return _page(rows, q, offset, limit)
@@ -0,0 +1,166 @@
+"""
+Slack Thread Tracker
+
+Per-thread reply watermarks stored in ``slack_threads``, keyed by
+``(channel_id, thread_ts)``:
+- ``latest_reply``: ts of the newest reply already collected
+- ``reply_count``: reply count reported by ``conversations.history``
+
+``conversations.history`` returns ``latest_reply`` / ``reply_count`` on every
+thread parent, so the collector can tell from the history page alone which
+threads received new replies, and fetch only those (and only the new
+replies, via ``conversations.replies(oldest=latest_reply)``).
+
+Watermarks are staged while fetching and committed after the replies are
+saved, like ``src/core/checkpoints.py``; channels fetched concurrently
+commit their own threads only. Writes use ``$max`` so a backfill of an older
+window never moves a watermark back.
+"""
+
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from pymongo import ASCENDING, UpdateOne
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+THREADS_COLLECTION = "slack_threads"
+
+
+def ensure_thread_indexes(db) -> None:
+    """Create the (channel_id, thread_ts) unique index"""
+    db[THREADS_COLLECTION].create_index(
+        [("channel_id", ASCENDING), ("thread_ts", ASCENDING)], unique=True, background=True
+    )
+
+
+class SlackThreadTracker:
+    """
+    Read/write access to ``slack_threads``
+
+    Args:
+        db: pymongo database (or None to disable tracking)
+        enabled: When False, no watermarks are read (every thread is fetched)
+            and commits are no-ops
+    """
+
+    def __init__(self, db, enabled: bool = True):
+        self.db = db
+        self.enabled = enabled and db is not None
+        self._watermarks: Dict[Tuple[str, str], str] = {}
+        self._loaded_channels = set()
+        self._staged: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def collection(self):
+        return self.db[THREADS_COLLECTION]
+
+    def load_channel(self, channel_id: str, since: Optional[str] = None) -> int:
+        """
+        Load the watermarks of a channel's threads started after ``since``
+
+        Returns:
+            Number of threads loaded
+        """
+        if not self.enabled or channel_id in self._loaded_channels:
+            return 0
+
+        query: Dict[str, Any] = {"channel_id": channel_id}
+        if since is not None:
+            # Slack ts strings have a fixed width, so they sort numerically
+            query["thread_ts"] = {"$gte": since}
+
+        docs = list(self.collection.find(query, {"_id": 0, "thread_ts": 1, "latest_reply": 1}))
+        count = 0
+        with self._lock:
+            for doc in docs:
+                if doc.get("latest_reply"):
+                    self._watermarks[(channel_id, doc["thread_ts"])] = doc["latest_reply"]
+                    count += 1
+            self._loaded_channels.add(channel_id)
+        return count
+
+    def watermark(self, channel_id: str, thread_ts: str) -> Optional[str]:
+        """ts of the newest reply already collected for a thread"""
+        if not self.enabled:
+            return None
+        return self._watermarks.get((channel_id, thread_ts))
+
+    def has_new_replies(self, channel_id: str, thread_ts: str, latest_reply: Optional[str]) -> bool:
+        """True unless the thread's ``latest_reply`` is at or below its watermark"""
+        watermark = self.watermark(channel_id, thread_ts)
+        if not latest_reply or not watermark:
+            return True
+        return float(latest_reply) > float(watermark)
+
+    def stage(self, channel_id: str, thread_ts: str, latest_reply: str, reply_count: int = 0) -> None:
+        """Record a thread's replies as collected up to ``latest_reply``"""
+        if not self.enabled:
+            return
+        key = (channel_id, thread_ts)
+        with self._lock:
+            entry = self._staged.get(key)
+            if entry is None or float(latest_reply) > float(entry["latest_reply"]):
+                self._staged[key] = {"latest_reply": latest_reply, "reply_count": reply_count}
+
+    def staged_count(self, channel_id: Optional[str] = None) -> int:
+        with self._lock:
+            return sum(1 for key in self._staged if channel_id is None or key[0] == channel_id)
+
+    def discard(self) -> None:
+        with self._lock:
+            self._staged = {}
+
+    def commit(self, channel_id: Optional[str] = None) -> int:
+        """
+        Persist staged watermarks
+
+        Args:
+            channel_id: Only commit this channel's threads (None for all)
+
+        Returns:
+            Number of threads written
+        """
+        if not self.enabled:
+            return 0
+        with self._lock:
+            staged = {
+                key: entry
+                for key, entry in self._staged.items()
+                if channel_id is None or key[0] == channel_id
+            }
+        if not staged:
+            return 0
+
+        now = datetime.now(timezone.utc)
+        operations = [
+            UpdateOne(
+                {"channel_id": channel, "thread_ts": thread_ts},
+                {
+                    "$max": {"latest_reply": entry["latest_reply"]},
+                    "$set": {"reply_count": entry["reply_count"], "updated_at": now},
+                },
+                upsert=True,
+            )
+            for (channel, thread_ts), entry in staged.items()
+        ]
+
+        try:
+            self.collection.bulk_write(operations, ordered=False)
+        except Exception as e:
+            logger.warning(f"⚠️  Failed to save Slack thread watermarks: {e}")
+            return 0
+
+        with self._lock:
+            for key, entry in staged.items():
+                current = self._watermarks.get(key)
+                if current is None or float(entry["latest_reply"]) > float(current):
+                    self._watermarks[key] = entry["latest_reply"]
+                # A newer watermark staged meanwhile stays staged
+                if self._staged.get(key) is entry:
+                    del self._staged[key]
+        return len(operations)
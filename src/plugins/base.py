@@ -1,7 +1,7 @@
 """Base plugin interface for all data source plugins"""
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, Iterator, List, Any, Optional
 from datetime import datetime
 
 
@@ -80,6 +80,44 @@ class DataSourcePlugin(ABC):
         """
         pass
     
+    def iter_records(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        **kwargs
+    ) -> Iterator[Any]:
+        """
+        Stream the records of the specified date range (optional)
+        
+        Streaming plugins yield ``(kind, record)`` tuples as they are fetched,
+        and ``CheckpointMark`` items once every record of a position has been
+        yielded. ``src.core.record_pipeline.persist_records`` saves them in
+        batches with the writers from :meth:`record_writers`.
+        
+        Args:
+            start_date: Start of collection period
+            end_date: End of collection period
+            **kwargs: Additional source-specific parameters
+            
+        Yields:
+            ``(kind, record)`` tuples and ``CheckpointMark`` items
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support streaming collection")
+    
+    def record_writers(self) -> Dict[str, Callable[[List[Dict[str, Any]]], int]]:
+        """
+        Writers for the record kinds yielded by :meth:`iter_records`
+        
+        Returns:
+            Dict mapping record kind to a callable saving a batch of records
+            and returning how many were persisted
+        """
+        return {}
+    
+    def supports_streaming(self) -> bool:
+        """Check if the plugin implements :meth:`iter_records`"""
+        return type(self).iter_records is not DataSourcePlugin.iter_records
+    
     @abstractmethod
     def get_member_mapping(self) -> Dict[str, str]:
         """
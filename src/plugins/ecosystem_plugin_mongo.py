@@ -18,6 +18,7 @@ import httpx
 from dotenv import load_dotenv
 
 from src.utils.logger import get_logger
+from src.core.bulk_writer import AsyncBulkWriter
 
 load_dotenv()
 
@@ -171,19 +172,12 @@ class EcosystemPluginMongo:
         # Create index if not exists
         await collection.create_index("date", unique=True)
         
-        saved_count = 0
-        for record in data["records"]:
-            try:
-                # Upsert by date
-                await collection.update_one(
-                    {"date": record["date"]},
-                    {"$set": record},
-                    upsert=True
-                )
-                saved_count += 1
-            except Exception as e:
-                logger.warning(f"Failed to save staking record: {e}")
+        # Upsert by date
+        async with AsyncBulkWriter(collection, label="ecosystem_staking") as writer:
+            for record in data["records"]:
+                await writer.update_one({"date": record["date"]}, {"$set": record})
         
+        saved_count = writer.result.operations - writer.result.errors
         logger.info(f"   ✅ Saved {saved_count} staking records")
         return saved_count
     
@@ -1,7 +1,8 @@
 """GitHub data source plugin - MongoDB version"""
 
 import time
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime, timedelta
 import requests
 from bson import ObjectId
@@ -9,6 +10,11 @@ from pymongo.errors import DuplicateKeyError
 
 from .base import DataSourcePlugin
 from src.core.mongo_manager import MongoDBManager
+from src.core.activity_timeline import ActivityTimelineWriter
+from src.core.bulk_writer import DEFAULT_BATCH_SIZE, BulkWriter
+from src.core.checkpoints import CheckpointMark, CheckpointStore, as_utc
+from src.core.collaboration_store import CollaborationStore
+from src.utils.rate_limiter import GitHubRateLimiter, parse_retry_after
 from src.models.mongo_models import (
     GitHubCommit,
     GitHubPullRequest,
@@ -65,9 +71,27 @@ class GitHubPluginMongo(DataSourcePlugin):
             }
         )
 
-        # Track problematic repositories to skip them for other members
+        # Track problematic repositories so they are reported once
         self.problematic_repos = set()
 
+        # Repository crawl concurrency and GraphQL pacing
+        collection_config = config.get("collection", {})
+        self.max_concurrent_repos = collection_config.get("max_concurrent_repos", 4)
+        self.rate_limiter = GitHubRateLimiter(
+            points_per_minute=collection_config.get("graphql_points_per_minute", 900)
+        )
+        self.bulk_batch_size = collection_config.get("bulk_batch_size", DEFAULT_BATCH_SIZE)
+
+        # Per-repository high-water marks; a partial member crawl must not
+        # mark repositories as done for everyone
+        self.checkpoints = CheckpointStore(
+            self.mongo.db,
+            "github",
+            enabled=config.get("use_checkpoints", False) and not self.target_members,
+        )
+        # One writer per run: member and project lookups are loaded once
+        self.timeline = ActivityTimelineWriter(self.mongo.db)
+
     def get_source_name(self) -> str:
         return "github"
 
@@ -174,6 +198,9 @@ class GitHubPluginMongo(DataSourcePlugin):
             saved_commits = self._save_commits(collected_data["commits"])
             print(f"   💾 Saved {saved_commits} commits to MongoDB")
 
+            # Commits are persisted: advance per-repository checkpoints
+            self.checkpoints.commit()
+
             # 6. Sync project repositories from GitHub Teams
             print("\n6️⃣ Syncing project repositories from GitHub Teams...")
             synced_projects = self._sync_project_repositories()
@@ -185,15 +212,74 @@ class GitHubPluginMongo(DataSourcePlugin):
             print(f"❌ Error collecting GitHub data: {e}")
             raise
 
+    def iter_records(
+        self, start_date: datetime, end_date: datetime, **kwargs
+    ) -> Iterator[Any]:
+        """
+        Stream GitHub records: ``member``, ``repository``, ``pull_request``,
+        ``issue`` and ``commit``
+
+        Commits are yielded per repository as its crawl completes, followed by
+        the repository's ``CheckpointMark``. Project repositories are synced
+        from GitHub Teams once the stream is exhausted.
+        """
+        print(f"\n📊 Collecting GitHub data for {self.org_name}")
+        print(f"   Period: {start_date.isoformat()} ~ {end_date.isoformat()}")
+
+        if not self._authenticated:
+            if not self.authenticate():
+                raise RuntimeError("GitHub authentication required")
+
+        print("\n1️⃣ Fetching members...")
+        members = self._get_members()
+        print(f"   ✅ Found {len(members)} members")
+        for member in members:
+            yield "member", member
+
+        print("\n2️⃣ Fetching repositories...")
+        repositories = self._get_repositories()
+        print(f"   ✅ Found {len(repositories)} repositories")
+        for repo in repositories:
+            yield "repository", repo
+
+        print("\n3️⃣ Fetching pull requests...")
+        for pr in self._get_pull_requests(start_date, end_date):
+            yield "pull_request", pr
+
+        print("\n4️⃣ Fetching issues...")
+        for issue in self._get_issues(start_date, end_date):
+            yield "issue", issue
+
+        print("\n5️⃣ Fetching commits...")
+        for _, repo_commits, mark in self._iter_member_commits(
+            members, repositories, start_date, end_date
+        ):
+            for commit in repo_commits:
+                yield "commit", commit
+            yield mark
+
+        print("\n6️⃣ Syncing project repositories from GitHub Teams...")
+        synced_projects = self._sync_project_repositories()
+        print(f"   ✅ Synced repositories for {synced_projects} projects")
+
+    def record_writers(self) -> Dict[str, Any]:
+        """Writers for :meth:`iter_records` (members are not stored)"""
+        return {
+            "repository": self._save_repositories,
+            "pull_request": self._save_pull_requests,
+            "issue": self._save_issues,
+            "commit": self._save_commits,
+        }
+
     def _save_repositories(self, repositories: List[Dict[str, Any]]) -> int:
         """Save repositories to MongoDB"""
         if not repositories:
             return 0
 
-        saved_count = 0
+        writer = BulkWriter(self.repos_col, batch_size=self.bulk_batch_size)
         for repo in repositories:
             try:
-                self.repos_col.update_one(
+                writer.update_one(
                     {"name": repo["name"]},
                     {
                         "$set": {
@@ -214,13 +300,12 @@ class GitHubPluginMongo(DataSourcePlugin):
                             "updated_at": datetime.utcnow(),
                         }
                     },
-                    upsert=True,
                 )
-                saved_count += 1
             except Exception as e:
                 print(f"      ⚠️  Error saving repository {repo.get('name')}: {e}")
 
-        return saved_count
+        result = writer.flush()
+        return result.operations - result.errors
 
     def _sync_project_repositories(self) -> int:
         """
@@ -360,7 +445,8 @@ class GitHubPluginMongo(DataSourcePlugin):
         if not commits:
             return 0
 
-        saved_count = 0
+        writer = BulkWriter(self.commits_col, batch_size=self.bulk_batch_size)
+        saved_docs = []
         for commit_data in commits:
             try:
                 # Prepare file changes if included
@@ -382,47 +468,49 @@ class GitHubPluginMongo(DataSourcePlugin):
                         files.append(file_data)
 
                 # Insert or update commit
-                self.commits_col.update_one(
-                    {"sha": commit_data["sha"]},
-                    {
-                        "$set": {
-                            "repository": commit_data.get(
-                                "repository_name"
-                            ),  # Changed from repository_name
-                            "author_name": commit_data.get(
-                                "author_login"
-                            ),  # Changed from author_login
-                            "author_email": commit_data.get("author_email", ""),
-                            "message": commit_data.get("message"),
-                            "date": datetime.fromisoformat(
-                                commit_data["committed_at"].replace("Z", "+00:00")
-                            ),  # Changed from committed_at
-                            "additions": commit_data.get("additions", 0),
-                            "deletions": commit_data.get("deletions", 0),
-                            "total_changes": commit_data.get("additions", 0)
-                            + commit_data.get("deletions", 0),
-                            "files": files,
-                            "url": commit_data.get("url"),
-                            "verified": True,
-                            "collected_at": datetime.utcnow(),
-                        }
-                    },
-                    upsert=True,
-                )
-                saved_count += 1
+                commit_doc = {
+                    "repository": commit_data.get(
+                        "repository_name"
+                    ),  # Changed from repository_name
+                    "author_name": commit_data.get(
+                        "author_login"
+                    ),  # Changed from author_login
+                    "author_email": commit_data.get("author_email", ""),
+                    "message": commit_data.get("message"),
+                    "date": datetime.fromisoformat(
+                        commit_data["committed_at"].replace("Z", "+00:00")
+                    ),  # Changed from committed_at
+                    "additions": commit_data.get("additions", 0),
+                    "deletions": commit_data.get("deletions", 0),
+                    "total_changes": commit_data.get("additions", 0)
+                    + commit_data.get("deletions", 0),
+                    "files": files,
+                    "url": commit_data.get("url"),
+                    "verified": True,
+                    "collected_at": datetime.utcnow(),
+                }
+                writer.update_one({"sha": commit_data["sha"]}, {"$set": commit_doc})
+                saved_docs.append({"sha": commit_data["sha"], **commit_doc})
             except Exception as e:
                 print(
-                    f"      ⚠️  Error saving commit {commit_data.get('sha', 'unknown')}: {e}"
+                    f"      ⚠️  Error preparing commit {commit_data.get('sha', 'unknown')}: {e}"
                 )
 
-        return saved_count
+        result = writer.flush()
+        if result.errors:
+            print(f"      ⚠️  {result.errors} commit writes failed")
+
+        self.timeline.safe_write("github_commits", saved_docs)
+        return result.operations - result.errors
 
     def _save_pull_requests(self, prs: List[Dict[str, Any]]) -> int:
         """Save pull requests to MongoDB"""
         if not prs:
             return 0
 
-        saved_count = 0
+        writer = BulkWriter(self.prs_col, batch_size=self.bulk_batch_size)
+        saved_docs = []
+        reviews_by_pr = []
         for pr_data in prs:
             try:
                 # Parse dates
@@ -468,7 +556,7 @@ class GitHubPluginMongo(DataSourcePlugin):
                         continue
 
                 # Insert or update PR
-                self.prs_col.update_one(
+                writer.update_one(
                     {
                         "repository": pr_data["repository_name"],
                         "number": pr_data["number"],
@@ -493,81 +581,112 @@ class GitHubPluginMongo(DataSourcePlugin):
                             "collected_at": datetime.utcnow(),
                         }
                     },
-                    upsert=True,
                 )
-                saved_count += 1
+                saved_docs.append(
+                    {
+                        "repository": pr_data["repository_name"],
+                        "number": pr_data["number"],
+                        "title": pr_data.get("title"),
+                        "state": pr_data.get("state"),
+                        "author": pr_data.get("author_login"),
+                        "created_at": created_at,
+                        "url": pr_data.get("url"),
+                    }
+                )
 
                 if reviews:
-                    print(
-                        f"      ✅ PR #{pr_data.get('number')}: {len(reviews)} reviews saved"
-                    )
-                    # Also save reviews to separate collection
-                    self._save_reviews(pr_data, reviews)
+                    reviews_by_pr.append((pr_data, reviews))
             except Exception as e:
-                print(f"      ⚠️  Error saving PR #{pr_data.get('number')}: {e}")
+                print(f"      ⚠️  Error preparing PR #{pr_data.get('number')}: {e}")
 
-        return saved_count
+        result = writer.flush()
+        if result.errors:
+            print(f"      ⚠️  {result.errors} pull request writes failed")
 
-    def _save_reviews(self, pr_data: Dict[str, Any], reviews: List[Dict[str, Any]]) -> int:
-        """Save reviews to separate github_reviews collection"""
-        if not reviews:
-            return 0
+        # Also save reviews to separate collection (one bulk write for all PRs)
+        if reviews_by_pr:
+            saved_reviews = self._save_reviews(reviews_by_pr)
+            print(f"      ✅ Saved {saved_reviews} reviews for {len(reviews_by_pr)} PRs")
 
-        saved_count = 0
-        repository = pr_data.get("repository_name")
-        pr_number = pr_data.get("number")
-        pr_title = pr_data.get("title")
-        pr_url = pr_data.get("url")
-        pr_author = pr_data.get("author_login")
+        self.timeline.safe_write("github_pull_requests", saved_docs)
+        CollaborationStore(self.mongo.db).safe_update(
+            pull_requests=[(doc["repository"], doc["number"]) for doc in saved_docs]
+        )
+        return result.operations - result.errors
 
-        for review in reviews:
-            try:
-                reviewer = review.get("reviewer")
-                submitted_at = review.get("submitted_at")
+    def _save_reviews(self, reviews_by_pr: List[tuple]) -> int:
+        """
+        Save reviews to separate github_reviews collection
 
-                if not reviewer or not submitted_at:
+        Args:
+            reviews_by_pr: List of (pr_data, parsed reviews) pairs
+        """
+        if not reviews_by_pr:
+            return 0
+
+        writer = BulkWriter(self.reviews_col, batch_size=self.bulk_batch_size)
+        saved_docs = []
+
+        for pr_data, reviews in reviews_by_pr:
+            repository = pr_data.get("repository_name")
+            pr_number = pr_data.get("number")
+            for review in reviews:
+                review_doc = self._build_review_doc(pr_data, review)
+                if review_doc is None:
                     continue
 
                 # Unique key: repository + pr_number + reviewer + submitted_at
-                self.reviews_col.update_one(
+                writer.update_one(
                     {
                         "repository": repository,
                         "pr_number": pr_number,
-                        "reviewer": reviewer,
-                        "submitted_at": submitted_at,
-                    },
-                    {
-                        "$set": {
-                            "repository": repository,
-                            "pr_number": pr_number,
-                            "pr_title": pr_title,
-                            "pr_url": pr_url,
-                            "pr_author": pr_author,
-                            "reviewer": reviewer,
-                            "state": review.get("state", "COMMENTED"),
-                            "submitted_at": submitted_at,
-                            "body": review.get("body", "") or "",
-                            "comment_path": review.get("comment_path"),
-                            "comment_line": review.get("comment_line"),
-                            "collected_at": datetime.utcnow(),
-                        }
+                        "reviewer": review_doc["reviewer"],
+                        "submitted_at": review_doc["submitted_at"],
                     },
-                    upsert=True,
-                )
-                saved_count += 1
-            except Exception as e:
-                print(
-                    f"      ⚠️  Error saving review by {review.get('reviewer', 'unknown')}: {e}"
+                    {"$set": review_doc},
                 )
+                saved_docs.append(review_doc)
+
+        result = writer.flush()
+        if result.errors:
+            print(f"      ⚠️  {result.errors} review writes failed")
+
+        self.timeline.safe_write("github_reviews", saved_docs)
+        return result.operations - result.errors
+
+    @staticmethod
+    def _build_review_doc(
+        pr_data: Dict[str, Any], review: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Build a github_reviews document (None if reviewer/date missing)"""
+        reviewer = review.get("reviewer")
+        submitted_at = review.get("submitted_at")
+
+        if not reviewer or not submitted_at:
+            return None
 
-        return saved_count
+        return {
+            "repository": pr_data.get("repository_name"),
+            "pr_number": pr_data.get("number"),
+            "pr_title": pr_data.get("title"),
+            "pr_url": pr_data.get("url"),
+            "pr_author": pr_data.get("author_login"),
+            "reviewer": reviewer,
+            "state": review.get("state", "COMMENTED"),
+            "submitted_at": submitted_at,
+            "body": review.get("body", "") or "",
+            "comment_path": review.get("comment_path"),
+            "comment_line": review.get("comment_line"),
+            "collected_at": datetime.utcnow(),
+        }
 
     def _save_issues(self, issues: List[Dict[str, Any]]) -> int:
         """Save issues to MongoDB"""
         if not issues:
             return 0
 
-        saved_count = 0
+        writer = BulkWriter(self.issues_col, batch_size=self.bulk_batch_size)
+        saved_keys = []
         for issue_data in issues:
             try:
                 # Parse dates
@@ -583,7 +702,7 @@ class GitHubPluginMongo(DataSourcePlugin):
                 )
 
                 # Insert or update issue
-                self.issues_col.update_one(
+                writer.update_one(
                     {
                         "repository": issue_data[
                             "repository_name"
@@ -606,13 +725,14 @@ class GitHubPluginMongo(DataSourcePlugin):
                             "collected_at": datetime.utcnow(),
                         }
                     },
-                    upsert=True,
                 )
-                saved_count += 1
+                saved_keys.append((issue_data["repository_name"], issue_data["number"]))
             except Exception as e:
-                print(f"      ⚠️  Error saving issue #{issue_data.get('number')}: {e}")
+                print(f"      ⚠️  Error preparing issue #{issue_data.get('number')}: {e}")
 
-        return saved_count
+        result = writer.flush()
+        CollaborationStore(self.mongo.db).safe_update(issues=saved_keys)
+        return result.operations - result.errors
 
     def get_member_mapping(self) -> Dict[str, str]:
         """
@@ -750,6 +870,7 @@ class GitHubPluginMongo(DataSourcePlugin):
             repo_info = f" (repo: {variables['name']})"
 
         for attempt in range(1, retries + 1):
+            self.rate_limiter.acquire()
             try:
                 response = requests.post(
                     self.GRAPHQL_ENDPOINT,
@@ -764,6 +885,16 @@ class GitHubPluginMongo(DataSourcePlugin):
                 if not response.ok:
                     status = response.status_code
 
+                    # Secondary rate limit: GitHub asks us to back off explicitly.
+                    # Every worker pauses, not just this one (acquire waits it out)
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    if status in [403, 429] and retry_after is not None and attempt < retries:
+                        print(
+                            f"\n         ⚠️  GitHub secondary rate limit{repo_info} (attempt {attempt}/{retries}). Pausing requests for {retry_after:.0f}s..."
+                        )
+                        self.rate_limiter.pause(retry_after)
+                        continue
+
                     if status in [502, 503, 504] and attempt < retries:
                         wait_time = min(2 ** (attempt - 1) * 2, 30)
                         print(
@@ -782,7 +913,10 @@ class GitHubPluginMongo(DataSourcePlugin):
                         f"\n         ⚠️  GraphQL errors{repo_info}: {result['errors']}"
                     )
 
-                return result.get("data")
+                data = result.get("data")
+                if data:
+                    self.rate_limiter.update(data.get("rateLimit"))
+                return data
 
             except requests.exceptions.RequestException as e:
                 if attempt < retries:
@@ -1009,6 +1143,11 @@ class GitHubPluginMongo(DataSourcePlugin):
 
         query = """
             query getOrgPRs($searchQuery: String!, $cursor: String) {
+                rateLimit {
+                    remaining
+                    resetAt
+                    cost
+                }
                 search(query: $searchQuery, type: ISSUE, first: 100, after: $cursor) {
                     nodes {
                         ... on PullRequest {
@@ -1105,6 +1244,11 @@ class GitHubPluginMongo(DataSourcePlugin):
         """Get reviews and review comments for a specific pull request"""
         query = """
             query getPRReviews($owner: String!, $repo: String!, $prNumber: Int!, $cursor: String, $commentsCursor: String) {
+                rateLimit {
+                    remaining
+                    resetAt
+                    cost
+                }
                 repository(owner: $owner, name: $repo) {
                     pullRequest(number: $prNumber) {
                         reviews(first: 100, after: $cursor) {
@@ -1258,6 +1402,11 @@ class GitHubPluginMongo(DataSourcePlugin):
 
         query = """
             query getOrgIssues($searchQuery: String!, $cursor: String) {
+                rateLimit {
+                    remaining
+                    resetAt
+                    cost
+                }
                 search(query: $searchQuery, type: ISSUE, first: 100, after: $cursor) {
                     nodes {
                         ... on Issue {
@@ -1325,7 +1474,36 @@ class GitHubPluginMongo(DataSourcePlugin):
         start_date: datetime,
         end_date: datetime,
     ) -> List[Dict[str, Any]]:
-        """Get commits for all members"""
+        """
+        Get commits for all members
+
+        Each active repository is crawled once (all branches) and commits are
+        attributed to every member in a single pass, instead of re-downloading
+        the same branch histories per member. Repositories are crawled
+        concurrently; GraphQL calls are paced by ``self.rate_limiter``.
+        """
+        all_commits = []
+        for _, repo_commits, mark in self._iter_member_commits(
+            members, repositories, start_date, end_date
+        ):
+            all_commits.extend(repo_commits)
+            # Committed by collect_data once the commits are saved
+            self.checkpoints.stage_mark(mark)
+        return all_commits
+
+    def _iter_member_commits(
+        self,
+        members: List[Dict[str, Any]],
+        repositories: List[Dict[str, Any]],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> Iterator[Tuple[str, List[Dict[str, Any]], CheckpointMark]]:
+        """
+        Yield ``(repo_name, commits, checkpoint mark)`` per crawled repository
+
+        Repositories are yielded as their crawl completes; failed ones are
+        recorded in ``self.problematic_repos`` and not yielded.
+        """
         # Ensure start_date has timezone info for comparison
         from datetime import timezone
 
@@ -1342,9 +1520,12 @@ class GitHubPluginMongo(DataSourcePlugin):
             >= start_date
         ]
 
-        print(
-            f"   📊 Checking {len(active_repos)} active repositories (pushed during collection period)"
-        )
+        # GitHub login (lowercase) -> login as configured for the member
+        member_logins = {
+            member["login"].lower(): member["login"]
+            for member in members
+            if member.get("login")
+        }
 
         # Use a wider lookback for the commit query (14 days).
         # Commits may have been authored days ago but pushed recently.
@@ -1352,87 +1533,107 @@ class GitHubPluginMongo(DataSourcePlugin):
         # and SHA-based upsert prevents duplicates.
         commit_since = min(start_date, end_date - timedelta(days=14))
 
-        all_commits = []
-
-        for member in members:
-            member_login = member.get("login")
-            if not member_login:
-                continue
-
-            print(f"\n   👤 Collecting commits for {member_login}...")
-            member_commits = self._get_member_commits(
-                member_login, active_repos, commit_since, end_date
-            )
-
-            if member_commits:
-                all_commits.extend(member_commits)
-                print(f"      ✅ Found {len(member_commits)} commits")
-
-            time.sleep(0.5)
-
-        if self.problematic_repos:
+        # Skip repositories that have not been pushed since a previous crawl
+        # that already covered this lookback window
+        changed_repos = [
+            repo for repo in active_repos if self._repo_changed(repo, commit_since)
+        ]
+        if len(changed_repos) < len(active_repos):
             print(
-                f"\n   ⚠️  Skipped {len(self.problematic_repos)} problematic repositories:"
+                f"   ⏭️  {len(active_repos) - len(changed_repos)} repositories unchanged since last checkpoint"
             )
-            for repo in sorted(self.problematic_repos):
-                print(f"      • {repo}")
+        active_repos = changed_repos
 
-        return all_commits
-
-    def _get_member_commits(
-        self,
-        member_login: str,
-        repositories: List[Dict[str, Any]],
-        start_date: datetime,
-        end_date: datetime,
-    ) -> List[Dict[str, Any]]:
-        """Get commits for a specific member across all repositories"""
-        all_commits = []
-
-        for idx, repo in enumerate(repositories, 1):
-            repo_name = repo["name"]
+        print(
+            f"   📊 Crawling {len(active_repos)} active repositories for {len(member_logins)} members "
+            f"({self.max_concurrent_repos} concurrent)"
+        )
 
-            if repo_name in self.problematic_repos:
-                print(f"      ⏭️  Skipping {repo_name} (known issue)")
-                continue
+        if not active_repos or not member_logins:
+            return
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_repos) as executor:
+            futures = {
+                executor.submit(
+                    self._get_repo_commits,
+                    repo["name"],
+                    member_logins,
+                    commit_since,
+                    end_date,
+                ): repo["name"]
+                for repo in active_repos
+            }
 
-            try:
-                print(
-                    f"      📂 [{idx}/{len(repositories)}] Checking {repo_name}...",
-                    end="",
-                    flush=True,
-                )
+            pushed_at = {repo["name"]: repo.get("pushedAt") for repo in active_repos}
 
-                repo_commits = self._get_repo_commits(
-                    repo_name, member_login, start_date, end_date
-                )
+            for idx, future in enumerate(as_completed(futures), 1):
+                repo_name = futures[future]
+                try:
+                    repo_commits = future.result()
+                except Exception as e:
+                    print(
+                        f"      ❌ [{idx}/{len(active_repos)}] Failed to fetch commits from {repo_name}: {e}"
+                    )
+                    self.problematic_repos.add(repo_name)
+                    continue
 
                 if repo_commits:
-                    all_commits.extend(repo_commits)
-                    print(f" ✅ {len(repo_commits)} commits")
+                    print(
+                        f"      📂 [{idx}/{len(active_repos)}] {repo_name}: ✅ {len(repo_commits)} commits"
+                    )
                 else:
-                    print(f" - no commits")
+                    print(f"      📂 [{idx}/{len(active_repos)}] {repo_name}: - no commits")
 
-                time.sleep(0.1)
+                yield repo_name, repo_commits, CheckpointMark(
+                    repo_name,
+                    etag=pushed_at[repo_name],
+                    timestamp=end_date,
+                    extra={"covered_since": as_utc(commit_since)},
+                )
 
-            except Exception as e:
-                print(f" ❌ Error")
-                print(f"         ⚠️  Failed to fetch commits from {repo_name}: {e}")
-                self.problematic_repos.add(repo_name)
-                continue
+        if self.problematic_repos:
+            print(
+                f"\n   ⚠️  Skipped {len(self.problematic_repos)} problematic repositories:"
+            )
+            for repo in sorted(self.problematic_repos):
+                print(f"      • {repo}")
 
-        return all_commits
+    def _repo_changed(self, repo: Dict[str, Any], since: datetime) -> bool:
+        """True unless the repository's checkpoint shows an identical pushedAt
+        and a crawl window that already reached back to ``since``"""
+        checkpoint = self.checkpoints.get(repo["name"])
+        if not checkpoint or checkpoint.get("etag") != repo.get("pushedAt"):
+            return True
+        covered_since = checkpoint.get("covered_since")
+        return covered_since is None or as_utc(covered_since) > as_utc(since)
 
     def _get_repo_commits(
         self,
         repo_name: str,
-        member_login: str,
+        member_logins: Dict[str, str],
         start_date: datetime,
         end_date: datetime,
     ) -> List[Dict[str, Any]]:
-        """Get commits from a repository for a specific member"""
+        """
+        Get member commits from every branch of a repository
+
+        Args:
+            repo_name: Repository name (without org)
+            member_logins: Lowercase GitHub login -> member login
+            start_date: History lower bound (timezone-aware)
+            end_date: History upper bound (timezone-aware)
+
+        Returns:
+            Commits authored by any of the members, de-duplicated by SHA across
+            branches (the first branch seen, most recently updated, is kept)
+        """
         query = """
             query RepoCommits($owner: String!, $name: String!, $sinceDate: GitTimestamp!, $cursor: String) {
+                rateLimit {
+                    remaining
+                    resetAt
+                    cost
+                }
                 repository(owner: $owner, name: $name) {
                     refs(refPrefix: "refs/heads/", first: 100, after: $cursor, orderBy: {field: TAG_COMMIT_DATE, direction: DESC}) {
                         nodes {
@@ -1471,6 +1672,7 @@ class GitHubPluginMongo(DataSourcePlugin):
         """
 
         all_commits = []
+        seen_shas = set()
         has_next_page = True
         cursor = None
         branches_checked = 0
@@ -1497,64 +1699,49 @@ class GitHubPluginMongo(DataSourcePlugin):
             for branch in refs["nodes"]:
                 branches_checked += 1
 
-                if not branch.get("target"):
-                    continue
-
-                target = branch["target"]
-
-                branch_last_commit_date_str = target.get("committedDate")
-                if not branch_last_commit_date_str:
-                    continue
-
-                branch_last_commit_date = datetime.fromisoformat(
-                    branch_last_commit_date_str.replace("Z", "+00:00")
-                )
-
-                # Don't skip branches based on last commit date - check all branches
-                # The history query already filters by sinceDate, so we don't need this check
-                # This ensures we don't miss branches that had recent activity but older last commit
-                # However, we can still use it as an optimization hint
-                # Only skip if the branch is clearly inactive (last commit is way before start_date)
-                # But allow branches that might have activity in the range
-
-                if not target.get("history"):
+                target = branch.get("target")
+                if not target or not target.get("history"):
                     continue
 
-                commits = target["history"]["nodes"]
+                for commit in target["history"]["nodes"]:
+                    sha = commit["oid"]
+                    if sha in seen_shas:
+                        continue
+                    seen_shas.add(sha)
 
-                for commit in commits:
-                    author_user = commit.get("author", {}).get("user")
+                    author_user = (commit.get("author") or {}).get("user")
                     if not author_user:
                         continue
 
-                    commit_login = author_user.get("login", "").lower()
+                    member_login = member_logins.get(
+                        (author_user.get("login") or "").lower()
+                    )
+                    if not member_login:
+                        continue
+
                     commit_date = datetime.fromisoformat(
                         commit["committedDate"].replace("Z", "+00:00")
                     )
+                    if not start_date <= commit_date <= end_date:
+                        continue
 
-                    if (
-                        commit_login == member_login.lower()
-                        and start_date <= commit_date <= end_date
-                    ):
-                        commit_data = {
-                            "sha": commit["oid"],
-                            "message": commit["message"],
-                            "url": commit["url"],
-                            "committed_at": commit["committedDate"],
-                            "author_login": member_login,
-                            "repository_name": repo_name,
-                            "additions": commit.get("additions", 0),
-                            "deletions": commit.get("deletions", 0),
-                            "changed_files": commit.get("changedFiles", 0),
-                            "branch": branch["name"],
-                        }
+                    commit_data = {
+                        "sha": sha,
+                        "message": commit["message"],
+                        "url": commit["url"],
+                        "committed_at": commit["committedDate"],
+                        "author_login": member_login,
+                        "repository_name": repo_name,
+                        "additions": commit.get("additions", 0),
+                        "deletions": commit.get("deletions", 0),
+                        "changed_files": commit.get("changedFiles", 0),
+                        "branch": branch["name"],
+                    }
 
-                        if self.include_diff:
-                            commit_data["files"] = self._get_commit_files(
-                                repo_name, commit["oid"]
-                            )
+                    if self.include_diff:
+                        commit_data["files"] = self._get_commit_files(repo_name, sha)
 
-                        all_commits.append(commit_data)
+                    all_commits.append(commit_data)
 
             has_next_page = refs["pageInfo"]["hasNextPage"]
             cursor = refs["pageInfo"]["endCursor"]
@@ -6,7 +6,7 @@ Requires Google Workspace Admin privileges.
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Any, Dict, Iterator, List, Optional
 import os
 import pickle
 from pathlib import Path
@@ -16,6 +16,9 @@ from pymongo.errors import DuplicateKeyError
 from src.plugins.base import DataSourcePlugin
 from src.utils.logger import get_logger
 from src.core.mongo_manager import MongoDBManager
+from src.core.activity_timeline import ActivityTimelineWriter
+from src.core.bulk_writer import DEFAULT_BATCH_SIZE, BulkWriter
+from src.core.checkpoints import CheckpointMark, CheckpointStore, resume_from
 from src.models.mongo_models import DriveActivity, DriveDocument, DriveFolder
 
 # Google API imports (lazy load to avoid import errors if not installed)
@@ -123,6 +126,7 @@ class GoogleDrivePluginMongo(DataSourcePlugin):
         self.config = config or {}
         self.mongo = mongo_manager
         self.logger = get_logger(__name__)
+        self.bulk_batch_size = self.config.get('bulk_batch_size', DEFAULT_BATCH_SIZE)
         
         # Set up paths
         base_path = Path(__file__).parent.parent.parent
@@ -166,6 +170,11 @@ class GoogleDrivePluginMongo(DataSourcePlugin):
         else:
             self.db = None
             self.collections = {}
+        
+        # Per-user high-water marks for the activity feed
+        self.checkpoints = CheckpointStore(self.db, "drive", enabled=self.config.get('use_checkpoints', False))
+        # One writer per run: member and project lookups are loaded once
+        self.timeline = ActivityTimelineWriter(self.db) if self.db is not None else None
     
     def get_source_name(self) -> str:
         """Return the name of this data source"""
@@ -253,14 +262,62 @@ class GoogleDrivePluginMongo(DataSourcePlugin):
         if not end_date:
             end_date = datetime.now(tz=pytz.UTC)
         
-        start_time = start_date.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+        all_activities = []
+        folders = []
+        for record in self.iter_records(start_date, end_date):
+            if isinstance(record, CheckpointMark):
+                # Committed in save_data once the activities are stored
+                self.checkpoints.stage_mark(record)
+                continue
+            kind, item = record
+            if kind == 'activity':
+                all_activities.append(item)
+            else:
+                folders.append(item)
+        
+        daily_edit_summaries = sum(1 for a in all_activities if a['event_name'] == 'edit_summary')
+        self.logger.info(f"✅ Final count: {len(all_activities)} Drive activities")
+        self.logger.info(f"   - Regular activities: {len(all_activities) - daily_edit_summaries}")
+        self.logger.info(f"   - Daily edit summaries: {daily_edit_summaries}")
+        
+        return [{
+            'activities': all_activities,
+            'folders': folders,
+            'start_date': start_date.isoformat(),
+            'end_date': end_date.isoformat(),
+            'user_count': len(self.target_users) if self.target_users else 1
+        }]
+    
+    def iter_records(
+        self, 
+        start_date: Optional[datetime] = None, 
+        end_date: Optional[datetime] = None
+    ) -> Iterator[Any]:
+        """
+        Stream Google Drive records: ``activity`` and ``folder``
+        
+        Non-edit events are yielded as they are read. Edit events are
+        summarized per day: the Reports API returns activities newest first,
+        so a day's summaries are complete (and yielded) once the feed moves
+        on to an earlier day or the user is done. Folders are derived from all
+        activities and yielded at the end. A ``CheckpointMark`` follows each
+        fully collected user.
+        """
+        if not self.service:
+            if not self.authenticate():
+                return
+        
+        # Calculate date range (always use UTC)
+        if not start_date:
+            start_date = datetime.now(tz=pytz.UTC) - timedelta(days=self.days_to_collect)
+        if not end_date:
+            end_date = datetime.now(tz=pytz.UTC)
         
         self.logger.info(
             f"📅 Collecting Drive activities from {start_date.date()} to {end_date.date()}"
         )
         
-        activities = []
-        edit_activities = []  # Collect edit events separately for daily summary
+        folders = {}
         
         # Collect for each target user, or all users if none specified
         users_to_query = self.target_users if self.target_users else ['all']
@@ -268,6 +325,18 @@ class GoogleDrivePluginMongo(DataSourcePlugin):
         for user_key in users_to_query:
             self.logger.info(f"🔍 Querying activities for: {user_key}")
             
+            # Edit events are stored as per-day summaries, so resume from the
+            # start of the checkpoint's day to rebuild that day's counts in full
+            user_start = resume_from(start_date, self.checkpoints.get(user_key))
+            if user_start != start_date:
+                user_start = max(start_date, user_start.replace(hour=0, minute=0, second=0, microsecond=0))
+                self.logger.info(f"   ↪️  Resuming from checkpoint: {user_start.isoformat()}")
+            start_time = user_start.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+            latest_seen = None
+            collected = 0
+            edit_day = None
+            edit_activities = []  # Edit events of edit_day, summarized when the day is complete
+            
             try:
                 page_token = None
                 while True:
@@ -283,89 +352,87 @@ class GoogleDrivePluginMongo(DataSourcePlugin):
                     
                     results = self.service.activities().list(**request_params).execute()
                     
-                    if 'items' in results:
-                        for item in results['items']:
-                            actor_email = item.get('actor', {}).get('email', 'Unknown')
-                            timestamp_str = item.get('id', {}).get('time', '')
-                            timestamp = self._parse_timestamp(timestamp_str)
+                    for item in results.get('items', []):
+                        actor_email = item.get('actor', {}).get('email', 'Unknown')
+                        timestamp_str = item.get('id', {}).get('time', '')
+                        timestamp = self._parse_timestamp(timestamp_str)
+                        if timestamp_str and (latest_seen is None or timestamp > latest_seen):
+                            latest_seen = timestamp
+                        
+                        # Process events
+                        for event in item.get('events', []):
+                            event_name = event.get('name', '')
                             
-                            # Process events
-                            events = item.get('events', [])
-                            for event in events:
-                                event_name = event.get('name', '')
-                                
-                                # Skip excluded events (noise reduction)
-                                if event_name in self.EXCLUDE_EVENTS:
-                                    continue
-                                
-                                doc_info = self._extract_doc_info(event)
-                                
-                                # For edit events, collect separately for daily summary
-                                if event_name == 'edit':
-                                    edit_activities.append({
-                                        'timestamp': timestamp,
-                                        'user_email': actor_email,
-                                        'action': self.ACTIVITY_MAP.get(event_name, event_name),
-                                        'event_name': event_name,
-                                        'doc_title': doc_info['title'],
-                                        'doc_type': doc_info['type'],
-                                        'doc_id': doc_info['id'],
-                                        'raw_event': str(event)
-                                    })
-                                else:
-                                    # Non-edit events are stored as-is
-                                    activities.append({
-                                        'timestamp': timestamp,
-                                        'user_email': actor_email,
-                                        'action': self.ACTIVITY_MAP.get(event_name, event_name),
-                                        'event_name': event_name,
-                                        'doc_title': doc_info['title'],
-                                        'doc_type': doc_info['type'],
-                                        'doc_id': doc_info['id'],
-                                        'raw_event': str(event)
-                                    })
+                            # Skip excluded events (noise reduction)
+                            if event_name in self.EXCLUDE_EVENTS:
+                                continue
+                            
+                            doc_info = self._extract_doc_info(event)
+                            activity = {
+                                'timestamp': timestamp,
+                                'user_email': actor_email,
+                                'action': self.ACTIVITY_MAP.get(event_name, event_name),
+                                'event_name': event_name,
+                                'doc_title': doc_info['title'],
+                                'doc_type': doc_info['type'],
+                                'doc_id': doc_info['id'],
+                                'raw_event': str(event)
+                            }
+                            collected += 1
+                            
+                            # Non-edit events are stored as-is
+                            if event_name != 'edit':
+                                self._track_folder(folders, activity)
+                                yield 'activity', activity
+                                continue
+                            
+                            # For edit events, collect per day for the daily summary
+                            day = timestamp.date()
+                            if edit_day is not None and day != edit_day:
+                                for summary in self._summarize_edit_events(edit_activities):
+                                    self._track_folder(folders, summary)
+                                    yield 'activity', summary
+                                edit_activities = []
+                            edit_day = day
+                            edit_activities.append(activity)
                     
                     # Progress
-                    total_collected = len(activities) + len(edit_activities)
-                    if total_collected % 500 == 0 and total_collected > 0:
-                        self.logger.info(f"  Collected {len(activities)} activities + {len(edit_activities)} edit events...")
+                    if collected % 500 == 0 and collected > 0:
+                        self.logger.info(f"  Collected {collected} activities and edit events...")
                     
                     # Next page
                     page_token = results.get('nextPageToken')
                     if not page_token:
                         break
-                        
+                
+                completed = True
             except Exception as e:
+                completed = False
                 self.logger.error(f"❌ Error collecting for {user_key}: {str(e)}")
                 if "forbidden" in str(e).lower():
                     self.logger.error(
                         "⚠️  Permission error: Ensure you're using a Google Workspace "
                         "Admin account and Admin SDK API is enabled"
                     )
-        
-        # Summarize edit events by day + user + document
-        self.logger.info(f"\n📊 Summarizing {len(edit_activities)} edit events into daily summaries...")
-        daily_edit_summaries = self._summarize_edit_events(edit_activities)
-        self.logger.info(f"   → Reduced to {len(daily_edit_summaries)} daily edit summaries")
-        
-        # Combine activities with daily edit summaries
-        all_activities = activities + daily_edit_summaries
-        
-        self.logger.info(f"✅ Final count: {len(all_activities)} Drive activities")
-        self.logger.info(f"   - Regular activities: {len(activities)}")
-        self.logger.info(f"   - Daily edit summaries: {len(daily_edit_summaries)}")
+            
+            for summary in self._summarize_edit_events(edit_activities):
+                self._track_folder(folders, summary)
+                yield 'activity', summary
+            
+            if completed and latest_seen:
+                yield CheckpointMark(user_key, timestamp=latest_seen)
         
         # Extract folder information from activities
         self.logger.info("\n📁 Extracting folder information from activities...")
-        folders = self._extract_folders_from_activities(all_activities)
-        
-        return [{
-            'activities': all_activities,
-            'folders': folders,
-            'start_date': start_date.isoformat(),
-            'end_date': end_date.isoformat(),
-            'user_count': len(users_to_query)
-        }]
+        for folder in self._format_folders(folders):
+            yield 'folder', folder
+    
+    def record_writers(self) -> Dict[str, Any]:
+        """Writers for :meth:`iter_records`"""
+        return {
+            'activity': self._save_activities,
+            'folder': self._save_folders,
+        }
     
     def _parse_timestamp(self, timestamp_str: str) -> datetime:
         """Parse RFC3339 timestamp to datetime"""
@@ -475,46 +542,53 @@ class GoogleDrivePluginMongo(DataSourcePlugin):
         Extract unique folder information from activity logs
         """
         folders_dict = {}
-        
         for activity in activities:
-            if activity.get('doc_type') != '폴더':
-                continue
-            
-            folder_id = activity.get('doc_id')
-            folder_name = activity.get('doc_title')
-            
-            if not folder_id or not folder_name:
-                continue
-            
-            if folder_id not in folders_dict:
-                folders_dict[folder_id] = {
-                    'folder_id': folder_id,
-                    'folder_name': folder_name,
-                    'parent_id': None,
-                    'project_key': None,
-                    'created_by': activity['user_email'],
-                    'created_time': activity['timestamp'],
-                    'modified_time': activity['timestamp'],
-                    'members': set()
-                }
-            else:
-                folder = folders_dict[folder_id]
-                if activity['timestamp'] > folder['modified_time']:
-                    folder['modified_time'] = activity['timestamp']
-            
-            # Track members
-            user_email = activity['user_email']
-            if '@tokamak.network' in user_email:
-                folders_dict[folder_id]['members'].add(user_email)
-        
-        # Convert to list and format members
+            self._track_folder(folders_dict, activity)
+        return self._format_folders(folders_dict)
+    
+    def _track_folder(self, folders_dict: Dict[str, Dict[str, Any]], activity: Dict[str, Any]) -> None:
+        """Add a folder activity to ``folders_dict`` (folder_id -> folder)"""
+        if activity.get('doc_type') != '폴더':
+            return
+        
+        folder_id = activity.get('doc_id')
+        folder_name = activity.get('doc_title')
+        
+        if not folder_id or not folder_name:
+            return
+        
+        if folder_id not in folders_dict:
+            folders_dict[folder_id] = {
+                'folder_id': folder_id,
+                'folder_name': folder_name,
+                'parent_id': None,
+                'project_key': None,
+                'created_by': activity['user_email'],
+                'created_time': activity['timestamp'],
+                'modified_time': activity['timestamp'],
+                'members': set()
+            }
+        else:
+            folder = folders_dict[folder_id]
+            if activity['timestamp'] > folder['modified_time']:
+                folder['modified_time'] = activity['timestamp']
+        
+        # Track members
+        user_email = activity['user_email']
+        if '@tokamak.network' in user_email:
+            folders_dict[folder_id]['members'].add(user_email)
+    
+    def _format_folders(self, folders_dict: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Convert tracked folders to a list with formatted members"""
         folders = []
         for folder in folders_dict.values():
-            folder['members'] = [
-                {'email': email, 'role': 'user', 'permission_id': None}
-                for email in sorted(folder['members'])
-            ]
-            folders.append(folder)
+            folders.append({
+                **folder,
+                'members': [
+                    {'email': email, 'role': 'user', 'permission_id': None}
+                    for email in sorted(folder['members'])
+                ],
+            })
         
         self.logger.info(f"✅ Extracted {len(folders)} unique folders from activities")
         return folders
@@ -523,11 +597,23 @@ class GoogleDrivePluginMongo(DataSourcePlugin):
         """Save collected Google Drive data to MongoDB"""
         print("\n8️⃣ Saving to MongoDB...")
         
-        # Save activities
+        activities = collected_data.get('activities', [])
+        if activities and self._save_activities(activities) == len(activities):
+            self.checkpoints.commit()
+        
+        self._save_folders(collected_data.get('folders', []))
+    
+    def _save_activities(self, activities: List[Dict[str, Any]]) -> int:
+        """
+        Upsert activities by activity_id
+        
+        Returns:
+            Number of activities saved (duplicates count as saved)
+        """
         activities_to_save = []
         import hashlib
         
-        for activity in collected_data.get('activities', []):
+        for activity in activities:
             # Generate unique activity_id using hash of raw_event
             # This ensures each unique activity (even with same timestamp/user/doc) gets a unique ID
             raw_event_str = activity.get('raw_event', '')
@@ -556,103 +642,30 @@ class GoogleDrivePluginMongo(DataSourcePlugin):
             
             activities_to_save.append(activity_doc)
         
-        if activities_to_save:
-            try:
-                # Use bulk_write with upsert to handle duplicates gracefully
-                from pymongo import UpdateOne
-                from pymongo.errors import BulkWriteError
-                batch_size = 1000
-                total = len(activities_to_save)
-                saved_count = 0
-                updated_count = 0
-                skipped_count = 0
-                
-                for i in range(0, total, batch_size):
-                    batch = activities_to_save[i:i+batch_size]
-                    try:
-                        # Create UpdateOne operations for each activity (upsert)
-                        operations = [
-                            UpdateOne(
-                                {'activity_id': activity['activity_id']},
-                                {'$set': activity},
-                                upsert=True
-                            )
-                            for activity in batch
-                        ]
-                        
-                        result = self.collections["activities"].bulk_write(operations, ordered=False)
-                        saved_count += result.upserted_count
-                        updated_count += result.modified_count
-                        
-                        if (i + batch_size) % 10000 == 0:
-                            print(f"   📊 Progress: {saved_count + updated_count}/{total} activities processed...")
-                    except BulkWriteError as bwe:
-                        # Handle bulk write errors (duplicates are expected)
-                        # Count successful operations
-                        saved_count += bwe.details.get('nInserted', 0) + bwe.details.get('nUpserted', 0)
-                        updated_count += bwe.details.get('nModified', 0)
-                        
-                        # Count duplicate key errors (these are expected and can be ignored)
-                        write_errors = bwe.details.get('writeErrors', [])
-                        duplicate_errors = [e for e in write_errors if e.get('code') == 11000]
-                        skipped_count += len(duplicate_errors)
-                        
-                        # If there are non-duplicate errors, log them
-                        other_errors = [e for e in write_errors if e.get('code') != 11000]
-                        if other_errors:
-                            print(f"   ⚠️  Non-duplicate errors in batch: {len(other_errors)}")
-                            for error in other_errors[:5]:  # Show first 5
-                                print(f"      Error: {error.get('errmsg', 'Unknown error')}")
-                        
-                        # Try individual upserts for failed operations (excluding duplicates)
-                        if other_errors:
-                            failed_indices = {e.get('index') for e in other_errors}
-                            for idx in failed_indices:
-                                if idx < len(batch):
-                                    try:
-                                        activity = batch[idx]
-                                        result = self.collections["activities"].update_one(
-                                            {'activity_id': activity['activity_id']},
-                                            {'$set': activity},
-                                            upsert=True
-                                        )
-                                        if result.upserted_id:
-                                            saved_count += 1
-                                        elif result.modified_count:
-                                            updated_count += 1
-                                    except Exception as e:
-                                        print(f"   ⚠️  Error saving activity {activity.get('activity_id', 'unknown')}: {e}")
-                    except Exception as batch_error:
-                        # If batch fails with non-BulkWriteError, try individual upserts
-                        print(f"   ⚠️  Batch error, processing individually: {batch_error}")
-                        for activity in batch:
-                            try:
-                                result = self.collections["activities"].update_one(
-                                    {'activity_id': activity['activity_id']},
-                                    {'$set': activity},
-                                    upsert=True
-                                )
-                                if result.upserted_id:
-                                    saved_count += 1
-                                elif result.modified_count:
-                                    updated_count += 1
-                            except Exception as e:
-                                # Ignore duplicate key errors
-                                if 'duplicate key' in str(e).lower() or 'E11000' in str(e):
-                                    skipped_count += 1
-                                else:
-                                    print(f"   ⚠️  Error saving activity {activity.get('activity_id', 'unknown')}: {e}")
-                
-                if skipped_count > 0:
-                    print(f"   ✅ Saved {saved_count} new activities, updated {updated_count} existing activities, skipped {skipped_count} duplicates")
-                else:
-                    print(f"   ✅ Saved {saved_count} new activities, updated {updated_count} existing activities")
-            except Exception as e:
-                print(f"   ❌ Error saving activities: {e}")
+        if not activities_to_save:
+            return 0
         
-        # Save folders
+        # Upsert by activity_id in unordered bulk batches; duplicates are expected
+        with BulkWriter(self.collections["activities"], batch_size=self.bulk_batch_size) as writer:
+            for activity in activities_to_save:
+                writer.update_one({'activity_id': activity['activity_id']}, {'$set': activity})
+
+        result = writer.result
+        summary = f"   ✅ Saved {result.upserted} new activities, updated {result.modified} existing activities"
+        if result.duplicates:
+            summary += f", skipped {result.duplicates} duplicates"
+        print(summary)
+        failed = result.errors - result.duplicates
+        if failed:
+            print(f"   ⚠️  {failed} activities failed to save")
+
+        self.timeline.safe_write("drive_activities", activities_to_save)
+        return result.operations - failed
+    
+    def _save_folders(self, folders: List[Dict[str, Any]]) -> int:
+        """Upsert folders into the files collection; returns the number saved"""
         folders_to_save = []
-        for folder in collected_data.get('folders', []):
+        for folder in folders:
             folder_doc = {
                 'folder_id': folder['folder_id'],
                 'folder_name': folder['folder_name'],
@@ -666,35 +679,29 @@ class GoogleDrivePluginMongo(DataSourcePlugin):
             }
             folders_to_save.append(folder_doc)
         
-        if folders_to_save:
-            try:
-                # Save folders/files in batches
-                saved_count = 0
-                for folder_doc in folders_to_save:
-                    try:
-                        self.collections["files"].replace_one(
-                            {'file_id': folder_doc['folder_id']},  # Use file_id for consistency
-                            {
-                                'file_id': folder_doc['folder_id'],
-                                'name': folder_doc['folder_name'],
-                                'owner': folder_doc['created_by'],
-                                'mime_type': 'application/vnd.google-apps.folder',
-                                'created_time': folder_doc['created_time'],
-                                'modified_time': folder_doc['modified_time'],
-                                'parents': [folder_doc.get('parent_id')] if folder_doc.get('parent_id') else [],
-                                'permissions': folder_doc.get('members', []),
-                                'collected_at': datetime.utcnow()
-                            },
-                            upsert=True
-                        )
-                        saved_count += 1
-                    except Exception:
-                        # Skip if error on individual folder
-                        pass
-                
-                print(f"   ✅ Saved {saved_count} folders/files")
-            except Exception as e:
-                print(f"   ❌ Error saving folders: {e}")
+        if not folders_to_save:
+            return 0
+        
+        with BulkWriter(self.collections["files"], batch_size=self.bulk_batch_size) as writer:
+            for folder_doc in folders_to_save:
+                writer.replace_one(
+                    {'file_id': folder_doc['folder_id']},  # Use file_id for consistency
+                    {
+                        'file_id': folder_doc['folder_id'],
+                        'name': folder_doc['folder_name'],
+                        'owner': folder_doc['created_by'],
+                        'mime_type': 'application/vnd.google-apps.folder',
+                        'created_time': folder_doc['created_time'],
+                        'modified_time': folder_doc['modified_time'],
+                        'parents': [folder_doc.get('parent_id')] if folder_doc.get('parent_id') else [],
+                        'permissions': folder_doc.get('members', []),
+                        'collected_at': datetime.utcnow()
+                    }
+                )
+
+        saved = writer.result.operations - writer.result.errors
+        print(f"   ✅ Saved {saved} folders/files")
+        return saved
     
     def get_member_mapping(self) -> Dict[str, str]:
         """
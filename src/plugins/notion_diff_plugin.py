@@ -7,17 +7,18 @@ Tracks granular content changes in Notion pages:
 - Stores snapshots and diffs in MongoDB
 
 Collections:
-- notion_block_snapshots: Current and historical block states
+- notion_block_snapshots: Current block manifests and per-edit manifest deltas
+- notion_block_contents: Block text, stored once per distinct content hash
 - notion_comment_snapshots: Current and historical comment states  
 - notion_content_diffs: Structured diff records for activity feed
 """
 
+import asyncio
 import difflib
-import time
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass, asdict
-from notion_client import Client
+from notion_client import AsyncClient, Client
 from notion_client.errors import APIResponseError
 from pymongo import UpdateOne, DESCENDING
 from pymongo.errors import BulkWriteError
@@ -25,6 +26,16 @@ from pymongo.errors import BulkWriteError
 from src.plugins.base import DataSourcePlugin
 from src.utils.logger import get_logger
 from src.core.mongo_manager import MongoDBManager
+from src.core.activity_timeline import ActivityTimelineWriter
+from src.core.notion_snapshots import BlockSnapshotStore, block_hash
+from src.utils.notion_block_fetcher import NotionBlockFetcher, run_sync
+from src.utils.rate_limiter import AdaptiveRateLimiter
+
+# Tracked as their own pages; including them duplicates diffs of child pages
+SKIPPED_BLOCK_TYPES = ('child_page', 'child_database')
+
+# Notion reports last_edited_time at minute precision
+EDIT_TIME_MARGIN = timedelta(minutes=2)
 
 
 @dataclass
@@ -55,7 +66,13 @@ class NotionDiffPlugin(DataSourcePlugin):
         self.mongo = mongo_manager
         self.token = self.config.get('token', '')
         self.days_to_collect = self.config.get('days_to_collect', 1)
-        self.rate_limit_delay = 1.0 / self.config.get('rate_limit', 3)  # requests per second
+        
+        # Shared by all block/comment requests; adapts to 429 / Retry-After
+        self.limiter = AdaptiveRateLimiter(rate=self.config.get('rate_limit', 3))  # requests per second
+        self.max_concurrency = self.config.get('max_concurrency', 4)
+        self.page_batch_size = self.config.get('page_batch_size', 20)
+        # Reuse the previous snapshot for subtrees not edited since it was taken
+        self.skip_unchanged_subtrees = self.config.get('skip_unchanged_subtrees', False)
         
         self.client = None
         self.logger = get_logger(__name__)
@@ -70,19 +87,16 @@ class NotionDiffPlugin(DataSourcePlugin):
             "page_tracking": self.db["notion_page_tracking"],
             "users": self.db["notion_users"],
         }
+        self.timeline = ActivityTimelineWriter(self.db)
+        self.snapshots = BlockSnapshotStore(self.db)
         
         self._ensure_indexes()
     
     def _ensure_indexes(self):
         """Create necessary indexes for performance"""
         try:
-            # Block snapshots - find current blocks for a page
-            self.collections["block_snapshots"].create_index([
-                ("page_id", 1), ("block_id", 1), ("is_current", 1)
-            ])
-            self.collections["block_snapshots"].create_index([
-                ("page_id", 1), ("snapshot_time", DESCENDING)
-            ])
+            # Block snapshots - current manifest and history for a page
+            self.snapshots.ensure_indexes()
             
             # Comment snapshots
             self.collections["comment_snapshots"].create_index([
@@ -168,41 +182,54 @@ class NotionDiffPlugin(DataSourcePlugin):
         if not pages:
             return []
         
-        # Process each page
+        # Process pages in batches: blocks and comments of a batch are fetched
+        # concurrently, then each page is diffed and saved
         all_diffs = []
         
-        for i, page in enumerate(pages, 1):
-            page_id = page['id']
-            title = page.get('title', 'Untitled')
+        for batch_start in range(0, len(pages), self.page_batch_size):
+            batch = pages[batch_start:batch_start + self.page_batch_size]
+            previous = {page['id']: self.snapshots.load_head(page['id']) for page in batch}
+            fetched = run_sync(self._prefetch_pages(batch, previous))
             
-            self.logger.info(f"\n  [{i}/{len(pages)}] {title[:40]}...")
-            
-            try:
-                # Collect block diffs (pass start_date to detect new documents)
-                block_diffs = self._process_page_blocks(page, collection_start=start_date)
-                if block_diffs:
-                    all_diffs.append(block_diffs)
-                    added = len(block_diffs['changes'].get('added', []))
-                    deleted = len(block_diffs['changes'].get('deleted', []))
-                    modified = len(block_diffs['changes'].get('modified', []))
-                    self.logger.info(f"      Blocks: +{added} -{deleted} ~{modified}")
+            for i, page in enumerate(batch, batch_start + 1):
+                page_id = page['id']
+                title = page.get('title', 'Untitled')
                 
-                # Collect comment diffs
-                comment_diffs = self._process_page_comments(page)
-                if comment_diffs:
-                    all_diffs.append(comment_diffs)
-                    added = len(comment_diffs['changes'].get('added', []))
-                    deleted = len(comment_diffs['changes'].get('deleted', []))
-                    self.logger.info(f"      Comments: +{added} -{deleted}")
+                self.logger.info(f"\n  [{i}/{len(pages)}] {title[:40]}...")
                 
-                # Update tracking
-                self._update_page_tracking(page)
-                
-            except Exception as e:
-                self.logger.error(f"      ❌ Error: {e}")
-            
-            # Rate limiting
-            time.sleep(self.rate_limit_delay)
+                try:
+                    result = fetched[page_id]
+                    if isinstance(result, Exception):
+                        raise result
+                    current_blocks, raw_comments = result
+                    
+                    # Collect block diffs (pass start_date to detect new documents)
+                    block_diffs = self._process_page_blocks(
+                        page,
+                        collection_start=start_date,
+                        current_blocks=current_blocks,
+                        previous_blocks=previous[page_id][0],
+                    )
+                    if block_diffs:
+                        all_diffs.append(block_diffs)
+                        added = len(block_diffs['changes'].get('added', []))
+                        deleted = len(block_diffs['changes'].get('deleted', []))
+                        modified = len(block_diffs['changes'].get('modified', []))
+                        self.logger.info(f"      Blocks: +{added} -{deleted} ~{modified}")
+                    
+                    # Collect comment diffs
+                    comment_diffs = self._process_page_comments(page, raw_comments)
+                    if comment_diffs:
+                        all_diffs.append(comment_diffs)
+                        added = len(comment_diffs['changes'].get('added', []))
+                        deleted = len(comment_diffs['changes'].get('deleted', []))
+                        self.logger.info(f"      Comments: +{added} -{deleted}")
+                    
+                    # Update tracking
+                    self._update_page_tracking(page)
+                    
+                except Exception as e:
+                    self.logger.error(f"      ❌ Error: {e}")
         
         self.logger.info(f"\n✅ Collected {len(all_diffs)} diff records")
         return all_diffs
@@ -262,7 +289,13 @@ class NotionDiffPlugin(DataSourcePlugin):
     # Block Processing
     # =========================================================================
     
-    def _process_page_blocks(self, page: Dict, collection_start: datetime = None) -> Optional[Dict]:
+    def _process_page_blocks(
+        self,
+        page: Dict,
+        collection_start: datetime = None,
+        current_blocks: Optional[List[Dict]] = None,
+        previous_blocks: Optional[List[Dict]] = None
+    ) -> Optional[Dict]:
         """
         Fetch blocks, compare with previous snapshot, save new snapshot.
         Returns diff record if changes detected.
@@ -277,11 +310,13 @@ class NotionDiffPlugin(DataSourcePlugin):
         """
         page_id = page['id']
         
-        # Fetch current blocks
-        current_blocks = self._fetch_all_blocks(page_id)
+        # Fetch current blocks (unless prefetched by collect_data)
+        if current_blocks is None:
+            current_blocks = self._fetch_all_blocks(page_id)
         
         # Get previous snapshot
-        previous_blocks = self._get_previous_block_snapshot(page_id)
+        if previous_blocks is None:
+            previous_blocks = self._get_previous_block_snapshot(page_id)
         
         # Check if this is the first snapshot (baseline)
         is_first_snapshot = len(previous_blocks) == 0
@@ -319,7 +354,7 @@ class NotionDiffPlugin(DataSourcePlugin):
                 }
                 
                 # Save snapshot
-                self._save_block_snapshot(page_id, current_blocks, is_baseline=True)
+                self._save_block_snapshot(page_id, current_blocks, previous_blocks, is_baseline=True)
                 
                 if changes['added']:
                     diff_record = ContentDiff(
@@ -334,21 +369,21 @@ class NotionDiffPlugin(DataSourcePlugin):
                         changes=changes
                     )
                     
-                    self.collections["content_diffs"].insert_one(diff_record.to_dict())
+                    self._save_diff(diff_record)
                     return diff_record.to_dict()
                 
                 return None
             else:
                 # Existing document, first time tracking - just baseline
-                self._save_block_snapshot(page_id, current_blocks, is_baseline=True)
+                self._save_block_snapshot(page_id, current_blocks, previous_blocks, is_baseline=True)
                 self.logger.info(f"      📸 Created baseline snapshot ({len(current_blocks)} blocks)")
                 return None
         
         # Compute diff against previous snapshot
         changes = self._compute_block_diff(previous_blocks, current_blocks)
         
-        # Save new snapshot
-        self._save_block_snapshot(page_id, current_blocks)
+        # Save new snapshot (only the changed manifest entries are written)
+        self._save_block_snapshot(page_id, current_blocks, previous_blocks)
         
         # Return diff only if there are actual changes
         if changes['added'] or changes['deleted'] or changes['modified']:
@@ -365,61 +400,107 @@ class NotionDiffPlugin(DataSourcePlugin):
             )
             
             # Save to MongoDB
-            self.collections["content_diffs"].insert_one(diff_record.to_dict())
+            self._save_diff(diff_record)
             
             return diff_record.to_dict()
         
         return None
     
     def _fetch_all_blocks(self, page_id: str) -> List[Dict]:
-        """Recursively fetch all blocks from a page"""
-        blocks = []
+        """Fetch all blocks of a single page (collect_data prefetches in batches)"""
+        result = run_sync(self._prefetch_pages([{'id': page_id}], {}))[page_id]
+        if isinstance(result, Exception):
+            raise result
+        return result[0]
+    
+    async def _prefetch_pages(
+        self,
+        pages: List[Dict],
+        previous: Dict[str, Tuple[List[Dict], Optional[datetime]]]
+    ) -> Dict[str, Any]:
+        """
+        Fetch block trees and comments of several pages concurrently
         
-        def fetch_children(block_id: str, parent_id: Optional[str] = None):
-            has_more = True
-            next_cursor = None
+        Args:
+            pages: Pages with 'id'
+            previous: page_id -> (previous manifest, snapshot time)
+        
+        Returns:
+            page_id -> (blocks, raw comments), or the exception the page failed with
+        """
+        async with AsyncClient(auth=self.token) as client:
+            fetcher = NotionBlockFetcher(client, self.limiter, max_concurrency=self.max_concurrency)
+            results = await asyncio.gather(
+                *(
+                    self._prefetch_page(fetcher, page['id'], *previous.get(page['id'], ([], None)))
+                    for page in pages
+                ),
+                return_exceptions=True
+            )
+        return {page['id']: result for page, result in zip(pages, results)}
+    
+    async def _prefetch_page(
+        self,
+        fetcher: NotionBlockFetcher,
+        page_id: str,
+        previous_blocks: List[Dict],
+        snapshot_time: Optional[datetime]
+    ) -> Tuple[List[Dict], List[Dict]]:
+        """Fetch one page's blocks (breadth-first) and comments"""
+        previous_children: Dict[Optional[str], List[Dict]] = {}
+        for entry in previous_blocks:
+            previous_children.setdefault(entry.get('parent_id'), []).append(entry)
+        
+        reused = set()
+        descend = None
+        if self.skip_unchanged_subtrees and snapshot_time and previous_children:
+            cutoff = snapshot_time.replace(tzinfo=snapshot_time.tzinfo or timezone.utc) - EDIT_TIME_MARGIN
             
-            while has_more:
-                try:
-                    params = {'block_id': block_id, 'page_size': 100}
-                    if next_cursor:
-                        params['start_cursor'] = next_cursor
-                    
-                    response = self.client.blocks.children.list(**params)
-                    
-                    for block in response.get('results', []):
-                        block_type = block.get('type', '')
-                        
-                        # COMPLETELY SKIP child_page and child_database blocks
-                        # These are tracked as their own separate pages
-                        # Including them causes duplicate diffs when child pages are edited
-                        if block_type in ('child_page', 'child_database'):
-                            continue
-                        
-                        plain_text = self._extract_block_text(block)
-                        
-                        blocks.append({
-                            'block_id': block['id'],
-                            'block_type': block_type,
-                            'plain_text': plain_text,
-                            'last_edited_time': block.get('last_edited_time', ''),
-                            'parent_id': parent_id
-                        })
-                        
-                        # Recurse into children for nested content (lists, toggles, etc.)
-                        if block.get('has_children', False):
-                            time.sleep(self.rate_limit_delay)
-                            fetch_children(block['id'], block['id'])
-                    
-                    has_more = response.get('has_more', False)
-                    next_cursor = response.get('next_cursor')
-                    
-                except APIResponseError as e:
-                    self.logger.warning(f"⚠️ Error fetching blocks: {e}")
-                    break
+            def descend(block: Dict) -> bool:
+                edited = block.get('last_edited_time')
+                if block['id'] in previous_children and edited and \
+                        datetime.fromisoformat(edited.replace('Z', '+00:00')) < cutoff:
+                    reused.add(block['id'])
+                    return False
+                return True
+        
+        tree, comments = await asyncio.gather(
+            fetcher.fetch_tree(
+                page_id,
+                include=lambda b: b.get('type', '') not in SKIPPED_BLOCK_TYPES,
+                descend=descend
+            ),
+            self._list_comments(fetcher, page_id)
+        )
+        
+        blocks = []
         
-        fetch_children(page_id)
-        return blocks
+        def add_previous_subtree(parent_id: str):
+            for entry in previous_children.get(parent_id, []):
+                blocks.append(entry)
+                add_previous_subtree(entry['block_id'])
+        
+        for block, parent_id in tree:
+            plain_text = self._extract_block_text(block)
+            blocks.append({
+                'block_id': block['id'],
+                'block_type': block.get('type', ''),
+                'plain_text': plain_text,
+                'hash': block_hash(plain_text),
+                'last_edited_time': block.get('last_edited_time', ''),
+                'parent_id': parent_id
+            })
+            if block['id'] in reused:
+                add_previous_subtree(block['id'])
+        
+        return blocks, comments
+    
+    async def _list_comments(self, fetcher: NotionBlockFetcher, page_id: str) -> List[Dict]:
+        try:
+            return await fetcher.list_comments(page_id)
+        except APIResponseError:
+            # Page might not support comments
+            return []
     
     def _extract_block_text(self, block: Dict) -> str:
         """Extract plain text from a block"""
@@ -445,55 +526,61 @@ class NotionDiffPlugin(DataSourcePlugin):
         return ''.join(item.get('plain_text', '') for item in rich_text)
     
     def _get_previous_block_snapshot(self, page_id: str) -> List[Dict]:
-        """Get the previous block snapshot for comparison"""
-        cursor = self.collections["block_snapshots"].find(
-            {"page_id": page_id, "is_current": True}
-        )
-        return list(cursor)
+        """Get the current block manifest (block_id, block_type, hash) for comparison"""
+        return self.snapshots.load_current(page_id)
     
-    def _save_block_snapshot(self, page_id: str, blocks: List[Dict], is_baseline: bool = False):
-        """Save new block snapshot, marking previous as historical"""
-        snapshot_time = datetime.now(timezone.utc)
-        
-        # Mark previous blocks as not current
-        self.collections["block_snapshots"].update_many(
-            {"page_id": page_id, "is_current": True},
-            {"$set": {"is_current": False}}
-        )
-        
-        # Insert new blocks
-        if blocks:
-            documents = []
-            for block in blocks:
-                documents.append({
-                    "page_id": page_id,
-                    "block_id": block['block_id'],
-                    "block_type": block['block_type'],
-                    "plain_text": block['plain_text'],
-                    "last_edited_time": block['last_edited_time'],
-                    "parent_id": block.get('parent_id'),
-                    "snapshot_time": snapshot_time,
-                    "is_current": True,
-                    "is_baseline": is_baseline  # Mark if this is initial baseline snapshot
-                })
-            
-            try:
-                self.collections["block_snapshots"].insert_many(documents, ordered=False)
-            except BulkWriteError as e:
-                self.logger.warning(f"⚠️ Some blocks already exist: {e.details.get('nInserted', 0)} inserted")
+    def _save_block_snapshot(
+        self,
+        page_id: str,
+        blocks: List[Dict],
+        previous_blocks: Optional[List[Dict]] = None,
+        is_baseline: bool = False
+    ):
+        """Save new block snapshot as a content-addressed manifest delta"""
+        try:
+            self.snapshots.save(page_id, blocks, previous=previous_blocks, is_baseline=is_baseline)
+        except BulkWriteError as e:
+            self.logger.warning(f"⚠️ Error saving block contents: {e.details.get('writeErrors', [])[:1]}")
     
     def _compute_block_diff(
         self, 
         old_blocks: List[Dict], 
         new_blocks: List[Dict]
     ) -> Dict[str, List[Dict]]:
-        """Compute block-level differences"""
+        """
+        Compute block-level differences
+        
+        Hash-first: blocks whose content hash is unchanged are skipped without
+        loading their old text; only changed and deleted blocks are resolved
+        from notion_block_contents and run through difflib.
+        """
         old_map = {b['block_id']: b for b in old_blocks}
         new_map = {b['block_id']: b for b in new_blocks}
         
+        def content_hash(block: Dict) -> str:
+            return block.get('hash') or block_hash(block.get('plain_text', ''))
+        
+        changed_ids = [
+            block_id for block_id, new_block in new_map.items()
+            if block_id in old_map and content_hash(old_map[block_id]) != content_hash(new_block)
+        ]
+        deleted_ids = [block_id for block_id in old_map if block_id not in new_map]
+        
+        # Old text is only needed for blocks that changed or disappeared
+        old_texts = self.snapshots.load_texts(
+            old_map[block_id]['hash'] for block_id in changed_ids + deleted_ids
+            if 'plain_text' not in old_map[block_id]
+        )
+        
+        def old_text_of(block: Dict) -> str:
+            if 'plain_text' in block:
+                return block['plain_text']
+            return old_texts.get(block['hash'], '')
+        
         added = []
         deleted = []
         modified = []
+        changed = set(changed_ids)
         
         # Find added and modified
         for block_id, new_block in new_map.items():
@@ -508,10 +595,10 @@ class NotionDiffPlugin(DataSourcePlugin):
                     'block_type': new_block.get('block_type', ''),
                     'content': text
                 })
-            else:
-                # Check if modified
+            elif block_id in changed:
+                # Content changed
                 old_block = old_map[block_id]
-                old_text = old_block.get('plain_text', '')
+                old_text = old_text_of(old_block)
                 
                 if old_text != text:
                     # Content changed
@@ -526,9 +613,10 @@ class NotionDiffPlugin(DataSourcePlugin):
                     })
         
         # Find deleted
-        for block_id, old_block in old_map.items():
-            text = old_block.get('plain_text', '')
-            if block_id not in new_map and text:
+        for block_id in deleted_ids:
+            old_block = old_map[block_id]
+            text = old_text_of(old_block)
+            if text:
                 deleted.append({
                     'block_id': block_id,
                     'block_type': old_block.get('block_type', ''),
@@ -554,15 +642,15 @@ class NotionDiffPlugin(DataSourcePlugin):
     # Comment Processing
     # =========================================================================
     
-    def _process_page_comments(self, page: Dict) -> Optional[Dict]:
+    def _process_page_comments(self, page: Dict, raw_comments: Optional[List[Dict]] = None) -> Optional[Dict]:
         """
         Fetch comments, compare with previous snapshot, save new snapshot.
         Returns diff record if changes detected.
         """
         page_id = page['id']
         
-        # Fetch current comments
-        current_comments = self._fetch_comments(page_id)
+        # Fetch current comments (unless prefetched by collect_data)
+        current_comments = self._fetch_comments(page_id, raw_comments)
         
         # Get previous snapshot
         previous_comments = self._get_previous_comment_snapshot(page_id)
@@ -588,20 +676,21 @@ class NotionDiffPlugin(DataSourcePlugin):
             )
             
             # Save to MongoDB
-            self.collections["content_diffs"].insert_one(diff_record.to_dict())
+            self._save_diff(diff_record)
             
             return diff_record.to_dict()
         
         return None
     
-    def _fetch_comments(self, page_id: str) -> List[Dict]:
-        """Fetch all comments for a page"""
+    def _fetch_comments(self, page_id: str, raw_comments: Optional[List[Dict]] = None) -> List[Dict]:
+        """Fetch all comments for a page (or parse already fetched ones)"""
         comments = []
         
         try:
-            response = self.client.comments.list(block_id=page_id)
+            if raw_comments is None:
+                raw_comments = self.client.comments.list(block_id=page_id).get('results', [])
             
-            for comment in response.get('results', []):
+            for comment in raw_comments:
                 created_by = comment.get('created_by', {})
                 
                 comments.append({
@@ -719,6 +808,12 @@ class NotionDiffPlugin(DataSourcePlugin):
         except:
             return 'Unknown'
     
+    def _save_diff(self, diff_record: ContentDiff):
+        """Persist a diff record and project it onto the activity timeline"""
+        diff_doc = diff_record.to_dict()
+        self.collections["content_diffs"].insert_one(diff_doc)
+        self.timeline.safe_write("notion_content_diffs", [diff_doc])
+    
     def _update_page_tracking(self, page: Dict):
         """Update page tracking info"""
         self.collections["page_tracking"].update_one(
@@ -791,7 +886,8 @@ class NotionDiffPlugin(DataSourcePlugin):
         return {
             "tracked_pages": self.collections["page_tracking"].count_documents({}),
             "total_block_snapshots": self.collections["block_snapshots"].count_documents({}),
-            "current_blocks": self.collections["block_snapshots"].count_documents({"is_current": True}),
+            "current_blocks": self.snapshots.current_block_count(),
+            "stored_block_contents": self.db["notion_block_contents"].estimated_document_count(),
             "total_comment_snapshots": self.collections["comment_snapshots"].count_documents({}),
             "total_diffs": self.collections["content_diffs"].count_documents({}),
             "block_diffs": self.collections["content_diffs"].count_documents({"diff_type": "block"}),
@@ -10,15 +10,18 @@ Collects activity data from Notion workspace including:
 
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
-from notion_client import Client
+from notion_client import AsyncClient, Client
 from notion_client.errors import APIResponseError
 import pytz
-import time
 from pymongo.errors import DuplicateKeyError
 
 from src.plugins.base import DataSourcePlugin
 from src.utils.logger import get_logger
 from src.core.mongo_manager import MongoDBManager
+from src.core.bulk_writer import DEFAULT_BATCH_SIZE, BulkWriter
+from src.core.checkpoints import CheckpointStore, resume_from
+from src.utils.notion_block_fetcher import NotionBlockFetcher, run_sync
+from src.utils.rate_limiter import AdaptiveRateLimiter
 from src.models.mongo_models import NotionPage, NotionDatabase, NotionUser, NotionBlock
 
 
@@ -41,6 +44,12 @@ class NotionPluginMongo(DataSourcePlugin):
         self.token = self.config.get('token', '')
         self.workspace_id = self.config.get('workspace_id')
         self.days_to_collect = self.config.get('days_to_collect', 7)
+        self.bulk_batch_size = self.config.get('bulk_batch_size', DEFAULT_BATCH_SIZE)
+        
+        # Page content fetching: shared adaptive pacing, bounded concurrency
+        self.limiter = AdaptiveRateLimiter(rate=self.config.get('rate_limit', 3))  # requests per second
+        self.max_concurrency = self.config.get('max_concurrency', 4)
+        self.page_batch_size = self.config.get('page_batch_size', 20)
         
         self.client = None
         self.logger = get_logger(__name__)
@@ -57,6 +66,9 @@ class NotionPluginMongo(DataSourcePlugin):
         else:
             self.db = None
             self.collections = {}
+        
+        # High-water marks for the page and database search feeds
+        self.checkpoints = CheckpointStore(self.db, "notion", enabled=self.config.get('use_checkpoints', False))
     
     def get_source_name(self) -> str:
         """Return the name of this data source"""
@@ -138,12 +150,15 @@ class NotionPluginMongo(DataSourcePlugin):
             
             # Step 2: Search for pages
             self.logger.info("\n2️⃣ Searching pages...")
-            pages = self._search_pages(start_date)
+            pages_since = resume_from(start_date, self.checkpoints.get("pages"))
+            if pages_since != start_date:
+                self.logger.info(f"   ↪️  Resuming from checkpoint: {pages_since.isoformat()}")
+            pages = self._search_pages(pages_since)
             self.logger.info(f"   ✅ Found {len(pages)} pages")
             
             # Step 3: Fetch databases
             self.logger.info("\n3️⃣ Fetching databases...")
-            databases = self._fetch_databases(start_date)
+            databases = self._fetch_databases(resume_from(start_date, self.checkpoints.get("databases")))
             self.logger.info(f"   ✅ Found {len(databases)} databases")
             
             # Step 4: Fetch comments (embedded in pages)
@@ -153,6 +168,11 @@ class NotionPluginMongo(DataSourcePlugin):
             
             total_comments = sum(pg.get('comments_count', 0) for pg in pages_with_comments)
             
+            # Committed in save_data once the documents are stored
+            for scope, items in (("pages", pages_with_comments), ("databases", databases)):
+                if items:
+                    self.checkpoints.stage(scope, timestamp=max(item['last_edited_time'] for item in items))
+            
             self.logger.info(f"\n📊 Collection Results:")
             self.logger.info(f"   Users: {len(users)}")
             self.logger.info(f"   Pages: {len(pages_with_comments)}")
@@ -242,26 +262,19 @@ class NotionPluginMongo(DataSourcePlugin):
                         page['last_edited_time'].replace('Z', '+00:00')
                     )
                     
-                    # Safety check: skip if somehow older than start_date
-                    # (API filter should handle this, but double-check)
+                    # Results are sorted by last_edited_time (descending),
+                    # so everything after this page is older as well
                     if last_edited < start_date:
-                        pages_skipped += 1
-                        continue  # Skip this page but continue processing others
-                    
-                    # Fetch page content (full text)
-                    page_content = self._fetch_page_content(page_id)
-                    
-                    # Rate limiting: respect Notion API limit (3 req/s)
-                    # Increase delay when collecting many pages to avoid rate limits
-                    time.sleep(0.5)  # ~2 requests per second (more conservative)
+                        has_more = False
+                        break
                     
                     page_data = {
                         'id': page_id,
                         'notion_id': page_id,
                         'url': page.get('url'),
                         'title': self._extract_title(page.get('properties', {})),
-                        'content': page_content,  # Add full content
-                        'content_length': len(page_content),  # Add content length for reference
+                        'content': '',  # Filled in below (fetched concurrently)
+                        'content_length': 0,
                         'created_time': datetime.fromisoformat(page.get('created_time', '').replace('Z', '+00:00')),
                         'last_edited_time': last_edited,
                         'created_by': self._extract_user_info(page.get('created_by', {})),
@@ -278,8 +291,16 @@ class NotionPluginMongo(DataSourcePlugin):
                 has_more = response.get('has_more', False) and has_more
                 next_cursor = response.get('next_cursor')
             
+            # Fetch page content (full text) for all pages, a batch at a time
+            for batch_start in range(0, len(pages), self.page_batch_size):
+                batch = pages[batch_start:batch_start + self.page_batch_size]
+                contents = run_sync(self._fetch_page_contents([pg['id'] for pg in batch]))
+                for page_data in batch:
+                    page_data['content'] = contents.get(page_data['id'], '')
+                    page_data['content_length'] = len(page_data['content'])  # For reference
+            
             if pages_skipped > 0:
-                self.logger.info(f"   ⚠️  Skipped {pages_skipped} pages (older than start_date despite API filter)")
+                self.logger.info(f"   ⚠️  Skipped {pages_skipped} pages without id")
             self.logger.info(f"   ✅ Collected {pages_collected} pages")
             
             return pages
@@ -409,188 +430,87 @@ class NotionPluginMongo(DataSourcePlugin):
     
     def _fetch_page_content(self, page_id: str, max_retries: int = 5) -> str:
         """
-        Fetch full content of a Notion page by retrieving all blocks with retry logic
+        Fetch full content of a Notion page (top-level blocks) as plain text
         
         Args:
             page_id: Notion page ID
-            max_retries: Maximum number of retry attempts for server errors
+            max_retries: Maximum number of attempts per request on 429 / 5xx
             
         Returns:
-            Full page content as plain text string
+            Full page content as plain text string ('' if it could not be fetched)
         """
-        # Retry logic for fetching blocks
-        last_error = None
-        for attempt in range(1, max_retries + 1):
-            # Reset last_error at the start of each attempt
-            attempt_error = None
-            try:
-                content_parts = []
-                has_more = True
-                next_cursor = None
-                
-                while has_more:
-                    # Request with pagination
-                    try:
-                        if next_cursor:
-                            response = self.client.blocks.children.list(
-                                block_id=page_id,
-                                start_cursor=next_cursor,
-                                page_size=100  # Max allowed by Notion API
-                            )
-                        else:
-                            response = self.client.blocks.children.list(
-                                block_id=page_id,
-                                page_size=100
-                            )
-                    except APIResponseError as e:
-                        # Check if it's a server error or rate limit that we should retry
-                        status_code = getattr(e, 'status', None)
-                        error_msg = str(e) if hasattr(e, '__str__') else getattr(e, 'message', 'Unknown error')
-                        attempt_error = f"HTTP {status_code}: {error_msg}"
-                        last_error = attempt_error  # Keep for final error message
-                        
-                        # Retry on 429 (Rate Limit), 502, 503, 504 errors
-                        if status_code in [429, 502, 503, 504] and attempt < max_retries:
-                            # Break inner while loop, retry outer loop
-                            # The retry log will be printed in the outer loop with error info
-                            has_more = False  # Exit while loop
-                            break
-                        else:
-                            # Final failure or non-retryable error
-                            self.logger.warning(f"⚠️  Could not fetch content for page {page_id}: {attempt_error}")
-                            return ""
-                    
-                    # Process blocks
-                    for block in response.get('results', []):
-                        block_type = block.get('type')
-                        
-                        # Extract text from different block types
-                        if block_type == 'paragraph':
-                            text = self._extract_rich_text(block['paragraph'].get('rich_text', []))
-                            if text:
-                                content_parts.append(text)
-                        
-                        elif block_type in ['heading_1', 'heading_2', 'heading_3']:
-                            heading = block[block_type]
-                            text = self._extract_rich_text(heading.get('rich_text', []))
-                            if text:
-                                # Add markdown-style heading
-                                prefix = '#' * int(block_type[-1])
-                                content_parts.append(f"{prefix} {text}")
-                        
-                        elif block_type == 'bulleted_list_item':
-                            text = self._extract_rich_text(block['bulleted_list_item'].get('rich_text', []))
-                            if text:
-                                content_parts.append(f"• {text}")
-                        
-                        elif block_type == 'numbered_list_item':
-                            text = self._extract_rich_text(block['numbered_list_item'].get('rich_text', []))
-                            if text:
-                                content_parts.append(f"- {text}")
-                        
-                        elif block_type == 'quote':
-                            text = self._extract_rich_text(block['quote'].get('rich_text', []))
-                            if text:
-                                content_parts.append(f"> {text}")
-                        
-                        elif block_type == 'code':
-                            text = self._extract_rich_text(block['code'].get('rich_text', []))
-                            language = block['code'].get('language', '')
-                            if text:
-                                content_parts.append(f"```{language}\n{text}\n```")
-                        
-                        elif block_type == 'toggle':
-                            text = self._extract_rich_text(block['toggle'].get('rich_text', []))
-                            if text:
-                                content_parts.append(text)
-                        
-                        elif block_type == 'callout':
-                            text = self._extract_rich_text(block['callout'].get('rich_text', []))
-                            if text:
-                                content_parts.append(f"💡 {text}")
-                    
-                    # Check for more pages
-                    has_more = response.get('has_more', False)
-                    next_cursor = response.get('next_cursor')
-                
-                # Successfully fetched all content
-                if content_parts:
-                    full_content = '\n\n'.join(content_parts)
-                    return full_content
-                else:
-                    # If we broke out of while loop due to retry, continue outer retry loop
-                    # Only retry if we have an error (attempt_error is set)
-                    if attempt_error and attempt < max_retries:
-                        # Check if it's a rate limit error (429) - wait 1 hour
-                        if "HTTP 429" in attempt_error:
-                            wait_time = 3600  # Wait 1 hour for rate limit reset
-                            self.logger.warning(
-                                f"⚠️  Notion API rate limit (429) for page {page_id} "
-                                f"(attempt {attempt}/{max_retries}). Error: {attempt_error}. Waiting 1 hour (3600s) for rate limit reset..."
-                            )
-                        else:
-                            wait_time = min(2 ** (attempt - 1) * 2, 30)
-                            self.logger.warning(
-                                f"⚠️  Retrying page {page_id} (attempt {attempt + 1}/{max_retries}) in {wait_time}s - Error: {attempt_error}..."
-                            )
-                        time.sleep(wait_time)
-                        continue
-                    elif attempt_error:
-                        # Max retries reached
-                        self.logger.warning(f"⚠️  Failed to fetch content for page {page_id} after {max_retries} attempts. Last error: {attempt_error}")
-                        return ""
-                    else:
-                        # No content and no error - this shouldn't happen, but handle gracefully
-                        return ""
-                
-            except APIResponseError as e:
-                # Handle APIResponseError that wasn't caught in inner try block
-                status_code = getattr(e, 'status', None)
-                error_msg = str(e) if hasattr(e, '__str__') else getattr(e, 'message', 'Unknown error')
-                attempt_error = f"HTTP {status_code}: {error_msg}"
-                last_error = attempt_error  # Keep for final error message
-                
-                # Retry on 429 (Rate Limit), 502, 503, 504 errors
-                if status_code in [429, 502, 503, 504] and attempt < max_retries:
-                    # For rate limit (429), wait 1 hour
-                    if status_code == 429:
-                        wait_time = 3600  # Wait 1 hour for rate limit reset
-                        self.logger.warning(
-                            f"⚠️  Notion API rate limit (429) for page {page_id} "
-                            f"(attempt {attempt}/{max_retries}). Error: {attempt_error}. Waiting 1 hour (3600s) for rate limit reset..."
-                        )
-                    else:
-                        wait_time = min(2 ** (attempt - 1) * 2, 30)
-                        self.logger.warning(
-                            f"⚠️  Notion API {status_code} error for page {page_id} "
-                            f"(attempt {attempt}/{max_retries}). Error: {attempt_error}. Retrying in {wait_time}s..."
-                        )
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    self.logger.warning(f"⚠️  Could not fetch content for page {page_id}: {attempt_error}")
-                    return ""
-            except Exception as e:
-                # For other exceptions, only retry if it's a network/server issue
-                if attempt < max_retries:
-                    wait_time = min(2 ** (attempt - 1) * 2, 30)
-                    self.logger.warning(
-                        f"⚠️  Unexpected error fetching content for page {page_id} "
-                        f"(attempt {attempt}/{max_retries}): {str(e)}. Retrying in {wait_time}s..."
-                    )
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    self.logger.warning(f"⚠️  Unexpected error fetching content for page {page_id}: {str(e)}")
-                    return ""
-        
-        # If all retries exhausted
-        self.logger.warning(f"⚠️  Failed to fetch content for page {page_id} after {max_retries} attempts")
-        return ""
+        return run_sync(self._fetch_page_contents([page_id], max_retries)).get(page_id, '')
+    
+    async def _fetch_page_contents(self, page_ids: List[str], max_retries: int = 5) -> Dict[str, str]:
+        """
+        Fetch the content of several pages concurrently
+        
+        Requests share the plugin's AdaptiveRateLimiter, which slows down on
+        429 / Retry-After instead of sleeping a fixed amount per page.
+        
+        Returns:
+            page_id -> content ('' for pages that failed)
+        """
+        async with AsyncClient(auth=self.token) as client:
+            fetcher = NotionBlockFetcher(
+                client, self.limiter, max_concurrency=self.max_concurrency, max_retries=max_retries
+            )
+            trees = await fetcher.fetch_trees(page_ids, max_depth=1)
+        
+        contents = {}
+        for page_id, tree in trees.items():
+            if isinstance(tree, Exception):
+                status_code = getattr(tree, 'status', None)
+                self.logger.warning(f"⚠️  Could not fetch content for page {page_id}: HTTP {status_code}: {tree}")
+                contents[page_id] = ''
+                continue
+            
+            content_parts = [
+                text for text in (self._format_block_text(block) for block, _ in tree) if text
+            ]
+            contents[page_id] = '\n\n'.join(content_parts)
+        
+        return contents
+    
+    def _format_block_text(self, block: Dict[str, Any]) -> Optional[str]:
+        """Render a block as markdown-ish text (None for unsupported or empty blocks)"""
+        block_type = block.get('type')
+        
+        if block_type in ('paragraph', 'toggle'):
+            return self._extract_rich_text(block[block_type].get('rich_text', [])) or None
+        
+        if block_type in ['heading_1', 'heading_2', 'heading_3']:
+            text = self._extract_rich_text(block[block_type].get('rich_text', []))
+            # Add markdown-style heading
+            return f"{'#' * int(block_type[-1])} {text}" if text else None
+        
+        if block_type == 'bulleted_list_item':
+            text = self._extract_rich_text(block['bulleted_list_item'].get('rich_text', []))
+            return f"• {text}" if text else None
+        
+        if block_type == 'numbered_list_item':
+            text = self._extract_rich_text(block['numbered_list_item'].get('rich_text', []))
+            return f"- {text}" if text else None
+        
+        if block_type == 'quote':
+            text = self._extract_rich_text(block['quote'].get('rich_text', []))
+            return f"> {text}" if text else None
+        
+        if block_type == 'code':
+            text = self._extract_rich_text(block['code'].get('rich_text', []))
+            language = block['code'].get('language', '')
+            return f"```{language}\n{text}\n```" if text else None
+        
+        if block_type == 'callout':
+            text = self._extract_rich_text(block['callout'].get('rich_text', []))
+            return f"💡 {text}" if text else None
+        
+        return None
     
     async def save_data(self, collected_data: Dict[str, Any]):
         """Save collected Notion data to MongoDB"""
         print("\n8️⃣ Saving to MongoDB...")
+        save_errors = 0
         
         # Save users first
         users_to_save = []
@@ -618,16 +538,12 @@ class NotionPluginMongo(DataSourcePlugin):
             }
         
         if users_to_save:
-            try:
+            with BulkWriter(self.collections["users"], batch_size=self.bulk_batch_size) as writer:
                 for user_doc in users_to_save:
-                    self.collections["users"].replace_one(
-                        {'user_id': user_doc['user_id']},
-                        user_doc,
-                        upsert=True
-                    )
-                print(f"   ✅ Saved {len(users_to_save)} users")
-            except Exception as e:
-                print(f"   ❌ Error saving users: {e}")
+                    writer.replace_one({'user_id': user_doc['user_id']}, user_doc)
+            if writer.result.errors:
+                print(f"   ❌ Error saving {writer.result.errors} users")
+            print(f"   ✅ Saved {writer.result.operations - writer.result.errors} users")
         
         # Save pages (enrich with user info)
         pages_to_save = []
@@ -671,19 +587,13 @@ class NotionPluginMongo(DataSourcePlugin):
             pages_to_save.append(page_doc)
         
         if pages_to_save:
-            try:
-                saved_count = 0
+            with BulkWriter(self.collections["pages"], batch_size=self.bulk_batch_size) as writer:
                 for page_doc in pages_to_save:
-                    result = self.collections["pages"].replace_one(
-                        {'page_id': page_doc['page_id']},
-                        page_doc,
-                        upsert=True
-                    )
-                    if result.modified_count > 0 or result.upserted_id:
-                        saved_count += 1
-                print(f"   ✅ Saved/Updated {saved_count} pages")
-            except Exception as e:
-                print(f"   ❌ Error saving pages: {e}")
+                    writer.replace_one({'page_id': page_doc['page_id']}, page_doc)
+            save_errors += writer.result.errors
+            if writer.result.errors:
+                print(f"   ❌ Error saving {writer.result.errors} pages")
+            print(f"   ✅ Saved/Updated {writer.result.written} pages")
         
         # Save databases (enrich with user info)
         dbs_to_save = []
@@ -724,19 +634,16 @@ class NotionPluginMongo(DataSourcePlugin):
             dbs_to_save.append(db_doc)
         
         if dbs_to_save:
-            try:
-                saved_count = 0
+            with BulkWriter(self.collections["databases"], batch_size=self.bulk_batch_size) as writer:
                 for db_doc in dbs_to_save:
-                    result = self.collections["databases"].replace_one(
-                        {'database_id': db_doc['database_id']},
-                        db_doc,
-                        upsert=True
-                    )
-                    if result.modified_count > 0 or result.upserted_id:
-                        saved_count += 1
-                print(f"   ✅ Saved/Updated {saved_count} databases")
-            except Exception as e:
-                print(f"   ❌ Error saving databases: {e}")
+                    writer.replace_one({'database_id': db_doc['database_id']}, db_doc)
+            save_errors += writer.result.errors
+            if writer.result.errors:
+                print(f"   ❌ Error saving {writer.result.errors} databases")
+            print(f"   ✅ Saved/Updated {writer.result.written} databases")
+        
+        if not save_errors:
+            self.checkpoints.commit()
     
     def get_member_mapping(self) -> Dict[str, str]:
         """
@@ -9,12 +9,15 @@ Collects team communication data from Slack including:
 - File metadata (embedded in messages)
 """
 
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, Iterator, List, Optional
 from datetime import datetime, timedelta
+import queue
 import re
 import os
 import ssl
-import time
+import threading
 import certifi
 import pytz
 from slack_sdk import WebClient
@@ -23,6 +26,12 @@ from pymongo.errors import DuplicateKeyError
 
 from src.plugins.base import DataSourcePlugin
 from src.core.mongo_manager import MongoDBManager, get_mongo_manager
+from src.core.activity_timeline import ActivityTimelineWriter
+from src.core.bulk_writer import DEFAULT_BATCH_SIZE, BulkWriter
+from src.core.checkpoints import CheckpointMark, CheckpointStore
+from src.core.collaboration_store import CollaborationStore
+from src.core.slack_threads import SlackThreadTracker
+from src.utils.rate_limiter import SlackRateLimiter
 from src.models.mongo_models import SlackMessage, SlackChannel, SlackReaction, SlackLink, SlackFile
 
 
@@ -57,9 +66,16 @@ class SlackPluginMongo(DataSourcePlugin):
         self.workspace = config.get('workspace', 'tokamak-network')
         self.target_channels = config.get('target_channels', [])
         self.include_threads = config.get('include_threads', True)
+        # Thread parents this far before the window are re-checked for late replies
+        self.thread_lookback_days = config.get('thread_lookback_days', 14)
         self.include_reactions = config.get('include_reactions', True)
         self.include_files = config.get('include_files', True)
         self.member_list = config.get('member_list', [])
+        self.bulk_batch_size = config.get('bulk_batch_size', DEFAULT_BATCH_SIZE)
+        self.max_concurrent_channels = config.get('max_concurrent_channels', 4)
+        
+        # Shared by all channel workers; tiers can be overridden per method
+        self.rate_limiter = SlackRateLimiter(method_tiers=config.get('method_tiers'))
         
         self.client = None
         self.user_email_map = {}  # Slack user ID -> email mapping
@@ -73,6 +89,16 @@ class SlackPluginMongo(DataSourcePlugin):
             "messages": self.db["slack_messages"],
             "channels": self.db["slack_channels"],
         }
+
+        # Per-channel high-water mark (latest top-level message ts)
+        self.checkpoints = CheckpointStore(self.db, "slack", enabled=config.get('use_checkpoints', False))
+        # One writer per run: member and project lookups are loaded once
+        self.timeline = ActivityTimelineWriter(self.db)
+        self._incomplete_channels = set()
+        
+        # Per-thread latest collected reply (slack_threads)
+        self.threads = SlackThreadTracker(self.db, enabled=config.get('use_checkpoints', False))
+        self._incomplete_threads = set()
         
     def get_source_name(self) -> str:
         """Get data source name"""
@@ -133,54 +159,21 @@ class SlackPluginMongo(DataSourcePlugin):
         Returns:
             List containing a single dict with all collected data
         """
-        if not self.client:
-            raise RuntimeError("Not authenticated. Call authenticate() first.")
-        
-        print(f"\n📊 Collecting Slack data for {self.workspace}")
-        if start_date and end_date:
-            print(f"   Period: {start_date.isoformat()} ~ {end_date.isoformat()}")
+        collected = {'user': [], 'channel': [], 'message': []}
         
         try:
-            # Convert datetime to Slack timestamps (Unix epoch seconds)
-            oldest = str(start_date.timestamp()) if start_date else "0"
-            latest = str(end_date.timestamp()) if end_date else str(datetime.now(tz=pytz.UTC).timestamp())
-            
-            # Step 1: Fetch and store users
-            print("\n1️⃣ Fetching users...")
-            users = self._fetch_users()
-            print(f"   ✅ Found {len(users)} users")
-            
-            # Step 2: Fetch channels
-            print("\n2️⃣ Fetching channels...")
-            channels = self._fetch_channels()
-            print(f"   ✅ Found {len(channels)} channels")
-            
-            # Filter channels if target_channels specified
-            if self.target_channels:
-                channels = [c for c in channels if c['name'] in self.target_channels]
-                print(f"   🔍 Filtered to {len(channels)} target channels")
-            
-            # Step 3: Fetch messages from channels
-            print("\n3️⃣ Fetching messages...")
-            all_messages = []
-            
-            for idx, channel in enumerate(channels, 1):
-                channel_id = channel['id']
-                channel_name = channel['name']
-                
-                print(f"   📂 [{idx}/{len(channels)}] Collecting from #{channel_name}...", end=" ")
-                
-                messages = self._fetch_channel_messages(channel_id, oldest, latest)
-                
-                if messages:
-                    all_messages.extend(messages)
-                    print(f"✅ {len(messages)} messages")
-                else:
-                    print("- no messages")
+            for record in self.iter_records(start_date, end_date):
+                if isinstance(record, CheckpointMark):
+                    # Committed in save_data once the messages are stored
+                    self.checkpoints.stage_mark(record)
+                    continue
+                kind, item = record
+                collected[kind].append(item)
             
+            all_messages = collected['message']
             print(f"\n📊 Collection Results:")
-            print(f"   Users: {len(users)}")
-            print(f"   Channels: {len(channels)}")
+            print(f"   Users: {len(collected['user'])}")
+            print(f"   Channels: {len(collected['channel'])}")
             print(f"   Messages: {len(all_messages)}")
             
             # Count embedded data
@@ -193,8 +186,8 @@ class SlackPluginMongo(DataSourcePlugin):
             print(f"   Files: {total_files}")
             
             return [{
-                'users': users,
-                'channels': channels,
+                'users': collected['user'],
+                'channels': collected['channel'],
                 'messages': all_messages,
             }]
             
@@ -202,6 +195,185 @@ class SlackPluginMongo(DataSourcePlugin):
             print(f"❌ Error collecting Slack data: {e}")
             raise
     
+    def iter_records(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> Iterator[Any]:
+        """
+        Stream Slack records: ``user``, ``channel`` and ``message``
+        
+        Messages are yielded page by page (thread replies right after their
+        parent). A ``CheckpointMark`` with the channel's latest top-level ts
+        follows each fully fetched channel.
+        """
+        if not self.client:
+            raise RuntimeError("Not authenticated. Call authenticate() first.")
+        
+        print(f"\n📊 Collecting Slack data for {self.workspace}")
+        if start_date and end_date:
+            print(f"   Period: {start_date.isoformat()} ~ {end_date.isoformat()}")
+        
+        # Convert datetime to Slack timestamps (Unix epoch seconds)
+        oldest = str(start_date.timestamp()) if start_date else "0"
+        latest = str(end_date.timestamp()) if end_date else str(datetime.now(tz=pytz.UTC).timestamp())
+        
+        # Step 1: Fetch users
+        print("\n1️⃣ Fetching users...")
+        users = self._fetch_users()
+        print(f"   ✅ Found {len(users)} users")
+        for user in users:
+            yield 'user', user
+        
+        # Step 2: Fetch channels
+        print("\n2️⃣ Fetching channels...")
+        channels = self._fetch_channels()
+        print(f"   ✅ Found {len(channels)} channels")
+        
+        # Filter channels if target_channels specified
+        if self.target_channels:
+            channels = [c for c in channels if c['name'] in self.target_channels]
+            print(f"   🔍 Filtered to {len(channels)} target channels")
+        for channel in channels:
+            yield 'channel', channel
+        
+        # Step 3: Fetch messages from channels
+        print(f"\n3️⃣ Fetching messages ({self.max_concurrent_channels} channels concurrently)...")
+        self.checkpoints.all()  # load once, before the workers read it
+        yield from self._iter_channels_concurrently(channels, oldest, latest)
+    
+    def _iter_channels_concurrently(
+        self,
+        channels: List[Dict[str, Any]],
+        oldest: str,
+        latest: str
+    ) -> Iterator[Any]:
+        """
+        Run :meth:`_iter_channel_records` for several channels at once
+        
+        Workers hand records over through a bounded queue, so memory stays
+        bounded and each channel's records keep their order (its
+        ``CheckpointMark`` still follows all of its messages). API calls of
+        all workers share ``self.rate_limiter``.
+        """
+        records = queue.Queue(maxsize=self.bulk_batch_size)
+        stop = threading.Event()
+        finished = object()
+        
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    records.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def worker(idx: int, channel: Dict[str, Any]) -> None:
+            error = None
+            try:
+                if stop.is_set():
+                    return
+                for record in self._iter_channel_records(channel, oldest, latest, f"[{idx}/{len(channels)}]"):
+                    if not put(record):
+                        return
+            except Exception as e:
+                error = e
+            finally:
+                put((finished, error))
+        
+        executor = ThreadPoolExecutor(max_workers=max(1, self.max_concurrent_channels))
+        try:
+            for idx, channel in enumerate(channels, 1):
+                executor.submit(worker, idx, channel)
+            
+            remaining = len(channels)
+            while remaining:
+                record = records.get()
+                if isinstance(record, tuple) and record[0] is finished:
+                    remaining -= 1
+                    if record[1] is not None:
+                        raise record[1]
+                    continue
+                yield record
+        finally:
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def _iter_channel_records(
+        self,
+        channel: Dict[str, Any],
+        oldest: str,
+        latest: str,
+        progress: str = ""
+    ) -> Iterator[Any]:
+        """Yield a channel's ``message`` records followed by its ``CheckpointMark``"""
+        channel_id = channel['id']
+        channel_name = channel['name']
+        
+        # Resume after the last persisted message of this channel
+        channel_oldest = oldest
+        checkpoint = self.checkpoints.get(channel_id)
+        if checkpoint and checkpoint.get('cursor') and float(checkpoint['cursor']) > float(oldest):
+            channel_oldest = checkpoint['cursor']
+        
+        # Re-read older thread parents (metadata only) to catch late replies
+        thread_oldest = None
+        if self.include_threads and self.threads.enabled and self.thread_lookback_days and float(channel_oldest) > 0:
+            thread_oldest = f"{float(channel_oldest) - self.thread_lookback_days * 86400:.6f}"
+        self.threads.load_channel(channel_id, since=thread_oldest)
+        
+        count = 0
+        latest_ts = None
+        for message in self._iter_channel_messages(channel_id, channel_oldest, latest, thread_oldest):
+            count += 1
+            if not message.get('thread_ts') or message['thread_ts'] == message['ts']:
+                if latest_ts is None or float(message['ts']) > float(latest_ts):
+                    latest_ts = message['ts']
+            yield 'message', message
+        
+        print(f"   📂 {progress} #{channel_name}: " + (f"✅ {count} messages" if count else "- no messages"))
+        
+        if channel_id in self._incomplete_channels:
+            return
+        commit_threads = partial(self.threads.commit, channel_id)
+        if latest_ts:
+            yield CheckpointMark(
+                channel_id,
+                cursor=latest_ts,
+                timestamp=datetime.fromtimestamp(float(latest_ts), tz=pytz.UTC),
+                on_commit=commit_threads,
+            )
+        elif self.threads.staged_count(channel_id):
+            # Only late replies to older threads
+            yield CheckpointMark(channel_id, on_commit=commit_threads)
+    
+    def record_writers(self) -> Dict[str, Any]:
+        """Writers for :meth:`iter_records` (users are not stored)"""
+        return {
+            'channel': self._save_channels,
+            'message': self._save_messages,
+        }
+    
+    def _call(self, method: str, max_retries: int = 3, **params) -> Any:
+        """
+        Call a Slack Web API method under the shared rate limiter
+        
+        A ``ratelimited`` error pauses every worker for ``Retry-After``
+        seconds; the call is retried up to ``max_retries`` times.
+        """
+        api = getattr(self.client, method.replace('.', '_'))
+        for attempt in range(max_retries + 1):
+            self.rate_limiter.acquire(method)
+            try:
+                return api(**params)
+            except SlackApiError as e:
+                if e.response['error'] != 'ratelimited' or attempt == max_retries:
+                    raise
+                retry_after = float(e.response.headers.get('Retry-After', 2 ** attempt))
+                print(f"\n   ⏳ {method} rate limited, pausing requests for {retry_after:.0f}s (attempt {attempt + 1}/{max_retries})")
+                self.rate_limiter.pause(retry_after)
+    
     def _fetch_users(self) -> List[Dict[str, Any]]:
         """Fetch all users in the workspace"""
         users = []
@@ -209,7 +381,7 @@ class SlackPluginMongo(DataSourcePlugin):
         
         while True:
             try:
-                response = self.client.users_list(cursor=cursor, limit=200)
+                response = self._call('users.list', cursor=cursor, limit=200)
                 
                 for member in response['members']:
                     user_id = member['id']
@@ -243,7 +415,8 @@ class SlackPluginMongo(DataSourcePlugin):
         cursor = None
         while True:
             try:
-                response = self.client.conversations_list(
+                response = self._call(
+                    'conversations.list',
                     types="public_channel",
                     exclude_archived=True,
                     cursor=cursor,
@@ -267,7 +440,8 @@ class SlackPluginMongo(DataSourcePlugin):
         cursor = None
         while True:
             try:
-                response = self.client.conversations_list(
+                response = self._call(
+                    'conversations.list',
                     types="private_channel",
                     exclude_archived=True,
                     cursor=cursor,
@@ -296,14 +470,33 @@ class SlackPluginMongo(DataSourcePlugin):
         latest: str
     ) -> List[Dict[str, Any]]:
         """Fetch messages from a specific channel"""
-        messages = []
+        return list(self._iter_channel_messages(channel_id, oldest, latest))
+    
+    def _iter_channel_messages(
+        self,
+        channel_id: str,
+        oldest: str,
+        latest: str,
+        thread_oldest: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield messages (and new thread replies) of a channel page by page
+        
+        Messages between ``thread_oldest`` and ``oldest`` are already stored
+        and are not yielded; they are only read for their thread metadata so
+        late replies to older threads are still collected.
+        """
         cursor = None
+        history_oldest = oldest
+        if thread_oldest is not None and float(thread_oldest) < float(oldest):
+            history_oldest = thread_oldest
         
         while True:
             try:
-                response = self.client.conversations_history(
+                response = self._call(
+                    'conversations.history',
                     channel=channel_id,
-                    oldest=oldest,
+                    oldest=history_oldest,
                     latest=latest,
                     limit=1000,
                     cursor=cursor
@@ -314,60 +507,12 @@ class SlackPluginMongo(DataSourcePlugin):
                     if msg.get('subtype') in ['bot_message', 'channel_join', 'channel_leave']:
                         continue
                     
-                    # Convert Slack timestamp to UTC datetime
-                    msg_timestamp = datetime.fromtimestamp(float(msg['ts']), tz=pytz.UTC)
+                    if float(msg['ts']) > float(oldest):
+                        yield self._message_data(channel_id, msg)
                     
-                    user_id = msg.get('user', '')
-                    
-                    # Extract reactions (to be embedded)
-                    reactions = []
-                    if self.include_reactions and 'reactions' in msg:
-                        for reaction in msg['reactions']:
-                            reactions.append({
-                                'reaction': reaction['name'],
-                                'count': reaction['count'],
-                                'users': reaction.get('users', [])
-                            })
-                    
-                    # Extract links (to be embedded)
-                    links = self._extract_links_from_text(msg.get('text', ''))
-                    
-                    # Extract files (to be embedded)
-                    files = []
-                    if self.include_files and 'files' in msg:
-                        for file_obj in msg['files']:
-                            files.append({
-                                'id': file_obj['id'],
-                                'name': file_obj.get('name', ''),
-                                'url_private': file_obj.get('url_private', ''),
-                                'size': file_obj.get('size', 0)
-                            })
-                    
-                    message_data = {
-                        'ts': msg['ts'],
-                        'channel_id': channel_id,
-                        'channel_name': self.channel_name_map.get(channel_id, ''),
-                        'user_id': user_id,
-                        'user_name': self.user_name_map.get(user_id, ''),
-                        'text': msg.get('text', ''),
-                        'thread_ts': msg.get('thread_ts'),
-                        'reply_count': msg.get('reply_count', 0),
-                        'reactions': reactions,
-                        'links': links,
-                        'files': files,
-                        'posted_at': msg_timestamp,
-                    }
-                    messages.append(message_data)
-                    
-                    # Fetch thread replies if this is a thread parent
-                    if self.include_threads and msg.get('thread_ts') == msg.get('ts'):
-                        thread_messages = self._fetch_thread_replies(
-                            channel_id,
-                            msg['thread_ts'],
-                            oldest,
-                            latest
-                        )
-                        messages.extend(thread_messages)
+                    # Fetch new replies if this is a thread parent
+                    if self.include_threads and msg.get('thread_ts') == msg.get('ts') and msg.get('reply_count'):
+                        yield from self._fetch_updated_thread(channel_id, msg, latest)
                 
                 if not response.get('has_more'):
                     break
@@ -378,9 +523,88 @@ class SlackPluginMongo(DataSourcePlugin):
                 
             except SlackApiError as e:
                 print(f"\n   ⚠️  Error fetching messages: {e.response['error']}")
+                self._incomplete_channels.add(channel_id)
                 break
+    
+    def _message_data(self, channel_id: str, msg: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a conversations.history message to the collected format"""
+        # Convert Slack timestamp to UTC datetime
+        msg_timestamp = datetime.fromtimestamp(float(msg['ts']), tz=pytz.UTC)
+        
+        user_id = msg.get('user', '')
+        
+        # Extract reactions (to be embedded)
+        reactions = []
+        if self.include_reactions and 'reactions' in msg:
+            for reaction in msg['reactions']:
+                reactions.append({
+                    'reaction': reaction['name'],
+                    'count': reaction['count'],
+                    'users': reaction.get('users', [])
+                })
+        
+        # Extract links (to be embedded)
+        links = self._extract_links_from_text(msg.get('text', ''))
+        
+        # Extract files (to be embedded)
+        files = []
+        if self.include_files and 'files' in msg:
+            for file_obj in msg['files']:
+                files.append({
+                    'id': file_obj['id'],
+                    'name': file_obj.get('name', ''),
+                    'url_private': file_obj.get('url_private', ''),
+                    'size': file_obj.get('size', 0)
+                })
+        
+        return {
+            'ts': msg['ts'],
+            'channel_id': channel_id,
+            'channel_name': self.channel_name_map.get(channel_id, ''),
+            'user_id': user_id,
+            'user_name': self.user_name_map.get(user_id, ''),
+            'text': msg.get('text', ''),
+            'thread_ts': msg.get('thread_ts'),
+            'reply_count': msg.get('reply_count', 0),
+            'reactions': reactions,
+            'links': links,
+            'files': files,
+            'posted_at': msg_timestamp,
+        }
+    
+    def _fetch_updated_thread(
+        self,
+        channel_id: str,
+        parent: Dict[str, Any],
+        latest: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch the replies a thread received since it was last collected
         
-        return messages
+        Threads whose ``latest_reply`` has not advanced past the tracked
+        watermark are skipped without an API call.
+        """
+        thread_ts = parent['ts']
+        latest_reply = parent.get('latest_reply')
+        if not self.threads.has_new_replies(channel_id, thread_ts, latest_reply):
+            return []
+        
+        replies = self._fetch_thread_replies(
+            channel_id,
+            thread_ts,
+            oldest=self.threads.watermark(channel_id, thread_ts),
+            latest=latest
+        )
+        
+        # Committed with the channel checkpoint once the replies are saved
+        if latest_reply and (channel_id, thread_ts) not in self._incomplete_threads:
+            self.threads.stage(
+                channel_id,
+                thread_ts,
+                latest_reply=min(latest_reply, latest, key=float),
+                reply_count=parent.get('reply_count', 0),
+            )
+        return replies
     
     def _fetch_thread_replies(
         self, 
@@ -390,96 +614,81 @@ class SlackPluginMongo(DataSourcePlugin):
         latest: str = None,
         max_retries: int = 3
     ) -> List[Dict[str, Any]]:
-        """Fetch replies in a thread (with rate limit handling)"""
+        """Fetch replies in a thread posted after ``oldest`` (paced by ``self.rate_limiter``)"""
         replies = []
         
         oldest_ts = float(oldest) if oldest else 0
         latest_ts = float(latest) if latest else float('inf')
         
-        # Rate limiting: add small delay between thread fetches
-        time.sleep(0.3)
+        try:
+            response = self._call(
+                'conversations.replies',
+                max_retries=max_retries,
+                channel=channel_id,
+                ts=thread_ts,
+                oldest=oldest or "0",
+                limit=1000
+            )
+        except SlackApiError as e:
+            print(f"\n   ⚠️  Error fetching thread replies: {e.response['error']}")
+            self._incomplete_threads.add((channel_id, thread_ts))
+            return replies
         
-        for attempt in range(max_retries):
-            try:
-                response = self.client.conversations_replies(
-                    channel=channel_id,
-                    ts=thread_ts,
-                    limit=1000
-                )
-                
-                for msg in response['messages']:
-                    # Skip the parent message
-                    if msg['ts'] == thread_ts:
-                        continue
-                    
-                    if msg.get('subtype') in ['bot_message']:
-                        continue
-                    
-                    # Filter by date range
-                    msg_ts = float(msg['ts'])
-                    if msg_ts < oldest_ts or msg_ts > latest_ts:
-                        continue
-                    
-                    reply_timestamp = datetime.fromtimestamp(msg_ts, tz=pytz.UTC)
-                    user_id = msg.get('user', '')
-                    
-                    # Extract reactions
-                    reactions = []
-                    if self.include_reactions and 'reactions' in msg:
-                        for reaction in msg['reactions']:
-                            reactions.append({
-                                'reaction': reaction['name'],
-                                'count': reaction['count'],
-                                'users': reaction.get('users', [])
-                            })
-                    
-                    # Extract links
-                    links = self._extract_links_from_text(msg.get('text', ''))
-                    
-                    # Extract files
-                    files = []
-                    if self.include_files and 'files' in msg:
-                        for file_obj in msg['files']:
-                            files.append({
-                                'id': file_obj['id'],
-                                'name': file_obj.get('name', ''),
-                                'url_private': file_obj.get('url_private', ''),
-                                'size': file_obj.get('size', 0)
-                            })
-                    
-                    reply_data = {
-                        'ts': msg['ts'],
-                        'channel_id': channel_id,
-                        'channel_name': self.channel_name_map.get(channel_id, ''),
-                        'user_id': user_id,
-                        'user_name': self.user_name_map.get(user_id, ''),
-                        'text': msg.get('text', ''),
-                        'thread_ts': thread_ts,
-                        'reply_count': 0,
-                        'reactions': reactions,
-                        'links': links,
-                        'files': files,
-                        'posted_at': reply_timestamp,
-                    }
-                    replies.append(reply_data)
-                
-                # Success - break out of retry loop
-                break
-                
-            except SlackApiError as e:
-                error_code = e.response['error']
-                
-                if error_code == 'ratelimited':
-                    # Get retry-after from headers, default to exponential backoff
-                    retry_after = int(e.response.headers.get('Retry-After', 2 ** attempt))
-                    print(f"\n   ⏳ Rate limited, waiting {retry_after}s (attempt {attempt + 1}/{max_retries})...", end='', flush=True)
-                    time.sleep(retry_after)
-                    
-                    if attempt == max_retries - 1:
-                        print(f"\n   ⚠️  Max retries reached for thread {thread_ts}")
-                else:
-                    print(f"\n   ⚠️  Error fetching thread replies: {error_code}")
-                    break  # Don't retry for non-rate-limit errors
+        for msg in response['messages']:
+            # Skip the parent message
+            if msg['ts'] == thread_ts:
+                continue
+            
+            if msg.get('subtype') in ['bot_message']:
+                continue
+            
+            # Filter by date range
+            msg_ts = float(msg['ts'])
+            if msg_ts < oldest_ts or msg_ts > latest_ts:
+                continue
+            
+            reply_timestamp = datetime.fromtimestamp(msg_ts, tz=pytz.UTC)
+            user_id = msg.get('user', '')
+            
+            # Extract reactions
+            reactions = []
+            if self.include_reactions and 'reactions' in msg:
+                for reaction in msg['reactions']:
+                    reactions.append({
+                        'reaction': reaction['name'],
+                        'count': reaction['count'],
+                        'users': reaction.get('users', [])
+                    })
+            
+            # Extract links
+            links = self._extract_links_from_text(msg.get('text', ''))
+            
+            # Extract files
+            files = []
+            if self.include_files and 'files' in msg:
+                for file_obj in msg['files']:
+                    files.append({
+                        'id': file_obj['id'],
+                        'name': file_obj.get('name', ''),
+                        'url_private': file_obj.get('url_private', ''),
+                        'size': file_obj.get('size', 0)
+                    })
+            
+            reply_data = {
+                'ts': msg['ts'],
+                'channel_id': channel_id,
+                'channel_name': self.channel_name_map.get(channel_id, ''),
+                'user_id': user_id,
+                'user_name': self.user_name_map.get(user_id, ''),
+                'text': msg.get('text', ''),
+                'thread_ts': thread_ts,
+                'reply_count': 0,
+                'reactions': reactions,
+                'links': links,
+                'files': files,
+                'posted_at': reply_timestamp,
+            }
+            replies.append(reply_data)
         
         return replies
     
@@ -513,9 +722,17 @@ class SlackPluginMongo(DataSourcePlugin):
         """Save collected Slack data to MongoDB"""
         print("\n8️⃣ Saving to MongoDB...")
         
-        # Save channels
+        self._save_channels(collected_data.get('channels', []))
+        
+        messages = collected_data.get('messages', [])
+        if messages and self._save_messages(messages) == len(messages):
+            self.checkpoints.commit()
+            self.threads.commit()
+    
+    def _save_channels(self, channels: List[Dict[str, Any]]) -> int:
+        """Upsert channels by channel_id; returns the number saved"""
         channels_to_save = []
-        for ch in collected_data.get('channels', []):
+        for ch in channels:
             channel_doc = {
                 'channel_id': ch['id'],
                 'name': ch['name'],
@@ -525,22 +742,28 @@ class SlackPluginMongo(DataSourcePlugin):
             }
             channels_to_save.append(channel_doc)
         
-        if channels_to_save:
-            try:
-                # Use replace_one with upsert for each channel to avoid duplicates
-                for ch_doc in channels_to_save:
-                    self.collections["channels"].replace_one(
-                        {'channel_id': ch_doc['channel_id']},
-                        ch_doc,
-                        upsert=True
-                    )
-                print(f"   ✅ Saved {len(channels_to_save)} channels")
-            except Exception as e:
-                print(f"   ❌ Error saving channels: {e}")
+        if not channels_to_save:
+            return 0
+        
+        # Upsert by channel_id to avoid duplicates, batched into bulk writes
+        with BulkWriter(self.collections["channels"], batch_size=self.bulk_batch_size) as writer:
+            for ch_doc in channels_to_save:
+                writer.replace_one({'channel_id': ch_doc['channel_id']}, ch_doc)
+        if writer.result.errors:
+            print(f"   ❌ Error saving {writer.result.errors} channels")
+        saved = writer.result.operations - writer.result.errors
+        print(f"   ✅ Saved {saved} channels")
+        return saved
+    
+    def _save_messages(self, messages: List[Dict[str, Any]]) -> int:
+        """
+        Upsert messages by (ts, channel_id) and update the derived collections
         
-        # Save messages
+        Returns:
+            Number of messages saved
+        """
         messages_to_save = []
-        for msg in collected_data.get('messages', []):
+        for msg in messages:
             # Ensure posted_at is a datetime object
             if isinstance(msg['posted_at'], str):
                 msg['posted_at'] = datetime.fromisoformat(msg['posted_at'])
@@ -563,20 +786,26 @@ class SlackPluginMongo(DataSourcePlugin):
             }
             messages_to_save.append(message_doc)
         
-        if messages_to_save:
-            try:
-                # Use replace_one with upsert for each message to avoid duplicates
-                saved_count = 0
-                for msg_doc in messages_to_save:
-                    self.collections["messages"].replace_one(
-                        {'ts': msg_doc['ts'], 'channel_id': msg_doc['channel_id']},
-                        msg_doc,
-                        upsert=True
-                    )
-                    saved_count += 1
-                print(f"   ✅ Saved {saved_count} messages")
-            except Exception as e:
-                print(f"   ❌ Error saving messages: {e}")
+        if not messages_to_save:
+            return 0
+        
+        # Upsert by (ts, channel_id) to avoid duplicates, batched into bulk writes
+        with BulkWriter(self.collections["messages"], batch_size=self.bulk_batch_size) as writer:
+            for msg_doc in messages_to_save:
+                writer.replace_one(
+                    {'ts': msg_doc['ts'], 'channel_id': msg_doc['channel_id']},
+                    msg_doc
+                )
+        if writer.result.errors:
+            print(f"   ❌ Error saving {writer.result.errors} messages")
+        saved = writer.result.operations - writer.result.errors
+        print(f"   ✅ Saved {saved} messages")
+
+        self.timeline.safe_write("slack_messages", messages_to_save)
+        CollaborationStore(self.db).safe_update(
+            threads=[(m['channel_id'], m['thread_ts']) for m in messages_to_save if m.get('thread_ts')]
+        )
+        return saved
     
     def get_member_mapping(self) -> Dict[str, str]:
         """
@@ -2,16 +2,43 @@
 AI Client for Report Generation
 
 Uses Tokamak AI API (OpenAI-compatible) for generating reports.
+
+Completions go through a small execution layer:
+- at most AI_MAX_CONCURRENCY requests in flight (per event loop)
+- identical in-flight requests share one API call
+- with a mongo_manager, responses are cached in ``llm_response_cache`` keyed
+  by (model, prompt hash, params); entries expire after AI_CACHE_TTL_SECONDS
+  and the least recently used are evicted beyond AI_CACHE_MAX_ENTRIES
+
+Fan out independent prompts with ``generate_completions`` so a report waits
+for the slowest call instead of the sum of all calls.
 """
 
 import os
 import asyncio
-from typing import Optional, List, Dict, Any
+import hashlib
+import json
+import weakref
+from datetime import datetime, timedelta
+from typing import Optional, List, Dict, Any, Awaitable, Callable
 import httpx
 from dotenv import load_dotenv
 
 load_dotenv()
 
+CACHE_COLLECTION = "llm_response_cache"
+
+# Concurrent API requests per event loop
+MAX_CONCURRENCY = int(os.getenv("AI_MAX_CONCURRENCY", "4"))
+
+CACHE_TTL_SECONDS = int(os.getenv("AI_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+CACHE_MAX_ENTRIES = int(os.getenv("AI_CACHE_MAX_ENTRIES", "5000"))
+
+# Per-loop state (generate_completion_sync runs a new loop per call)
+_semaphores = weakref.WeakKeyDictionary()  # loop -> asyncio.Semaphore
+_inflight = weakref.WeakKeyDictionary()  # loop -> {cache key: task}
+_indexed_caches = set()  # collection full names
+
 
 def get_ai_api_key() -> str:
     """Get AI API key from environment."""
@@ -28,13 +55,117 @@ def get_default_model() -> str:
     return os.getenv("AI_MODEL", "qwen3-235b")
 
 
+def cache_key(model: str, prompt: str, **params: Any) -> str:
+    """Cache key for a completion: (model, prompt hash, params)"""
+    prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    canonical = json.dumps({"model": model, "prompt": prompt_hash, "params": params}, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _loop_state():
+    loop = asyncio.get_running_loop()
+    if loop not in _semaphores:
+        _semaphores[loop] = asyncio.Semaphore(max(1, MAX_CONCURRENCY))
+        _inflight[loop] = {}
+    return _semaphores[loop], _inflight[loop]
+
+
+async def _cache_get(collection, key: str) -> Optional[str]:
+    doc = await collection.find_one_and_update(
+        {"_id": key, "expires_at": {"$gt": datetime.utcnow()}},
+        {"$set": {"last_used_at": datetime.utcnow()}, "$inc": {"hits": 1}},
+        projection={"response": 1},
+    )
+    return doc["response"] if doc else None
+
+
+async def _cache_put(collection, key: str, model: str, response: str) -> None:
+    if collection.full_name not in _indexed_caches:
+        await collection.create_index("expires_at", expireAfterSeconds=0)
+        await collection.create_index("last_used_at")
+        _indexed_caches.add(collection.full_name)
+
+    now = datetime.utcnow()
+    await collection.replace_one(
+        {"_id": key},
+        {
+            "model": model,
+            "response": response,
+            "created_at": now,
+            "last_used_at": now,
+            "expires_at": now + timedelta(seconds=CACHE_TTL_SECONDS),
+            "hits": 0,
+        },
+        upsert=True,
+    )
+
+    # LRU eviction beyond the size limit
+    excess = await collection.estimated_document_count() - CACHE_MAX_ENTRIES
+    if excess > 0:
+        stale = await collection.find({}, {"_id": 1}).sort("last_used_at", 1).limit(excess).to_list(length=excess)
+        await collection.delete_many({"_id": {"$in": [doc["_id"] for doc in stale]}})
+
+
+async def run_cached(
+    key: str,
+    model: str,
+    call: Callable[[], Awaitable[str]],
+    mongo_manager=None,
+    use_cache: bool = True,
+) -> str:
+    """
+    Run an LLM call through the concurrency limit, coalescing and cache
+
+    Args:
+        key: ``cache_key`` of the request
+        model: Model name (stored with the cached response)
+        call: Makes the API request when the response is not cached
+        mongo_manager: MongoDB manager for the response cache (optional)
+        use_cache: Read and write the response cache
+
+    Returns:
+        Generated text response (failures are not cached)
+    """
+    semaphore, inflight = _loop_state()
+    if key in inflight:
+        return await asyncio.shield(inflight[key])
+
+    collection = mongo_manager.async_db[CACHE_COLLECTION] if mongo_manager is not None and use_cache else None
+
+    async def execute() -> str:
+        if collection is not None:
+            try:
+                cached = await _cache_get(collection, key)
+                if cached is not None:
+                    return cached
+            except Exception as e:
+                print(f"LLM cache read failed: {e}")
+
+        async with semaphore:
+            response = await call()
+
+        if collection is not None:
+            try:
+                await _cache_put(collection, key, model, response)
+            except Exception as e:
+                print(f"LLM cache write failed: {e}")
+        return response
+
+    task = asyncio.ensure_future(execute())
+    inflight[key] = task
+    task.add_done_callback(lambda _: inflight.pop(key, None))
+    return await asyncio.shield(task)
+
+
 async def generate_completion(
     prompt: str,
     system_prompt: Optional[str] = None,
     model: Optional[str] = None,
     max_tokens: int = 4000,
     temperature: float = 0.2,
-    max_retries: int = 3
+    max_retries: int = 3,
+    mongo_manager=None,
+    use_cache: bool = True,
 ) -> str:
     """
     Generate completion using Tokamak AI API.
@@ -46,10 +177,57 @@ async def generate_completion(
         max_tokens: Maximum tokens in response
         temperature: Temperature for generation
         max_retries: Number of retries on failure
+        mongo_manager: MongoDB manager for the response cache (optional)
+        use_cache: Reuse a cached response for the same request
         
     Returns:
         Generated text response
     """
+    # Model is required for Tokamak AI API
+    actual_model = model or get_default_model()
+    key = cache_key(
+        actual_model, prompt, system_prompt=system_prompt, max_tokens=max_tokens, temperature=temperature
+    )
+    return await run_cached(
+        key,
+        actual_model,
+        lambda: _request_completion(prompt, system_prompt, actual_model, max_tokens, temperature, max_retries),
+        mongo_manager=mongo_manager,
+        use_cache=use_cache,
+    )
+
+
+async def generate_completions(
+    requests: List[Dict[str, Any]],
+    mongo_manager=None,
+    return_exceptions: bool = True,
+) -> List[Any]:
+    """
+    Run several completions concurrently (bounded by AI_MAX_CONCURRENCY)
+    
+    Args:
+        requests: ``generate_completion`` keyword arguments per call
+        mongo_manager: MongoDB manager for the response cache (optional)
+        return_exceptions: Return failures in place instead of raising
+        
+    Returns:
+        Responses (or exceptions) in request order
+    """
+    return await asyncio.gather(
+        *(generate_completion(mongo_manager=mongo_manager, **request) for request in requests),
+        return_exceptions=return_exceptions,
+    )
+
+
+async def _request_completion(
+    prompt: str,
+    system_prompt: Optional[str],
+    model: str,
+    max_tokens: int,
+    temperature: float,
+    max_retries: int,
+) -> str:
+    """Call the chat completions API (with retries)"""
     api_key = get_ai_api_key()
     api_url = get_ai_api_url()
     
@@ -61,12 +239,9 @@ async def generate_completion(
         messages.append({"role": "system", "content": system_prompt})
     messages.append({"role": "user", "content": prompt})
     
-    # Model is required for Tokamak AI API
-    actual_model = model or get_default_model()
-    
     payload = {
         "messages": messages,
-        "model": actual_model,
+        "model": model,
         "max_tokens": max_tokens,
         "temperature": temperature,
     }
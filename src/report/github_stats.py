@@ -0,0 +1,232 @@
+"""
+GitHub statistics for the biweekly report.
+
+Counts commits and PRs with ``$group`` pipelines instead of loading every
+commit document (with its ``files`` array) into the API process:
+
+- commits per repository and per category (Economics / Zkp / Rollup / etc)
+- PRs per repository
+- the newest commit headlines per project (ooo / eco / trh), limited to what
+  the project summaries use
+
+Repository classification rules are compiled once into a ``RepoClassifier``.
+The classifier works in Python and can also render each rule set as a
+``$switch`` expression, so MongoDB applies exactly the same rules.
+"""
+
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+# Category keywords (case-insensitive substrings, first match wins)
+CATEGORY_KEYWORDS: Dict[str, List[str]] = {
+    "Economics": ["ton-staking-v2", "TON-Ecosystem", "staking-dashboard", "ton-staking", "tokamak-dao"],
+    "Zkp": ["Tokamak-zk-EVM", "tokamak-zk-evm-docs", "Tokamak-zkp-channel-manager", "zkp", "zk-"],
+    "Rollup": ["tokamak-titan", "tokamak-titan-canyon", "optimism", "thanos", "trh-"],
+}
+DEFAULT_CATEGORY = "etc"
+CATEGORIES = list(CATEGORY_KEYWORDS) + [DEFAULT_CATEGORY]
+
+# Projects summarized in the report
+REPORT_PROJECTS = ["ooo", "eco", "trh"]
+
+# Fallback keywords for repos not assigned to a project in the DB
+PROJECT_KEYWORDS: Dict[str, List[str]] = {
+    "ooo": ["zk-evm", "zkevm", "zkp", "tokamak-zk", "channel-manager"],
+    "eco": ["staking", "ton-staking", "dao", "ecosystem", "ton-total"],
+    "trh": ["titan", "thanos", "drb", "trh-", "commit-reveal"],
+}
+
+# Commit headlines kept per project (the AI summary reads up to 20)
+HEADLINE_LIMIT = 20
+
+
+def _keyword_pattern(keywords: List[str]) -> str:
+    return "|".join(re.escape(kw.lower()) for kw in keywords)
+
+
+class RepoClassifier:
+    """
+    Precompiled repository -> category / project rules
+
+    Args:
+        active_projects: Project key (without ``project-``) -> repositories,
+            as returned by ``get_active_projects``; only report projects
+            are used
+    """
+
+    def __init__(self, active_projects: Optional[Dict[str, List[str]]] = None):
+        self.category_rules: List[Tuple[str, str]] = [
+            (category, _keyword_pattern(keywords)) for category, keywords in CATEGORY_KEYWORDS.items()
+        ]
+        self.project_rules: List[Tuple[str, str]] = [
+            (project, _keyword_pattern(keywords)) for project, keywords in PROJECT_KEYWORDS.items()
+        ]
+        self._category_res: List[Tuple[str, Pattern]] = [
+            (category, re.compile(pattern)) for category, pattern in self.category_rules
+        ]
+        self._project_res: List[Tuple[str, Pattern]] = [
+            (project, re.compile(pattern)) for project, pattern in self.project_rules
+        ]
+
+        # Exact repository assignments from the DB take precedence over keywords
+        self.repo_to_project: Dict[str, str] = {}
+        for project_key, repos in (active_projects or {}).items():
+            if project_key in REPORT_PROJECTS:
+                for repo in repos:
+                    self.repo_to_project[repo.lower()] = project_key
+
+    def category(self, repository: str) -> str:
+        """Report category of a repository"""
+        repo = (repository or "").lower()
+        for category, regex in self._category_res:
+            if regex.search(repo):
+                return category
+        return DEFAULT_CATEGORY
+
+    def project(self, repository: str) -> Optional[str]:
+        """Report project of a repository (None if it belongs to none)"""
+        repo = (repository or "").lower()
+        if repo in self.repo_to_project:
+            return self.repo_to_project[repo]
+        for project, regex in self._project_res:
+            if regex.search(repo):
+                return project
+        return None
+
+    def category_expression(self, field: str = "$repository") -> Dict[str, Any]:
+        """``$switch`` evaluating :meth:`category` inside a pipeline"""
+        repo = {"$toLower": {"$ifNull": [field, ""]}}
+        return {
+            "$switch": {
+                "branches": [
+                    {"case": {"$regexMatch": {"input": repo, "regex": pattern}}, "then": category}
+                    for category, pattern in self.category_rules
+                ],
+                "default": DEFAULT_CATEGORY,
+            }
+        }
+
+    def project_expression(self, field: str = "$repository") -> Dict[str, Any]:
+        """``$switch`` evaluating :meth:`project` inside a pipeline"""
+        repo = {"$toLower": {"$ifNull": [field, ""]}}
+        repos_by_project: Dict[str, List[str]] = {}
+        for repo_name, project in self.repo_to_project.items():
+            repos_by_project.setdefault(project, []).append(repo_name)
+
+        branches = [
+            {"case": {"$in": [repo, sorted(repos)]}, "then": project}
+            for project, repos in repos_by_project.items()
+        ]
+        branches += [
+            {"case": {"$regexMatch": {"input": repo, "regex": pattern}}, "then": project}
+            for project, pattern in self.project_rules
+        ]
+        return {"$switch": {"branches": branches, "default": None}}
+
+
+def commit_stats_pipeline(
+    start_date: datetime, end_date: datetime, classifier: RepoClassifier, headline_limit: int = HEADLINE_LIMIT
+) -> List[Dict[str, Any]]:
+    """Single ``$facet`` pipeline over ``github_commits`` for the report period"""
+    repository = {"$ifNull": ["$repository", "unknown"]}
+    return [
+        {"$match": {"date": {"$gte": start_date, "$lte": end_date}}},
+        {"$project": {"_id": 0, "repository": 1, "message": 1, "date": 1}},
+        {
+            "$facet": {
+                "by_repo": [{"$group": {"_id": repository, "commits": {"$sum": 1}}}],
+                "by_category": [
+                    {
+                        "$group": {
+                            "_id": classifier.category_expression(),
+                            "repos": {"$addToSet": repository},
+                            "commits": {"$sum": 1},
+                        }
+                    },
+                    {"$project": {"repos": {"$size": "$repos"}, "commits": 1}},
+                ],
+                "headlines": [
+                    {"$addFields": {"project": classifier.project_expression()}},
+                    {"$match": {"project": {"$ne": None}}},
+                    {"$sort": {"date": -1}},
+                    {
+                        "$group": {
+                            "_id": "$project",
+                            "commits": {"$push": {"repository": "$repository", "message": "$message"}},
+                        }
+                    },
+                    {"$project": {"commits": {"$slice": ["$commits", headline_limit]}}},
+                ],
+            }
+        },
+    ]
+
+
+def pr_stats_pipeline(start_date: datetime, end_date: datetime) -> List[Dict[str, Any]]:
+    """PR counts per repository for the report period"""
+    return [
+        {"$match": {"created_at": {"$gte": start_date, "$lte": end_date}}},
+        {"$group": {"_id": {"$ifNull": ["$repository", "unknown"]}, "prs": {"$sum": 1}}},
+    ]
+
+
+def build_github_stats(facets: Dict[str, List[Dict[str, Any]]], pr_groups: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Report stats from the pipeline results
+
+    Returns:
+        total_commits, total_repos, total_prs, by_repo, pr_by_repo,
+        by_category ({category: {"repos", "commits"}}) and headlines
+        ({project: [{"repository", "message"}]}, newest first)
+    """
+    repo_counts = {group["_id"]: group["commits"] for group in facets.get("by_repo", [])}
+    pr_counts = {group["_id"]: group["prs"] for group in pr_groups}
+
+    category_stats = {category: {"repos": 0, "commits": 0} for category in CATEGORIES}
+    for group in facets.get("by_category", []):
+        category_stats[group["_id"]] = {"repos": group["repos"], "commits": group["commits"]}
+
+    headlines = {project: [] for project in REPORT_PROJECTS}
+    for group in facets.get("headlines", []):
+        headlines[group["_id"]] = [
+            {"repository": c.get("repository", ""), "message": (c.get("message") or "").split("\n")[0]}
+            for c in group["commits"]
+        ]
+
+    return {
+        "total_commits": sum(repo_counts.values()),
+        "total_repos": len(repo_counts),
+        "total_prs": sum(pr_counts.values()),
+        "by_repo": repo_counts,
+        "pr_by_repo": pr_counts,
+        "by_category": category_stats,
+        "headlines": headlines,
+    }
+
+
+async def load_github_stats(
+    db,
+    start_date: datetime,
+    end_date: datetime,
+    active_projects: Optional[Dict[str, List[str]]] = None,
+    headline_limit: int = HEADLINE_LIMIT,
+) -> Dict[str, Any]:
+    """
+    GitHub statistics for a report period (see :func:`build_github_stats`)
+
+    Args:
+        db: Motor database
+        start_date: Period start (naive UTC)
+        end_date: Period end (naive UTC)
+        active_projects: Project -> repositories (see ``RepoClassifier``)
+        headline_limit: Commit headlines kept per project
+    """
+    classifier = RepoClassifier(active_projects)
+    facets = await db["github_commits"].aggregate(
+        commit_stats_pipeline(start_date, end_date, classifier, headline_limit), allowDiskUse=True
+    ).to_list(length=None)
+    pr_groups = await db["github_pull_requests"].aggregate(pr_stats_pipeline(start_date, end_date)).to_list(
+        length=None
+    )
+    return build_github_stats(facets[0] if facets else {}, pr_groups)
@@ -0,0 +1,431 @@
+"""
+Streaming Export Encoders
+
+Turns a MongoDB cursor into file chunks without holding the result set in
+memory:
+
+    cursor -> iterate_cursor -> encode_csv / encode_json_array / encode_ndjson /
+    encode_toon_array -> (gzip_chunks | zip_entries) -> StreamingResponse
+
+Every stage is an async generator, so the pipeline only pulls the next cursor
+batch once the client has consumed the previous chunk (the ASGI server awaits
+each send). Text is emitted in ~64 KB chunks.
+
+Formats that need a header before the first row (CSV columns, TOON array
+length) look at the first ``sample_size`` rows only:
+
+- CSV: columns are taken from the sample. When the result is larger than the
+  sample, an ``_extra`` column carries (as JSON) fields first seen later.
+- TOON: exports that fit in the sample are encoded exactly like
+  ``encode_toon``; larger ones use the list format with the length from
+  ``count()``.
+
+Example:
+    cursor = db["slack_messages"].find(query).batch_size(500)
+    rows = (clean_document(doc, flatten=True) async for doc in iterate_cursor(cursor))
+    return StreamingResponse(encode_csv(rows), media_type="text/csv")
+"""
+
+import asyncio
+import csv
+import itertools
+import json
+import zipfile
+import zlib
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from bson import ObjectId
+
+from src.utils.toon_encoder import TOONEncoder, encode_toon
+
+CHUNK_SIZE = 64 * 1024
+SAMPLE_SIZE = 1000
+CURSOR_BATCH_SIZE = 500
+
+# CSV column holding fields that were not in the sampled header
+EXTRA_COLUMN = "_extra"
+
+Row = Dict[str, Any]
+Chunk = Union[str, bytes]
+
+
+# =============================================================================
+# Sources
+# =============================================================================
+
+
+async def iterate_cursor(cursor, batch_size: int = CURSOR_BATCH_SIZE) -> AsyncIterator[Row]:
+    """
+    Iterate a Motor cursor, or a pymongo cursor without blocking the event loop
+
+    Sync cursors (pymongo) are read ``batch_size`` documents
+    at a time on a worker thread.
+    """
+    if hasattr(cursor, "__aiter__"):
+        async for doc in cursor:
+            yield doc
+        return
+
+    while True:
+        batch = await asyncio.to_thread(lambda: list(itertools.islice(cursor, batch_size)))
+        if not batch:
+            return
+        for doc in batch:
+            yield doc
+
+
+def clean_document(doc: Row, flatten: bool = False) -> Row:
+    """
+    Make a MongoDB document serializable
+
+    Args:
+        doc: Raw document
+        flatten: Encode nested dicts/lists as JSON strings (for CSV)
+    """
+    clean = {}
+    for key, value in doc.items():
+        if isinstance(value, ObjectId):
+            clean[key] = str(value)
+        elif isinstance(value, datetime):
+            clean[key] = value.isoformat()
+        elif flatten and isinstance(value, (dict, list)):
+            clean[key] = json.dumps(value, default=str, ensure_ascii=False)
+        else:
+            clean[key] = value
+    return clean
+
+
+async def peek(rows: AsyncIterable[Row]) -> Tuple[Optional[Row], AsyncIterator[Row]]:
+    """
+    First row of a stream, and a stream that still yields it
+
+    Returns:
+        (first row or None if empty, full stream)
+    """
+    iterator = rows.__aiter__()
+    try:
+        first = await iterator.__anext__()
+    except StopAsyncIteration:
+        return None, _empty()
+
+    async def rejoined():
+        yield first
+        async for row in iterator:
+            yield row
+
+    return first, rejoined()
+
+
+async def merge_sorted(
+    streams: List[AsyncIterable[Row]], key: Callable[[Row], Any], reverse: bool = False
+) -> AsyncIterator[Row]:
+    """
+    Merge streams that are each sorted by ``key`` (ties keep stream order)
+
+    Holds one row per stream, e.g. to interleave per-source activity cursors
+    newest-first without collecting them.
+    """
+    iterators = [s.__aiter__() for s in streams]
+    heads: List[Optional[Row]] = []
+    for iterator in iterators:
+        heads.append(await _next_or_none(iterator))
+
+    while True:
+        best = None
+        for index, head in enumerate(heads):
+            if head is None:
+                continue
+            if best is None:
+                best = index
+                continue
+            current, candidate = key(heads[best]), key(head)
+            if (candidate > current) if reverse else (candidate < current):
+                best = index
+        if best is None:
+            return
+        yield heads[best]
+        heads[best] = await _next_or_none(iterators[best])
+
+
+async def _next_or_none(iterator: AsyncIterator[Row]) -> Optional[Row]:
+    try:
+        return await iterator.__anext__()
+    except StopAsyncIteration:
+        return None
+
+
+async def _empty() -> AsyncIterator[Row]:
+    return
+    yield
+
+
+async def _take(iterator: AsyncIterator[Row], count: int) -> List[Row]:
+    rows = []
+    while len(rows) < count:
+        row = await _next_or_none(iterator)
+        if row is None:
+            break
+        rows.append(row)
+    return rows
+
+
+# =============================================================================
+# Encoders
+# =============================================================================
+
+
+class _TextSink:
+    """File-like target for csv writers; buffered text is taken in chunks"""
+
+    def __init__(self):
+        self.parts: List[str] = []
+        self.size = 0
+
+    def write(self, text: str) -> int:
+        self.parts.append(text)
+        self.size += len(text)
+        return len(text)
+
+    def take(self) -> str:
+        text = "".join(self.parts)
+        self.parts = []
+        self.size = 0
+        return text
+
+
+async def encode_csv(
+    rows: AsyncIterable[Row],
+    fieldnames: Optional[List[str]] = None,
+    sort_fields: bool = False,
+    empty_header: Optional[List[str]] = None,
+    sample_size: int = SAMPLE_SIZE,
+    chunk_size: int = CHUNK_SIZE,
+) -> AsyncIterator[str]:
+    """
+    Encode rows as CSV
+
+    Args:
+        rows: Flat rows (see ``clean_document(flatten=True)``)
+        fieldnames: Fixed columns (skips sampling; other fields are dropped)
+        sort_fields: Sort sampled columns (default: first-seen order)
+        empty_header: Header written when there are no rows (default: nothing)
+        sample_size: Rows inspected to choose the columns
+        chunk_size: Approximate characters per yielded chunk
+    """
+    iterator = rows.__aiter__()
+    sink = _TextSink()
+    has_extra = False
+
+    if fieldnames is None:
+        sample = await _take(iterator, sample_size)
+        if not sample:
+            if empty_header:
+                csv.writer(sink).writerow(empty_header)
+                yield sink.take()
+            return
+
+        fieldnames = []
+        seen = set()
+        for row in sample:
+            for field in row:
+                if field not in seen:
+                    seen.add(field)
+                    fieldnames.append(field)
+        if sort_fields:
+            fieldnames.sort()
+        # More rows than the sample: later rows may carry unseen fields
+        if len(sample) >= sample_size:
+            has_extra = True
+            fieldnames.append(EXTRA_COLUMN)
+    else:
+        sample = []
+
+    known = set(fieldnames)
+    writer = csv.DictWriter(sink, fieldnames=fieldnames, extrasaction="ignore")
+    writer.writeheader()
+
+    async def all_rows():
+        for row in sample:
+            yield row
+        async for row in iterator:
+            yield row
+
+    async for row in all_rows():
+        if has_extra:
+            extra = {k: v for k, v in row.items() if k not in known}
+            if extra:
+                row = {**row, EXTRA_COLUMN: json.dumps(extra, default=str, ensure_ascii=False)}
+        writer.writerow(row)
+        if sink.size >= chunk_size:
+            yield sink.take()
+
+    if sink.size:
+        yield sink.take()
+
+
+async def encode_json_array(
+    rows: AsyncIterable[Row], indent: int = 2, chunk_size: int = CHUNK_SIZE
+) -> AsyncIterator[str]:
+    """Encode rows as a JSON array (same layout as ``json.dumps(rows, indent=indent)``)"""
+    sink = _TextSink()
+    prefix = " " * indent
+    first = True
+
+    async for row in rows:
+        item = json.dumps(row, indent=indent, default=str, ensure_ascii=False)
+        item = "\n".join(prefix + line for line in item.split("\n"))
+        sink.write(("[\n" if first else ",\n") + item)
+        first = False
+        if sink.size >= chunk_size:
+            yield sink.take()
+
+    sink.write("[]" if first else "\n]")
+    yield sink.take()
+
+
+async def encode_ndjson(rows: AsyncIterable[Row], chunk_size: int = CHUNK_SIZE) -> AsyncIterator[str]:
+    """Encode rows as newline-delimited JSON (one object per line)"""
+    sink = _TextSink()
+    async for row in rows:
+        sink.write(json.dumps(row, default=str, ensure_ascii=False) + "\n")
+        if sink.size >= chunk_size:
+            yield sink.take()
+    if sink.size:
+        yield sink.take()
+
+
+async def encode_toon_array(
+    key: str,
+    rows: AsyncIterable[Row],
+    count: Callable[[], Awaitable[int]],
+    delimiter: str = ",",
+    sample_size: int = SAMPLE_SIZE,
+    chunk_size: int = CHUNK_SIZE,
+) -> AsyncIterator[str]:
+    """
+    Encode rows as the TOON document ``{key: rows}``
+
+    Args:
+        key: Array name (collection name)
+        rows: Rows to encode
+        count: Returns the number of rows (only awaited for large exports;
+            at most that many rows are written)
+        delimiter: TOON delimiter
+    """
+    iterator = rows.__aiter__()
+    sample = await _take(iterator, sample_size)
+    if len(sample) < sample_size:
+        yield encode_toon({key: sample}, indent=2, delimiter=delimiter)
+        return
+
+    total = await count()
+    encoder = TOONEncoder(indent=2, delimiter=delimiter)
+    sink = _TextSink()
+    sink.write(f"{key}[{total}]:")
+    written = 0
+
+    async def all_rows():
+        for row in sample:
+            yield row
+        async for row in iterator:
+            yield row
+
+    async for row in all_rows():
+        if written >= total:
+            break
+        item = encoder.encode_list_item(row)
+        if item:
+            sink.write("\n" + item)
+        written += 1
+        if sink.size >= chunk_size:
+            yield sink.take()
+
+    if sink.size:
+        yield sink.take()
+
+
+# =============================================================================
+# Compression
+# =============================================================================
+
+
+def _to_bytes(chunk: Chunk) -> bytes:
+    return chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+
+
+async def gzip_chunks(chunks: AsyncIterable[Chunk], level: int = 6) -> AsyncIterator[bytes]:
+    """Gzip-compress a chunk stream"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        data = compressor.compress(_to_bytes(chunk))
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+class _ByteSink:
+    """Unseekable file for ZipFile (forces data descriptors instead of seeking back)"""
+
+    def __init__(self):
+        self.parts: List[bytes] = []
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        self.parts.append(bytes(data))
+        self.size += len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def take(self) -> bytes:
+        data = b"".join(self.parts)
+        self.parts = []
+        self.size = 0
+        return data
+
+
+async def zip_entries(
+    entries: AsyncIterable[Tuple[str, AsyncIterable[Chunk]]],
+    on_error: Optional[Callable[[str, Exception], None]] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """
+    Stream a ZIP archive built from (filename, chunk stream) entries
+
+    Args:
+        entries: Files to add, produced lazily
+        on_error: Called when an entry's stream fails; the entry is closed
+            with what was written so far and the archive continues
+    """
+    sink = _ByteSink()
+    archive = zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED)
+    try:
+        async for name, chunks in entries:
+            with archive.open(name, "w") as entry:
+                try:
+                    async for chunk in chunks:
+                        entry.write(_to_bytes(chunk))
+                        if sink.size >= chunk_size:
+                            yield sink.take()
+                except Exception as e:
+                    if on_error is None:
+                        raise
+                    on_error(name, e)
+            if sink.size:
+                yield sink.take()
+    finally:
+        archive.close()
+    yield sink.take()
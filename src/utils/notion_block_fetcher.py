@@ -0,0 +1,204 @@
+"""
+Async Notion block-tree fetcher
+
+Walks page block trees breadth-first: every child list of one tree level is
+requested concurrently, and several pages can be walked at once. All requests
+share one ``AdaptiveRateLimiter`` (Notion averages ~3 requests/second and
+answers bursts with 429 + ``Retry-After``) and a concurrency bound.
+
+Callers decide which blocks are kept (``include``) and which subtrees are
+walked (``descend``), e.g. to skip ``child_page`` blocks or subtrees that have
+not been edited since the previous snapshot.
+
+Example:
+    limiter = AdaptiveRateLimiter(rate=3)
+
+    async def fetch(page_ids):
+        async with AsyncClient(auth=token) as client:
+            fetcher = NotionBlockFetcher(client, limiter)
+            return await fetcher.fetch_trees(page_ids)
+
+    trees = run_sync(fetch(page_ids))
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from notion_client.errors import APIResponseError, HTTPResponseError
+
+from src.utils.logger import get_logger
+from src.utils.rate_limiter import AdaptiveRateLimiter, parse_retry_after
+
+logger = get_logger(__name__)
+
+# Statuses worth retrying (rate limit and transient server errors)
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+# (block, parent block id or None for top-level blocks), in document order
+BlockTree = List[Tuple[Dict[str, Any], Optional[str]]]
+
+
+def run_sync(coro):
+    """
+    Run a coroutine to completion from synchronous code
+
+    Plugins' ``collect_data`` is synchronous but is also called from inside
+    ``async def`` scripts, where ``asyncio.run`` raises RuntimeError. In that
+    case the coroutine runs on its own event loop in a worker thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    headers = getattr(error, "headers", None) or {}
+    return parse_retry_after(headers.get("retry-after"))
+
+
+class NotionBlockFetcher:
+    """
+    Concurrent, rate-limited reader for Notion blocks and comments
+
+    Args:
+        client: notion_client.AsyncClient (bound to the running event loop)
+        limiter: Shared AdaptiveRateLimiter
+        max_concurrency: Requests in flight at once (across all pages)
+        max_retries: Attempts per request on 429 / 5xx
+    """
+
+    def __init__(
+        self,
+        client,
+        limiter: AdaptiveRateLimiter,
+        max_concurrency: int = 4,
+        max_retries: int = 5,
+    ):
+        self.client = client
+        self.limiter = limiter
+        self.max_retries = max_retries
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self.requests = 0
+
+    async def _request(self, func: Callable[..., Any], **kwargs) -> Dict[str, Any]:
+        for attempt in range(1, self.max_retries + 1):
+            await self.limiter.acquire()
+            async with self._semaphore:
+                try:
+                    self.requests += 1
+                    response = await func(**kwargs)
+                except (APIResponseError, HTTPResponseError) as e:
+                    status = getattr(e, "status", None)
+                    if status not in RETRYABLE_STATUSES or attempt == self.max_retries:
+                        raise
+                    if status == 429:
+                        retry_after = _retry_after(e)
+                        self.limiter.on_throttled(retry_after)
+                        logger.warning(
+                            f"⚠️  Notion rate limited; backing off to {self.limiter.rate:.2f} req/s"
+                            + (f", retry after {retry_after:.0f}s" if retry_after else "")
+                        )
+                        continue
+                    error = e
+                else:
+                    self.limiter.on_success()
+                    return response
+            # Server error: back off outside the semaphore
+            wait = min(2 ** (attempt - 1), 30)
+            logger.warning(f"⚠️  Notion HTTP {getattr(error, 'status', '?')}, retrying in {wait}s")
+            await asyncio.sleep(wait)
+        raise RuntimeError("unreachable")
+
+    async def _paginate(self, func: Callable[..., Any], **kwargs) -> List[Dict[str, Any]]:
+        results = []
+        cursor = None
+        while True:
+            params = dict(kwargs, page_size=100)
+            if cursor:
+                params["start_cursor"] = cursor
+            response = await self._request(func, **params)
+            results.extend(response.get("results", []))
+            if not response.get("has_more"):
+                return results
+            cursor = response.get("next_cursor")
+
+    async def list_children(self, block_id: str) -> List[Dict[str, Any]]:
+        """All direct children of a block or page"""
+        return await self._paginate(self.client.blocks.children.list, block_id=block_id)
+
+    async def list_comments(self, block_id: str) -> List[Dict[str, Any]]:
+        """All comments on a page or block"""
+        return await self._paginate(self.client.comments.list, block_id=block_id)
+
+    async def fetch_tree(
+        self,
+        page_id: str,
+        include: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        descend: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        max_depth: Optional[int] = None,
+    ) -> BlockTree:
+        """
+        Fetch a page's block tree breadth-first
+
+        Args:
+            page_id: Notion page id
+            include: Keep a block (and consider its subtree); default: all
+            descend: Walk into a kept block with ``has_children``; default: all
+            max_depth: Levels to fetch (1 = top-level blocks only)
+
+        Returns:
+            [(block, parent_id)] in document order
+
+        Raises:
+            APIResponseError / HTTPResponseError if any listing fails, so
+            callers never mistake a partial tree for deleted blocks
+        """
+        children_of: Dict[Optional[str], List[Dict[str, Any]]] = {}
+        level: List[Optional[str]] = [None]
+        depth = 0
+
+        while level and (max_depth is None or depth < max_depth):
+            listings = await asyncio.gather(
+                *(self.list_children(block_id or page_id) for block_id in level)
+            )
+            next_level = []
+            for parent_id, children in zip(level, listings):
+                kept = [b for b in children if include is None or include(b)]
+                children_of[parent_id] = kept
+                next_level.extend(
+                    b["id"] for b in kept
+                    if b.get("has_children") and (descend is None or descend(b))
+                )
+            level = next_level
+            depth += 1
+
+        # Flatten in document order (parent followed by its subtree)
+        tree: BlockTree = []
+
+        def walk(parent_id: Optional[str]):
+            for block in children_of.get(parent_id, []):
+                tree.append((block, parent_id))
+                walk(block["id"])
+
+        walk(None)
+        return tree
+
+    async def fetch_trees(
+        self, page_ids: List[str], **options
+    ) -> Dict[str, Union[BlockTree, Exception]]:
+        """
+        Fetch several pages concurrently
+
+        Returns:
+            page_id -> block tree, or the exception that page failed with
+        """
+        results = await asyncio.gather(
+            *(self.fetch_tree(page_id, **options) for page_id in page_ids),
+            return_exceptions=True,
+        )
+        return dict(zip(page_ids, results))
@@ -0,0 +1,447 @@
+"""
+Request profiling and metrics
+
+- MetricsRegistry: thread-safe counters and histograms rendered in the
+  Prometheus text exposition format (no client library needed)
+- RequestProfile / current_profile: per-request accumulator carried in a
+  context variable, so Mongo commands issued while serving a request (Motor
+  copies the context into its executor threads) are attributed to its route
+- MongoCommandProfiler: pymongo ``CommandListener`` recording every command's
+  collection, duration and returned/affected document count
+- SamplingProfiler: optional background thread sampling all thread stacks
+  into folded stacks (flamegraph input)
+
+MongoDB does not report documents examined in command replies; slow
+commands are logged with their filter shape instead, so they can be checked
+with ``explain()`` (see ``src.core.index_manifest``).
+
+Example:
+    client = MongoClient(uri, event_listeners=[mongo_profiler])
+
+    profile = RequestProfile(route="/api/v1/members")
+    token = current_profile.set(profile)
+    ...
+    current_profile.reset(token)
+
+    text = metrics.render()
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter as _Counter
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pymongo import monitoring
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Log Mongo commands slower than this (seconds)
+SLOW_COMMAND_SECONDS = float(os.getenv("PROFILING_SLOW_COMMAND_SECONDS", "0.5"))
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Tuple[str, ...], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class CounterMetric:
+    """Monotonic counter with labels"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labels: Tuple[str, ...] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def value(self, *label_values: str) -> float:
+        return self._values.get(label_values, 0.0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labels, values)} {value:g}" for values, value in items]
+
+
+class HistogramMetric:
+    """Cumulative histogram with labels"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: Tuple[str, ...] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [bucket counts..., +Inf count, sum]
+        self._values: Dict[LabelValues, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str) -> None:
+        with self._lock:
+            state = self._values.get(label_values)
+            if state is None:
+                state = self._values[label_values] = [0.0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+            state[-2] += 1
+            state[-1] += value
+
+    def count(self, *label_values: str) -> int:
+        state = self._values.get(label_values)
+        return int(state[-2]) if state else 0
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((values, list(state)) for values, state in self._values.items())
+
+        lines = []
+        for values, state in items:
+            for bound, count in zip(self.buckets, state):
+                le = _format_labels(self.labels, values, f'le="{bound:g}"')
+                lines.append(f"{self.name}_bucket{le} {count:g}")
+            le = _format_labels(self.labels, values, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{le} {state[-2]:g}")
+            labels = _format_labels(self.labels, values)
+            lines.append(f"{self.name}_sum{labels} {state[-1]:.6f}")
+            lines.append(f"{self.name}_count{labels} {state[-2]:g}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named metrics rendered together by ``render``"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help_text: str, labels: Tuple[str, ...] = ()) -> CounterMetric:
+        return self._register(CounterMetric(name, help_text, labels))
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labels: Tuple[str, ...] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> HistogramMetric:
+        return self._register(HistogramMetric(name, help_text, labels, buckets))
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format (0.0.4)"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.help_text}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+http_request_duration = metrics.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ("method", "route", "status"),
+)
+mongo_command_duration = metrics.histogram(
+    "mongo_command_duration_seconds",
+    "MongoDB command latency by originating route",
+    ("command", "collection", "route"),
+)
+mongo_documents_returned = metrics.counter(
+    "mongo_documents_returned_total",
+    "Documents returned (reads) or affected (writes) by MongoDB commands",
+    ("command", "collection", "route"),
+)
+mongo_command_failures = metrics.counter(
+    "mongo_command_failures_total",
+    "Failed MongoDB commands",
+    ("command", "collection", "route"),
+)
+
+
+# =============================================================================
+# Per-request attribution
+# =============================================================================
+
+
+class RequestProfile:
+    """Mongo work done while serving one request"""
+
+    def __init__(self, route: str = "unknown", method: str = ""):
+        self.route = route
+        self.method = method
+        self.started = time.perf_counter()
+        self.mongo_commands = 0
+        self.mongo_seconds = 0.0
+        # (command, collection) -> [count, seconds, documents]
+        self.commands: Dict[Tuple[str, str], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, command: str, collection: str, seconds: float, documents: int) -> None:
+        with self._lock:
+            self.mongo_commands += 1
+            self.mongo_seconds += seconds
+            totals = self.commands.setdefault((command, collection), [0, 0.0, 0])
+            totals[0] += 1
+            totals[1] += seconds
+            totals[2] += documents
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def top_commands(self, limit: int = 5) -> List[Dict[str, Any]]:
+        """Command groups that spent the most time, slowest first"""
+        with self._lock:
+            items = sorted(self.commands.items(), key=lambda item: item[1][1], reverse=True)
+        return [
+            {
+                "command": command,
+                "collection": collection,
+                "count": int(count),
+                "seconds": seconds,
+                "documents": int(documents),
+            }
+            for (command, collection), (count, seconds, documents) in items[:limit]
+        ]
+
+    def summary(self) -> str:
+        parts = [
+            f"{c['collection']}.{c['command']} ×{c['count']} {c['seconds'] * 1000:.0f}ms ({c['documents']} docs)"
+            for c in self.top_commands()
+        ]
+        return ", ".join(parts)
+
+
+current_profile: ContextVar[Optional[RequestProfile]] = ContextVar("current_profile", default=None)
+
+# Commands whose value is the target collection name
+_COLLECTION_COMMANDS = {
+    "find",
+    "aggregate",
+    "count",
+    "distinct",
+    "insert",
+    "update",
+    "delete",
+    "findAndModify",
+    "createIndexes",
+    "listIndexes",
+}
+
+
+def command_collection(command_name: str, command: Dict[str, Any]) -> str:
+    """Target collection of a Mongo command ("" for database/admin commands)"""
+    if command_name == "getMore":
+        return str(command.get("collection", ""))
+    if command_name in _COLLECTION_COMMANDS:
+        value = command.get(command_name)
+        return value if isinstance(value, str) else ""
+    return ""
+
+
+def reply_documents(reply: Dict[str, Any]) -> int:
+    """Documents returned by a read or affected by a write"""
+    cursor = reply.get("cursor")
+    if isinstance(cursor, dict):
+        return len(cursor.get("firstBatch") or cursor.get("nextBatch") or [])
+    n = reply.get("n")
+    return int(n) if isinstance(n, (int, float)) else 0
+
+
+def _filter_shape(value: Any, depth: int = 0) -> Any:
+    """Filter with values replaced by ``?`` (keeps operators and field names)"""
+    if depth > 4:
+        return "…"
+    if isinstance(value, dict):
+        return {
+            key: _filter_shape(item, depth + 1) if key.startswith("$") or isinstance(item, (dict, list)) else "?"
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_filter_shape(value[0], depth + 1)] if value else []
+    return "?"
+
+
+class MongoCommandProfiler(monitoring.CommandListener):
+    """
+    pymongo command listener feeding the Mongo metrics
+
+    Started events are matched to their outcome by (connection, request id).
+    Commands issued outside a request are recorded under route ``background``.
+    """
+
+    def __init__(self, slow_seconds: float = SLOW_COMMAND_SECONDS):
+        self.slow_seconds = slow_seconds
+        self._pending: Dict[Tuple[Any, int], Tuple[str, Dict[str, Any], Optional[RequestProfile]]] = {}
+        self._lock = threading.Lock()
+
+    def started(self, event) -> None:
+        collection = command_collection(event.command_name, event.command)
+        if not collection:
+            return
+        shape = {}
+        if self.slow_seconds > 0:
+            query = event.command.get("filter") or event.command.get("pipeline") or event.command.get("query")
+            shape = query if query is not None else {}
+        with self._lock:
+            self._pending[(event.connection_id, event.request_id)] = (collection, shape, current_profile.get())
+
+    def _finish(self, event):
+        with self._lock:
+            return self._pending.pop((event.connection_id, event.request_id), None)
+
+    def succeeded(self, event) -> None:
+        pending = self._finish(event)
+        if pending is None:
+            return
+        collection, shape, profile = pending
+        seconds = event.duration_micros / 1_000_000
+        documents = reply_documents(event.reply)
+        route = profile.route if profile else "background"
+
+        mongo_command_duration.observe(seconds, event.command_name, collection, route)
+        mongo_documents_returned.inc(event.command_name, collection, route, amount=documents)
+        if profile is not None:
+            profile.record(event.command_name, collection, seconds, documents)
+
+        if self.slow_seconds and seconds >= self.slow_seconds:
+            logger.warning(
+                f"🐢 Slow Mongo command {collection}.{event.command_name} {seconds * 1000:.0f}ms "
+                f"({documents} docs) from {route}: {_filter_shape(shape)}"
+            )
+
+    def failed(self, event) -> None:
+        pending = self._finish(event)
+        if pending is None:
+            return
+        collection, _, profile = pending
+        mongo_command_failures.inc(event.command_name, collection, profile.route if profile else "background")
+
+
+mongo_profiler = MongoCommandProfiler()
+
+
+# =============================================================================
+# Sampling profiler
+# =============================================================================
+
+
+class SamplingProfiler:
+    """
+    Samples the stacks of all threads at a fixed interval
+
+    Stacks are aggregated as folded stacks (``frame;frame;frame count``),
+    the input format of flamegraph.pl / speedscope.
+
+    Args:
+        interval: Seconds between samples
+        max_depth: Innermost frames kept per stack
+    """
+
+    def __init__(self, interval: float = 0.01, max_depth: int = 64):
+        self.interval = interval
+        self.max_depth = max_depth
+        self.samples = 0
+        self._stacks: _Counter = _Counter()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        logger.info(f"🔬 Sampling profiler started (every {self.interval * 1000:.0f}ms)")
+
+    def stop(self) -> None:
+        if not self.running:
+            return
+        self._stop.set()
+        self._thread.join(timeout=1.0)
+        self._thread = None
+        logger.info(f"🔬 Sampling profiler stopped ({self.samples} samples)")
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stacks.clear()
+            self.samples = 0
+
+    def sample(self) -> None:
+        """Take one sample of every other thread"""
+        own = threading.get_ident()
+        stacks = []
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own:
+                continue
+            frames = []
+            while frame is not None and len(frames) < self.max_depth:
+                code = frame.f_code
+                frames.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                frame = frame.f_back
+            stacks.append(";".join(reversed(frames)))
+
+        with self._lock:
+            self.samples += 1
+            self._stacks.update(stacks)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def folded(self, limit: Optional[int] = None) -> str:
+        """Folded stacks, most sampled first"""
+        with self._lock:
+            items = self._stacks.most_common(limit)
+        return "\n".join(f"{stack} {count}" for stack, count in items) + "\n"
+
+
+sampling_profiler = SamplingProfiler(
+    interval=float(os.getenv("PROFILER_SAMPLING_INTERVAL_MS", "10")) / 1000.0
+)
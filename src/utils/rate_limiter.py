@@ -0,0 +1,348 @@
+"""
+Rate limiting helpers for API collectors
+
+- parse_retry_after: ``Retry-After`` header (seconds or HTTP-date) to seconds
+- TokenBucket: thread-safe token bucket used to pace concurrent workers
+- GitHubRateLimiter: paces GraphQL calls and honours the primary limit reported
+  by GitHub's ``rateLimit { remaining resetAt cost }`` field
+- SlackRateLimiter: per-method pacing from Slack's rate limit tiers, with a
+  global pause on ``Retry-After``
+- AdaptiveRateLimiter: asyncio pacing that backs off on 429 / Retry-After and
+  recovers gradually (used for the Notion API)
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional
+
+
+def parse_retry_after(value: Optional[str], now: Optional[datetime] = None) -> Optional[float]:
+    """
+    Seconds to wait from a ``Retry-After`` header
+
+    The header is either delay-seconds (``"120"``) or an HTTP-date
+    (``"Wed, 21 Oct 2015 07:28:00 GMT"``).
+
+    Args:
+        value: Header value (None if absent)
+        now: Current time for HTTP-dates (default: now, UTC)
+
+    Returns:
+        Seconds (never negative), or None if absent or unparseable
+    """
+    if value is None:
+        return None
+    value = str(value).strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at is None:
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - (now or datetime.now(timezone.utc))).total_seconds())
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket
+
+    Args:
+        rate: Tokens added per second
+        capacity: Maximum burst size
+        clock: Monotonic clock (injectable for tests)
+        sleep: Sleep function (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def set_rate(self, rate: float) -> None:
+        with self._lock:
+            self._refill()
+            self.rate = float(rate)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take ``tokens`` from the bucket, blocking until they are available
+
+        Requests larger than the capacity are allowed once the bucket is full
+        (the balance goes negative), so a single expensive call never deadlocks.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                needed = min(tokens, self.capacity)
+                if self._tokens >= needed:
+                    self._tokens -= tokens
+                    return waited
+                wait = (needed - self._tokens) / self.rate
+            self._sleep(wait)
+            waited += wait
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take ``tokens`` without blocking
+
+        Uses the same over-capacity rule as ``acquire``.
+
+        Returns:
+            0.0 if the tokens were taken, otherwise the seconds until they
+            would be available (nothing is taken)
+        """
+        with self._lock:
+            self._refill()
+            needed = min(tokens, self.capacity)
+            if self._tokens >= needed:
+                self._tokens -= tokens
+                return 0.0
+            return (needed - self._tokens) / self.rate
+
+
+class GitHubRateLimiter:
+    """
+    Rate limiter for the GitHub GraphQL API
+
+    Two limits are enforced:
+    - secondary limit: requests are paced by a token bucket measured in query
+      points (``points_per_minute``)
+    - primary limit: once ``remaining`` from the last ``rateLimit`` response
+      drops below ``reserve``, every caller waits until ``resetAt``
+
+    The expected cost of the next query is the ``cost`` GitHub reported for the
+    previous one. A secondary rate limit response (``Retry-After``) pauses
+    every caller through :meth:`pause`, like ``SlackRateLimiter``.
+    """
+
+    def __init__(
+        self,
+        points_per_minute: float = 900,
+        burst: float = 20,
+        reserve: int = 50,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.bucket = TokenBucket(points_per_minute / 60.0, burst, clock=clock, sleep=sleep)
+        self.reserve = reserve
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[datetime] = None
+        self.last_cost = 1
+        self._clock = clock
+        self._sleep = sleep
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until the next GraphQL query may be sent"""
+        with self._lock:
+            cost = self.last_cost
+            if self.remaining is not None and self.reset_at is not None:
+                if self.remaining - cost < self.reserve:
+                    wait = (self.reset_at - datetime.now(timezone.utc)).total_seconds() + 1
+                    self._paused_until = max(self._paused_until, self._clock() + wait)
+                    # Assume a fresh window after the pause until GitHub tells us otherwise
+                    self.remaining = None
+                    print(f"         ⏳ GitHub rate limit nearly exhausted, pausing requests {wait:.0f}s for reset...")
+            pause = self._paused_until - self._clock()
+
+        if pause > 0:
+            self._sleep(pause)
+
+        self.bucket.acquire(cost)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for ``seconds`` (a ``Retry-After``)"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+    def update(self, rate_limit: Optional[Dict[str, Any]]) -> None:
+        """Record a ``rateLimit { remaining resetAt cost }`` payload"""
+        if not rate_limit:
+            return
+
+        with self._lock:
+            if rate_limit.get("remaining") is not None:
+                self.remaining = int(rate_limit["remaining"])
+            if rate_limit.get("resetAt"):
+                self.reset_at = datetime.fromisoformat(rate_limit["resetAt"].replace("Z", "+00:00"))
+            if rate_limit.get("cost"):
+                self.last_cost = max(1, int(rate_limit["cost"]))
+
+
+# Slack Web API rate limit tiers: requests per minute, per method and workspace
+SLACK_TIER_RATES = {1: 1, 2: 20, 3: 50, 4: 100}
+
+SLACK_METHOD_TIERS = {
+    "users.list": 2,
+    "conversations.list": 2,
+    "conversations.history": 3,
+    "conversations.replies": 3,
+}
+
+
+class SlackRateLimiter:
+    """
+    Rate limiter for the Slack Web API
+
+    Each method is paced by its own token bucket, sized from its rate limit
+    tier. A ``ratelimited`` response pauses every method for ``Retry-After``
+    seconds, because concurrent workers would otherwise keep hitting the
+    limit while one of them backs off.
+
+    Args:
+        method_tiers: Method -> tier overrides (merged into SLACK_METHOD_TIERS)
+        default_tier: Tier of methods not listed
+        burst: Requests a method may send back to back
+        headroom: Fraction of each tier's budget to use, leaving room for
+            other clients of the same token
+    """
+
+    def __init__(
+        self,
+        method_tiers: Optional[Dict[str, int]] = None,
+        default_tier: int = 3,
+        burst: float = 3,
+        headroom: float = 0.9,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.method_tiers = {**SLACK_METHOD_TIERS, **(method_tiers or {})}
+        self.default_tier = default_tier
+        self.burst = burst
+        self.headroom = headroom
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def requests_per_minute(self, method: str) -> float:
+        tier = self.method_tiers.get(method, self.default_tier)
+        return SLACK_TIER_RATES.get(tier, SLACK_TIER_RATES[self.default_tier]) * self.headroom
+
+    def _bucket(self, method: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(method)
+            if bucket is None:
+                per_minute = self.requests_per_minute(method)
+                bucket = self._buckets[method] = TokenBucket(
+                    per_minute / 60.0,
+                    max(1.0, min(self.burst, per_minute)),
+                    clock=self._clock,
+                    sleep=self._sleep,
+                )
+            return bucket
+
+    def acquire(self, method: str) -> float:
+        """
+        Block until ``method`` may be called
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                pause = self._paused_until - self._clock()
+            if pause <= 0:
+                break
+            self._sleep(pause)
+            waited += pause
+        return waited + self._bucket(method).acquire()
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every method for ``seconds`` (a ``Retry-After``)"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+
+class AdaptiveRateLimiter:
+    """
+    Request pacing for asyncio code that adapts to server throttling
+
+    Requests are spaced ``1 / rate`` seconds apart. A 429 halves the rate and
+    pauses every caller for ``Retry-After`` seconds; each success raises the
+    rate again by ``recovery`` up to ``max_rate`` (AIMD).
+
+    The limiter holds no asyncio primitives, so one instance can be shared by
+    successive ``asyncio.run`` calls.
+
+    Args:
+        rate: Initial requests per second
+        max_rate: Upper bound for recovery (default: ``rate``)
+        min_rate: Lower bound for back-off
+        recovery: Requests/second regained per successful request
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        max_rate: Optional[float] = None,
+        min_rate: float = 0.2,
+        recovery: float = 0.05,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Any] = asyncio.sleep,
+    ):
+        self.max_rate = float(max_rate or rate)
+        self.min_rate = float(min_rate)
+        self.rate = min(float(rate), self.max_rate)
+        self.recovery = recovery
+        self._clock = clock
+        self._sleep = sleep
+        self._next_slot = 0.0
+        self._paused_until = 0.0
+
+    async def acquire(self) -> float:
+        """
+        Wait for the next request slot
+
+        Returns:
+            Seconds spent waiting
+        """
+        # No await between reading and reserving the slot, so this is atomic
+        # within the event loop
+        now = self._clock()
+        slot = max(now, self._next_slot, self._paused_until)
+        self._next_slot = slot + 1.0 / self.rate
+        wait = slot - now
+        if wait > 0:
+            await self._sleep(wait)
+        return wait
+
+    def on_success(self) -> None:
+        self.rate = min(self.max_rate, self.rate + self.recovery)
+
+    def on_throttled(self, retry_after: Optional[float] = None) -> None:
+        """Record a 429: halve the rate and pause for ``retry_after`` seconds"""
+        self.rate = max(self.min_rate, self.rate / 2)
+        pause = retry_after if retry_after is not None else 1.0 / self.rate
+        self._paused_until = max(self._paused_until, self._clock() + pause)
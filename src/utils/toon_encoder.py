@@ -193,20 +193,39 @@ class TOONEncoder:
         lines = [f"{indent_str}{key}[{len(arr)}]:"]
         
         for item in arr:
-            if isinstance(item, (str, int, float, bool, type(None))):
-                value_str = self._format_value(item)
-                lines.append(f"{indent_str}  - {value_str}")
-            elif isinstance(item, dict):
-                lines.append(f"{indent_str}  -")
-                nested = self._encode_object(item, level + 2)
-                if nested:
-                    lines.append(nested)
-            elif isinstance(item, list):
-                nested_arr = self._encode_array(item, level + 2)
-                lines.append(f"{indent_str}  - {nested_arr}")
+            item_str = self.encode_list_item(item, level)
+            if item_str:
+                lines.append(item_str)
         
         return '\n'.join(lines)
     
+    def encode_list_item(self, item: Any, level: int = 0) -> str:
+        """
+        Encode one ``-`` entry of a list-format array
+        
+        Lets callers stream large arrays: write the ``key[N]:`` header, then
+        one encoded item at a time.
+        
+        Args:
+            item: Array element
+            level: Indentation level of the array header
+            
+        Returns:
+            TOON lines for the item (empty for unsupported types)
+        """
+        indent_str = ' ' * (self.indent * level)
+        
+        if isinstance(item, (str, int, float, bool, type(None))):
+            value_str = self._format_value(item)
+            return f"{indent_str}  - {value_str}"
+        elif isinstance(item, dict):
+            nested = self._encode_object(item, level + 2)
+            return f"{indent_str}  -" + (f"\n{nested}" if nested else "")
+        elif isinstance(item, list):
+            nested_arr = self._encode_array(item, level + 2)
+            return f"{indent_str}  - {nested_arr}"
+        return ""
+    
     def _encode_list_array_root(self, arr: List[Any], level: int) -> str:
         """Encode root-level mixed array"""
         lines = [f"[{len(arr)}]:"]
@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+"""
+Tests for the daily activity rollups (src/core/activity_rollups.py)
+"""
+
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.activity_rollups import (
+    build_rollup_docs,
+    iso_week_label,
+    load_daily_totals,
+    refresh_rollups,
+    rollup_buckets,
+    summarize_code_changes,
+)
+
+
+class FakeTimeline:
+    def __init__(self, groups):
+        self.groups = groups
+        self.pipelines = []
+
+    def aggregate(self, pipeline, **kwargs):
+        self.pipelines.append(pipeline)
+        return iter(self.groups)
+
+
+class FakeRollups:
+    name = "daily_activity_rollups"
+
+    def __init__(self, docs=None):
+        self.docs = {d["_id"]: d for d in docs or []}
+
+    def bulk_write(self, operations, ordered=True):
+        for op in operations:
+            self.docs[op._filter["_id"]] = op._doc
+
+        class Result:
+            inserted_count = 0
+            upserted_count = len(operations)
+            matched_count = 0
+            modified_count = 0
+
+        return Result()
+
+    def delete_many(self, query):
+        keep = set(query["_id"]["$nin"])
+        for doc_id in list(self.docs):
+            doc = self.docs[doc_id]
+            if (doc["date"], doc["source_type"]) == (query["date"], query["source_type"]) and doc_id not in keep:
+                del self.docs[doc_id]
+
+
+class FakeAsyncCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def __aiter__(self):
+        self._iter = iter(self.docs)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._iter)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class FakeAsyncRollups:
+    def __init__(self, docs):
+        self.docs = docs
+        self.query = None
+
+    def find(self, query, projection=None):
+        self.query = query
+        return FakeAsyncCursor(self.docs)
+
+
+def group(member, activity_type, count, projects=(), repository="", additions=0, deletions=0):
+    return {
+        "_id": {
+            "member_key": member.lower(),
+            "project_keys": list(projects),
+            "repository": repository,
+            "activity_type": activity_type,
+        },
+        "member_name": member,
+        "count": count,
+        "additions": additions,
+        "deletions": deletions,
+    }
+
+
+def test_rollup_buckets_are_per_day_and_source():
+    rows = [
+        {"source_type": "github", "timestamp": datetime(2025, 11, 17, 23, 59)},
+        {"source_type": "github", "timestamp": datetime(2025, 11, 17, 1, 0)},
+        {"source_type": "slack", "timestamp": datetime(2025, 11, 18, 0, 0)},
+    ]
+    assert rollup_buckets(rows) == {("2025-11-17", "github"), ("2025-11-18", "slack")}
+
+
+def test_build_rollup_docs_merges_activity_types_and_only_counts_commit_lines():
+    docs = build_rollup_docs(
+        "2025-11-17",
+        "github",
+        [
+            group("Alice", "commit", 3, ["ooo"], "repo-a", additions=120, deletions=7),
+            group("Alice", "pull_request", 1, ["ooo"], "repo-a", additions=5, deletions=5),
+            group("Bob", "commit", 1, [], "repo-b", additions=2, deletions=1),
+        ],
+    )
+
+    by_member = {d["member_key"]: d for d in docs}
+    alice = by_member["alice"]
+    assert alice["_id"] == "2025-11-17|github|alice|ooo|repo-a"
+    assert alice["count"] == 4
+    assert alice["by_type"] == {"commit": 3, "pull_request": 1}
+    assert (alice["additions"], alice["deletions"]) == (120, 7)
+    assert by_member["bob"]["project_keys"] == []
+
+
+def test_refresh_replaces_bucket_and_drops_stale_dimensions():
+    stale = {"_id": "2025-11-17|slack|carol||", "date": "2025-11-17", "source_type": "slack"}
+    other_day = {"_id": "2025-11-16|slack|carol||", "date": "2025-11-16", "source_type": "slack"}
+    db = {
+        "activity_timeline": FakeTimeline([group("Dave", "message", 2)]),
+        "daily_activity_rollups": FakeRollups([stale, other_day]),
+    }
+
+    assert refresh_rollups(db, [("2025-11-17", "slack")]) == 1
+    # Refreshing again is idempotent
+    assert refresh_rollups(db, [("2025-11-17", "slack")]) == 1
+
+    rollups = db["daily_activity_rollups"].docs
+    assert set(rollups) == {"2025-11-17|slack|dave||", "2025-11-16|slack|carol||"}
+    assert rollups["2025-11-17|slack|dave||"]["count"] == 2
+
+    match = db["activity_timeline"].pipelines[0][0]["$match"]
+    assert match["source_type"] == "slack"
+    assert match["timestamp"]["$gte"] == datetime(2025, 11, 17)
+    assert match["timestamp"]["$lt"] == datetime(2025, 11, 18)
+
+
+def test_load_daily_totals_and_code_changes():
+    rollups = FakeAsyncRollups(
+        [
+            {"date": "2025-11-17", "source_type": "github", "count": 3,
+             "by_type": {"commit": 2, "review": 1}, "additions": 10, "deletions": 4},
+            {"date": "2025-11-17", "source_type": "github", "count": 1,
+             "by_type": {"commit": 1}, "additions": 5, "deletions": 0},
+            {"date": "2025-11-17", "source_type": "slack", "count": 7, "by_type": {"message": 7}},
+        ]
+    )
+    db = {"daily_activity_rollups": rollups}
+    end = datetime(2025, 11, 18, 12, 0)
+
+    totals = asyncio.run(
+        load_daily_totals(db, datetime(2025, 8, 20), end, {"member_key": "alice"})
+    )
+    assert rollups.query["member_key"] == "alice"
+    assert rollups.query["date"] == {"$gte": "2025-08-20", "$lte": "2025-11-18"}
+    assert totals["2025-11-17"]["github"]["by_type"] == {"commit": 3, "review": 1}
+    assert totals["2025-11-17"]["slack"]["count"] == 7
+
+    code_changes = summarize_code_changes(totals, end)
+    assert code_changes["total"] == {"additions": 15, "deletions": 4}
+    assert len(code_changes["daily"]) == 31
+    assert code_changes["daily"][-2] == {"date": "2025-11-17", "additions": 15, "deletions": 4}
+    assert code_changes["weekly"] == [{"week": iso_week_label("2025-11-17"), "additions": 15, "deletions": 4}]
+
+
+def test_iso_week_label_matches_mongo_format():
+    assert iso_week_label("2025-11-17") == "2025-47"
+    assert iso_week_label("2025-01-02") == "2025-01"
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+"""
+Tests for the unified activity timeline projection.
+
+Covers src/core/activity_timeline.py:
+- cursor encoding / keyset filter construction
+- source document normalizers
+- member and project resolution in ActivityTimelineWriter
+"""
+
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.activity_timeline import (
+    ActivityTimelineWriter,
+    build_keyset_filter,
+    date_range_filter,
+    decode_cursor,
+    encode_cursor,
+    normalize,
+    to_utc_naive,
+)
+
+
+class FakeCollection:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def find(self, *args, **kwargs):
+        return iter(self.docs)
+
+
+class FakeDB(dict):
+    def __getitem__(self, name):
+        return self.setdefault(name, FakeCollection([]))
+
+
+def test_to_utc_naive_converts_aware_and_strings():
+    aware = datetime(2025, 11, 17, 9, 0, tzinfo=timezone.utc)
+    assert to_utc_naive(aware) == datetime(2025, 11, 17, 9, 0)
+    assert to_utc_naive("2025-11-17T18:00:00+09:00") == datetime(2025, 11, 17, 9, 0)
+    assert to_utc_naive("2025-11-17T09:00:00Z") == datetime(2025, 11, 17, 9, 0)
+    assert to_utc_naive("2025-11-17") == datetime(2025, 11, 17)
+    assert to_utc_naive("not a date") is None
+    assert to_utc_naive(None) is None
+
+
+def test_date_range_filter_rejects_unparseable_bounds():
+    assert date_range_filter("2025-11-01", None) == {"$gte": datetime(2025, 11, 1)}
+    assert date_range_filter(None, "") == {}
+    with pytest.raises(ValueError, match="Invalid date"):
+        date_range_filter("2025-11-01", "yesterday")
+
+
+def test_cursor_round_trip():
+    ts = datetime(2025, 11, 17, 9, 30, 15, 123456)
+    cursor = encode_cursor(ts, "slack:C123:1763525860.094349")
+    assert decode_cursor(cursor) == (ts, "slack:C123:1763525860.094349")
+
+
+def test_decode_cursor_rejects_garbage():
+    with pytest.raises(ValueError):
+        decode_cursor("garbage")
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-date,abc")
+
+
+def test_keyset_filter_orders_by_timestamp_then_id():
+    ts = datetime(2025, 11, 17, 9, 0)
+    query = build_keyset_filter(encode_cursor(ts, "github_commit:abc"))
+    assert query == {
+        "$or": [
+            {"timestamp": {"$lt": ts}},
+            {"timestamp": ts, "_id": {"$lt": "github_commit:abc"}},
+        ]
+    }
+    assert build_keyset_filter(None) == {}
+
+
+def test_normalize_slack_thread_reply_and_excluded_channel():
+    msg = {
+        "channel_id": "C1",
+        "channel_name": "general",
+        "ts": "1763525860.094349",
+        "thread_ts": "1763525000.000100",
+        "user_id": "U1",
+        "text": "hello",
+        "posted_at": datetime(2025, 11, 19, 4, 17, 40),
+    }
+    row = normalize("slack_messages", msg)
+    assert row["_id"] == "slack:C1:1763525860.094349"
+    assert row["activity_type"] == "thread_reply"
+    assert row["metadata"]["url"].endswith("/C1/p1763525860094349")
+
+    assert normalize("slack_messages", {**msg, "channel_name": "tokamak-partners"}) is None
+
+
+def test_normalize_skips_bot_reviews_and_missing_timestamps():
+    review = {
+        "repository": "repo",
+        "pr_number": 1,
+        "reviewer": "github-actions[bot]",
+        "submitted_at": datetime(2025, 11, 1),
+    }
+    assert normalize("github_reviews", review) is None
+    assert normalize("github_commits", {"sha": "abc"}) is None
+
+
+def test_writer_resolves_member_and_projects():
+    db = FakeDB()
+    db["member_identifiers"] = FakeCollection(
+        [{"source": "github", "identifier_value": "JohnDoe", "member_name": "john"}]
+    )
+    db["projects"] = FakeCollection(
+        [{"key": "project-ooo", "repositories": ["zk-evm"], "is_active": True}]
+    )
+    writer = ActivityTimelineWriter(db)
+
+    rows = writer.build_rows(
+        "github_commits",
+        [
+            {
+                "sha": "abc123",
+                "repository": "zk-evm",
+                "author_name": "johndoe",
+                "date": datetime(2025, 11, 17, 9, 0),
+            }
+        ],
+    )
+
+    assert len(rows) == 1
+    assert rows[0]["member_name"] == "John"
+    assert rows[0]["member_key"] == "john"
+    assert rows[0]["project_keys"] == ["project-ooo"]
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+"""
+Tests for the batched MongoDB writer (src/core/bulk_writer.py)
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+from pymongo.errors import BulkWriteError
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.bulk_writer import AsyncBulkWriter, BulkWriter
+
+
+class FakeResult:
+    def __init__(self, operations):
+        self.inserted_count = 0
+        self.upserted_count = len(operations)
+        self.matched_count = 0
+        self.modified_count = 0
+
+
+class FakeCollection:
+    name = "fake"
+
+    def __init__(self, fail_batch=None):
+        self.batches = []
+        self.fail_batch = fail_batch
+
+    def bulk_write(self, operations, ordered=True):
+        assert ordered is False
+        self.batches.append(list(operations))
+        if len(self.batches) == self.fail_batch:
+            raise BulkWriteError(
+                {
+                    "nUpserted": len(operations) - 2,
+                    "writeErrors": [{"code": 11000}, {"code": 2}],
+                }
+            )
+        return FakeResult(operations)
+
+
+class FakeAsyncCollection(FakeCollection):
+    async def bulk_write(self, operations, ordered=True):
+        return FakeCollection.bulk_write(self, operations, ordered)
+
+
+def test_operations_are_sent_in_batches():
+    collection = FakeCollection()
+    with BulkWriter(collection, batch_size=3) as writer:
+        for i in range(7):
+            writer.update_one({"_id": i}, {"$set": {"v": i}})
+
+    assert [len(b) for b in collection.batches] == [3, 3, 1]
+    assert writer.result.batches == 3
+    assert writer.result.operations == 7
+    assert writer.result.upserted == 7
+    assert writer.result.errors == 0
+
+
+def test_bulk_write_errors_are_counted_not_raised():
+    collection = FakeCollection(fail_batch=1)
+    seen = []
+    with BulkWriter(collection, batch_size=5, on_batch=seen.append) as writer:
+        for i in range(5):
+            writer.replace_one({"_id": i}, {"_id": i})
+
+    assert writer.result.upserted == 3
+    assert writer.result.errors == 2
+    assert writer.result.duplicates == 1
+    assert len(seen) == 1
+
+
+def test_background_flush_writes_everything_on_close():
+    collection = FakeCollection()
+    writer = BulkWriter(collection, batch_size=10, max_pending_batches=1)
+    for i in range(95):
+        writer.insert_one({"_id": i})
+    result = writer.close()
+
+    assert sum(len(b) for b in collection.batches) == 95
+    assert result.batches == 10
+
+
+def test_async_writer_flushes_on_exit():
+    collection = FakeAsyncCollection()
+
+    async def run():
+        async with AsyncBulkWriter(collection, batch_size=4) as writer:
+            for i in range(6):
+                await writer.update_one({"date": i}, {"$set": {"v": i}})
+        return writer.result
+
+    result = asyncio.run(run())
+    assert [len(b) for b in collection.batches] == [4, 2]
+    assert result.upserted == 6
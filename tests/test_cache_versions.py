@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""
+Tests for the collection version counters (src/core/cache_versions.py)
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.cache_versions import (
+    CollectionVersionCache,
+    bump_collection_versions,
+    snapshot,
+)
+
+
+class FakeVersions:
+    def __init__(self):
+        self.docs = {}
+        self.finds = 0
+
+    def bulk_write(self, operations, ordered=True):
+        for op in operations:
+            doc = self.docs.setdefault(op._filter["_id"], {"_id": op._filter["_id"], "version": 0})
+            doc["version"] += op._doc["$inc"]["version"]
+
+    def find(self, query, projection=None):
+        self.finds += 1
+        docs = [dict(doc) for doc in self.docs.values()]
+
+        class Cursor:
+            async def to_list(self, length=None):
+                return docs
+
+        return Cursor()
+
+
+def test_bump_upserts_each_collection_once():
+    db = {"cache_versions": FakeVersions()}
+
+    bump_collection_versions(db, "slack_messages", "activity_timeline", "slack_messages", "")
+    bump_collection_versions(db, "activity_timeline")
+    bump_collection_versions(db)
+
+    versions = {doc_id: doc["version"] for doc_id, doc in db["cache_versions"].docs.items()}
+    assert versions == {"slack_messages": 1, "activity_timeline": 2}
+
+
+def test_version_cache_rereads_after_interval():
+    db = {"cache_versions": FakeVersions()}
+    cache = CollectionVersionCache(check_interval=60)
+    bump_collection_versions(db, "members")
+
+    assert asyncio.run(cache.get_async(db)) == {"members": 1}
+    bump_collection_versions(db, "members")
+    assert asyncio.run(cache.get_async(db)) == {"members": 1}  # within the interval
+    assert db["cache_versions"].finds == 1
+
+    cache.invalidate()
+    versions = asyncio.run(cache.get_async(db))
+    assert versions == {"members": 2}
+    assert snapshot(versions, ["members", "projects"]) == {"members": 2, "projects": 0}
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""
+Tests for per-source collection checkpoints (src/core/checkpoints.py)
+"""
+
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.checkpoints import CheckpointStore, resume_from
+from src.plugins.github_plugin_mongo import GitHubPluginMongo
+
+
+class FakeCollection:
+    def __init__(self, docs=None):
+        self.docs = list(docs or [])
+        self.writes = []
+
+    def find(self, query, projection=None):
+        return [dict(d) for d in self.docs if d["source"] == query["source"]]
+
+    def bulk_write(self, operations, ordered=True):
+        self.writes.extend(operations)
+
+
+class FakeDB(dict):
+    def __init__(self, docs=None):
+        super().__init__(collection_checkpoints=FakeCollection(docs))
+
+
+def test_stage_keeps_newest_timestamp_and_commits_once():
+    db = FakeDB()
+    store = CheckpointStore(db, "slack")
+
+    store.stage("C1", cursor="100.1", timestamp=datetime(2025, 11, 17, 10))
+    store.stage("C1", timestamp=datetime(2025, 11, 17, 9))
+    store.stage("C2", cursor="200.2")
+
+    assert store.commit() == 2
+    assert store.commit() == 0
+
+    writes = {op._filter["scope"]: op._doc["$set"] for op in db["collection_checkpoints"].writes}
+    assert writes["C1"]["cursor"] == "100.1"
+    assert writes["C1"]["timestamp"] == datetime(2025, 11, 17, 10, tzinfo=timezone.utc)
+    assert "timestamp" not in writes["C2"]
+
+
+def test_disabled_store_reads_nothing_and_writes_nothing():
+    db = FakeDB([{"source": "notion", "scope": "pages", "timestamp": datetime(2025, 11, 17)}])
+    store = CheckpointStore(db, "notion", enabled=False)
+
+    store.stage("pages", timestamp=datetime(2025, 11, 18))
+    assert store.get("pages") is None
+    assert store.commit() == 0
+    assert db["collection_checkpoints"].writes == []
+
+
+def test_resume_from_only_moves_start_forward():
+    start = datetime(2025, 11, 17)
+    assert resume_from(start, None) == start
+    assert resume_from(start, {"timestamp": datetime(2025, 11, 16)}) == start
+    assert resume_from(start, {"timestamp": datetime(2025, 11, 17, 6)}) == datetime(2025, 11, 17, 6)
+
+    aware = datetime(2025, 11, 17, tzinfo=timezone.utc)
+    assert resume_from(aware, {"timestamp": datetime(2025, 11, 17, 6)}).tzinfo is not None
+
+
+def test_github_skips_repositories_unchanged_since_checkpoint():
+    db = FakeDB(
+        [
+            {
+                "source": "github",
+                "scope": "repo-a",
+                "etag": "2025-11-17T10:00:00Z",
+                "covered_since": datetime(2025, 11, 1, tzinfo=timezone.utc),
+            }
+        ]
+    )
+    plugin = GitHubPluginMongo.__new__(GitHubPluginMongo)
+    plugin.checkpoints = CheckpointStore(db, "github")
+    since = datetime(2025, 11, 4)
+
+    assert not plugin._repo_changed({"name": "repo-a", "pushedAt": "2025-11-17T10:00:00Z"}, since)
+    assert plugin._repo_changed({"name": "repo-a", "pushedAt": "2025-11-18T08:00:00Z"}, since)
+    # an earlier window than the last crawl covered needs a re-crawl
+    assert plugin._repo_changed(
+        {"name": "repo-a", "pushedAt": "2025-11-17T10:00:00Z"}, datetime(2025, 10, 20)
+    )
+    assert plugin._repo_changed({"name": "repo-b", "pushedAt": "2025-11-17T10:00:00Z"}, since)
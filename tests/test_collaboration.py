@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+"""
+Tests for the collaboration engine (src/core/collaboration.py)
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.collaboration import (
+    CollaborationMatrix,
+    _to_micros,
+    group_threads,
+    issue_pairs,
+    issue_repository,
+    project_from_channel_name,
+    project_from_repo,
+    pull_request_pairs,
+    recency_multipliers,
+    thread_pairs,
+)
+
+NOW = datetime(2025, 11, 17, 12, 0)
+
+
+def test_recency_multiplier_matches_day_buckets():
+    times = np.array(
+        [
+            _to_micros(NOW),
+            _to_micros(NOW - timedelta(days=45, hours=1)),
+            _to_micros(NOW - timedelta(days=200)),
+            _to_micros(None),
+        ]
+    )
+
+    assert recency_multipliers(times, NOW).tolist() == pytest.approx([1.0, 0.5, 0.3, 1.0])
+
+
+def test_project_inference():
+    assert project_from_repo("Tokamak-zk-EVM") == "ooo"
+    assert project_from_repo("trh-sdk") == "trh"
+    assert project_from_repo("website") is None
+    assert project_from_channel_name("project-ecosystem") == "eco"
+    assert project_from_channel_name(None) is None
+
+
+def test_matrix_is_symmetric_and_sums_sources():
+    matrix = CollaborationMatrix(now=NOW)
+    matrix.add("Alice", "Bob", "github_pr_review", NOW, "trh")
+    matrix.add("bob", "alice", "slack_thread", NOW - timedelta(days=9), "ooo")
+    matrix.add("Alice", "alice", "slack_thread", NOW)  # self-pair ignored
+    matrix.add("Alice", "Carol", "github_issue", None)
+
+    alice = matrix.network("alice")
+    assert set(alice) == {"Bob", "Carol"}
+    bob = alice["Bob"]
+    assert bob["total_score"] == pytest.approx(3.0 + 2.0 * 0.9)
+    assert bob["interaction_count"] == 2
+    assert bob["common_projects"] == ["ooo", "trh"]
+    assert bob["first_interaction"] == NOW - timedelta(days=9)
+    assert bob["last_interaction"] == NOW
+    assert [d["source"] for d in bob["details"]] == ["github_pr_review", "slack_thread"]
+    assert alice["Carol"]["first_interaction"] is None
+
+    assert matrix.network("Bob")["Alice"]["total_score"] == pytest.approx(bob["total_score"])
+    assert matrix.network("Alice", min_score=4.0).keys() == {"Bob"}
+
+    edges = matrix.edges()
+    assert [(e["source_name"], e["target_name"]) for e in edges] == [("Alice", "Bob"), ("Alice", "Carol")]
+
+
+def test_pairs_from_pull_requests_issues_and_threads():
+    pr = {"author": "alice-gh", "reviews": [{"reviewer": "bob-gh"}, {"reviewer": "alice-gh"}, {"reviewer": "bob-gh"}]}
+    # Self-reviews and repeated reviews count once
+    assert pull_request_pairs(pr) == [("alice-gh", "bob-gh")]
+    assert pull_request_pairs({"reviews": [{"reviewer": "bob-gh"}]}) == []
+
+    issue = {"user": {"login": "carol"}, "assignees": [{"login": "alice-gh"}, "bob-gh"], "repository_name": "website"}
+    assert issue_pairs(issue) == [("alice-gh", "bob-gh"), ("alice-gh", "carol"), ("bob-gh", "carol")]
+    assert issue_repository(issue) == "website"
+
+    threads = group_threads(
+        [
+            {"thread_ts": "1.0", "user_name": "alice", "posted_at": NOW - timedelta(days=1), "channel_id": "C1"},
+            {"thread_ts": "1.0", "user_name": "bob", "posted_at": NOW, "channel_id": "C1"},
+            {"thread_ts": "2.0", "user_name": "alice", "posted_at": NOW, "channel_id": "C2"},
+        ]
+    )
+    assert threads["1.0"]["latest"] == NOW and threads["1.0"]["channel_id"] == "C1"
+    assert thread_pairs(threads["1.0"]) == [("alice", "bob")]
+    assert thread_pairs(threads["2.0"]) == []
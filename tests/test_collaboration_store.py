@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+"""
+Tests for the materialized collaboration store (src/core/collaboration_store.py)
+"""
+
+import asyncio
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.collaboration import CollaborationMatrix, _Resolver
+from src.core.collaboration_store import (
+    build_event,
+    load_collaboration_matrix,
+    pull_request_event,
+    refresh_days,
+)
+from src.core.identity_index import IdentityIndex
+
+NOW = datetime(2025, 11, 17, 12, 0)
+
+
+class FakeEvents:
+    def __init__(self, groups):
+        self.groups = groups
+
+    def aggregate(self, pipeline, **kwargs):
+        return iter(self.groups)
+
+
+class FakeDaily:
+    name = "collaboration_daily"
+
+    def __init__(self, docs=None):
+        self.docs = {d["_id"]: d for d in docs or []}
+
+    def bulk_write(self, operations, ordered=True):
+        for op in operations:
+            self.docs[op._filter["_id"]] = op._doc
+
+        class Result:
+            inserted_count = 0
+            upserted_count = len(operations)
+            matched_count = 0
+            modified_count = 0
+
+        return Result()
+
+    def delete_many(self, query):
+        keep = set(query["_id"]["$nin"])
+        for doc_id in list(self.docs):
+            if self.docs[doc_id]["date"] == query["date"] and doc_id not in keep:
+                del self.docs[doc_id]
+
+
+class FakeAsyncCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def __aiter__(self):
+        async def gen():
+            for doc in self.docs:
+                yield doc
+
+        return gen()
+
+
+class FakeAsyncDaily:
+    def __init__(self, docs):
+        self.docs = docs
+        self.query = None
+
+    def find(self, query, projection=None):
+        self.query = query
+        return FakeAsyncCursor(self.docs)
+
+
+def test_build_event_normalizes_pairs():
+    event = build_event(
+        "thread:C1:1.0",
+        "slack_thread",
+        "2025-11-16T23:30:00+09:00",
+        "ooo",
+        [("Bob", "Alice"), ("alice", "Bob"), ("Alice", "alice"), ("Carol", "")],
+    )
+
+    assert event["date"] == "2025-11-16"
+    assert event["timestamp"] == datetime(2025, 11, 16, 14, 30)
+    assert event["pairs"] == [{"a": "Alice", "b": "Bob", "a_key": "alice", "b_key": "bob"}]
+    assert build_event("x", "slack_thread", None, None, [("A", "B")]) is None
+    assert build_event("x", "slack_thread", NOW, None, [("A", "a")]) is None
+
+
+def test_pull_request_event_resolves_members():
+    identity = IdentityIndex.from_documents(
+        [
+            {"source": "github", "identifier_value": "alice-gh", "member_name": "Alice"},
+            {"source": "github", "identifier_value": "bob-gh", "member_name": "Bob"},
+        ]
+    )
+    pr = {
+        "repository": "trh-sdk",
+        "number": 7,
+        "author": "alice-gh",
+        "reviews": [{"reviewer": "bob-gh"}, {"reviewer": "alice-gh"}],
+        "created_at": NOW,
+    }
+
+    event_id, event = pull_request_event(pr, _Resolver(identity))
+
+    assert event_id == "pr:trh-sdk#7"
+    assert event["source"] == "github_pr_review"
+    assert event["project_key"] == "trh"
+    assert [(p["a"], p["b"]) for p in event["pairs"]] == [("Alice", "Bob")]
+
+    # No reviewers left: the event is dropped (and deleted if it existed)
+    assert pull_request_event(dict(pr, reviews=[]), _Resolver(identity)) == ("pr:trh-sdk#7", None)
+
+
+def test_refresh_days_replaces_the_day():
+    stale = {"_id": "2025-11-16|slack_thread|alice|carol", "date": "2025-11-16"}
+    other_day = {"_id": "2025-11-15|slack_thread|alice|carol", "date": "2025-11-15"}
+    db = {
+        "collaboration_events": FakeEvents(
+            [
+                {
+                    "_id": {"source": "slack_thread", "a_key": "alice", "b_key": "bob"},
+                    "member_a": "Alice",
+                    "member_b": "Bob",
+                    "count": 2,
+                    "first_at": NOW - timedelta(hours=2),
+                    "last_at": NOW,
+                    "project_keys": ["ooo", None],
+                }
+            ]
+        ),
+        "collaboration_daily": FakeDaily([stale, other_day]),
+    }
+
+    assert refresh_days(db, ["2025-11-16"]) == 1
+
+    docs = db["collaboration_daily"].docs
+    assert set(docs) == {"2025-11-16|slack_thread|alice|bob", other_day["_id"]}
+    bucket = docs["2025-11-16|slack_thread|alice|bob"]
+    assert (bucket["member_a_key"], bucket["count"], bucket["project_keys"]) == ("alice", 2, ["ooo"])
+
+
+def test_buckets_score_by_day_and_count():
+    matrix = CollaborationMatrix(now=NOW)
+    matrix.add_bucket("Alice", "Bob", "github_pr_review", 2, datetime(2025, 11, 8), project_keys=["trh"])
+    matrix.add_bucket("Bob", "Alice", "slack_thread", 1, datetime(2025, 11, 17), NOW, NOW)
+
+    bob = matrix.network("Alice")["Bob"]
+    assert bob["total_score"] == pytest.approx(2 * 3.0 * 0.9 + 2.0)
+    assert bob["interaction_count"] == 3
+    assert bob["first_interaction"] == datetime(2025, 11, 8)
+    assert bob["last_interaction"] == NOW
+    assert bob["common_projects"] == ["trh"]
+
+
+def test_load_collaboration_matrix_for_a_member():
+    daily = FakeAsyncDaily(
+        [
+            {
+                "date": "2025-11-16",
+                "source": "slack_thread",
+                "member_a": "Alice",
+                "member_b": "Bob",
+                "count": 3,
+                "first_at": NOW - timedelta(days=1),
+                "last_at": NOW - timedelta(days=1),
+                "project_keys": ["ooo"],
+            }
+        ]
+    )
+    db = {"collaboration_daily": daily}
+
+    matrix = asyncio.run(load_collaboration_matrix(db, NOW - timedelta(days=90), NOW, member_name="alice", now=NOW))
+
+    assert daily.query == {
+        "date": {"$gte": "2025-08-19", "$lte": "2025-11-17"},
+        "$or": [{"member_a_key": "alice"}, {"member_b_key": "alice"}],
+    }
+    assert matrix.network("alice")["Bob"]["interaction_count"] == 3
+    assert matrix.edges()[0]["total_score"] == pytest.approx(3 * 2.0 * (1 - 1 / 90))
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+"""
+Tests for the concurrent collection orchestrator (src/core/collection_orchestrator.py)
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.collection_orchestrator import (
+    CollectionOrchestrator,
+    PermanentSourceError,
+    SourceDisabled,
+    SourcePolicy,
+)
+from src.core.checkpoints import CHECKPOINTS_COLLECTION, CheckpointStore
+
+
+def test_blocking_sources_run_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+
+    def blocking_collect():
+        # Only passes if both sources are inside a blocking call at once
+        barrier.wait()
+        return 3
+
+    async def job(ctx):
+        return await ctx.run_blocking("collect", blocking_collect)
+
+    runs = asyncio.run(CollectionOrchestrator().run({"github": job, "slack": job}))
+
+    assert {r.status for r in runs.values()} == {"success"}
+    assert runs["github"].items_collected == 3
+    assert "collect" in runs["slack"].timings
+
+
+def test_timeout_does_not_hold_up_other_sources():
+    release = threading.Event()
+
+    async def slow(ctx):
+        return await ctx.run_blocking("collect", release.wait)
+
+    async def fast(ctx):
+        return 1
+
+    completed = []
+
+    async def on_complete(run):
+        completed.append(run.source)
+
+    orchestrator = CollectionOrchestrator(
+        {"notion": SourcePolicy(timeout_seconds=0.2)}, on_complete=on_complete
+    )
+    started = time.perf_counter()
+    runs = asyncio.run(orchestrator.run({"notion": slow, "github": fast}))
+    release.set()
+
+    assert time.perf_counter() - started < 2
+    assert runs["notion"].status == "timeout"
+    assert runs["github"].status == "success"
+    assert completed == ["github", "notion"]
+
+
+def test_retries_until_success_but_not_permanent_errors():
+    calls = {"slack": 0, "drive": 0}
+
+    async def flaky(ctx):
+        calls["slack"] += 1
+        if calls["slack"] < 3:
+            raise RuntimeError("ratelimited")
+        return 7
+
+    async def bad_credentials(ctx):
+        calls["drive"] += 1
+        raise PermanentSourceError("Authentication failed")
+
+    async def disabled(ctx):
+        raise SourceDisabled("notion")
+
+    policy = SourcePolicy(max_attempts=3, retry_delay_seconds=0)
+    orchestrator = CollectionOrchestrator({"slack": policy, "drive": policy})
+    runs = asyncio.run(
+        orchestrator.run({"slack": flaky, "drive": bad_credentials, "notion": disabled})
+    )
+
+    assert (runs["slack"].status, runs["slack"].attempts, runs["slack"].items_collected) == ("success", 3, 7)
+    assert (runs["drive"].status, calls["drive"]) == ("failed", 1)
+    assert runs["drive"].error_message == "Authentication failed"
+    assert runs["notion"].status == "disabled"
+
+
+def test_policy_from_config_overlays_defaults():
+    default = SourcePolicy(timeout_seconds=600, max_attempts=2)
+    policy = SourcePolicy.from_config({"max_attempts": 4, "max_threads": 2}, default)
+
+    assert policy.timeout_seconds == 600
+    assert policy.max_attempts == 4
+    assert policy.max_threads == 2
+    assert SourcePolicy.from_config(None, default) == default
+
+
+def test_max_threads_bounds_concurrent_blocking_calls():
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def blocking_call():
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.05)
+        with lock:
+            active["now"] -= 1
+        return 1
+
+    async def job(ctx):
+        results = await asyncio.gather(*(ctx.run_blocking("collect", blocking_call) for _ in range(6)))
+        return sum(results)
+
+    runs = asyncio.run(CollectionOrchestrator({"drive": SourcePolicy(max_threads=2)}).run({"drive": job}))
+
+    assert runs["drive"].items_collected == 6
+    assert active["peak"] == 2
+
+
+def test_abandoned_source_does_not_commit_checkpoints():
+    committed = []
+    release = threading.Event()
+    finished = threading.Event()
+
+    class FakeCheckpoints:
+        def bulk_write(self, operations, ordered=True):
+            committed.extend(operations)
+
+    store = CheckpointStore({CHECKPOINTS_COLLECTION: FakeCheckpoints()}, "notion")
+
+    def collect():
+        release.wait(5)
+        store.stage(timestamp=datetime(2025, 1, 1, tzinfo=timezone.utc))
+        store.commit()
+        finished.set()
+
+    async def job(ctx):
+        ctx.guard(store)
+        return await ctx.run_blocking("collect", collect)
+
+    runs = asyncio.run(CollectionOrchestrator({"notion": SourcePolicy(timeout_seconds=0.1)}).run({"notion": job}))
+    release.set()
+
+    assert runs["notion"].status == "timeout"
+    assert finished.wait(5)
+    assert committed == []
@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+"""
+Tests for the semantic index (src/core/embeddings.py, src/core/embedding_index.py)
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.embedding_index import SemanticIndex, VectorStore, build_chunks
+from src.core.embeddings import Chunk, HashingEmbedder, commit_chunks, normalize_rows, split_text
+
+
+class FakeChunks:
+    """embedding_chunks with the query shapes used by SemanticIndex"""
+
+    def __init__(self):
+        self.docs = {}
+
+    def find(self, query, projection=None):
+        docs = list(self.docs.values())
+        if "source_id" in query:
+            docs = [d for d in docs if d["source_id"] in query["source_id"]["$in"]]
+        if "row" in query:
+            docs = [d for d in docs if d["row"] in query["row"]["$in"]]
+        if "source_type" in query:
+            docs = [d for d in docs if d["source_type"] == query["source_type"]]
+        if "timestamp" in query:
+            low, high = query["timestamp"].get("$gte"), query["timestamp"].get("$lte")
+            docs = [d for d in docs if (low is None or d["timestamp"] >= low) and (high is None or d["timestamp"] <= high)]
+        return [dict(d) for d in docs]
+
+    def bulk_write(self, operations, ordered=True):
+        if getattr(self, "fail", False):
+            raise RuntimeError("write failed")
+        for op in operations:
+            chunk_id = op._filter["_id"]
+            if hasattr(op, "_doc"):
+                self.docs[chunk_id] = {"_id": chunk_id, **op._doc["$set"]}
+            else:
+                self.docs.pop(chunk_id, None)
+
+
+class CountingEmbedder(HashingEmbedder):
+    def __init__(self):
+        super().__init__(dim=64)
+        self.embedded = []
+
+    def embed(self, texts):
+        self.embedded.extend(texts)
+        return super().embed(texts)
+
+
+def test_split_text_bounds_chunks_with_overlap():
+    text = " ".join(f"Sentence {i} about the bridge fee." for i in range(300))
+    chunks = split_text(text, max_chars=300, overlap=50)
+
+    assert len(chunks) > 1
+    assert all(len(c) <= 300 for c in chunks)
+    # Each chunk starts with context from the end of the previous one
+    assert chunks[1].split(" Sentence")[0] in chunks[0]
+    assert split_text("   ") == []
+
+
+def test_slack_thread_chunks_rebuild_whole_threads():
+    messages = {
+        "m1": {"channel_id": "C1", "channel_name": "dev", "ts": "1.000", "thread_ts": "1.000",
+               "user_name": "ale", "text": "Should we lower the bridge fee?", "posted_at": datetime(2025, 1, 1)},
+        "m2": {"channel_id": "C1", "channel_name": "dev", "ts": "2.000", "thread_ts": "1.000",
+               "user_name": "kevin", "text": "Yes, gas costs dropped", "posted_at": datetime(2025, 1, 2)},
+    }
+
+    class Messages:
+        def find(self, query, projection=None):
+            return [m for m in messages.values() if m["thread_ts"] in query["thread_ts"]["$in"]]
+
+    db = {"slack_messages": Messages()}
+    short = {"channel_id": "C1", "ts": "3.000", "user_name": "ale", "text": "ok"}
+
+    # Only the reply arrived in this batch; the chunk still covers the thread
+    chunks, source_ids = build_chunks(db, "slack_messages", [messages["m2"], short])
+
+    assert source_ids == ["slack_thread:C1:3.000", "slack_thread:C1:1.000"]
+    assert len(chunks) == 1
+    assert chunks[0].text == "ale: Should we lower the bridge fee?\nkevin: Yes, gas costs dropped"
+    assert chunks[0].members == ["ale", "kevin"]
+    assert chunks[0].url == "https://tokamak-network.slack.com/archives/C1/p1000"
+
+
+def test_vector_store_ivf_search_and_tombstones(tmp_path):
+    rng = np.random.default_rng(0)
+    vectors = normalize_rows(rng.normal(size=(600, 16)).astype(np.float32))
+
+    store = VectorStore(tmp_path, dim=16, embedder="test", nprobe=16, min_train_rows=256)
+    for start in range(0, 600, 200):
+        with store.lock() as writer:
+            writer.append(vectors[start : start + 200], range(start + 1, start + 201))
+            writer.maybe_train()
+            writer.commit()
+
+    # Trained at 400 rows; later rows join the existing lists until it doubles
+    assert store.trained_rows == 400 and store.centroids is not None
+
+    # Another process sees committed rows through meta.json
+    reader = VectorStore(tmp_path, dim=16, embedder="test", nprobe=16)
+    assert reader.search(vectors[42], 1)[0][0] == 42
+    assert reader.search(vectors[555], 1)[0][0] == 555
+
+    with store.lock() as writer:
+        writer.delete([42])
+        writer.commit()
+    assert 42 not in [row for row, _ in reader.search(vectors[42], 5)]
+
+
+def test_semantic_index_reembeds_only_changed_chunks(tmp_path):
+    embedder = CountingEmbedder()
+    index = SemanticIndex(VectorStore(tmp_path, embedder.dim, embedder.name), embedder)
+    db = {"embedding_chunks": FakeChunks()}
+
+    commits = [
+        {"sha": "a1", "repository": "bridge", "message": "Lower the bridge withdrawal fee", "date": datetime(2025, 1, 1)},
+        {"sha": "b2", "repository": "ui", "message": "Fix dark mode colors on the dashboard", "date": datetime(2025, 1, 2)},
+    ]
+    chunks = [c for doc in commits for c in commit_chunks(doc)]
+    assert index.upsert(db, chunks) == 2
+    assert index.upsert(db, chunks) == 0
+    assert len(embedder.embedded) == 2
+
+    commits[1]["message"] = "Fix dark mode contrast on the dashboard"
+    assert index.upsert(db, commit_chunks(commits[1])) == 1
+    assert index.store.rows == 3
+
+    hits = index.search(db, "bridge fee for withdrawals", k=2)
+    assert hits[0]["chunk_id"] == "github_commit:a1:0"
+    assert hits[0]["timestamp"] == "2025-01-01T00:00:00Z"
+    # The replaced vector is gone; the chunk appears once, at its new row
+    assert [h["chunk_id"] for h in index.search(db, "dark mode dashboard", k=5)].count("github_commit:b2:0") == 1
+
+    # A source without chunks anymore is removed
+    index.upsert(db, [], source_ids=["github_commit:b2"])
+    assert "github_commit:b2:0" not in db["embedding_chunks"].docs
+
+
+def test_filtered_search_scores_only_matching_rows(tmp_path, monkeypatch):
+    embedder = HashingEmbedder(dim=64)
+    store = VectorStore(tmp_path, embedder.dim, embedder.name, nprobe=1, min_train_rows=256)
+    index = SemanticIndex(store, embedder)
+    db = {"embedding_chunks": FakeChunks()}
+
+    # Hundreds of closer commit chunks, three Slack threads
+    commits = [
+        {"sha": f"c{i}", "repository": "bridge", "message": f"Bridge fee change number {i}", "date": datetime(2025, 1, 1)}
+        for i in range(400)
+    ]
+    chunks = [c for doc in commits for c in commit_chunks(doc)]
+    chunks += [
+        Chunk(chunk_id=f"slack_thread:C1:{i}:0", source_type="slack", source_id=f"slack_thread:C1:{i}",
+              text=f"Unrelated lunch plans {i}", timestamp=datetime(2025, 2, i + 1))
+        for i in range(3)
+    ]
+    index.upsert(db, chunks)
+    assert store.centroids is not None
+
+    hits = index.search(db, "bridge fee change", k=3, source_type="slack")
+    assert sorted(h["chunk_id"] for h in hits) == [f"slack_thread:C1:{i}:0" for i in range(3)]
+
+    # Broad filters probe IVF lists past nprobe until k matching rows are found
+    monkeypatch.setattr("src.core.embedding_index.EXACT_FILTER_ROWS", 0)
+    hits = index.search(db, "bridge fee change", k=3, source_type="slack")
+    assert len(hits) == 3
+
+    hits = index.search(db, "bridge fee change", k=3, source_type="slack", start_date="2025-02-02")
+    assert len(hits) == 2
+
+    with pytest.raises(ValueError):
+        index.search(db, "bridge fee", source_type="slack", start_date="last tuesday")
+
+
+def test_chunks_are_reembedded_when_their_rows_no_longer_hold_them(tmp_path):
+    embedder = CountingEmbedder()
+    index = SemanticIndex(VectorStore(tmp_path / "a", embedder.dim, embedder.name), embedder)
+    db = {"embedding_chunks": FakeChunks()}
+    commit = {"sha": "a1", "repository": "bridge", "message": "Lower the bridge withdrawal fee", "date": datetime(2025, 1, 1)}
+    index.upsert(db, commit_chunks(commit))
+
+    # The metadata outlives the vector files (e.g. a container without the shared volume)
+    fresh = SemanticIndex(VectorStore(tmp_path / "b", embedder.dim, embedder.name), embedder)
+    other = {"sha": "b2", "repository": "ui", "message": "Fix dark mode colors on the dashboard", "date": datetime(2025, 1, 2)}
+    fresh.upsert(db, commit_chunks(other))
+    # Row 0 of the new files holds b2, so a1's document must not be paired with it
+    assert [h["chunk_id"] for h in fresh.search(db, "bridge withdrawal fee", k=5)] == ["github_commit:b2:0"]
+
+    assert fresh.upsert(db, commit_chunks(commit)) == 1
+    assert fresh.search(db, "bridge withdrawal fee", k=1)[0]["chunk_id"] == "github_commit:a1:0"
+
+
+def test_failed_metadata_write_never_points_at_unpublished_rows(tmp_path):
+    embedder = CountingEmbedder()
+    index = SemanticIndex(VectorStore(tmp_path, embedder.dim, embedder.name), embedder)
+    db = {"embedding_chunks": FakeChunks()}
+    commit = {"sha": "a1", "repository": "bridge", "message": "Lower the bridge withdrawal fee", "date": datetime(2025, 1, 1)}
+    index.upsert(db, commit_chunks(commit))
+
+    commit["message"] = "Raise the bridge withdrawal fee"
+    db["embedding_chunks"].fail = True
+    with pytest.raises(RuntimeError):
+        index.upsert(db, commit_chunks(commit))
+    db["embedding_chunks"].fail = False
+
+    # The published rows are consistent; the retry embeds the change again
+    assert index.store.rows == 2
+    assert index.upsert(db, commit_chunks(commit)) == 1
+    hits = index.search(db, "raise the bridge withdrawal fee", k=5)
+    assert [h["chunk_id"] for h in hits] == ["github_commit:a1:0"]
+    assert hits[0]["text"] == "Raise the bridge withdrawal fee"
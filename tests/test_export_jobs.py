@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+"""
+Tests for background export jobs (backend/api/v1/export_jobs.py)
+"""
+
+import asyncio
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from bson import ObjectId
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.api.v1 import export_jobs
+from backend.api.v1.custom_export import CustomExportRequest
+
+
+class FakeJobs:
+    """Minimal async stand-in for the export_jobs Motor collection"""
+
+    def __init__(self, docs=None):
+        self.docs = {doc["_id"]: dict(doc) for doc in docs or []}
+
+    def _matches(self, doc, query):
+        for key, cond in query.items():
+            value = doc.get(key)
+            if isinstance(cond, dict):
+                if "$in" in cond and value not in cond["$in"]:
+                    return False
+                if "$gte" in cond and (value is None or value < cond["$gte"]):
+                    return False
+            elif value != cond:
+                return False
+        return True
+
+    async def find_one(self, query, sort=None):
+        matches = [d for d in self.docs.values() if self._matches(d, query)]
+        if sort:
+            field, direction = sort[0]
+            matches.sort(key=lambda d: d.get(field), reverse=direction < 0)
+        return matches[0] if matches else None
+
+    async def find_one_and_update(self, query, update):
+        doc = await self.find_one(query)
+        if doc:
+            doc.update(update["$set"])
+        return doc
+
+    async def update_one(self, query, update):
+        doc = self.docs.get(query["_id"])
+        if doc:
+            doc.update(update["$set"])
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_params_hash_ignores_key_order_and_preview_paging():
+    a = CustomExportRequest(selected_members=["Alice"], start_date="2025-11-01", limit=50)
+    b = CustomExportRequest(start_date="2025-11-01", selected_members=["Alice"], limit=10, offset=20)
+
+    params_a = export_jobs.custom_export_params(a, "csv")
+    params_b = export_jobs.custom_export_params(b, "csv")
+
+    assert export_jobs.params_hash("custom", params_a) == export_jobs.params_hash("custom", params_b)
+    assert export_jobs.params_hash("custom", params_a) != export_jobs.params_hash(
+        "custom", export_jobs.custom_export_params(a, "json")
+    )
+
+
+def test_find_reusable_job_prefers_active_then_fresh_artifact(tmp_path):
+    now = datetime(2025, 11, 17, 12, 0)
+    artifact = tmp_path / "done.bin"
+    artifact.write_bytes(b"data")
+    done = {
+        "_id": ObjectId(),
+        "params_hash": "h",
+        "status": "done",
+        "created_at": now - timedelta(hours=1),
+        "finished_at": now - timedelta(minutes=30),
+        "artifact_path": str(artifact),
+    }
+    jobs = FakeJobs([done])
+
+    assert run(export_jobs.find_reusable_job(jobs, "h", now, ttl_seconds=3600))["_id"] == done["_id"]
+    assert run(export_jobs.find_reusable_job(jobs, "other", now, ttl_seconds=3600)) is None
+    # Past the TTL, or artifact removed from disk
+    assert run(export_jobs.find_reusable_job(jobs, "h", now, ttl_seconds=600)) is None
+    artifact.unlink()
+    assert run(export_jobs.find_reusable_job(jobs, "h", now, ttl_seconds=3600)) is None
+
+    running = {"_id": ObjectId(), "params_hash": "h", "status": "running", "created_at": now}
+    jobs.docs[running["_id"]] = running
+    assert run(export_jobs.find_reusable_job(jobs, "h", now))["_id"] == running["_id"]
+
+
+def test_run_export_job_writes_artifact(tmp_path, monkeypatch):
+    job_id = ObjectId()
+    jobs = FakeJobs([{"_id": job_id, "kind": "custom", "params": {}, "status": "queued"}])
+
+    async def start_export(kind, params):
+        return StreamingResponse(
+            iter(["a,b\n", "1,2\n"]),
+            media_type="text/csv",
+            headers={"Content-Disposition": "attachment; filename=custom_export_all_all.csv"},
+        )
+
+    monkeypatch.setattr(export_jobs, "_jobs_collection", lambda: jobs)
+    monkeypatch.setattr(export_jobs, "_start_export", start_export)
+    monkeypatch.setattr(export_jobs, "ARTIFACT_DIR", tmp_path)
+
+    run(export_jobs.run_export_job(job_id))
+
+    job = jobs.docs[job_id]
+    assert job["status"] == "done"
+    assert job["bytes_written"] == 8
+    assert job["filename"] == "custom_export_all_all.csv"
+    assert Path(job["artifact_path"]).read_bytes() == b"a,b\n1,2\n"
+    assert not list(tmp_path.glob("*.part"))
+
+    # Already claimed: a second worker does nothing
+    run(export_jobs.run_export_job(job_id))
+    assert jobs.docs[job_id]["status"] == "done"
+
+
+def test_run_export_job_records_failure(tmp_path, monkeypatch):
+    job_id = ObjectId()
+    jobs = FakeJobs([{"_id": job_id, "kind": "custom", "params": {}, "status": "queued"}])
+
+    async def start_export(kind, params):
+        raise HTTPException(status_code=404, detail="No data found")
+
+    monkeypatch.setattr(export_jobs, "_jobs_collection", lambda: jobs)
+    monkeypatch.setattr(export_jobs, "_start_export", start_export)
+    monkeypatch.setattr(export_jobs, "ARTIFACT_DIR", tmp_path)
+
+    run(export_jobs.run_export_job(job_id))
+
+    assert jobs.docs[job_id]["status"] == "failed"
+    assert jobs.docs[job_id]["error"] == "No data found"
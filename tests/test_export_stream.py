@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+"""
+Tests for the streaming export encoders (src/utils/export_stream.py)
+"""
+
+import asyncio
+import csv
+import gzip
+import io
+import json
+import sys
+import zipfile
+from datetime import datetime
+from pathlib import Path
+
+from bson import ObjectId
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.export_stream import (
+    EXTRA_COLUMN,
+    clean_document,
+    encode_csv,
+    encode_json_array,
+    encode_ndjson,
+    encode_toon_array,
+    gzip_chunks,
+    iterate_cursor,
+    merge_sorted,
+    peek,
+    zip_entries,
+)
+from src.utils.toon_encoder import encode_toon
+
+
+async def arows(rows):
+    for row in rows:
+        yield row
+
+
+async def collect(chunks):
+    parts = [chunk async for chunk in chunks]
+    if parts and isinstance(parts[0], bytes):
+        return b"".join(parts)
+    return "".join(parts)
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_clean_document_converts_bson_types():
+    oid = ObjectId()
+    doc = {"_id": oid, "at": datetime(2025, 11, 17, 9, 0), "tags": ["a"], "n": 1}
+
+    assert clean_document(doc) == {"_id": str(oid), "at": "2025-11-17T09:00:00", "tags": ["a"], "n": 1}
+    assert clean_document(doc, flatten=True)["tags"] == '["a"]'
+
+
+def test_iterate_cursor_reads_sync_cursors_in_batches():
+    cursor = iter([{"i": i} for i in range(7)])
+
+    async def read():
+        return [doc["i"] async for doc in iterate_cursor(cursor, batch_size=3)]
+
+    assert run(read()) == list(range(7))
+
+
+def test_csv_small_export_matches_sorted_header():
+    rows = [{"b": 1, "a": "x"}, {"a": "y", "c": 2}]
+    text = run(collect(encode_csv(arows(rows), sort_fields=True)))
+
+    assert list(csv.DictReader(io.StringIO(text))) == [
+        {"a": "x", "b": "1", "c": ""},
+        {"a": "y", "b": "", "c": "2"},
+    ]
+
+
+def test_csv_late_fields_go_to_extra_column():
+    rows = [{"a": i} for i in range(3)] + [{"a": 3, "late": True}]
+    text = run(collect(encode_csv(arows(rows), sample_size=3, chunk_size=8)))
+
+    parsed = list(csv.DictReader(io.StringIO(text)))
+    assert list(parsed[0].keys()) == ["a", EXTRA_COLUMN]
+    assert json.loads(parsed[3][EXTRA_COLUMN]) == {"late": True}
+    assert parsed[0][EXTRA_COLUMN] == ""
+
+
+def test_csv_empty_header():
+    assert run(collect(encode_csv(arows([]), empty_header=["_id", "no_data"]))) == "_id,no_data\r\n"
+    assert run(collect(encode_csv(arows([])))) == ""
+
+
+def test_json_array_matches_json_dumps_layout():
+    rows = [{"a": 1, "nested": {"b": [1, 2]}}, {"a": 2}]
+    text = run(collect(encode_json_array(arows(rows), chunk_size=10)))
+
+    assert text == json.dumps(rows, indent=2, ensure_ascii=False)
+    assert run(collect(encode_json_array(arows([])))) == "[]"
+
+
+def test_ndjson_one_object_per_line():
+    text = run(collect(encode_ndjson(arows([{"a": 1}, {"b": "é"}]))))
+    assert text == '{"a": 1}\n{"b": "é"}\n'
+
+
+def test_toon_small_export_is_identical_and_large_uses_count():
+    rows = [{"id": i, "name": f"n{i}"} for i in range(3)]
+
+    async def count():
+        raise AssertionError("count not needed for small exports")
+
+    small = run(collect(encode_toon_array("items", arows(rows), count)))
+    assert small == encode_toon({"items": rows}, indent=2)
+
+    async def count_three():
+        return 3
+
+    large = run(collect(encode_toon_array("items", arows(rows), count_three, sample_size=2)))
+    assert large.startswith("items[3]:\n  -\n    id: 0\n    name: n0")
+    assert large.count("  -") == 3
+
+
+def test_peek_and_merge_sorted():
+    async def scenario():
+        first, rows = await peek(arows([{"t": "3"}, {"t": "1"}]))
+        streams = [rows, arows([{"t": "2"}, {"t": "0"}])]
+        merged = [r["t"] async for r in merge_sorted(streams, key=lambda r: r["t"], reverse=True)]
+        empty, _ = await peek(arows([]))
+        return first, merged, empty
+
+    first, merged, empty = run(scenario())
+    assert first == {"t": "3"}
+    assert merged == ["3", "2", "1", "0"]
+    assert empty is None
+
+
+def test_gzip_and_zip_streams_round_trip():
+    data = run(collect(gzip_chunks(arows(["hello ", "world"]))))
+    assert gzip.decompress(data) == b"hello world"
+
+    errors = []
+
+    async def broken():
+        yield "partial"
+        raise RuntimeError("cursor died")
+
+    async def entries():
+        yield "a.csv", arows(["x,y\r\n", "1,2\r\n"])
+        yield "b.csv", broken()
+
+    archive = run(collect(zip_entries(entries(), on_error=lambda name, e: errors.append(name))))
+    with zipfile.ZipFile(io.BytesIO(archive)) as zf:
+        assert zf.read("a.csv") == b"x,y\r\n1,2\r\n"
+        assert zf.read("b.csv") == b"partial"
+    assert errors == ["b.csv"]
@@ -0,0 +1,206 @@
+#!/usr/bin/env python
+"""
+Tests for the repo-centric GitHub commit crawl and GraphQL rate limiting
+
+Covers:
+- GitHubPluginMongo._get_all_member_commits (one crawl per repository)
+- src/utils/rate_limiter.py (TokenBucket, GitHubRateLimiter, parse_retry_after)
+"""
+
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.checkpoints import CheckpointStore
+from src.plugins.github_plugin_mongo import GitHubPluginMongo
+from src.utils.rate_limiter import GitHubRateLimiter, TokenBucket, parse_retry_after
+
+
+def _commit(sha, login, committed="2025-11-17T09:00:00Z"):
+    return {
+        "oid": sha,
+        "committedDate": committed,
+        "message": f"commit {sha}",
+        "url": f"https://github.com/org/repo/commit/{sha}",
+        "additions": 1,
+        "deletions": 0,
+        "changedFiles": 1,
+        "author": {"name": login, "email": None, "user": {"login": login}},
+    }
+
+
+def _branch(name, commits):
+    return {
+        "name": name,
+        "target": {"committedDate": "2025-11-17T09:00:00Z", "history": {"nodes": commits}},
+    }
+
+
+class FakeGitHubPlugin(GitHubPluginMongo):
+    """Plugin with GraphQL responses served from memory"""
+
+    def __init__(self, branches_by_repo):
+        self.org_name = "org"
+        self.include_diff = False
+        self.problematic_repos = set()
+        self.max_concurrent_repos = 2
+        self.checkpoints = CheckpointStore(None, "github")
+        self.branches_by_repo = branches_by_repo
+        self.queries = []
+
+    def _query_graphql(self, query, variables, retries=5):
+        self.queries.append(variables["name"])
+        branches = self.branches_by_repo[variables["name"]]
+        if branches is None:
+            raise Exception("boom")
+        return {
+            "repository": {
+                "refs": {
+                    "nodes": branches,
+                    "pageInfo": {"hasNextPage": False, "endCursor": None},
+                }
+            }
+        }
+
+
+def test_each_repository_is_crawled_once_for_all_members():
+    plugin = FakeGitHubPlugin(
+        {
+            "repo-a": [
+                _branch("main", [_commit("a1", "Alice"), _commit("a2", "bob")]),
+                # same commit reachable from a feature branch
+                _branch("feature", [_commit("a1", "Alice"), _commit("x1", "outsider")]),
+            ],
+            "repo-b": [_branch("main", [_commit("b1", "BOB")])],
+            "broken": None,
+        }
+    )
+    members = [{"login": "alice"}, {"login": "Bob"}, {"login": None}]
+    repos = [
+        {"name": name, "isArchived": False, "pushedAt": "2025-11-17T10:00:00Z"}
+        for name in ("repo-a", "repo-b", "broken")
+    ] + [{"name": "archived", "isArchived": True, "pushedAt": "2025-11-17T10:00:00Z"}]
+
+    commits = plugin._get_all_member_commits(
+        members, repos, datetime(2025, 11, 10), datetime(2025, 11, 18)
+    )
+
+    assert sorted(plugin.queries) == ["broken", "repo-a", "repo-b"]
+    assert sorted((c["sha"], c["author_login"]) for c in commits) == [
+        ("a1", "alice"),
+        ("a2", "Bob"),
+        ("b1", "Bob"),
+    ]
+    assert next(c for c in commits if c["sha"] == "a1")["branch"] == "main"
+    assert plugin.problematic_repos == {"broken"}
+
+
+def test_token_bucket_waits_for_refill():
+    now = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    bucket = TokenBucket(rate=2, capacity=2, clock=lambda: now[0], sleep=sleep)
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0.5
+    assert sleeps == [0.5]
+
+
+def test_token_bucket_try_acquire_never_blocks():
+    now = [0.0]
+    bucket = TokenBucket(rate=10, capacity=100, clock=lambda: now[0], sleep=None)
+
+    assert bucket.try_acquire(80) == 0.0
+    assert bucket.try_acquire(50) == 3.0  # nothing taken
+    now[0] += 3.0
+    assert bucket.try_acquire(250) == 5.0  # over capacity: waits for a full bucket
+    now[0] += 5.0
+    assert bucket.try_acquire(250) == 0.0
+
+
+def test_github_limiter_waits_for_reset_when_budget_exhausted():
+    sleeps = []
+    limiter = GitHubRateLimiter(reserve=10, sleep=sleeps.append)
+    reset_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+
+    limiter.update({"remaining": 500, "resetAt": reset_at.isoformat(), "cost": 2})
+    limiter.acquire()
+    assert sleeps == []
+    assert limiter.last_cost == 2
+
+    limiter.update({"remaining": 11, "resetAt": reset_at.isoformat(), "cost": 2})
+    limiter.acquire()
+    assert len(sleeps) == 1 and 55 < sleeps[0] <= 61
+
+
+def test_github_limiter_pauses_every_caller():
+    now = [0.0]
+    sleeps = []
+    limiter = GitHubRateLimiter(reserve=10, clock=lambda: now[0], sleep=sleeps.append)
+    reset_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+
+    # The caller that sees the exhausted budget and the workers after it all wait
+    limiter.update({"remaining": 11, "resetAt": reset_at.isoformat(), "cost": 2})
+    limiter.acquire()
+    limiter.acquire()
+    assert len(sleeps) == 2 and all(55 < s <= 61 for s in sleeps)
+
+    # Retry-After from one worker holds back the others
+    now[0] = 100.0
+    sleeps.clear()
+    limiter.pause(30)
+    now[0] = 110.0
+    limiter.acquire()
+    assert sleeps == [20.0]
+
+
+def test_parse_retry_after_accepts_seconds_and_http_dates():
+    now = datetime(2015, 10, 21, 7, 27, 0, tzinfo=timezone.utc)
+
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT", now=now) == 60.0
+    # A date in the past means "retry now"
+    assert parse_retry_after("Wed, 21 Oct 2015 07:00:00 GMT", now=now) == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_graphql_retries_after_http_date_and_tracks_rate_limit(monkeypatch):
+    class Response:
+        def __init__(self, status, headers=None, body=None):
+            self.status_code = status
+            self.ok = status == 200
+            self.headers = headers or {}
+            self.text = ""
+            self._body = body
+
+        def json(self):
+            return self._body
+
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    reset_at = (datetime.now(timezone.utc) + timedelta(hours=1)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    responses = [
+        Response(403, {"Retry-After": retry_at.strftime("%a, %d %b %Y %H:%M:%S GMT")}),
+        Response(200, body={"data": {"rateLimit": {"remaining": 4000, "resetAt": reset_at, "cost": 3}, "search": {}}}),
+    ]
+    sleeps = []
+    monkeypatch.setattr("src.plugins.github_plugin_mongo.requests.post", lambda *a, **kw: responses.pop(0))
+    monkeypatch.setattr("src.plugins.github_plugin_mongo.time.sleep", sleeps.append)
+
+    plugin = GitHubPluginMongo.__new__(GitHubPluginMongo)
+    plugin.token = "token"
+    plugin.rate_limiter = GitHubRateLimiter(sleep=sleeps.append)
+
+    data = plugin._query_graphql("query { search }", {"searchQuery": "org:org is:pr"})
+
+    assert data["search"] == {}
+    assert len(sleeps) == 1 and 25 < sleeps[0] <= 30
+    assert (plugin.rate_limiter.remaining, plugin.rate_limiter.last_cost) == (4000, 3)
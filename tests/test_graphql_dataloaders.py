@@ -0,0 +1,293 @@
+#!/usr/bin/env python
+"""
+Tests for the per-request GraphQL loader registry (backend/graphql/dataloaders.py)
+"""
+
+import asyncio
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import strawberry
+from bson import ObjectId
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.graphql.dataloaders import create_dataloaders, load_activity_counts_batch
+from backend.graphql.queries import Query
+from src.core.collaboration_store import DAILY_COLLECTION
+from src.core.identity_index import identity_cache
+
+NOW = datetime.now(timezone.utc)
+
+
+# =============================================================================
+# Fake Motor database (the query and pipeline shapes used by the loaders)
+# =============================================================================
+
+
+def _get(doc, path):
+    for part in path.split("."):
+        if not isinstance(doc, dict):
+            return None
+        doc = doc.get(part)
+    return doc
+
+
+def _eval(doc, expr):
+    if isinstance(expr, str) and expr.startswith("$"):
+        return _get(doc, expr[1:])
+    if isinstance(expr, dict) and len(expr) == 1 and next(iter(expr)).startswith("$"):
+        op, args = next(iter(expr.items()))
+        if op == "$cond":
+            return _eval(doc, args[1]) if _eval(doc, args[0]) else _eval(doc, args[2])
+        if op == "$and":
+            return all(_eval(doc, arg) for arg in args)
+        values = [_eval(doc, arg) for arg in args]
+        if op == "$in":
+            return values[0] in values[1]
+        if op == "$ne":
+            return values[0] != values[1]
+        if op == "$gte":
+            return values[0] is not None and values[0] >= values[1]
+        if op == "$lt":
+            return values[0] is not None and values[0] < values[1]
+    if isinstance(expr, dict):
+        return {key: _eval(doc, value) for key, value in expr.items()}
+    return expr
+
+
+def _matches_value(value, condition):
+    candidates = value if isinstance(value, list) else [value]
+    if not isinstance(condition, dict):
+        return condition in candidates
+    for op, arg in condition.items():
+        if op == "$in" and not any(c in arg for c in candidates):
+            return False
+        if op == "$ne" and arg in candidates:
+            return False
+        if op == "$exists" and (value is not None) != arg:
+            return False
+        if op == "$gte" and not (value is not None and value >= arg):
+            return False
+        if op == "$lte" and not (value is not None and value <= arg):
+            return False
+    return True
+
+
+def _matches(doc, query):
+    for key, condition in query.items():
+        if key == "$or":
+            if not any(_matches(doc, sub) for sub in condition):
+                return False
+        elif key == "$expr":
+            if not _eval(doc, condition):
+                return False
+        elif not _matches_value(_get(doc, key), condition):
+            return False
+    return True
+
+
+def _group(docs, spec):
+    groups = {}
+    for doc in docs:
+        key = _eval(doc, spec["_id"])
+        hashable = repr(key)
+        if hashable not in groups:
+            groups[hashable] = {"_id": key}
+        group = groups[hashable]
+        for name, accumulator in spec.items():
+            if name == "_id":
+                continue
+            (op, expr), = accumulator.items()
+            value = _eval(doc, expr)
+            if op == "$sum":
+                group[name] = group.get(name, 0) + (value or 0)
+            elif op == "$max":
+                if value is not None and (group.get(name) is None or value > group[name]):
+                    group[name] = value
+            elif op == "$first":
+                group.setdefault(name, value)
+    return list(groups.values())
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def sort(self, field, direction=1):
+        self.docs = sorted(self.docs, key=lambda d: _get(d, field), reverse=direction == -1)
+        return self
+
+    def skip(self, n):
+        self.docs = self.docs[n:]
+        return self
+
+    def limit(self, n):
+        self.docs = self.docs[:n] if n else self.docs
+        return self
+
+    async def to_list(self, length=None):
+        return list(self.docs)
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for doc in self.docs:
+            yield doc
+
+
+class FakeCollection:
+    def __init__(self, db, name):
+        self.db = db
+        self.name = name
+        self.docs = []
+
+    def find(self, query=None, projection=None):
+        self.db.round_trips.append(("find", self.name))
+        return FakeCursor([d for d in self.docs if _matches(d, query or {})])
+
+    async def find_one(self, query=None, projection=None):
+        self.db.round_trips.append(("find_one", self.name))
+        return next((d for d in self.docs if _matches(d, query or {})), None)
+
+    def aggregate(self, pipeline):
+        self.db.round_trips.append(("aggregate", self.name))
+        docs = list(self.docs)
+        for stage in pipeline:
+            (op, spec), = stage.items()
+            if op == "$match":
+                docs = [d for d in docs if _matches(d, spec)]
+            elif op == "$project":
+                docs = [{"_id": d.get("_id"), **_eval(d, spec)} for d in docs]
+            elif op == "$group":
+                docs = _group(docs, spec)
+        return FakeCursor(docs)
+
+
+class FakeDB(dict):
+    name = "test"
+
+    def __init__(self):
+        super().__init__()
+        self.round_trips = []
+
+    def __getitem__(self, name):
+        if name not in self:
+            self[name] = FakeCollection(self, name)
+        return dict.__getitem__(self, name)
+
+
+def make_team(size):
+    """A team where member i has i + 1 commits, i Slack messages and one page"""
+    db = FakeDB()
+    project_id = ObjectId()
+    member_ids = []
+    for i in range(size):
+        name = f"Member{i}"
+        member_id = ObjectId()
+        member_ids.append(member_id)
+        db["members"].docs.append({"_id": member_id, "name": name, "email": f"m{i}@tokamak.network"})
+        db["member_identifiers"].docs += [
+            {"source": "github", "identifier_type": "username", "identifier_value": f"gh-{i}", "member_name": name},
+            {"source": "slack", "identifier_type": "user_name", "identifier_value": f"slack.{i}", "member_name": name},
+        ]
+        db["github_commits"].docs += [
+            {"_id": ObjectId(), "author_name": f"gh-{i}", "repository": "bridge", "date": NOW - timedelta(days=1)}
+            for _ in range(i + 1)
+        ]
+        db["slack_messages"].docs += [
+            {"_id": ObjectId(), "user_name": f"slack.{i}", "channel_name": "dev", "posted_at": NOW - timedelta(days=40)}
+            for _ in range(i)
+        ]
+        db["notion_pages"].docs.append(
+            {"_id": ObjectId(), "created_by": {"name": name}, "last_edited_by": {"name": name}}
+        )
+        if i:
+            db[DAILY_COLLECTION].docs.append({
+                "member_a": "Member0", "member_a_key": "member0", "member_b": name, "member_b_key": name.lower(),
+                "source": "github_review", "count": i, "last_at": NOW,
+            })
+
+    # Activity of people outside the team is never attributed to it
+    db["github_commits"].docs.append({"_id": ObjectId(), "author_name": "stranger", "repository": "bridge", "date": NOW})
+    db["projects"].docs.append(
+        {"_id": project_id, "key": "project-ooo", "name": "OOO", "member_ids": member_ids[::2], "is_active": True}
+    )
+    return db
+
+
+TEAM_QUERY = """
+query {
+  members {
+    name
+    activityStats { totalActivities last30Days bySource { source count } }
+    topCollaborators(limit: 3) { memberName collaborationCount }
+    projectDetails { key }
+  }
+}
+"""
+
+
+def run_team_query(db):
+    identity_cache.invalidate()
+    schema = strawberry.Schema(query=Query)
+    context = {"db": db, "dataloaders": create_dataloaders(db)}
+    result = asyncio.run(schema.execute(TEAM_QUERY, context_value=context))
+    assert result.errors is None, result.errors
+    return {member["name"]: member for member in result.data["members"]}
+
+
+def test_whole_team_query_costs_constant_round_trips():
+    small, large = make_team(3), make_team(12)
+
+    run_team_query(small)
+    members = run_team_query(large)
+
+    assert len(members) == 12
+    assert sorted(small.round_trips) == sorted(large.round_trips)
+    # One members page, one identity build, one grouped query per loader source
+    assert len(large.round_trips) == 13
+
+    member = members["Member5"]
+    by_source = {s["source"]: s["count"] for s in member["activityStats"]["bySource"]}
+    assert by_source == {"github": 6, "slack": 5, "notion": 1, "drive": 0}
+    assert member["activityStats"]["totalActivities"] == 12
+    # Slack messages are older than 30 days
+    assert member["activityStats"]["last30Days"] == 6
+    assert member["topCollaborators"] == [{"memberName": "Member0", "collaborationCount": 5}]
+    assert member["projectDetails"] == []
+
+    assert [c["memberName"] for c in members["Member0"]["topCollaborators"]] == ["Member11", "Member10", "Member9"]
+    assert members["Member4"]["projectDetails"] == [{"key": "project-ooo"}]
+
+
+def test_member_lookup_joins_results_back_to_their_member():
+    db = FakeDB()
+    db["member_identifiers"].docs += [
+        {"source": "github", "identifier_value": "JohnDoe", "member_name": "John"},
+        {"source": "slack", "identifier_value": "U0123ABC", "member_name": "John"},
+        {"source": "github", "identifier_value": "alice-dev", "member_name": "Alice"},
+    ]
+    db["github_commits"].docs += [
+        {"author_name": "JohnDoe"},
+        {"author_name": "John"},  # older commits stored under the display name
+        {"author_name": "alice-dev"},
+        {"author_name": "stranger"},
+    ]
+    db["github_pull_requests"].docs.append({"author": "Alice"})  # stored under the display name
+    db["slack_messages"].docs += [{"user_name": "U0123ABC"}, {"user_name": "john"}, {"user_name": "U999"}]
+    db["notion_pages"].docs += [
+        {"created_by": {"name": "Alice"}, "last_edited_by": {"name": "John"}},
+        {"created_by": {"name": "Someone"}, "last_edited_by": {"name": "John"}},
+    ]
+
+    identity_cache.invalidate()
+    counts = asyncio.run(load_activity_counts_batch(["Alice", "John", "Nobody"], db))
+
+    # Alice: 1 commit + 1 PR + the page she created; John: 2 commits,
+    # 2 messages and the page he last edited but did not create
+    assert counts == [3, 5, 0]
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""
+Tests for the shared member identity index (src/core/identity_index.py)
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.identity_index import IdentityIndex, IdentityIndexCache, MemberLookup, member_identifiers
+
+
+IDENTIFIERS = [
+    {"source": "github", "identifier_value": "JohnDoe", "member_name": "John"},
+    {"source": "slack", "identifier_value": "U0123ABC", "member_name": "John"},
+    {"source": "email", "identifier_value": "John@Tokamak.Network", "member_name": "John"},
+    {"source": "github", "identifier_value": "alice-dev", "member_name": "Alice"},
+    {"source": "github", "identifier_value": "", "member_name": "Nobody"},
+]
+
+
+class FakeCollection:
+    def __init__(self, docs=None, one=None):
+        self.docs = docs or []
+        self.one = one
+        self.find_calls = 0
+
+    def find(self, *args, **kwargs):
+        self.find_calls += 1
+        return iter(self.docs)
+
+    def find_one(self, *args, **kwargs):
+        return self.one
+
+
+class FakeDB(dict):
+    def __getitem__(self, name):
+        return self.setdefault(name, FakeCollection())
+
+
+def test_forward_lookup_case_folds_github_and_email_only():
+    index = IdentityIndex.from_documents(IDENTIFIERS)
+
+    assert index.member_for("github", "johndoe") == "John"
+    assert index.member_for("email", "john@tokamak.network") == "John"
+    assert index.member_for("slack", "U0123ABC") == "John"
+    assert index.member_for("slack", "u0123abc") is None
+    assert index.member_for("slack", "u0123abc", fold_case=True) == "John"
+    assert index.member_for("github", None) is None
+
+
+def test_reverse_lookup_and_legacy_layout():
+    index = IdentityIndex.from_documents(IDENTIFIERS)
+
+    assert index.identifiers_for("john", "github") == ["JohnDoe"]
+    assert index.identifiers_for("John") == {
+        "github": ["JohnDoe"],
+        "slack": ["U0123ABC"],
+        "email": ["John@Tokamak.Network"],
+    }
+    assert index.identifiers_for("Nobody", "github") == []
+    assert not index.has_member("Nobody")
+
+    # dict view keeps the load_member_mappings structure
+    assert index["github"]["johndoe"] == {"original": "JohnDoe", "member": "John"}
+    assert index["notion"] == {}
+
+
+def test_cache_rebuilds_only_when_version_changes():
+    db = FakeDB()
+    db["member_identifiers"] = FakeCollection(IDENTIFIERS)
+    db["cache_versions"] = FakeCollection(one={"_id": "member_identifiers", "version": 1})
+    cache = IdentityIndexCache(check_interval=0)
+
+    first = cache.get(db)
+    assert first.version == 1
+    assert cache.get(db) is first
+    assert db["member_identifiers"].find_calls == 1
+
+    db["cache_versions"].one = {"_id": "member_identifiers", "version": 2}
+    second = cache.get(db)
+    assert second is not first
+    assert second.version == 2
+    assert db["member_identifiers"].find_calls == 2
+
+
+def test_member_lookup_joins_through_dict_indexes():
+    index = IdentityIndex.from_documents(IDENTIFIERS)
+    identifiers = {
+        "John": member_identifiers(index, "John", {"email": "john@tokamak.network"}),
+        "Alice": member_identifiers(index, "Alice", {"github_username": "alice-dev"}),
+    }
+
+    assert identifiers["John"]["github"] == ["JohnDoe", "John"]
+    assert identifiers["John"]["slack"] == ["U0123ABC", "John", "john"]
+    assert identifiers["John"]["drive"] == ["John@Tokamak.Network", "john@tokamak.network", "John"]
+    assert identifiers["Alice"]["github"] == ["alice-dev", "Alice"]
+
+    lookup = MemberLookup(identifiers)
+    assert lookup.identifiers("github") == ["JohnDoe", "John", "alice-dev", "Alice"]
+    assert lookup.member("github", "johndoe") == "John"
+    assert lookup.member("slack", "JOHN") == "John"
+    assert lookup.member("drive", "john@tokamak.network") == "John"
+    assert lookup.member("github", "someone-else") is None
+    assert lookup.member("github", None) is None
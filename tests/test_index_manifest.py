@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+"""
+Tests for the index manifest and advisor (src/core/index_manifest.py)
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.index_manifest import (
+    INDEX_MANIFEST,
+    QUERY_TEMPLATES,
+    analyze_plan,
+    ensure_manifest_indexes,
+    explain_templates,
+    log_index_report,
+)
+
+NOW = datetime(2025, 11, 17, 12, 0)
+
+CLASSIC_SORT = {
+    "queryPlanner": {
+        "winningPlan": {
+            "stage": "LIMIT",
+            "inputStage": {
+                "stage": "SORT",
+                "inputStage": {"stage": "FETCH", "inputStage": {"stage": "COLLSCAN"}},
+            },
+        }
+    }
+}
+
+SBE_INDEXED = {
+    "queryPlanner": {
+        "winningPlan": {
+            "queryPlan": {
+                "stage": "LIMIT",
+                "inputStage": {
+                    "stage": "FETCH",
+                    "inputStage": {
+                        "stage": "SORT_MERGE",
+                        "inputStages": [
+                            {"stage": "IXSCAN", "indexName": "author_name_1_date_-1"},
+                            {"stage": "IXSCAN", "indexName": "author_name_1_date_-1"},
+                        ],
+                    },
+                },
+            },
+            "slotBasedPlan": {"stages": "..."},
+        }
+    }
+}
+
+
+class FakeCursor:
+    def __init__(self, plan):
+        self.plan = plan
+        self.sorted_by = None
+
+    def sort(self, keys):
+        self.sorted_by = keys
+        return self
+
+    def limit(self, n):
+        return self
+
+    def explain(self):
+        return self.plan
+
+
+class FakeCollection:
+    def __init__(self, plan=None):
+        self.plan = plan
+        self.indexes = []
+        self.filters = []
+
+    def create_index(self, keys):
+        self.indexes.append(keys)
+
+    def find(self, query):
+        self.filters.append(query)
+        if self.plan is None:
+            raise RuntimeError("not authorized")
+        return FakeCursor(self.plan)
+
+
+class FakeDatabase(dict):
+    def __missing__(self, name):
+        self[name] = FakeCollection(SBE_INDEXED)
+        return self[name]
+
+
+def test_analyze_plan_flags_collscan_and_sort():
+    report = analyze_plan(CLASSIC_SORT)
+    assert report["collscan"] and report["in_memory_sort"]
+    assert report["stages"] == ["LIMIT", "SORT", "FETCH", "COLLSCAN"]
+
+    report = analyze_plan(SBE_INDEXED)
+    assert not report["collscan"] and not report["in_memory_sort"]
+    assert report["indexes"] == ["author_name_1_date_-1"]
+
+
+def test_every_template_has_a_leading_index():
+    for template in QUERY_TEMPLATES:
+        fields = set(template.filter(NOW)) | {key for key, _ in template.sort}
+        leading = {
+            spec.keys[0][0]
+            for spec in INDEX_MANIFEST
+            if spec.collection == template.collection and spec.database == template.database
+        }
+        assert fields & leading, template.name
+
+
+def test_ensure_and_explain_only_touch_their_database():
+    db = FakeDatabase()
+    db["github_commits"] = FakeCollection(CLASSIC_SORT)
+    db["slack_messages"] = FakeCollection(None)
+
+    created = ensure_manifest_indexes(db)
+    assert created == sum(1 for spec in INDEX_MANIFEST if spec.database == "main")
+    assert "recordings" not in db
+
+    reports = explain_templates(db, now=NOW)
+    assert {r["collection"] for r in reports} == {t.collection for t in QUERY_TEMPLATES} - {"recordings"}
+    by_name = {r["name"]: r for r in reports}
+    assert by_name["commits by member"]["collscan"]
+    assert by_name["slack thread"]["error"] == "not authorized"
+    assert db["github_commits"].filters[0]["date"]["$lte"] == NOW
+
+    assert log_index_report(reports) == 2  # both commit templates
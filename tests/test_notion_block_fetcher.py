@@ -0,0 +1,247 @@
+#!/usr/bin/env python
+"""
+Tests for the async Notion block-tree fetcher (src/utils/notion_block_fetcher.py)
+and AdaptiveRateLimiter (src/utils/rate_limiter.py)
+"""
+
+import asyncio
+import sys
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from pathlib import Path
+
+from notion_client.errors import APIResponseError
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.notion_snapshots import block_hash
+from src.plugins.notion_diff_plugin import NotionDiffPlugin
+from src.utils.notion_block_fetcher import NotionBlockFetcher, _retry_after
+from src.utils.rate_limiter import AdaptiveRateLimiter
+
+
+def _rate_limited(retry_after="2"):
+    error = APIResponseError.__new__(APIResponseError)
+    error.status = 429
+    error.headers = {"retry-after": retry_after}
+    return error
+
+
+def _block(block_id, text="", children=False, edited="2025-11-17T09:00:00.000Z", block_type="paragraph"):
+    return {
+        "id": block_id,
+        "type": block_type,
+        "has_children": children,
+        "last_edited_time": edited,
+        block_type: {"rich_text": [{"plain_text": text}]},
+    }
+
+
+class FakeEndpoint:
+    def __init__(self, pages, failures=None):
+        self.pages = pages  # block_id -> list of response pages
+        self.failures = failures or {}
+        self.calls = []
+
+    async def list(self, block_id, page_size=100, start_cursor=None):
+        self.calls.append(block_id)
+        if self.failures.get(block_id):
+            raise self.failures[block_id].pop()
+        pages = self.pages.get(block_id, [[]])
+        index = int(start_cursor or 0)
+        has_more = index + 1 < len(pages)
+        return {
+            "results": pages[index],
+            "has_more": has_more,
+            "next_cursor": str(index + 1) if has_more else None,
+        }
+
+
+class FakeAsyncClient:
+    def __init__(self, tree, failures=None):
+        self.blocks = type("Blocks", (), {})()
+        self.blocks.children = FakeEndpoint(tree, failures)
+        self.comments = FakeEndpoint({})
+
+
+class InstantLimiter(AdaptiveRateLimiter):
+    def __init__(self):
+        super().__init__(rate=1000, clock=lambda: 0.0)
+        self.throttled = []
+
+    async def acquire(self):
+        return 0.0
+
+    def on_throttled(self, retry_after=None):
+        self.throttled.append(retry_after)
+        super().on_throttled(retry_after)
+
+
+TREE = {
+    "page": [[_block("a", "A", children=True), _block("b", "B")], [_block("c", "C", children=True)]],
+    "a": [[_block("a1", "A1", children=True), _block("sub", block_type="child_page")]],
+    "a1": [[_block("a1x", "A1x")]],
+    "c": [[_block("c1", "C1")]],
+}
+
+
+def test_tree_is_fetched_breadth_first_and_returned_in_document_order():
+    client = FakeAsyncClient(TREE, failures={"c": [_rate_limited()]})
+    limiter = InstantLimiter()
+
+    async def run():
+        fetcher = NotionBlockFetcher(client, limiter)
+        return await fetcher.fetch_tree("page", include=lambda b: b["type"] != "child_page")
+
+    tree = asyncio.run(run())
+
+    assert [(b["id"], parent) for b, parent in tree] == [
+        ("a", None), ("a1", "a"), ("a1x", "a1"), ("b", None), ("c", None), ("c1", "c"),
+    ]
+    calls = client.blocks.children.calls
+    # both second-level lists are requested before the third level
+    assert calls.index("a1") > max(calls.index("a"), calls.index("c"))
+    assert limiter.throttled == [2.0]
+
+
+def test_retry_after_accepts_seconds_and_http_dates():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=120)
+
+    assert _retry_after(_rate_limited("5")) == 5.0
+    assert 100 < _retry_after(_rate_limited(format_datetime(retry_at, usegmt=True))) <= 120
+    assert _retry_after(_rate_limited("soon")) is None
+
+
+def test_adaptive_limiter_backs_off_and_recovers():
+    now = [0.0]
+    sleeps = []
+
+    async def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    limiter = AdaptiveRateLimiter(rate=4, recovery=1, clock=lambda: now[0], sleep=sleep)
+
+    async def run():
+        await limiter.acquire()
+        await limiter.acquire()
+        limiter.on_throttled(retry_after=3)
+        await limiter.acquire()
+
+    asyncio.run(run())
+    assert sleeps == [0.25, 3.0]
+    assert limiter.rate == 2
+    limiter.on_success()
+    limiter.on_success()
+    limiter.on_success()
+    assert limiter.rate == 4
+
+
+def test_diff_plugin_reuses_unedited_subtrees_from_previous_snapshot():
+    snapshot_time = datetime(2025, 11, 17, 12, tzinfo=timezone.utc)
+    edited_after = (snapshot_time + timedelta(minutes=5)).isoformat().replace("+00:00", "Z")
+    tree = {
+        "page": [[_block("a", "A", children=True), _block("c", "C2", children=True, edited=edited_after)]],
+        "c": [[_block("c1", "C1 new")]],
+    }
+    previous = [
+        {"block_id": "a", "block_type": "paragraph", "hash": block_hash("A"), "parent_id": None},
+        {"block_id": "a1", "block_type": "paragraph", "hash": block_hash("A1"), "parent_id": "a"},
+        {"block_id": "c", "block_type": "paragraph", "hash": block_hash("C"), "parent_id": None},
+        {"block_id": "c1", "block_type": "paragraph", "hash": block_hash("C1"), "parent_id": "c"},
+    ]
+    client = FakeAsyncClient(tree)
+    plugin = NotionDiffPlugin.__new__(NotionDiffPlugin)
+    plugin.skip_unchanged_subtrees = True
+
+    async def run():
+        fetcher = NotionBlockFetcher(client, InstantLimiter())
+        return await plugin._prefetch_page(fetcher, "page", previous, snapshot_time)
+
+    blocks, comments = asyncio.run(run())
+
+    assert "a" not in client.blocks.children.calls
+    assert [(b["block_id"], b["hash"]) for b in blocks] == [
+        ("a", block_hash("A")),
+        ("a1", block_hash("A1")),  # reused, not fetched
+        ("c", block_hash("C2")),
+        ("c1", block_hash("C1 new")),
+    ]
+    assert comments == []
+
+
+class FakeNotionClient:
+    """Sync notion_client.Client with one user and one recently edited page"""
+
+    def __init__(self):
+        self.users = type("Users", (), {"list": lambda _self: {"results": [
+            {"id": "u1", "name": "Ale", "email": "ale@tokamak.network", "type": "person"}
+        ]}})()
+        self.comments = type("Comments", (), {"list": lambda _self, block_id: {"results": []}})()
+
+    def search(self, filter, sort, start_cursor=None):
+        results = []
+        if filter["value"] == "page":
+            results = [{
+                "id": "page",
+                "url": "https://notion.so/page",
+                "created_time": "2025-11-01T00:00:00.000Z",
+                "last_edited_time": "2025-11-17T09:00:00.000Z",
+                "created_by": {"id": "u1"},
+                "last_edited_by": {"id": "u1"},
+                "parent": {"type": "workspace"},
+                "properties": {"Name": {"type": "title", "title": [{"plain_text": "Roadmap"}]}},
+            }]
+        return {"results": results, "has_more": False, "next_cursor": None}
+
+
+class FakeWriteCollection:
+    def __init__(self):
+        self.docs = []
+
+    def find(self, query, projection=None):
+        return []
+
+    def bulk_write(self, operations, ordered=True):
+        self.docs.extend(op._doc for op in operations)
+        return type("Result", (), {"inserted_count": 0, "upserted_count": len(operations), "matched_count": 0, "modified_count": 0})()
+
+
+def test_mongo_plugin_collects_inside_event_loop_and_saves(monkeypatch):
+    import src.plugins.notion_plugin_mongo as notion_module
+
+    class ContextClient(FakeAsyncClient):
+        def __init__(self, auth):
+            super().__init__({"page": [[_block("a", "Launch plan", block_type="heading_1"), _block("b", "Ship it")]]})
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return None
+
+    monkeypatch.setattr(notion_module, "AsyncClient", ContextClient)
+    db = {"collection_checkpoints": FakeWriteCollection()}
+    db.update({name: FakeWriteCollection() for name in ("notion_pages", "notion_databases", "notion_comments", "notion_users")})
+    mongo_manager = type("Mongo", (), {"db": db})()
+
+    plugin = notion_module.NotionPluginMongo({"token": "t", "use_checkpoints": True}, mongo_manager)
+    plugin.client = FakeNotionClient()
+    plugin.limiter = InstantLimiter()
+
+    # Collection scripts call collect_data from inside a running event loop
+    async def run():
+        data = plugin.collect_data(start_date=datetime(2025, 11, 10, tzinfo=timezone.utc))[0]
+        await plugin.save_data(data)
+
+    asyncio.run(run())
+
+    [page] = db["notion_pages"].docs
+    assert page["title"] == "Roadmap"
+    assert page["content"] == "# Launch plan\n\nShip it"
+    assert page["created_by"]["name"] == "Ale"
+    assert [u["user_id"] for u in db["notion_users"].docs] == ["u1"]
+    [checkpoint] = db["collection_checkpoints"].docs
+    assert checkpoint["$set"]["timestamp"] == datetime(2025, 11, 17, 9, tzinfo=timezone.utc)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+"""
+Tests for content-addressed Notion block snapshots (src/core/notion_snapshots.py)
+and the hash-first block diff in NotionDiffPlugin
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.notion_snapshots import BlockSnapshotStore, block_hash
+from src.plugins.notion_diff_plugin import NotionDiffPlugin
+
+
+def _matches(doc, query):
+    for key, cond in query.items():
+        if isinstance(cond, dict) and "$exists" in cond:
+            if (key in doc) != cond["$exists"]:
+                return False
+        elif isinstance(cond, dict) and "$in" in cond:
+            if doc.get(key) not in cond["$in"]:
+                return False
+        elif doc.get(key) != cond:
+            return False
+    return True
+
+
+class FakeCollection:
+    def __init__(self):
+        self.docs = []
+        self.find_queries = []
+
+    def find(self, query, projection=None):
+        self.find_queries.append(query)
+        return [dict(d) for d in self.docs if _matches(d, query)]
+
+    def find_one(self, query, projection=None):
+        found = self.find(query)
+        return found[0] if found else None
+
+    def insert_one(self, doc):
+        self.docs.append(dict(doc))
+
+    def replace_one(self, query, doc, upsert=False):
+        self.docs = [d for d in self.docs if not _matches(d, query)]
+        self.docs.append(dict(doc))
+
+    def update_many(self, query, update):
+        for d in self.docs:
+            if _matches(d, query):
+                d.update(update["$set"])
+
+    def bulk_write(self, operations, ordered=True):
+        for op in operations:
+            if not self.find_one(op._filter):
+                self.docs.append({**op._filter, **op._doc["$setOnInsert"]})
+
+
+class FakeDB(dict):
+    def __missing__(self, name):
+        self[name] = FakeCollection()
+        return self[name]
+
+
+def _block(block_id, text, block_type="paragraph"):
+    return {"block_id": block_id, "block_type": block_type, "plain_text": text, "parent_id": None}
+
+
+def test_unchanged_blocks_are_stored_once_and_edits_write_only_deltas():
+    db = FakeDB()
+    store = BlockSnapshotStore(db)
+    page = [_block("b1", "intro"), _block("b2", "spec"), _block("b3", "intro")]
+
+    assert store.save("p1", page, previous=[]) == 3
+    assert len(db["notion_block_contents"].docs) == 2  # "intro" is shared
+
+    previous = store.load_current("p1")
+    assert [e["hash"] for e in previous] == [block_hash("intro"), block_hash("spec"), block_hash("intro")]
+    assert store.save("p1", page, previous=previous) == 0
+
+    edited = [_block("b1", "intro"), _block("b2", "spec v2")]
+    assert store.save("p1", edited, previous=previous) == 2
+
+    history = [d for d in db["notion_block_snapshots"].docs if not d["is_current"]]
+    assert history[-1]["changed"] == [
+        {"block_id": "b2", "block_type": "paragraph", "hash": block_hash("spec v2"), "parent_id": None}
+    ]
+    assert history[-1]["removed"] == ["b3"]
+    assert len(db["notion_block_contents"].docs) == 3
+    assert len([d for d in db["notion_block_snapshots"].docs if d["is_current"]]) == 1
+
+
+def test_legacy_per_block_snapshots_are_read_and_retired():
+    db = FakeDB()
+    db["notion_block_snapshots"].docs = [
+        {"page_id": "p1", "block_id": "b1", "block_type": "paragraph", "plain_text": "old", "is_current": True},
+    ]
+    store = BlockSnapshotStore(db)
+
+    previous = store.load_current("p1")
+    assert previous[0]["plain_text"] == "old"
+
+    store.save("p1", [_block("b1", "old")], previous=previous)
+    legacy = [d for d in db["notion_block_snapshots"].docs if "plain_text" in d]
+    assert legacy[0]["is_current"] is False
+    assert store.load_current("p1")[0]["hash"] == block_hash("old")
+
+
+def test_block_diff_only_loads_text_for_changed_blocks():
+    db = FakeDB()
+    plugin = NotionDiffPlugin.__new__(NotionDiffPlugin)
+    plugin.snapshots = BlockSnapshotStore(db)
+    plugin.snapshots.save(
+        "p1", [_block("b1", "same"), _block("b2", "line a\nline b"), _block("b3", "gone")], previous=[]
+    )
+    previous = plugin.snapshots.load_current("p1")
+    contents = db["notion_block_contents"]
+    contents.find_queries.clear()
+
+    changes = plugin._compute_block_diff(
+        previous,
+        [_block("b1", "same"), _block("b2", "line a\nline c"), _block("b4", "new")],
+    )
+
+    assert changes["added"] == [{"block_id": "b4", "block_type": "paragraph", "content": "new"}]
+    assert changes["deleted"] == [{"block_id": "b3", "block_type": "paragraph", "content": "gone"}]
+    assert changes["modified"][0]["added_lines"] == ["line c"]
+    assert changes["modified"][0]["deleted_lines"] == ["line b"]
+    # "same" was never read back
+    assert sorted(contents.find_queries[0]["_id"]["$in"]) == sorted(
+        [block_hash("line a\nline b"), block_hash("gone")]
+    )
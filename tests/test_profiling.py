@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+"""
+Tests for request profiling and metrics (src/utils/profiling.py)
+"""
+
+import asyncio
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils import profiling
+from src.utils.profiling import (
+    MetricsRegistry,
+    MongoCommandProfiler,
+    RequestProfile,
+    SamplingProfiler,
+    command_collection,
+    current_profile,
+    reply_documents,
+)
+
+
+def _started(request_id, command_name, command):
+    return SimpleNamespace(connection_id=("db", 27017), request_id=request_id, command_name=command_name, command=command)
+
+
+def _succeeded(request_id, command_name, micros, reply):
+    return SimpleNamespace(
+        connection_id=("db", 27017), request_id=request_id, command_name=command_name, duration_micros=micros, reply=reply
+    )
+
+
+def test_registry_renders_prometheus_text():
+    registry = MetricsRegistry()
+    latency = registry.histogram("req_seconds", "Latency", ("route",), buckets=(0.1, 1.0))
+    hits = registry.counter("hits_total", "Hits", ("route",))
+    assert registry.histogram("req_seconds", "again") is latency
+
+    latency.observe(0.05, '/a"b')
+    latency.observe(0.5, '/a"b')
+    hits.inc("/x", amount=3)
+
+    assert registry.render().splitlines() == [
+        "# HELP req_seconds Latency",
+        "# TYPE req_seconds histogram",
+        'req_seconds_bucket{route="/a\\"b",le="0.1"} 1',
+        'req_seconds_bucket{route="/a\\"b",le="1"} 2',
+        'req_seconds_bucket{route="/a\\"b",le="+Inf"} 2',
+        'req_seconds_sum{route="/a\\"b"} 0.550000',
+        'req_seconds_count{route="/a\\"b"} 2',
+        "# HELP hits_total Hits",
+        "# TYPE hits_total counter",
+        'hits_total{route="/x"} 3',
+    ]
+
+
+def test_command_helpers():
+    assert command_collection("find", {"find": "slack_messages"}) == "slack_messages"
+    assert command_collection("getMore", {"getMore": 123, "collection": "github_commits"}) == "github_commits"
+    assert command_collection("aggregate", {"aggregate": 1}) == ""
+    assert command_collection("ping", {"ping": 1}) == ""
+
+    assert reply_documents({"cursor": {"firstBatch": [{}, {}]}}) == 2
+    assert reply_documents({"cursor": {"nextBatch": [{}]}}) == 1
+    assert reply_documents({"n": 4, "nModified": 3}) == 4
+    assert reply_documents({"ok": 1}) == 0
+
+
+def test_commands_are_attributed_to_the_request(monkeypatch):
+    warnings = []
+    monkeypatch.setattr(profiling.logger, "warning", warnings.append)
+    listener = MongoCommandProfiler(slow_seconds=0.1)
+    profile = RequestProfile(route="/api/v1/members/{member_id}", method="GET")
+
+    async def handler():
+        # The profile is captured when the command starts; the outcome may arrive on another thread
+        loop = asyncio.get_running_loop()
+        listener.started(_started(1, "find", {"find": "slack_messages", "filter": {"user_name": {"$in": ["a"]}}}))
+        await loop.run_in_executor(None, listener.succeeded, _succeeded(1, "find", 250_000, {"cursor": {"firstBatch": [{}] * 3}}))
+
+    token = current_profile.set(profile)
+    try:
+        asyncio.run(handler())
+    finally:
+        current_profile.reset(token)
+
+    # Outside a request
+    listener.started(_started(2, "count", {"count": "members"}))
+    listener.succeeded(_succeeded(2, "count", 1_000, {"n": 7}))
+    listener.started(_started(3, "ping", {"ping": 1}))
+    listener.succeeded(_succeeded(3, "ping", 1_000, {"ok": 1}))
+
+    assert profile.mongo_commands == 1
+    assert profile.top_commands() == [
+        {"command": "find", "collection": "slack_messages", "count": 1, "seconds": 0.25, "documents": 3}
+    ]
+    assert profiling.mongo_documents_returned.value("count", "members", "background") >= 7
+    assert len(warnings) == 1 and "{'user_name': {'$in': ['?']}}" in warnings[0]
+
+
+def test_sampling_profiler_folds_other_threads():
+    sampler = SamplingProfiler(interval=0.001)
+    ready = threading.Event()
+    done = threading.Event()
+
+    def busy_worker():
+        ready.set()
+        done.wait(5)
+
+    worker = threading.Thread(target=busy_worker)
+    worker.start()
+    ready.wait(5)
+    try:
+        sampler.sample()
+    finally:
+        done.set()
+        worker.join()
+
+    folded = sampler.folded()
+    assert sampler.samples == 1
+    assert any("busy_worker (test_profiling.py:" in line for line in folded.splitlines())
+    assert "sample (profiling.py" not in folded
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+"""
+Tests for the streaming record pipeline (src/core/record_pipeline.py)
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.checkpoints import CheckpointMark, CollectionCancelled
+from src.core.record_pipeline import RecordPipeline
+
+
+class FakeCheckpoints:
+    def __init__(self):
+        self.staged = []
+        self.committed = []
+        self.is_cancelled = False
+
+    def stage_mark(self, mark):
+        self.staged.append(mark.scope)
+
+    def commit(self):
+        count = len(self.staged)
+        self.committed.extend(self.staged)
+        self.staged = []
+        return count
+
+
+class FakeWriter:
+    def __init__(self, fail_on=None):
+        self.batches = []
+        self.fail_on = fail_on
+
+    def __call__(self, batch):
+        self.batches.append([item["id"] for item in batch])
+        if self.fail_on in self.batches[-1]:
+            return len(batch) - 1
+        return len(batch)
+
+
+def _records(kind, ids):
+    return [(kind, {"id": i}) for i in ids]
+
+
+def test_batches_and_commits_at_marks():
+    messages = FakeWriter()
+    checkpoints = FakeCheckpoints()
+    pipeline = RecordPipeline({"message": messages}, checkpoints, batch_size=2)
+
+    result = pipeline.run(
+        _records("user", [1, 2])
+        + _records("message", [1, 2, 3])
+        + [CheckpointMark("C1", cursor="3")]
+        + _records("message", [4])
+        + [CheckpointMark("C2", cursor="4")]
+        + _records("message", [5])
+    )
+
+    # The mark flushes the partial batch before committing
+    assert messages.batches == [[1, 2], [3], [4], [5]]
+    assert checkpoints.committed == ["C1", "C2"]
+    assert result.records == {"message": 5}
+    assert result.skipped == {"user": 2}
+    assert result.checkpoints == 2
+
+
+def test_partial_save_holds_back_checkpoints():
+    messages = FakeWriter(fail_on=2)
+    checkpoints = FakeCheckpoints()
+    pipeline = RecordPipeline({"message": messages}, checkpoints, batch_size=10)
+    committed_threads = []
+
+    result = pipeline.run(
+        _records("message", [1])
+        + [CheckpointMark("C1", on_commit=lambda: committed_threads.append("C1"))]
+        + _records("message", [2, 3])
+        + [CheckpointMark("C2", on_commit=lambda: committed_threads.append("C2"))]
+        + _records("message", [4])
+        + [CheckpointMark("C3")]
+    )
+
+    assert checkpoints.committed == ["C1"]
+    assert committed_threads == ["C1"]
+    assert result.failed_batches == 1
+    assert result.records == {"message": 3}
+
+
+def test_stream_error_flushes_buffered_records():
+    messages = FakeWriter()
+    checkpoints = FakeCheckpoints()
+    pipeline = RecordPipeline({"message": messages}, checkpoints, batch_size=10)
+
+    def stream():
+        yield from _records("message", [1, 2])
+        raise RuntimeError("rate limited")
+
+    with pytest.raises(RuntimeError):
+        pipeline.run(stream())
+
+    # Saved, but without a mark nothing is committed: the window is re-fetched
+    assert messages.batches == [[1, 2]]
+    assert checkpoints.committed == []
+
+
+def test_cancelled_collection_stops_at_the_next_mark():
+    messages = FakeWriter()
+    checkpoints = FakeCheckpoints()
+    pipeline = RecordPipeline({"message": messages}, checkpoints, batch_size=10)
+
+    def stream():
+        yield from _records("message", [1, 2])
+        yield CheckpointMark("C1")
+        checkpoints.is_cancelled = True  # the orchestrator abandoned the source
+        yield from _records("message", [3])
+        yield CheckpointMark("C2")
+        yield from _records("message", [4])
+
+    with pytest.raises(CollectionCancelled):
+        pipeline.run(stream())
+
+    # Records already received are saved; the mark after the cancellation is not
+    assert messages.batches == [[1, 2], [3]]
+    assert checkpoints.committed == ["C1"]
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+"""
+Tests for the report AI execution layer (src/report/ai_client.py)
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.report import ai_client
+from src.report.ai_client import cache_key, run_cached
+
+
+class FakeCache:
+    """Async stand-in for the llm_response_cache Motor collection"""
+
+    full_name = "test.llm_response_cache"
+
+    def __init__(self):
+        self.docs = {}
+
+    async def find_one_and_update(self, query, update, projection=None):
+        doc = self.docs.get(query["_id"])
+        if doc is None or doc["expires_at"] <= query["expires_at"]["$gt"]:
+            return None
+        doc.update(update["$set"])
+        return doc
+
+    async def create_index(self, *args, **kwargs):
+        pass
+
+    async def replace_one(self, query, doc, upsert=False):
+        self.docs[query["_id"]] = dict(doc, _id=query["_id"])
+
+    async def estimated_document_count(self):
+        return len(self.docs)
+
+
+class FakeMongo:
+    def __init__(self):
+        self.cache = FakeCache()
+        self.async_db = {ai_client.CACHE_COLLECTION: self.cache}
+
+
+def test_cache_key_depends_on_model_prompt_and_params():
+    base = cache_key("m", "prompt", max_tokens=500, temperature=0.2)
+
+    assert base == cache_key("m", "prompt", temperature=0.2, max_tokens=500)
+    assert base != cache_key("other", "prompt", max_tokens=500, temperature=0.2)
+    assert base != cache_key("m", "prompt2", max_tokens=500, temperature=0.2)
+    assert base != cache_key("m", "prompt", max_tokens=300, temperature=0.2)
+
+
+def test_identical_inflight_calls_are_coalesced():
+    calls = []
+
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "summary"
+
+    async def scenario():
+        return await asyncio.gather(*(run_cached("k", "m", call) for _ in range(3)))
+
+    assert asyncio.run(scenario()) == ["summary"] * 3
+    assert len(calls) == 1
+
+
+def test_concurrency_is_bounded(monkeypatch):
+    monkeypatch.setattr(ai_client, "MAX_CONCURRENCY", 2)
+    running = {"now": 0, "max": 0}
+
+    def make_call(value):
+        async def call():
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+            await asyncio.sleep(0.01)
+            running["now"] -= 1
+            return value
+
+        return call
+
+    async def scenario():
+        return await asyncio.gather(*(run_cached(f"k{i}", "m", make_call(i)) for i in range(5)))
+
+    assert asyncio.run(scenario()) == [0, 1, 2, 3, 4]
+    assert running["max"] == 2
+
+
+def test_responses_are_cached_in_mongo():
+    mongo = FakeMongo()
+    calls = []
+
+    async def call():
+        calls.append(1)
+        return "cached summary"
+
+    async def scenario():
+        first = await run_cached("k", "m", call, mongo_manager=mongo)
+        second = await run_cached("k", "m", call, mongo_manager=mongo)
+        uncached = await run_cached("k", "m", call, mongo_manager=mongo, use_cache=False)
+        return first, second, uncached
+
+    assert asyncio.run(scenario()) == ("cached summary",) * 3
+    assert len(calls) == 2
+    assert mongo.cache.docs["k"]["model"] == "m"
+
+
+def test_failures_are_not_cached():
+    mongo = FakeMongo()
+
+    async def fail():
+        raise RuntimeError("AI API error")
+
+    async def scenario():
+        try:
+            await run_cached("k", "m", fail, mongo_manager=mongo)
+        except RuntimeError:
+            pass
+        return await run_cached("k", "m", lambda: asyncio.sleep(0, result="ok"), mongo_manager=mongo)
+
+    assert asyncio.run(scenario()) == "ok"
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""
+Tests for the biweekly report GitHub statistics (src/report/github_stats.py)
+"""
+
+import re
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.report.github_stats import (
+    CATEGORIES,
+    RepoClassifier,
+    build_github_stats,
+    commit_stats_pipeline,
+)
+
+
+def test_category_rules_match_keyword_substrings():
+    classifier = RepoClassifier()
+
+    assert classifier.category("ton-staking-v2") == "Economics"
+    assert classifier.category("TON-Ecosystem-Site") == "Economics"
+    assert classifier.category("Tokamak-zk-EVM") == "Zkp"
+    assert classifier.category("zk-explorer") == "Zkp"
+    assert classifier.category("trh-sdk") == "Rollup"
+    assert classifier.category("website") == "etc"
+    assert classifier.category(None) == "etc"
+
+
+def test_project_prefers_db_assignment_over_keywords():
+    classifier = RepoClassifier({"trh": ["Staking-Bridge"], "syb": ["titan-ui"]})
+
+    assert classifier.project("staking-bridge") == "trh"
+    assert classifier.project("ton-staking") == "eco"
+    # Non-report projects do not override keywords
+    assert classifier.project("titan-ui") == "trh"
+    assert classifier.project("website") is None
+
+
+def test_switch_expressions_use_the_same_rules():
+    classifier = RepoClassifier({"ooo": ["Private-Prover"]})
+
+    category_branches = classifier.category_expression()["$switch"]["branches"]
+    assert [b["then"] for b in category_branches] == CATEGORIES[:-1]
+    zkp_regex = category_branches[1]["case"]["$regexMatch"]["regex"]
+    assert re.search(zkp_regex, "tokamak-zk-evm")
+
+    project_branches = classifier.project_expression()["$switch"]["branches"]
+    assert project_branches[0] == {
+        "case": {"$in": [{"$toLower": {"$ifNull": ["$repository", ""]}}, ["private-prover"]]},
+        "then": "ooo",
+    }
+    assert [b["then"] for b in project_branches[1:]] == ["ooo", "eco", "trh"]
+
+
+def test_commit_pipeline_projects_before_facets():
+    pipeline = commit_stats_pipeline(datetime(2025, 11, 1), datetime(2025, 11, 14), RepoClassifier(), 5)
+
+    assert pipeline[1] == {"$project": {"_id": 0, "repository": 1, "message": 1, "date": 1}}
+    headlines = pipeline[2]["$facet"]["headlines"]
+    assert headlines[-1] == {"$project": {"commits": {"$slice": ["$commits", 5]}}}
+
+
+def test_build_github_stats():
+    facets = {
+        "by_repo": [{"_id": "trh-sdk", "commits": 3}, {"_id": "website", "commits": 2}],
+        "by_category": [
+            {"_id": "Rollup", "repos": 1, "commits": 3},
+            {"_id": "etc", "repos": 1, "commits": 2},
+        ],
+        "headlines": [
+            {"_id": "trh", "commits": [{"repository": "trh-sdk", "message": "Add deploy\n\nDetails"}]},
+        ],
+    }
+    stats = build_github_stats(facets, [{"_id": "trh-sdk", "prs": 4}])
+
+    assert stats["total_commits"] == 5
+    assert stats["total_repos"] == 2
+    assert stats["total_prs"] == 4
+    assert stats["by_category"]["Rollup"] == {"repos": 1, "commits": 3}
+    assert stats["by_category"]["Zkp"] == {"repos": 0, "commits": 0}
+    assert stats["headlines"] == {
+        "ooo": [],
+        "eco": [],
+        "trh": [{"repository": "trh-sdk", "message": "Add deploy"}],
+    }
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+"""
+Tests for the full-text search over the activity timeline (src/core/search_index.py)
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.search_index import (
+    MAX_SEARCH_TEXT_CHARS,
+    build_search_filter,
+    highlight,
+    parse_query,
+    search_fields,
+    search_timeline,
+)
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    def sort(self, spec):
+        self.calls.append(("sort", spec))
+        return self
+
+    def skip(self, n):
+        self.calls.append(("skip", n))
+        self.rows = self.rows[n:]
+        return self
+
+    def limit(self, n):
+        self.calls.append(("limit", n))
+        self.rows = self.rows[:n]
+        return self
+
+    def __iter__(self):
+        return iter(self.rows)
+
+
+class FakeCollection:
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    def find(self, query, projection=None):
+        self.queries.append((query, projection))
+        self.cursor = FakeCursor(list(self.rows))
+        return self.cursor
+
+
+def test_search_fields_use_full_source_text():
+    long_text = "deploy " * 20000
+    assert search_fields("github_commits", {"message": "Fix bridge fee\n\nRound down"}) == {
+        "search_title": "Fix bridge fee",
+        "search_text": "Fix bridge fee\n\nRound down",
+    }
+    assert len(search_fields("recordings", {"name": "Weekly", "content": long_text})["search_text"]) == (
+        MAX_SEARCH_TEXT_CHARS
+    )
+
+    diff = {
+        "document_title": "Roadmap",
+        "changes": {
+            "added": [{"content": "New milestone"}],
+            "deleted": [{"content": "Old milestone"}],
+            "modified": [{"old_content": "Q1", "new_content": "Q2 launch"}],
+        },
+    }
+    assert search_fields("notion_content_diffs", diff) == {
+        "search_title": "Roadmap",
+        "search_text": "New milestone\nQ2 launch",
+    }
+
+
+def test_build_search_filter_validates_and_keeps_timeline_filters():
+    query = build_search_filter(
+        'bridge "fee cap"', source_type="github", member_name="Ale", start_date="2025-11-01"
+    )
+    assert query == {
+        "$text": {"$search": 'bridge "fee cap"'},
+        "source_type": "github",
+        "member_key": "ale",
+        "timestamp": {"$gte": datetime(2025, 11, 1)},
+    }
+    assert parse_query('bridge "fee cap" -draft') == (["bridge"], ["fee cap"])
+
+    for bad in ("", "   ", "-draft", "x" * 500):
+        with pytest.raises(ValueError):
+            build_search_filter(bad)
+
+    # An unparseable date is an error, not a silently dropped filter
+    with pytest.raises(ValueError, match="Invalid date"):
+        build_search_filter("bridge", start_date="last week")
+    with pytest.raises(ValueError, match="Invalid date"):
+        build_search_filter("bridge", start_date="2025-11-01", end_date="2025-13-45")
+
+
+def test_highlight_marks_whole_terms_around_first_match():
+    text = "intro " * 50 + "Fixed the Bridge fee; bridges and bridge-fee both apply"
+    snippet, highlights = highlight(text, "bridge fee", width=80)
+
+    assert snippet.startswith("…")
+    marked = [snippet[s:e] for s, e in highlights]
+    # "bridges" is a different token without stemming
+    assert marked == ["Bridge", "fee", "bridge", "fee"]
+
+    snippet, highlights = highlight("Release (v2.1) notes", '"v2.1)"')
+    assert [snippet[s:e] for s, e in highlights] == ["v2.1)"]
+
+
+def test_search_timeline_pages_ranked_rows():
+    rows = [
+        {
+            "_id": f"slack:C1:{i}",
+            "score": 3.0 - i,
+            "source_type": "slack",
+            "activity_type": "message",
+            "timestamp": datetime(2025, 11, 17, 9, i),
+            "member_name": "Ale",
+            "search_title": "",
+            "search_text": f"bridge audit number {i}",
+            "metadata": {"url": "https://example"},
+        }
+        for i in range(3)
+    ]
+    db = {"activity_timeline": FakeCollection(rows)}
+
+    page = search_timeline(db, "audit", offset=1, limit=1)
+
+    query, projection = db["activity_timeline"].queries[0]
+    assert query == {"$text": {"$search": "audit"}}
+    assert projection["score"] == {"$meta": "textScore"}
+    assert ("skip", 1) in db["activity_timeline"].cursor.calls
+    assert page["has_more"] is True
+    assert [hit["id"] for hit in page["results"]] == ["slack:C1:1"]
+
+    hit = page["results"][0]
+    assert hit["timestamp"] == "2025-11-17T09:01:00Z"
+    assert [hit["snippet"][s:e] for s, e in hit["highlights"]] == ["audit"]
@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+"""
+Tests for Slack thread reply watermarks (src/core/slack_threads.py) and the
+concurrent, rate-limited channel fetch of SlackPluginMongo
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+
+from src.core.checkpoints import CheckpointMark, CheckpointStore
+from src.core.slack_threads import SlackThreadTracker
+from src.plugins.slack_plugin_mongo import SlackPluginMongo
+from src.utils.rate_limiter import SlackRateLimiter
+
+
+class FakeCollection:
+    def __init__(self, docs=None):
+        self.docs = list(docs or [])
+        self.writes = []
+
+    def find(self, query, projection=None):
+        since = query.get("thread_ts", {}).get("$gte", "")
+        return [
+            dict(d) for d in self.docs if d["channel_id"] == query["channel_id"] and d["thread_ts"] >= since
+        ]
+
+    def bulk_write(self, operations, ordered=True):
+        self.writes.extend(operations)
+
+
+class FakeDB(dict):
+    def __init__(self, docs=None):
+        super().__init__(slack_threads=FakeCollection(docs))
+
+
+class FakeSlackClient:
+    def __init__(self, history, replies):
+        self.history = history
+        self.replies = replies
+        self.history_calls = []
+        self.reply_calls = []
+
+    def conversations_history(self, **params):
+        self.history_calls.append(params)
+        messages = [m for m in self.history if float(m["ts"]) > float(params["oldest"])]
+        return {"messages": messages, "has_more": False}
+
+    def conversations_replies(self, channel, ts, oldest, limit):
+        self.reply_calls.append((ts, oldest))
+        return {"messages": [m for m in self.replies[ts] if float(m["ts"]) > float(oldest)]}
+
+
+def test_tracker_skips_threads_without_new_replies():
+    db = FakeDB(
+        [
+            {"channel_id": "C1", "thread_ts": "1700000000.000100", "latest_reply": "1700000500.000000"},
+            {"channel_id": "C1", "thread_ts": "1600000000.000100", "latest_reply": "1600000500.000000"},
+        ]
+    )
+    tracker = SlackThreadTracker(db)
+
+    assert tracker.load_channel("C1", since="1690000000.000000") == 1
+    assert not tracker.has_new_replies("C1", "1700000000.000100", "1700000500.000000")
+    assert tracker.has_new_replies("C1", "1700000000.000100", "1700000900.000000")
+    assert tracker.has_new_replies("C1", "1700000300.000100", "1700000400.000000")
+
+    tracker.stage("C1", "1700000000.000100", "1700000900.000000", reply_count=4)
+    tracker.stage("C1", "1700000000.000100", "1700000600.000000", reply_count=3)
+    assert tracker.commit() == 1
+    update = db["slack_threads"].writes[0]._doc
+    assert update["$max"] == {"latest_reply": "1700000900.000000"}
+    assert update["$set"]["reply_count"] == 4
+    assert not tracker.has_new_replies("C1", "1700000000.000100", "1700000900.000000")
+
+
+def _plugin(client, db):
+    plugin = SlackPluginMongo.__new__(SlackPluginMongo)
+    plugin.client = client
+    plugin.include_threads = plugin.include_reactions = plugin.include_files = True
+    plugin.channel_name_map, plugin.user_name_map = {}, {}
+    plugin._incomplete_channels, plugin._incomplete_threads = set(), set()
+    plugin.threads = SlackThreadTracker(db)
+    plugin.rate_limiter = SlackRateLimiter(burst=100, sleep=lambda seconds: None)
+    return plugin
+
+
+def test_only_advanced_threads_are_fetched_including_older_parents():
+    oldest, latest = "1700100000.000000", "1700200000.000000"
+
+    history = [
+        # in the window: new thread and a thread without replies
+        {"ts": "1700150000.000100", "user": "U1", "text": "new", "thread_ts": "1700150000.000100",
+         "reply_count": 1, "latest_reply": "1700150100.000000"},
+        {"ts": "1700160000.000100", "user": "U1", "text": "plain"},
+        # before the window: one thread with a late reply, one unchanged
+        {"ts": "1700050000.000100", "user": "U2", "text": "old", "thread_ts": "1700050000.000100",
+         "reply_count": 3, "latest_reply": "1700180000.000000"},
+        {"ts": "1700040000.000100", "user": "U2", "text": "quiet", "thread_ts": "1700040000.000100",
+         "reply_count": 2, "latest_reply": "1700045000.000000"},
+    ]
+    replies = {
+        "1700150000.000100": [{"ts": "1700150000.000100"}, {"ts": "1700150100.000000", "user": "U2"}],
+        "1700050000.000100": [
+            {"ts": "1700050000.000100"},
+            {"ts": "1700060000.000000", "user": "U1"},
+            {"ts": "1700180000.000000", "user": "U1"},
+        ],
+    }
+    db = FakeDB(
+        [
+            {"channel_id": "C1", "thread_ts": "1700050000.000100", "latest_reply": "1700060000.000000"},
+            {"channel_id": "C1", "thread_ts": "1700040000.000100", "latest_reply": "1700045000.000000"},
+        ]
+    )
+
+    plugin = _plugin(FakeSlackClient(history, replies), db)
+    plugin.threads.load_channel("C1", since="1699000000.000000")
+
+    messages = list(plugin._iter_channel_messages("C1", oldest, latest, thread_oldest="1699000000.000000"))
+
+    assert [m["ts"] for m in messages] == [
+        "1700150000.000100",
+        "1700150100.000000",
+        "1700160000.000100",
+        "1700180000.000000",
+    ]
+    assert plugin.client.history_calls[0]["oldest"] == "1699000000.000000"
+    assert plugin.client.reply_calls == [
+        ("1700150000.000100", "0"),
+        ("1700050000.000100", "1700060000.000000"),
+    ]
+    assert plugin.threads.staged_count() == 2
+
+
+def test_rate_limiter_paces_by_tier_and_pauses_globally():
+    now = [0.0]
+
+    def sleep(seconds):
+        now[0] += seconds
+
+    limiter = SlackRateLimiter(burst=1, headroom=1.0, clock=lambda: now[0], sleep=sleep)
+
+    assert limiter.requests_per_minute("users.list") == 20
+    assert limiter.requests_per_minute("conversations.history") == 50
+
+    limiter.acquire("users.list")
+    assert limiter.acquire("users.list") == pytest.approx(3.0)  # tier 2: 20/min
+    limiter.acquire("conversations.history")
+
+    # Retry-After holds back every method, not only the one that was limited
+    limiter.pause(30)
+    assert limiter.acquire("conversations.history") == pytest.approx(30.0)
+
+
+class ChannelClient:
+    """conversations.history per channel; "broken" fails with a non-Slack error"""
+
+    def conversations_history(self, channel, **params):
+        if channel == "broken":
+            raise ConnectionError("reset by peer")
+        return {"messages": [{"ts": f"17000{i}0000.000100", "user": "U1"} for i in range(3)], "has_more": False}
+
+
+def _channel_plugin():
+    plugin = _plugin(ChannelClient(), None)
+    plugin.checkpoints = CheckpointStore(None, "slack")
+    plugin.thread_lookback_days = 0
+    plugin.bulk_batch_size = 2
+    plugin.max_concurrent_channels = 3
+    return plugin
+
+
+def test_channels_are_fetched_concurrently_with_marks_after_their_messages():
+    plugin = _channel_plugin()
+    channels = [{"id": f"C{i}", "name": f"c{i}"} for i in range(5)]
+
+    records = list(plugin._iter_channels_concurrently(channels, "0", "1800000000.000000"))
+
+    for channel in channels:
+        own = [r for r in records if (r.scope if isinstance(r, CheckpointMark) else r[1]["channel_id"]) == channel["id"]]
+        assert [isinstance(r, CheckpointMark) for r in own] == [False, False, False, True]
+        assert own[-1].cursor == "1700020000.000100"
+
+
+def test_channel_worker_errors_are_raised_to_the_consumer():
+    plugin = _channel_plugin()
+    channels = [{"id": "C1", "name": "ok"}, {"id": "broken", "name": "broken"}]
+
+    with pytest.raises(ConnectionError):
+        list(plugin._iter_channels_concurrently(channels, "0", "1800000000.000000"))